@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# scripts/benchmark_rate_limiter.py
+"""
+Measure rate limiter throughput (checks/sec) in memory and Redis mode.
+
+Redis mode runs only when a Redis URL is given or REDIS_URL is set.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py
+    python scripts/benchmark_rate_limiter.py --checks 200000 --identifiers 50000
+    python scripts/benchmark_rate_limiter.py --redis-url redis://localhost:6379/0 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+async def run_checks(limiter, checks: int, identifiers: int, concurrency: int) -> float:
+    async def worker(offset: int):
+        for i in range(offset, checks, concurrency):
+            await limiter.check(f"ip:{i % identifiers}", "default", limit=100, window=60)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    return checks / (time.perf_counter() - start)
+
+
+async def main_async(args) -> int:
+    from src.app.infrastructure.rate_limiter import RateLimiter
+
+    memory = RateLimiter(redis_url=None, max_buckets=args.max_buckets)
+    rate = await run_checks(memory, args.checks, args.identifiers, args.concurrency)
+    stats = memory.get_stats()
+    print(f"memory: {rate:,.0f} checks/sec "
+          f"({stats['buckets']} buckets, {stats['evicted']} evicted, {stats['expired']} expired)")
+
+    redis_url = args.redis_url or os.environ.get("REDIS_URL")
+    if redis_url:
+        redis_limiter = RateLimiter(redis_url=redis_url)
+        if not redis_limiter.is_redis_available:
+            print("redis: unavailable, skipped")
+            return 1
+        rate = await run_checks(redis_limiter, args.checks, args.identifiers, args.concurrency)
+        print(f"redis:  {rate:,.0f} checks/sec")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rate limiter checks/sec")
+    parser.add_argument("--checks", type=int, default=100_000)
+    parser.add_argument("--identifiers", type=int, default=10_000, help="Distinct callers")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent check loops")
+    parser.add_argument("--max-buckets", type=int, default=10_000, help="Memory-mode bucket cap")
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
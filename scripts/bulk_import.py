@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# scripts/bulk_import.py
+"""
+Bulk-import meeting transcripts from a zip archive or a directory.
+
+Signals are extracted in a process pool and meetings are inserted in
+batches; each file is recorded in import_history under one batch id.
+
+Usage:
+    python scripts/bulk_import.py exports/pocket.zip
+    python scripts/bulk_import.py ~/transcripts --workers 8 --date 2025-06-01
+    python scripts/bulk_import.py exports/pocket.zip --no-date-from-filename
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-import meeting transcripts")
+    parser.add_argument("source", help="Zip archive or directory of .md/.markdown/.txt transcripts")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: cores - 1, max 8)")
+    parser.add_argument("--batch-size", type=int, default=50, help="Meetings per DB transaction")
+    parser.add_argument("--date", default=None, help="Date for files without one in their name (default: today)")
+    parser.add_argument("--no-date-from-filename", action="store_true",
+                        help="Don't take meeting dates from YYYY-MM-DD in filenames")
+    parser.add_argument("--source-url", default=None, help="Source URL recorded on every meeting")
+    args = parser.parse_args()
+
+    from src.app.db import init_db
+    from src.app.services.bulk_import import BulkImporter, iter_transcript_sources
+
+    source = Path(args.source).expanduser()
+    if not source.exists():
+        print(f"❌ Not found: {source}")
+        return 1
+
+    init_db()
+    importer = BulkImporter(
+        workers=args.workers,
+        batch_size=args.batch_size,
+        default_date=args.date,
+        date_from_filename=not args.no_date_from_filename,
+        source_url=args.source_url,
+    )
+
+    def report(progress):
+        print(f"  … {progress.processed} processed ({progress.completed} imported, {progress.failed} failed)")
+
+    print(f"📥 Importing {source} with {importer.workers} worker(s)")
+    started = time.perf_counter()
+    progress = importer.run(iter_transcript_sources(source), on_progress=report)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n✅ Batch {progress.batch_id}: {progress.completed} meetings, "
+          f"{progress.signals} signals, {progress.failed} failed in {elapsed:.1f}s")
+    for error in progress.errors:
+        print(f"  ⚠️ {error['filename']}: {error['error']}")
+    return 0 if progress.status == "completed" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
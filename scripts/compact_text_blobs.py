@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# scripts/compact_text_blobs.py
+"""
+Move large inline transcripts into the compressed text_blobs store.
+
+Rewrites meeting_summaries.raw_text / pocket_ai_summary / pocket_mind_map and
+meeting_documents.content values above the size threshold into blob
+references, then drops blobs nothing references any more.
+
+Usage:
+    python scripts/compact_text_blobs.py
+    python scripts/compact_text_blobs.py --min-bytes 2048 --vacuum
+    python scripts/compact_text_blobs.py --stats
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact large transcript columns into text_blobs")
+    parser.add_argument("--min-bytes", type=int, default=None, help="Size threshold (default: TEXT_BLOB_MIN_BYTES)")
+    parser.add_argument("--batch-size", type=int, default=200, help="Rows rewritten per transaction")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM afterwards to return freed pages to the OS")
+    parser.add_argument("--stats", action="store_true", help="Only print blob store statistics")
+    args = parser.parse_args()
+
+    from src.app.db import connect, init_db
+    from src.app.db_blobs import collect_garbage, externalize_columns, get_blob_stats
+
+    init_db()
+    with connect() as conn:
+        if not args.stats:
+            moved = externalize_columns(conn, min_bytes=args.min_bytes, batch_size=args.batch_size)
+            for column, count in moved.items():
+                print(f"  {column}: {count} value(s) moved")
+            print(f"🧹 Removed {collect_garbage(conn)} unreferenced blob(s)")
+            if args.vacuum:
+                conn.execute("VACUUM")
+
+        stats = get_blob_stats(conn)
+    print(f"\n📦 {stats['blobs']} blobs, {stats['bytes'] / 1e6:.1f} MB text in "
+          f"{stats['compressed_bytes'] / 1e6:.1f} MB ({stats['codec']}, ratio {stats['ratio']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# scripts/load_test.py
+"""
+Asyncio load test for the hot HTML and API read paths.
+
+By default the app runs in-process (httpx ASGI transport) against a
+synthetic corpus in a temp SQLite DB (tests/performance/corpus.py), with
+Supabase unconfigured and embeddings computed locally, so results reflect
+this repo's code rather than the network. Pass --url to load a running
+server instead.
+
+--fake-backends supabase,llm,embeddings (or all) swaps in the offline
+stand-ins from src/app/infrastructure/fake_providers.py and
+fake_supabase.py, so the Supabase-first and LLM/embedding-backed paths run
+with modelled latency (FAKE_*_LATENCY). The fake Supabase is seeded from
+the corpus before the run starts.
+
+Per-endpoint latency percentiles, throughput and error counts are printed
+and written as JSON (tagged with the git commit) so runs can be compared
+across commits.
+
+Usage:
+    python scripts/load_test.py
+    python scripts/load_test.py --concurrency 50 --duration 60 --scale 5
+    FAKE_SUPABASE_LATENCY=lognormal:25:0.5 python scripts/load_test.py --fake-backends all
+    python scripts/load_test.py --url http://localhost:8000 --token $BYPASS_TOKEN
+    python scripts/load_test.py --output .benchmarks/load/latest.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+SEARCH_TERMS = ["billing", "pipeline latency", "vendor", "snowflake", "release plan", "approval"]
+
+# (name, path template, weight)
+SCENARIO = [
+    ("meetings", "/meetings", 3),
+    ("signals_decisions", "/signals/decisions", 3),
+    ("signals_all_90d", "/signals/all?days=90", 1),
+    ("action_items", "/action-items", 1),
+    ("search_page", "/search?q={term}&source_type=both", 2),
+    ("api_keyword_search", "/api/search?q={term}&source_type=both", 3),
+    ("api_unified_search", "/api/search/unified?q={term}", 2),
+]
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def setup_in_process(scale: float, seed: int, fake_backends: str = ""):
+    """Build a corpus in a temp DB and return the app wired to it."""
+    os.environ.setdefault("BYPASS_TOKEN", "load-test")
+    for var in ("SUPABASE_URL", "SUPABASE_KEY", "SUPABASE_ANON_KEY", "SUPABASE_SERVICE_ROLE_KEY"):
+        os.environ.pop(var, None)
+    if fake_backends:
+        os.environ["FAKE_BACKENDS"] = fake_backends
+
+    from src.app import db
+    from src.app.memory import semantic
+    from tests.performance.corpus import CorpusSize, build_corpus, fake_embedding
+
+    semantic.embed_text = fake_embedding
+    db.close_pool()
+    db.DB_PATH = str(Path(tempfile.mkdtemp(prefix="loadtest-")) / "corpus.db")
+    db.init_db()
+    size = CorpusSize().scaled(scale)
+    with db.connect() as conn:
+        counts = build_corpus(conn, size, seed=seed)
+    print(f"corpus: {counts} -> {db.DB_PATH}")
+
+    from src.app.infrastructure.fake_providers import fake_backend_enabled
+    if fake_backend_enabled("supabase"):
+        from src.app.infrastructure import fake_supabase
+        os.environ["FAKE_SUPABASE_SEED"] = "true"
+        fake_supabase.reset_fake_supabase_client()
+        fake_supabase.get_fake_supabase_client()  # seed now rather than inside the first request
+
+    from src.app.main import app
+    return app, asdict(size)
+
+
+async def run_load(client, token: str, concurrency: int, duration: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    names = [name for name, _, _ in SCENARIO]
+    paths = {name: path for name, path, _ in SCENARIO}
+    weights = [weight for _, _, weight in SCENARIO]
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    headers = {"X-Auth-Token": token, "Accept-Encoding": "gzip"}
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            path = paths[name].format(term=rng.choice(SEARCH_TERMS))
+            start = time.perf_counter()
+            try:
+                resp = await client.get(path, headers=headers)
+                await resp.aread()
+                ok = resp.status_code < 400
+            except Exception:
+                ok = False
+            latencies[name].append((time.perf_counter() - start) * 1000)
+            if not ok:
+                errors[name] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    endpoints = {}
+    for name in names:
+        values = sorted(latencies[name])
+        endpoints[name] = {
+            "requests": len(values),
+            "errors": errors[name],
+            "rps": round(len(values) / elapsed, 2),
+            "p50_ms": round(percentile(values, 0.50), 2),
+            "p95_ms": round(percentile(values, 0.95), 2),
+            "p99_ms": round(percentile(values, 0.99), 2),
+            "max_ms": round(values[-1], 2) if values else 0.0,
+        }
+    total = sum(e["requests"] for e in endpoints.values())
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "requests": total,
+        "errors": sum(errors.values()),
+        "rps": round(total / elapsed, 2),
+        "endpoints": endpoints,
+    }
+
+
+async def main_async(args) -> int:
+    import httpx
+
+    corpus = None
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+        token = args.token or os.environ.get("BYPASS_TOKEN", "")
+    else:
+        app, corpus = setup_in_process(args.scale, args.seed, args.fake_backends)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest",
+                                   timeout=args.timeout)
+        token = os.environ["BYPASS_TOKEN"]
+
+    async with client:
+        results = await run_load(client, token, args.concurrency, args.duration, args.seed)
+
+    report = {
+        "commit": git_commit(),
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "target": args.url or "in-process",
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "corpus": corpus,
+        "fake_backends": os.environ.get("FAKE_BACKENDS", ""),
+        **results,
+    }
+
+    print(f"{'endpoint':<22}{'reqs':>8}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, e in results["endpoints"].items():
+        print(f"{name:<22}{e['requests']:>8}{e['errors']:>6}{e['rps']:>9.1f}"
+              f"{e['p50_ms']:>9.1f}{e['p95_ms']:>9.1f}{e['p99_ms']:>9.1f}")
+    print(f"total: {results['requests']} requests, {results['errors']} errors, {results['rps']:.1f} req/s")
+
+    output = Path(args.output or project_root / ".benchmarks" / "load" / f"{report['commit'][:12]}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"results written to {output}")
+    return 1 if results["errors"] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the hot read paths")
+    parser.add_argument("--url", help="Base URL of a running server (default: run the app in-process)")
+    parser.add_argument("--token", help="BYPASS_TOKEN of the target server")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds to run")
+    parser.add_argument("--scale", type=float, default=float(os.getenv("BENCH_SCALE", "1.0")),
+                        help="In-process corpus scale (see tests/performance/corpus.py)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fake-backends", default=os.getenv("FAKE_BACKENDS", ""),
+                        help="In-process only: backends to replace with offline fakes "
+                             "(supabase, llm, embeddings or all)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--output", help="JSON results path (default: .benchmarks/load/<commit>.json)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -32,9 +32,13 @@ from pathlib import Path
 
 # Add src/app to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "app"))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from supabase import create_client, Client
 
+from src.app.db_blobs import row_dict as resolve_blob_row
+from src.app.services.code_locker_store import CodeLockerStore
+
 # Configuration
 SQLITE_DB_PATH = Path(__file__).parent.parent / "agent.db"
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -58,9 +62,9 @@ def get_supabase_client() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 
-def row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
-    """Convert SQLite row to dictionary."""
-    return {key: row[key] for key in row.keys()}
+def row_to_dict(row: sqlite3.Row, conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Convert SQLite row to dictionary, resolving text_blobs references (transcripts, Pocket summaries)."""
+    return resolve_blob_row(row, conn)
 
 
 def migrate_table(
@@ -97,7 +101,7 @@ def migrate_table(
     errors = []
     
     for row in rows:
-        row_dict = row_to_dict(row)
+        row_dict = row_to_dict(row, sqlite_conn)
         
         # Apply column mapping if provided
         if column_mapping:
@@ -352,8 +356,13 @@ def migrate_ticket_files(sqlite_conn: sqlite3.Connection, supabase: Client) -> i
 
 def migrate_code_locker(sqlite_conn: sqlite3.Connection, supabase: Client) -> int:
     """Migrate code_locker table."""
-    return migrate_table(sqlite_conn, supabase, "code_locker", "code_locker", 
-                        transform_fn=transform_datetime)
+    def transform(row):
+        # Inline content is blanked once a version lives in the delta store
+        row['content'] = CodeLockerStore.row_content(sqlite_conn, row)
+        row.pop('content_hash', None)
+        return transform_datetime(row)
+    
+    return migrate_table(sqlite_conn, supabase, "code_locker", "code_locker", transform_fn=transform)
 
 
 def migrate_sprint_settings(sqlite_conn: sqlite3.Connection, supabase: Client) -> int:
@@ -26,6 +26,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.app.services.code_locker_store import CodeLockerStore
+
 
 def get_supabase_client():
     """Get Supabase client."""
@@ -70,7 +72,7 @@ def migrate_code_locker(client, conn, dry_run=False):
             data = {
                 'ticket_id': row['ticket_id'],  # Already a UUID
                 'filename': row['filename'],
-                'content': row['content'],
+                'content': CodeLockerStore.row_content(conn, row),  # inline content is blanked once stored as blobs
                 'version': row['version'] or 1,
                 'notes': row['notes'],
                 'is_initial': bool(row['is_initial']),
@@ -16,6 +16,8 @@ from datetime import datetime, timezone
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.app.db_blobs import BlobRow
+
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -65,7 +67,7 @@ def sync_meetings(client, dry_run=True):
     
     # Get all from SQLite
     conn = sqlite3.connect('agent.db')
-    conn.row_factory = sqlite3.Row
+    conn.row_factory = BlobRow  # resolves text_blobs references
     rows = conn.execute("""
         SELECT id, meeting_name, synthesized_notes, meeting_date, 
                created_at, signals_json, raw_text, pocket_ai_summary,
@@ -144,7 +146,7 @@ def sync_documents(client, dry_run=True):
     
     # Get all from SQLite
     conn = sqlite3.connect('agent.db')
-    conn.row_factory = sqlite3.Row
+    conn.row_factory = BlobRow  # resolves text_blobs references
     rows = conn.execute("""
         SELECT id, source, content, document_date, created_at
         FROM docs
@@ -211,7 +213,7 @@ def sync_notifications(client, dry_run=True):
     
     # Get all from SQLite
     conn = sqlite3.connect('agent.db')
-    conn.row_factory = sqlite3.Row
+    conn.row_factory = BlobRow  # resolves text_blobs references
     
     # Check if notifications table exists
     table_check = conn.execute(
@@ -317,7 +319,7 @@ def sync_conversations(client, dry_run=True):
     
     # Get all from SQLite
     conn = sqlite3.connect('agent.db')
-    conn.row_factory = sqlite3.Row
+    conn.row_factory = BlobRow  # resolves text_blobs references
     
     # Check if conversations table exists
     table_check = conn.execute(
@@ -5,6 +5,7 @@ import sqlite3
 import sys
 sys.path.insert(0, '/Users/rowan/v0agent/src')
 
+from app.db_blobs import row_dict
 from app.infrastructure.supabase_client import get_supabase_client
 
 def main():
@@ -12,7 +13,8 @@ def main():
     conn.row_factory = sqlite3.Row
     
     # Get all meetings from SQLite
-    meetings = conn.execute('SELECT * FROM meeting_summaries').fetchall()
+    # Resolve text_blobs references so the transcript text is synced, not the reference
+    meetings = [row_dict(m, conn) for m in conn.execute('SELECT * FROM meeting_summaries').fetchall()]
     print(f'Found {len(meetings)} meetings in SQLite')
     
     client = get_supabase_client()
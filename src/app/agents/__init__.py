@@ -21,99 +21,88 @@ Usage:
     result = guardrails.pre_call("arjuna", user_input)
 """
 
+import importlib
 from typing import Optional
 from .base import BaseAgent, AgentConfig
 from .registry import AgentRegistry
-from .model_router import (
-    ModelRouter,
-    ModelSelectionResult,
-    TaskTypeConfig,
-    get_model_router,
-    initialize_model_router,
-)
-from .guardrails import (
-    Guardrails,
-    GuardrailConfig,
-    GuardrailResult,
-    GuardrailAction,
-    ReflectionResult,
-    ReflectionOutcome,
-    GuardrailMetrics,
-    get_guardrails,
-    initialize_guardrails,
-)
-from .arjuna import (
-    ArjunaAgent,
-    get_arjuna_agent,
-    AVAILABLE_MODELS,
-    SYSTEM_PAGES,
-    MODEL_ALIASES,
-    FOCUS_KEYWORDS,
-    # MCP Short Notation Commands
-    MCP_COMMANDS,
-    MCP_INFERENCE_PATTERNS,
-    parse_mcp_command,
-    infer_mcp_command,
-    get_command_help,
-    # Adapter functions for backward compatibility
-    get_follow_up_suggestions,
-    get_focus_recommendations,
-    get_system_context,
-    parse_assistant_intent,
-    execute_intent,
-)
-from .career_coach import (
-    CareerCoachAgent,
-    get_career_coach_agent,
-    CAREER_REPO_CAPABILITIES,
-    format_capabilities_context,
-    # Adapter functions for backward compatibility
-    get_career_capabilities,
-    career_chat_adapter,
-    generate_suggestions_adapter,
-    analyze_standup_adapter,
-)
-from .meeting_analyzer import (
-    MeetingAnalyzerAgent,
-    get_meeting_analyzer,
-    parse_meeting_summary_adaptive,
-    extract_signals_from_meeting,
-    SIGNAL_TYPES,
-    HEADING_TO_SIGNAL_TYPE,
-)
-from .dikw_synthesizer import (
-    DIKWSynthesizerAgent,
-    get_dikw_synthesizer,
-    DIKW_LEVELS,
-    DIKW_NEXT_LEVEL,
-    DIKW_LEVEL_DESCRIPTIONS,
-    # Adapter functions for backward compatibility
-    promote_signal_to_dikw_adapter,
-    promote_dikw_item_adapter,
-    merge_dikw_items_adapter,
-    validate_dikw_item_adapter,
-    generate_dikw_tags_adapter,
-    ai_summarize_dikw_adapter,
-    ai_promote_dikw_adapter,
-    get_mindmap_data_adapter,
-    generate_dikw_tags,
-)
-from .ticket_agent import (
-    TicketAgent,
-    # Adapter functions for backward compatibility
-    summarize_ticket_adapter,
-    generate_plan_adapter,
-    decompose_ticket_adapter,
-    summarize_ticket_sync,
-    generate_plan_sync,
-    decompose_ticket_sync,
-)
-# Shared context utilities
-from .context import (
-    get_sprint_context,
-    format_sprint_context_for_prompt,
-    get_sprint_context_summary,
-)
+
+# Everything else is imported on first attribute access (PEP 562) so that
+# importing one agent, or this package, doesn't load every agent, its
+# prompt templates and their dependencies at startup.
+_LAZY_EXPORTS = {
+    "model_router": [
+        "ModelRouter", "ModelSelectionResult", "TaskTypeConfig",
+        "get_model_router", "initialize_model_router",
+    ],
+    "guardrails": [
+        "Guardrails", "GuardrailConfig", "GuardrailResult", "GuardrailAction",
+        "ReflectionResult", "ReflectionOutcome", "GuardrailMetrics",
+        "get_guardrails", "initialize_guardrails",
+    ],
+    "arjuna": [
+        "ArjunaAgent", "get_arjuna_agent", "AVAILABLE_MODELS", "SYSTEM_PAGES",
+        "MODEL_ALIASES", "FOCUS_KEYWORDS",
+        # MCP Short Notation Commands
+        "MCP_COMMANDS", "MCP_INFERENCE_PATTERNS", "parse_mcp_command",
+        "infer_mcp_command", "get_command_help",
+        # Adapter functions for backward compatibility
+        "get_follow_up_suggestions", "get_focus_recommendations",
+        "get_system_context", "parse_assistant_intent", "execute_intent",
+    ],
+    "career_coach": [
+        "CareerCoachAgent", "get_career_coach_agent", "CAREER_REPO_CAPABILITIES",
+        "format_capabilities_context",
+        # Adapter functions for backward compatibility
+        "get_career_capabilities", "career_chat_adapter",
+        "generate_suggestions_adapter", "analyze_standup_adapter",
+    ],
+    "meeting_analyzer": [
+        "MeetingAnalyzerAgent", "get_meeting_analyzer",
+        "parse_meeting_summary_adaptive", "extract_signals_from_meeting",
+        "SIGNAL_TYPES", "HEADING_TO_SIGNAL_TYPE",
+    ],
+    "dikw_synthesizer": [
+        "DIKWSynthesizerAgent", "get_dikw_synthesizer", "DIKW_LEVELS",
+        "DIKW_NEXT_LEVEL", "DIKW_LEVEL_DESCRIPTIONS",
+        # Adapter functions for backward compatibility
+        "promote_signal_to_dikw_adapter", "promote_dikw_item_adapter",
+        "merge_dikw_items_adapter", "validate_dikw_item_adapter",
+        "generate_dikw_tags_adapter", "ai_summarize_dikw_adapter",
+        "ai_promote_dikw_adapter", "get_mindmap_data_adapter", "generate_dikw_tags",
+    ],
+    "ticket_agent": [
+        "TicketAgent",
+        # Adapter functions for backward compatibility
+        "summarize_ticket_adapter", "generate_plan_adapter", "decompose_ticket_adapter",
+        "summarize_ticket_sync", "generate_plan_sync", "decompose_ticket_sync",
+    ],
+    # Event loop for running agents from sync code
+    "runtime": [
+        "AgentRuntime", "ClientDisconnected", "get_runtime", "shutdown_runtime",
+        "run_sync", "run_cancellable",
+    ],
+    # Shared context utilities
+    "context": [
+        "get_sprint_context", "format_sprint_context_for_prompt",
+        "get_sprint_context_summary",
+    ],
+}
+_LAZY_NAMES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
 import logging
 
 logger = logging.getLogger(__name__)
@@ -244,6 +233,13 @@ __all__ = [
     "summarize_ticket_sync",
     "generate_plan_sync",
     "decompose_ticket_sync",
+    # Agent Runtime
+    "AgentRuntime",
+    "ClientDisconnected",
+    "get_runtime",
+    "shutdown_runtime",
+    "run_sync",
+    "run_cancellable",
     # Shared Sprint Context
     "get_sprint_context",
     "format_sprint_context_for_prompt",
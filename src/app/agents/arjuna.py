@@ -16,13 +16,14 @@ Maintains backward compatibility through an adapter layer.
 
 from typing import Any, Dict, List, Optional
 from datetime import datetime, date, timedelta
-from pathlib import Path
 import asyncio
 import json
 import logging
 
-from jinja2 import Environment, FileSystemLoader
 from ..agents.base import BaseAgent, AgentConfig
+from ..prompt_templates import get_prompt_env
+from ..token_budget import ContextBlock, count_tokens, pack_context, prompt_budget
+from ..agents.runtime import run_sync
 from ..agents.context import get_sprint_context, format_sprint_context_for_prompt
 
 logger = logging.getLogger(__name__)
@@ -198,13 +199,7 @@ class ArjunaAgent(BaseAgent):
         self.db_connection = db_connection
         
         # Initialize Jinja2 environment for prompt templates
-        prompts_dir = Path(__file__).parent.parent.parent.parent / "prompts" / "agents" / "arjuna"
-        if prompts_dir.exists():
-            self.jinja_env = Environment(loader=FileSystemLoader(str(prompts_dir)))
-            logger.info(f"Loaded Arjuna prompts from {prompts_dir}")
-        else:
-            self.jinja_env = None
-            logger.warning(f"Arjuna prompts directory not found: {prompts_dir}")
+        self.jinja_env = get_prompt_env("agents/arjuna")
     
     def get_system_prompt(self) -> str:
         """Generate system prompt from Jinja2 template."""
@@ -1042,6 +1037,8 @@ Analyze the user's intent and respond with JSON as specified."""
                 f"UPDATE tickets SET {', '.join(updates)} WHERE ticket_id = ?",
                 params,
             )
+            from ..services.ticket_index import index_ticket_changed
+            index_ticket_changed({"ticket_id": ticket_id, **{k: entities[k] for k in ("status", "priority") if k in entities}})
         
         return {"success": True, "action": "update_ticket"}
     
@@ -1197,7 +1194,7 @@ Analyze the user's intent and respond with JSON as specified."""
             """
             SELECT meeting_name, meeting_date, signals_json
             FROM meeting_summaries
-            WHERE meeting_name LIKE ? OR raw_text LIKE ? OR signals_json LIKE ?
+            WHERE meeting_name LIKE ? OR blob_text(raw_text) LIKE ? OR signals_json LIKE ?
             ORDER BY meeting_date DESC
             LIMIT 5
             """,
@@ -1597,7 +1594,7 @@ Analyze the user's intent and respond with JSON as specified."""
                     meetings_raw = conn.execute(
                         """SELECT ms.id, ms.meeting_name, ms.raw_text, ms.meeting_date
                            FROM meeting_summaries ms
-                           WHERE LOWER(ms.raw_text) LIKE ?
+                           WHERE LOWER(blob_text(ms.raw_text)) LIKE ?
                            ORDER BY COALESCE(ms.meeting_date, ms.created_at) DESC
                            LIMIT 10""",
                         (f"%{search_name.lower()}%",)
@@ -1623,7 +1620,7 @@ Analyze the user's intent and respond with JSON as specified."""
                         """SELECT md.id, md.content, md.source, md.doc_type, ms.meeting_name, ms.meeting_date
                            FROM meeting_documents md
                            JOIN meeting_summaries ms ON md.meeting_id = ms.id
-                           WHERE LOWER(md.content) LIKE ?
+                           WHERE LOWER(blob_text(md.content)) LIKE ?
                            ORDER BY COALESCE(ms.meeting_date, md.created_at) DESC
                            LIMIT 10""",
                         (f"%{search_name.lower()}%",)
@@ -1690,9 +1687,16 @@ Analyze the user's intent and respond with JSON as specified."""
         return "\n".join(snippets)
     
     async def _get_recent_meetings_context(self) -> str:
-        """Get context from recent meetings for quick_ask.
+        """Get context from recent meetings as one string (no token budget)."""
+        blocks = await self._get_recent_meetings_blocks()
+        return "\n\n".join(block.text for block in blocks)
+    
+    async def _get_recent_meetings_blocks(self) -> List[ContextBlock]:
+        """Get context blocks from recent meetings for quick_ask.
         
         Tries Supabase first (for Railway/production), falls back to SQLite.
+        Newer meetings get higher priority, and each meeting's signals rank
+        above its notes, so pack_context() cuts old notes first.
         """
         meetings = []
         
@@ -1726,30 +1730,34 @@ Analyze the user's intent and respond with JSON as specified."""
                             m['signals'] = m.pop('signals_json')
             except Exception as e:
                 logger.error(f"Failed to fetch meeting context from SQLite: {e}")
-                return ""
-        
-        if not meetings:
-            return ""
+                return []
         
-        context_parts = []
-        for m in meetings:
+        blocks = []
+        for age, m in enumerate(meetings):
             notes = m.get('synthesized_notes', '')
             name = m.get('meeting_name', 'Unknown Meeting')
-            context_parts.append(f"Meeting: {name}\n{notes[:1000] if notes else '(No notes)'}")
+            blocks.append(ContextBlock(
+                f"Meeting: {name}\n{notes if notes else '(No notes)'}",
+                priority=50 - 2 * age,
+                name=f"meeting:{name}",
+            ))
             
             signals = m.get('signals') or m.get('signals_json')
             if signals:
                 try:
                     if isinstance(signals, str):
                         signals = json.loads(signals)
+                    lines = []
                     for stype in ["decisions", "action_items", "blockers", "risks", "ideas"]:
                         items = signals.get(stype, [])
                         if items:
-                            context_parts.append(f"{stype}: {', '.join(str(i) for i in items[:3])}")
+                            lines.append(f"{stype}: {', '.join(str(i) for i in items)}")
+                    if lines:
+                        blocks.append(ContextBlock("\n\n".join(lines), priority=51 - 2 * age, name=f"signals:{name}"))
                 except Exception:
                     pass
         
-        return "\n\n".join(context_parts)
+        return blocks
     
     def get_sprint_context_for_prompt(self) -> str:
         """
@@ -2137,31 +2145,43 @@ Keep it concise but informative. Use first person ("I"). Be specific about ticke
         
         # F2b: Special handling for user mentions - search raw transcripts
         if topic == "rowan_mentions":
-            context = await self._search_user_mentions_in_transcripts(user_name)
+            mentions = await self._search_user_mentions_in_transcripts(user_name)
+            blocks = [ContextBlock(mentions, priority=60, name="mentions")]
         else:
             # Standard context from recent meetings
-            context = await self._get_recent_meetings_context()
+            blocks = await self._get_recent_meetings_blocks()
+        has_context = any(block.text.strip() for block in blocks)
         
         # Include sprint context for work-related topics
         sprint_context = ""
         if topic in ["sprint_status", "my_plate", "blockers", "action_items", "this_week"] or not topic:
             sprint_context = self.get_sprint_context_for_prompt()
-        
-        # Check if we have enough context
-        has_context = bool(context and context.strip())
         has_sprint = bool(sprint_context and sprint_context.strip())
         
         if has_context or has_sprint:
-            prompt = f"""Based on this context from recent meetings and documents:
-
-{context if context else "(No recent meeting notes available)"}
-
-{f"Current Sprint Status:{chr(10)}{sprint_context}" if sprint_context else ""}
-
-Question: {question}
+            if not has_context:
+                blocks = [ContextBlock("(No recent meeting notes available)", required=True, name="no_notes")]
+            if has_sprint:
+                # Sprint questions need the sprint state more than old meeting notes
+                blocks.append(ContextBlock(
+                    f"Current Sprint Status:\n{sprint_context}",
+                    priority=70 if topic in ("sprint_status", "my_plate") else 45,
+                    name="sprint",
+                ))
+            
+            header = "Based on this context from recent meetings and documents:"
+            footer = f"""Question: {question}
 
 Provide a concise, helpful answer. Focus on the most relevant information. Use bullet points where appropriate.
 If the context doesn't directly answer the question, provide general guidance or ask clarifying questions."""
+            model = self.config.primary_model
+            budget = prompt_budget(
+                model,
+                max_output_tokens=self.config.max_tokens,
+                reserved_tokens=count_tokens(self.get_system_prompt(), model) + count_tokens(header + footer, model),
+            )
+            packed = pack_context(blocks, budget, model=model, caller="arjuna.quick_ask")
+            prompt = f"{header}\n\n{packed.text}\n\n{footer}"
         else:
             # Minimal context - still try to be helpful
             prompt = f"""Question: {question}
@@ -2252,7 +2272,11 @@ _arjuna_instance: Optional[ArjunaAgent] = None
 
 
 class SimpleLLMClient:
-    """Simple LLM client wrapper for use outside the registry."""
+    """Simple LLM client wrapper for use outside the registry.
+    
+    Awaits the async provider client, so agent calls don't block the event
+    loop and are aborted when the calling task is cancelled.
+    """
     
     async def ask(
         self,
@@ -2263,20 +2287,20 @@ class SimpleLLMClient:
         max_tokens: int = 1000,
     ) -> str:
         """Call the LLM."""
-        from ..llm import _openai_client_once
+        from ..llm import acomplete
         
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        resp = _openai_client_once().chat.completions.create(
-            model=model,
-            messages=messages,
+        return await acomplete(
+            messages,
+            model,
             temperature=temperature,
             max_tokens=max_tokens,
+            trace_name=None,  # timed per agent in BaseAgent._call_model
         )
-        return resp.choices[0].message.content.strip()
 
 
 def get_arjuna_agent() -> ArjunaAgent:
@@ -2333,8 +2357,6 @@ def parse_assistant_intent(message: str, context: dict, history: list, thread_id
     
     Note: This is a synchronous adapter. For async code, use ArjunaAgent directly.
     """
-    import asyncio
-    
     agent = get_arjuna_agent()
     
     # Set thread_id on agent for LangSmith tracing
@@ -2375,22 +2397,9 @@ def parse_assistant_intent(message: str, context: dict, history: list, thread_id
                 "suggested_page": None,
             }
     
-    # For other intents, we need async - run in event loop
+    # For other intents, we need async - run on the shared agent loop
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If already in async context, create task
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    agent._parse_intent(message, context, history),
-                )
-                return future.result()
-        else:
-            return loop.run_until_complete(
-                agent._parse_intent(message, context, history)
-            )
+        return run_sync(agent._parse_intent(message, context, history))
     except Exception as e:
         logger.error(f"Intent parsing failed: {e}")
         return {
@@ -2408,22 +2417,10 @@ def execute_intent(intent_data: dict) -> dict:
     
     Note: This is a synchronous adapter. For async code, use ArjunaAgent directly.
     """
-    import asyncio
-    
     agent = get_arjuna_agent()
     
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    agent._execute_intent(intent_data),
-                )
-                return future.result()
-        else:
-            return loop.run_until_complete(agent._execute_intent(intent_data))
+        return run_sync(agent._execute_intent(intent_data))
     except Exception as e:
         logger.error(f"Intent execution failed: {e}")
         return {"success": False, "error": str(e)}
@@ -2458,22 +2455,10 @@ def quick_ask_sync(topic: Optional[str] = None, query: Optional[str] = None) ->
     Returns:
         Dict with response and success status
     """
-    import asyncio
-    
     agent = get_arjuna_agent()
     
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    agent.quick_ask(topic=topic, query=query),
-                )
-                return future.result()
-        else:
-            return loop.run_until_complete(agent.quick_ask(topic=topic, query=query))
+        return run_sync(agent.quick_ask(topic=topic, query=query))
     except Exception as e:
         logger.error(f"Quick ask failed: {e}")
         return {"response": f"AI Error: {str(e)}", "success": False}
@@ -7,12 +7,18 @@ Integrates with LangSmith tracing for observability and debugging.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from pydantic import BaseModel
 from datetime import datetime
+import asyncio
 import logging
+import time
 import uuid
 
+from .. import llm_cache
+from ..metrics import timer as metrics_timer
+from ..token_budget import count_tokens, record_prompt_tokens
+
 if TYPE_CHECKING:
     from .guardrails import Guardrails
 
@@ -33,25 +39,21 @@ except ImportError:
     logger.debug("Tracing module not available")
 
 
-def estimate_tokens(text: str) -> int:
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
     """
-    Estimate token count for text using a heuristic.
+    Count tokens for text.
     
-    Uses ~4 characters per token as a reasonable estimate for GPT models.
-    This is more accurate than word splitting for real-world text.
-    For precise counting, use tiktoken library.
+    Uses the model's tiktoken encoding when tiktoken is installed, otherwise
+    ~4 characters per token (see token_budget.count_tokens).
     
     Args:
-        text: Input text to estimate tokens for
+        text: Input text to count tokens for
+        model: Model whose tokenizer to use (defaults to the GPT-4 encoding)
     
     Returns:
-        Estimated token count
+        Token count
     """
-    if not text:
-        return 0
-    # ~4 chars per token is a reasonable heuristic for GPT models
-    # Slightly better than len(text.split()) which underestimates
-    return max(1, len(text) // 4)
+    return count_tokens(text, model)
 
 
 class AgentConfig(BaseModel):
@@ -229,6 +231,30 @@ class BaseAgent(ABC):
         
         start_time = datetime.now()
         
+        # === RESPONSE CACHE (opt-in per task type via routing policy) ===
+        cache_key = None
+        if llm_cache.get_ttl(task_type, self.model_router):
+            cache_key = llm_cache.make_key(selected_model, self.get_system_prompt(), prompt, temperature, max_tokens)
+            cached = await llm_cache.aget(cache_key, task_type)
+            if cached is not None:
+                self._last_run_id = None
+                self._log_interaction(
+                    model=selected_model,
+                    task_type=task_type,
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    latency_ms=int((datetime.now() - start_time).total_seconds() * 1000),
+                    status="cached",
+                )
+                return cached
+        
+        prompt_tokens = estimate_tokens(prompt, selected_model)
+        record_prompt_tokens(
+            prompt_tokens + estimate_tokens(self.get_system_prompt(), selected_model),
+            task_type=task_type,
+            agent=self.config.name,
+        )
+        
         # === LANGSMITH TRACING ===
         run_id = None
         langsmith_client = None
@@ -275,9 +301,17 @@ class BaseAgent(ABC):
             elif not is_tracing_enabled():
                 print("⚠️ LangSmith: tracing not enabled (env vars)")
         
+        # Latency-critical task types race a backup model past the primary's p95
+        hedge = None
+        if self.model_router and model is None and hasattr(self.model_router, "get_hedge_plan"):
+            hedge = self.model_router.get_hedge_plan(task_type, selected_model)
+        
         try:
-            response = await self._call_model(
+            call_start = time.monotonic()
+            response, answered_by, latency_ms = await self._call_model_hedged(
                 model=selected_model,
+                hedge=hedge,
+                task_type=task_type,
                 system_prompt=self.get_system_prompt(),
                 user_prompt=prompt,
                 temperature=temperature,
@@ -286,12 +320,12 @@ class BaseAgent(ABC):
             
             # Log interaction
             self._log_interaction(
-                model=selected_model,
+                model=answered_by,
                 task_type=task_type,
-                prompt_tokens=estimate_tokens(prompt),
-                completion_tokens=estimate_tokens(response),
-                latency_ms=int((datetime.now() - start_time).total_seconds() * 1000),
-                status="success"
+                prompt_tokens=prompt_tokens,
+                completion_tokens=estimate_tokens(response, answered_by),
+                latency_ms=latency_ms,
+                status="success" if answered_by == selected_model else "hedged"
             )
             
             # === UPDATE LANGSMITH TRACE (SUCCESS) ===
@@ -301,8 +335,8 @@ class BaseAgent(ABC):
                         run_id=run_id,
                         outputs={
                             "response": response[:2000],  # Truncate for storage
-                            "prompt_tokens": estimate_tokens(prompt),
-                            "completion_tokens": estimate_tokens(response),
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": estimate_tokens(response, answered_by),
                         },
                         end_time=datetime.now(),
                     )
@@ -332,10 +366,21 @@ class BaseAgent(ABC):
                             f"detected for {self.config.name}"
                         )
             
+            if cache_key:
+                await llm_cache.aput(cache_key, task_type, selected_model, response)
+            
             return response
             
         except Exception as e:
             logger.error(f"Model call failed for {selected_model}: {e}")
+            self._log_interaction(
+                model=selected_model,
+                task_type=task_type,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=0,
+                latency_ms=int((time.monotonic() - call_start) * 1000),
+                status="error",
+            )
             
             # === UPDATE LANGSMITH TRACE (ERROR) ===
             if langsmith_client and run_id:
@@ -353,6 +398,7 @@ class BaseAgent(ABC):
             
             for fallback_model in fallback_models:
                 logger.info(f"Attempting fallback model: {fallback_model}")
+                call_start = time.monotonic()
                 try:
                     response = await self._call_model(
                         model=fallback_model,
@@ -365,15 +411,23 @@ class BaseAgent(ABC):
                     self._log_interaction(
                         model=fallback_model,
                         task_type=task_type,
-                        prompt_tokens=estimate_tokens(prompt),
-                        completion_tokens=estimate_tokens(response),
-                        latency_ms=int((datetime.now() - start_time).total_seconds() * 1000),
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=estimate_tokens(response, fallback_model),
+                        latency_ms=int((time.monotonic() - call_start) * 1000),
                         status="fallback"
                     )
                     
                     return response
                 except Exception as fallback_error:
                     logger.error(f"Fallback model {fallback_model} also failed: {fallback_error}")
+                    self._log_interaction(
+                        model=fallback_model,
+                        task_type=task_type,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=0,
+                        latency_ms=int((time.monotonic() - call_start) * 1000),
+                        status="error",
+                    )
                     continue
             
             # All fallbacks exhausted
@@ -418,13 +472,87 @@ class BaseAgent(ABC):
         if not self.llm_client:
             raise RuntimeError("LLM client not initialized")
         
-        return await self.llm_client.ask(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        with metrics_timer("llm", f"agent:{self.config.name}"):
+            return await self.llm_client.ask(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+    
+    async def _call_model_hedged(
+        self,
+        model: str,
+        hedge: Optional[Tuple[str, float]],
+        task_type: Optional[str] = None,
+        **call_kwargs,
+    ) -> Tuple[str, str, int]:
+        """
+        Call ``model``; with a hedge plan, also start the backup model if the
+        primary hasn't answered after the hedge delay.
+        
+        The first successful answer wins and the other call is cancelled (its
+        elapsed time is still recorded, so a primary that keeps losing shows
+        up as slow). If both fail, the primary's error is raised.
+        
+        Returns:
+            (response, model that answered, that call's latency in ms)
+        """
+        started = {}
+        
+        def launch(name):
+            task = asyncio.ensure_future(self._call_model(model=name, **call_kwargs))
+            started[task] = (name, time.monotonic())
+            return task
+        
+        def elapsed_ms(task):
+            return int((time.monotonic() - started[task][1]) * 1000)
+        
+        def log_call(task, status):
+            self._log_interaction(
+                model=started[task][0],
+                task_type=task_type,
+                prompt_tokens=0,
+                completion_tokens=0,
+                latency_ms=elapsed_ms(task),
+                status=status,
+            )
+        
+        primary = launch(model)
+        pending = {primary}
+        winner = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge[1] / 1000 if hedge else None)
+            if primary in done:
+                winner = primary
+                return primary.result(), model, elapsed_ms(primary)
+            
+            backup = hedge[0]
+            logger.info(f"Hedging {self.config.name}/{task_type}: {model} over {hedge[1]:.0f}ms, starting {backup}")
+            secondary = launch(backup)
+            pending = {primary, secondary}
+            primary_error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        if primary_error is not None:
+                            log_call(primary, "error")
+                        return task.result(), started[task][0], elapsed_ms(task)
+                    if task is primary:
+                        primary_error = task.exception()
+                    else:
+                        log_call(secondary, "error")
+            raise primary_error
+        finally:
+            for task in pending:
+                task.cancel()
+                if winner is not None:
+                    log_call(task, "hedge_cancelled")
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
     
     def get_available_tools(self) -> List[str]:
         """Get list of tools this agent can use."""
@@ -452,6 +580,10 @@ class BaseAgent(ABC):
         }
         self.interaction_log.append(interaction)
         
+        # Feed the router's rolling per-model latency/error windows
+        if status != "cached" and self.model_router and hasattr(self.model_router, "record_outcome"):
+            self.model_router.record_outcome(model, latency_ms, success=status != "error")
+        
         logger.info(
             f"Agent {self.config.name} interaction: {model} | "
             f"task={task_type or 'default'} | "
@@ -13,13 +13,12 @@ Maintains backward compatibility through an adapter layer.
 
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-from pathlib import Path
 import json
 import logging
 import re
 
-from jinja2 import Environment, FileSystemLoader
 from ..agents.base import BaseAgent, AgentConfig
+from ..prompt_templates import get_prompt_env
 
 logger = logging.getLogger(__name__)
 
@@ -110,13 +109,7 @@ class CareerCoachAgent(BaseAgent):
         self.db_connection = db_connection
         
         # Initialize Jinja2 environment for prompt templates
-        prompts_dir = Path(__file__).parent.parent.parent.parent / "prompts" / "agents" / "career_coach"
-        if prompts_dir.exists():
-            self.jinja_env = Environment(loader=FileSystemLoader(str(prompts_dir)))
-            logger.info(f"Loaded Career Coach prompts from {prompts_dir}")
-        else:
-            self.jinja_env = None
-            logger.warning(f"Career Coach prompts directory not found: {prompts_dir}")
+        self.jinja_env = get_prompt_env("agents/career_coach")
     
     def get_system_prompt(self, profile: Dict = None, context: Dict = None) -> str:
         """Generate system prompt from Jinja2 template."""
@@ -20,12 +20,13 @@ DIKW Pyramid Levels:
 """
 
 from typing import Any, Dict, List, Optional, Tuple
-from pathlib import Path
 import json
 import logging
 
-from jinja2 import Environment, FileSystemLoader
 from ..agents.base import BaseAgent, AgentConfig
+from ..prompt_templates import get_prompt_env
+from ..agents.runtime import run_sync
+from .. import llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -154,13 +155,7 @@ class DIKWSynthesizerAgent(BaseAgent):
         self.db_connection = db_connection
         
         # Initialize Jinja2 environment for prompt templates
-        prompts_dir = Path(__file__).parent.parent.parent.parent / "prompts" / "agents" / "dikw_synthesizer"
-        if prompts_dir.exists():
-            self.jinja_env = Environment(loader=FileSystemLoader(str(prompts_dir)))
-            logger.info(f"Loaded DIKW Synthesizer prompts from {prompts_dir}")
-        else:
-            self.jinja_env = None
-            logger.warning(f"DIKW Synthesizer prompts directory not found: {prompts_dir}")
+        self.jinja_env = get_prompt_env("agents/dikw_synthesizer")
     
     def get_system_prompt(self, context: Optional[Dict] = None) -> str:
         """Generate system prompt from Jinja2 template."""
@@ -533,7 +528,7 @@ Return a JSON array of improvements (only include items that need changes):
         prompt = level_prompts.get(level, level_prompts['data'])
         
         try:
-            return await self._call_llm_text(prompt)
+            return await self._call_llm_text(prompt, task_type="dikw_enrichment")
         except Exception as e:
             logger.error(f"Failed to generate summary: {e}")
             return content[:200]
@@ -594,7 +589,7 @@ Rules:
 Return ONLY comma-separated tags, nothing else:"""
         
         try:
-            tags = await self._call_llm_text(prompt)
+            tags = await self._call_llm_text(prompt, task_type="dikw_enrichment")
             # Clean up the response
             tags = tags.strip().replace('"', '').replace("'", '')
             return tags
@@ -602,22 +597,41 @@ Return ONLY comma-separated tags, nothing else:"""
             logger.error(f"Failed to generate tags: {e}")
             return ""
     
-    async def _call_llm_text(self, prompt: str) -> str:
-        """Call LLM and get text response."""
+    async def _call_llm_text(self, prompt: str, task_type: str = "synthesis") -> str:
+        """Call LLM and get text response.
+        
+        Task types with cache_ttl_seconds in the routing policy (e.g.
+        dikw_enrichment) are served from the LLM response cache.
+        """
         # Get model from router
         model = "gpt-4o-mini"
         if self.model_router:
-            selection = self.model_router.select("synthesis", agent_name="dikw_synthesizer")
+            selection = self.model_router.select(task_type, agent_name="dikw_synthesizer")
             model = selection.model
         
+        cache_key = None
+        if llm_cache.get_ttl(task_type, self.model_router):
+            cache_key = llm_cache.make_key(model, None, prompt)
+            cached = await llm_cache.aget(cache_key, task_type)
+            if cached is not None:
+                return cached
+        
         if self.llm_client:
-            messages = [{"role": "user", "content": prompt}]
-            response = await self._call_llm(messages, model=model)
-            return response.get("content", "") if isinstance(response, dict) else str(response)
+            text = await self._call_model(
+                model=model,
+                system_prompt="",
+                user_prompt=prompt,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+            )
         else:
-            # Fallback to direct call
-            from ..llm import ask as ask_llm
-            return ask_llm(prompt, model=model)
+            # Fallback to direct (non-blocking) call
+            from ..llm import ask_async
+            text = await ask_async(prompt, model=model, trace_name="agent:dikw_synthesizer")
+        
+        if cache_key:
+            await llm_cache.aput(cache_key, task_type, model, text)
+        return text
     
     # =========================================================================
     # STATIC UTILITIES
@@ -1167,22 +1181,8 @@ def generate_dikw_tags(content: str, level: str, existing_tags: str = "") -> str
     Synchronous wrapper for tag generation.
     Used by main.py for direct calls.
     """
-    import asyncio
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # Already in async context, use create_task
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    generate_dikw_tags_adapter(content, level, existing_tags)
-                )
-                return future.result()
-        else:
-            return loop.run_until_complete(
-                generate_dikw_tags_adapter(content, level, existing_tags)
-            )
+        return run_sync(generate_dikw_tags_adapter(content, level, existing_tags))
     except Exception as e:
         logger.error(f"Failed to generate tags synchronously: {e}")
         # Fallback to simple extraction
@@ -6,6 +6,7 @@ AI-powered meeting analysis that provides:
 - Adaptive heading-based parsing for multiple summary formats (Teams, Pocket, etc.)
 - Screenshot analysis with vision integration
 - Multi-source transcript processing
+- Map-reduce extraction over long transcripts (chunked, concurrent, merged)
 - Semantic signal grouping and deduplication
 
 Extracted from meetings.py and mcp/extract.py following the migration plan.
@@ -13,13 +14,13 @@ Maintains backward compatibility through adapter functions.
 """
 
 from typing import Any, Dict, List, Optional
-from pathlib import Path
 import json
 import logging
 import re
 
-from jinja2 import Environment, FileSystemLoader
 from ..agents.base import BaseAgent, AgentConfig
+from ..prompt_templates import get_prompt_env
+from ..services.transcript_chunks import map_chunks, reduce_signals, split_transcript
 
 logger = logging.getLogger(__name__)
 
@@ -167,13 +168,7 @@ class MeetingAnalyzerAgent(BaseAgent):
         self.db_connection = db_connection
         
         # Initialize Jinja2 environment for prompt templates
-        prompts_dir = Path(__file__).parent.parent.parent.parent / "prompts" / "agents" / "meeting_analyzer"
-        if prompts_dir.exists():
-            self.jinja_env = Environment(loader=FileSystemLoader(str(prompts_dir)))
-            logger.info(f"Loaded Meeting Analyzer prompts from {prompts_dir}")
-        else:
-            self.jinja_env = None
-            logger.warning(f"Meeting Analyzer prompts directory not found: {prompts_dir}")
+        self.jinja_env = get_prompt_env("agents/meeting_analyzer")
     
     def get_system_prompt(self, meeting: Dict = None, context: Dict = None) -> str:
         """Generate system prompt from Jinja2 template."""
@@ -240,9 +235,11 @@ Be thorough but avoid duplicates. Attribute actions to specific people when ment
         signals = self.extract_signals_from_sections(parsed_sections)
         
         # Step 3: If we have few signals, use AI to enhance extraction
+        signal_sources = None
         if self._should_use_ai_extraction(signals):
-            ai_signals = await self._extract_signals_with_ai(meeting_text, context)
-            signals = self._merge_signals(signals, ai_signals)
+            extraction = await self.extract_signals_chunked(meeting_text, context)
+            signals = self._merge_signals(signals, extraction["signals"])
+            signal_sources = extraction["sources"]
         
         # Step 4: Deduplicate and validate signals
         signals = self._deduplicate_signals(signals)
@@ -254,6 +251,7 @@ Be thorough but avoid duplicates. Attribute actions to specific people when ment
             "meeting_name": meeting_name,
             "meeting_date": meeting_date,
             "signal_counts": {k: len(v) for k, v in signals.items() if isinstance(v, list)},
+            "signal_sources": signal_sources,
         }
     
     # =========================================================================
@@ -514,8 +512,7 @@ Be thorough but avoid duplicates. Attribute actions to specific people when ment
         """
         Use AI to extract signals when rule-based parsing finds few.
         
-        Integrates with SignalLearningService (PC-1) to include user feedback
-        patterns in the extraction prompt.
+        Covers the whole text via extract_signals_chunked().
         
         Args:
             meeting_text: The meeting text
@@ -524,35 +521,69 @@ Be thorough but avoid duplicates. Attribute actions to specific people when ment
         Returns:
             Dict with extracted signals
         """
-        if not self.jinja_env:
-            return self._extract_signals_keyword_fallback(meeting_text)
+        return (await self.extract_signals_chunked(meeting_text, context))["signals"]
+    
+    async def extract_signals_chunked(
+        self,
+        meeting_text: str,
+        context: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Map-reduce signal extraction over the full meeting text.
         
-        try:
+        The text is split into overlapping speaker-turn chunks, each chunk is
+        extracted concurrently (at most max_concurrency LLM calls in flight),
+        and the results are merged and deduplicated in transcript order. A
+        chunk whose LLM call fails falls back to keyword extraction, so one
+        bad response never drops a section of the meeting.
+        
+        Integrates with SignalLearningService (PC-1) to include user feedback
+        patterns in every chunk prompt.
+        
+        Args:
+            meeting_text: The meeting summary or transcript text
+            context: Additional context
+            max_concurrency: Cap on concurrent chunk extractions
+        
+        Returns:
+            Dict with "signals", "sources" (offsets per signal), "chunks"
+            and "failed_chunks" (see transcript_chunks.reduce_signals)
+        """
+        chunks = split_transcript(meeting_text)
+        
+        template = None
+        learning_context = ""
+        if self.jinja_env:
+            try:
+                template = self.jinja_env.get_template("extract_signals.jinja2")
+            except Exception as e:
+                logger.error(f"Failed to load extraction prompt: {e}")
+        if template is not None:
             # Get learning context from user feedback (PC-1 integration)
-            learning_context = ""
             try:
                 from ..services.signal_learning import get_learning_context_for_extraction
                 learning_context = get_learning_context_for_extraction()
             except Exception as e:
                 logger.debug(f"Could not load signal learning context: {e}")
-            
-            template = self.jinja_env.get_template("extract_signals.jinja2")
-            prompt = template.render(
-                meeting_text=meeting_text[:4000],  # Limit context size
-                signal_types=SIGNAL_TYPES,
-                learning_context=learning_context,  # Add feedback-based hints
-            )
-            
-            response = await self.ask_llm(
-                prompt,
-                system_prompt=self.get_system_prompt(context=context),
-                task_type="extraction",
-            )
-            
-            return self._parse_ai_signal_response(response)
-        except Exception as e:
-            logger.error(f"AI signal extraction failed: {e}")
-            return self._extract_signals_keyword_fallback(meeting_text)
+        
+        async def extract(chunk):
+            if template is None:
+                return self._extract_signals_keyword_fallback(chunk.text)
+            try:
+                prompt = template.render(
+                    meeting_text=chunk.text,
+                    signal_types=SIGNAL_TYPES,
+                    learning_context=learning_context,  # Add feedback-based hints
+                )
+                response = await self.ask_llm(prompt, task_type="extraction")
+                return self._parse_ai_signal_response(response)
+            except Exception as e:
+                logger.error(f"AI signal extraction failed for chunk {chunk.index}: {e}")
+                return self._extract_signals_keyword_fallback(chunk.text)
+        
+        results = await map_chunks(chunks, extract, max_concurrency=max_concurrency)
+        return reduce_signals(chunks, results)
     
     def _extract_signals_keyword_fallback(self, text: str) -> Dict[str, List[str]]:
         """
@@ -615,9 +646,9 @@ Be thorough but avoid duplicates. Attribute actions to specific people when ment
             "key_signals": [],
         }
         
-        # Try to parse as JSON first
+        # Try to parse as JSON first (the prompt asks for a ```json block)
         try:
-            parsed = json.loads(response)
+            parsed = json.loads(re.sub(r"^\s*```(?:json)?\s*|\s*```\s*$", "", response))
             if isinstance(parsed, dict):
                 for key in result:
                     if key in parsed and isinstance(parsed[key], list):
@@ -6,22 +6,35 @@ Implements checkpoint 1.7 from PHASED_MIGRATION_ROLLOUT.md:
 - Deterministic fallback chain
 - User override via config or explicit param
 - Declarative routing policy (YAML) for future LangChain/LangGraph swap
+- Adaptive routing: rolling per-model latency percentiles and error rates
+  (fed by BaseAgent._log_interaction) steer selection away from models that
+  are failing or slower than the task type's latency_budget_ms, and
+  latency-critical task types (hedge: true) can race a backup model once
+  the primary passes its p95
 
 Usage:
     router = get_model_router()
     model = router.select("classification", agent_name="arjuna")
     model = router.select("synthesis", override="gpt-4o")  # User override
+    router.record_outcome("gpt-4o-mini", latency_ms=850, success=True)
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
+from bisect import bisect_left
+from collections import Counter, deque
 import logging
+import threading
+import time
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Same policy file the agent registry loads (config/model_routing.yaml)
+DEFAULT_POLICY_PATH = Path(__file__).resolve().parents[3] / "config" / "model_routing.yaml"
+
 
 @dataclass
 class ModelSelectionResult:
@@ -46,6 +59,152 @@ class TaskTypeConfig:
     max_tokens: int = 1000
     cost_tier: str = "standard"
     description: str = ""
+    cache_ttl_seconds: int = 0  # > 0 opts the task type into the LLM response cache
+    hedge: bool = False  # race a backup model once the primary passes its p95
+
+
+@dataclass
+class AdaptiveRoutingConfig:
+    """Policy knobs for latency/error-aware selection (``adaptive_routing`` in the YAML)."""
+    enabled: bool = True
+    window_size: int = 100  # most recent calls kept per model
+    window_seconds: int = 600  # older samples expire, so a recovered model is retried
+    min_samples: int = 5  # below this a model is assumed healthy
+    max_error_rate: float = 0.5
+    hedge_min_delay_ms: int = 250
+
+
+# Latency buckets for the rolling windows: 10ms .. ~2min in 25% steps, fine
+# enough to compare a p95 against a latency budget
+_WINDOW_BOUNDS_MS = tuple(10 * 1.25 ** i for i in range(43))
+
+
+class RollingModelStats:
+    """
+    Latency and error rate of one model over its last ``size`` calls.
+    
+    Samples live in a deque and are also counted into fixed latency buckets,
+    so recording, expiring and reading a percentile are all constant time
+    regardless of traffic. Samples older than ``window_seconds`` are dropped.
+    """
+    
+    def __init__(self, size: int = 100, window_seconds: float = 600):
+        self.size = size
+        self.window_seconds = window_seconds
+        self._samples: deque = deque()  # (timestamp, bucket or None for errors, latency_ms)
+        self._counts = [0] * (len(_WINDOW_BOUNDS_MS) + 1)
+        self._ok = 0
+        self._errors = 0
+        self._total_ms = 0.0
+        self._lock = threading.Lock()
+    
+    def record(self, latency_ms: float, success: bool = True, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._expire(now)
+            if len(self._samples) >= self.size:
+                self._evict()
+            bucket = bisect_left(_WINDOW_BOUNDS_MS, latency_ms) if success else None
+            self._samples.append((now, bucket, latency_ms))
+            if bucket is None:
+                self._errors += 1
+            else:
+                self._counts[bucket] += 1
+                self._ok += 1
+                self._total_ms += latency_ms
+    
+    def _evict(self):
+        _, bucket, latency_ms = self._samples.popleft()
+        if bucket is None:
+            self._errors -= 1
+        else:
+            self._counts[bucket] -= 1
+            self._ok -= 1
+            self._total_ms -= latency_ms
+    
+    def _expire(self, now: float):
+        cutoff = now - self.window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._evict()
+    
+    def count(self, now: Optional[float] = None) -> int:
+        with self._lock:
+            self._expire(time.monotonic() if now is None else now)
+            return len(self._samples)
+    
+    def error_rate(self, now: Optional[float] = None) -> float:
+        with self._lock:
+            self._expire(time.monotonic() if now is None else now)
+            total = self._ok + self._errors
+            return self._errors / total if total else 0.0
+    
+    def quantile(self, q: float, now: Optional[float] = None) -> float:
+        """Latency (ms) at quantile q of successful calls, interpolated within its bucket."""
+        with self._lock:
+            self._expire(time.monotonic() if now is None else now)
+            if not self._ok:
+                return 0.0
+            rank = q * self._ok
+            seen = 0
+            for index, n in enumerate(self._counts):
+                if n and seen + n >= rank:
+                    lower = _WINDOW_BOUNDS_MS[index - 1] if index else 0.0
+                    upper = _WINDOW_BOUNDS_MS[index] if index < len(_WINDOW_BOUNDS_MS) else lower * 1.25
+                    return lower + (upper - lower) * (rank - seen) / n
+                seen += n
+            return _WINDOW_BOUNDS_MS[-1]
+    
+    def summary(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            ok, errors, total_ms = self._ok, self._errors, self._total_ms
+        return {
+            "calls": ok + errors,
+            "errors": errors,
+            "error_rate": round(errors / (ok + errors), 3) if ok + errors else 0.0,
+            "avg_ms": round(total_ms / ok, 1) if ok else 0.0,
+            "p50_ms": round(self.quantile(0.50, now), 1),
+            "p95_ms": round(self.quantile(0.95, now), 1),
+        }
+
+
+class _SelectionCounters:
+    """Per-minute selection counts, so stats never rescan the selection log."""
+    
+    def __init__(self, retention_minutes: int = 24 * 60):
+        self._buckets: deque = deque(maxlen=retention_minutes)
+        self._lock = threading.Lock()
+    
+    def add(self, result: "ModelSelectionResult", now: Optional[float] = None):
+        minute = int((time.time() if now is None else now) // 60)
+        with self._lock:
+            if not self._buckets or self._buckets[-1]["minute"] != minute:
+                self._buckets.append({
+                    "minute": minute, "total": 0, "overrides": 0, "fallbacks": 0, "adaptive": 0,
+                    "by_model": Counter(), "by_task_type": Counter(),
+                })
+            bucket = self._buckets[-1]
+            bucket["total"] += 1
+            bucket["overrides"] += result.override_applied
+            bucket["fallbacks"] += result.fallback_used
+            bucket["adaptive"] += result.selection_reason.startswith("adaptive")
+            bucket["by_model"][result.model] += 1
+            bucket["by_task_type"][result.task_type] += 1
+    
+    def totals(self, minutes: int, now: Optional[float] = None) -> Dict[str, Any]:
+        first = int((time.time() if now is None else now) // 60) - minutes + 1
+        totals = {"total": 0, "overrides": 0, "fallbacks": 0, "adaptive": 0,
+                  "by_model": Counter(), "by_task_type": Counter()}
+        with self._lock:
+            for bucket in reversed(self._buckets):
+                if bucket["minute"] < first:
+                    break
+                for key in ("total", "overrides", "fallbacks", "adaptive"):
+                    totals[key] += bucket[key]
+                totals["by_model"].update(bucket["by_model"])
+                totals["by_task_type"].update(bucket["by_task_type"])
+        return totals
 
 
 # Default routing policy embedded for zero-config startup
@@ -62,6 +221,8 @@ DEFAULT_ROUTING_POLICY = {
             "latency_budget_ms": 2000,
             "max_tokens": 500,
             "cost_tier": "low",
+            "cache_ttl_seconds": 3600,
+            "hedge": True,
             "description": "Intent classification, routing, simple parsing"
         },
         "routing": {
@@ -70,6 +231,7 @@ DEFAULT_ROUTING_POLICY = {
             "latency_budget_ms": 1500,
             "max_tokens": 300,
             "cost_tier": "low",
+            "hedge": True,
             "description": "Agent routing, query classification"
         },
         "parsing": {
@@ -78,6 +240,7 @@ DEFAULT_ROUTING_POLICY = {
             "latency_budget_ms": 2000,
             "max_tokens": 500,
             "cost_tier": "low",
+            "cache_ttl_seconds": 86400,
             "description": "Structured extraction, JSON parsing"
         },
         
@@ -88,6 +251,7 @@ DEFAULT_ROUTING_POLICY = {
             "latency_budget_ms": 5000,
             "max_tokens": 1000,
             "cost_tier": "standard",
+            "cache_ttl_seconds": 86400,
             "description": "Meeting summaries, document summaries"
         },
         "extraction": {
@@ -124,6 +288,15 @@ DEFAULT_ROUTING_POLICY = {
             "cost_tier": "premium",
             "description": "Deep analysis, career insights, pattern detection"
         },
+        "dikw_enrichment": {
+            "default_model": "gpt-4o",
+            "fallback_models": ["gpt-4o-mini", "gpt-3.5-turbo"],
+            "latency_budget_ms": 10000,
+            "max_tokens": 1000,
+            "cost_tier": "premium",
+            "cache_ttl_seconds": 604800,
+            "description": "DIKW level summaries and tags (pure function of the item content)"
+        },
         "long_context": {
             "default_model": "gpt-4o",
             "fallback_models": ["gpt-4o-mini"],
@@ -182,6 +355,16 @@ DEFAULT_ROUTING_POLICY = {
         "model": "gpt-4o-mini",
         "reason": "Unknown task type, using global fallback"
     },
+    
+    # Latency/error-aware selection among default_model + fallback_models
+    "adaptive_routing": {
+        "enabled": True,
+        "window_size": 100,
+        "window_seconds": 600,
+        "min_samples": 5,
+        "max_error_rate": 0.5,
+        "hedge_min_delay_ms": 250,
+    },
 }
 
 
@@ -195,6 +378,10 @@ class ModelRouter:
     3. Task type default from policy
     4. Agent default task type
     5. Global fallback
+    
+    For 3 and 4 the task type's default model is skipped in favour of the
+    first fallback that is within budget when the default's rolling p95
+    exceeds latency_budget_ms or its error rate exceeds max_error_rate.
     """
     
     def __init__(self, policy_path: Optional[str] = None):
@@ -206,7 +393,11 @@ class ModelRouter:
         """
         self.policy = self._load_policy(policy_path)
         self.task_configs: Dict[str, TaskTypeConfig] = {}
-        self.selection_log: List[ModelSelectionResult] = []
+        self.adaptive = AdaptiveRoutingConfig()
+        self.selection_log: deque = deque(maxlen=1000)
+        self._selection_counters = _SelectionCounters()
+        self._model_stats: Dict[str, RollingModelStats] = {}
+        self._stats_lock = threading.Lock()
         self._parse_policy()
         
         logger.info(f"ModelRouter initialized with {len(self.task_configs)} task types")
@@ -234,7 +425,15 @@ class ModelRouter:
                 max_tokens=config.get("max_tokens", 1000),
                 cost_tier=config.get("cost_tier", "standard"),
                 description=config.get("description", ""),
+                cache_ttl_seconds=config.get("cache_ttl_seconds", 0),
+                hedge=bool(config.get("hedge", False)),
             )
+        
+        adaptive = self.policy.get("adaptive_routing") or {}
+        self.adaptive = AdaptiveRoutingConfig(**{
+            key: value for key, value in adaptive.items()
+            if key in AdaptiveRoutingConfig.__dataclass_fields__
+        })
     
     def select(
         self,
@@ -289,11 +488,13 @@ class ModelRouter:
         # Priority 3: Task type default
         if task_type and task_type in self.task_configs:
             config = self.task_configs[task_type]
+            model, reason = self._route_within_budget(config, "task_type_default")
             result = ModelSelectionResult(
-                model=config.default_model,
+                model=model,
                 task_type=task_type,
                 agent_name=agent_name,
-                selection_reason="task_type_default",
+                selection_reason=reason,
+                fallback_used=model != config.default_model,
                 latency_budget_ms=config.latency_budget_ms,
                 cost_tier=config.cost_tier,
             )
@@ -307,11 +508,13 @@ class ModelRouter:
                 default_task = agent_defaults[agent_name]
                 if default_task in self.task_configs:
                     config = self.task_configs[default_task]
+                    model, reason = self._route_within_budget(config, "agent_default_task_type")
                     result = ModelSelectionResult(
-                        model=config.default_model,
+                        model=model,
                         task_type=default_task,
                         agent_name=agent_name,
-                        selection_reason="agent_default_task_type",
+                        selection_reason=reason,
+                        fallback_used=model != config.default_model,
                         latency_budget_ms=config.latency_budget_ms,
                         cost_tier=config.cost_tier,
                     )
@@ -334,6 +537,9 @@ class ModelRouter:
         """
         Get the fallback chain for a task type.
         
+        Models currently over budget or failing are moved to the end
+        (policy order is kept otherwise).
+        
         Returns:
             List of models in fallback order [primary, fallback1, fallback2, ...]
         """
@@ -342,12 +548,90 @@ class ModelRouter:
             return [fallback.get("model", "gpt-4o-mini")]
         
         config = self.task_configs[task_type]
-        return [config.default_model] + config.fallback_models
+        chain = [config.default_model] + config.fallback_models
+        if not self.adaptive.enabled:
+            return chain
+        healthy = [m for m in chain if self._health_issue(m, config.latency_budget_ms) is None]
+        return healthy + [m for m in chain if m not in healthy]
+    
+    # -------------------------
+    # Adaptive routing
+    # -------------------------
+    
+    def record_outcome(self, model: str, latency_ms: float, success: bool = True):
+        """Feed one call's latency/outcome into the model's rolling window."""
+        if not model:
+            return
+        stats = self._model_stats.get(model)
+        if stats is None:
+            with self._stats_lock:
+                stats = self._model_stats.setdefault(
+                    model, RollingModelStats(self.adaptive.window_size, self.adaptive.window_seconds)
+                )
+        stats.record(latency_ms, success)
+    
+    def _health_issue(self, model: str, latency_budget_ms: Optional[int]) -> Optional[str]:
+        """"errors" or "latency" when the model should be routed around, else None."""
+        stats = self._model_stats.get(model)
+        if stats is None or stats.count() < self.adaptive.min_samples:
+            return None
+        if stats.error_rate() > self.adaptive.max_error_rate:
+            return "errors"
+        if latency_budget_ms and stats.quantile(0.95) > latency_budget_ms:
+            return "latency"
+        return None
+    
+    def _route_within_budget(self, config: TaskTypeConfig, default_reason: str) -> Tuple[str, str]:
+        """First model of the task type's chain that is healthy and within budget."""
+        if not self.adaptive.enabled:
+            return config.default_model, default_reason
+        issue = self._health_issue(config.default_model, config.latency_budget_ms)
+        if issue is None:
+            return config.default_model, default_reason
+        for model in config.fallback_models:
+            if self._health_issue(model, config.latency_budget_ms) is None:
+                return model, f"adaptive_{issue}"
+        # Everything is degraded: keep the default rather than bounce between models
+        return config.default_model, default_reason
+    
+    def get_hedge_plan(self, task_type: Optional[str], model: str) -> Optional[Tuple[str, float]]:
+        """
+        Backup model and delay for a hedged request, or None.
+        
+        Only task types with ``hedge: true`` are hedged. The backup fires once
+        the primary has been running for its rolling p95 (the latency budget
+        until enough samples exist), never sooner than hedge_min_delay_ms.
+        """
+        config = self.task_configs.get(task_type) if task_type else None
+        if not self.adaptive.enabled or config is None or not config.hedge:
+            return None
+        backup = next(
+            (m for m in self.get_fallback_chain(task_type)
+             if m != model and self._health_issue(m, config.latency_budget_ms) is None),
+            None,
+        )
+        if backup is None:
+            return None
+        stats = self._model_stats.get(model)
+        if stats is not None and stats.count() >= self.adaptive.min_samples:
+            delay_ms = min(stats.quantile(0.95), config.latency_budget_ms)
+        else:
+            delay_ms = config.latency_budget_ms
+        return backup, max(delay_ms, self.adaptive.hedge_min_delay_ms)
+    
+    def get_model_health(self) -> Dict[str, Dict[str, Any]]:
+        """Rolling latency/error summary per model seen so far."""
+        return {model: stats.summary() for model, stats in sorted(self._model_stats.items())}
     
     def get_task_config(self, task_type: str) -> Optional[TaskTypeConfig]:
         """Get configuration for a task type."""
         return self.task_configs.get(task_type)
     
+    def get_cache_ttl(self, task_type: Optional[str]) -> int:
+        """Response cache TTL in seconds for a task type (0 = never cached)."""
+        config = self.task_configs.get(task_type) if task_type else None
+        return config.cache_ttl_seconds if config else 0
+    
     def list_task_types(self) -> Dict[str, str]:
         """List all task types with descriptions."""
         return {
@@ -356,12 +640,9 @@ class ModelRouter:
         }
     
     def _log_selection(self, result: ModelSelectionResult):
-        """Log model selection for observability."""
+        """Log model selection for observability (last 1000 kept in memory)."""
         self.selection_log.append(result)
-        
-        # Keep only last 1000 selections in memory
-        if len(self.selection_log) > 1000:
-            self.selection_log = self.selection_log[-1000:]
+        self._selection_counters.add(result)
         
         logger.info(
             f"Model selected: {result.model} | "
@@ -374,42 +655,32 @@ class ModelRouter:
         """
         Get model selection statistics for observability.
         
+        Counts come from per-minute rolling counters (the cost depends on
+        the window length, not on traffic).
+        
         Args:
             minutes: Time window in minutes
         
         Returns:
-            Statistics dictionary
+            Statistics dictionary, including rolling per-model health
         """
-        from datetime import timedelta
-        cutoff = datetime.now() - timedelta(minutes=minutes)
-        cutoff_str = cutoff.isoformat()
-        
-        recent = [s for s in self.selection_log if s.timestamp > cutoff_str]
-        
-        if not recent:
-            return {"total": 0, "by_model": {}, "by_task_type": {}, "overrides": 0}
-        
-        by_model: Dict[str, int] = {}
-        by_task_type: Dict[str, int] = {}
-        overrides = 0
-        fallbacks = 0
+        totals = self._selection_counters.totals(minutes)
+        total = totals["total"]
         
-        for s in recent:
-            by_model[s.model] = by_model.get(s.model, 0) + 1
-            by_task_type[s.task_type] = by_task_type.get(s.task_type, 0) + 1
-            if s.override_applied:
-                overrides += 1
-            if s.fallback_used:
-                fallbacks += 1
+        if not total:
+            return {"total": 0, "by_model": {}, "by_task_type": {}, "overrides": 0,
+                    "model_health": self.get_model_health()}
         
         return {
-            "total": len(recent),
-            "by_model": by_model,
-            "by_task_type": by_task_type,
-            "overrides": overrides,
-            "fallbacks": fallbacks,
-            "override_rate": overrides / len(recent) if recent else 0,
-            "fallback_rate": fallbacks / len(recent) if recent else 0,
+            "total": total,
+            "by_model": dict(totals["by_model"]),
+            "by_task_type": dict(totals["by_task_type"]),
+            "overrides": totals["overrides"],
+            "fallbacks": totals["fallbacks"],
+            "adaptive_reroutes": totals["adaptive"],
+            "override_rate": totals["overrides"] / total,
+            "fallback_rate": totals["fallbacks"] / total,
+            "model_health": self.get_model_health(),
         }
     
     def reload_policy(self, policy_path: Optional[str] = None):
@@ -436,7 +707,7 @@ def get_model_router() -> ModelRouter:
     """
     global _global_router
     if _global_router is None:
-        _global_router = ModelRouter()
+        _global_router = ModelRouter(str(DEFAULT_POLICY_PATH) if DEFAULT_POLICY_PATH.exists() else None)
     return _global_router
 
 
@@ -0,0 +1,206 @@
+"""
+Agent Runtime - one long-lived event loop for running agents from sync code
+
+Agents are async, but many callers are not (sync FastAPI routes running in
+the threadpool, chat turns, MCP tools, scheduler jobs). Instead of creating
+a ThreadPoolExecutor and a fresh ``asyncio.run`` loop per call, sync callers
+submit coroutines to a single background loop owned by this module:
+
+- run_sync(): blocks the calling thread until the coroutine finishes; on
+  timeout the coroutine is cancelled on the runtime loop (so the in-flight
+  LLM request is aborted) and TimeoutError is raised
+- run_cancellable(): for async routes; races the agent coroutine against
+  client disconnect and a timeout, cancelling the agent when either fires
+
+Async clients (AsyncOpenAI etc.) bind their connection pools to the loop
+that first uses them, so keeping one loop also lets those pools be reused
+across calls instead of being rebuilt per request.
+
+Environment Variables:
+- AGENT_TIMEOUT_SECONDS: default end-to-end timeout for run_sync (120)
+
+Usage:
+    from .runtime import run_sync, run_cancellable
+
+    result = run_sync(agent.quick_ask(topic="blockers"))                # sync code
+    result = await run_cancellable(agent.quick_ask(query=q), request)   # async route
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+AGENT_TIMEOUT_SECONDS = float(os.getenv("AGENT_TIMEOUT_SECONDS", "120"))
+
+# How often run_cancellable checks whether the HTTP client went away
+DISCONNECT_POLL_SECONDS = 0.5
+
+
+class ClientDisconnected(Exception):
+    """The HTTP client disconnected before the agent finished."""
+
+
+class AgentRuntime:
+    """A daemon thread running one asyncio event loop for sync callers."""
+
+    def __init__(self, name: str = "agent-runtime"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime loop, started on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start()
+            return self._loop
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name=self._name, daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """Schedule a coroutine on the runtime loop and return its future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_sync(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the runtime loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (defaults to AGENT_TIMEOUT_SECONDS; 0 = no limit)
+
+        Raises:
+            TimeoutError: The coroutine didn't finish in time (it is cancelled)
+            RuntimeError: Called from the runtime loop itself, which would deadlock
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("run_sync() called on the agent runtime loop; await the coroutine instead")
+
+        timeout = AGENT_TIMEOUT_SECONDS if timeout is None else timeout
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout or None)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Agent call timed out after {timeout:.0f}s") from None
+        except BaseException:
+            # KeyboardInterrupt / SystemExit in the waiting thread
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 5.0):
+        """Cancel outstanding work, stop the loop and join the thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+
+        async def _cancel_all():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_all(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Agent runtime shutdown: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+_runtime: Optional[AgentRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> AgentRuntime:
+    """Get the process-wide agent runtime."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AgentRuntime()
+        return _runtime
+
+
+def shutdown_runtime():
+    """Stop the runtime loop (app shutdown)."""
+    global _runtime
+    with _runtime_lock:
+        runtime, _runtime = _runtime, None
+    if runtime is not None:
+        runtime.shutdown()
+
+
+def run_sync(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """Run an agent coroutine from sync code on the shared runtime loop."""
+    return get_runtime().run_sync(coro, timeout)
+
+
+async def _wait_for_disconnect(request) -> None:
+    try:
+        while not await request.is_disconnected():
+            await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+    except Exception as e:
+        # Can't tell; stop watching rather than cancel a healthy call
+        logger.debug(f"Disconnect check failed: {e}")
+        await asyncio.get_running_loop().create_future()
+
+
+async def run_cancellable(coro: Awaitable, request=None, timeout: Optional[float] = None) -> Any:
+    """
+    Await an agent coroutine, cancelling it if the client goes away or time runs out.
+
+    Cancellation propagates down to the awaited LLM request, which aborts
+    the underlying HTTP call instead of letting it finish unobserved.
+
+    Args:
+        coro: Agent coroutine
+        request: Starlette/FastAPI Request to watch for disconnects (optional)
+        timeout: Seconds before giving up (defaults to AGENT_TIMEOUT_SECONDS; 0 = no limit)
+
+    Raises:
+        ClientDisconnected: The client disconnected first
+        TimeoutError: The agent didn't finish in time
+    """
+    timeout = AGENT_TIMEOUT_SECONDS if timeout is None else timeout
+    task = asyncio.ensure_future(coro)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request)) if request is not None else None
+    try:
+        waiting = {task} if watcher is None else {task, watcher}
+        done, _ = await asyncio.wait(waiting, timeout=timeout or None, return_when=asyncio.FIRST_COMPLETED)
+        if task in done:
+            return task.result()
+        if watcher is not None and watcher in done:
+            raise ClientDisconnected("Client disconnected; agent call cancelled")
+        raise TimeoutError(f"Agent call timed out after {timeout:.0f}s")
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
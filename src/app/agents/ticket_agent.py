@@ -16,14 +16,14 @@ Extracted from tickets.py following the migration plan.
 
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-from pathlib import Path
 import json
 import re
 import logging
 
-from jinja2 import Environment, FileSystemLoader
 from ..agents.base import BaseAgent, AgentConfig
-from ..llm import ask, CLAUDE_OPUS_MODEL
+from ..prompt_templates import get_prompt_env
+from ..llm import ask_async, CLAUDE_OPUS_MODEL
+from ..agents.runtime import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -55,15 +55,7 @@ class TicketAgent(BaseAgent):
         super().__init__(config)
         
         # Initialize Jinja2 environment for prompts
-        prompts_path = Path(__file__).parent.parent.parent.parent / "prompts" / "agents" / "ticket_agent"
-        if prompts_path.exists():
-            self.jinja_env = Environment(
-                loader=FileSystemLoader(str(prompts_path)),
-                autoescape=False,
-            )
-        else:
-            self.jinja_env = None
-            logger.warning(f"Prompts directory not found: {prompts_path}")
+        self.jinja_env = get_prompt_env("agents/ticket_agent")
     
     # =========================================================================
     # ABSTRACT METHOD IMPLEMENTATIONS
@@ -178,7 +170,7 @@ Always provide structured, actionable output that helps developers understand wh
         
         try:
             # Use standard model for summarization (cost-effective)
-            summary = ask(prompt)
+            summary = await ask_async(prompt, task_type="summarization")
             
             return {
                 "success": True,
@@ -253,7 +245,7 @@ Be concise and actionable. Use markdown formatting."""
         try:
             # Use GPT-4o for implementation planning (good quality, available via OpenAI)
             model = "gpt-4o" if use_premium_model else None
-            plan = ask(prompt, model=model)
+            plan = await ask_async(prompt, model=model, task_type="implementation_planning")
             
             return {
                 "success": True,
@@ -328,7 +320,7 @@ Be specific and actionable. Assume access to local development environment."""
         
         try:
             # Use Claude Opus 4.5 for superior task decomposition
-            result = ask(prompt, model=CLAUDE_OPUS_MODEL)
+            result = await ask_async(prompt, model=CLAUDE_OPUS_MODEL, task_type="task_breakdown")
             
             # Parse the JSON response
             json_match = re.search(r'\[[\s\S]*\]', result)
@@ -505,20 +497,17 @@ async def decompose_ticket_adapter(ticket_pk: str) -> Dict[str, Any]:
 # Synchronous wrappers for non-async contexts
 def summarize_ticket_sync(ticket_pk: str, format_hint: str = "") -> Dict[str, Any]:
     """Synchronous wrapper for summarize_ticket_adapter."""
-    import asyncio
-    return asyncio.run(summarize_ticket_adapter(ticket_pk, format_hint))
+    return run_sync(summarize_ticket_adapter(ticket_pk, format_hint))
 
 
 def generate_plan_sync(ticket_pk: str) -> Dict[str, Any]:
     """Synchronous wrapper for generate_plan_adapter."""
-    import asyncio
-    return asyncio.run(generate_plan_adapter(ticket_pk))
+    return run_sync(generate_plan_adapter(ticket_pk))
 
 
 def decompose_ticket_sync(ticket_pk: str) -> Dict[str, Any]:
     """Synchronous wrapper for decompose_ticket_adapter."""
-    import asyncio
-    return asyncio.run(decompose_ticket_adapter(ticket_pk))
+    return run_sync(decompose_ticket_adapter(ticket_pk))
 
 
 # =============================================================================
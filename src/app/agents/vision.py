@@ -12,6 +12,7 @@ Part of Phase 1 agent extraction (Checkpoint 1.x).
 """
 
 from .base import BaseAgent, AgentConfig
+from .runtime import run_sync
 
 
 class VisionAgent(BaseAgent):
@@ -62,11 +63,10 @@ If it's a screenshot of a meeting, diagram, or document:
 Return the analysis as structured text that can be stored and searched."""
         
         # Use the raw LLM call for vision (needs special message format)
-        from ..llm import _openai_client_once
+        from ..llm import acomplete
         
-        resp = _client_once().chat.completions.create(
-            model=self.config.model,
-            messages=[
+        return await acomplete(
+            [
                 {
                     "role": "user",
                     "content": [
@@ -81,17 +81,14 @@ Return the analysis as structured text that can be stored and searched."""
                     ]
                 }
             ],
-            max_tokens=self.config.max_tokens
+            self.config.model,
+            max_tokens=self.config.max_tokens,
+            trace_name="agent:vision",
         )
-        
-        return resp.choices[0].message.content.strip()
     
     def analyze_sync(self, image_base64: str, context: str = None) -> str:
         """Synchronous wrapper for analyze()."""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(
-            self.analyze(image_base64, context)
-        )
+        return run_sync(self.analyze(image_base64, context))
 
 
 # Singleton instance
@@ -150,6 +150,7 @@ class InfrastructureStatusResponse(BaseModel):
     rate_limiter: dict
     mdns: dict
     supabase: dict
+    sqlite_pool: List[dict] = []
 
 
 @router.get("/infrastructure", response_model=InfrastructureStatusResponse)
@@ -163,7 +164,9 @@ def get_infrastructure_status():
     - Rate limiter
     - mDNS discovery
     - Supabase connection
+    - SQLite connection pool
     """
+    from ..db import get_pool_stats
     from ..infrastructure import (
         get_task_queue,
         get_cache,
@@ -185,9 +188,7 @@ def get_infrastructure_status():
     
     # Rate limiter
     limiter = get_rate_limiter()
-    rate_limiter_status = {
-        "mode": "redis" if limiter.is_redis_available else "memory",
-    }
+    rate_limiter_status = limiter.get_stats()
     
     # mDNS
     mdns = get_mdns_discovery()
@@ -208,6 +209,7 @@ def get_infrastructure_status():
         rate_limiter=rate_limiter_status,
         mdns=mdns_status,
         supabase=supabase_status,
+        sqlite_pool=get_pool_stats(),
     )
 
 
@@ -299,3 +301,105 @@ async def sync_data(request: SyncRequest):
         synced=synced,
         errors=errors
     )
+
+
+@router.get("/code-locker/stats")
+def get_code_locker_stats():
+    """
+    Get code locker version store statistics.
+    
+    Reports blob counts, storage ratio (stored bytes / logical bytes)
+    and diff latency/cache hit counts for this process.
+    """
+    from ..services.code_locker_store import CodeLockerStore
+    from ..db import connect
+    
+    with connect() as conn:
+        return CodeLockerStore.get_stats(conn)
+
+
+@router.post("/code-locker/compact")
+def compact_code_locker():
+    """
+    Move legacy inline code locker content into the delta version store.
+    
+    Safe to call multiple times - already compacted rows are skipped.
+    """
+    from ..services.code_locker_store import CodeLockerStore
+    from ..db import connect
+    
+    with connect() as conn:
+        compacted = CodeLockerStore.compact(conn)
+        conn.commit()
+        stats = CodeLockerStore.get_stats(conn)
+    
+    return {"compacted": compacted, "stats": stats}
+
+
+@router.get("/startup")
+def get_startup_profile(limit: int = 25):
+    """
+    Get startup phase timings and readiness.
+    
+    Includes the slowest module imports when the app was started with
+    STARTUP_PROFILE=1.
+    """
+    from ..startup_profile import startup_state
+    
+    return startup_state.report(limit)
+
+
+@router.get("/metrics")
+def get_metrics_snapshot():
+    """
+    Get per-route and per-dependency latency percentiles for this process.
+    
+    Routes and dependency callers are sorted by total time spent.
+    """
+    from ..metrics import get_metrics
+    
+    return get_metrics().snapshot()
+
+
+@router.post("/metrics/reset")
+def reset_metrics():
+    """Return the current metrics snapshot and start a fresh measurement window."""
+    from ..metrics import get_metrics
+    
+    registry = get_metrics()
+    snapshot = registry.snapshot()
+    registry.reset()
+    return snapshot
+
+
+@router.get("/llm-cache")
+def get_llm_cache_stats():
+    """
+    Get LLM response cache size per task type and this process's hit rate.
+    
+    Task types are cached only when the routing policy sets cache_ttl_seconds.
+    """
+    from .. import llm_cache
+    
+    return llm_cache.get_stats()
+
+
+@router.post("/llm-cache/clear")
+def clear_llm_cache(task_type: str | None = None):
+    """Drop cached LLM responses, optionally for a single task type."""
+    from .. import llm_cache
+    
+    return {"deleted": llm_cache.clear(task_type)}
+
+
+@router.get("/model-routing")
+def get_model_routing_stats(minutes: int = 60):
+    """
+    Get model selections and rolling per-model latency/error health.
+    
+    Shows which task types were rerouted away from their default model
+    because it was over its latency budget or failing.
+    """
+    from ..agents.model_router import get_model_router
+    
+    return get_model_router().get_selection_stats(minutes)
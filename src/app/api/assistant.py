@@ -13,6 +13,7 @@ Migration Status:
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 from datetime import datetime, date, timedelta
+import asyncio
 import json
 from ..db import connect
 # llm.ask removed - use lazy imports inside functions for backward compatibility
@@ -31,6 +32,7 @@ from ..agents.arjuna import (
     parse_assistant_intent,
     execute_intent,
 )
+from ..agents.runtime import ClientDisconnected, run_cancellable
 
 router = APIRouter()
 
@@ -513,7 +515,7 @@ async def parse_assistant_intent(message: str, context: dict, history: list, thr
         message: User's message
         context: System context  
         history: Conversation history
-        thread_id: Optional thread ID for LangSmith tracing
+        thread_id: Thread ID for LangSmith tracing (optional)
     
     Returns:
         Dict with intent, entities, response_text, and run_id for feedback
@@ -643,8 +645,16 @@ IMPORTANT GUIDELINES:
 8. When user asks about app features, explain them clearly using your knowledge"""
 
     # Lazy import for backward compatibility
-    from ..llm import ask as ask_llm
-    response = ask_llm(system_prompt, model="gpt-4o-mini", thread_id=thread_id)
+    from ..llm import ask_async
+    # Async client: when run_cancellable cancels this coroutine (client gone,
+    # timeout) the in-flight HTTP request is aborted, not left running in a thread
+    response, run_id = await ask_async(
+        system_prompt,
+        model="gpt-4o-mini",
+        trace_name="assistant.parse_intent",
+        thread_id=thread_id,
+        return_run_id=True,
+    )
     
     try:
         # Try to parse JSON from response
@@ -653,16 +663,18 @@ IMPORTANT GUIDELINES:
         elif "```" in response:
             response = response.split("```")[1].split("```")[0].strip()
         
-        return json.loads(response)
+        intent_data = json.loads(response)
     except:
         # Fallback if JSON parsing fails
-        return {
+        intent_data = {
             "intent": "ask_question",
             "confidence": 0.5,
             "entities": {},
             "clarifications": [],
             "response_text": response
         }
+    intent_data["run_id"] = run_id
+    return intent_data
 
 
 def execute_intent(intent_data: dict) -> dict:
@@ -719,6 +731,8 @@ def execute_intent(intent_data: dict) -> dict:
                         f"UPDATE tickets SET {', '.join(updates)} WHERE ticket_id = ?",
                         params
                     )
+                    from ..services.ticket_index import index_ticket_changed
+                    index_ticket_changed({"ticket_id": ticket_id, **{k: entities[k] for k in ("status", "priority") if k in entities}})
                 return {"success": True, "action": "update_ticket"}
         
         elif intent == "list_tickets":
@@ -872,7 +886,7 @@ def execute_intent(intent_data: dict) -> dict:
                     """
                     SELECT meeting_name, meeting_date, signals_json
                     FROM meeting_summaries
-                    WHERE meeting_name LIKE ? OR raw_text LIKE ? OR signals_json LIKE ?
+                    WHERE meeting_name LIKE ? OR blob_text(raw_text) LIKE ? OR signals_json LIKE ?
                     ORDER BY meeting_date DESC
                     LIMIT 5
                     """,
@@ -908,24 +922,15 @@ async def assistant_chat(request: Request):
         # Get current system context
         context = get_system_context()
         
-        # Parse user intent with conversation history (pass thread_id for tracing)
-        intent_data = await parse_assistant_intent(message, context, conversation_history, thread_id=thread_id)
+        # Parse user intent with conversation history (pass thread_id for tracing);
+        # abandoned if the user closes the chat before the model answers
+        intent_data = await run_cancellable(
+            parse_assistant_intent(message, context, conversation_history, thread_id=thread_id),
+            request,
+        )
         
-        # Get run_id from intent_data (if ArjunaAgent was used) or fallback to list_runs
+        # LangSmith run that produced this answer (None when tracing is off)
         run_id = intent_data.get("run_id")
-        if not run_id:
-            try:
-                from ..tracing import get_langsmith_client, get_project_name
-                client = get_langsmith_client()
-                if client:
-                    runs = list(client.list_runs(
-                        project_name=get_project_name(),
-                        limit=1,
-                    ))
-                    if runs:
-                        run_id = str(runs[0].id)
-            except Exception:
-                pass
         
         # If needs clarification, return questions
         if intent_data.get("clarifications") and intent_data.get("intent") == "needs_clarification":
@@ -995,7 +1000,6 @@ async def assistant_chat(request: Request):
         # Run helpfulness evaluation in background and submit to LangSmith
         if is_evaluation_enabled() and response_text and message:
             try:
-                import asyncio
                 async def run_eval():
                     try:
                         result = evaluate_helpfulness(response_text, message)
@@ -1037,6 +1041,13 @@ async def assistant_chat(request: Request):
             "run_id": run_id  # For user feedback
         })
     
+    except ClientDisconnected:
+        return JSONResponse({"response": "Request cancelled", "success": False}, status_code=499)
+    except TimeoutError:
+        return JSONResponse({
+            "response": "Sorry, the assistant took too long to respond. Please try again.",
+            "success": False
+        }, status_code=504)
     except Exception as e:
         return JSONResponse({
             "response": f"Sorry, I encountered an error: {str(e)}",
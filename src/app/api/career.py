@@ -14,8 +14,12 @@ Migration Status:
 from fastapi import APIRouter, Request, Query
 from fastapi.responses import JSONResponse
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from ..db import connect
+from ..db_async import fetch_one, fetch_all, transaction
 from ..services import tickets_supabase
+from ..services.code_locker_store import CodeLockerStore
+from ..services.signal_learning import signal_feedback_recorded
 # llm.ask removed - use lazy imports inside functions for backward compatibility
 import json
 
@@ -57,9 +61,15 @@ async def update_signal_status(request: Request):
     if not (meeting_id and signal_type and signal_text and status):
         return JSONResponse({"error": "Missing required fields"}, status_code=400)
 
-    with connect() as conn:
+    async with transaction() as tx:
+        existing = await tx.fetch_one(
+            "SELECT feedback FROM signal_feedback WHERE meeting_id = ? AND signal_type = ? AND signal_text = ?",
+            (meeting_id, signal_type, signal_text)
+        )
+        previous = existing["feedback"] if existing else None
+
         # Update or insert signal status
-        conn.execute("""
+        await tx.execute("""
             INSERT INTO signal_status (meeting_id, signal_type, signal_text, status, updated_at)
             VALUES (?, ?, ?, ?, datetime('now'))
             ON CONFLICT(meeting_id, signal_type, signal_text)
@@ -77,14 +87,15 @@ async def update_signal_status(request: Request):
         elif status == 'completed':
             feedback = 'completed'
         if feedback:
-            conn.execute("""
+            await tx.execute("""
                 INSERT INTO signal_feedback (meeting_id, signal_type, signal_text, feedback, created_at)
                 VALUES (?, ?, ?, ?, datetime('now'))
                 ON CONFLICT(meeting_id, signal_type, signal_text)
                 DO UPDATE SET feedback = excluded.feedback, created_at = datetime('now')
             """, (meeting_id, signal_type, signal_text, feedback))
-        conn.commit()
 
+    if feedback:
+        signal_feedback_recorded(signal_type, signal_text, feedback, previous)
     return JSONResponse({"status": "ok"})
 
 def get_code_locker_code_for_sprint_tickets(conn, tickets, max_lines=40, max_chars=2000):
@@ -103,18 +114,19 @@ def get_code_locker_code_for_sprint_tickets(conn, tickets, max_lines=40, max_cha
             fname = f['filename']
             # Get latest code locker entry for this file/ticket
             row = conn.execute("""
-                SELECT content FROM code_locker
+                SELECT content, content_hash FROM code_locker
                 WHERE filename = ? AND ticket_id = ?
                 ORDER BY version DESC LIMIT 1
             """, (fname, tid)).fetchone()
-            if row and row['content']:
-                code = row['content']
+            full_code = CodeLockerStore.row_content(conn, row) if row else ''
+            if full_code:
+                code = full_code
                 # Truncate for brevity
                 lines = code.splitlines()
                 if len(lines) > max_lines:
                     code = '\n'.join(lines[:max_lines]) + f"\n... (truncated, {len(lines)} lines total)"
                 if len(code) > max_chars:
-                    code = code[:max_chars] + f"\n... (truncated, {len(row['content'])} chars total)"
+                    code = code[:max_chars] + f"\n... (truncated, {len(full_code)} chars total)"
                 code_by_ticket[ticket_code][fname] = code
     return code_by_ticket
 
@@ -189,17 +201,15 @@ templates = Jinja2Templates(directory="src/app/templates")
 @router.delete("/api/career/standups/{standup_id}")
 async def delete_standup(standup_id: int):
     """Delete a standup update by ID."""
-    with connect() as conn:
-        conn.execute("DELETE FROM standup_updates WHERE id = ?", (standup_id,))
-        conn.commit()
+    async with transaction() as tx:
+        await tx.execute("DELETE FROM standup_updates WHERE id = ?", (standup_id,))
     return JSONResponse({"status": "ok"})
 
 
 @router.get("/api/career/profile")
 async def get_career_profile(request: Request):
     """Get the current career profile."""
-    with connect() as conn:
-        profile = conn.execute("SELECT * FROM career_profile WHERE id = 1").fetchone()
+    profile = await fetch_one("SELECT * FROM career_profile WHERE id = 1")
     
     if profile:
         keys = profile.keys()
@@ -238,8 +248,8 @@ async def update_career_profile(request: Request):
     """Update the career profile."""
     data = await request.json()
     
-    with connect() as conn:
-        conn.execute("""
+    async with transaction() as tx:
+        await tx.execute("""
             INSERT INTO career_profile (id, current_role, target_role, strengths, weaknesses, interests, goals,
                 certifications, education, years_experience, preferred_work_style, industry_focus,
                 leadership_experience, notable_projects, learning_priorities, career_timeline,
@@ -305,21 +315,20 @@ async def update_career_profile(request: Request):
 @router.get("/api/career/suggestions")
 async def get_career_suggestions(request: Request, limit: int = Query(10, ge=1, le=50)):
     """Get career development suggestions."""
-    with connect() as conn:
-        suggestions = conn.execute("""
-            SELECT * FROM career_suggestions 
-            WHERE status IN ('suggested', 'accepted', 'in_progress', 'dismissed', 'completed')
-            ORDER BY 
-                CASE status 
-                    WHEN 'in_progress' THEN 1
-                    WHEN 'accepted' THEN 2
-                    WHEN 'suggested' THEN 3
-                    WHEN 'dismissed' THEN 4
-                    WHEN 'completed' THEN 5
-                END,
-                created_at DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
+    suggestions = await fetch_all("""
+        SELECT * FROM career_suggestions 
+        WHERE status IN ('suggested', 'accepted', 'in_progress', 'dismissed', 'completed')
+        ORDER BY 
+            CASE status 
+                WHEN 'in_progress' THEN 1
+                WHEN 'accepted' THEN 2
+                WHEN 'suggested' THEN 3
+                WHEN 'dismissed' THEN 4
+                WHEN 'completed' THEN 5
+            END,
+            created_at DESC
+        LIMIT ?
+    """, (limit,))
     
     return JSONResponse([dict(s) for s in suggestions])
 
@@ -391,14 +400,13 @@ async def generate_career_suggestions(request: Request):
 @router.get("/api/career/chat/history")
 async def get_career_chat_history(request: Request, limit: int = Query(20, ge=1, le=100)):
     """Return recent career chat messages."""
-    with connect() as conn:
-        rows = conn.execute(
-            """SELECT message, response, summary, created_at
-               FROM career_chat_updates
-               ORDER BY created_at DESC
-               LIMIT ?""",
-            (limit,)
-        ).fetchall()
+    rows = await fetch_all(
+        """SELECT message, response, summary, created_at
+           FROM career_chat_updates
+           ORDER BY created_at DESC
+           LIMIT ?""",
+        (limit,)
+    )
     return JSONResponse([dict(r) for r in rows][::-1])
 
 
@@ -582,14 +590,14 @@ Keep it brief, actionable, and encouraging. Use markdown formatting."""
 @router.get("/api/career/insights")
 async def get_career_insights():
     """Get the last saved career insights."""
-    with connect() as conn:
+    async with transaction() as tx:
         # Add column if doesn't exist
         try:
-            conn.execute("ALTER TABLE career_profile ADD COLUMN last_insights TEXT")
+            await tx.execute("ALTER TABLE career_profile ADD COLUMN last_insights TEXT")
         except:
             pass
         
-        result = conn.execute("SELECT last_insights, updated_at FROM career_profile WHERE id = 1").fetchone()
+        result = await tx.fetch_one("SELECT last_insights, updated_at FROM career_profile WHERE id = 1")
         if result and result["last_insights"]:
             return JSONResponse({
                 "insights": result["last_insights"],
@@ -605,16 +613,16 @@ async def get_career_insights():
 @router.get("/api/career/tweaks")
 async def get_career_tweaks(request: Request):
     """Get saved career tweaks."""
-    with connect() as conn:
+    async with transaction() as tx:
         # Ensure table exists
-        conn.execute("""
+        await tx.execute("""
             CREATE TABLE IF NOT EXISTS career_tweaks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 content TEXT NOT NULL,
                 created_at TEXT DEFAULT (datetime('now'))
             )
         """)
-        tweaks = conn.execute("SELECT * FROM career_tweaks ORDER BY created_at DESC").fetchall()
+        tweaks = await tx.fetch_all("SELECT * FROM career_tweaks ORDER BY created_at DESC")
     return JSONResponse({"tweaks": [dict(t) for t in tweaks]})
 
 
@@ -626,25 +634,23 @@ async def save_career_tweak(request: Request):
     if not content:
         return JSONResponse({"error": "Content required"}, status_code=400)
     
-    with connect() as conn:
-        conn.execute("""
+    async with transaction() as tx:
+        await tx.execute("""
             CREATE TABLE IF NOT EXISTS career_tweaks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 content TEXT NOT NULL,
                 created_at TEXT DEFAULT (datetime('now'))
             )
         """)
-        conn.execute("INSERT INTO career_tweaks (content) VALUES (?)", (content,))
-        conn.commit()
+        await tx.execute("INSERT INTO career_tweaks (content) VALUES (?)", (content,))
     return JSONResponse({"status": "ok"})
 
 
 @router.delete("/api/career/tweaks/{tweak_id}")
 async def delete_career_tweak(tweak_id: int):
     """Delete a career tweak."""
-    with connect() as conn:
-        conn.execute("DELETE FROM career_tweaks WHERE id = ?", (tweak_id,))
-        conn.commit()
+    async with transaction() as tx:
+        await tx.execute("DELETE FROM career_tweaks WHERE id = ?", (tweak_id,))
     return JSONResponse({"status": "ok"})
 
 
@@ -654,8 +660,8 @@ async def update_suggestion_status(suggestion_id: int, request: Request):
     data = await request.json()
     status = data.get("status")
     
-    with connect() as conn:
-        conn.execute("""
+    async with transaction() as tx:
+        await tx.execute("""
             UPDATE career_suggestions 
             SET status = ?, updated_at = datetime('now')
             WHERE id = ?
@@ -668,18 +674,18 @@ async def update_suggestion_status(suggestion_id: int, request: Request):
 async def convert_suggestion_to_ticket(suggestion_id: int, request: Request):
     """Convert a career suggestion to a ticket."""
     try:
-        with connect() as conn:
-            suggestion = conn.execute(
+        async with transaction() as tx:
+            suggestion = await tx.fetch_one(
                 "SELECT * FROM career_suggestions WHERE id = ?",
                 (suggestion_id,)
-            ).fetchone()
+            )
             
             if not suggestion:
                 return JSONResponse({"error": "Suggestion not found"}, status_code=404)
             
             # Create ticket
             ticket_id = f"CAREER-{suggestion_id}"
-            cur = conn.execute("""
+            ticket_db_id = await tx.execute("""
                 INSERT INTO tickets (ticket_id, title, description, status, priority, tags)
                 VALUES (?, ?, ?, 'backlog', 'medium', 'career,growth')
             """, (
@@ -688,10 +694,9 @@ async def convert_suggestion_to_ticket(suggestion_id: int, request: Request):
                 f"{suggestion['description']}\n\n**Rationale:** {suggestion['rationale']}\n**Difficulty:** {suggestion['difficulty']}\n**Time:** {suggestion['time_estimate']}"
             ))
             
-            ticket_db_id = cur.lastrowid
             
             # Update suggestion
-            conn.execute("""
+            await tx.execute("""
                 UPDATE career_suggestions 
                 SET status = 'accepted', 
                     converted_to_ticket = ?,
@@ -715,14 +720,14 @@ async def compress_suggestions(request: Request):
     # Use ask_llm from module-level import (from ..llm import ask as ask_llm)
     
     try:
-        with connect() as conn:
+        async with transaction() as tx:
             # Get all active suggestions (status is 'suggested' not 'pending')
-            rows = conn.execute("""
+            rows = await tx.fetch_all("""
                 SELECT id, title, description, suggestion_type, rationale
                 FROM career_suggestions 
                 WHERE status = 'suggested'
                 ORDER BY created_at DESC
-            """).fetchall()
+            """)
             
             if len(rows) < 2:
                 return JSONResponse({"status": "ok", "merged": 0, "removed": 0, "message": "Not enough suggestions to compress"})
@@ -773,15 +778,14 @@ Rules:
                     # Keep first ID, remove rest
                     to_remove = group[1:]
                     for rid in to_remove:
-                        conn.execute("UPDATE career_suggestions SET status = 'dismissed' WHERE id = ?", (rid,))
+                        await tx.execute("UPDATE career_suggestions SET status = 'dismissed' WHERE id = ?", (rid,))
                         merged += 1
             
             # Process removals
             for rid in result.get("remove", []):
-                conn.execute("UPDATE career_suggestions SET status = 'dismissed' WHERE id = ?", (rid,))
+                await tx.execute("UPDATE career_suggestions SET status = 'dismissed' WHERE id = ?", (rid,))
                 removed += 1
             
-            conn.commit()
             
             return JSONResponse({
                 "status": "ok", 
@@ -804,12 +808,11 @@ Rules:
 @router.get("/api/career/standups")
 async def get_standups(request: Request, limit: int = Query(30, ge=1, le=100)):
     """Get recent standup updates with feedback."""
-    with connect() as conn:
-        standups = conn.execute("""
-            SELECT * FROM standup_updates 
-            ORDER BY standup_date DESC, created_at DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
+    standups = await fetch_all("""
+        SELECT * FROM standup_updates 
+        ORDER BY standup_date DESC, created_at DESC
+        LIMIT ?
+    """, (limit,))
     return JSONResponse([dict(s) for s in standups])
 
 
@@ -825,13 +828,12 @@ async def get_today_standup(request: Request):
     from datetime import date
     today = date.today().isoformat()
     
-    with connect() as conn:
-        standup = conn.execute("""
-            SELECT * FROM standup_updates 
-            WHERE standup_date = ?
-            ORDER BY created_at DESC
-            LIMIT 1
-        """, (today,)).fetchone()
+    standup = await fetch_one("""
+        SELECT * FROM standup_updates 
+        WHERE standup_date = ?
+        ORDER BY created_at DESC
+        LIMIT 1
+    """, (today,))
     
     if standup:
         return JSONResponse(dict(standup))
@@ -1118,25 +1120,24 @@ async def get_code_locker(request: Request, ticket_id: int = None, filename: str
         
         query += " ORDER BY cl.filename, cl.version DESC"
         
-        entries = conn.execute(query, params).fetchall()
+        entries = CodeLockerStore.hydrate(conn, conn.execute(query, params).fetchall())
     
-    return JSONResponse([dict(e) for e in entries])
+    return JSONResponse(entries)
 
 
 @router.get("/api/career/code-locker/files")
 async def get_code_locker_files(request: Request):
     """Get unique filenames in code locker with latest version info."""
-    with connect() as conn:
-        files = conn.execute("""
-            SELECT filename, 
-                   ticket_id,
-                   MAX(version) as latest_version,
-                   COUNT(*) as version_count,
-                   MAX(created_at) as last_updated
-            FROM code_locker
-            GROUP BY filename, ticket_id
-            ORDER BY last_updated DESC
-        """).fetchall()
+    files = await fetch_all("""
+        SELECT filename, 
+               ticket_id,
+               MAX(version) as latest_version,
+               COUNT(*) as version_count,
+               MAX(created_at) as last_updated
+        FROM code_locker
+        GROUP BY filename, ticket_id
+        ORDER BY last_updated DESC
+    """)
     
     return JSONResponse([dict(f) for f in files])
 
@@ -1172,12 +1173,9 @@ async def add_to_code_locker(request: Request):
         if not existing['max_version']:
             is_initial = True
         
-        cur = conn.execute("""
-            INSERT INTO code_locker (filename, content, ticket_id, version, notes, is_initial)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (filename, content, ticket_id, next_version, notes, 1 if is_initial else 0))
-        
-        entry_id = cur.lastrowid
+        entry_id = CodeLockerStore.insert_version(
+            conn, filename, content, ticket_id, next_version, notes, is_initial
+        )
         conn.commit()
     
     return JSONResponse({
@@ -1198,56 +1196,37 @@ async def get_code_locker_entry(entry_id: int):
             LEFT JOIN tickets t ON cl.ticket_id = t.id
             WHERE cl.id = ?
         """, (entry_id,)).fetchone()
+        
+        if not entry:
+            return JSONResponse({"error": "Entry not found"}, status_code=404)
+        
+        entry = CodeLockerStore.hydrate(conn, [entry])[0]
     
-    if not entry:
-        return JSONResponse({"error": "Entry not found"}, status_code=404)
-    
-    return JSONResponse(dict(entry))
+    return JSONResponse(entry)
 
 
 @router.get("/api/career/code-locker/diff/{filename}")
 async def get_code_diff(filename: str, v1: int = Query(...), v2: int = Query(...)):
-    """Get diff between two versions of a file."""
-    import difflib
+    """Get diff between two versions of a file.
     
+    Versions are reconstructed from the delta store and the diff is cached
+    in memory per content-hash pair, so repeated comparisons skip difflib
+    entirely. Nothing is written to the database.
+    """
     with connect() as conn:
-        version1 = conn.execute("""
-            SELECT content FROM code_locker 
-            WHERE filename = ? AND version = ?
-        """, (filename, v1)).fetchone()
-        
-        version2 = conn.execute("""
-            SELECT content FROM code_locker 
-            WHERE filename = ? AND version = ?
-        """, (filename, v2)).fetchone()
+        result = CodeLockerStore.diff_versions(conn, filename, v1, v2)
     
-    if not version1 or not version2:
+    if not result:
         return JSONResponse({"error": "One or both versions not found"}, status_code=404)
     
-    # Generate unified diff
-    diff = list(difflib.unified_diff(
-        version1['content'].splitlines(keepends=True),
-        version2['content'].splitlines(keepends=True),
-        fromfile=f"{filename} (v{v1})",
-        tofile=f"{filename} (v{v2})"
-    ))
-    
-    return JSONResponse({
-        "filename": filename,
-        "v1": v1,
-        "v2": v2,
-        "diff": "".join(diff),
-        "lines_added": sum(1 for line in diff if line.startswith('+')),
-        "lines_removed": sum(1 for line in diff if line.startswith('-'))
-    })
+    return JSONResponse(result)
 
 
 @router.delete("/api/career/code-locker/{entry_id}")
 async def delete_code_locker_entry(entry_id: int):
     """Delete a code locker entry."""
-    with connect() as conn:
-        conn.execute("DELETE FROM code_locker WHERE id = ?", (entry_id,))
-        conn.commit()
+    async with transaction() as tx:
+        await tx.execute("DELETE FROM code_locker WHERE id = ?", (entry_id,))
     
     return JSONResponse({"status": "ok"})
 
@@ -1259,17 +1238,16 @@ async def delete_code_locker_entry(entry_id: int):
 @router.get("/api/career/ticket-files/{ticket_id}")
 async def get_ticket_files(ticket_id: int):
     """Get files associated with a ticket."""
-    with connect() as conn:
-        files = conn.execute("""
-            SELECT tf.*, 
-                   (SELECT MAX(version) FROM code_locker cl 
-                    WHERE cl.filename = tf.filename AND cl.ticket_id = tf.ticket_id) as locker_version,
-                   (SELECT COUNT(*) FROM code_locker cl 
-                    WHERE cl.filename = tf.filename AND cl.ticket_id = tf.ticket_id) as locker_count
-            FROM ticket_files tf
-            WHERE tf.ticket_id = ?
-            ORDER BY tf.file_type, tf.filename
-        """, (ticket_id,)).fetchall()
+    files = await fetch_all("""
+        SELECT tf.*, 
+               (SELECT MAX(version) FROM code_locker cl 
+                WHERE cl.filename = tf.filename AND cl.ticket_id = tf.ticket_id) as locker_version,
+               (SELECT COUNT(*) FROM code_locker cl 
+                WHERE cl.filename = tf.filename AND cl.ticket_id = tf.ticket_id) as locker_count
+        FROM ticket_files tf
+        WHERE tf.ticket_id = ?
+        ORDER BY tf.file_type, tf.filename
+    """, (ticket_id,))
     
     return JSONResponse([dict(f) for f in files])
 
@@ -1297,10 +1275,10 @@ async def add_ticket_file(ticket_id: int, request: Request):
             
             # If this is an 'update' file with base_content, add it to code locker as v1
             if file_type == 'update' and base_content:
-                conn.execute("""
-                    INSERT INTO code_locker (ticket_id, filename, content, version, notes, is_initial)
-                    VALUES (?, ?, ?, 1, 'Initial/baseline version from ticket', 1)
-                """, (ticket_id, filename, base_content))
+                CodeLockerStore.insert_version(
+                    conn, filename, base_content, ticket_id, 1,
+                    'Initial/baseline version from ticket', is_initial=True
+                )
             
             conn.commit()
             
@@ -1319,7 +1297,7 @@ async def update_ticket_file(file_id: int, request: Request):
     """Update a ticket file's details."""
     data = await request.json()
     
-    with connect() as conn:
+    async with transaction() as tx:
         updates = []
         params = []
         
@@ -1335,10 +1313,9 @@ async def update_ticket_file(file_id: int, request: Request):
         
         if updates:
             params.append(file_id)
-            conn.execute(f"""
+            await tx.execute(f"""
                 UPDATE ticket_files SET {', '.join(updates)} WHERE id = ?
             """, params)
-            conn.commit()
     
     return JSONResponse({"status": "ok"})
 
@@ -1346,9 +1323,8 @@ async def update_ticket_file(file_id: int, request: Request):
 @router.delete("/api/career/ticket-files/{file_id}")
 async def delete_ticket_file(file_id: int):
     """Delete a ticket file."""
-    with connect() as conn:
-        conn.execute("DELETE FROM ticket_files WHERE id = ?", (file_id,))
-        conn.commit()
+    async with transaction() as tx:
+        await tx.execute("DELETE FROM ticket_files WHERE id = ?", (file_id,))
     
     return JSONResponse({"status": "ok"})
 
@@ -1374,63 +1350,61 @@ async def get_tickets_with_files():
             tickets.sort(key=lambda t: status_order.get(t.get("status", "todo"), 5))
             
             # Get files from SQLite (ticket_files table is still local)
-            with connect() as conn:
-                result_list = []
-                for ticket in tickets:
-                    files = conn.execute("""
-                        SELECT tf.id, tf.filename, tf.file_type, tf.description,
-                               (SELECT MAX(version) FROM code_locker cl 
-                                WHERE cl.filename = tf.filename AND cl.ticket_id = tf.ticket_id) as latest_version
-                        FROM ticket_files tf
-                        WHERE tf.ticket_id = ?
-                        ORDER BY tf.file_type, tf.filename
-                    """, (ticket.get('id'),)).fetchall()
-                    
-                    result_list.append({
-                        "id": ticket.get("id"),
-                        "ticket_id": ticket.get("ticket_id"),
-                        "title": ticket.get("title", ""),
-                        "status": ticket.get("status"),
-                        "files": [dict(f) for f in files]
-                    })
+            result_list = []
+            for ticket in tickets:
+                files = await fetch_all("""
+                    SELECT tf.id, tf.filename, tf.file_type, tf.description,
+                           (SELECT MAX(version) FROM code_locker cl 
+                            WHERE cl.filename = tf.filename AND cl.ticket_id = tf.ticket_id) as latest_version
+                    FROM ticket_files tf
+                    WHERE tf.ticket_id = ?
+                    ORDER BY tf.file_type, tf.filename
+                """, (ticket.get('id'),))
                 
-                return JSONResponse(result_list)
+                result_list.append({
+                    "id": ticket.get("id"),
+                    "ticket_id": ticket.get("ticket_id"),
+                    "title": ticket.get("title", ""),
+                    "status": ticket.get("status"),
+                    "files": [dict(f) for f in files]
+                })
+            
+            return JSONResponse(result_list)
     except Exception as e:
         import logging
         logging.getLogger(__name__).warning(f"Supabase tickets-with-files failed, falling back to SQLite: {e}")
     
     # Fallback to SQLite
-    with connect() as conn:
-        tickets = conn.execute("""
-            SELECT t.id, t.ticket_id, t.title, t.status
-            FROM tickets t
-            WHERE t.status IN ('todo', 'in_progress', 'in_review', 'blocked')
-            AND t.in_sprint = 1
-            ORDER BY 
-                CASE t.status 
-                    WHEN 'in_progress' THEN 1
-                    WHEN 'blocked' THEN 2
-                    WHEN 'in_review' THEN 3
-                    WHEN 'todo' THEN 4
-                END
-        """).fetchall()
+    tickets = await fetch_all("""
+        SELECT t.id, t.ticket_id, t.title, t.status
+        FROM tickets t
+        WHERE t.status IN ('todo', 'in_progress', 'in_review', 'blocked')
+        AND t.in_sprint = 1
+        ORDER BY 
+            CASE t.status 
+                WHEN 'in_progress' THEN 1
+                WHEN 'blocked' THEN 2
+                WHEN 'in_review' THEN 3
+                WHEN 'todo' THEN 4
+            END
+    """)
+    
+    result = []
+    for ticket in tickets:
+        # Get files for this ticket
+        files = await fetch_all("""
+            SELECT tf.id, tf.filename, tf.file_type, tf.description,
+                   (SELECT MAX(version) FROM code_locker cl 
+                    WHERE cl.filename = tf.filename AND cl.ticket_id = tf.ticket_id) as latest_version
+            FROM ticket_files tf
+            WHERE tf.ticket_id = ?
+            ORDER BY tf.file_type, tf.filename
+        """, (ticket['id'],))
         
-        result = []
-        for ticket in tickets:
-            # Get files for this ticket
-            files = conn.execute("""
-                SELECT tf.id, tf.filename, tf.file_type, tf.description,
-                       (SELECT MAX(version) FROM code_locker cl 
-                        WHERE cl.filename = tf.filename AND cl.ticket_id = tf.ticket_id) as latest_version
-                FROM ticket_files tf
-                WHERE tf.ticket_id = ?
-                ORDER BY tf.file_type, tf.filename
-            """, (ticket['id'],)).fetchall()
-            
-            result.append({
-                **dict(ticket),
-                "files": [dict(f) for f in files]
-            })
+        result.append({
+            **dict(ticket),
+            "files": [dict(f) for f in files]
+        })
     
     return JSONResponse(result)
 
@@ -1438,34 +1412,33 @@ async def get_tickets_with_files():
 @router.get("/api/career/code-locker/next-version")
 async def get_next_version(filename: str = Query(...), ticket_id: int = Query(None)):
     """Get the next version number for a file in the locker."""
-    with connect() as conn:
-        # Check for existing versions
-        query = "SELECT MAX(version) as max_version FROM code_locker WHERE filename = ?"
-        params = [filename]
-        
-        if ticket_id:
-            query += " AND ticket_id = ?"
-            params.append(ticket_id)
-        
-        existing = conn.execute(query, params).fetchone()
-        next_version = (existing['max_version'] or 0) + 1
-        
-        # Check if this file is linked to a ticket
-        ticket_file = None
-        if ticket_id:
-            ticket_file = conn.execute("""
-                SELECT tf.*, t.ticket_id as ticket_code
-                FROM ticket_files tf
-                JOIN tickets t ON tf.ticket_id = t.id
-                WHERE tf.filename = ? AND tf.ticket_id = ?
-            """, (filename, ticket_id)).fetchone()
-        
-        return JSONResponse({
-            "filename": filename,
-            "next_version": next_version,
-            "is_new_file": existing['max_version'] is None,
-            "ticket_file": dict(ticket_file) if ticket_file else None
-        })
+    # Check for existing versions
+    query = "SELECT MAX(version) as max_version FROM code_locker WHERE filename = ?"
+    params = [filename]
+    
+    if ticket_id:
+        query += " AND ticket_id = ?"
+        params.append(ticket_id)
+    
+    existing = await fetch_one(query, params)
+    next_version = (existing['max_version'] or 0) + 1
+    
+    # Check if this file is linked to a ticket
+    ticket_file = None
+    if ticket_id:
+        ticket_file = await fetch_one("""
+            SELECT tf.*, t.ticket_id as ticket_code
+            FROM ticket_files tf
+            JOIN tickets t ON tf.ticket_id = t.id
+            WHERE tf.filename = ? AND tf.ticket_id = ?
+        """, (filename, ticket_id))
+    
+    return JSONResponse({
+        "filename": filename,
+        "next_version": next_version,
+        "is_new_file": existing['max_version'] is None,
+        "ticket_file": dict(ticket_file) if ticket_file else None
+    })
 
 
 # ----------------------
@@ -1627,25 +1600,24 @@ Keep the response conversational and not too long (2-4 paragraphs typically). Be
 @router.get("/api/career/memories")
 async def get_career_memories(memory_type: str = None, include_unpinned: bool = True):
     """Get career memories, optionally filtered by type."""
-    with connect() as conn:
-        if memory_type:
-            if include_unpinned:
-                rows = conn.execute("""
-                    SELECT * FROM career_memories 
-                    WHERE memory_type = ?
-                    ORDER BY is_pinned DESC, created_at DESC
-                """, (memory_type,)).fetchall()
-            else:
-                rows = conn.execute("""
-                    SELECT * FROM career_memories 
-                    WHERE memory_type = ? AND is_pinned = 1
-                    ORDER BY created_at DESC
-                """, (memory_type,)).fetchall()
-        else:
-            rows = conn.execute("""
+    if memory_type:
+        if include_unpinned:
+            rows = await fetch_all("""
                 SELECT * FROM career_memories 
+                WHERE memory_type = ?
                 ORDER BY is_pinned DESC, created_at DESC
-            """).fetchall()
+            """, (memory_type,))
+        else:
+            rows = await fetch_all("""
+                SELECT * FROM career_memories 
+                WHERE memory_type = ? AND is_pinned = 1
+                ORDER BY created_at DESC
+            """, (memory_type,))
+    else:
+        rows = await fetch_all("""
+            SELECT * FROM career_memories 
+            ORDER BY is_pinned DESC, created_at DESC
+        """)
     return JSONResponse([dict(r) for r in rows])
 
 
@@ -1666,13 +1638,11 @@ async def create_career_memory(request: Request):
     if not title:
         return JSONResponse({"error": "Title is required"}, status_code=400)
     
-    with connect() as conn:
-        cur = conn.execute("""
+    async with transaction() as tx:
+        memory_id = await tx.execute("""
             INSERT INTO career_memories (memory_type, title, description, source_type, source_id, skills, is_pinned, is_ai_work, metadata)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (memory_type, title, description, source_type, source_id, skills, is_pinned, is_ai_work, metadata))
-        conn.commit()
-        memory_id = cur.lastrowid
     
     return JSONResponse({"status": "ok", "id": memory_id})
 
@@ -1680,14 +1650,13 @@ async def create_career_memory(request: Request):
 @router.post("/api/career/memories/{memory_id}/pin")
 async def toggle_pin_memory(memory_id: int):
     """Toggle pin status of a memory."""
-    with connect() as conn:
-        row = conn.execute("SELECT is_pinned FROM career_memories WHERE id = ?", (memory_id,)).fetchone()
+    async with transaction() as tx:
+        row = await tx.fetch_one("SELECT is_pinned FROM career_memories WHERE id = ?", (memory_id,))
         if not row:
             return JSONResponse({"error": "Memory not found"}, status_code=404)
         
         new_status = 0 if row["is_pinned"] else 1
-        conn.execute("UPDATE career_memories SET is_pinned = ?, updated_at = datetime('now') WHERE id = ?", (new_status, memory_id))
-        conn.commit()
+        await tx.execute("UPDATE career_memories SET is_pinned = ?, updated_at = datetime('now') WHERE id = ?", (new_status, memory_id))
     
     return JSONResponse({"status": "ok", "is_pinned": bool(new_status)})
 
@@ -1695,13 +1664,12 @@ async def toggle_pin_memory(memory_id: int):
 @router.delete("/api/career/memories/{memory_id}")
 async def delete_career_memory(memory_id: int):
     """Delete a career memory (only if not pinned)."""
-    with connect() as conn:
-        row = conn.execute("SELECT is_pinned FROM career_memories WHERE id = ?", (memory_id,)).fetchone()
+    async with transaction() as tx:
+        row = await tx.fetch_one("SELECT is_pinned FROM career_memories WHERE id = ?", (memory_id,))
         if row and row["is_pinned"]:
             return JSONResponse({"error": "Cannot delete pinned memory. Unpin first."}, status_code=400)
         
-        conn.execute("DELETE FROM career_memories WHERE id = ?", (memory_id,))
-        conn.commit()
+        await tx.execute("DELETE FROM career_memories WHERE id = ?", (memory_id,))
     
     return JSONResponse({"status": "ok"})
 
@@ -1709,30 +1677,29 @@ async def delete_career_memory(memory_id: int):
 @router.get("/api/career/completed-projects")
 async def get_completed_projects():
     """Get completed projects from tickets and career memories."""
-    with connect() as conn:
-        # Get completed tickets that haven't been synced to memories yet
-        tickets = conn.execute("""
-            SELECT t.*, 
-                   GROUP_CONCAT(DISTINCT tf.filename) as files
-            FROM tickets t
-            LEFT JOIN ticket_files tf ON tf.ticket_id = t.id
-            WHERE t.status IN ('done', 'complete', 'completed')
-              AND NOT EXISTS (
-                  SELECT 1 FROM career_memories cm 
-                  WHERE cm.source_type = 'ticket' 
-                    AND cm.source_id = CAST(t.id AS TEXT)
-              )
-            GROUP BY t.id
-            ORDER BY t.updated_at DESC
-            LIMIT 50
-        """).fetchall()
-        
-        # Get completed project memories (includes synced tickets)
-        memories = conn.execute("""
-            SELECT * FROM career_memories 
-            WHERE memory_type = 'completed_project'
-            ORDER BY is_pinned DESC, created_at DESC
-        """).fetchall()
+    # Get completed tickets that haven't been synced to memories yet
+    tickets = await fetch_all("""
+        SELECT t.*, 
+               GROUP_CONCAT(DISTINCT tf.filename) as files
+        FROM tickets t
+        LEFT JOIN ticket_files tf ON tf.ticket_id = t.id
+        WHERE t.status IN ('done', 'complete', 'completed')
+          AND NOT EXISTS (
+              SELECT 1 FROM career_memories cm 
+              WHERE cm.source_type = 'ticket' 
+                AND cm.source_id = CAST(t.id AS TEXT)
+          )
+        GROUP BY t.id
+        ORDER BY t.updated_at DESC
+        LIMIT 50
+    """)
+    
+    # Get completed project memories (includes synced tickets)
+    memories = await fetch_all("""
+        SELECT * FROM career_memories 
+        WHERE memory_type = 'completed_project'
+        ORDER BY is_pinned DESC, created_at DESC
+    """)
     
     return JSONResponse({
         "tickets": [dict(t) for t in tickets],
@@ -1747,11 +1714,11 @@ async def sync_completed_projects():
     all_tickets = tickets_supabase.get_all_tickets()
     completed_tickets = [t for t in all_tickets if t.get("status") in ('done', 'complete', 'completed')]
     
-    with connect() as conn:
+    async with transaction() as tx:
         # Get IDs already in memories
-        existing = conn.execute("""
+        existing = await tx.fetch_all("""
             SELECT source_id FROM career_memories WHERE source_type = 'ticket'
-        """).fetchall()
+        """)
         existing_ids = {row["source_id"] for row in existing}
         
         added = 0
@@ -1767,13 +1734,12 @@ async def sync_completed_projects():
                 "completed_at": t.get("updated_at")
             })
             
-            conn.execute("""
+            await tx.execute("""
                 INSERT INTO career_memories (memory_type, title, description, source_type, source_id, skills, is_pinned, metadata)
                 VALUES ('completed_project', ?, ?, 'ticket', ?, ?, 0, ?)
             """, (t.get("title") or "", t.get("ai_summary") or t.get("description") or "", t["id"], skills, metadata))
             added += 1
         
-        conn.commit()
     
     return JSONResponse({"status": "ok", "added": added})
 
@@ -1800,48 +1766,47 @@ SKILL_CATEGORIES = {
 @router.get("/api/career/development-tracker")
 async def get_development_tracker():
     """Get development tracker data - skill progress and learning activities."""
-    with connect() as conn:
-        # Get recent skill changes (skills with evidence or high proficiency)
-        skills = conn.execute("""
-            SELECT skill_name, category, proficiency_level, evidence, updated_at, projects_count
-            FROM skill_tracker
-            WHERE proficiency_level > 0
-            ORDER BY 
-                CASE WHEN updated_at IS NOT NULL THEN 0 ELSE 1 END,
-                updated_at DESC,
-                proficiency_level DESC
-            LIMIT 20
-        """).fetchall()
-        
-        # Get recent career memories as learning activities
-        memories = conn.execute("""
-            SELECT id, memory_type, title, description, skills, created_at
-            FROM career_memories
-            WHERE memory_type IN ('skill_milestone', 'achievement')
-            ORDER BY created_at DESC
-            LIMIT 10
-        """).fetchall()
-        
-        # Get completed projects from career_memories
-        projects = conn.execute("""
-            SELECT id, title, skills as technologies, description as impact, created_at as completed_date
-            FROM career_memories
-            WHERE memory_type = 'completed_project' OR is_ai_work = 1
-            ORDER BY created_at DESC
-            LIMIT 5
-        """).fetchall()
-        
-        # Calculate summary stats
-        total_skills = conn.execute("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level > 0").fetchone()[0]
-        avg_proficiency = conn.execute("SELECT AVG(proficiency_level) FROM skill_tracker WHERE proficiency_level > 0").fetchone()[0] or 0
-        
-        # Skills by proficiency level
-        skill_levels = {
-            "beginner": conn.execute("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level BETWEEN 1 AND 30").fetchone()[0],
-            "intermediate": conn.execute("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level BETWEEN 31 AND 60").fetchone()[0],
-            "advanced": conn.execute("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level BETWEEN 61 AND 85").fetchone()[0],
-            "expert": conn.execute("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level > 85").fetchone()[0],
-        }
+    # Get recent skill changes (skills with evidence or high proficiency)
+    skills = await fetch_all("""
+        SELECT skill_name, category, proficiency_level, evidence, updated_at, projects_count
+        FROM skill_tracker
+        WHERE proficiency_level > 0
+        ORDER BY 
+            CASE WHEN updated_at IS NOT NULL THEN 0 ELSE 1 END,
+            updated_at DESC,
+            proficiency_level DESC
+        LIMIT 20
+    """)
+    
+    # Get recent career memories as learning activities
+    memories = await fetch_all("""
+        SELECT id, memory_type, title, description, skills, created_at
+        FROM career_memories
+        WHERE memory_type IN ('skill_milestone', 'achievement')
+        ORDER BY created_at DESC
+        LIMIT 10
+    """)
+    
+    # Get completed projects from career_memories
+    projects = await fetch_all("""
+        SELECT id, title, skills as technologies, description as impact, created_at as completed_date
+        FROM career_memories
+        WHERE memory_type = 'completed_project' OR is_ai_work = 1
+        ORDER BY created_at DESC
+        LIMIT 5
+    """)
+    
+    # Calculate summary stats
+    total_skills = (await fetch_one("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level > 0"))[0]
+    avg_proficiency = (await fetch_one("SELECT AVG(proficiency_level) FROM skill_tracker WHERE proficiency_level > 0"))[0] or 0
+    
+    # Skills by proficiency level
+    skill_levels = {
+        "beginner": (await fetch_one("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level BETWEEN 1 AND 30"))[0],
+        "intermediate": (await fetch_one("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level BETWEEN 31 AND 60"))[0],
+        "advanced": (await fetch_one("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level BETWEEN 61 AND 85"))[0],
+        "expert": (await fetch_one("SELECT COUNT(*) FROM skill_tracker WHERE proficiency_level > 85"))[0],
+    }
         
     return JSONResponse({
         "skills": [dict(s) for s in skills],
@@ -1858,11 +1823,10 @@ async def get_development_tracker():
 @router.get("/api/career/skills")
 async def get_skills():
     """Get all tracked skills with categories."""
-    with connect() as conn:
-        skills = conn.execute("""
-            SELECT * FROM skill_tracker
-            ORDER BY category, proficiency_level DESC
-        """).fetchall()
+    skills = await fetch_all("""
+        SELECT * FROM skill_tracker
+        ORDER BY category, proficiency_level DESC
+    """)
     
     # Group by category
     by_category = {}
@@ -1890,7 +1854,7 @@ async def initialize_skills(request: Request):
         skills_with_categories = []
         custom_skills = []
     
-    with connect() as conn:
+    async with transaction() as tx:
         added = 0
         
         if skills_with_categories:
@@ -1899,11 +1863,11 @@ async def initialize_skills(request: Request):
                 skill_name = item.get("name") if isinstance(item, dict) else item
                 category = item.get("category", "Custom") if isinstance(item, dict) else "Custom"
                 try:
-                    conn.execute("""
+                    await tx.execute("""
                         INSERT OR IGNORE INTO skill_tracker (skill_name, category, proficiency_level)
                         VALUES (?, ?, 0)
                     """, (skill_name, category))
-                    if conn.execute("SELECT changes()").fetchone()[0] > 0:
+                    if (await tx.fetch_one("SELECT changes()"))[0] > 0:
                         added += 1
                 except:
                     pass
@@ -1911,11 +1875,11 @@ async def initialize_skills(request: Request):
             # Legacy format: just skill names (default to Custom category)
             for skill in custom_skills:
                 try:
-                    conn.execute("""
+                    await tx.execute("""
                         INSERT OR IGNORE INTO skill_tracker (skill_name, category, proficiency_level)
                         VALUES (?, ?, 0)
                     """, (skill, "Custom"))
-                    if conn.execute("SELECT changes()").fetchone()[0] > 0:
+                    if (await tx.fetch_one("SELECT changes()"))[0] > 0:
                         added += 1
                 except:
                     pass
@@ -1924,15 +1888,14 @@ async def initialize_skills(request: Request):
             for category, skills in SKILL_CATEGORIES.items():
                 for skill in skills:
                     try:
-                        conn.execute("""
+                        await tx.execute("""
                             INSERT OR IGNORE INTO skill_tracker (skill_name, category, proficiency_level)
                             VALUES (?, ?, 0)
                         """, (skill, category))
-                        if conn.execute("SELECT changes()").fetchone()[0] > 0:
+                        if (await tx.fetch_one("SELECT changes()"))[0] > 0:
                             added += 1
                     except:
                         pass
-        conn.commit()
     
     return JSONResponse({"status": "ok", "initialized": added})
 
@@ -1940,9 +1903,8 @@ async def initialize_skills(request: Request):
 @router.post("/api/career/skills/reset")
 async def reset_skills():
     """Reset all skill data (delete all skills)."""
-    with connect() as conn:
-        conn.execute("DELETE FROM skill_tracker")
-        conn.commit()
+    async with transaction() as tx:
+        await tx.execute("DELETE FROM skill_tracker")
     return JSONResponse({"status": "ok", "message": "All skills reset"})
 
 
@@ -2008,9 +1970,9 @@ Return ONLY the JSON object, no other text."""
             
             # Insert skills into database
             skills_added = 0
-            with connect() as conn:
+            async with transaction() as tx:
                 for skill in skills_data.get("skills", []):
-                    conn.execute("""
+                    await tx.execute("""
                         INSERT INTO skill_tracker (skill_name, category, proficiency_level, evidence)
                         VALUES (?, ?, ?, ?)
                         ON CONFLICT(skill_name) DO UPDATE SET
@@ -2024,7 +1986,6 @@ Return ONLY the JSON object, no other text."""
                         json.dumps([skill.get("evidence", "Extracted from resume")])
                     ))
                     skills_added += 1
-                conn.commit()
             
             # If update_profile is requested, extract and update profile info
             if update_profile:
@@ -2060,7 +2021,7 @@ Return ONLY valid JSON, no other text. Use null for fields you can't determine."
                         profile_data = json.loads(profile_match.group())
                         
                         # Build update query for non-null fields
-                        with connect() as conn:
+                        async with transaction() as tx:
                             updates = []
                             values = []
                             for field in ['current_role', 'target_role', 'years_experience', 'education', 
@@ -2077,10 +2038,10 @@ Return ONLY valid JSON, no other text. Use null for fields you can't determine."
                             
                             if updates:
                                 # Check if profile exists
-                                existing = conn.execute("SELECT id FROM career_profile LIMIT 1").fetchone()
+                                existing = await tx.fetch_one("SELECT id FROM career_profile LIMIT 1")
                                 if existing:
                                     values.append(existing['id'])
-                                    conn.execute(f"""
+                                    await tx.execute(f"""
                                         UPDATE career_profile 
                                         SET {', '.join(updates)}, updated_at = datetime('now')
                                         WHERE id = ?
@@ -2088,11 +2049,10 @@ Return ONLY valid JSON, no other text. Use null for fields you can't determine."
                                 else:
                                     # Insert new profile
                                     fields = [u.split(' = ')[0] for u in updates]
-                                    conn.execute(f"""
+                                    await tx.execute(f"""
                                         INSERT INTO career_profile ({', '.join(fields)})
                                         VALUES ({', '.join(['?' for _ in values])})
                                     """, values)
-                                conn.commit()
                                 profile_updated = True
                 except Exception as pe:
                     print(f"Profile update error: {pe}")
@@ -2274,7 +2234,7 @@ async def assess_skills_from_codebase(request: Request):
     
     # Update skill levels based on evidence - now per-skill with variance
     skills_updated = 0
-    with connect() as conn:
+    async with transaction() as tx:
         for skill, evidence in skill_evidence.items():
             file_count = len(evidence["files"])
             pattern_count = len(evidence["patterns_found"])
@@ -2296,7 +2256,7 @@ async def assess_skills_from_codebase(request: Request):
                 evidence_json = json.dumps(evidence["files"][:10])
                 
                 # Insert or update the specific skill
-                conn.execute("""
+                await tx.execute("""
                     INSERT INTO skill_tracker (skill_name, category, proficiency_level, evidence)
                     VALUES (?, ?, ?, ?)
                     ON CONFLICT(skill_name) DO UPDATE SET
@@ -2307,7 +2267,6 @@ async def assess_skills_from_codebase(request: Request):
                 """, (skill, category, proficiency, evidence_json))
                 skills_updated += 1
         
-        conn.commit()
     
     # Build evidence summary for response
     evidence_summary = {
@@ -2334,14 +2293,17 @@ async def populate_skills_from_projects():
     Tracks which memories/tickets have been processed to avoid double-counting.
     Uses a processed_sources table to remember what's already been imported.
     """
-    with connect() as conn:
+    # Supabase fetch happens before the write transaction is opened
+    all_tickets = await run_in_threadpool(tickets_supabase.get_all_tickets)
+    
+    async with transaction() as tx:
         skills_updated = 0
         projects_processed = 0
         memories_processed = 0
         skipped_already_processed = 0
         
         # Ensure tracking table exists
-        conn.execute("""
+        await tx.execute("""
             CREATE TABLE IF NOT EXISTS skill_import_tracking (
                 source_type TEXT NOT NULL,
                 source_id TEXT NOT NULL,
@@ -2351,19 +2313,19 @@ async def populate_skills_from_projects():
         """)
         
         # 1. Get skills/tags from completed project memories
-        project_memories = conn.execute("""
+        project_memories = await tx.fetch_all("""
             SELECT id, skills, title FROM career_memories 
             WHERE memory_type = 'completed_project' AND skills IS NOT NULL AND skills != ''
-        """).fetchall()
+        """)
         
         for mem in project_memories:
             mem_id = str(mem["id"])
             
             # Check if already processed
-            already = conn.execute(
+            already = await tx.fetch_one(
                 "SELECT 1 FROM skill_import_tracking WHERE source_type = 'career_memory' AND source_id = ?",
                 (mem_id,)
-            ).fetchone()
+            )
             
             if already:
                 skipped_already_processed += 1
@@ -2374,7 +2336,7 @@ async def populate_skills_from_projects():
                 skill = skill.strip()
                 if skill:
                     # Insert or update skill
-                    conn.execute("""
+                    await tx.execute("""
                         INSERT INTO skill_tracker (skill_name, category, proficiency_level, projects_count)
                         VALUES (?, 'projects', 20, 1)
                         ON CONFLICT(skill_name) DO UPDATE SET
@@ -2386,26 +2348,26 @@ async def populate_skills_from_projects():
                     skills_updated += 1
             
             # Mark as processed
-            conn.execute(
+            await tx.execute(
                 "INSERT OR IGNORE INTO skill_import_tracking (source_type, source_id) VALUES ('career_memory', ?)",
                 (mem_id,)
             )
         
         # 2. Get technologies from AI implementation memories (if table exists)
         try:
-            ai_memories = conn.execute("""
+            ai_memories = await tx.fetch_all("""
                 SELECT id, technologies, title FROM ai_implementation_memories 
                 WHERE technologies IS NOT NULL AND technologies != ''
-            """).fetchall()
+            """)
             
             for mem in ai_memories:
                 mem_id = str(mem["id"])
                 
                 # Check if already processed
-                already = conn.execute(
+                already = await tx.fetch_one(
                     "SELECT 1 FROM skill_import_tracking WHERE source_type = 'ai_memory' AND source_id = ?",
                     (mem_id,)
-                ).fetchone()
+                )
                 
                 if already:
                     skipped_already_processed += 1
@@ -2416,7 +2378,7 @@ async def populate_skills_from_projects():
                     tech = tech.strip()
                     if tech:
                         # Insert or update skill with AI category
-                        conn.execute("""
+                        await tx.execute("""
                             INSERT INTO skill_tracker (skill_name, category, proficiency_level, projects_count)
                             VALUES (?, 'ai', 25, 1)
                             ON CONFLICT(skill_name) DO UPDATE SET
@@ -2428,7 +2390,7 @@ async def populate_skills_from_projects():
                         skills_updated += 1
                 
                 # Mark as processed
-                conn.execute(
+                await tx.execute(
                     "INSERT OR IGNORE INTO skill_import_tracking (source_type, source_id) VALUES ('ai_memory', ?)",
                     (mem_id,)
                 )
@@ -2436,7 +2398,6 @@ async def populate_skills_from_projects():
             pass  # ai_implementation_memories table may not exist
         
         # 3. Also process completed tickets with tags (from Supabase)
-        all_tickets = tickets_supabase.get_all_tickets()
         completed_tickets = [t for t in all_tickets 
                            if t.get("status") in ('done', 'complete', 'completed')
                            and t.get("tags")]
@@ -2445,10 +2406,10 @@ async def populate_skills_from_projects():
             ticket_id = str(ticket.get("id", ticket.get("key", "")))
             
             # Check if already processed
-            already = conn.execute(
+            already = await tx.fetch_one(
                 "SELECT 1 FROM skill_import_tracking WHERE source_type = 'ticket' AND source_id = ?",
                 (ticket_id,)
-            ).fetchone()
+            )
             
             if already:
                 skipped_already_processed += 1
@@ -2457,7 +2418,7 @@ async def populate_skills_from_projects():
             for tag in (ticket.get("tags") or "").split(","):
                 tag = tag.strip()
                 if tag:
-                    conn.execute("""
+                    await tx.execute("""
                         INSERT INTO skill_tracker (skill_name, category, proficiency_level, tickets_count)
                         VALUES (?, 'tickets', 15, 1)
                         ON CONFLICT(skill_name) DO UPDATE SET
@@ -2469,12 +2430,11 @@ async def populate_skills_from_projects():
                     skills_updated += 1
             
             # Mark as processed
-            conn.execute(
+            await tx.execute(
                 "INSERT OR IGNORE INTO skill_import_tracking (source_type, source_id) VALUES ('ticket', ?)",
                 (ticket_id,)
             )
         
-        conn.commit()
     
     return JSONResponse({
         "status": "ok",
@@ -2502,12 +2462,12 @@ async def update_skills_from_tickets():
             if tag:
                 tag_counts[tag] = tag_counts.get(tag, 0) + 1
     
-    with connect() as conn:
+    async with transaction() as tx:
         # Update skill tracker
         updated = 0
         for tag, count in tag_counts.items():
             # Try to match tag to skill
-            conn.execute("""
+            await tx.execute("""
                 UPDATE skill_tracker 
                 SET tickets_count = tickets_count + ?,
                     last_used_at = datetime('now'),
@@ -2516,7 +2476,6 @@ async def update_skills_from_tickets():
             """, (count, f"%{tag}%"))
             updated += 1
         
-        conn.commit()
     
     return JSONResponse({"status": "ok", "tags_processed": len(tag_counts)})
 
@@ -2542,13 +2501,11 @@ async def add_ai_implementation_memory(request: Request):
         "features": data.get("features", [])
     })
     
-    with connect() as conn:
-        cur = conn.execute("""
+    async with transaction() as tx:
+        memory_id = await tx.execute("""
             INSERT INTO career_memories (memory_type, title, description, source_type, skills, is_pinned, is_ai_work, metadata)
             VALUES ('ai_implementation', ?, ?, 'codebase', ?, 0, 1, ?)
         """, (title, description, skills, metadata))
-        conn.commit()
-        memory_id = cur.lastrowid
     
     return JSONResponse({"status": "ok", "id": memory_id})
 
@@ -2556,35 +2513,33 @@ async def add_ai_implementation_memory(request: Request):
 @router.get("/api/career/ai-memories")
 async def get_ai_memories():
     """Get all AI implementation memories."""
-    with connect() as conn:
-        rows = conn.execute("""
-            SELECT * FROM career_memories 
-            WHERE is_ai_work = 1
-            ORDER BY is_pinned DESC, created_at DESC
-        """).fetchall()
+    rows = await fetch_all("""
+        SELECT * FROM career_memories 
+        WHERE is_ai_work = 1
+        ORDER BY is_pinned DESC, created_at DESC
+    """)
     return JSONResponse([dict(r) for r in rows])
 
 
 @router.delete("/api/career/ai-memories/{memory_id}")
 async def delete_ai_memory(memory_id: int):
     """Delete an AI implementation memory."""
-    with connect() as conn:
-        conn.execute("DELETE FROM career_memories WHERE id = ? AND is_ai_work = 1", (memory_id,))
-        conn.commit()
+    async with transaction() as tx:
+        await tx.execute("DELETE FROM career_memories WHERE id = ? AND is_ai_work = 1", (memory_id,))
     return JSONResponse({"status": "ok", "deleted": memory_id})
 
 
 @router.post("/api/career/ai-memories/compress")
 async def compress_ai_memories(request: Request):
     """Compress AI memories by removing duplicates and merging similar entries."""
-    with connect() as conn:
+    async with transaction() as tx:
         # Get all AI memories
-        memories = conn.execute("""
+        memories = await tx.fetch_all("""
             SELECT id, title, description, technologies, skills 
             FROM career_memories 
             WHERE is_ai_work = 1
             ORDER BY created_at DESC
-        """).fetchall()
+        """)
         
         if len(memories) <= 1:
             return JSONResponse({"status": "ok", "removed": 0, "merged": 0, "message": "Not enough memories to compress"})
@@ -2598,7 +2553,7 @@ async def compress_ai_memories(request: Request):
             title_lower = (mem['title'] or '').lower().strip()
             if title_lower in seen_titles:
                 # Delete duplicate
-                conn.execute("DELETE FROM career_memories WHERE id = ?", (mem['id'],))
+                await tx.execute("DELETE FROM career_memories WHERE id = ?", (mem['id'],))
                 removed += 1
             else:
                 seen_titles[title_lower] = mem['id']
@@ -2627,19 +2582,18 @@ async def compress_ai_memories(request: Request):
                             if s.strip():
                                 all_skills.add(s.strip())
                         # Delete the duplicate
-                        conn.execute("DELETE FROM career_memories WHERE id = ?", (other['id'],))
+                        await tx.execute("DELETE FROM career_memories WHERE id = ?", (other['id'],))
                         removed += 1
                     
                     # Update the keeper with merged skills
                     if all_skills:
-                        conn.execute("""
+                        await tx.execute("""
                             UPDATE career_memories 
                             SET skills = ?, updated_at = datetime('now')
                             WHERE id = ?
                         """, (','.join(sorted(all_skills)), keeper['id']))
                         merged += 1
         
-        conn.commit()
     
     return JSONResponse({
         "status": "ok",
@@ -2722,7 +2676,8 @@ Respond in JSON format:
             patterns = data.get("patterns", [])
             
             added = []
-            with connect() as conn:
+            to_sync = []
+            async with transaction() as tx:
                 for pattern in patterns[:5]:
                     title = pattern.get("title", "Unknown Pattern")
                     description = pattern.get("description", "")
@@ -2732,20 +2687,18 @@ Respond in JSON format:
                     full_desc = f"{description}\n\n**Code Insight:** {code_insight}" if code_insight else description
                     
                     # Check for duplicates
-                    existing = conn.execute(
+                    existing = await tx.fetch_one(
                         "SELECT id FROM career_memories WHERE title = ? AND is_ai_work = 1",
                         (title,)
-                    ).fetchone()
+                    )
                     
                     if not existing:
-                        conn.execute("""
+                        await tx.execute("""
                             INSERT INTO career_memories (memory_type, title, description, source_type, skills, is_pinned, is_ai_work)
                             VALUES ('ai_implementation', ?, ?, 'codebase_ai', ?, 0, 1)
                         """, (title, full_desc, technologies))
                         added.append(title)
-                        
-                        # Sync to Supabase (fire-and-forget)
-                        sync_memory_to_supabase({
+                        to_sync.append({
                             'memory_type': 'ai_implementation',
                             'title': title,
                             'description': full_desc,
@@ -2753,7 +2706,10 @@ Respond in JSON format:
                             'source_type': 'codebase_ai',
                             'is_ai_work': True,
                         })
-                conn.commit()
+            
+            # Sync to Supabase (fire-and-forget) once the local write is committed
+            for memory_data in to_sync:
+                await run_in_threadpool(sync_memory_to_supabase, memory_data)
             
             return JSONResponse({"status": "ok", "added": added, "count": len(added)})
     except Exception as e:
@@ -2862,7 +2818,7 @@ async def sync_docs_to_memories():
         added = []
         updated = []
         
-        with connect() as conn:
+        async with transaction() as tx:
             for impl in implementations:
                 title = impl.get("title", "Unknown Implementation")
                 description = impl.get("summary", "")
@@ -2870,14 +2826,14 @@ async def sync_docs_to_memories():
                 source = impl.get("source", "docs")
                 
                 # Check if already exists
-                existing = conn.execute(
+                existing = await tx.fetch_one(
                     "SELECT id FROM career_memories WHERE title = ? AND source_type = 'documentation'",
                     (title,)
-                ).fetchone()
+                )
                 
                 if existing:
                     # Update existing
-                    conn.execute("""
+                    await tx.execute("""
                         UPDATE career_memories 
                         SET description = ?, skills = ?, updated_at = datetime('now')
                         WHERE id = ?
@@ -2885,13 +2841,12 @@ async def sync_docs_to_memories():
                     updated.append(title)
                 else:
                     # Insert new
-                    conn.execute("""
+                    await tx.execute("""
                         INSERT INTO career_memories (memory_type, title, description, source_type, skills, is_pinned, is_ai_work, metadata)
                         VALUES ('ai_implementation', ?, ?, 'documentation', ?, 0, 1, ?)
                     """, (title, description, technologies, json.dumps({"source": source})))
                     added.append(title)
             
-            conn.commit()
         
         return JSONResponse({
             "status": "ok",
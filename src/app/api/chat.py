@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Request, Form
 from fastapi.responses import RedirectResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime, timedelta
 import json
 import os
@@ -390,11 +391,15 @@ async def send_chat_message(conversation_id: int, request: Request):
         meeting_id = conv_dict.get("meeting_id")
         document_id = conv_dict.get("document_id")
         
-        # Run the chat turn with context if available
+        # Run the chat turn off the event loop (it blocks on the agent runtime).
+        # Not cancelled on disconnect: the turn stores both messages, so it is
+        # left to finish and the answer shows up when the conversation reloads.
         if meeting_id or document_id:
-            answer, run_id = run_chat_turn_with_context(conversation_id, message, meeting_id, document_id)
+            answer, run_id = await run_in_threadpool(
+                run_chat_turn_with_context, conversation_id, message, meeting_id, document_id
+            )
         else:
-            answer, run_id = run_chat_turn(conversation_id, message)
+            answer, run_id = await run_in_threadpool(run_chat_turn, conversation_id, message)
         
         # Generate title if this is the first message
         if conv_dict and not conv_dict.get("title"):
@@ -17,9 +17,11 @@ import logging
 from typing import List, Optional
 from fastapi import APIRouter, Query, HTTPException, status
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from ..db import connect
+from ..db_async import fetch_one, fetch_all, transaction
 from .search import get_embedding, get_supabase_client
 
 logger = logging.getLogger(__name__)
@@ -373,11 +375,10 @@ async def get_entity_links(
 @router.delete("/links/{link_id}")
 async def delete_link(link_id: int):
     """Delete a link by ID."""
-    with connect() as conn:
-        result = conn.execute(
+    async with transaction() as tx:
+        result = await tx.fetch_one(
             "DELETE FROM entity_links WHERE id = ? RETURNING id", (link_id,)
-        ).fetchone()
-        conn.commit()
+        )
         
         if not result:
             raise HTTPException(
@@ -529,48 +530,60 @@ async def auto_suggest_links(
 @router.get("/stats")
 async def graph_stats() -> GraphStatsResponse:
     """Get statistics about the knowledge graph."""
-    with connect() as conn:
-        # Total links
-        total = conn.execute("SELECT COUNT(*) as c FROM entity_links").fetchone()["c"]
-        
-        # Links by type
-        by_type = conn.execute(
-            """SELECT link_type, COUNT(*) as c 
-               FROM entity_links 
-               GROUP BY link_type 
-               ORDER BY c DESC"""
-        ).fetchall()
-        links_by_type = {row["link_type"]: row["c"] for row in by_type}
-        
-        # Entities with links
-        source_counts = conn.execute(
-            """SELECT source_type, COUNT(DISTINCT source_id) as c 
-               FROM entity_links 
-               GROUP BY source_type"""
-        ).fetchall()
-        target_counts = conn.execute(
-            """SELECT target_type, COUNT(DISTINCT target_id) as c 
-               FROM entity_links 
-               GROUP BY target_type"""
-        ).fetchall()
-        
-        entities_with_links = {}
-        for row in source_counts:
-            entities_with_links[row["source_type"]] = row["c"]
-        for row in target_counts:
-            existing = entities_with_links.get(row["target_type"], 0)
-            entities_with_links[row["target_type"]] = max(existing, row["c"])
-        
-        # Average links per entity
-        total_entities = sum(entities_with_links.values()) or 1
-        avg_links = total / total_entities if total_entities > 0 else 0
-        
-        return GraphStatsResponse(
-            total_links=total,
-            links_by_type=links_by_type,
-            entities_with_links=entities_with_links,
-            avg_links_per_entity=round(avg_links, 2),
-        )
+    # Total links
+    total = (await fetch_one("SELECT COUNT(*) as c FROM entity_links"))["c"]
+    
+    # Links by type
+    by_type = await fetch_all(
+        """SELECT link_type, COUNT(*) as c 
+           FROM entity_links 
+           GROUP BY link_type 
+           ORDER BY c DESC"""
+    )
+    links_by_type = {row["link_type"]: row["c"] for row in by_type}
+    
+    # Entities with links
+    source_counts = await fetch_all(
+        """SELECT source_type, COUNT(DISTINCT source_id) as c 
+           FROM entity_links 
+           GROUP BY source_type"""
+    )
+    target_counts = await fetch_all(
+        """SELECT target_type, COUNT(DISTINCT target_id) as c 
+           FROM entity_links 
+           GROUP BY target_type"""
+    )
+    
+    entities_with_links = {}
+    for row in source_counts:
+        entities_with_links[row["source_type"]] = row["c"]
+    for row in target_counts:
+        existing = entities_with_links.get(row["target_type"], 0)
+        entities_with_links[row["target_type"]] = max(existing, row["c"])
+    
+    # Average links per entity
+    total_entities = sum(entities_with_links.values()) or 1
+    avg_links = total / total_entities if total_entities > 0 else 0
+    
+    return GraphStatsResponse(
+        total_links=total,
+        links_by_type=links_by_type,
+        entities_with_links=entities_with_links,
+        avg_links_per_entity=round(avg_links, 2),
+    )
+
+
+def _find_similar(sb, content: str, min_similarity: float) -> list:
+    """Embed content and return the semantic_search matches (blocking)."""
+    embedding = get_embedding(content[:8000])
+    if not embedding:
+        return []
+    result = sb.rpc("semantic_search", {
+        "query_embedding": embedding,
+        "match_threshold": min_similarity,
+        "match_count": 10,
+    }).execute()
+    return result.data or []
 
 
 @router.post("/build-from-embeddings")
@@ -594,105 +607,99 @@ async def build_graph_from_embeddings(
     
     types = entity_types.split(",") if entity_types else ["meeting", "document", "ticket", "dikw"]
     
-    with connect() as conn:
-        created = 0
-        skipped = 0
-        suggestions = []
+    # Embedding and semantic search are network calls: run them in the
+    # threadpool and outside the transaction, which only writes the links
+    candidates = []
+    for etype in types:
+        # Get all entities of this type
+        if etype == "meeting":
+            rows = await fetch_all(
+                "SELECT id, synthesized_notes as content FROM meeting_summaries WHERE synthesized_notes IS NOT NULL LIMIT 100"
+            )
+        elif etype == "document":
+            rows = await fetch_all(
+                "SELECT id, content FROM docs WHERE content IS NOT NULL LIMIT 100"
+            )
+        elif etype == "ticket":
+            rows = await fetch_all(
+                "SELECT id, description as content FROM tickets WHERE description IS NOT NULL LIMIT 100"
+            )
+        elif etype == "dikw":
+            rows = await fetch_all(
+                "SELECT id, content FROM dikw_items WHERE content IS NOT NULL LIMIT 100"
+            )
+        else:
+            continue
         
-        # For each entity type, get all entities and find similar ones
-        for etype in types:
-            # Get all entities of this type
-            if etype == "meeting":
-                rows = conn.execute(
-                    "SELECT id, synthesized_notes as content FROM meeting_summaries WHERE synthesized_notes IS NOT NULL LIMIT 100"
-                ).fetchall()
-            elif etype == "document":
-                rows = conn.execute(
-                    "SELECT id, content FROM docs WHERE content IS NOT NULL LIMIT 100"
-                ).fetchall()
-            elif etype == "ticket":
-                rows = conn.execute(
-                    "SELECT id, description as content FROM tickets WHERE description IS NOT NULL LIMIT 100"
-                ).fetchall()
-            elif etype == "dikw":
-                rows = conn.execute(
-                    "SELECT id, content FROM dikw_items WHERE content IS NOT NULL LIMIT 100"
-                ).fetchall()
-            else:
+        for row in rows:
+            if not row["content"]:
+                continue
+            try:
+                matches = await run_in_threadpool(_find_similar, sb, row["content"], min_similarity)
+            except Exception as e:
+                logger.warning(f"Failed to process {etype}/{row['id']}: {e}")
                 continue
             
-            for row in rows:
-                if not row["content"]:
+            for item in matches:
+                item_type = item.get("ref_type")
+                item_id = item.get("ref_id")
+                
+                # Skip self
+                if item_type == etype and str(item_id) == str(row["id"]):
                     continue
                 
-                embedding = get_embedding(row["content"][:8000])
-                if not embedding:
+                # Skip if not in allowed types
+                if item_type not in types:
                     continue
                 
-                try:
-                    result = sb.rpc("semantic_search", {
-                        "query_embedding": embedding,
-                        "match_threshold": min_similarity,
-                        "match_count": 10,
-                    }).execute()
-                    
-                    for item in result.data or []:
-                        item_type = item.get("ref_type")
-                        item_id = item.get("ref_id")
-                        similarity = item.get("similarity", 0)
-                        
-                        # Skip self
-                        if item_type == etype and str(item_id) == str(row["id"]):
-                            continue
-                        
-                        # Skip if not in allowed types
-                        if item_type not in types:
-                            continue
-                        
-                        # Check if link exists
-                        existing = conn.execute(
-                            """SELECT id FROM entity_links 
-                               WHERE (source_type = ? AND source_id = ? AND target_type = ? AND target_id = ?)
-                                  OR (source_type = ? AND source_id = ? AND target_type = ? AND target_id = ?)""",
-                            (etype, row["id"], item_type, item_id,
-                             item_type, item_id, etype, row["id"])
-                        ).fetchone()
-                        
-                        if existing:
-                            skipped += 1
-                            continue
-                        
-                        link_type = "semantic_similar" if similarity > 0.85 else "same_topic"
-                        
-                        if not dry_run:
-                            conn.execute(
-                                """INSERT INTO entity_links 
-                                   (source_type, source_id, target_type, target_id, link_type,
-                                    similarity_score, confidence, is_bidirectional, created_by)
-                                   VALUES (?, ?, ?, ?, ?, ?, 0.8, 1, 'system')""",
-                                (etype, row["id"], item_type, item_id, link_type, similarity)
-                            )
-                            created += 1
-                        else:
-                            suggestions.append({
-                                "source": f"{etype}/{row['id']}",
-                                "target": f"{item_type}/{item_id}",
-                                "similarity": round(similarity, 3),
-                                "link_type": link_type,
-                            })
-                            
-                except Exception as e:
-                    logger.warning(f"Failed to process {etype}/{row['id']}: {e}")
-        
-        if not dry_run:
-            conn.commit()
-        
-        return {
-            "dry_run": dry_run,
-            "links_created": created,
-            "links_skipped": skipped,
-            "suggestions": suggestions[:50] if dry_run else None,
-        }
+                candidates.append((etype, row["id"], item_type, item_id, item.get("similarity", 0)))
+    
+    created = 0
+    skipped = 0
+    suggestions = []
+    
+    async def _link_exists(fetch, etype, source_id, item_type, item_id):
+        return await fetch(
+            """SELECT id FROM entity_links 
+               WHERE (source_type = ? AND source_id = ? AND target_type = ? AND target_id = ?)
+                  OR (source_type = ? AND source_id = ? AND target_type = ? AND target_id = ?)""",
+            (etype, source_id, item_type, item_id,
+             item_type, item_id, etype, source_id)
+        )
+    
+    if dry_run:
+        for etype, source_id, item_type, item_id, similarity in candidates:
+            if await _link_exists(fetch_one, etype, source_id, item_type, item_id):
+                skipped += 1
+                continue
+            suggestions.append({
+                "source": f"{etype}/{source_id}",
+                "target": f"{item_type}/{item_id}",
+                "similarity": round(similarity, 3),
+                "link_type": "semantic_similar" if similarity > 0.85 else "same_topic",
+            })
+    elif candidates:
+        async with transaction() as tx:
+            for etype, source_id, item_type, item_id, similarity in candidates:
+                if await _link_exists(tx.fetch_one, etype, source_id, item_type, item_id):
+                    skipped += 1
+                    continue
+                link_type = "semantic_similar" if similarity > 0.85 else "same_topic"
+                await tx.execute(
+                    """INSERT INTO entity_links 
+                       (source_type, source_id, target_type, target_id, link_type,
+                        similarity_score, confidence, is_bidirectional, created_by)
+                       VALUES (?, ?, ?, ?, ?, ?, 0.8, 1, 'system')""",
+                    (etype, source_id, item_type, item_id, link_type, similarity)
+                )
+                created += 1
+    
+    return {
+        "dry_run": dry_run,
+        "links_created": created,
+        "links_skipped": skipped,
+        "suggestions": suggestions[:50] if dry_run else None,
+    }
 
 
 @router.post("/link-documents")
@@ -714,93 +721,75 @@ async def link_all_documents(
             detail="Supabase not available for semantic search"
         )
     
-    with connect() as conn:
-        # Get documents without many links
-        docs = conn.execute(
-            """SELECT d.id, d.source, d.content 
-               FROM docs d
-               LEFT JOIN (
-                   SELECT source_id, COUNT(*) as link_count 
-                   FROM entity_links 
-                   WHERE source_type = 'document' AND created_by = 'system'
-                   GROUP BY source_id
-               ) el ON d.id = el.source_id
-               WHERE d.content IS NOT NULL AND LENGTH(d.content) > 50
-               AND (el.link_count IS NULL OR el.link_count < 3)
-               ORDER BY d.id DESC
-               LIMIT ?""",
-            (limit,)
-        ).fetchall()
-        
-        processed = 0
-        links_created = 0
-        suggestions = []
+    # Get documents without many links
+    docs = await fetch_all(
+        """SELECT d.id, d.source, d.content 
+           FROM docs d
+           LEFT JOIN (
+               SELECT source_id, COUNT(*) as link_count 
+               FROM entity_links 
+               WHERE source_type = 'document' AND created_by = 'system'
+               GROUP BY source_id
+           ) el ON d.id = el.source_id
+           WHERE d.content IS NOT NULL AND LENGTH(d.content) > 50
+           AND (el.link_count IS NULL OR el.link_count < 3)
+           ORDER BY d.id DESC
+           LIMIT ?""",
+        (limit,)
+    )
+    
+    # Semantic search per document, outside the transaction
+    processed = 0
+    candidates = []
+    for doc in docs:
+        try:
+            matches = await run_in_threadpool(_find_similar, sb, doc["content"], min_similarity)
+        except Exception as e:
+            logger.warning(f"Failed to process document {doc['id']}: {e}")
+            continue
         
-        for doc in docs:
-            try:
-                # Generate embedding
-                embedding = get_embedding(doc["content"][:8000])
-                if not embedding:
+        for item in matches:
+            # Skip self and other documents
+            if item.get("ref_type") == "document":
+                continue
+            candidates.append((doc, item.get("ref_type"), item.get("ref_id"), item.get("similarity", 0)))
+        processed += 1
+    
+    links_created = 0
+    suggestions = []
+    link_exists_sql = """SELECT id FROM entity_links 
+                         WHERE source_type = 'document' AND source_id = ? 
+                         AND target_type = ? AND target_id = ?"""
+    
+    if dry_run:
+        for doc, item_type, item_id, similarity in candidates:
+            if await fetch_one(link_exists_sql, (doc["id"], item_type, item_id)):
+                continue
+            suggestions.append({
+                "document_id": doc["id"],
+                "document_source": doc["source"][:50],
+                "target": f"{item_type}/{item_id}",
+                "similarity": round(similarity, 3),
+                "link_type": "semantic_similar" if similarity > 0.85 else "same_topic",
+            })
+    elif candidates:
+        async with transaction() as tx:
+            for doc, item_type, item_id, similarity in candidates:
+                if await tx.fetch_one(link_exists_sql, (doc["id"], item_type, item_id)):
                     continue
-                
-                # Search for similar content
-                result = sb.rpc("semantic_search", {
-                    "query_embedding": embedding,
-                    "match_threshold": min_similarity,
-                    "match_count": 10,
-                }).execute()
-                
-                for item in result.data or []:
-                    item_type = item.get("ref_type")
-                    item_id = item.get("ref_id")
-                    similarity = item.get("similarity", 0)
-                    
-                    # Skip self and other documents
-                    if item_type == "document":
-                        continue
-                    
-                    # Check if link exists
-                    existing = conn.execute(
-                        """SELECT id FROM entity_links 
-                           WHERE source_type = 'document' AND source_id = ? 
-                           AND target_type = ? AND target_id = ?""",
-                        (doc["id"], item_type, item_id)
-                    ).fetchone()
-                    
-                    if existing:
-                        continue
-                    
-                    link_type = "semantic_similar" if similarity > 0.85 else "same_topic"
-                    
-                    if not dry_run:
-                        conn.execute(
-                            """INSERT INTO entity_links 
-                               (source_type, source_id, target_type, target_id, link_type,
-                                similarity_score, confidence, is_bidirectional, created_by)
-                               VALUES ('document', ?, ?, ?, ?, ?, 0.8, 1, 'system')""",
-                            (doc["id"], item_type, item_id, link_type, similarity)
-                        )
-                        links_created += 1
-                    else:
-                        suggestions.append({
-                            "document_id": doc["id"],
-                            "document_source": doc["source"][:50],
-                            "target": f"{item_type}/{item_id}",
-                            "similarity": round(similarity, 3),
-                            "link_type": link_type,
-                        })
-                
-                processed += 1
-                
-            except Exception as e:
-                logger.warning(f"Failed to process document {doc['id']}: {e}")
-        
-        if not dry_run:
-            conn.commit()
-        
-        return {
-            "dry_run": dry_run,
-            "documents_processed": processed,
-            "links_created": links_created,
-            "suggestions": suggestions[:30] if dry_run else None,
-        }
+                link_type = "semantic_similar" if similarity > 0.85 else "same_topic"
+                await tx.execute(
+                    """INSERT INTO entity_links 
+                       (source_type, source_id, target_type, target_id, link_type,
+                        similarity_score, confidence, is_bidirectional, created_by)
+                       VALUES ('document', ?, ?, ?, ?, ?, 0.8, 1, 'system')""",
+                    (doc["id"], item_type, item_id, link_type, similarity)
+                )
+                links_created += 1
+    
+    return {
+        "dry_run": dry_run,
+        "documents_processed": processed,
+        "links_created": links_created,
+        "suggestions": suggestions[:30] if dry_run else None,
+    }
@@ -16,6 +16,9 @@ import logging
 import asyncio
 import time
 
+from ..infrastructure.fake_providers import fake_backend_enabled, get_fake_client
+from ..metrics import timer as metrics_timer
+
 from .models import (
     SearchRequest,
     SemanticSearchRequest,
@@ -39,6 +42,9 @@ router = APIRouter(prefix="/api/search", tags=["search"])
 
 def get_supabase_client():
     """Get Supabase client for semantic search."""
+    if fake_backend_enabled("supabase"):
+        from ..infrastructure.fake_supabase import get_fake_supabase_client
+        return get_fake_supabase_client()
     try:
         from supabase import create_client
         url = os.getenv("SUPABASE_URL")
@@ -54,12 +60,16 @@ def get_supabase_client():
 def get_embedding(text: str) -> Optional[List[float]]:
     """Generate embedding for search query using OpenAI."""
     try:
-        import openai
-        client = openai.OpenAI()
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=text
-        )
+        if fake_backend_enabled("embeddings"):
+            client = get_fake_client("openai")
+        else:
+            import openai
+            client = openai.OpenAI()
+        with metrics_timer("embedding", "search.query"):
+            response = client.embeddings.create(
+                model="text-embedding-3-small",
+                input=text
+            )
         return response.data[0].embedding
     except Exception as e:
         logger.warning(f"Failed to generate embedding: {e}")
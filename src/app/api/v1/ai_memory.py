@@ -13,11 +13,12 @@ Key features:
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from typing import Optional, List, Literal
 from datetime import datetime
 
-from ...db import connect
+from ...db_async import fetch_one, fetch_all, run_write, transaction
 from ...memory.embed import embed_text, EMBED_MODEL
 from ...memory.vector_store import upsert_embedding
 from ...memory.semantic import semantic_search
@@ -77,6 +78,15 @@ class MemoryContext(BaseModel):
     memory_count: int
 
 
+# ============== Helpers ==============
+
+async def _embed_memory(memory_id: int, source_query: Optional[str], content: str):
+    """Embed a committed memory and store the vector through the writer."""
+    text_for_embedding = f"{source_query or ''}\n{content}"
+    vector = await run_in_threadpool(embed_text, text_for_embedding)
+    await run_write(upsert_embedding, "ai_memory", memory_id, EMBED_MODEL, vector)
+
+
 # ============== Endpoints ==============
 
 @router.post("/memories", response_model=MemoryResponse, status_code=201)
@@ -87,8 +97,8 @@ async def create_memory(memory: MemoryCreate):
     Memories are automatically embedded for semantic search.
     High-importance memories (7+) are prioritized in context retrieval.
     """
-    with connect() as conn:
-        cursor = conn.execute(
+    async with transaction() as tx:
+        memory_id = await tx.execute(
             """
             INSERT INTO ai_memory (source_type, source_query, content, tags, importance)
             VALUES (?, ?, ?, ?, ?)
@@ -96,18 +106,16 @@ async def create_memory(memory: MemoryCreate):
             (memory.source_type, memory.source_query, memory.content,
              memory.tags, memory.importance)
         )
-        memory_id = cursor.lastrowid
-        
-        # Create embedding for semantic search
-        text_for_embedding = f"{memory.source_query or ''}\n{memory.content}"
-        vector = embed_text(text_for_embedding)
-        upsert_embedding("ai_memory", memory_id, EMBED_MODEL, vector)
         
         # Fetch the created record
-        row = conn.execute(
+        row = await tx.fetch_one(
             "SELECT * FROM ai_memory WHERE id = ?",
             (memory_id,)
-        ).fetchone()
+        )
+    
+    # Create embedding for semantic search (after commit; the embedding call
+    # is a network request and must not hold the writer)
+    await _embed_memory(memory_id, memory.source_query, memory.content)
     
     return MemoryResponse(**dict(row))
 
@@ -120,21 +128,20 @@ async def list_memories(
     limit: int = Query(50, ge=1, le=200),
 ):
     """List memories with optional filtering."""
-    with connect() as conn:
-        query = "SELECT * FROM ai_memory WHERE importance >= ?"
-        params = [min_importance]
-        
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        if source_type:
-            query += " AND source_type = ?"
-            params.append(source_type)
-        
-        query += " ORDER BY importance DESC, created_at DESC LIMIT ?"
-        params.append(limit)
-        
-        rows = conn.execute(query, tuple(params)).fetchall()
+    query = "SELECT * FROM ai_memory WHERE importance >= ?"
+    params = [min_importance]
+    
+    if status:
+        query += " AND status = ?"
+        params.append(status)
+    if source_type:
+        query += " AND source_type = ?"
+        params.append(source_type)
+    
+    query += " ORDER BY importance DESC, created_at DESC LIMIT ?"
+    params.append(limit)
+    
+    rows = await fetch_all(query, tuple(params))
     
     return [MemoryResponse(**dict(row)) for row in rows]
 
@@ -142,11 +149,10 @@ async def list_memories(
 @router.get("/memories/{memory_id}", response_model=MemoryResponse)
 async def get_memory(memory_id: int):
     """Get a specific memory by ID."""
-    with connect() as conn:
-        row = conn.execute(
-            "SELECT * FROM ai_memory WHERE id = ?",
-            (memory_id,)
-        ).fetchone()
+    row = await fetch_one(
+        "SELECT * FROM ai_memory WHERE id = ?",
+        (memory_id,)
+    )
     
     if not row:
         raise HTTPException(status_code=404, detail="Memory not found")
@@ -164,12 +170,12 @@ async def update_memory(memory_id: int, memory: MemoryUpdate):
     - Archive old memories
     - Update content or importance
     """
-    with connect() as conn:
+    async with transaction() as tx:
         # Check if memory exists
-        existing = conn.execute(
+        existing = await tx.fetch_one(
             "SELECT id FROM ai_memory WHERE id = ?",
             (memory_id,)
-        ).fetchone()
+        )
         
         if not existing:
             raise HTTPException(status_code=404, detail="Memory not found")
@@ -193,23 +199,17 @@ async def update_memory(memory_id: int, memory: MemoryUpdate):
         
         query = f"UPDATE ai_memory SET {', '.join(updates)} WHERE id = ?"
         params.append(memory_id)
-        conn.execute(query, tuple(params))
-        
-        # Re-embed if content changed
-        if memory.content:
-            row = conn.execute(
-                "SELECT source_query, content FROM ai_memory WHERE id = ?",
-                (memory_id,)
-            ).fetchone()
-            text_for_embedding = f"{row['source_query'] or ''}\n{row['content']}"
-            vector = embed_text(text_for_embedding)
-            upsert_embedding("ai_memory", memory_id, EMBED_MODEL, vector)
+        await tx.execute(query, tuple(params))
         
         # Fetch updated record
-        row = conn.execute(
+        row = await tx.fetch_one(
             "SELECT * FROM ai_memory WHERE id = ?",
             (memory_id,)
-        ).fetchone()
+        )
+    
+    # Re-embed if content changed
+    if memory.content:
+        await _embed_memory(memory_id, row["source_query"], row["content"])
     
     return MemoryResponse(**dict(row))
 
@@ -217,16 +217,16 @@ async def update_memory(memory_id: int, memory: MemoryUpdate):
 @router.delete("/memories/{memory_id}", status_code=204)
 async def delete_memory(memory_id: int):
     """Delete a memory (soft delete by setting status to 'rejected')."""
-    with connect() as conn:
-        existing = conn.execute(
+    async with transaction() as tx:
+        existing = await tx.fetch_one(
             "SELECT id FROM ai_memory WHERE id = ?",
             (memory_id,)
-        ).fetchone()
+        )
         
         if not existing:
             raise HTTPException(status_code=404, detail="Memory not found")
         
-        conn.execute(
+        await tx.execute(
             "UPDATE ai_memory SET status = 'rejected', updated_at = datetime('now') WHERE id = ?",
             (memory_id,)
         )
@@ -261,17 +261,16 @@ async def search_memories(
     if not results:
         return []
     
-    with connect() as conn:
-        memory_ids = [r["ref_id"] for r in results]
-        placeholders = ",".join("?" * len(memory_ids))
-        
-        rows = conn.execute(
-            f"""
-            SELECT * FROM ai_memory 
-            WHERE id IN ({placeholders}) AND status = 'approved'
-            """,
-            tuple(memory_ids)
-        ).fetchall()
+    memory_ids = [r["ref_id"] for r in results]
+    placeholders = ",".join("?" * len(memory_ids))
+    
+    rows = await fetch_all(
+        f"""
+        SELECT * FROM ai_memory 
+        WHERE id IN ({placeholders}) AND status = 'approved'
+        """,
+        tuple(memory_ids)
+    )
     
     # Merge with similarity scores
     memory_map = {row["id"]: dict(row) for row in rows}
@@ -314,26 +313,25 @@ async def get_memory_context(
     memories_to_include = []
     tokens_used = 0
     
-    with connect() as conn:
-        # First, always include high-importance memories (8+)
-        if include_high_importance:
-            high_importance = conn.execute(
-                """
-                SELECT * FROM ai_memory 
-                WHERE status = 'approved' AND importance >= 8
-                ORDER BY importance DESC, created_at DESC
-                LIMIT ?
-                """,
-                (max_memories,)
-            ).fetchall()
+    # First, always include high-importance memories (8+)
+    if include_high_importance:
+        high_importance = await fetch_all(
+            """
+            SELECT * FROM ai_memory 
+            WHERE status = 'approved' AND importance >= 8
+            ORDER BY importance DESC, created_at DESC
+            LIMIT ?
+            """,
+            (max_memories,)
+        )
+        
+        for row in high_importance:
+            content = row["content"]
+            estimated_tokens = len(content) // 4  # Rough estimate
             
-            for row in high_importance:
-                content = row["content"]
-                estimated_tokens = len(content) // 4  # Rough estimate
-                
-                if tokens_used + estimated_tokens <= max_tokens:
-                    memories_to_include.append(dict(row))
-                    tokens_used += estimated_tokens
+            if tokens_used + estimated_tokens <= max_tokens:
+                memories_to_include.append(dict(row))
+                tokens_used += estimated_tokens
     
     # Then, add semantically relevant memories
     remaining_slots = max_memories - len(memories_to_include)
@@ -411,27 +409,26 @@ async def save_chat_as_memory(
 @router.get("/memories/stats")
 async def get_memory_stats():
     """Get statistics about stored memories."""
-    with connect() as conn:
-        stats = conn.execute(
-            """
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END) as approved,
-                SUM(CASE WHEN status = 'rejected' THEN 1 ELSE 0 END) as rejected,
-                SUM(CASE WHEN status = 'archived' THEN 1 ELSE 0 END) as archived,
-                AVG(importance) as avg_importance
-            FROM ai_memory
-            """
-        ).fetchone()
-        
-        by_source = conn.execute(
-            """
-            SELECT source_type, COUNT(*) as count
-            FROM ai_memory
-            WHERE status = 'approved'
-            GROUP BY source_type
-            """
-        ).fetchall()
+    stats = await fetch_one(
+        """
+        SELECT 
+            COUNT(*) as total,
+            SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END) as approved,
+            SUM(CASE WHEN status = 'rejected' THEN 1 ELSE 0 END) as rejected,
+            SUM(CASE WHEN status = 'archived' THEN 1 ELSE 0 END) as archived,
+            AVG(importance) as avg_importance
+        FROM ai_memory
+        """
+    )
+    
+    by_source = await fetch_all(
+        """
+        SELECT source_type, COUNT(*) as count
+        FROM ai_memory
+        WHERE status = 'approved'
+        GROUP BY source_type
+        """
+    )
     
     return {
         "total": stats["total"] or 0,
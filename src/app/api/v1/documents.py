@@ -17,6 +17,7 @@ from ..v1.models import (
     PaginatedResponse, APIResponse
 )
 from ...db import connect
+from ...db_async import fetch_one, execute, run_read, transaction
 
 logger = logging.getLogger(__name__)
 
@@ -110,7 +111,7 @@ async def list_documents(
     
     # Fall back to SQLite
     try:
-        documents, total = _get_documents_from_sqlite(skip, limit)
+        documents, total = await run_read(_get_documents_from_sqlite, skip, limit)
         return PaginatedResponse(items=documents, skip=skip, limit=limit, total=total)
     except Exception as e:
         logger.error(f"❌ SQLite also failed: {e}")
@@ -145,11 +146,10 @@ async def get_document(document_id: str):
     
     # Fall back to SQLite
     try:
-        with connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM docs WHERE id = ?",
-                (int(document_id) if document_id.isdigit() else -1,)
-            ).fetchone()
+        row = await fetch_one(
+            "SELECT * FROM docs WHERE id = ?",
+            (int(document_id) if document_id.isdigit() else -1,)
+        )
         
         if row:
             return DocumentResponse(
@@ -192,14 +192,11 @@ async def create_document(document: DocumentCreate):
         logger.warning(f"⚠️ Supabase create failed, trying SQLite: {e}")
     
     # Fall back to SQLite
-    with connect() as conn:
-        cursor = conn.execute(
-            """INSERT INTO docs (source, content)
-               VALUES (?, ?)""",
-            (document.title, document.content or "")
-        )
-        document_id = cursor.lastrowid
-        conn.commit()
+    document_id = await execute(
+        """INSERT INTO docs (source, content)
+           VALUES (?, ?)""",
+        (document.title, document.content or "")
+    )
     
     return APIResponse(success=True, message="Document created", data={"id": document_id})
 
@@ -239,9 +236,9 @@ async def update_document(document_id: str, document: DocumentUpdate):
         logger.warning(f"⚠️ Supabase update failed: {e}")
     
     # Fall back to SQLite
-    with connect() as conn:
+    async with transaction() as tx:
         sqlite_id = int(document_id) if document_id.isdigit() else -1
-        existing = conn.execute("SELECT id FROM docs WHERE id = ?", (sqlite_id,)).fetchone()
+        existing = await tx.fetch_one("SELECT id FROM docs WHERE id = ?", (sqlite_id,))
         
         if not existing:
             raise HTTPException(status_code=404, detail="Document not found")
@@ -258,8 +255,7 @@ async def update_document(document_id: str, document: DocumentUpdate):
         if updates:
             query = f"UPDATE docs SET {', '.join(updates)} WHERE id = ?"
             params.append(sqlite_id)
-            conn.execute(query, tuple(params))
-            conn.commit()
+            await tx.execute(query, tuple(params))
     
     return APIResponse(success=True, message="Document updated", data={"id": document_id})
 
@@ -289,14 +285,13 @@ async def delete_document(document_id: str):
         logger.warning(f"⚠️ Supabase delete failed: {e}")
     
     # Fall back to SQLite
-    with connect() as conn:
+    async with transaction() as tx:
         sqlite_id = int(document_id) if document_id.isdigit() else -1
-        existing = conn.execute("SELECT id FROM docs WHERE id = ?", (sqlite_id,)).fetchone()
+        existing = await tx.fetch_one("SELECT id FROM docs WHERE id = ?", (sqlite_id,))
         
         if not existing:
             raise HTTPException(status_code=404, detail="Document not found")
         
-        conn.execute("DELETE FROM docs WHERE id = ?", (sqlite_id,))
-        conn.commit()
+        await tx.execute("DELETE FROM docs WHERE id = ?", (sqlite_id,))
     
     return Response(status_code=204)
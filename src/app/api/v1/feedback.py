@@ -17,6 +17,9 @@ from typing import Optional, List, Literal
 from datetime import datetime
 
 from ...db import connect
+from ...db_async import fetch_one, fetch_all, transaction
+from ...services import feedback_ledger
+from ...services.signal_learning import signal_feedback_recorded
 
 router = APIRouter()
 
@@ -78,7 +81,7 @@ async def create_feedback(feedback: FeedbackCreate):
         # Check if feedback already exists (upsert pattern)
         existing = conn.execute(
             """
-            SELECT id FROM signal_feedback 
+            SELECT id, feedback FROM signal_feedback 
             WHERE meeting_id = ? AND signal_type = ? AND signal_text = ?
             """,
             (feedback.meeting_id, feedback.signal_type, feedback.signal_text)
@@ -111,12 +114,21 @@ async def create_feedback(feedback: FeedbackCreate):
         # Update DIKW item confidence if this signal was promoted
         _update_dikw_confidence(conn, feedback.signal_type, feedback.signal_text, feedback.feedback)
         
+        # Mirror the vote into the evaluation feedback ledger
+        feedback_ledger.record_signal_vote(
+            conn, feedback.meeting_id, feedback.signal_type, feedback.signal_text, feedback.feedback
+        )
+        
         # Fetch the created/updated record
         row = conn.execute(
             "SELECT * FROM signal_feedback WHERE id = ?",
             (feedback_id,)
         ).fetchone()
     
+    signal_feedback_recorded(
+        feedback.signal_type, feedback.signal_text, feedback.feedback,
+        existing["feedback"] if existing else None,
+    )
     return FeedbackResponse(**dict(row))
 
 
@@ -165,24 +177,23 @@ async def list_feedback(
     limit: int = Query(100, ge=1, le=500),
 ):
     """List all feedback with optional filtering."""
-    with connect() as conn:
-        query = "SELECT * FROM signal_feedback WHERE 1=1"
-        params = []
-        
-        if meeting_id:
-            query += " AND meeting_id = ?"
-            params.append(meeting_id)
-        if signal_type:
-            query += " AND signal_type = ?"
-            params.append(signal_type)
-        if feedback_type:
-            query += " AND feedback = ?"
-            params.append(feedback_type)
-        
-        query += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
-        
-        rows = conn.execute(query, tuple(params)).fetchall()
+    query = "SELECT * FROM signal_feedback WHERE 1=1"
+    params = []
+    
+    if meeting_id:
+        query += " AND meeting_id = ?"
+        params.append(meeting_id)
+    if signal_type:
+        query += " AND signal_type = ?"
+        params.append(signal_type)
+    if feedback_type:
+        query += " AND feedback = ?"
+        params.append(feedback_type)
+    
+    query += " ORDER BY created_at DESC LIMIT ?"
+    params.append(limit)
+    
+    rows = await fetch_all(query, tuple(params))
     
     return [FeedbackResponse(**dict(row)) for row in rows]
 
@@ -190,26 +201,25 @@ async def list_feedback(
 @router.get("/feedback/stats", response_model=FeedbackStats)
 async def get_feedback_stats():
     """Get aggregated statistics about all signal feedback."""
-    with connect() as conn:
-        # Total counts
-        totals = conn.execute(
-            """
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN feedback = 'up' THEN 1 ELSE 0 END) as upvotes,
-                SUM(CASE WHEN feedback = 'down' THEN 1 ELSE 0 END) as downvotes
-            FROM signal_feedback
-            """
-        ).fetchone()
-        
-        # By signal type
-        by_type = conn.execute(
-            """
-            SELECT signal_type, feedback, COUNT(*) as count
-            FROM signal_feedback
-            GROUP BY signal_type, feedback
-            """
-        ).fetchall()
+    # Total counts
+    totals = await fetch_one(
+        """
+        SELECT 
+            COUNT(*) as total,
+            SUM(CASE WHEN feedback = 'up' THEN 1 ELSE 0 END) as upvotes,
+            SUM(CASE WHEN feedback = 'down' THEN 1 ELSE 0 END) as downvotes
+        FROM signal_feedback
+        """
+    )
+    
+    # By signal type
+    by_type = await fetch_all(
+        """
+        SELECT signal_type, feedback, COUNT(*) as count
+        FROM signal_feedback
+        GROUP BY signal_type, feedback
+        """
+    )
     
     type_stats = {}
     for row in by_type:
@@ -238,28 +248,27 @@ async def get_confidence_boosts():
     - Ratio of upvotes to total feedback
     - Number of distinct positive patterns
     """
-    with connect() as conn:
-        # Get upvoted signals with their text patterns
-        upvoted = conn.execute(
-            """
-            SELECT signal_type, signal_text, COUNT(*) as count
-            FROM signal_feedback
-            WHERE feedback = 'up'
-            GROUP BY signal_type, signal_text
-            ORDER BY count DESC
-            """
-        ).fetchall()
-        
-        # Get total feedback by type for ratio calculation
-        totals = conn.execute(
-            """
-            SELECT signal_type, 
-                   SUM(CASE WHEN feedback = 'up' THEN 1 ELSE 0 END) as ups,
-                   SUM(CASE WHEN feedback = 'down' THEN 1 ELSE 0 END) as downs
-            FROM signal_feedback
-            GROUP BY signal_type
-            """
-        ).fetchall()
+    # Get upvoted signals with their text patterns
+    upvoted = await fetch_all(
+        """
+        SELECT signal_type, signal_text, COUNT(*) as count
+        FROM signal_feedback
+        WHERE feedback = 'up'
+        GROUP BY signal_type, signal_text
+        ORDER BY count DESC
+        """
+    )
+    
+    # Get total feedback by type for ratio calculation
+    totals = await fetch_all(
+        """
+        SELECT signal_type, 
+               SUM(CASE WHEN feedback = 'up' THEN 1 ELSE 0 END) as ups,
+               SUM(CASE WHEN feedback = 'down' THEN 1 ELSE 0 END) as downs
+        FROM signal_feedback
+        GROUP BY signal_type
+        """
+    )
     
     results = []
     type_totals = {row["signal_type"]: row for row in totals}
@@ -306,24 +315,23 @@ async def get_approved_signals(
     This is used by the chat system to provide relevant context from
     user-validated signals.
     """
-    with connect() as conn:
-        query = """
-            SELECT sf.signal_type, sf.signal_text, sf.notes, sf.meeting_id,
-                   ms.meeting_name, ms.meeting_date
-            FROM signal_feedback sf
-            LEFT JOIN meeting_summaries ms ON sf.meeting_id = ms.id
-            WHERE sf.feedback = 'up' AND sf.include_in_chat = 1
-        """
-        params = []
-        
-        if signal_type:
-            query += " AND sf.signal_type = ?"
-            params.append(signal_type)
-        
-        query += " ORDER BY sf.created_at DESC LIMIT ?"
-        params.append(limit)
-        
-        rows = conn.execute(query, tuple(params)).fetchall()
+    query = """
+        SELECT sf.signal_type, sf.signal_text, sf.notes, sf.meeting_id,
+               ms.meeting_name, ms.meeting_date
+        FROM signal_feedback sf
+        LEFT JOIN meeting_summaries ms ON sf.meeting_id = ms.id
+        WHERE sf.feedback = 'up' AND sf.include_in_chat = 1
+    """
+    params = []
+    
+    if signal_type:
+        query += " AND sf.signal_type = ?"
+        params.append(signal_type)
+    
+    query += " ORDER BY sf.created_at DESC LIMIT ?"
+    params.append(limit)
+    
+    rows = await fetch_all(query, tuple(params))
     
     return [dict(row) for row in rows]
 
@@ -331,15 +339,20 @@ async def get_approved_signals(
 @router.delete("/feedback/{feedback_id}", status_code=204)
 async def delete_feedback(feedback_id: int):
     """Delete a feedback entry."""
-    with connect() as conn:
-        existing = conn.execute(
-            "SELECT id FROM signal_feedback WHERE id = ?",
+    async with transaction() as tx:
+        existing = await tx.fetch_one(
+            "SELECT id, meeting_id, signal_type, signal_text, feedback FROM signal_feedback WHERE id = ?",
             (feedback_id,)
-        ).fetchone()
+        )
         
         if not existing:
             raise HTTPException(status_code=404, detail="Feedback not found")
         
-        conn.execute("DELETE FROM signal_feedback WHERE id = ?", (feedback_id,))
+        await tx.execute("DELETE FROM signal_feedback WHERE id = ?", (feedback_id,))
+        await tx.run(
+            feedback_ledger.record_signal_vote,
+            existing["meeting_id"], existing["signal_type"], existing["signal_text"], None,
+        )
     
+    signal_feedback_recorded(existing["signal_type"], existing["signal_text"], None, existing["feedback"])
     return None
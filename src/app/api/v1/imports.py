@@ -17,10 +17,19 @@ import json
 import logging
 
 from ...db import connect
+from ...db_blobs import put_text
+from ...db_async import fetch_one, fetch_all, transaction
 from ...mcp.parser import parse_meeting_summary
 from ...mcp.extract import extract_structured_signals
 from ...mcp.cleaner import clean_meeting_text
 from ...llm import analyze_image
+from ...services.bulk_import import (
+    BulkImporter,
+    extract_markdown_text,
+    get_bulk_import_progress,
+    infer_meeting_name_from_content,
+    iter_zip_transcripts,
+)
 import base64
 
 router = APIRouter()
@@ -52,61 +61,6 @@ class ImportHistoryItem(BaseModel):
 
 # ============== Helper Functions ==============
 
-def extract_markdown_text(content: bytes) -> str:
-    """
-    Extract plain text from markdown file content.
-    
-    Args:
-        content: Raw bytes from uploaded file
-        
-    Returns:
-        Decoded text content (markdown is already text)
-        
-    Raises:
-        ValueError: If content cannot be decoded as UTF-8
-    """
-    try:
-        text = content.decode('utf-8')
-        return text.strip()
-    except UnicodeDecodeError:
-        # Try with latin-1 as fallback
-        try:
-            text = content.decode('latin-1')
-            return text.strip()
-        except:
-            raise ValueError("Could not decode file as text. Ensure it's a valid text/markdown file.")
-
-
-def infer_meeting_name_from_content(text: str, filename: str) -> str:
-    """
-    Try to infer a meeting name from the content or filename.
-    
-    Checks for:
-    1. First H1 header (# Title)
-    2. First line if it looks like a title
-    3. Filename without extension
-    """
-    lines = text.split('\n')
-    
-    # Look for H1 header
-    for line in lines[:10]:  # Check first 10 lines
-        line = line.strip()
-        if line.startswith('# '):
-            return line[2:].strip()[:100]  # Remove # and limit length
-    
-    # Check if first non-empty line looks like a title (short, no punctuation at end)
-    for line in lines[:5]:
-        line = line.strip()
-        if line and len(line) < 80 and not line.endswith(('.', '?', '!')):
-            if not line.startswith(('#', '-', '*', '>')):  # Not a markdown element
-                return line[:100]
-    
-    # Fall back to filename
-    name = filename.rsplit('.', 1)[0]  # Remove extension
-    name = name.replace('_', ' ').replace('-', ' ')  # Clean up
-    return name[:100]
-
-
 def record_import_history(
     conn,
     filename: str,
@@ -199,7 +153,7 @@ async def import_transcript(
                 INSERT INTO meeting_summaries 
                 (meeting_name, synthesized_notes, meeting_date, raw_text, import_source, source_url)
                 VALUES (?, ?, ?, ?, ?, ?)
-            """, (meeting_name, text, meeting_date, text, 'markdown_upload', source_url))
+            """, (meeting_name, text, meeting_date, put_text(conn, text), 'markdown_upload', source_url))
             
             meeting_id = cursor.lastrowid
             
@@ -242,17 +196,66 @@ async def import_transcript(
         logger.error(f"Import failed for {filename}: {e}")
         # Try to record failure
         try:
-            with connect() as conn:
-                conn.execute("""
+            async with transaction() as tx:
+                await tx.execute("""
                     UPDATE import_history SET status = 'failed', error_message = ? 
                     WHERE filename = ? AND status = 'processing'
                 """, (str(e), filename))
-                conn.commit()
         except:
             pass
         raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
 
 
+@router.post("/bulk")
+async def import_transcript_archive(
+    file: UploadFile = File(..., description="Zip archive of markdown/txt transcripts"),
+    meeting_date: Optional[str] = Form(None, description="Date for files without one in their name (YYYY-MM-DD)"),
+    batch_id: Optional[str] = Form(None, description="Client-chosen id to poll GET /bulk/{batch_id} while this runs"),
+    source_url: Optional[str] = Form(None, description="Original source URL"),
+):
+    """
+    Import every transcript in a zip archive.
+    
+    Members are decompressed one at a time from the uploaded (disk-spooled)
+    file, signals are extracted in a process pool, and meetings are
+    inserted in batches. Each file gets an ``import_history`` row tagged
+    with the batch id.
+    
+    **Returns:** counts, created meeting ids and per-file errors.
+    """
+    from starlette.concurrency import run_in_threadpool
+    import zipfile
+    
+    filename = file.filename or "upload.zip"
+    if not filename.lower().endswith('.zip'):
+        raise HTTPException(status_code=400, detail="Bulk import expects a .zip archive")
+    
+    importer = BulkImporter(default_date=meeting_date, source_url=source_url)
+    
+    def _run():
+        return importer.run(iter_zip_transcripts(file.file), batch_id=batch_id)
+    
+    try:
+        progress = await run_in_threadpool(_run)
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail="File is not a valid zip archive")
+    
+    if progress.status == "failed":
+        raise HTTPException(status_code=500, detail={"message": "Bulk import failed", **progress.to_dict()})
+    return progress.to_dict()
+
+
+@router.get("/bulk/{batch_id}")
+async def get_bulk_import_status(batch_id: str):
+    """Progress of a bulk import (live while running, from import_history afterwards)."""
+    from ...db_async import run_read
+    
+    progress = await run_read(get_bulk_import_progress, batch_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Bulk import not found")
+    return progress
+
+
 @router.get("/history", response_model=list[ImportHistoryItem])
 async def get_import_history(
     limit: int = 50,
@@ -265,18 +268,17 @@ async def get_import_history(
     - limit: Maximum number of records to return (default 50)
     - status: Filter by status ('completed', 'failed', 'processing')
     """
-    with connect() as conn:
-        query = "SELECT * FROM import_history"
-        params = []
-        
-        if status:
-            query += " WHERE status = ?"
-            params.append(status)
-        
-        query += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
-        
-        rows = conn.execute(query, tuple(params)).fetchall()
+    query = "SELECT * FROM import_history"
+    params = []
+    
+    if status:
+        query += " WHERE status = ?"
+        params.append(status)
+    
+    query += " ORDER BY created_at DESC LIMIT ?"
+    params.append(limit)
+    
+    rows = await fetch_all(query, tuple(params))
     
     return [
         ImportHistoryItem(
@@ -435,7 +437,7 @@ def add_document_to_meeting(
         meeting_id,
         doc_type,
         source,
-        content,
+        put_text(conn, content),
         format,
         json.dumps(signals) if signals else None,
         file_path,
@@ -573,7 +575,7 @@ async def amend_meeting_with_pocket(
             if is_primary:
                 conn.execute(
                     "UPDATE meeting_summaries SET raw_text = ? WHERE id = ?",
-                    (transcript_content, meeting_id)
+                    (put_text(conn, transcript_content), meeting_id)
                 )
         
         # Add summary if provided
@@ -630,22 +632,21 @@ async def list_meeting_documents(meeting_id: int):
     """
     List all documents (transcripts and summaries) linked to a meeting.
     """
-    with connect() as conn:
-        meeting = conn.execute(
-            "SELECT id FROM meeting_summaries WHERE id = ?",
-            (meeting_id,)
-        ).fetchone()
-        
-        if not meeting:
-            raise HTTPException(status_code=404, detail=f"Meeting {meeting_id} not found")
-        
-        rows = conn.execute("""
-            SELECT id, doc_type, source, LENGTH(content) as content_length, 
-                   format, is_primary, created_at
-            FROM meeting_documents
-            WHERE meeting_id = ?
-            ORDER BY created_at
-        """, (meeting_id,)).fetchall()
+    meeting = await fetch_one(
+        "SELECT id FROM meeting_summaries WHERE id = ?",
+        (meeting_id,)
+    )
+    
+    if not meeting:
+        raise HTTPException(status_code=404, detail=f"Meeting {meeting_id} not found")
+    
+    rows = await fetch_all("""
+        SELECT id, doc_type, source, LENGTH(content) as content_length, 
+               format, is_primary, created_at
+        FROM meeting_documents
+        WHERE meeting_id = ?
+        ORDER BY created_at
+    """, (meeting_id,))
     
     return [
         MeetingDocumentInfo(
@@ -666,14 +667,13 @@ async def get_meeting_document(meeting_id: int, doc_id: int):
     """
     Get a specific document's full content.
     """
-    with connect() as conn:
-        row = conn.execute("""
-            SELECT * FROM meeting_documents
-            WHERE id = ? AND meeting_id = ?
-        """, (doc_id, meeting_id)).fetchone()
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Document not found")
+    row = await fetch_one("""
+        SELECT * FROM meeting_documents
+        WHERE id = ? AND meeting_id = ?
+    """, (doc_id, meeting_id))
+    
+    if not row:
+        raise HTTPException(status_code=404, detail="Document not found")
     
     return {
         "id": row['id'],
@@ -847,16 +847,15 @@ async def ingest_mindmap(
         )
     
     # Verify meeting exists
-    with connect() as conn:
-        meeting = conn.execute(
-            "SELECT id, meeting_name FROM meeting_summaries WHERE id = ?",
-            (meeting_id,)
-        ).fetchone()
-        
-        if not meeting:
-            raise HTTPException(status_code=404, detail=f"Meeting {meeting_id} not found")
-        
-        meeting_name = meeting['meeting_name']
+    meeting = await fetch_one(
+        "SELECT id, meeting_name FROM meeting_summaries WHERE id = ?",
+        (meeting_id,)
+    )
+    
+    if not meeting:
+        raise HTTPException(status_code=404, detail=f"Meeting {meeting_id} not found")
+    
+    meeting_name = meeting['meeting_name']
     
     # Read and encode image
     try:
@@ -938,21 +937,20 @@ async def list_meeting_mindmaps(meeting_id: int):
     """
     List all mindmap analyses linked to a meeting.
     """
-    with connect() as conn:
-        meeting = conn.execute(
-            "SELECT id FROM meeting_summaries WHERE id = ?",
-            (meeting_id,)
-        ).fetchone()
-        
-        if not meeting:
-            raise HTTPException(status_code=404, detail=f"Meeting {meeting_id} not found")
-        
-        rows = conn.execute("""
-            SELECT id, source, metadata_json, created_at
-            FROM meeting_documents
-            WHERE meeting_id = ? AND doc_type = 'mindmap'
-            ORDER BY created_at DESC
-        """, (meeting_id,)).fetchall()
+    meeting = await fetch_one(
+        "SELECT id FROM meeting_summaries WHERE id = ?",
+        (meeting_id,)
+    )
+    
+    if not meeting:
+        raise HTTPException(status_code=404, detail=f"Meeting {meeting_id} not found")
+    
+    rows = await fetch_all("""
+        SELECT id, source, metadata_json, created_at
+        FROM meeting_documents
+        WHERE meeting_id = ? AND doc_type = 'mindmap'
+        ORDER BY created_at DESC
+    """, (meeting_id,))
     
     results = []
     for row in rows:
@@ -18,6 +18,8 @@ from ..v1.models import (
     PaginatedResponse, APIResponse
 )
 from ...db import connect
+from ...db_async import fetch_one, execute, run_read, run_write, transaction
+from ...services.mindmap_synthesis import MindmapSynthesizer
 
 logger = logging.getLogger(__name__)
 
@@ -116,7 +118,7 @@ async def list_meetings(
     
     # Fall back to SQLite
     try:
-        meetings, total = _get_meetings_from_sqlite(skip, limit)
+        meetings, total = await run_read(_get_meetings_from_sqlite, skip, limit)
         return PaginatedResponse(items=meetings, skip=skip, limit=limit, total=total)
     except Exception as e:
         logger.error(f"❌ SQLite also failed: {e}")
@@ -152,11 +154,10 @@ async def get_meeting(meeting_id: str):
     
     # Fall back to SQLite
     try:
-        with connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM meeting_summaries WHERE id = ?",
-                (int(meeting_id) if meeting_id.isdigit() else -1,)
-            ).fetchone()
+        row = await fetch_one(
+            "SELECT * FROM meeting_summaries WHERE id = ?",
+            (int(meeting_id) if meeting_id.isdigit() else -1,)
+        )
         
         if row:
             return MeetingResponse(
@@ -200,14 +201,11 @@ async def create_meeting(meeting: MeetingCreate):
         logger.warning(f"⚠️ Supabase create failed, trying SQLite: {e}")
     
     # Fall back to SQLite
-    with connect() as conn:
-        cursor = conn.execute(
-            """INSERT INTO meeting_summaries (meeting_name, synthesized_notes, meeting_date)
-               VALUES (?, ?, ?)""",
-            (meeting.name, meeting.notes or "", meeting.date)
-        )
-        meeting_id = cursor.lastrowid
-        conn.commit()
+    meeting_id = await execute(
+        """INSERT INTO meeting_summaries (meeting_name, synthesized_notes, meeting_date)
+           VALUES (?, ?, ?)""",
+        (meeting.name, meeting.notes or "", meeting.date)
+    )
     
     return APIResponse(success=True, message="Meeting created", data={"id": meeting_id})
 
@@ -249,9 +247,9 @@ async def update_meeting(meeting_id: str, meeting: MeetingUpdate):
         logger.warning(f"⚠️ Supabase update failed: {e}")
     
     # Fall back to SQLite
-    with connect() as conn:
+    async with transaction() as tx:
         sqlite_id = int(meeting_id) if meeting_id.isdigit() else -1
-        existing = conn.execute("SELECT id FROM meeting_summaries WHERE id = ?", (sqlite_id,)).fetchone()
+        existing = await tx.fetch_one("SELECT id FROM meeting_summaries WHERE id = ?", (sqlite_id,))
         
         if not existing:
             raise HTTPException(status_code=404, detail="Meeting not found")
@@ -271,8 +269,7 @@ async def update_meeting(meeting_id: str, meeting: MeetingUpdate):
         if updates:
             query = f"UPDATE meeting_summaries SET {', '.join(updates)} WHERE id = ?"
             params.append(sqlite_id)
-            conn.execute(query, tuple(params))
-            conn.commit()
+            await tx.execute(query, tuple(params))
     
     return APIResponse(success=True, message="Meeting updated", data={"id": meeting_id})
 
@@ -295,21 +292,26 @@ async def delete_meeting(meeting_id: str):
             raise HTTPException(status_code=404, detail="Meeting not found")
         
         supabase.table("meetings").delete().eq("id", meeting_id).execute()
-        return Response(status_code=204)
+        deleted_from_supabase = True
     except HTTPException:
         raise
     except Exception as e:
         logger.warning(f"⚠️ Supabase delete failed: {e}")
+        deleted_from_supabase = False
+    
+    if deleted_from_supabase:
+        await run_write(MindmapSynthesizer.delete_conversation_mindmaps, f"meeting_{meeting_id}")
+        return Response(status_code=204)
     
     # Fall back to SQLite
-    with connect() as conn:
+    async with transaction() as tx:
         sqlite_id = int(meeting_id) if meeting_id.isdigit() else -1
-        existing = conn.execute("SELECT id FROM meeting_summaries WHERE id = ?", (sqlite_id,)).fetchone()
+        existing = await tx.fetch_one("SELECT id FROM meeting_summaries WHERE id = ?", (sqlite_id,))
         
         if not existing:
             raise HTTPException(status_code=404, detail="Meeting not found")
         
-        conn.execute("DELETE FROM meeting_summaries WHERE id = ?", (sqlite_id,))
-        conn.commit()
+        await tx.execute("DELETE FROM meeting_summaries WHERE id = ?", (sqlite_id,))
+        await tx.run(MindmapSynthesizer.remove_conversation_mindmaps, f"meeting_{sqlite_id}")
     
     return Response(status_code=204)
@@ -13,7 +13,7 @@ from ..v1.models import (
     SignalCreate, SignalUpdate, SignalResponse,
     PaginatedResponse, APIResponse
 )
-from ...db import connect
+from ...db_async import fetch_one, fetch_all, execute, transaction
 
 router = APIRouter()
 
@@ -32,30 +32,29 @@ async def list_signals(
     Signal types: decision, action_item, blocker, risk, idea
     Status: active, resolved, archived
     """
-    with connect() as conn:
-        query = "SELECT * FROM signal WHERE 1=1"
-        params = []
-        
-        if signal_type:
-            query += " AND signal_type = ?"
-            params.append(signal_type)
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        if meeting_id:
-            query += " AND source_meeting_id = ?"
-            params.append(meeting_id)
-        
-        # Get total count
-        count_query = query.replace("SELECT *", "SELECT COUNT(*) as count")
-        total = conn.execute(count_query, tuple(params)).fetchone()["count"]
-        
-        # Add pagination
-        query += " ORDER BY priority DESC, pk DESC LIMIT ? OFFSET ?"
-        params.extend([limit, skip])
-        
-        rows = conn.execute(query, tuple(params)).fetchall()
-        signals = [dict(row) for row in rows]
+    query = "SELECT * FROM signal WHERE 1=1"
+    params = []
+    
+    if signal_type:
+        query += " AND signal_type = ?"
+        params.append(signal_type)
+    if status:
+        query += " AND status = ?"
+        params.append(status)
+    if meeting_id:
+        query += " AND source_meeting_id = ?"
+        params.append(meeting_id)
+    
+    # Get total count
+    count_query = query.replace("SELECT *", "SELECT COUNT(*) as count")
+    total = (await fetch_one(count_query, tuple(params)))["count"]
+    
+    # Add pagination
+    query += " ORDER BY priority DESC, pk DESC LIMIT ? OFFSET ?"
+    params.extend([limit, skip])
+    
+    rows = await fetch_all(query, tuple(params))
+    signals = [dict(row) for row in rows]
     
     return PaginatedResponse(
         items=signals,
@@ -72,11 +71,10 @@ async def get_signal(signal_id: int):
     
     Returns 404 if signal not found.
     """
-    with connect() as conn:
-        row = conn.execute(
-            "SELECT * FROM signal WHERE pk = ?",
-            (signal_id,)
-        ).fetchone()
+    row = await fetch_one(
+        "SELECT * FROM signal WHERE pk = ?",
+        (signal_id,)
+    )
     
     if not row:
         raise HTTPException(status_code=404, detail="Signal not found")
@@ -100,15 +98,12 @@ async def create_signal(signal: SignalCreate):
     
     Returns the created signal ID.
     """
-    with connect() as conn:
-        cursor = conn.execute(
-            """INSERT INTO signal (signal_type, content, source_meeting_id, priority, status)
-               VALUES (?, ?, ?, ?, ?)""",
-            (signal.signal_type, signal.content, signal.source_meeting_id,
-             signal.priority, signal.status)
-        )
-        signal_id = cursor.lastrowid
-        conn.commit()
+    signal_id = await execute(
+        """INSERT INTO signal (signal_type, content, source_meeting_id, priority, status)
+           VALUES (?, ?, ?, ?, ?)""",
+        (signal.signal_type, signal.content, signal.source_meeting_id,
+         signal.priority, signal.status)
+    )
     
     return APIResponse(
         success=True,
@@ -125,12 +120,12 @@ async def update_signal(signal_id: int, signal: SignalUpdate):
     Only updates fields that are provided.
     Returns 404 if signal not found.
     """
-    with connect() as conn:
+    async with transaction() as tx:
         # Check if signal exists
-        existing = conn.execute(
+        existing = await tx.fetch_one(
             "SELECT pk FROM signal WHERE pk = ?",
             (signal_id,)
-        ).fetchone()
+        )
         
         if not existing:
             raise HTTPException(status_code=404, detail="Signal not found")
@@ -152,8 +147,7 @@ async def update_signal(signal_id: int, signal: SignalUpdate):
         if updates:
             query = f"UPDATE signal SET {', '.join(updates)} WHERE pk = ?"
             params.append(signal_id)
-            conn.execute(query, tuple(params))
-            conn.commit()
+            await tx.execute(query, tuple(params))
     
     return APIResponse(
         success=True,
@@ -169,18 +163,17 @@ async def delete_signal(signal_id: int):
     
     Returns 204 No Content on success, 404 if signal not found.
     """
-    with connect() as conn:
+    async with transaction() as tx:
         # Check if signal exists
-        existing = conn.execute(
+        existing = await tx.fetch_one(
             "SELECT pk FROM signal WHERE pk = ?",
             (signal_id,)
-        ).fetchone()
+        )
         
         if not existing:
             raise HTTPException(status_code=404, detail="Signal not found")
         
-        conn.execute("DELETE FROM signal WHERE pk = ?", (signal_id,))
-        conn.commit()
+        await tx.execute("DELETE FROM signal WHERE pk = ?", (signal_id,))
     
     return Response(status_code=204)
 
@@ -17,7 +17,9 @@ from ..v1.models import (
     PaginatedResponse, APIResponse
 )
 from ...db import connect
+from ...db_async import fetch_one, run_read, transaction
 from ...repositories import get_ticket_repository
+from ...services.ticket_index import index_ticket_changed, index_ticket_deleted
 
 logger = logging.getLogger(__name__)
 
@@ -117,13 +119,31 @@ async def list_tickets(
     
     # Fall back to SQLite
     try:
-        tickets, total = _get_tickets_from_sqlite(skip, limit, status, tag)
+        tickets, total = await run_read(_get_tickets_from_sqlite, skip, limit, status, tag)
         return PaginatedResponse(items=tickets, skip=skip, limit=limit, total=total)
     except Exception as e:
         logger.error(f"❌ SQLite also failed for tickets: {e}")
         raise HTTPException(status_code=500, detail="Unable to fetch tickets")
 
 
+@router.get("/match")
+async def match_tickets(
+    q: str = Query(..., min_length=3, description="Text to match, e.g. an action item or transcript"),
+    limit: int = Query(5, ge=1, le=50),
+    active_only: bool = Query(False, description="Only match todo/in-progress/in-review/blocked tickets"),
+):
+    """
+    Suggest existing tickets for a piece of text (BM25 over the full backlog).
+    
+    Used for action item -> ticket suggestions and duplicate checks.
+    """
+    from ...services.ticket_index import find_similar_tickets, ACTIVE_STATUSES
+    
+    statuses = ACTIVE_STATUSES if active_only else None
+    matches = await run_read(find_similar_tickets, q, limit, 0.0, statuses)
+    return {"query": q, "matches": matches}
+
+
 @router.get("/{ticket_id}", response_model=TicketResponse)
 async def get_ticket(ticket_id: int):
     """
@@ -131,11 +151,10 @@ async def get_ticket(ticket_id: int):
     
     Returns 404 if ticket not found.
     """
-    with connect() as conn:
-        row = conn.execute(
-            "SELECT * FROM tickets WHERE id = ?",
-            (ticket_id,)
-        ).fetchone()
+    row = await fetch_one(
+        "SELECT * FROM tickets WHERE id = ?",
+        (ticket_id,)
+    )
     
     if not row:
         raise HTTPException(status_code=404, detail="Ticket not found")
@@ -160,15 +179,17 @@ async def create_ticket(ticket: TicketCreate):
     
     Returns the created ticket ID.
     """
-    with connect() as conn:
-        cursor = conn.execute(
+    async with transaction() as tx:
+        ticket_id = await tx.execute(
             """INSERT INTO tickets (title, description, status, priority, points, tags)
                VALUES (?, ?, ?, ?, ?, ?)""",
             (ticket.title, ticket.description, ticket.status,
              ticket.priority, ticket.points, ticket.tags)
         )
-        ticket_id = cursor.lastrowid
-        conn.commit()
+    index_ticket_changed({
+        "id": ticket_id, "title": ticket.title, "description": ticket.description,
+        "status": ticket.status, "priority": ticket.priority, "tags": ticket.tags,
+    })
     
     return APIResponse(
         success=True,
@@ -185,12 +206,12 @@ async def update_ticket(ticket_id: int, ticket: TicketUpdate):
     Only updates fields that are provided.
     Returns 404 if ticket not found.
     """
-    with connect() as conn:
+    async with transaction() as tx:
         # Check if ticket exists
-        existing = conn.execute(
+        existing = await tx.fetch_one(
             "SELECT id FROM tickets WHERE id = ?",
             (ticket_id,)
-        ).fetchone()
+        )
         
         if not existing:
             raise HTTPException(status_code=404, detail="Ticket not found")
@@ -221,8 +242,15 @@ async def update_ticket(ticket_id: int, ticket: TicketUpdate):
         if updates:
             query = f"UPDATE tickets SET {', '.join(updates)} WHERE id = ?"
             params.append(ticket_id)
-            conn.execute(query, tuple(params))
-            conn.commit()
+            await tx.execute(query, tuple(params))
+    
+    changed = {
+        field: getattr(ticket, field)
+        for field in ("title", "description", "status", "priority", "tags")
+        if getattr(ticket, field) is not None
+    }
+    if changed:
+        index_ticket_changed({"id": ticket_id, **changed})
     
     return APIResponse(
         success=True,
@@ -238,18 +266,18 @@ async def delete_ticket(ticket_id: int):
     
     Returns 204 No Content on success, 404 if ticket not found.
     """
-    with connect() as conn:
+    async with transaction() as tx:
         # Check if ticket exists
-        existing = conn.execute(
+        existing = await tx.fetch_one(
             "SELECT id FROM tickets WHERE id = ?",
             (ticket_id,)
-        ).fetchone()
+        )
         
         if not existing:
             raise HTTPException(status_code=404, detail="Ticket not found")
         
-        conn.execute("DELETE FROM tickets WHERE id = ?", (ticket_id,))
-        conn.commit()
+        await tx.execute("DELETE FROM tickets WHERE id = ?", (ticket_id,))
+    index_ticket_deleted(ticket_id)
     
     return Response(status_code=204)
 
@@ -268,11 +296,10 @@ async def generate_ticket_summary(ticket_id: int):
     # Lazy import for backward compatibility
     from ...agents.ticket_agent import summarize_ticket_adapter
     
-    with connect() as conn:
-        row = conn.execute(
-            "SELECT * FROM tickets WHERE id = ?",
-            (ticket_id,)
-        ).fetchone()
+    row = await fetch_one(
+        "SELECT * FROM tickets WHERE id = ?",
+        (ticket_id,)
+    )
     
     if not row:
         raise HTTPException(status_code=404, detail="Ticket not found")
@@ -297,11 +324,10 @@ async def generate_ticket_plan(ticket_id: int):
     # Lazy import for backward compatibility
     from ...agents.ticket_agent import generate_plan_adapter
     
-    with connect() as conn:
-        row = conn.execute(
-            "SELECT * FROM tickets WHERE id = ?",
-            (ticket_id,)
-        ).fetchone()
+    row = await fetch_one(
+        "SELECT * FROM tickets WHERE id = ?",
+        (ticket_id,)
+    )
     
     if not row:
         raise HTTPException(status_code=404, detail="Ticket not found")
@@ -326,11 +352,10 @@ async def decompose_ticket(ticket_id: int):
     # Lazy import for backward compatibility
     from ...agents.ticket_agent import decompose_ticket_adapter
     
-    with connect() as conn:
-        row = conn.execute(
-            "SELECT * FROM tickets WHERE id = ?",
-            (ticket_id,)
-        ).fetchone()
+    row = await fetch_one(
+        "SELECT * FROM tickets WHERE id = ?",
+        (ticket_id,)
+    )
     
     if not row:
         raise HTTPException(status_code=404, detail="Ticket not found")
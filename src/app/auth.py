@@ -152,6 +152,7 @@ PUBLIC_ROUTES = [
     "/api/dikw",
     "/api/career",  # Allow all career APIs
     "/api/admin/health",  # Health check for monitoring
+    "/ready",  # Readiness probe
     "/api/admin/infrastructure",  # Infrastructure status
     "/api/notifications",  # Allow notifications (single user app)
 ]
@@ -168,6 +169,11 @@ class AuthMiddleware(BaseHTTPMiddleware):
             if path.startswith(route):
                 return await call_next(request)
         
+        # Prometheus scrapes with the METRICS_TOKEN bearer (checked by the route)
+        # instead of a session; without a token /metrics needs a login like any page
+        if path == "/metrics" and os.environ.get("METRICS_TOKEN"):
+            return await call_next(request)
+        
         # Check if auth is disabled
         from .db import connect
         try:
@@ -192,7 +198,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         
         if not validate_session(session_token):
             # API routes return 401
-            if path.startswith("/api/") or path.startswith("/mcp/"):
+            if path.startswith("/api/") or path.startswith("/mcp/") or path == "/metrics":
                 return HTMLResponse(
                     content='{"error": "Unauthorized"}',
                     status_code=401,
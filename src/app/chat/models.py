@@ -393,7 +393,9 @@ def unarchive_conversation(conversation_id: int):
 
 def delete_conversation(conversation_id: int):
     """Delete a conversation and all its messages permanently."""
+    from ..services.mindmap_synthesis import MindmapSynthesizer
     with connect() as conn:
+        MindmapSynthesizer.remove_conversation_mindmaps(conn, str(conversation_id))
         conn.execute("DELETE FROM messages WHERE conversation_id = ?", (conversation_id,))
         conn.execute("DELETE FROM conversations WHERE id = ?", (conversation_id,))
 
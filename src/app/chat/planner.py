@@ -2,8 +2,13 @@
 
 import json
 from typing import Dict, Any
+from .. import llm_cache
 from ..llm import _openai_client_once
 
+PLANNER_MODEL = "gpt-4.1-mini"
+# query_planner's routing task type; plans are cached when the policy sets a TTL
+PLANNER_TASK_TYPE = "parsing"
+
 # ---- Schema Definition ----
 REQUIRED_KEYS = {"keywords", "concepts"}
 OPTIONAL_KEYS = {"source_preference", "time_hint", "notes"}
@@ -76,15 +81,19 @@ def plan(
         question=question,
     )
 
-    resp = _client_once().responses.create(
-        model="gpt-4.1-mini",
-        input=[
-            {"role": "system", "content": SYSTEM_PROMPT.strip()},
-            {"role": "user", "content": prompt.strip()},
-        ],
-    )
-
-    raw_text = strip_json_fences(resp.output_text)
+    cache_key = llm_cache.lookup_key(PLANNER_TASK_TYPE, PLANNER_MODEL, SYSTEM_PROMPT, prompt)
+    raw_text = llm_cache.get(cache_key, PLANNER_TASK_TYPE) if cache_key else None
+    from_cache = raw_text is not None
+
+    if not from_cache:
+        resp = _openai_client_once().responses.create(
+            model=PLANNER_MODEL,
+            input=[
+                {"role": "system", "content": SYSTEM_PROMPT.strip()},
+                {"role": "user", "content": prompt.strip()},
+            ],
+        )
+        raw_text = strip_json_fences(resp.output_text)
 
     try:
         data = json.loads(raw_text)
@@ -124,6 +133,10 @@ def plan(
     if data["time_hint"] not in ("recent", "past", "any", None):
         raise ValueError("Invalid time_hint value")
 
+    # Only plans that passed validation are cached
+    if cache_key and not from_cache:
+        llm_cache.put(cache_key, PLANNER_TASK_TYPE, PLANNER_MODEL, raw_text)
+
     # ---- Normalize strings ----
     data["keywords"] = [
         k.lower() for k in data["keywords"] if isinstance(k, str)
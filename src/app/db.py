@@ -1,6 +1,13 @@
+import hashlib
+import os
 import sqlite3
 import logging
+import threading
 import traceback
+import weakref
+
+from . import db_blobs
+from .metrics import sql_label, timer as metrics_timer
 
 DB_PATH = "agent.db"
 
@@ -8,35 +15,60 @@ DB_PATH = "agent.db"
 _sqlite_logger = logging.getLogger("sqlite_usage")
 _sqlite_logger.setLevel(logging.WARNING)  # Change to DEBUG to see all queries
 
+# Set SQLITE_USAGE_LOGGING=false to skip deprecation checks entirely
+SQLITE_USAGE_LOGGING = os.getenv("SQLITE_USAGE_LOGGING", "true").lower() in ("1", "true", "yes")
+
 # Track which code paths are hitting SQLite
 _SQLITE_DEPRECATION_TABLES = {"meeting_summaries", "docs", "tickets"}
 
+# Connection pool settings
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "8"))       # idle connections kept per DB file
+SQLITE_CACHED_STATEMENTS = 256                                    # prepared statements cached per connection
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
 
-def _log_sqlite_usage(query: str = None):
-    """Log SQLite usage with caller info - helps identify code that needs migration."""
+# Applied to every new connection (WAL itself is persistent and set in SCHEMA)
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",       # ~20 MB page cache
+    "PRAGMA mmap_size=268435456",     # 256 MB memory-mapped I/O
+    f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+)
+
+
+def _find_caller() -> str:
     stack = traceback.extract_stack()
     # Find the first frame outside db.py
-    for frame in reversed(stack[:-2]):
+    for frame in reversed(stack[:-3]):
         if "db.py" not in frame.filename:
-            caller = f"{frame.filename}:{frame.lineno} in {frame.name}"
-            break
-    else:
-        caller = "unknown"
+            return f"{frame.filename}:{frame.lineno} in {frame.name}"
+    return "unknown"
+
+
+def _log_sqlite_usage(query: str = None):
+    """Log SQLite usage with caller info - helps identify code that needs migration.
+    
+    The stack is only inspected when a message will actually be emitted.
+    """
+    if not SQLITE_USAGE_LOGGING:
+        return
     
     # Check if query touches deprecated tables
     if query:
         query_lower = query.lower()
         for table in _SQLITE_DEPRECATION_TABLES:
             if table in query_lower:
-                _sqlite_logger.warning(
-                    f"⚠️ SQLite query on '{table}' table - should use Supabase!\n"
-                    f"   Caller: {caller}\n"
-                    f"   Query: {query[:200]}..."
-                )
+                if _sqlite_logger.isEnabledFor(logging.WARNING):
+                    _sqlite_logger.warning(
+                        f"⚠️ SQLite query on '{table}' table - should use Supabase!\n"
+                        f"   Caller: {_find_caller()}\n"
+                        f"   Query: {query[:200]}..."
+                    )
                 return
     
     # For all other queries, log at debug level
-    _sqlite_logger.debug(f"SQLite query from: {caller}")
+    if _sqlite_logger.isEnabledFor(logging.DEBUG):
+        _sqlite_logger.debug(f"SQLite query from: {_find_caller()}")
 
 SCHEMA = """
 PRAGMA journal_mode=WAL;
@@ -92,6 +124,8 @@ CREATE TABLE IF NOT EXISTS embeddings (
 CREATE INDEX IF NOT EXISTS idx_embeddings_ref ON embeddings(ref_type, ref_id);
 CREATE INDEX IF NOT EXISTS idx_docs_document_date ON docs(document_date);
 CREATE INDEX IF NOT EXISTS idx_meetings_meeting_date ON meeting_summaries(meeting_date);
+-- Newest-first listing order; keyset "load more" pages seek on it
+CREATE INDEX IF NOT EXISTS idx_meetings_sort ON meeting_summaries(COALESCE(meeting_date, created_at), id);
 Create INDEX IF NOT EXISTS idx_docs_content ON docs(LOWER(content));
 CREATE INDEX IF NOT EXISTS idx_meetings_notes ON meeting_summaries(LOWER(synthesized_notes));
 Create INDEX IF NOT EXISTS idx_docs_source ON docs(LOWER(source));
@@ -105,6 +139,8 @@ CREATE TABLE IF NOT EXISTS conversation_mindmaps (
   hierarchy_levels INTEGER,
   root_node_id TEXT,
   node_count INTEGER,
+  title TEXT,
+  content_hash TEXT,               -- sha256 of mindmap_json, keys mindmap_extractions
   created_at TEXT DEFAULT (datetime('now')),
   updated_at TEXT DEFAULT (datetime('now')),
   FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
@@ -112,6 +148,45 @@ CREATE TABLE IF NOT EXISTS conversation_mindmaps (
 
 CREATE INDEX IF NOT EXISTS idx_conv_mindmaps_conversation_id ON conversation_mindmaps(conversation_id);
 
+-- Mindmap Extractions - Topics/relationships extracted once per distinct mindmap content
+CREATE TABLE IF NOT EXISTS mindmap_extractions (
+  content_hash TEXT PRIMARY KEY,   -- sha256 of the canonical mindmap JSON
+  first_mindmap_id INTEGER NOT NULL, -- conversation_mindmaps row that introduced this content
+  conversation_id TEXT,
+  title TEXT,
+  key_topics TEXT,                 -- JSON list
+  relationships TEXT,              -- JSON list of {source, target, relationship}
+  hierarchy_levels INTEGER,
+  max_depth INTEGER,
+  node_count INTEGER,
+  level_counts TEXT,               -- JSON {level: node count}
+  created_at TEXT DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_mindmap_extractions_first ON mindmap_extractions(first_mindmap_id);
+
+-- Running topic/relationship aggregates, updated as new mindmap content arrives
+CREATE TABLE IF NOT EXISTS mindmap_topic_stats (
+  topic TEXT PRIMARY KEY,
+  mention_count INTEGER DEFAULT 0,
+  last_mindmap_id INTEGER,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_mindmap_topic_stats_count ON mindmap_topic_stats(mention_count DESC);
+
+CREATE TABLE IF NOT EXISTS mindmap_relationship_stats (
+  source TEXT NOT NULL,
+  target TEXT NOT NULL,
+  relationship TEXT NOT NULL,
+  mention_count INTEGER DEFAULT 0,
+  last_mindmap_id INTEGER,
+  updated_at TEXT DEFAULT (datetime('now')),
+  PRIMARY KEY (source, target, relationship)
+);
+
+CREATE INDEX IF NOT EXISTS idx_mindmap_relationship_stats_count ON mindmap_relationship_stats(mention_count DESC);
+
 -- Mindmap Syntheses - AI-generated synthesis of all mindmaps
 CREATE TABLE IF NOT EXISTS mindmap_syntheses (
   id INTEGER PRIMARY KEY,
@@ -122,6 +197,7 @@ CREATE TABLE IF NOT EXISTS mindmap_syntheses (
   source_conversation_ids TEXT,
   key_topics TEXT,
   relationships TEXT,
+  last_mindmap_id INTEGER,         -- highest conversation_mindmaps.id folded into this synthesis
   created_at TEXT DEFAULT (datetime('now')),
   updated_at TEXT DEFAULT (datetime('now'))
 );
@@ -253,6 +329,7 @@ CREATE TABLE IF NOT EXISTS import_history (
   meeting_id INTEGER,               -- Reference to created meeting (if successful)
   status TEXT DEFAULT 'pending',    -- 'pending', 'processing', 'completed', 'failed'
   error_message TEXT,               -- Error details if failed
+  batch_id TEXT,                    -- bulk import run (services/bulk_import.py), NULL for single uploads
   created_at TEXT DEFAULT (datetime('now')),
   FOREIGN KEY (meeting_id) REFERENCES meeting_summaries(id) ON DELETE SET NULL
 );
@@ -558,6 +635,7 @@ CREATE TABLE IF NOT EXISTS code_locker (
   version INTEGER DEFAULT 1,       -- version number (increments with each upload)
   notes TEXT,                      -- optional notes about this version
   is_initial INTEGER DEFAULT 0,   -- 1 if this is the initial/baseline version
+  content_hash TEXT,               -- key into code_locker_blobs ('' content when set)
   created_at TEXT DEFAULT (datetime('now')),
   FOREIGN KEY (ticket_id) REFERENCES tickets(id) ON DELETE SET NULL
 );
@@ -565,6 +643,18 @@ CREATE TABLE IF NOT EXISTS code_locker (
 CREATE INDEX IF NOT EXISTS idx_code_locker_ticket ON code_locker(ticket_id);
 CREATE INDEX IF NOT EXISTS idx_code_locker_filename ON code_locker(filename);
 
+-- Code locker version store: full snapshots plus forward deltas, deduped by hash
+CREATE TABLE IF NOT EXISTS code_locker_blobs (
+  content_hash TEXT PRIMARY KEY,   -- sha256 of the file content
+  storage TEXT NOT NULL,           -- 'full' | 'delta'
+  base_hash TEXT,                  -- blob this delta applies to (NULL for full)
+  chain_depth INTEGER DEFAULT 0,   -- deltas since the nearest full snapshot
+  payload BLOB NOT NULL,           -- zlib-compressed JSON (content or delta ops)
+  raw_size INTEGER,                -- uncompressed content bytes
+  stored_size INTEGER,             -- payload bytes
+  created_at TEXT DEFAULT (datetime('now'))
+);
+
 CREATE TABLE IF NOT EXISTS documents (
   id INTEGER PRIMARY KEY,
   meeting_id INTEGER,
@@ -612,23 +702,254 @@ CREATE TABLE IF NOT EXISTS skill_tracker (
 );
 
 CREATE INDEX IF NOT EXISTS idx_skill_tracker_category ON skill_tracker(category);
+
+-- Scheduler leader lease and per-tick claims (see services/scheduler_lease.py)
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+  name TEXT PRIMARY KEY,
+  holder TEXT NOT NULL,
+  expires_at REAL NOT NULL,         -- unix timestamp
+  acquired_at REAL
+);
+
+-- Per-job scheduling state and execution history
+CREATE TABLE IF NOT EXISTS scheduler_jobs (
+  job_id TEXT PRIMARY KEY,
+  name TEXT,
+  schedule TEXT,
+  last_run_at TEXT,
+  last_status TEXT,                 -- success | failed | skipped
+  last_duration_ms INTEGER,
+  next_run_at TEXT,
+  run_count INTEGER DEFAULT 0,
+  failure_count INTEGER DEFAULT 0,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
+
+CREATE TABLE IF NOT EXISTS scheduler_job_runs (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  job_id TEXT NOT NULL,
+  scheduled_for TEXT,               -- cron tick, NULL for manual runs
+  trigger TEXT DEFAULT 'cron',      -- cron | manual
+  holder TEXT,
+  started_at TEXT NOT NULL,
+  finished_at TEXT,
+  duration_ms INTEGER,
+  status TEXT NOT NULL DEFAULT 'running',
+  error TEXT,
+  result_summary TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_scheduler_job_runs_job ON scheduler_job_runs(job_id, started_at);
+
+-- Compressed, content-addressed storage for large transcript text (see db_blobs.py).
+-- meeting_summaries.raw_text/pocket_ai_summary/pocket_mind_map and
+-- meeting_documents.content hold a reference into this table once large.
+CREATE TABLE IF NOT EXISTS text_blobs (
+  hash TEXT PRIMARY KEY,            -- SHA-256 of the UTF-8 text
+  codec TEXT NOT NULL,              -- 'zstd' | 'zlib'
+  size INTEGER NOT NULL,            -- uncompressed bytes
+  compressed_size INTEGER NOT NULL,
+  data BLOB NOT NULL,
+  created_at TEXT DEFAULT (datetime('now'))
+) WITHOUT ROWID;
+
+-- LLM response cache for deterministic task types (see llm_cache.py)
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+  key TEXT PRIMARY KEY,             -- SHA-256 of model, system prompt, prompt, temperature, max_tokens
+  task_type TEXT,
+  model TEXT,
+  response TEXT NOT NULL,
+  size INTEGER NOT NULL,            -- response bytes, for size-bounded eviction
+  created_at REAL NOT NULL,
+  expires_at REAL NOT NULL,
+  last_used_at REAL NOT NULL,
+  hits INTEGER DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_used ON llm_response_cache(last_used_at);
+
+-- Local ledger of evaluation feedback events (see services/feedback_ledger.py)
+CREATE TABLE IF NOT EXISTS feedback_events (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  source TEXT NOT NULL,             -- 'api' | 'thumbs' | 'signal' | 'agent' | 'auto_evaluator' | 'langsmith'
+  run_id TEXT,                      -- LangSmith run the feedback is about (NULL for signal feedback)
+  agent_name TEXT NOT NULL DEFAULT '',
+  key TEXT NOT NULL,                -- feedback dimension (helpfulness, user_feedback, signal_feedback, ...)
+  score REAL,
+  value TEXT,
+  comment TEXT,
+  dedupe_key TEXT UNIQUE,           -- one live event per thumbs toggle / signal vote
+  day TEXT NOT NULL,                -- UTC YYYY-MM-DD, the rollup bucket
+  created_at REAL NOT NULL,
+  langsmith_feedback_id TEXT UNIQUE,
+  synced_at REAL                    -- when LangSmith last had this event
+);
+
+CREATE INDEX IF NOT EXISTS idx_feedback_events_day ON feedback_events(day);
+CREATE INDEX IF NOT EXISTS idx_feedback_events_low ON feedback_events(created_at) WHERE score < 0.6;
+CREATE INDEX IF NOT EXISTS idx_feedback_events_unsynced ON feedback_events(created_at)
+  WHERE synced_at IS NULL AND run_id IS NOT NULL;
+
+-- LangSmith feedback whose ledger event was replaced or cleared; reconciliation
+-- must not pull it back in
+CREATE TABLE IF NOT EXISTS feedback_retracted (
+  langsmith_feedback_id TEXT PRIMARY KEY,
+  retracted_at REAL NOT NULL
+) WITHOUT ROWID;
+
+-- Per-day, per-agent, per-key feedback totals maintained on every ledger write
+CREATE TABLE IF NOT EXISTS feedback_daily_rollup (
+  day TEXT NOT NULL,
+  agent_name TEXT NOT NULL,
+  key TEXT NOT NULL,
+  count INTEGER NOT NULL DEFAULT 0,
+  scored INTEGER NOT NULL DEFAULT 0,  -- events with a numeric score
+  score_sum REAL NOT NULL DEFAULT 0,
+  low_count INTEGER NOT NULL DEFAULT 0, -- scores below 0.6
+  PRIMARY KEY (day, agent_name, key)
+) WITHOUT ROWID;
+
+-- Fingerprint of the last schema init_db() applied (startup fast path)
+CREATE TABLE IF NOT EXISTS schema_state (
+  key TEXT PRIMARY KEY,
+  value TEXT NOT NULL,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
 """
 
+# Bump when init_db() gains a migration that isn't a change to SCHEMA itself
+# (SCHEMA edits change the fingerprint on their own)
+SCHEMA_VERSION = 2
+
+
+def schema_fingerprint() -> str:
+    return hashlib.sha256(f"{SCHEMA_VERSION}\n{SCHEMA}".encode()).hexdigest()[:16]
+
+
+def schema_is_current(conn) -> bool:
+    """True if init_db() already ran against this database at the current schema."""
+    try:
+        row = conn.execute("SELECT value FROM schema_state WHERE key = 'fingerprint'").fetchone()
+    except sqlite3.OperationalError:
+        return False  # Table doesn't exist yet
+    return row is not None and row[0] == schema_fingerprint()
+
+
+class _ConnectionPool:
+    """Thread-safe pool of idle SQLite connections for one database file."""
+    
+    def __init__(self, path: str, max_idle: int = SQLITE_POOL_SIZE):
+        self.path = path
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self.created = 0
+        self.reused = 0
+    
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+        )
+        db_blobs.register(conn)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        self.created += 1
+        return conn
+    
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked worker: never share the parent's connections
+                self._idle = []
+                self._pid = os.getpid()
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+        return self._open()
+    
+    def release(self, conn: sqlite3.Connection):
+        try:
+            if conn.in_transaction:
+                conn.rollback()  # Uncommitted work is discarded, as on close()
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            if self._pid == os.getpid() and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+    
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+    
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "idle": len(self._idle),
+            "created": self.created,
+            "reused": self.reused,
+        }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+# Stands in for a released connection so late use fails like a closed one
+_RELEASED = sqlite3.connect(":memory:")
+_RELEASED.close()
+
+
+def _get_pool(path: str) -> _ConnectionPool:
+    pool = _pools.get(path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(path, _ConnectionPool(path))
+    return pool
+
+
+def close_pool():
+    """Close all idle pooled connections (e.g. on shutdown or between tests)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+def get_pool_stats() -> list:
+    """Idle/created/reused counts for each pooled database file."""
+    return [pool.stats() for pool in list(_pools.values())]
+
 
 class _LoggingConnection:
-    """Wrapper around SQLite connection that logs queries on deprecated tables."""
+    """Wrapper around SQLite connection that logs queries on deprecated tables.
     
-    def __init__(self, conn):
+    Pooled connections go back to the pool on close() or when the wrapper is
+    garbage collected, so callers that never close keep working unchanged.
+    """
+    
+    def __init__(self, conn, pool: _ConnectionPool = None):
         self._conn = conn
         self.row_factory = conn.row_factory
+        self._finalizer = weakref.finalize(self, pool.release, conn) if pool else None
     
     def execute(self, sql, params=()):
         _log_sqlite_usage(sql)
-        return self._conn.execute(sql, params)
+        with metrics_timer("db", sql_label(sql)):
+            return self._conn.execute(sql, params)
     
     def executemany(self, sql, params):
         _log_sqlite_usage(sql)
-        return self._conn.executemany(sql, params)
+        with metrics_timer("db", sql_label(sql)):
+            return self._conn.executemany(sql, params)
     
     def executescript(self, script):
         return self._conn.executescript(script)
@@ -640,6 +961,9 @@ class _LoggingConnection:
         return self._conn.rollback()
     
     def close(self):
+        if self._finalizer is not None:
+            self._conn = _RELEASED
+            return self._finalizer()
         return self._conn.close()
     
     def __enter__(self):
@@ -650,9 +974,13 @@ class _LoggingConnection:
 
 
 def connect():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return _LoggingConnection(conn)
+    if DB_PATH == ":memory:" or DB_PATH.startswith("file:"):
+        # Every in-memory connection is its own database, so never pool them
+        conn = sqlite3.connect(DB_PATH)
+        db_blobs.register(conn)
+        return _LoggingConnection(conn)
+    pool = _get_pool(DB_PATH)
+    return _LoggingConnection(pool.acquire(), pool)
 
 def table_exists(conn, table_name: str) -> bool:
     """Check if a table exists in the database."""
@@ -662,8 +990,15 @@ def table_exists(conn, table_name: str) -> bool:
     )
     return cursor.fetchone() is not None
 
-def init_db():
+def init_db(force: bool = False):
+    """Create tables and apply column migrations.
+
+    Skips all work when the database was already initialized at the current
+    schema fingerprint, unless ``force`` is set.
+    """
     with connect() as conn:
+        if not force and schema_is_current(conn):
+            return
         conn.executescript(SCHEMA)
         
         # Migration: Add sprint_points column to tickets if it doesn't exist
@@ -844,6 +1179,39 @@ def init_db():
         """)
         conn.execute("CREATE INDEX IF NOT EXISTS idx_synthesis_history_synthesis_id ON mindmap_synthesis_history(synthesis_id)")
         
+        # Migration (F2b): Content hash on mindmaps for extraction cache lookups
+        try:
+            conn.execute("ALTER TABLE conversation_mindmaps ADD COLUMN content_hash TEXT")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_conv_mindmaps_content_hash ON conversation_mindmaps(content_hash)")
+        
+        # Migration (F2b): High-water mark so synthesis refreshes only send the delta
+        try:
+            conn.execute("ALTER TABLE mindmap_syntheses ADD COLUMN last_mindmap_id INTEGER")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        try:
+            conn.execute("ALTER TABLE mindmap_syntheses ADD COLUMN synthesis_type TEXT DEFAULT NULL")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
+        # Migration: Content hash on code_locker rows for the delta version store
+        try:
+            conn.execute("ALTER TABLE code_locker ADD COLUMN content_hash TEXT")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_code_locker_file_version ON code_locker(filename, version)")
+        # Diffs are cached in memory now; drop the unbounded table
+        conn.execute("DROP TABLE IF EXISTS code_locker_diff_cache")
+        
+        # Migration (F1c): Group bulk-import rows so per-file progress can be queried
+        try:
+            conn.execute("ALTER TABLE import_history ADD COLUMN batch_id TEXT")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_import_history_batch ON import_history(batch_id)")
+        
         # Initialize default career profile
         conn.execute("""
             INSERT OR IGNORE INTO career_profile (id, current_role, target_role, strengths, weaknesses, interests, goals)
@@ -857,3 +1225,8 @@ def init_db():
             )
         """)
 
+        
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_state (key, value, updated_at) VALUES ('fingerprint', ?, datetime('now'))",
+            (schema_fingerprint(),)
+        )
@@ -0,0 +1,202 @@
+"""
+Async SQLite access for FastAPI route handlers.
+
+SQLite allows many concurrent readers but only one writer, so reads run on a
+small thread pool and all writes are funnelled through a single writer thread.
+Route handlers await these helpers instead of calling the blocking
+``db.connect()`` on the event loop.
+
+Usage:
+    from ..db_async import fetch_one, fetch_all, execute, transaction
+
+    row = await fetch_one("SELECT * FROM tickets WHERE id = ?", (ticket_id,))
+
+    async with transaction() as tx:
+        await tx.execute("UPDATE tickets SET status = ? WHERE id = ?", (status, ticket_id))
+        await tx.execute("INSERT INTO ticket_history ...", (...))
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+from . import db
+
+logger = logging.getLogger(__name__)
+
+SQLITE_READER_THREADS = int(os.getenv("SQLITE_READER_THREADS", "4"))
+
+
+class AsyncDatabase:
+    """Reader thread pool plus a single serialized writer thread."""
+
+    def __init__(self, reader_threads: int = SQLITE_READER_THREADS):
+        self._readers = ThreadPoolExecutor(max_workers=reader_threads, thread_name_prefix="sqlite-read")
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-write")
+        self._write_locks = weakref.WeakKeyDictionary()
+
+    def _write_lock(self) -> asyncio.Lock:
+        # asyncio locks are bound to a loop; keep one per running loop
+        loop = asyncio.get_running_loop()
+        lock = self._write_locks.get(loop)
+        if lock is None:
+            lock = self._write_locks[loop] = asyncio.Lock()
+        return lock
+
+    # -------------------------
+    # Generic dispatch
+    # -------------------------
+
+    async def run_read(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking read function on the reader pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, lambda: fn(*args, **kwargs))
+
+    async def run_write(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking write function on the writer thread."""
+        loop = asyncio.get_running_loop()
+        async with self._write_lock():
+            return await loop.run_in_executor(self._writer, lambda: fn(*args, **kwargs))
+
+    # -------------------------
+    # Query helpers
+    # -------------------------
+
+    async def fetch_one(self, sql: str, params: Sequence = ()) -> Optional[Any]:
+        def _fetch():
+            with db.connect() as conn:
+                return conn.execute(sql, params).fetchone()
+        return await self.run_read(_fetch)
+
+    async def fetch_all(self, sql: str, params: Sequence = ()) -> List[Any]:
+        def _fetch():
+            with db.connect() as conn:
+                return conn.execute(sql, params).fetchall()
+        return await self.run_read(_fetch)
+
+    async def execute(self, sql: str, params: Sequence = ()) -> int:
+        """Execute a single write and commit.
+
+        Returns:
+            lastrowid for inserts, otherwise the number of affected rows
+        """
+        def _execute():
+            with db.connect() as conn:
+                cur = conn.execute(sql, params)
+                conn.commit()
+                return cur.lastrowid if sql.lstrip().upper().startswith("INSERT") else cur.rowcount
+        return await self.run_write(_execute)
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Sequence]) -> int:
+        def _executemany():
+            with db.connect() as conn:
+                cur = conn.executemany(sql, seq_of_params)
+                conn.commit()
+                return cur.rowcount
+        return await self.run_write(_executemany)
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Hold the writer for a multi-statement transaction.
+
+        Commits on normal exit and rolls back if the block raises. Other
+        writes queue behind the transaction; reads are not blocked.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._write_lock():
+            conn = await loop.run_in_executor(self._writer, db.connect)
+            tx = AsyncTransaction(conn, self._writer)
+            try:
+                yield tx
+            except BaseException:
+                await loop.run_in_executor(self._writer, conn.rollback)
+                raise
+            else:
+                await loop.run_in_executor(self._writer, conn.commit)
+            finally:
+                await loop.run_in_executor(self._writer, conn.close)
+
+    def shutdown(self):
+        self._readers.shutdown(wait=False)
+        self._writer.shutdown(wait=True)
+
+
+class AsyncTransaction:
+    """Statements issued inside :meth:`AsyncDatabase.transaction`."""
+
+    def __init__(self, conn, writer: ThreadPoolExecutor):
+        self._conn = conn
+        self._writer = writer
+
+    async def _run(self, fn: Callable) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._writer, fn)
+
+    async def execute(self, sql: str, params: Sequence = ()) -> int:
+        def _execute():
+            cur = self._conn.execute(sql, params)
+            return cur.lastrowid if sql.lstrip().upper().startswith("INSERT") else cur.rowcount
+        return await self._run(_execute)
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Sequence]) -> int:
+        return await self._run(lambda: self._conn.executemany(sql, seq_of_params).rowcount)
+
+    async def fetch_one(self, sql: str, params: Sequence = ()) -> Optional[Any]:
+        return await self._run(lambda: self._conn.execute(sql, params).fetchone())
+
+    async def fetch_all(self, sql: str, params: Sequence = ()) -> List[Any]:
+        return await self._run(lambda: self._conn.execute(sql, params).fetchall())
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run ``fn(conn, *args, **kwargs)`` on the writer within this transaction."""
+        return await self._run(lambda: fn(self._conn, *args, **kwargs))
+
+
+_async_db: Optional[AsyncDatabase] = None
+
+
+def get_async_db() -> AsyncDatabase:
+    """Get the process-wide async database facade."""
+    global _async_db
+    if _async_db is None:
+        _async_db = AsyncDatabase()
+    return _async_db
+
+
+def shutdown_async_db():
+    """Stop the reader pool and writer thread."""
+    global _async_db
+    if _async_db is not None:
+        _async_db.shutdown()
+        _async_db = None
+
+
+async def fetch_one(sql: str, params: Sequence = ()) -> Optional[Any]:
+    return await get_async_db().fetch_one(sql, params)
+
+
+async def fetch_all(sql: str, params: Sequence = ()) -> List[Any]:
+    return await get_async_db().fetch_all(sql, params)
+
+
+async def execute(sql: str, params: Sequence = ()) -> int:
+    return await get_async_db().execute(sql, params)
+
+
+async def executemany(sql: str, seq_of_params: Iterable[Sequence]) -> int:
+    return await get_async_db().executemany(sql, seq_of_params)
+
+
+async def run_read(fn: Callable, *args, **kwargs) -> Any:
+    return await get_async_db().run_read(fn, *args, **kwargs)
+
+
+async def run_write(fn: Callable, *args, **kwargs) -> Any:
+    return await get_async_db().run_write(fn, *args, **kwargs)
+
+
+def transaction():
+    return get_async_db().transaction()
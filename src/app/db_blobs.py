@@ -0,0 +1,277 @@
+"""
+Content-addressed blob store for large SQLite text columns.
+
+Transcripts and Pocket summaries used to live inline in ``meeting_summaries``
+and ``meeting_documents``, so every ``SELECT *`` on those tables dragged
+hundreds of KB per row through the page cache. Large values are now stored
+once in ``text_blobs`` (compressed, keyed by SHA-256, shared across tables)
+and the column holds a short reference instead.
+
+References are resolved lazily: ``BlobRow`` (the row factory ``db.connect()``
+installs) only loads and decompresses a blob when that column is actually
+read, and SQL that filters on the text wraps the column in ``blob_text()``:
+
+    conn.execute("SELECT id FROM meeting_summaries WHERE LOWER(blob_text(raw_text)) LIKE ?", (like,))
+
+Writers call ``put_text(conn, text)`` and store whatever it returns; values
+under ``TEXT_BLOB_MIN_BYTES`` stay inline unchanged.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional
+
+try:
+    import zstandard
+except ImportError:  # zlib is always available
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Values shorter than this (in UTF-8 bytes) are cheaper to keep inline
+TEXT_BLOB_MIN_BYTES = int(os.getenv("TEXT_BLOB_MIN_BYTES", "4096"))
+
+# Column values that hold a blob reference start with this marker. The NUL
+# byte keeps it from ever colliding with real transcript text.
+BLOB_REF_PREFIX = "\x00blob:sha256:"
+_PREFIX_BYTES = BLOB_REF_PREFIX.encode()
+
+# Columns that may hold blob references: (table, column)
+BLOB_COLUMNS = (
+    ("meeting_summaries", "raw_text"),
+    ("meeting_summaries", "pocket_ai_summary"),
+    ("meeting_summaries", "pocket_mind_map"),
+    ("meeting_documents", "content"),
+)
+
+# Decompressed texts keyed by hash (immutable, so never stale). New blobs are
+# cached on write so they resolve before their transaction commits.
+_TEXT_CACHE_SIZE = 64
+_text_cache: "OrderedDict[str, str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+_ZSTD_LEVEL = 10
+_ZLIB_LEVEL = 6
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def compress(data: bytes, codec: Optional[str] = None) -> bytes:
+    codec = codec or default_codec()
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, _ZLIB_LEVEL)
+
+
+def decompress(payload: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("text blob is zstd-compressed but the 'zstandard' package is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return zlib.decompress(payload)
+
+
+def is_blob_ref(value) -> bool:
+    return isinstance(value, str) and value.startswith(BLOB_REF_PREFIX)
+
+
+def _hash_of(ref: str) -> str:
+    return ref[len(BLOB_REF_PREFIX):]
+
+
+def _cache_get(digest: str) -> Optional[str]:
+    with _cache_lock:
+        text = _text_cache.get(digest)
+        if text is not None:
+            _text_cache.move_to_end(digest)
+        return text
+
+
+def _cache_put(digest: str, text: str):
+    with _cache_lock:
+        _text_cache[digest] = text
+        _text_cache.move_to_end(digest)
+        while len(_text_cache) > _TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+
+
+def clear_cache():
+    with _cache_lock:
+        _text_cache.clear()
+
+
+def put_text(conn, text: Optional[str], min_bytes: Optional[int] = None) -> Optional[str]:
+    """Store ``text`` as a blob and return the value to write to the column.
+
+    Returns ``text`` unchanged when it is empty, already a reference, or
+    smaller than ``min_bytes``. Identical texts share one blob.
+    """
+    if not text or is_blob_ref(text):
+        return text
+    data = text.encode("utf-8")
+    if len(data) < (TEXT_BLOB_MIN_BYTES if min_bytes is None else min_bytes):
+        return text
+
+    digest = hashlib.sha256(data).hexdigest()
+    codec = default_codec()
+    payload = compress(data, codec)
+    conn.execute(
+        """INSERT OR IGNORE INTO text_blobs (hash, codec, size, compressed_size, data)
+           VALUES (?, ?, ?, ?, ?)""",
+        (digest, codec, len(data), len(payload), payload),
+    )
+    _cache_put(digest, text)
+    return BLOB_REF_PREFIX + digest
+
+
+def get_text(ref: str, conn=None) -> str:
+    """Load and decompress the text behind a blob reference.
+
+    Uses ``conn`` when given (required inside an uncommitted transaction that
+    wrote the blob and may have evicted it from the cache), otherwise a
+    pooled connection.
+    """
+    digest = _hash_of(ref)
+    text = _cache_get(digest)
+    if text is not None:
+        return text
+
+    try:
+        if conn is None:
+            from . import db
+            with db.connect() as pooled:
+                row = pooled.execute("SELECT codec, data FROM text_blobs WHERE hash = ?", (digest,)).fetchone()
+        else:
+            row = conn.execute("SELECT codec, data FROM text_blobs WHERE hash = ?", (digest,)).fetchone()
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Could not load text blob {digest[:12]}: {e}")
+        return ""
+    if row is None:
+        logger.warning(f"Missing text blob {digest[:12]}")
+        return ""
+
+    text = decompress(row[1], row[0]).decode("utf-8")
+    _cache_put(digest, text)
+    return text
+
+
+def resolve(value):
+    """Return the text behind ``value`` if it is a blob reference, else ``value``."""
+    if value.__class__ is str and value.startswith(BLOB_REF_PREFIX):
+        return get_text(value)
+    return value
+
+
+def row_dict(row, conn) -> Dict[str, object]:
+    """``dict(row)`` with blob references resolved on ``conn``.
+
+    For scripts that open a database file directly: ``BlobRow`` resolves
+    through the app's pooled connection, which may be a different file.
+    """
+    return {
+        key: get_text(value, conn) if is_blob_ref(value) else value
+        for key, value in zip(row.keys(), sqlite3.Row.__iter__(row))
+    }
+
+
+class BlobRow(sqlite3.Row):
+    """``sqlite3.Row`` that resolves blob references when a column is read.
+
+    Selecting a blob column only carries the short reference; the transcript
+    is loaded on ``row["raw_text"]``, ``dict(row)`` or iteration.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = sqlite3.Row.__getitem__(self, key)
+        if value.__class__ is str and value.startswith(BLOB_REF_PREFIX):
+            return get_text(value)
+        return value
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def register(conn: sqlite3.Connection):
+    """Install the lazy row factory and the ``blob_text()`` SQL function."""
+    conn.row_factory = BlobRow
+    conn.create_function("blob_text", 1, resolve, deterministic=True)
+
+
+# -------------------------
+# Maintenance
+# -------------------------
+
+def externalize_columns(conn, min_bytes: Optional[int] = None, batch_size: int = 200) -> Dict[str, int]:
+    """Move existing large inline values in ``BLOB_COLUMNS`` into the blob store.
+
+    Commits after every batch so a long backfill never holds the write lock
+    for long. Returns the number of values moved per ``table.column``.
+    """
+    threshold = TEXT_BLOB_MIN_BYTES if min_bytes is None else min_bytes
+    moved = {}
+    for table, column in BLOB_COLUMNS:
+        count = 0
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                f"""SELECT id, {column} FROM {table}
+                    WHERE id > ? AND {column} IS NOT NULL
+                      AND length(CAST({column} AS BLOB)) >= ?
+                      AND substr(CAST({column} AS BLOB), 1, ?) != ?
+                    ORDER BY id LIMIT ?""",
+                (last_id, threshold, len(_PREFIX_BYTES), _PREFIX_BYTES, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            for row_id, value in rows:
+                conn.execute(
+                    f"UPDATE {table} SET {column} = ? WHERE id = ?",
+                    (put_text(conn, value, min_bytes=threshold), row_id),
+                )
+            conn.commit()
+            count += len(rows)
+            last_id = rows[-1][0]
+        moved[f"{table}.{column}"] = count
+    return moved
+
+
+def collect_garbage(conn) -> int:
+    """Delete blobs no column references any more. Returns the number removed."""
+    # Compare as BLOBs: SQLite's text functions stop at the prefix's NUL byte
+    prefix_len = len(_PREFIX_BYTES)
+    referenced = " UNION ".join(
+        f"SELECT CAST(substr(CAST({column} AS BLOB), {prefix_len + 1}) AS TEXT) FROM {table} "
+        f"WHERE substr(CAST({column} AS BLOB), 1, {prefix_len}) = :prefix"
+        for table, column in BLOB_COLUMNS
+    )
+    cursor = conn.execute(
+        f"DELETE FROM text_blobs WHERE hash NOT IN ({referenced})",
+        {"prefix": _PREFIX_BYTES},
+    )
+    conn.commit()
+    return cursor.rowcount
+
+
+def get_blob_stats(conn) -> dict:
+    row = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(compressed_size), 0) FROM text_blobs"
+    ).fetchone()
+    count, size, compressed = row[0], row[1], row[2]
+    return {
+        "blobs": count,
+        "bytes": size,
+        "compressed_bytes": compressed,
+        "ratio": round(size / compressed, 2) if compressed else None,
+        "codec": default_codec(),
+        "cached": len(_text_cache),
+    }
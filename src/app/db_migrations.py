@@ -277,19 +277,30 @@ def migrate_4_1_5_doc_ticket_sync():
 # Run All Migrations
 # -------------------------
 
+MIGRATIONS = [
+    ("4.1.1", "4.1.1_device_registry", migrate_4_1_1_device_registry),
+    ("4.1.2", "4.1.2_agent_task_queue", migrate_4_1_2_agent_task_queue),
+    ("4.1.3", "4.1.3_sync_log", migrate_4_1_3_sync_log),
+    ("4.1.4", "4.1.4_meeting_sync", migrate_4_1_4_meeting_sync),
+    ("4.1.5", "4.1.5_doc_ticket_sync", migrate_4_1_5_doc_ticket_sync),
+]
+
+
 def run_all_migrations() -> dict:
     """
     Run all pending migrations in order.
     
+    Checks schema_migrations once up front and returns immediately when
+    every migration is already applied (the common startup case).
+    
     Returns dict with migration results.
     """
-    results = {
-        "4.1.1_device_registry": migrate_4_1_1_device_registry(),
-        "4.1.2_agent_task_queue": migrate_4_1_2_agent_task_queue(),
-        "4.1.3_sync_log": migrate_4_1_3_sync_log(),
-        "4.1.4_meeting_sync": migrate_4_1_4_meeting_sync(),
-        "4.1.5_doc_ticket_sync": migrate_4_1_5_doc_ticket_sync(),
-    }
+    applied_versions = get_applied_migrations()
+    
+    if all(version in applied_versions for version, _, _ in MIGRATIONS):
+        results = {key: False for _, key, _ in MIGRATIONS}
+    else:
+        results = {key: migrate() for _, key, migrate in MIGRATIONS}
     
     applied = sum(1 for v in results.values() if v)
     skipped = sum(1 for v in results.values() if not v)
@@ -8,6 +8,7 @@ import logging
 from .db import connect
 from .memory.embed import embed_text, EMBED_MODEL
 from .memory.vector_store import upsert_embedding
+from .metrics import timer as metrics_timer
 from .services import documents_supabase  # Supabase-first reads
 
 # NOTE: Neo4j removed - using Supabase knowledge graph instead (Phase 5.10)
@@ -51,10 +52,11 @@ def auto_link_document(doc_id: int, content: str, min_similarity: float = 0.78):
         # Generate embedding for the document
         import openai
         client = openai.OpenAI()
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=content[:8000]  # Limit to model context
-        )
+        with metrics_timer("embedding", "documents.auto_link"):
+            response = client.embeddings.create(
+                model="text-embedding-3-small",
+                input=content[:8000]  # Limit to model context
+            )
         embedding = response.data[0].embedding
         
         # Search for similar content
@@ -0,0 +1,303 @@
+# src/app/infrastructure/fake_providers.py
+"""
+Offline stand-ins for OpenAI, Anthropic and embeddings
+
+Deterministic fake clients with the same call shapes the app uses
+(``chat.completions.create``, ``responses.create``, ``embeddings.create``,
+``messages.create`` and their async twins) and a configurable latency
+distribution per backend. With them the LLM- and embedding-backed paths can
+be load tested and benchmarked without network access or API keys.
+
+- Completions are derived from a hash of the prompt: same prompt, same
+  answer. Prompts that ask for JSON get a JSON object back
+- Embeddings are hashed bag-of-words unit vectors, so texts sharing words
+  are close in cosine space and semantic search behaves sensibly
+- set_llm_responder() installs a custom responder (e.g. to return the
+  JSON shape a specific agent expects)
+
+Selected per backend with FAKE_BACKENDS; llm.py, memory/embed.py and
+supabase_client.py check fake_backend_enabled() before creating real
+clients. See fake_supabase.py for the PostgREST stand-in.
+
+Environment Variables:
+- FAKE_BACKENDS: comma-separated backends to fake: supabase, llm, embeddings, or all (default: none)
+- FAKE_LLM_LATENCY: latency spec for completions (default: lognormal:800:0.5)
+- FAKE_EMBED_LATENCY: latency spec for embeddings (default: lognormal:60:0.4)
+- FAKE_BACKEND_SEED: seed for latency sampling (default: 0)
+- FAKE_EMBED_DIM: embedding dimensions (default: 1536, as text-embedding-3-small)
+- FAKE_LLM_OUTPUT_TOKENS: approximate completion length (default: 200)
+
+Latency specs (milliseconds):
+    fixed:MS | uniform:LOW:HIGH | normal:MEAN:STDDEV | lognormal:MEDIAN:SIGMA | 0 (none)
+
+Usage:
+    FAKE_BACKENDS=all FAKE_LLM_LATENCY=lognormal:1200:0.6 python scripts/load_test.py
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+FAKE_BACKENDS = os.getenv("FAKE_BACKENDS", "")
+FAKE_LLM_LATENCY = os.getenv("FAKE_LLM_LATENCY", "lognormal:800:0.5")
+FAKE_EMBED_LATENCY = os.getenv("FAKE_EMBED_LATENCY", "lognormal:60:0.4")
+FAKE_BACKEND_SEED = int(os.getenv("FAKE_BACKEND_SEED", "0"))
+FAKE_EMBED_DIM = int(os.getenv("FAKE_EMBED_DIM", "1536"))
+FAKE_LLM_OUTPUT_TOKENS = int(os.getenv("FAKE_LLM_OUTPUT_TOKENS", "200"))
+
+BACKEND_KINDS = ("supabase", "llm", "embeddings")
+
+_WORDS = [
+    "the", "team", "agreed", "to", "review", "rollout", "plan", "next", "sprint", "owner",
+    "will", "follow", "up", "on", "pipeline", "latency", "billing", "migration", "risk", "decision",
+]
+
+
+def fake_backend_enabled(kind: str) -> bool:
+    """Whether FAKE_BACKENDS selects the fake for ``kind`` (supabase, llm or embeddings)."""
+    selected = {k.strip().lower() for k in os.getenv("FAKE_BACKENDS", FAKE_BACKENDS).split(",") if k.strip()}
+    return kind in selected or "all" in selected
+
+
+@dataclass
+class LatencyModel:
+    """Latency distribution in milliseconds, sampled deterministically from ``seed``."""
+    distribution: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.distribution not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec: Optional[str], seed: int = FAKE_BACKEND_SEED) -> "LatencyModel":
+        """Build from a spec like ``lognormal:800:0.5``; empty or ``0`` means no latency."""
+        spec = (spec or "").strip()
+        if spec in ("", "0", "none"):
+            return cls(seed=seed)
+        name, _, params = spec.partition(":")
+        values = [float(v) for v in params.split(":") if v] if params else []
+        if name.replace(".", "", 1).isdigit():
+            return cls("fixed", float(name), seed=seed)
+        values += [0.0] * (2 - len(values))
+        return cls(name, values[0], values[1], seed=seed)
+
+    def sample(self) -> float:
+        """One latency draw, in seconds."""
+        with self._lock:
+            if self.distribution == "fixed":
+                ms = self.a
+            elif self.distribution == "uniform":
+                ms = self._rng.uniform(self.a, self.b)
+            elif self.distribution == "normal":
+                ms = self._rng.gauss(self.a, self.b)
+            else:
+                ms = self.a * math.exp(self._rng.gauss(0.0, self.b)) if self.a > 0 else 0.0
+        return max(ms, 0.0) / 1000
+
+    def sleep(self) -> float:
+        delay = self.sample()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def asleep(self) -> float:
+        delay = self.sample()
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+
+def hashed_embedding(text: str, dim: int = FAKE_EMBED_DIM) -> List[float]:
+    """Deterministic unit vector: hashed bag of words."""
+    vec = [0.0] * dim
+    for word in (text or "").lower().split():
+        digest = hashlib.blake2b(word.strip(".,:;!?\"'()").encode("utf-8"), digest_size=8).digest()
+        bucket = int.from_bytes(digest[:4], "little") % dim
+        vec[bucket] += 1.0 if digest[4] & 1 else -1.0
+    norm = math.sqrt(sum(x * x for x in vec))
+    return [x / norm for x in vec] if norm else vec
+
+
+def _message_text(messages) -> str:
+    if isinstance(messages, str):
+        return messages
+    parts = []
+    for m in messages or []:
+        content = m.get("content") if isinstance(m, dict) else getattr(m, "content", "")
+        if isinstance(content, list):  # multi-part (vision) messages
+            content = " ".join(p.get("text", "") for p in content if isinstance(p, dict))
+        parts.append(str(content or ""))
+    return "\n".join(parts)
+
+
+def default_responder(prompt: str, model: str) -> str:
+    """Deterministic completion; JSON when the prompt asks for it."""
+    digest = hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).digest()
+    rng = random.Random(digest)
+    words = " ".join(rng.choice(_WORDS) for _ in range(max(FAKE_LLM_OUTPUT_TOKENS * 3 // 4, 1)))
+    if "json" in prompt.lower():
+        return json.dumps({"fake": True, "id": digest.hex()[:12], "summary": words, "items": []})
+    return f"{words.capitalize()}."
+
+
+_responder: Callable[[str, str], str] = default_responder
+
+
+def set_llm_responder(responder: Optional[Callable[[str, str], str]]):
+    """Install ``responder(prompt, model) -> text`` for all fake LLM calls (None restores the default)."""
+    global _responder
+    _responder = responder or default_responder
+
+
+def _usage(prompt: str, text: str) -> SimpleNamespace:
+    prompt_tokens = max(len(prompt) // 4, 1)
+    completion_tokens = max(len(text) // 4, 1)
+    return SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                           total_tokens=prompt_tokens + completion_tokens,
+                           input_tokens=prompt_tokens, output_tokens=completion_tokens)
+
+
+def _chat_completion(model: str, messages) -> SimpleNamespace:
+    prompt = _message_text(messages)
+    text = _responder(prompt, model)
+    return SimpleNamespace(
+        id=f"fake-{hashlib.md5(prompt.encode('utf-8')).hexdigest()[:12]}",
+        model=model,
+        choices=[SimpleNamespace(index=0, finish_reason="stop",
+                                 message=SimpleNamespace(role="assistant", content=text))],
+        usage=_usage(prompt, text),
+    )
+
+
+def _response(model: str, input) -> SimpleNamespace:
+    prompt = _message_text(input)
+    text = _responder(prompt, model)
+    return SimpleNamespace(model=model, output_text=text, usage=_usage(prompt, text))
+
+
+def _message(model: str, messages, system=None) -> SimpleNamespace:
+    prompt = _message_text(([{"content": system}] if system else []) + list(messages or []))
+    text = _responder(prompt, model)
+    return SimpleNamespace(model=model, role="assistant", stop_reason="end_turn",
+                           content=[SimpleNamespace(type="text", text=text)], usage=_usage(prompt, text))
+
+
+def _embeddings(model: str, input) -> SimpleNamespace:
+    texts = [input] if isinstance(input, str) else list(input)
+    return SimpleNamespace(
+        model=model,
+        data=[SimpleNamespace(index=i, embedding=hashed_embedding(t)) for i, t in enumerate(texts)],
+        usage=SimpleNamespace(prompt_tokens=sum(len(t) // 4 for t in texts), total_tokens=sum(len(t) // 4 for t in texts)),
+    )
+
+
+class _Endpoint:
+    """One sync API method: sleep for a latency draw, then build the response."""
+
+    def __init__(self, latency: LatencyModel, build: Callable):
+        self._latency = latency
+        self._build = build
+
+    def create(self, model: str = "", **kwargs):
+        self._latency.sleep()
+        return self._build(model, **kwargs)
+
+
+class _AsyncEndpoint(_Endpoint):
+
+    async def create(self, model: str = "", **kwargs):
+        await self._latency.asleep()
+        return self._build(model, **kwargs)
+
+
+def _chat_builder(model, messages=None, **_):
+    return _chat_completion(model, messages)
+
+
+def _responses_builder(model, input=None, **_):
+    return _response(model, input)
+
+
+def _messages_builder(model, messages=None, system=None, **_):
+    return _message(model, messages, system)
+
+
+def _embeddings_builder(model, input="", **_):
+    return _embeddings(model, input)
+
+
+class FakeOpenAI:
+    """Stands in for ``openai.OpenAI``: chat completions, responses and embeddings."""
+
+    endpoint = _Endpoint
+
+    def __init__(self, llm_latency: Optional[LatencyModel] = None, embed_latency: Optional[LatencyModel] = None):
+        llm_latency = llm_latency or LatencyModel.parse(os.getenv("FAKE_LLM_LATENCY", FAKE_LLM_LATENCY))
+        embed_latency = embed_latency or LatencyModel.parse(os.getenv("FAKE_EMBED_LATENCY", FAKE_EMBED_LATENCY))
+        self.chat = SimpleNamespace(completions=self.endpoint(llm_latency, _chat_builder))
+        self.responses = self.endpoint(llm_latency, _responses_builder)
+        self.embeddings = self.endpoint(embed_latency, _embeddings_builder)
+
+
+class FakeAsyncOpenAI(FakeOpenAI):
+    """Stands in for ``openai.AsyncOpenAI``."""
+
+    endpoint = _AsyncEndpoint
+
+
+class FakeAnthropic:
+    """Stands in for ``anthropic.Anthropic``: messages."""
+
+    endpoint = _Endpoint
+
+    def __init__(self, llm_latency: Optional[LatencyModel] = None):
+        llm_latency = llm_latency or LatencyModel.parse(os.getenv("FAKE_LLM_LATENCY", FAKE_LLM_LATENCY))
+        self.messages = self.endpoint(llm_latency, _messages_builder)
+
+
+class FakeAsyncAnthropic(FakeAnthropic):
+    """Stands in for ``anthropic.AsyncAnthropic``."""
+
+    endpoint = _AsyncEndpoint
+
+
+_clients: Dict[str, object] = {}
+_clients_lock = threading.Lock()
+
+_FACTORIES = {
+    "openai": FakeOpenAI,
+    "async_openai": FakeAsyncOpenAI,
+    "anthropic": FakeAnthropic,
+    "async_anthropic": FakeAsyncAnthropic,
+}
+
+
+def get_fake_client(name: str):
+    """Process-wide fake client: openai, async_openai, anthropic or async_anthropic."""
+    client = _clients.get(name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(name)
+            if client is None:
+                client = _clients[name] = _FACTORIES[name]()
+    return client
+
+
+def reset_fake_clients():
+    """Drop cached fake clients (picks up changed latency settings) and restore the default responder."""
+    with _clients_lock:
+        _clients.clear()
+    set_llm_responder(None)
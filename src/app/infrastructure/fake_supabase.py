@@ -0,0 +1,580 @@
+# src/app/infrastructure/fake_supabase.py
+"""
+In-process PostgREST stand-in backed by SQLite
+
+Implements the slice of the supabase-py client the app uses, so the
+Supabase-first code paths run (and can be benchmarked) offline:
+
+- ``table(name)`` query builder: select (incl. ``count="exact"``), insert,
+  update, upsert, delete; filters eq, neq, gt, gte, lt, lte, like, ilike,
+  in_, is_, match, or_ and ``not_``; order, limit, range, single,
+  maybe_single; ``execute()`` returns an object with ``.data`` / ``.count``
+- ``rpc("semantic_search" | "match_embeddings" | "hybrid_search", params)``
+  over the ``embeddings`` table (cosine similarity, plus reciprocal rank
+  fusion with a keyword ranking for hybrid search)
+
+Tables are schemaless: each row is a JSON document in a SQLite table
+created on first use, and filters compile to ``json_extract`` so they run
+in SQLite rather than Python. ``seed_from_sqlite()`` copies the local
+meetings, documents, tickets, DIKW items and embeddings in, so the fake
+serves the same corpus as the SQLite fallbacks.
+
+Selected with FAKE_BACKENDS=supabase (or all); get_supabase_client() then
+returns get_fake_supabase_client().
+
+Environment Variables:
+- FAKE_SUPABASE_DB: SQLite path for the fake's data (default: in-memory)
+- FAKE_SUPABASE_SEED: true/false, copy the local SQLite corpus in on first use (default: true)
+- FAKE_SUPABASE_LATENCY: latency spec per request (default: lognormal:15:0.5, see fake_providers.py)
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from .fake_providers import FAKE_BACKEND_SEED, LatencyModel
+
+logger = logging.getLogger(__name__)
+
+FAKE_SUPABASE_DB = os.getenv("FAKE_SUPABASE_DB", ":memory:")
+FAKE_SUPABASE_SEED = os.getenv("FAKE_SUPABASE_SEED", "true").lower() in ("1", "true", "yes")
+FAKE_SUPABASE_LATENCY = os.getenv("FAKE_SUPABASE_LATENCY", "lognormal:15:0.5")
+
+# Reciprocal rank fusion constant (as in the hybrid_search SQL function)
+RRF_K = 50
+
+_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_INT = re.compile(r"^-?\d+$")
+
+
+class FakePostgrestError(Exception):
+    """Mirrors postgrest.exceptions.APIError (code + message)."""
+
+    def __init__(self, message: str, code: str = "PGRST000"):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _column(name: str) -> str:
+    """SQL expression for a row field (``id`` has a real column so it can be indexed)."""
+    if not _IDENT.match(name):
+        raise FakePostgrestError(f"column {name!r} is not supported by the fake", "42703")
+    return "id" if name == "id" else f"json_extract(data, '$.{name}')"
+
+
+def _candidates(value: Any) -> List[Any]:
+    """PostgREST casts filter text to the column type; match numeric strings against numbers too."""
+    if isinstance(value, str) and _INT.match(value):
+        return [value, int(value)]
+    if isinstance(value, bool):
+        return [int(value)]
+    return [value]
+
+
+def _filter_sql(column: str, op: str, value: Any) -> Tuple[str, List[Any]]:
+    expr = _column(column)
+    if op == "eq":
+        values = _candidates(value)
+        return f"{expr} IN ({','.join('?' * len(values))})", values
+    if op == "neq":
+        values = _candidates(value)
+        return f"({expr} IS NULL OR {expr} NOT IN ({','.join('?' * len(values))}))", values
+    if op in ("gt", "gte", "lt", "lte"):
+        sql_op = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}[op]
+        return f"{expr} {sql_op} ?", [value]
+    if op == "like":
+        return f"{expr} GLOB ?", [str(value).replace("%", "*").replace("_", "?")]
+    if op == "ilike":
+        return f"LOWER({expr}) LIKE LOWER(?)", [str(value).replace("*", "%")]
+    if op == "in":
+        values = [c for v in value for c in _candidates(v)]
+        if not values:
+            return "0", []
+        return f"{expr} IN ({','.join('?' * len(values))})", values
+    if op == "is":
+        token = str(value).lower()
+        if token == "null":
+            return f"{expr} IS NULL", []
+        if token in ("true", "false"):
+            return f"{expr} = ?", [1 if token == "true" else 0]
+        raise FakePostgrestError(f"invalid is. value {value!r}", "22P02")
+    raise FakePostgrestError(f"operator {op!r} is not supported by the fake", "PGRST100")
+
+
+def _parse_or(expression: str) -> Tuple[str, List[Any]]:
+    """``col.op.value,col.op.value`` (PostgREST or= syntax) to SQL."""
+    clauses, params = [], []
+    for part in re.split(r",(?![^()]*\))", expression):
+        column, op, value = part.strip().split(".", 2)
+        negate = op == "not"
+        if negate:
+            op, _, value = value.partition(".")
+        if op == "in":
+            value = [v.strip().strip('"') for v in value.strip("()").split(",") if v.strip()]
+        sql, values = _filter_sql(column, op, value)
+        clauses.append(f"NOT ({sql})" if negate else sql)
+        params += values
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+def _project(row: Dict[str, Any], columns: Optional[List[str]]) -> Dict[str, Any]:
+    if columns is None:
+        return row
+    return {c: row.get(c) for c in columns}
+
+
+def _parse_columns(spec: str) -> Optional[List[str]]:
+    """``"*"`` -> None (all); embedded resources like ``meetings(*)`` are ignored."""
+    spec = re.sub(r"\w+\s*\([^)]*\)", "", spec or "*")
+    columns = [c.strip() for c in spec.split(",") if c.strip()]
+    if not columns or "*" in columns:
+        return None
+    return [c.split(":")[-1].split("::")[0] for c in columns]
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    if not a or not b or len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    na = sum(x * x for x in a) ** 0.5
+    nb = sum(y * y for y in b) ** 0.5
+    return dot / (na * nb) if na and nb else 0.0
+
+
+class _Not:
+    """``query.not_.is_(...)``: negates the next filter."""
+
+    def __init__(self, query: "FakeQuery"):
+        self._query = query
+
+    def __getattr__(self, name):
+        method = getattr(self._query, name)
+
+        def negated(*args, **kwargs):
+            self._query._negate_next = True
+            return method(*args, **kwargs)
+        return negated
+
+
+class FakeQuery:
+    """Chainable query on one table; nothing runs until execute()."""
+
+    def __init__(self, client: "FakeSupabaseClient", table: str):
+        self._client = client
+        self._table = table
+        self._action = "select"
+        self._columns: Optional[List[str]] = None
+        self._count = None
+        self._payload: Any = None
+        self._on_conflict = "id"
+        self._where: List[str] = []
+        self._params: List[Any] = []
+        self._order: List[str] = []
+        self._limit: Optional[int] = None
+        self._offset = 0
+        self._single = None
+        self._negate_next = False
+
+    # ---- actions ----
+
+    def select(self, columns: str = "*", count: Optional[str] = None, head: bool = False):
+        self._action = "select"
+        self._columns = _parse_columns(columns)
+        self._count = count
+        return self
+
+    def insert(self, rows, **_):
+        self._action, self._payload = "insert", rows
+        return self
+
+    def upsert(self, rows, on_conflict: str = "id", **_):
+        self._action, self._payload, self._on_conflict = "upsert", rows, on_conflict
+        return self
+
+    def update(self, values: Dict[str, Any], **_):
+        self._action, self._payload = "update", values
+        return self
+
+    def delete(self, **_):
+        self._action = "delete"
+        return self
+
+    # ---- filters ----
+
+    def _add(self, sql: str, params: List[Any]):
+        if self._negate_next:
+            sql, self._negate_next = f"NOT ({sql})", False
+        self._where.append(sql)
+        self._params += params
+        return self
+
+    @property
+    def not_(self):
+        return _Not(self)
+
+    def eq(self, column, value):
+        return self._add(*_filter_sql(column, "eq", value))
+
+    def neq(self, column, value):
+        return self._add(*_filter_sql(column, "neq", value))
+
+    def gt(self, column, value):
+        return self._add(*_filter_sql(column, "gt", value))
+
+    def gte(self, column, value):
+        return self._add(*_filter_sql(column, "gte", value))
+
+    def lt(self, column, value):
+        return self._add(*_filter_sql(column, "lt", value))
+
+    def lte(self, column, value):
+        return self._add(*_filter_sql(column, "lte", value))
+
+    def like(self, column, pattern):
+        return self._add(*_filter_sql(column, "like", pattern))
+
+    def ilike(self, column, pattern):
+        return self._add(*_filter_sql(column, "ilike", pattern))
+
+    def in_(self, column, values):
+        return self._add(*_filter_sql(column, "in", list(values)))
+
+    def is_(self, column, value):
+        return self._add(*_filter_sql(column, "is", value))
+
+    def match(self, query: Dict[str, Any]):
+        for column, value in query.items():
+            self.eq(column, value)
+        return self
+
+    def or_(self, filters: str, **_):
+        return self._add(*_parse_or(filters))
+
+    # ---- modifiers ----
+
+    def order(self, column: str, desc: bool = False, nullsfirst: Optional[bool] = None, **_):
+        expr = _column(column)
+        nulls_first = desc if nullsfirst is None else nullsfirst  # PostgREST default
+        self._order.append(f"({expr} IS NULL) {'DESC' if nulls_first else 'ASC'}, {expr} {'DESC' if desc else 'ASC'}")
+        return self
+
+    def limit(self, size: int, **_):
+        self._limit = size
+        return self
+
+    def range(self, start: int, end: int, **_):
+        self._offset, self._limit = start, end - start + 1
+        return self
+
+    def single(self):
+        self._single = "single"
+        return self
+
+    def maybe_single(self):
+        self._single = "maybe"
+        return self
+
+    # ---- execution ----
+
+    def _where_sql(self) -> str:
+        return " WHERE " + " AND ".join(self._where) if self._where else ""
+
+    def execute(self):
+        self._client.latency.sleep()
+        with self._client._lock:
+            self._client._ensure_table(self._table)
+            data, count = getattr(self, f"_run_{self._action}")()
+        if self._single:
+            if len(data) > 1 or (not data and self._single == "single"):
+                raise FakePostgrestError(
+                    f"JSON object requested, multiple (or no) rows returned ({len(data)})", "PGRST116"
+                )
+            data = data[0] if data else None
+        return SimpleNamespace(data=data, count=count)
+
+    def _run_select(self):
+        conn, table = self._client._conn, self._table
+        sql = f'SELECT data FROM "{table}"{self._where_sql()}'
+        if self._order:
+            sql += " ORDER BY " + ", ".join(self._order)
+        if self._limit is not None or self._offset:
+            sql += f" LIMIT {int(self._limit if self._limit is not None else -1)} OFFSET {int(self._offset)}"
+        rows = [_project(json.loads(r[0]), self._columns) for r in conn.execute(sql, self._params)]
+        count = None
+        if self._count:
+            count = conn.execute(f'SELECT COUNT(*) FROM "{table}"{self._where_sql()}', self._params).fetchone()[0]
+        return rows, count
+
+    def _rows(self) -> List[Dict[str, Any]]:
+        rows = self._payload if isinstance(self._payload, list) else [self._payload]
+        now = _now()
+        prepared = []
+        for row in rows:
+            row = dict(row)
+            row.setdefault("id", str(uuid.uuid4()))
+            row.setdefault("created_at", now)
+            prepared.append(row)
+        return prepared
+
+    def _write(self, row: Dict[str, Any], replace: bool = False):
+        verb = "INSERT OR REPLACE" if replace else "INSERT"
+        try:
+            self._client._conn.execute(
+                f'{verb} INTO "{self._table}" (id, data) VALUES (?, ?)',
+                (row["id"], json.dumps(row, default=str)),
+            )
+        except sqlite3.IntegrityError as e:
+            raise FakePostgrestError(f"duplicate key value violates unique constraint: {e}", "23505")
+
+    def _run_insert(self):
+        rows = self._rows()
+        for row in rows:
+            self._write(row)
+        self._client._changed(self._table)
+        return rows, None
+
+    def _run_upsert(self):
+        conflict = [c.strip() for c in self._on_conflict.split(",")]
+        rows = []
+        for row in (self._payload if isinstance(self._payload, list) else [self._payload]):
+            where = [_filter_sql(c, "eq", row.get(c)) for c in conflict if c in row]
+            existing = None
+            if where:
+                sql = " AND ".join(w for w, _ in where)
+                params = [p for _, ps in where for p in ps]
+                found = self._client._conn.execute(
+                    f'SELECT data FROM "{self._table}" WHERE {sql} LIMIT 1', params
+                ).fetchone()
+                existing = json.loads(found[0]) if found else None
+            if existing:
+                merged = {**existing, **row, "id": existing["id"], "updated_at": _now()}
+                self._write(merged, replace=True)
+                rows.append(merged)
+            else:
+                self._payload = row
+                new = self._rows()[0]
+                self._write(new)
+                rows.append(new)
+        self._client._changed(self._table)
+        return rows, None
+
+    def _run_update(self):
+        conn = self._client._conn
+        matched = [json.loads(r[0]) for r in conn.execute(
+            f'SELECT data FROM "{self._table}"{self._where_sql()}', self._params
+        )]
+        rows = []
+        for row in matched:
+            row = {**row, **self._payload, "id": row["id"]}
+            row.setdefault("updated_at", _now())
+            self._write(row, replace=True)
+            rows.append(row)
+        self._client._changed(self._table)
+        return rows, None
+
+    def _run_delete(self):
+        conn = self._client._conn
+        rows = [json.loads(r[0]) for r in conn.execute(
+            f'SELECT data FROM "{self._table}"{self._where_sql()}', self._params
+        )]
+        conn.execute(f'DELETE FROM "{self._table}"{self._where_sql()}', self._params)
+        self._client._changed(self._table)
+        return rows, None
+
+
+class _RpcCall:
+
+    def __init__(self, client: "FakeSupabaseClient", name: str, params: Dict[str, Any]):
+        self._client = client
+        self._name = name
+        self._params = params or {}
+
+    def execute(self):
+        handler = getattr(self._client, f"_rpc_{self._name}", None)
+        if handler is None:
+            raise FakePostgrestError(f"Could not find the function public.{self._name}", "PGRST202")
+        self._client.latency.sleep()
+        with self._client._lock:
+            return SimpleNamespace(data=handler(**self._params), count=None)
+
+
+class FakeSupabaseClient:
+    """supabase-py ``Client`` stand-in: ``table()`` / ``from_()`` queries and ``rpc()``."""
+
+    def __init__(self, path: str = ":memory:", latency: Optional[LatencyModel] = None):
+        self.latency = latency or LatencyModel.parse(os.getenv("FAKE_SUPABASE_LATENCY", FAKE_SUPABASE_LATENCY),
+                                                     seed=FAKE_BACKEND_SEED)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        self._tables = set()
+        self._versions: Dict[str, int] = {}
+        self._vectors: Optional[Tuple[int, List[Tuple[Dict[str, Any], List[float]]]]] = None
+
+    def table(self, name: str) -> FakeQuery:
+        if not _IDENT.match(name):
+            raise FakePostgrestError(f"relation {name!r} is not supported by the fake", "42P01")
+        return FakeQuery(self, name)
+
+    from_ = table
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> _RpcCall:
+        return _RpcCall(self, name, params)
+
+    # ---- storage ----
+
+    def _ensure_table(self, name: str):
+        if name not in self._tables:
+            self._conn.execute(f'CREATE TABLE IF NOT EXISTS "{name}" (pk INTEGER PRIMARY KEY, id UNIQUE, data TEXT NOT NULL)')
+            self._tables.add(name)
+
+    def _changed(self, table: str):
+        self._versions[table] = self._versions.get(table, 0) + 1
+
+    def _embedding_rows(self) -> List[Tuple[Dict[str, Any], List[float]]]:
+        """Parsed embeddings, cached until the table changes."""
+        self._ensure_table("embeddings")
+        version = self._versions.get("embeddings", 0)
+        if self._vectors is None or self._vectors[0] != version:
+            rows = []
+            for (raw,) in self._conn.execute('SELECT data FROM "embeddings"'):
+                row = json.loads(raw)
+                vector = row.get("embedding")
+                if isinstance(vector, str):  # pgvector text form
+                    vector = json.loads(vector)
+                rows.append((row, vector or []))
+            self._vectors = (version, rows)
+        return self._vectors[1]
+
+    # ---- RPC functions ----
+
+    def _rpc_semantic_search(self, query_embedding, match_threshold: float = None, match_count: int = 10,
+                             similarity_threshold: float = None, filter_ref_type: str = None, **_):
+        threshold = match_threshold if match_threshold is not None else (similarity_threshold or 0.0)
+        scored = []
+        for row, vector in self._embedding_rows():
+            if filter_ref_type and row.get("ref_type") != filter_ref_type:
+                continue
+            similarity = _cosine(query_embedding, vector)
+            if similarity >= threshold:
+                scored.append({"id": row.get("id"), "ref_type": row.get("ref_type"),
+                               "ref_id": row.get("ref_id"), "similarity": similarity})
+        scored.sort(key=lambda r: r["similarity"], reverse=True)
+        return scored[:match_count]
+
+    _rpc_match_embeddings = _rpc_semantic_search
+
+    def _rpc_hybrid_search(self, query_text: str, query_embedding, match_count: int = 10,
+                           full_text_weight: float = 1.0, semantic_weight: float = 1.0, rrf_k: int = RRF_K, **_):
+        semantic = self._rpc_semantic_search(query_embedding, match_threshold=0.0, match_count=match_count * 2)
+        semantic_rank = {(r["ref_type"], str(r["ref_id"])): i for i, r in enumerate(semantic, 1)}
+
+        terms = [t for t in (query_text or "").lower().split() if t]
+        sources = {"document": ("documents", "source", "content"),
+                   "meeting": ("meetings", "meeting_name", "synthesized_notes")}
+        keyword, details = [], {}
+        for ref_type, (table, title_field, content_field) in sources.items():
+            self._ensure_table(table)
+            for (raw,) in self._conn.execute(f'SELECT data FROM "{table}"'):
+                row = json.loads(raw)
+                text = f"{row.get(title_field) or ''} {row.get(content_field) or ''}".lower()
+                hits = sum(text.count(t) for t in terms)
+                key = (ref_type, str(row.get("id")))
+                details[key] = (row, title_field, content_field)
+                if hits:
+                    keyword.append((hits, key))
+        keyword.sort(key=lambda x: x[0], reverse=True)
+        keyword_rank = {key: i for i, (_, key) in enumerate(keyword[:match_count * 2], 1)}
+
+        fused = []
+        for key in set(semantic_rank) | set(keyword_rank):
+            if key not in details:
+                continue
+            score = 0.0
+            if key in keyword_rank:
+                score += full_text_weight / (rrf_k + keyword_rank[key])
+            if key in semantic_rank:
+                score += semantic_weight / (rrf_k + semantic_rank[key])
+            row, title_field, content_field = details[key]
+            fused.append({"id": row.get("id"), "ref_type": key[0], "source_name": row.get(title_field),
+                          "content": row.get(content_field) or "", "rrf_score": score})
+        fused.sort(key=lambda r: r["rrf_score"], reverse=True)
+        return fused[:match_count]
+
+    # ---- seeding ----
+
+    def seed_from_sqlite(self, conn) -> Dict[str, int]:
+        """Copy the local corpus (a ``db.connect()`` connection) into the fake's tables."""
+        counts = {}
+
+        def copy(table: str, sql: str, convert):
+            rows = [convert(r) for r in conn.execute(sql).fetchall()]
+            if rows:
+                self.table(table).upsert(rows).execute()
+            counts[table] = len(rows)
+
+        def meeting(r):
+            return {
+                "id": r["id"], "meeting_name": r["meeting_name"], "synthesized_notes": r["synthesized_notes"],
+                "meeting_date": r["meeting_date"], "raw_text": r["raw_text"],
+                "signals": json.loads(r["signals_json"]) if r["signals_json"] else None,
+                "import_source": r["import_source"], "created_at": r["created_at"],
+            }
+
+        saved, self.latency = self.latency, LatencyModel()
+        try:
+            copy("meetings", "SELECT id, meeting_name, synthesized_notes, meeting_date, raw_text, signals_json, "
+                             "import_source, created_at FROM meeting_summaries", meeting)
+            copy("documents", "SELECT id, source, content, document_date, created_at FROM docs", dict)
+            copy("tickets", "SELECT id, ticket_id, title, description, status, priority, sprint_points, "
+                            "in_sprint, tags, created_at, updated_at FROM tickets", dict)
+            copy("dikw_items", "SELECT id, level, content, summary, source_type, meeting_id, tags, confidence, "
+                               "status, created_at FROM dikw_items", dict)
+            copy("embeddings", "SELECT id, ref_type, ref_id, model, vector FROM embeddings", lambda r: {
+                "id": r["id"], "ref_type": "document" if r["ref_type"] == "doc" else r["ref_type"],
+                "ref_id": r["ref_id"], "model": r["model"], "embedding": json.loads(r["vector"]),
+            })
+        finally:
+            self.latency = saved
+        return counts
+
+
+_fake_client: Optional[FakeSupabaseClient] = None
+_fake_client_lock = threading.Lock()
+
+
+def get_fake_supabase_client() -> FakeSupabaseClient:
+    """Process-wide fake client; seeded from the local SQLite DB on first use when FAKE_SUPABASE_SEED is on."""
+    global _fake_client
+    if _fake_client is None:
+        with _fake_client_lock:
+            if _fake_client is None:
+                client = FakeSupabaseClient(os.getenv("FAKE_SUPABASE_DB", FAKE_SUPABASE_DB))
+                if os.getenv("FAKE_SUPABASE_SEED", str(FAKE_SUPABASE_SEED)).lower() in ("1", "true", "yes"):
+                    from ..db import connect
+                    try:
+                        with connect() as conn:
+                            counts = client.seed_from_sqlite(conn)
+                        logger.info(f"Fake Supabase seeded from SQLite: {counts}")
+                    except sqlite3.Error as e:
+                        logger.warning(f"Fake Supabase not seeded: {e}")
+                _fake_client = client
+    return _fake_client
+
+
+def reset_fake_supabase_client():
+    """Drop the process-wide fake client (tests, or after changing settings)."""
+    global _fake_client
+    with _fake_client_lock:
+        _fake_client = None
@@ -7,9 +7,10 @@ Supports Redis for distributed rate limiting with memory fallback.
 
 Features:
 - Per-endpoint rate limits
-- Per-user rate limits
-- Token bucket algorithm
+- Per-user rate limits, tiered by caller (anonymous IP, session user, API key)
+- Token bucket algorithm (atomic Lua script in Redis, O(1) per check)
 - Burst allowance
+- Bounded, idle-expiring in-memory buckets
 - Graceful degradation
 
 Usage:
@@ -29,7 +30,10 @@ Usage:
 import asyncio
 import hashlib
 import logging
+import math
+import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Dict, Optional, Tuple
@@ -56,7 +60,7 @@ class RateLimitInfo:
             "X-RateLimit-Reset": str(int(self.reset_at)),
         }
         if self.retry_after:
-            headers["Retry-After"] = str(int(self.retry_after))
+            headers["Retry-After"] = str(math.ceil(self.retry_after))
         return headers
 
 
@@ -65,10 +69,11 @@ class TokenBucket:
     """Token bucket for rate limiting."""
     tokens: float
     last_update: float
+    window: float = 60.0  # a bucket idle this long is full again, so it can be dropped
     
-    def refill(self, rate: float, max_tokens: int) -> None:
+    def refill(self, rate: float, max_tokens: int, now: Optional[float] = None) -> None:
         """Refill tokens based on elapsed time."""
-        now = time.time()
+        now = time.time() if now is None else now
         elapsed = now - self.last_update
         self.tokens = min(max_tokens, self.tokens + elapsed * rate)
         self.last_update = now
@@ -81,6 +86,46 @@ class TokenBucket:
         return False
 
 
+# Memory-mode bucket cap (least recently used buckets are evicted beyond it)
+RATE_LIMIT_MAX_BUCKETS = int(os.getenv("RATE_LIMIT_MAX_BUCKETS", "10000"))
+
+# Token bucket in one round trip. State is a hash {tokens, ts} that expires
+# once the bucket would be full again, so idle keys clean themselves up.
+# KEYS[1] = bucket key; ARGV = limit, window (seconds), cost
+# Returns {allowed, remaining, retry_after_ms}
+_TOKEN_BUCKET_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local rate = limit / window
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+  tokens = limit
+  ts = now
+end
+
+tokens = math.min(limit, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after_ms = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry_after_ms = math.ceil((cost - tokens) / rate * 1000)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((limit - tokens) / rate * 1000) + 1000)
+return {allowed, math.floor(tokens), retry_after_ms}
+"""
+
+
 class RateLimiter:
     """
     Token bucket rate limiter with Redis support.
@@ -100,11 +145,19 @@ class RateLimiter:
         "webhook": (1000, 60),     # 1000 webhooks per minute
     }
     
+    # Limit multipliers by caller tier (see resolve_identity)
+    TIER_MULTIPLIERS = {
+        "anonymous": 1.0,
+        "user": 2.0,
+        "api_key": 5.0,
+    }
+    
     def __init__(
         self,
         redis_url: Optional[str] = None,
         default_limit: int = 100,
         default_window: int = 60,
+        max_buckets: int = RATE_LIMIT_MAX_BUCKETS,
     ):
         """
         Initialize rate limiter.
@@ -113,14 +166,19 @@ class RateLimiter:
             redis_url: Redis connection URL
             default_limit: Default requests per window
             default_window: Default window in seconds
+            max_buckets: Most in-memory buckets kept before LRU eviction
         """
         self._redis_url = redis_url
         self._default_limit = default_limit
         self._default_window = default_window
+        self._max_buckets = max_buckets
         
         self._redis_client = None
+        self._token_bucket_script = None
         self._fallback_mode = True
-        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self.evicted = 0
+        self.expired = 0
         
         # Try to connect to Redis
         self._connect_redis()
@@ -138,6 +196,7 @@ class RateLimiter:
                 self._redis_url,
                 decode_responses=True,
             )
+            self._token_bucket_script = self._redis_client.register_script(_TOKEN_BUCKET_LUA)
             self._fallback_mode = False
             logger.info("✅ Rate limiter connected to Redis")
             return True
@@ -158,6 +217,7 @@ class RateLimiter:
         endpoint: str = "default",
         limit: Optional[int] = None,
         window: Optional[int] = None,
+        tier: str = "anonymous",
     ) -> Tuple[bool, RateLimitInfo]:
         """
         Check if request is allowed.
@@ -167,6 +227,7 @@ class RateLimiter:
             endpoint: Endpoint name for limit lookup
             limit: Override limit
             window: Override window
+            tier: Caller tier; scales the limit by TIER_MULTIPLIERS
             
         Returns:
             Tuple of (allowed, rate_limit_info)
@@ -176,10 +237,10 @@ class RateLimiter:
             default = self.DEFAULT_LIMITS.get(endpoint, self.DEFAULT_LIMITS["default"])
             limit = limit or default[0]
             window = window or default[1]
+        limit = max(1, int(limit * self.TIER_MULTIPLIERS.get(tier, 1.0)))
         
         key = self._make_key(identifier, endpoint)
         now = time.time()
-        reset_at = now + window
         
         if self._fallback_mode:
             return await self._check_memory(key, limit, window, now)
@@ -197,12 +258,18 @@ class RateLimiter:
         # Get or create bucket
         bucket = self._buckets.get(key)
         if bucket is None:
-            bucket = TokenBucket(tokens=limit, last_update=now)
+            self._expire_idle(now)
+            bucket = TokenBucket(tokens=limit, last_update=now, window=window)
             self._buckets[key] = bucket
+            if len(self._buckets) > self._max_buckets:
+                self._buckets.popitem(last=False)
+                self.evicted += 1
+        else:
+            self._buckets.move_to_end(key)
         
         # Refill tokens
         rate = limit / window  # tokens per second
-        bucket.refill(rate, limit)
+        bucket.refill(rate, limit, now)
         
         # Try to consume
         allowed = bucket.consume(1)
@@ -214,11 +281,25 @@ class RateLimiter:
             limit=limit,
             remaining=remaining,
             reset_at=reset_at,
-            retry_after=(window - bucket.tokens / rate) if not allowed else None,
+            retry_after=((1 - bucket.tokens) / rate) if not allowed else None,
         )
         
         return allowed, info
     
+    def _expire_idle(self, now: float, max_checks: int = 8) -> None:
+        """Drop least recently used buckets that have refilled completely.
+        
+        A bucket idle for its whole window is indistinguishable from a new
+        one, so dropping it never changes a decision. Only a few buckets at
+        the LRU end are examined per call, keeping each check O(1).
+        """
+        for _ in range(min(max_checks, len(self._buckets))):
+            key, bucket = next(iter(self._buckets.items()))
+            if now - bucket.last_update < bucket.window:
+                return
+            del self._buckets[key]
+            self.expired += 1
+    
     async def _check_redis(
         self,
         key: str,
@@ -226,45 +307,21 @@ class RateLimiter:
         window: int,
         now: float,
     ) -> Tuple[bool, RateLimitInfo]:
-        """Check rate limit using Redis."""
+        """Check rate limit using the atomic Redis token bucket script."""
         try:
-            # Sliding window log algorithm
-            pipe = self._redis_client.pipeline()
-            
-            # Remove old entries
-            pipe.zremrangebyscore(key, 0, now - window)
-            
-            # Count current entries
-            pipe.zcard(key)
-            
-            # Add current request
-            pipe.zadd(key, {str(now): now})
-            
-            # Set expiry
-            pipe.expire(key, window)
-            
-            results = await pipe.execute()
-            count = results[1]
-            
-            allowed = count < limit
-            remaining = max(0, limit - count - 1)
-            reset_at = now + window
-            
-            # If not allowed, remove the entry we just added
-            if not allowed:
-                await self._redis_client.zrem(key, str(now))
-                remaining = 0
+            allowed, remaining, retry_after_ms = await self._token_bucket_script(
+                keys=[key], args=[limit, window, 1]
+            )
+            allowed = bool(int(allowed))
             
-            info = RateLimitInfo(
+            return allowed, RateLimitInfo(
                 allowed=allowed,
                 limit=limit,
-                remaining=remaining,
-                reset_at=reset_at,
-                retry_after=window if not allowed else None,
+                remaining=int(remaining),
+                reset_at=now + window,
+                retry_after=int(retry_after_ms) / 1000 if not allowed else None,
             )
             
-            return allowed, info
-            
         except Exception as e:
             logger.error(f"Redis rate limit error: {e}")
             # Fail open
@@ -300,12 +357,15 @@ class RateLimiter:
             }
         
         try:
-            now = time.time()
-            count = await self._redis_client.zcount(key, now - window, now)
+            tokens, ts = await self._redis_client.hmget(key, "tokens", "ts")
+            used = 0
+            if tokens is not None:
+                refilled = float(tokens) + max(0.0, time.time() - float(ts)) * limit / window
+                used = max(0, limit - int(min(limit, refilled)))
             return {
                 "identifier": identifier,
                 "endpoint": endpoint,
-                "used": count,
+                "used": used,
                 "limit": limit,
                 "window": window,
             }
@@ -338,6 +398,16 @@ class RateLimiter:
     def is_redis_available(self) -> bool:
         """Check if Redis is connected."""
         return not self._fallback_mode
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Mode and memory-bucket counters for the admin infrastructure page."""
+        return {
+            "mode": "redis" if self.is_redis_available else "memory",
+            "buckets": len(self._buckets),
+            "max_buckets": self._max_buckets,
+            "evicted": self.evicted,
+            "expired": self.expired,
+        }
 
 
 # Singleton instance
@@ -362,7 +432,6 @@ def get_rate_limiter(
     """
     global _rate_limiter
     if _rate_limiter is None:
-        import os
         url = redis_url or os.environ.get("REDIS_URL")
         _rate_limiter = RateLimiter(
             redis_url=url,
@@ -414,6 +483,38 @@ def parse_rate_limit(limit_str: str) -> Tuple[int, int]:
     return count, window
 
 
+def _hash_identity(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+def resolve_identity(request: Request) -> Tuple[str, str]:
+    """
+    Work out who is calling and which limit tier applies.
+    
+    Only credentials AuthMiddleware already validated raise the tier, so a
+    made-up header can't buy a bigger limit:
+    - API key (the X-Auth-Token / ?token= bypass token) -> "api_key"
+    - Logged-in session (or request.state.user_id) -> "user"
+    - Anything else is keyed by client IP -> "anonymous"
+    
+    Returns:
+        Tuple of (identifier, tier)
+    """
+    state = request.state
+    session_token = getattr(state, "session_token", None)
+    if session_token == "bypass":
+        token = request.headers.get("X-Auth-Token") or request.query_params.get("token") or ""
+        return f"key:{_hash_identity(token)}", "api_key"
+    
+    user_id = getattr(state, "user_id", None)
+    if user_id:
+        return f"user:{user_id}", "user"
+    if session_token:
+        return f"session:{_hash_identity(session_token)}", "user"
+    
+    return f"ip:{request.client.host if request.client else 'unknown'}", "anonymous"
+
+
 def rate_limit(
     limit_str: str = "100/minute",
     key_func: Optional[Callable[[Request], str]] = None,
@@ -422,6 +523,10 @@ def rate_limit(
     """
     FastAPI dependency for rate limiting.
     
+    The limit is per caller and scaled by the caller's tier (see
+    resolve_identity and RateLimiter.TIER_MULTIPLIERS). A custom
+    ``key_func`` keys by its own identifier at the anonymous tier.
+    
     Usage:
         @app.get("/api/data")
         async def get_data(request: Request, _=Depends(rate_limit("10/minute"))):
@@ -432,15 +537,9 @@ def rate_limit(
     async def dependency(request: Request):
         # Get identifier
         if key_func:
-            identifier = key_func(request)
+            identifier, tier = key_func(request), "anonymous"
         else:
-            # Default: use IP + user ID if authenticated
-            identifier = request.client.host if request.client else "unknown"
-            
-            # Add user ID if available
-            user_id = getattr(request.state, "user_id", None)
-            if user_id:
-                identifier = f"{identifier}:{user_id}"
+            identifier, tier = resolve_identity(request)
         
         # Check rate limit
         limiter = get_rate_limiter()
@@ -449,6 +548,7 @@ def rate_limit(
             endpoint=endpoint,
             limit=limit,
             window=window,
+            tier=tier,
         )
         
         # Add headers to response (via state)
@@ -22,6 +22,9 @@ Usage:
         "ref_id": "uuid-here",
         "embedding": [0.1, 0.2, ...],
     }).execute()
+
+With FAKE_BACKENDS=supabase (or all) get_supabase_client() returns the
+in-process SQLite-backed stand-in from fake_supabase.py instead.
 """
 
 import json
@@ -29,12 +32,24 @@ import logging
 import os
 from typing import Any, Dict, List, Optional
 
+from .fake_providers import fake_backend_enabled
+
 logger = logging.getLogger(__name__)
 
 # Singleton client
 _supabase_client = None
 
 
+def _instrument(client):
+    """Attach latency metrics to the client's PostgREST HTTP session (best effort)."""
+    try:
+        from ..metrics import instrument_httpx_client
+        instrument_httpx_client(client.postgrest.session, kind="supabase")
+    except Exception as e:
+        logger.debug(f"Supabase metrics hooks not attached: {e}")
+    return client
+
+
 def get_supabase_client():
     """
     Get the Supabase client singleton.
@@ -44,6 +59,10 @@ def get_supabase_client():
     """
     global _supabase_client
     
+    if fake_backend_enabled("supabase"):
+        from .fake_supabase import get_fake_supabase_client
+        return get_fake_supabase_client()
+    
     if _supabase_client is not None:
         return _supabase_client
     
@@ -64,7 +83,7 @@ def get_supabase_client():
             postgrest_client_timeout=30,
             storage_client_timeout=30,
         )
-        _supabase_client = create_client(supabase_url, supabase_key, options=options)
+        _supabase_client = _instrument(create_client(supabase_url, supabase_key, options=options))
         logger.info(f"✅ Connected to Supabase: {supabase_url}")
         return _supabase_client
     except ImportError:
@@ -76,7 +95,7 @@ def get_supabase_client():
         logger.warning(f"⚠️ Supabase client options failed ({e}), trying without options...")
         try:
             from supabase import create_client
-            _supabase_client = create_client(supabase_url, supabase_key)
+            _supabase_client = _instrument(create_client(supabase_url, supabase_key))
             logger.info(f"✅ Connected to Supabase (fallback): {supabase_url}")
             return _supabase_client
         except Exception as e2:
@@ -1,11 +1,33 @@
+import asyncio
 import os
 import datetime
-from typing import Any, Dict, List, Optional, Tuple
+import logging
+import random
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import httpx
 import requests
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 DEFAULT_BASE_URL = "https://public.heypocketai.com"
 
+# Override to point both clients at another server (e.g. the offline fixture
+# server in integrations/pocket_fixtures.py)
+POCKET_BASE_URL = os.getenv("POCKET_BASE_URL", DEFAULT_BASE_URL)
+
+# Async client tuning
+POCKET_MAX_CONCURRENCY = int(os.getenv("POCKET_MAX_CONCURRENCY", "8"))
+POCKET_MAX_RETRIES = int(os.getenv("POCKET_MAX_RETRIES", "4"))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 
 class PocketClient:
     """Thin wrapper for Pocket Public API.
@@ -13,8 +35,8 @@ class PocketClient:
     Uses API key in Authorization header as either Bearer or ApiKey.
     """
 
-    def __init__(self, api_key: Optional[str] = None, base_url: str = DEFAULT_BASE_URL):
-        self.base_url = base_url.rstrip("/")
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        self.base_url = (base_url or POCKET_BASE_URL).rstrip("/")
         self.api_key = api_key or os.getenv("POCKET_API_KEY")
         if not self.api_key:
             raise ValueError("Pocket API key not provided. Set POCKET_API_KEY env or pass api_key.")
@@ -63,6 +85,234 @@ class PocketClient:
         return resp.json()
 
 
+class AsyncPocketClient:
+    """Async Pocket client for route handlers and bulk syncs.
+
+    One pooled ``httpx.AsyncClient`` (HTTP/2 when ``h2`` is installed) is
+    shared by all requests; at most ``max_concurrency`` are in flight at once.
+    429/5xx responses and transport errors are retried with exponential
+    backoff (honouring ``Retry-After``), and recording payloads are cached by
+    ETag / Last-Modified so an unchanged recording costs a 304, not a download.
+
+    Usage:
+        async with AsyncPocketClient() as client:
+            details = await client.get_recording(recording_id)
+            batch = await client.fetch_recordings(start_date="2026-01-05", end_date="2026-01-11")
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: int = POCKET_MAX_CONCURRENCY,
+        max_retries: int = POCKET_MAX_RETRIES,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+        timeout: float = 30.0,
+        cache_size: int = 256,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = (base_url or POCKET_BASE_URL).rstrip("/")
+        self.api_key = api_key or os.getenv("POCKET_API_KEY")
+        if not self.api_key:
+            raise ValueError("Pocket API key not provided. Set POCKET_API_KEY env or pass api_key.")
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            http2=HTTP2_AVAILABLE and transport is None,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"requests": 0, "retries": 0, "not_modified": 0, "downloads": 0}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    # -------------------------
+    # Transport
+    # -------------------------
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.backoff_max)
+                except ValueError:
+                    pass  # HTTP-date form; fall back to backoff
+        delay = self.backoff_base * (2 ** attempt)
+        return min(delay, self.backoff_max) * (0.5 + random.random() / 2)
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None, cache: bool = False) -> Dict[str, Any]:
+        params = {k: (str(v).lower() if isinstance(v, bool) else v) for k, v in (params or {}).items()}
+        key = f"{path}?{sorted(params.items())}"
+        cached = self._cache.get(key) if cache else None
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                self.stats["requests"] += 1
+                response = None
+                try:
+                    response = await self._client.get(path, params=params, headers=headers)
+                except httpx.TransportError as e:
+                    if attempt >= self.max_retries:
+                        raise
+                    logger.warning(f"Pocket {path} failed ({e!r}), retrying")
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                        break
+                    logger.warning(f"Pocket {path} returned {response.status_code}, retrying")
+                self.stats["retries"] += 1
+                await asyncio.sleep(self._retry_delay(attempt, response))
+                attempt += 1
+
+        if response.status_code == 304 and cached:
+            self.stats["not_modified"] += 1
+            self._cache.move_to_end(key)
+            return cached["payload"]
+        response.raise_for_status()
+        payload = response.json()
+        self.stats["downloads"] += 1
+
+        if cache and (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+            self._cache[key] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "payload": payload,
+            }
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return payload
+
+    # -------------------------
+    # API
+    # -------------------------
+
+    async def list_recordings(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        tag_ids: Optional[str] = None,
+        page: int = 1,
+        limit: int = 20,
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"page": page, "limit": limit}
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        if tag_ids:
+            params["tag_ids"] = tag_ids
+        return await self._get("/api/v1/public/recordings", params)
+
+    async def get_recording(self, recording_id: str, include_transcript: bool = True, include_summarizations: bool = True) -> Dict[str, Any]:
+        params = {
+            "include_transcript": include_transcript,
+            "include_summarizations": include_summarizations,
+        }
+        return await self._get(f"/api/v1/public/recordings/{recording_id}", params, cache=True)
+
+    async def get_audio_url(self, recording_id: str, expires_in: int = 3600) -> Dict[str, Any]:
+        return await self._get(f"/api/v1/public/recordings/{recording_id}/audio-url", {"expires_in": expires_in})
+
+    async def list_all_recordings(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        tag_ids: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """All recording list items in a date range; pages after the first are fetched concurrently."""
+        first = await self.list_recordings(start_date, end_date, tag_ids, page=1, limit=limit)
+        items = list(_recording_items(first))
+        total_pages = int((first.get("pagination") or {}).get("total_pages") or 1)
+        if total_pages > 1:
+            pages = await asyncio.gather(*(
+                self.list_recordings(start_date, end_date, tag_ids, page=page, limit=limit)
+                for page in range(2, total_pages + 1)
+            ))
+            for resp in pages:
+                items.extend(_recording_items(resp))
+        return items
+
+    async def get_recordings(
+        self,
+        recording_ids: Iterable[str],
+        include_transcript: bool = True,
+        include_summarizations: bool = True,
+    ) -> Dict[str, Any]:
+        """Fetch many recordings in one concurrent batch.
+
+        Returns ``{recording_id: details}``; a recording that still fails after
+        retries maps to its exception instead of failing the whole batch.
+        """
+        ids = list(dict.fromkeys(recording_ids))
+        results = await asyncio.gather(
+            *(self.get_recording(rid, include_transcript, include_summarizations) for rid in ids),
+            return_exceptions=True,
+        )
+        return dict(zip(ids, results))
+
+    async def fetch_recordings(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        tag_ids: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """List a date range and fetch every recording in it as one parallel batch."""
+        items = await self.list_all_recordings(start_date, end_date, tag_ids)
+        ids = [item.get("id") or item.get("recording_id") for item in items]
+        return await self.get_recordings(rid for rid in ids if rid)
+
+
+def _recording_items(resp: Dict[str, Any]) -> List[Dict[str, Any]]:
+    data = resp.get("data") or {}
+    return data if isinstance(data, list) else data.get("items") or []
+
+
+_async_client: Optional[AsyncPocketClient] = None
+
+
+def get_async_pocket_client() -> AsyncPocketClient:
+    """Process-wide async client, so the connection pool and ETag cache are shared."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncPocketClient()
+    return _async_client
+
+
+async def close_async_pocket_client():
+    global _async_client
+    if _async_client is not None:
+        client, _async_client = _async_client, None
+        await client.aclose()
+
+
 def _get_dict(d: Any) -> Dict[str, Any]:
     return d if isinstance(d, dict) else {}
 
@@ -0,0 +1,196 @@
+"""
+Offline stand-in for the Pocket Public API.
+
+Serves recordings from a JSON fixture file (or an in-memory list) over local
+HTTP with the same routes, pagination, auth check and ETag / Last-Modified
+behaviour as the real API, so the Pocket clients can be exercised without
+network access.
+
+Usage:
+    python -m src.app.integrations.pocket_fixtures fixtures/pocket.json --port 8765
+    POCKET_BASE_URL=http://127.0.0.1:8765 POCKET_API_KEY=test uvicorn src.app.main:app
+
+    # In tests
+    with PocketFixtureServer(recordings) as server:
+        client = AsyncPocketClient(api_key="test", base_url=server.url)
+
+A fixture file is a JSON list of recording objects (``id``, ``title``,
+``created_at``, plus optional ``transcript`` and ``summarizations``), or an
+object with a ``recordings`` key holding that list.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from collections import Counter, deque
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+RECORDINGS_PATH = "/api/v1/public/recordings"
+
+
+class PocketFixtureServer:
+    """Threaded local HTTP server serving fixture recordings."""
+
+    def __init__(self, recordings: List[Dict[str, Any]], api_key: str = "test", host: str = "127.0.0.1", port: int = 0):
+        self.api_key = api_key
+        self.recordings = {str(r["id"]): r for r in recordings}
+        self.requests = Counter()  # "<status> <path>" -> count
+        self._failures = deque()   # (path_prefix, status) injected ahead of real responses
+        self._lock = threading.Lock()
+        self._modified = {rid: formatdate(usegmt=True) for rid in self.recordings}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "PocketFixtureServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="pocket-fixtures", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def fail_next(self, status: int, times: int = 1, path_prefix: str = RECORDINGS_PATH):
+        """Answer the next ``times`` matching requests with ``status`` (e.g. 429 or 503)."""
+        with self._lock:
+            self._failures.extend([(path_prefix, status)] * times)
+
+    def update_recording(self, recording: Dict[str, Any]):
+        """Replace or add a recording; its ETag and Last-Modified change accordingly."""
+        rid = str(recording["id"])
+        with self._lock:
+            self.recordings[rid] = recording
+            self._modified[rid] = formatdate(usegmt=True)
+
+    def count(self, status: int, path_prefix: str = RECORDINGS_PATH) -> int:
+        """Responses sent with ``status`` for paths under ``path_prefix``."""
+        return sum(n for key, n in self.requests.items() if key.startswith(f"{status} {path_prefix}"))
+
+    # -------------------------
+    # Request handling
+    # -------------------------
+
+    def _take_failure(self, path: str) -> Optional[int]:
+        with self._lock:
+            if self._failures and path.startswith(self._failures[0][0]):
+                return self._failures.popleft()[1]
+        return None
+
+    def _list(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        page = int(query.get("page", ["1"])[0])
+        limit = int(query.get("limit", ["20"])[0])
+        start = query.get("start_date", [""])[0]
+        end = query.get("end_date", [""])[0]
+        items = sorted(self.recordings.values(), key=lambda r: r.get("created_at", ""), reverse=True)
+        if start:
+            items = [r for r in items if r.get("created_at", "")[:10] >= start]
+        if end:
+            items = [r for r in items if r.get("created_at", "")[:10] <= end]
+        total_pages = max(1, -(-len(items) // limit))
+        page_items = items[(page - 1) * limit:page * limit]
+        return {
+            "data": [{"id": r["id"], "title": r.get("title"), "created_at": r.get("created_at")} for r in page_items],
+            "pagination": {"page": page, "total_pages": total_pages, "has_more": page < total_pages},
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None):
+                payload = json.dumps(body).encode() if body is not None else b""
+                path = urlparse(self.path).path
+                with server._lock:
+                    server.requests[f"{status} {path}"] += 1
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path, query = parsed.path, parse_qs(parsed.query)
+
+                if self.headers.get("Authorization") not in (f"Bearer {server.api_key}", f"ApiKey {server.api_key}"):
+                    return self._send(401, {"error": "unauthorized"})
+                failure = server._take_failure(path)
+                if failure:
+                    return self._send(failure, {"error": "injected failure"})
+
+                if path == RECORDINGS_PATH:
+                    return self._send(200, server._list(query))
+                if not path.startswith(RECORDINGS_PATH + "/"):
+                    return self._send(404, {"error": "not found"})
+
+                rid, _, action = path[len(RECORDINGS_PATH) + 1:].partition("/")
+                recording = server.recordings.get(rid)
+                if recording is None:
+                    return self._send(404, {"error": "recording not found"})
+                if action == "audio-url":
+                    return self._send(200, {"data": {"url": f"{server.url}/audio/{rid}.m4a"}})
+
+                body = dict(recording)
+                if query.get("include_transcript", ["true"])[0] != "true":
+                    body.pop("transcript", None)
+                if query.get("include_summarizations", ["true"])[0] != "true":
+                    body.pop("summarizations", None)
+                etag = '"' + hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()[:16] + '"'
+                headers = {"ETag": etag, "Last-Modified": server._modified[rid]}
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, None, headers)
+                return self._send(200, {"data": body}, headers)
+
+        return Handler
+
+
+def load_fixture_file(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        data = json.load(f)
+    return data["recordings"] if isinstance(data, dict) else data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Pocket API fixtures locally")
+    parser.add_argument("fixtures", help="JSON file with a list of recordings")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--api-key", default="test")
+    args = parser.parse_args()
+
+    server = PocketFixtureServer(load_fixture_file(args.fixtures), api_key=args.api_key, port=args.port)
+    print(f"Serving {len(server.recordings)} Pocket recordings on {server.url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,40 @@
+import asyncio
 import os
-from openai import OpenAI
+import weakref
+from contextlib import nullcontext
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
+from . import llm_cache
+from .metrics import timer as metrics_timer
+from .token_budget import count_tokens, record_prompt_tokens
+
+# Per-request timeout for the async clients used by agents
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+
 _openai_client = None
 _anthropic_client = None
 
+# Async clients hold connection pools bound to the loop that created them
+_async_openai_clients = weakref.WeakKeyDictionary()
+_async_anthropic_clients = weakref.WeakKeyDictionary()
+
+def _fake_client(name: str):
+    """Offline stand-in when FAKE_BACKENDS selects llm (see infrastructure/fake_providers.py), else None."""
+    from .infrastructure.fake_providers import fake_backend_enabled, get_fake_client  # deferred: loads the infrastructure package
+    return get_fake_client(name) if fake_backend_enabled("llm") else None
+
+
 # Claude model identifier
 CLAUDE_OPUS_MODEL = "claude-opus-4-5-20250514"
 
 def _openai_client_once():
     global _openai_client
+    fake = _fake_client("openai")
+    if fake is not None:
+        return fake
     if _openai_client is None:
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
@@ -20,12 +42,16 @@ def _openai_client_once():
                 "OPENAI_API_KEY environment variable is not set. "
                 "Please add it to your .env file."
             )
+        from openai import OpenAI  # deferred: slow import, not needed to serve
         _openai_client = OpenAI(api_key=api_key)
     return _openai_client
 
 
 def _anthropic_client_once():
     global _anthropic_client
+    fake = _fake_client("anthropic")
+    if fake is not None:
+        return fake
     if _anthropic_client is None:
         try:
             import anthropic
@@ -41,6 +67,47 @@ def _anthropic_client_once():
     return _anthropic_client
 
 
+def _async_openai_client_once():
+    """AsyncOpenAI client for the running event loop."""
+    fake = _fake_client("async_openai")
+    if fake is not None:
+        return fake
+    loop = asyncio.get_running_loop()
+    client = _async_openai_clients.get(loop)
+    if client is None:
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "OPENAI_API_KEY environment variable is not set. "
+                "Please add it to your .env file."
+            )
+        from openai import AsyncOpenAI
+        client = _async_openai_clients[loop] = AsyncOpenAI(api_key=api_key, timeout=LLM_TIMEOUT_SECONDS)
+    return client
+
+
+def _async_anthropic_client_once():
+    """AsyncAnthropic client for the running event loop."""
+    fake = _fake_client("async_anthropic")
+    if fake is not None:
+        return fake
+    loop = asyncio.get_running_loop()
+    client = _async_anthropic_clients.get(loop)
+    if client is None:
+        try:
+            import anthropic
+        except ImportError:
+            raise ImportError("anthropic package not installed. Run: pip install anthropic")
+        api_key = os.environ.get("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "ANTHROPIC_API_KEY environment variable is not set. "
+                "Please add it to your .env file."
+            )
+        client = _async_anthropic_clients[loop] = anthropic.AsyncAnthropic(api_key=api_key, timeout=LLM_TIMEOUT_SECONDS)
+    return client
+
+
 def _is_claude_model(model: str) -> bool:
     """Check if the model is a Claude model."""
     return model and (model.startswith("claude") or "anthropic" in model.lower())
@@ -64,7 +131,63 @@ def get_current_model() -> str:
         pass
     return "gpt-4o-mini"  # Default fallback
 
-def ask(prompt: str, model: str = None, trace_name: str = "llm.ask", thread_id: str = None) -> str:
+def _start_ask_run(prompt: str, model: str, trace_name: str, thread_id: str = None):
+    """Create the LangSmith run for an ask()/ask_async() call.
+    
+    Returns:
+        (langsmith_client, run_id), both None when tracing is off or fails
+    """
+    import uuid
+    
+    try:
+        from .tracing import is_tracing_enabled, get_langsmith_client, get_project_name
+        if not is_tracing_enabled():
+            return None, None
+        langsmith_client = get_langsmith_client()
+        if not langsmith_client:
+            return None, None
+        run_id = str(uuid.uuid4())
+        
+        # Build metadata with thread_id for Threads feature
+        metadata = {"source": "llm.ask"}
+        tags = [f"model:{model}", "source:llm.ask"]
+        
+        if thread_id:
+            # LangSmith looks for session_id, thread_id, or conversation_id
+            metadata["session_id"] = thread_id
+            metadata["thread_id"] = thread_id
+            metadata["conversation_id"] = thread_id
+            tags.append(f"thread:{thread_id[:8]}")
+        
+        langsmith_client.create_run(
+            name=trace_name,
+            run_type="llm",
+            inputs={"prompt": prompt[:2000], "model": model},
+            tags=tags,
+            extra={"metadata": metadata},
+            project_name=get_project_name(),
+            id=run_id,
+        )
+        print(f"✅ LangSmith: created run {run_id[:8]}... for {trace_name}")
+        return langsmith_client, run_id
+    except Exception as e:
+        print(f"⚠️ LangSmith: tracing init error: {e}")
+        return None, None
+
+
+def _end_ask_run(langsmith_client, run_id: str, **fields) -> None:
+    """Close a run opened by _start_ask_run with outputs= or error=."""
+    from datetime import datetime
+    
+    if not (langsmith_client and run_id):
+        return
+    try:
+        langsmith_client.update_run(run_id=run_id, end_time=datetime.now(), **fields)
+    except Exception:
+        pass
+
+
+def ask(prompt: str, model: str = None, trace_name: str = "llm.ask", thread_id: str = None, task_type: str = None) -> str:
     """Simple single-turn prompt to LLM without context.
     
     Args:
@@ -72,91 +195,53 @@ def ask(prompt: str, model: str = None, trace_name: str = "llm.ask", thread_id:
         model: Model to use (defaults to current_model setting)
         trace_name: Name for LangSmith tracing (optional)
         thread_id: Thread ID for LangSmith thread grouping (optional)
+        task_type: Routing task type; responses are served from the LLM
+            response cache when the policy sets cache_ttl_seconds for it
     
     Returns:
         LLM response text
     """
-    import uuid
-    from datetime import datetime
-    
     model = model or get_current_model()
+    max_tokens = 8192 if _is_claude_model(model) else None
+    
+    cache_key = llm_cache.lookup_key(task_type, model, None, prompt, max_tokens=max_tokens)
+    if cache_key:
+        cached = llm_cache.get(cache_key, task_type)
+        if cached is not None:
+            return cached
+    record_prompt_tokens(count_tokens(prompt, model), task_type=task_type, agent=trace_name or "llm")
     
     # LangSmith tracing
-    run_id = None
-    langsmith_client = None
-    try:
-        from .tracing import is_tracing_enabled, get_langsmith_client, get_project_name, TraceMetadata
-        if is_tracing_enabled():
-            langsmith_client = get_langsmith_client()
-            if langsmith_client:
-                run_id = str(uuid.uuid4())
-                
-                # Build metadata with thread_id for Threads feature
-                metadata = {"source": "llm.ask"}
-                tags = [f"model:{model}", "source:llm.ask"]
-                
-                if thread_id:
-                    # LangSmith looks for session_id, thread_id, or conversation_id
-                    metadata["session_id"] = thread_id
-                    metadata["thread_id"] = thread_id
-                    metadata["conversation_id"] = thread_id
-                    tags.append(f"thread:{thread_id[:8]}")
-                
-                langsmith_client.create_run(
-                    name=trace_name,
-                    run_type="llm",
-                    inputs={"prompt": prompt[:2000], "model": model},
-                    tags=tags,
-                    extra={"metadata": metadata},
-                    project_name=get_project_name(),
-                    id=run_id,
-                )
-                print(f"✅ LangSmith: created run {run_id[:8]}... for {trace_name}")
-    except Exception as e:
-        print(f"⚠️ LangSmith: tracing init error: {e}")
+    langsmith_client, run_id = _start_ask_run(prompt, model, trace_name, thread_id)
     
     try:
         # Route to appropriate provider based on model
         if _is_claude_model(model):
             # Use Anthropic API for Claude models
             client = _anthropic_client_once()
-            message = client.messages.create(
-                model=model,
-                max_tokens=8192,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            with metrics_timer("llm", trace_name):
+                message = client.messages.create(
+                    model=model,
+                    max_tokens=max_tokens,
+                    messages=[{"role": "user", "content": prompt}]
+                )
             response_text = message.content[0].text.strip()
         else:
             # Use OpenAI API
-            resp = _openai_client_once().chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            with metrics_timer("llm", trace_name):
+                resp = _openai_client_once().chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                )
             response_text = resp.choices[0].message.content.strip()
         
-        # Update trace with success
-        if langsmith_client and run_id:
-            try:
-                langsmith_client.update_run(
-                    run_id=run_id,
-                    outputs={"response": response_text[:2000]},
-                    end_time=datetime.now(),
-                )
-            except Exception:
-                pass
+        if cache_key:
+            llm_cache.put(cache_key, task_type, model, response_text)
         
+        _end_ask_run(langsmith_client, run_id, outputs={"response": response_text[:2000]})
         return response_text
     except Exception as e:
-        # Update trace with error
-        if langsmith_client and run_id:
-            try:
-                langsmith_client.update_run(
-                    run_id=run_id,
-                    error=str(e),
-                    end_time=datetime.now(),
-                )
-            except Exception:
-                pass
+        _end_ask_run(langsmith_client, run_id, error=str(e))
         raise
 
 
@@ -164,6 +249,98 @@ def ask(prompt: str, model: str = None, trace_name: str = "llm.ask", thread_id:
 chat = ask
 
 
+async def acomplete(
+    messages: list,
+    model: str,
+    temperature: float = None,
+    max_tokens: int = None,
+    trace_name: str = "llm.acomplete",
+) -> str:
+    """Non-blocking chat completion for async agents.
+    
+    Uses the async provider clients, so the event loop keeps serving while
+    the request is in flight. Cancelling the awaiting task aborts the HTTP
+    request; each request is also bounded by LLM_TIMEOUT_SECONDS.
+    
+    Args:
+        messages: OpenAI-style [{"role", "content"}] messages
+        model: Model name (Claude models go to Anthropic)
+        temperature: Sampling temperature (provider default if None)
+        max_tokens: Completion limit (provider default if None; 8192 for Claude)
+        trace_name: Metrics caller label (None when the caller times the call itself)
+    
+    Returns:
+        Response text
+    """
+    if _is_claude_model(model):
+        system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+        kwargs = {
+            "model": model,
+            "max_tokens": max_tokens or 8192,
+            "messages": [m for m in messages if m["role"] != "system"],
+        }
+        if system:
+            kwargs["system"] = system
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        with metrics_timer("llm", trace_name) if trace_name else nullcontext():
+            message = await _async_anthropic_client_once().messages.create(**kwargs)
+        return message.content[0].text.strip()
+    
+    kwargs = {"model": model, "messages": messages}
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    with metrics_timer("llm", trace_name) if trace_name else nullcontext():
+        resp = await _async_openai_client_once().chat.completions.create(**kwargs)
+    return (resp.choices[0].message.content or "").strip()
+
+
+async def ask_async(
+    prompt: str,
+    model: str = None,
+    trace_name: str = "llm.ask",
+    task_type: str = None,
+    thread_id: str = None,
+    return_run_id: bool = False,
+) -> str | tuple:
+    """Async counterpart of ask() for use inside agents.
+    
+    Shares ask()'s response cache and LangSmith run (BaseAgent.ask_llm
+    traces its own calls and goes through acomplete directly).
+    
+    Args:
+        thread_id: Thread ID for LangSmith thread grouping (optional)
+        return_run_id: If True, return (response, run_id) for feedback;
+            run_id is None for cache hits or when tracing is off
+    """
+    model = model or get_current_model()
+    max_tokens = 8192 if _is_claude_model(model) else None
+    
+    cache_key = llm_cache.lookup_key(task_type, model, None, prompt, max_tokens=max_tokens)
+    if cache_key:
+        cached = await llm_cache.aget(cache_key, task_type)
+        if cached is not None:
+            return (cached, None) if return_run_id else cached
+    record_prompt_tokens(count_tokens(prompt, model), task_type=task_type, agent=trace_name or "llm")
+    
+    langsmith_client, run_id = _start_ask_run(prompt, model, trace_name, thread_id)
+    try:
+        response_text = await acomplete(
+            [{"role": "user", "content": prompt}], model, max_tokens=max_tokens, trace_name=trace_name
+        )
+    except BaseException as e:
+        # Includes cancellation, so an abandoned request still closes its run
+        _end_ask_run(langsmith_client, run_id, error=str(e) or type(e).__name__)
+        raise
+    _end_ask_run(langsmith_client, run_id, outputs={"response": response_text[:2000]})
+    
+    if cache_key:
+        await llm_cache.aput(cache_key, task_type, model, response_text)
+    return (response_text, run_id) if return_run_id else response_text
+
+
 def analyze_image(image_base64: str, prompt: str = None) -> str:
     """Analyze an image using GPT-4 Vision and return a text description."""
     if not prompt:
@@ -176,25 +353,26 @@ If it's a screenshot of a meeting, diagram, or document:
 
 Return the analysis as structured text that can be stored and searched."""
     
-    resp = _openai_client_once().chat.completions.create(
-        model="gpt-4o",  # Vision requires gpt-4o or gpt-4-turbo
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/jpeg;base64,{image_base64}",
-                            "detail": "high"
+    with metrics_timer("llm", "llm.analyze_image"):
+        resp = _openai_client_once().chat.completions.create(
+            model="gpt-4o",  # Vision requires gpt-4o or gpt-4-turbo
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{image_base64}",
+                                "detail": "high"
+                            }
                         }
-                    }
-                ]
-            }
-        ],
-        max_tokens=1000
-    )
+                    ]
+                }
+            ],
+            max_tokens=1000
+        )
     return resp.choices[0].message.content.strip()
 
 def get_user_status_context() -> str:
@@ -282,16 +460,17 @@ def answer(question: str, context_blocks: list[str], trace_name: str = "llm.answ
         print(f"⚠️ LangSmith: tracing init error: {e}")
     
     try:
-        resp = _openai_client_once().chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": f"Context:\n{ctx}\n\nQuestion:\n{question}",
-                },
-            ],
-        )
+        with metrics_timer("llm", trace_name):
+            resp = _openai_client_once().chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {
+                        "role": "user",
+                        "content": f"Context:\n{ctx}\n\nQuestion:\n{question}",
+                    },
+                ],
+            )
         response_text = resp.choices[0].message.content.strip()
         
         # Update trace with success
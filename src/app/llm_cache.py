@@ -0,0 +1,269 @@
+"""
+Persistent LLM response cache for deterministic task types
+
+Many LLM calls are pure functions of their inputs (ticket summaries for an
+unchanged ticket, DIKW tags, status interpretation, query plans). Their
+responses are stored in SQLite keyed by a hash of everything that shapes
+the output, so repeating the same UI action returns instantly.
+
+- Opt-in per task type: a task type is cached only when its routing policy
+  entry sets ``cache_ttl_seconds`` (config/model_routing.yaml)
+- Key: SHA-256 of model, system prompt, prompt, temperature and max_tokens
+- Bounded: least-recently-used rows are evicted past LLM_CACHE_MAX_ENTRIES
+  or LLM_CACHE_MAX_BYTES; expired rows are never served
+- Hits/misses are counted per task type in the metrics registry
+- Async callers use aget()/aput(): the lookup runs on the reader pool and
+  writes go through the async writer, so the event loop never waits on
+  SQLite; the recency bump on a hit is deferred
+
+Environment Variables:
+- LLM_CACHE_ENABLED=false to bypass the cache entirely
+- LLM_CACHE_MAX_ENTRIES (default 2000), LLM_CACHE_MAX_BYTES (default 20 MB)
+
+Usage:
+    key = llm_cache.lookup_key("parsing", model, system_prompt, prompt)
+    cached = llm_cache.get(key, "parsing") if key else None
+    if cached is None:
+        response = call_model(...)
+        if key:
+            llm_cache.put(key, "parsing", model, response)
+
+    # in async code
+    cached = await llm_cache.aget(key, "parsing")
+    await llm_cache.aput(key, "parsing", model, response)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .db import connect
+from .db_async import run_read, run_write
+from .metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(20 * 1024 * 1024)))
+
+# Eviction runs on every Nth write rather than every write
+_PRUNE_EVERY = 32
+
+CACHE_REQUESTS = "signalflow_llm_cache_requests_total"
+
+_writes = 0
+_writes_lock = threading.Lock()
+
+# Deferred hit bumps still in flight (strong refs so they aren't collected)
+_pending = set()
+
+
+def make_key(
+    model: Optional[str],
+    system_prompt: Optional[str],
+    prompt: str,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """Stable hash of every input that shapes the response."""
+    payload = json.dumps([model, system_prompt or "", prompt, temperature, max_tokens], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_ttl(task_type: Optional[str], router=None) -> int:
+    """Cache TTL in seconds for a task type (0 = not cached)."""
+    if not LLM_CACHE_ENABLED or not task_type:
+        return 0
+    if router is None:
+        from .agents.model_router import get_model_router
+        router = get_model_router()
+    return router.get_cache_ttl(task_type)
+
+
+def lookup_key(
+    task_type: Optional[str],
+    model: Optional[str],
+    system_prompt: Optional[str],
+    prompt: str,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    router=None,
+) -> Optional[str]:
+    """Cache key for a call, or None when its task type isn't cacheable."""
+    if not get_ttl(task_type, router):
+        return None
+    return make_key(model, system_prompt, prompt, temperature, max_tokens)
+
+
+def _read(conn, key: str, now: float) -> Optional[str]:
+    row = conn.execute(
+        "SELECT response FROM llm_response_cache WHERE key = ? AND expires_at > ?",
+        (key, now),
+    ).fetchone()
+    return row["response"] if row is not None else None
+
+
+def _touch(conn, key: str, now: float):
+    conn.execute(
+        "UPDATE llm_response_cache SET hits = hits + 1, last_used_at = ? WHERE key = ?",
+        (now, key),
+    )
+
+
+def _count(task_type: Optional[str], hit: bool):
+    result = "hit" if hit else "miss"
+    get_metrics().inc(CACHE_REQUESTS, (("result", result), ("task_type", task_type or "")))
+
+
+def get(key: str, task_type: Optional[str] = None) -> Optional[str]:
+    """Return a fresh cached response and bump its recency, or None."""
+    now = time.time()
+    try:
+        with connect() as conn:
+            response = _read(conn, key, now)
+            if response is not None:
+                _touch(conn, key, now)
+                conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache read failed: {e}")
+        return None
+
+    _count(task_type, response is not None)
+    return response
+
+
+def _read_fresh(key: str, now: float) -> Optional[str]:
+    with connect() as conn:
+        return _read(conn, key, now)
+
+
+def _touch_committed(key: str, now: float):
+    try:
+        with connect() as conn:
+            _touch(conn, key, now)
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.debug(f"LLM cache recency update failed: {e}")
+
+
+async def aget(key: str, task_type: Optional[str] = None) -> Optional[str]:
+    """get() for async code: reads on the reader pool, defers the recency bump."""
+    now = time.time()
+    try:
+        response = await run_read(_read_fresh, key, now)
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache read failed: {e}")
+        return None
+
+    _count(task_type, response is not None)
+    if response is not None:
+        task = asyncio.ensure_future(run_write(_touch_committed, key, now))
+        _pending.add(task)
+        task.add_done_callback(_pending.discard)
+    return response
+
+
+def put(key: str, task_type: Optional[str], model: Optional[str], response: str, ttl: Optional[int] = None):
+    """Store a response; ttl defaults to the task type's policy TTL."""
+    global _writes
+    if not response:
+        return
+    ttl = ttl if ttl is not None else get_ttl(task_type)
+    if ttl <= 0:
+        return
+    now = time.time()
+    try:
+        with connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_response_cache
+                    (key, task_type, model, response, size, created_at, expires_at, last_used_at, hits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, task_type, model, response, len(response.encode("utf-8")), now, now + ttl, now),
+            )
+            with _writes_lock:
+                _writes += 1
+                due = _writes % _PRUNE_EVERY == 0
+            if due:
+                prune(conn, now=now)
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache write failed: {e}")
+
+
+async def aput(key: str, task_type: Optional[str], model: Optional[str], response: str, ttl: Optional[int] = None):
+    """put() for async code, run on the async writer."""
+    await run_write(put, key, task_type, model, response, ttl)
+
+
+def prune(conn, max_entries: int = None, max_bytes: int = None, now: float = None) -> int:
+    """Delete expired rows, then least-recently-used rows beyond the entry/byte bounds."""
+    max_entries = max_entries or LLM_CACHE_MAX_ENTRIES
+    max_bytes = max_bytes or LLM_CACHE_MAX_BYTES
+    deleted = conn.execute(
+        "DELETE FROM llm_response_cache WHERE expires_at <= ?", (now or time.time(),)
+    ).rowcount
+    deleted += conn.execute(
+        """
+        DELETE FROM llm_response_cache WHERE key IN (
+            SELECT key FROM (
+                SELECT key,
+                       ROW_NUMBER() OVER (ORDER BY last_used_at DESC) AS rank,
+                       SUM(size) OVER (ORDER BY last_used_at DESC ROWS UNBOUNDED PRECEDING) AS running
+                FROM llm_response_cache
+            ) WHERE rank > ? OR running > ?
+        )
+        """,
+        (max_entries, max_bytes),
+    ).rowcount
+    return deleted
+
+
+def clear(task_type: Optional[str] = None) -> int:
+    """Drop cached responses (all, or for one task type)."""
+    with connect() as conn:
+        if task_type:
+            deleted = conn.execute("DELETE FROM llm_response_cache WHERE task_type = ?", (task_type,)).rowcount
+        else:
+            deleted = conn.execute("DELETE FROM llm_response_cache").rowcount
+        conn.commit()
+    return deleted
+
+
+def get_stats() -> Dict[str, Any]:
+    """Stored entries per task type plus this process's hit/miss counts."""
+    with connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT task_type, COUNT(*) AS entries, COALESCE(SUM(size), 0) AS bytes, COALESCE(SUM(hits), 0) AS hits
+            FROM llm_response_cache GROUP BY task_type ORDER BY task_type
+            """
+        ).fetchall()
+
+    counters = get_metrics()._counters.get(CACHE_REQUESTS, {})
+    process: Dict[str, Dict[str, int]] = {}
+    for key, count in counters.items():
+        labels = dict(key)
+        entry = process.setdefault(labels["task_type"], {"hits": 0, "misses": 0})
+        entry["hits" if labels["result"] == "hit" else "misses"] += int(count)
+    for entry in process.values():
+        total = entry["hits"] + entry["misses"]
+        entry["hit_rate"] = round(entry["hits"] / total, 3) if total else 0.0
+
+    return {
+        "enabled": LLM_CACHE_ENABLED,
+        "max_entries": LLM_CACHE_MAX_ENTRIES,
+        "max_bytes": LLM_CACHE_MAX_BYTES,
+        "entries": sum(r["entries"] for r in rows),
+        "bytes": sum(r["bytes"] for r in rows),
+        "by_task_type": {r["task_type"] or "": {"entries": r["entries"], "bytes": r["bytes"], "hits": r["hits"]} for r in rows},
+        "process": process,
+    }
@@ -1,5 +1,4 @@
 import os
-from openai import OpenAI
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -32,6 +31,7 @@ def _openai_client_once():
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY not set in .env file.")
+        from openai import OpenAI  # deferred: slow import, not needed to serve
         _openai_client = OpenAI(api_key=api_key)
     return _openai_client
 
@@ -1,5 +1,8 @@
+# Imported first so STARTUP_PROFILE=1 can time every import below
+from .startup_profile import startup_state
+
 from fastapi import FastAPI, Request, Form, BackgroundTasks
-from fastapi.responses import RedirectResponse, JSONResponse, HTMLResponse
+from fastapi.responses import RedirectResponse, JSONResponse, HTMLResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from datetime import datetime, timedelta
@@ -7,12 +10,16 @@ import json
 import logging
 import os
 import re
+import time
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()
 
 from .db import init_db, connect
+from .db_async import fetch_one, fetch_all, run_read, transaction, shutdown_async_db
+from .metrics import MetricsMiddleware, render_prometheus
+from .compression import CompressionMiddleware
 from .meetings import router as meetings_router
 from .documents import router as documents_router
 from .search import router as search_router
@@ -39,10 +46,13 @@ from .auth import (
     AuthMiddleware, get_login_page, create_session, 
     destroy_session, get_auth_password, hash_password
 )
-from .integrations.pocket import PocketClient, extract_latest_summary, extract_transcript_text, extract_mind_map, extract_action_items, get_all_summary_versions, get_all_mind_map_versions
+from .integrations.pocket import get_async_pocket_client, close_async_pocket_client, extract_latest_summary, extract_transcript_text, extract_mind_map, extract_action_items, get_all_summary_versions, get_all_mind_map_versions
 from .services import meetings_supabase  # Supabase-first meeting reads
 from .services import documents_supabase  # Supabase-first document reads
 from .services import tickets_supabase  # Supabase-first ticket reads
+from .services import feedback_ledger
+from .services.signal_learning import signal_feedback_recorded
+from .services.notification_hub import publish_notification_event
 from typing import Optional
 
 # Initialize logger
@@ -128,8 +138,28 @@ async def health_check():
     """Health check endpoint for Railway and other platforms."""
     return {"status": "healthy", "version": API_VERSION}
 
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once warm, 503 while starting or warming up."""
+    state = startup_state.readiness()
+    return JSONResponse({**state, "version": API_VERSION}, status_code=200 if state["warm"] else 503)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(request: Request):
+    """Prometheus scrape endpoint: bearer METRICS_TOKEN if set, else a login session (AuthMiddleware)."""
+    token = os.getenv("METRICS_TOKEN")
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return PlainTextResponse("unauthorized\n", status_code=401)
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
 # Add authentication middleware
 app.add_middleware(AuthMiddleware)
+# Compresses streamed pages chunk by chunk (brotli when installed, else gzip)
+app.add_middleware(CompressionMiddleware)
+# Added last so it is outermost and times auth as well as the route
+app.add_middleware(MetricsMiddleware)
 
 # Serve static files (CSS, JS)
 STATIC_DIR = "src/app/static"
@@ -150,14 +180,32 @@ templates.env.globals['env'] = os.environ
 # NOTE: Neo4j removed - using Supabase knowledge graph instead (Phase 5.10)
 
 
+# Modules that are slow to import but not needed to start serving. They are
+# imported in the background after startup so the first request that needs
+# them doesn't pay for it; /ready reports "warm" once this finishes.
+WARMUP_MODULES = [
+    "openai",
+    ".llm",
+    ".memory.embed",
+    ".agents.arjuna",
+    ".agents.career_coach",
+    ".agents.meeting_analyzer",
+    ".agents.ticket_agent",
+    ".infrastructure.supabase_client",
+]
+
+
 @app.on_event("startup")
 def startup():
-    init_db()
-    init_chat_tables()
+    with startup_state.phase("init_db"):
+        init_db()
+    with startup_state.phase("init_chat_tables"):
+        init_chat_tables()
     
     # Run Phase 4.1 database migrations
     from .db_migrations import run_all_migrations
-    migration_result = run_all_migrations()
+    with startup_state.phase("migrations"):
+        migration_result = run_all_migrations()
     if migration_result["applied"] > 0:
         print(f"✅ Applied {migration_result['applied']} database migrations")
     
@@ -180,11 +228,29 @@ def startup():
     # Initialize background job scheduler (production only)
     try:
         from .services.scheduler import init_scheduler
-        scheduler = init_scheduler()
+        with startup_state.phase("scheduler"):
+            scheduler = init_scheduler()
         if scheduler:
             print("✅ Background job scheduler initialized")
     except Exception as e:
         print(f"⚠️ Scheduler init failed (non-fatal): {e}")
+    
+    from .prompt_templates import precompile_prompts
+    
+    startup_state.mark_serving()
+    startup_state.warm_up(WARMUP_MODULES, package=__package__, tasks=[precompile_prompts])
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    from .db import close_pool
+    from .services.scheduler import shutdown_scheduler
+    from .agents.runtime import shutdown_runtime
+    shutdown_scheduler()  # releases the leader lease before the pool closes
+    shutdown_runtime()
+    await close_async_pocket_client()
+    shutdown_async_db()
+    close_pool()
 
 
 # -------------------------
@@ -599,25 +665,32 @@ async def signal_feedback(request: Request):
     signal_text = data.get("signal_text")
     feedback = data.get("feedback")  # 'up', 'down', or None to remove
     
-    with connect() as conn:
+    async with transaction() as tx:
+        existing = await tx.fetch_one(
+            """SELECT feedback FROM signal_feedback
+               WHERE meeting_id = ? AND signal_type = ? AND signal_text = ?""",
+            (meeting_id, signal_type, signal_text)
+        )
+        previous = existing["feedback"] if existing else None
         if feedback is None:
             # Remove feedback
-            conn.execute(
+            await tx.execute(
                 """DELETE FROM signal_feedback 
                    WHERE meeting_id = ? AND signal_type = ? AND signal_text = ?""",
                 (meeting_id, signal_type, signal_text)
             )
         else:
             # Upsert feedback
-            conn.execute(
+            await tx.execute(
                 """INSERT INTO signal_feedback (meeting_id, signal_type, signal_text, feedback)
                    VALUES (?, ?, ?, ?)
                    ON CONFLICT(meeting_id, signal_type, signal_text) 
                    DO UPDATE SET feedback = ?, updated_at = CURRENT_TIMESTAMP""",
                 (meeting_id, signal_type, signal_text, feedback, feedback)
             )
-        conn.commit()
+        await tx.run(feedback_ledger.record_signal_vote, meeting_id, signal_type, signal_text, feedback)
     
+    signal_feedback_recorded(signal_type, signal_text, feedback, previous)
     return JSONResponse({"status": "ok"})
 
 
@@ -630,13 +703,15 @@ async def dashboard_quick_ask(request: Request):
     Returns run_id for user feedback.
     """
     from .agents.arjuna import quick_ask
+    from .agents.runtime import ClientDisconnected, run_cancellable
     
     data = await request.json()
     topic = data.get("topic")
     query = data.get("query")
     
     try:
-        result = await quick_ask(topic=topic, query=query)
+        # Cancelled (along with its LLM call) if the dashboard navigates away
+        result = await run_cancellable(quick_ask(topic=topic, query=query), request)
         
         if result.get("success"):
             return JSONResponse({
@@ -645,6 +720,10 @@ async def dashboard_quick_ask(request: Request):
             })
         else:
             return JSONResponse({"error": result.get("response", "AI Error")}, status_code=500)
+    except ClientDisconnected:
+        return JSONResponse({"error": "Request cancelled"}, status_code=499)
+    except TimeoutError as e:
+        return JSONResponse({"error": f"AI Error: {e}"}, status_code=504)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -693,140 +772,139 @@ async def get_highlights(request: Request):
                 "link_text": "Update Status"
             })
     
-    with connect() as conn:
-        # 3. Check sprint progress
-        sprint = conn.execute("SELECT * FROM sprint_settings WHERE id = 1").fetchone()
-        if sprint and sprint['sprint_start_date']:
-            try:
-                start = datetime.strptime(sprint['sprint_start_date'], '%Y-%m-%d')
-                length = sprint['sprint_length_days'] or 14
-                end = start + timedelta(days=length)
-                now = datetime.now()
-                progress = min(100, max(0, int((now - start).days / length * 100)))
-                days_left = (end - now).days
-                
-                # Sprint ending soon
-                if 0 < days_left <= 3 and f"sprint-ending" not in dismissed_ids:
-                    todo_count = tickets_supabase.get_tickets_count(statuses=["todo"])
-                    if todo_count > 0:
+    # 3. Check sprint progress
+    sprint = await fetch_one("SELECT * FROM sprint_settings WHERE id = 1")
+    if sprint and sprint['sprint_start_date']:
+        try:
+            start = datetime.strptime(sprint['sprint_start_date'], '%Y-%m-%d')
+            length = sprint['sprint_length_days'] or 14
+            end = start + timedelta(days=length)
+            now = datetime.now()
+            progress = min(100, max(0, int((now - start).days / length * 100)))
+            days_left = (end - now).days
+            
+            # Sprint ending soon
+            if 0 < days_left <= 3 and f"sprint-ending" not in dismissed_ids:
+                todo_count = tickets_supabase.get_tickets_count(statuses=["todo"])
+                if todo_count > 0:
+                    highlights.append({
+                        "id": "sprint-ending",
+                        "type": "risk",
+                        "label": "⏳ Sprint Ending",
+                        "text": f"{days_left} day{'s' if days_left != 1 else ''} left with {todo_count} todo items",
+                        "action": "Review remaining work and prioritize",
+                        "link": "/tickets",
+                        "link_text": "View Tickets"
+                    })
+            
+            # Sprint just started - set it up
+            if progress < 10 and f"sprint-setup" not in dismissed_ids:
+                ticket_count = tickets_supabase.get_tickets_count()
+                if ticket_count == 0:
+                    highlights.append({
+                        "id": "sprint-setup",
+                        "type": "action",
+                        "label": "🚀 New Sprint",
+                        "text": "Your sprint has started but no tickets yet",
+                        "action": "Create tickets to track your work this sprint",
+                        "link": "/tickets",
+                        "link_text": "Add Tickets"
+                    })
+        except:
+            pass
+    
+    # 4. Check for unreviewed signals
+    unreviewed = await fetch_one(
+        """SELECT COUNT(*) as c FROM signal_status 
+           WHERE status = 'pending' OR status IS NULL"""
+    )
+    if unreviewed and unreviewed['c'] > 5 and "review-signals" not in dismissed_ids:
+        highlights.append({
+            "id": "review-signals",
+            "type": "action",
+            "label": "📥 Unreviewed Signals",
+            "text": f"{unreviewed['c']} signals waiting for your review",
+            "action": "Validate signals to build your knowledge base",
+            "link": "/signals",
+            "link_text": "Review Signals"
+        })
+    
+    # 5. Check workflow mode progress
+    # (suggest moving to next mode if current is complete)
+    
+    # 6. Recent meeting with unprocessed signals (from Supabase)
+    recent_meetings_for_highlights = meetings_supabase.get_meetings_with_signals(limit=1)
+    if recent_meetings_for_highlights:
+        recent_meeting = recent_meetings_for_highlights[0]
+        try:
+            signals = recent_meeting.get('signals', {})
+            blockers = signals.get('blockers', [])
+            actions = signals.get('action_items', [])
+            
+            # Highlight blockers from recent meeting
+            for i, blocker in enumerate(blockers[:2]):
+                if blocker:
+                    highlight_id = f"mtg-blocker-{recent_meeting['id']}-{i}"
+                    if highlight_id not in dismissed_ids:
                         highlights.append({
-                            "id": "sprint-ending",
-                            "type": "risk",
-                            "label": "⏳ Sprint Ending",
-                            "text": f"{days_left} day{'s' if days_left != 1 else ''} left with {todo_count} todo items",
-                            "action": "Review remaining work and prioritize",
-                            "link": "/tickets",
-                            "link_text": "View Tickets"
+                            "id": highlight_id,
+                            "type": "blocker",
+                            "label": "🚧 Meeting Blocker",
+                            "text": blocker[:100] + ('...' if len(blocker) > 100 else ''),
+                            "action": f"From: {recent_meeting['meeting_name']}",
+                            "link": f"/meetings/{recent_meeting['id']}",
+                            "link_text": "View Meeting"
                         })
-                
-                # Sprint just started - set it up
-                if progress < 10 and f"sprint-setup" not in dismissed_ids:
-                    ticket_count = tickets_supabase.get_tickets_count()
-                    if ticket_count == 0:
+            
+            # Highlight action items from recent meeting
+            for i, action in enumerate(actions[:2]):
+                if action:
+                    highlight_id = f"mtg-action-{recent_meeting['id']}-{i}"
+                    if highlight_id not in dismissed_ids:
                         highlights.append({
-                            "id": "sprint-setup",
+                            "id": highlight_id,
                             "type": "action",
-                            "label": "🚀 New Sprint",
-                            "text": "Your sprint has started but no tickets yet",
-                            "action": "Create tickets to track your work this sprint",
-                            "link": "/tickets",
-                            "link_text": "Add Tickets"
+                            "label": "📋 Action Item",
+                            "text": action[:100] + ('...' if len(action) > 100 else ''),
+                            "action": f"From: {recent_meeting['meeting_name']}",
+                            "link": f"/meetings/{recent_meeting['id']}",
+                            "link_text": "View Meeting"
                         })
-            except:
-                pass
-        
-        # 4. Check for unreviewed signals
-        unreviewed = conn.execute(
-            """SELECT COUNT(*) as c FROM signal_status 
-               WHERE status = 'pending' OR status IS NULL"""
-        ).fetchone()
-        if unreviewed and unreviewed['c'] > 5 and "review-signals" not in dismissed_ids:
-            highlights.append({
-                "id": "review-signals",
-                "type": "action",
-                "label": "📥 Unreviewed Signals",
-                "text": f"{unreviewed['c']} signals waiting for your review",
-                "action": "Validate signals to build your knowledge base",
-                "link": "/signals",
-                "link_text": "Review Signals"
-            })
-        
-        # 5. Check workflow mode progress
-        # (suggest moving to next mode if current is complete)
-        
-        # 6. Recent meeting with unprocessed signals (from Supabase)
-        recent_meetings_for_highlights = meetings_supabase.get_meetings_with_signals(limit=1)
-        if recent_meetings_for_highlights:
-            recent_meeting = recent_meetings_for_highlights[0]
-            try:
-                signals = recent_meeting.get('signals', {})
-                blockers = signals.get('blockers', [])
-                actions = signals.get('action_items', [])
-                
-                # Highlight blockers from recent meeting
-                for i, blocker in enumerate(blockers[:2]):
-                    if blocker:
-                        highlight_id = f"mtg-blocker-{recent_meeting['id']}-{i}"
-                        if highlight_id not in dismissed_ids:
-                            highlights.append({
-                                "id": highlight_id,
-                                "type": "blocker",
-                                "label": "🚧 Meeting Blocker",
-                                "text": blocker[:100] + ('...' if len(blocker) > 100 else ''),
-                                "action": f"From: {recent_meeting['meeting_name']}",
-                                "link": f"/meetings/{recent_meeting['id']}",
-                                "link_text": "View Meeting"
-                            })
-                
-                # Highlight action items from recent meeting
-                for i, action in enumerate(actions[:2]):
-                    if action:
-                        highlight_id = f"mtg-action-{recent_meeting['id']}-{i}"
-                        if highlight_id not in dismissed_ids:
-                            highlights.append({
-                                "id": highlight_id,
-                                "type": "action",
-                                "label": "📋 Action Item",
-                                "text": action[:100] + ('...' if len(action) > 100 else ''),
-                                "action": f"From: {recent_meeting['meeting_name']}",
-                                "link": f"/meetings/{recent_meeting['id']}",
-                                "link_text": "View Meeting"
-                            })
-            except:
-                pass
-        
-        # 7. Accountability items (waiting for others)
-        waiting = conn.execute(
-            """SELECT id, description, responsible_party FROM accountability_items
-               WHERE status = 'waiting'
-               ORDER BY created_at DESC LIMIT 2"""
-        ).fetchall()
-        for w in waiting:
-            highlight_id = f"waiting-{w['id']}"
-            if highlight_id not in dismissed_ids:
-                highlights.append({
-                    "id": highlight_id,
-                    "type": "waiting",
-                    "label": "⏳ Waiting On",
-                    "text": f"{w['responsible_party']}: {w['description'][:80]}",
-                    "action": "Follow up if this is blocking you",
-                    "link": "/accountability",
-                    "link_text": "Waiting-For List"
-                })
-        
-        # 8. Check for empty DIKW (encourage knowledge building)
-        dikw_count = conn.execute("SELECT COUNT(*) as c FROM dikw_items").fetchone()
-        if dikw_count and dikw_count['c'] == 0 and "dikw-empty" not in dismissed_ids:
+        except:
+            pass
+    
+    # 7. Accountability items (waiting for others)
+    waiting = await fetch_all(
+        """SELECT id, description, responsible_party FROM accountability_items
+           WHERE status = 'waiting'
+           ORDER BY created_at DESC LIMIT 2"""
+    )
+    for w in waiting:
+        highlight_id = f"waiting-{w['id']}"
+        if highlight_id not in dismissed_ids:
             highlights.append({
-                "id": "dikw-empty",
-                "type": "idea",
-                "label": "💡 Knowledge Base",
-                "text": "Start building your knowledge pyramid",
-                "action": "Promote signals to DIKW to capture learnings",
-                "link": "/dikw",
-                "link_text": "View DIKW"
+                "id": highlight_id,
+                "type": "waiting",
+                "label": "⏳ Waiting On",
+                "text": f"{w['responsible_party']}: {w['description'][:80]}",
+                "action": "Follow up if this is blocking you",
+                "link": "/accountability",
+                "link_text": "Waiting-For List"
             })
-        
+    
+    # 8. Check for empty DIKW (encourage knowledge building)
+    dikw_count = await fetch_one("SELECT COUNT(*) as c FROM dikw_items")
+    if dikw_count and dikw_count['c'] == 0 and "dikw-empty" not in dismissed_ids:
+        highlights.append({
+            "id": "dikw-empty",
+            "type": "idea",
+            "label": "💡 Knowledge Base",
+            "text": "Start building your knowledge pyramid",
+            "action": "Promote signals to DIKW to capture learnings",
+            "link": "/dikw",
+            "link_text": "View DIKW"
+        })
+    
     # 9. No recent meetings (encourage logging) - check Supabase
     recent_meetings_check = meetings_supabase.get_meetings_with_signals_in_range(days=7)
     if len(recent_meetings_check) == 0 and "log-meeting" not in dismissed_ids:
@@ -985,15 +1063,14 @@ async def update_signal_status(request: Request):
     if not all([meeting_id, signal_type, signal_text, status]):
         return JSONResponse({"error": "Missing required fields"}, status_code=400)
     
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO signal_status (meeting_id, signal_type, signal_text, status, notes, updated_at)
                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
                ON CONFLICT(meeting_id, signal_type, signal_text) 
                DO UPDATE SET status = ?, notes = ?, updated_at = CURRENT_TIMESTAMP""",
             (meeting_id, signal_type, signal_text, status, notes, status, notes)
         )
-        conn.commit()
     
     return JSONResponse({"status": "ok", "new_status": status})
 
@@ -1012,37 +1089,52 @@ async def convert_signal_to_ticket(request: Request):
     # Get meeting name from Supabase for context
     meeting_name = meetings_supabase.get_meeting_name(meeting_id) or "Unknown Meeting"
     
+    # Check the backlog for tickets that already cover this signal
+    from .services.ticket_index import find_similar_tickets
+    possible_duplicates = await run_read(find_similar_tickets, signal_text, 3, 0.5)
+    
     # Generate ticket ID from Supabase
     next_num = tickets_supabase.get_next_ticket_number()
     ticket_id = f"SIG-{next_num}"
     
-    with connect() as conn:
+    async with transaction() as tx:
         # Determine priority based on signal type
         priority_map = {"blocker": "high", "risk": "high", "action_item": "medium", "decision": "low", "idea": "low"}
         priority = priority_map.get(signal_type, "medium")
         
         # Create ticket
-        conn.execute(
+        await tx.execute(
             """INSERT INTO tickets (ticket_id, title, description, status, priority, ai_summary, created_at)
                VALUES (?, ?, ?, 'backlog', ?, ?, CURRENT_TIMESTAMP)""",
             (ticket_id, signal_text[:100], f"Signal from: {meeting_name}\n\nOriginal Signal ({signal_type}):\n{signal_text}", 
              priority, f"Converted from {signal_type} signal: {signal_text[:150]}...")
         )
         
-        ticket_row = conn.execute("SELECT last_insert_rowid() as id").fetchone()
+        ticket_row = await tx.fetch_one("SELECT last_insert_rowid() as id")
         ticket_db_id = ticket_row["id"]
         
         # Update signal status
-        conn.execute(
+        await tx.execute(
             """INSERT INTO signal_status (meeting_id, signal_type, signal_text, status, converted_to, converted_ref_id, updated_at)
                VALUES (?, ?, ?, 'completed', 'ticket', ?, CURRENT_TIMESTAMP)
                ON CONFLICT(meeting_id, signal_type, signal_text) 
                DO UPDATE SET status = 'completed', converted_to = 'ticket', converted_ref_id = ?, updated_at = CURRENT_TIMESTAMP""",
             (meeting_id, signal_type, signal_text, ticket_db_id, ticket_db_id)
         )
-        conn.commit()
     
-    return JSONResponse({"status": "ok", "ticket_id": ticket_id, "ticket_db_id": ticket_db_id})
+    # SQLite-only write: update the match index now rather than at its next rebuild
+    from .services.ticket_index import index_ticket_changed
+    index_ticket_changed({
+        "id": ticket_db_id, "ticket_id": ticket_id, "title": signal_text[:100],
+        "description": signal_text, "status": "backlog", "priority": priority,
+    })
+    
+    return JSONResponse({
+        "status": "ok",
+        "ticket_id": ticket_id,
+        "ticket_db_id": ticket_db_id,
+        "possible_duplicates": possible_duplicates,
+    })
 
 
 # -------------------------
@@ -1125,14 +1217,13 @@ async def save_ai_memory(request: Request):
     if not content:
         return JSONResponse({"error": "Content is required"}, status_code=400)
     
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO ai_memory (source_type, source_query, content, status, tags, importance, created_at)
                VALUES (?, ?, ?, 'approved', ?, ?, CURRENT_TIMESTAMP)""",
             (source_type, source_query, content, tags, importance)
         )
-        conn.commit()
-        memory_id = conn.execute("SELECT last_insert_rowid() as id").fetchone()["id"]
+        memory_id = (await tx.fetch_one("SELECT last_insert_rowid() as id"))["id"]
     
     return JSONResponse({"status": "ok", "memory_id": memory_id})
 
@@ -1145,13 +1236,12 @@ async def reject_ai_response(request: Request):
     content = data.get("content", "")
     
     # We can optionally log rejected responses for ML training
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO ai_memory (source_type, source_query, content, status, importance, created_at)
                VALUES ('quick_ask', ?, ?, 'rejected', 0, CURRENT_TIMESTAMP)""",
             (source_query, content[:500])  # Store truncated for training feedback
         )
-        conn.commit()
     
     return JSONResponse({"status": "ok"})
 
@@ -1214,97 +1304,130 @@ async def get_notifications(limit: int = 10):
             logger.warning(f"Supabase notifications fetch failed, falling back to SQLite: {e}")
     
     # SQLite fallback
-    with connect() as conn:
-        # Check if notifications table exists
-        table_check = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='notifications'"
-        ).fetchone()
-        
-        if not table_check:
-            return JSONResponse({"notifications": []})
-        
-        # Query using new schema (notification_type, body) with fallback for old schema
-        try:
-            notifications = conn.execute(
-                """SELECT id, notification_type as type, title, body as message, 
-                          data, read, created_at, actioned, action_taken, expires_at
-                   FROM notifications 
-                   WHERE actioned = 0 OR actioned IS NULL
-                   ORDER BY 
-                     CASE priority WHEN 'critical' THEN 0 WHEN 'high' THEN 1 WHEN 'normal' THEN 2 ELSE 3 END,
-                     created_at DESC 
-                   LIMIT ?""",
-                (limit,)
-            ).fetchall()
-        except Exception:
-            # Fall back to old schema if new columns don't exist
-            notifications = conn.execute(
-                """SELECT id, type, title, message, link, read, created_at 
-                   FROM notifications 
-                   ORDER BY created_at DESC 
-                   LIMIT ?""",
-                (limit,)
-            ).fetchall()
-        
-        result = []
-        for n in notifications:
-            n_dict = dict(n)
-            # Parse action_url from data JSON if available
-            if 'data' in n_dict and n_dict['data']:
-                try:
-                    import json
-                    data = json.loads(n_dict['data']) if isinstance(n_dict['data'], str) else n_dict['data']
-                    n_dict['action_url'] = data.get('action_url', '')
-                    # Include read_at for frontend compatibility
-                    n_dict['read_at'] = n_dict['created_at'] if n_dict.get('read') else None
-                except:
-                    pass
-            result.append(n_dict)
-        
-        return JSONResponse({"notifications": result})
+    # Check if notifications table exists
+    table_check = await fetch_one(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='notifications'"
+    )
+    
+    if not table_check:
+        return JSONResponse({"notifications": []})
+    
+    # Query using new schema (notification_type, body) with fallback for old schema
+    try:
+        notifications = await fetch_all(
+            """SELECT id, notification_type as type, title, body as message, 
+                      data, read, created_at, actioned, action_taken, expires_at
+               FROM notifications 
+               WHERE actioned = 0 OR actioned IS NULL
+               ORDER BY 
+                 CASE priority WHEN 'critical' THEN 0 WHEN 'high' THEN 1 WHEN 'normal' THEN 2 ELSE 3 END,
+                 created_at DESC 
+               LIMIT ?""",
+            (limit,)
+        )
+    except Exception:
+        # Fall back to old schema if new columns don't exist
+        notifications = await fetch_all(
+            """SELECT id, type, title, message, link, read, created_at 
+               FROM notifications 
+               ORDER BY created_at DESC 
+               LIMIT ?""",
+            (limit,)
+        )
+    
+    result = []
+    for n in notifications:
+        n_dict = dict(n)
+        # Parse action_url from data JSON if available
+        if 'data' in n_dict and n_dict['data']:
+            try:
+                import json
+                data = json.loads(n_dict['data']) if isinstance(n_dict['data'], str) else n_dict['data']
+                n_dict['action_url'] = data.get('action_url', '')
+                # Include read_at for frontend compatibility
+                n_dict['read_at'] = n_dict['created_at'] if n_dict.get('read') else None
+            except:
+                pass
+        result.append(n_dict)
+    
+    return JSONResponse({"notifications": result})
 
 
 @app.get("/api/notifications/count")
 async def get_notification_count():
-    """Get count of unread notifications."""
-    # Try Supabase first
-    supabase = _get_supabase()
+    """Get count of unread notifications (served from the hub's reconciled cache)."""
+    from .services.notification_hub import get_notification_hub
     
-    if supabase:
+    hub = get_notification_hub()
+    counts = await run_read(hub.counts) if hub.is_stale() else hub.counts()
+    return JSONResponse({"unread": counts["unread"], "total": counts["total"]})
+
+
+def _sse(event: dict) -> str:
+    payload = json.dumps({"type": event["type"], "data": event["data"], "counts": event["counts"]}, default=str)
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {payload}\n\n"
+
+
+@app.get("/api/notifications/stream")
+async def stream_notifications(request: Request):
+    """
+    Server-Sent Events stream of notification changes.
+    
+    Replays buffered events after the Last-Event-ID header (sent by
+    EventSource on reconnect) or, when that isn't possible, starts with a
+    ``snapshot`` event carrying the current counts.
+    """
+    import asyncio
+    from fastapi.responses import StreamingResponse
+    from .services.notification_hub import get_notification_hub, DEFAULT_USER
+    
+    hub = get_notification_hub()
+    last_event_id = request.headers.get("last-event-id") or request.query_params.get("last_event_id")
+    keepalive = 15.0
+    
+    async def event_stream():
+        # Subscribe before replaying so nothing published in between is lost
+        queue = hub.subscribe()
         try:
-            # Count unread (read_at is null)
-            unread_result = supabase.table("notifications").select("id", count="exact").is_("read_at", "null").execute()
-            unread = unread_result.count or 0
-            
-            # Count total non-actioned (actioned_at is null)
-            total_result = supabase.table("notifications").select("id", count="exact").is_("actioned_at", "null").execute()
-            total = total_result.count or 0
+            yield "retry: 5000\n\n"
+            replay = hub.events_since(last_event_id)
+            last_seq = 0
+            if replay is None:
+                # Counts are absolute, so events racing the snapshot are harmless
+                last_seq = hub.last_seq
+                counts = await run_read(hub.counts) if hub.is_stale() else hub.counts()
+                yield _sse({"id": f"{hub.epoch}-{last_seq}", "type": "snapshot", "data": {}, "counts": counts})
+            else:
+                last_seq = hub.seq_of(last_event_id)
+                for event in replay:
+                    last_seq = hub.seq_of(event["id"])
+                    yield _sse(event)
             
-            return JSONResponse({"unread": unread, "total": total})
-        except Exception as e:
-            logger.warning(f"Supabase notification count failed: {e}")
-    
-    # SQLite fallback
-    with connect() as conn:
-        # Check if notifications table exists
-        table_check = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='notifications'"
-        ).fetchone()
-        
-        if not table_check:
-            return JSONResponse({"unread": 0, "total": 0})
-        
-        result = conn.execute(
-            """SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN read = 0 THEN 1 ELSE 0 END) as unread
-               FROM notifications"""
-        ).fetchone()
-        
-        return JSONResponse({
-            "unread": result["unread"] or 0,
-            "total": result["total"] or 0
-        })
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    # Periodic reconcile (shared across streams) picks up writes
+                    # from other workers; emits a count event only on drift
+                    if hub.is_stale():
+                        await run_read(hub.reconcile)
+                    yield ": keepalive\n\n"
+                    continue
+                seq = hub.seq_of(event["id"])
+                if seq <= last_seq or event["user"] != DEFAULT_USER:
+                    continue
+                last_seq = seq
+                yield _sse(event)
+        finally:
+            hub.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.post("/api/notifications/{notification_id}/read")
@@ -1318,26 +1441,27 @@ async def mark_notification_read(notification_id: str):
         try:
             # Supabase uses read_at timestamp instead of read boolean
             supabase.table("notifications").update({"read_at": datetime.now(timezone.utc).isoformat()}).eq("id", notification_id).execute()
+            await run_read(publish_notification_event, "read", {"id": notification_id}, reconcile=True)
             return JSONResponse({"status": "ok"})
         except Exception as e:
             logger.warning(f"Supabase mark read failed: {e}")
     
     # SQLite fallback
-    with connect() as conn:
+    async with transaction() as tx:
         # Check if notifications table exists
-        table_check = conn.execute(
+        table_check = await tx.fetch_one(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='notifications'"
-        ).fetchone()
+        )
         
         if not table_check:
             return JSONResponse({"status": "ok"})
         
-        conn.execute(
+        await tx.execute(
             "UPDATE notifications SET read = 1 WHERE id = ?",
             (notification_id,)
         )
-        conn.commit()
     
+    await run_read(publish_notification_event, "read", {"id": notification_id}, reconcile=True)
     return JSONResponse({"status": "ok"})
 
 
@@ -1352,23 +1476,24 @@ async def mark_all_notifications_read():
         try:
             # Supabase uses read_at timestamp instead of read boolean
             supabase.table("notifications").update({"read_at": datetime.now(timezone.utc).isoformat()}).is_("read_at", "null").execute()
+            publish_notification_event("read_all", unread=0)
             return JSONResponse({"status": "ok"})
         except Exception as e:
             logger.warning(f"Supabase mark all read failed: {e}")
     
     # SQLite fallback
-    with connect() as conn:
+    async with transaction() as tx:
         # Check if notifications table exists
-        table_check = conn.execute(
+        table_check = await tx.fetch_one(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='notifications'"
-        ).fetchone()
+        )
         
         if not table_check:
             return JSONResponse({"status": "ok"})
         
-        conn.execute("UPDATE notifications SET read = 1 WHERE read = 0")
-        conn.commit()
+        await tx.execute("UPDATE notifications SET read = 1 WHERE read = 0")
     
+    publish_notification_event("read_all", unread=0)
     return JSONResponse({"status": "ok"})
 
 
@@ -1381,14 +1506,15 @@ async def delete_notification(notification_id: str):
     if supabase:
         try:
             supabase.table("notifications").delete().eq("id", notification_id).execute()
+            await run_read(publish_notification_event, "deleted", {"id": notification_id}, reconcile=True)
             return JSONResponse({"status": "ok"})
         except Exception as e:
             logger.warning(f"Supabase delete failed: {e}")
     
     # SQLite fallback
-    with connect() as conn:
-        conn.execute("DELETE FROM notifications WHERE id = ?", (notification_id,))
-        conn.commit()
+    async with transaction() as tx:
+        await tx.execute("DELETE FROM notifications WHERE id = ?", (notification_id,))
+    await run_read(publish_notification_event, "deleted", {"id": notification_id}, reconcile=True)
     return JSONResponse({"status": "ok"})
 
 
@@ -1411,15 +1537,21 @@ async def convert_ai_to_action(request: Request):
     if not title:
         title = query[:100] if query else "AI Generated Action Item"
     
-    with connect() as conn:
+    async with transaction() as tx:
         
-        conn.execute(
+        await tx.execute(
             """INSERT INTO tickets (ticket_id, title, description, status, priority, ai_summary, created_at)
                VALUES (?, ?, ?, 'backlog', 'medium', ?, CURRENT_TIMESTAMP)""",
             (ticket_id, title, f"From AI Query: {query}\n\nAI Response:\n{content}", f"AI insight: {content[:150]}...")
         )
-        conn.commit()
-        ticket_db_id = conn.execute("SELECT last_insert_rowid() as id").fetchone()["id"]
+        ticket_db_id = (await tx.fetch_one("SELECT last_insert_rowid() as id"))["id"]
+    
+    # SQLite-only write: update the match index now rather than at its next rebuild
+    from .services.ticket_index import index_ticket_changed
+    index_ticket_changed({
+        "id": ticket_db_id, "ticket_id": ticket_id, "title": title,
+        "description": content, "status": "backlog", "priority": "medium",
+    })
     
     return JSONResponse({"status": "ok", "ticket_id": ticket_id, "ticket_db_id": ticket_db_id})
 
@@ -1481,34 +1613,33 @@ async def get_expected_mode_duration():
     
     result = {}
     
-    with connect() as conn:
-        # Get historical averages from mode_sessions table
-        for mode, default_mins in defaults.items():
-            row = conn.execute("""
-                SELECT 
-                    COUNT(*) as session_count,
-                    AVG(duration_seconds) as avg_seconds,
-                    MIN(duration_seconds) as min_seconds,
-                    MAX(duration_seconds) as max_seconds
-                FROM mode_sessions
-                WHERE mode = ? AND duration_seconds IS NOT NULL AND duration_seconds > 0
-            """, (mode,)).fetchone()
-            
-            session_count = row["session_count"] if row else 0
-            
-            if session_count >= 3:  # Need at least 3 data points to trust the average
-                avg_mins = int((row["avg_seconds"] or 0) / 60)
-                # Use a blend: 70% historical, 30% default (to avoid extreme values)
-                expected_mins = int(avg_mins * 0.7 + default_mins * 0.3)
-            else:
-                expected_mins = default_mins
-            
-            result[mode] = {
-                "expected_minutes": expected_mins,
-                "default_minutes": default_mins,
-                "historical_sessions": session_count,
-                "has_sufficient_data": session_count >= 3,
-            }
+    # Get historical averages from mode_sessions table
+    for mode, default_mins in defaults.items():
+        row = await fetch_one("""
+            SELECT 
+                COUNT(*) as session_count,
+                AVG(duration_seconds) as avg_seconds,
+                MIN(duration_seconds) as min_seconds,
+                MAX(duration_seconds) as max_seconds
+            FROM mode_sessions
+            WHERE mode = ? AND duration_seconds IS NOT NULL AND duration_seconds > 0
+        """, (mode,))
+        
+        session_count = row["session_count"] if row else 0
+        
+        if session_count >= 3:  # Need at least 3 data points to trust the average
+            avg_mins = int((row["avg_seconds"] or 0) / 60)
+            # Use a blend: 70% historical, 30% default (to avoid extreme values)
+            expected_mins = int(avg_mins * 0.7 + default_mins * 0.3)
+        else:
+            expected_mins = default_mins
+        
+        result[mode] = {
+            "expected_minutes": expected_mins,
+            "default_minutes": default_mins,
+            "historical_sessions": session_count,
+            "has_sufficient_data": session_count >= 3,
+        }
     
     return JSONResponse(result)
 
@@ -1677,7 +1808,8 @@ async def run_background_job(job_name: str, request: Request):
     - sprint_mode_detect: Detect suggested workflow mode
     - overdue_encouragement: Send encouraging messages for overdue tasks
     """
-    from src.app.services.background_jobs import run_job, JOB_CONFIGS
+    from src.app.services.background_jobs import JOB_CONFIGS
+    from src.app.services.scheduler import run_tracked
     
     # Get optional run_id from pg_cron trigger
     run_id = request.headers.get("X-Job-Run-Id")
@@ -1691,7 +1823,7 @@ async def run_background_job(job_name: str, request: Request):
         }, status_code=400)
     
     try:
-        result = run_job(job_name)
+        result = run_tracked(job_name, job_name, trigger="http")
         
         return JSONResponse({
             "job_name": job_name,
@@ -1727,15 +1859,23 @@ async def list_background_jobs():
         })
     
     # Get scheduler status if available
+    recent_runs = []
     try:
-        from src.app.services.scheduler import get_scheduler, get_next_job_runs
+        from src.app.services.scheduler import (
+            get_scheduler, get_next_job_runs, get_leader_info, get_job_states, get_job_history,
+        )
+        states = {s["job_id"]: s for s in await run_read(get_job_states)}
+        for job in jobs:
+            job["state"] = [s for job_id, s in states.items() if job_id.startswith(job["name"])]
+        recent_runs = await run_read(get_job_history, None, 20)
         scheduler = get_scheduler()
         if scheduler:
             scheduling_info = {
                 "method": "apscheduler",
-                "description": "Jobs are scheduled via in-app APScheduler",
+                "description": "Jobs are scheduled via in-app APScheduler, executed by the lease holder only",
                 "status": "running" if scheduler.running else "stopped",
                 "next_runs": get_next_job_runs(),
+                "leader": await run_read(get_leader_info),
             }
         else:
             scheduling_info = {
@@ -1752,9 +1892,26 @@ async def list_background_jobs():
     return JSONResponse({
         "jobs": jobs,
         "scheduling": scheduling_info,
+        "recent_runs": recent_runs,
     })
 
 
+@app.get("/api/v1/jobs/{job_name}/history")
+async def get_background_job_history(job_name: str, limit: int = 50):
+    """Execution history (timing, outcome, which worker ran it) for one job."""
+    from src.app.services.background_jobs import JOB_CONFIGS
+    from src.app.services.scheduler import get_job_history
+    
+    if job_name not in JOB_CONFIGS:
+        return JSONResponse({
+            "error": f"Unknown job: {job_name}",
+            "available_jobs": list(JOB_CONFIGS.keys()),
+        }, status_code=400)
+    
+    runs = await run_read(get_job_history, job_name, min(limit, 200))
+    return JSONResponse({"job_name": job_name, "runs": runs})
+
+
 @app.get("/api/v1/tracing/status")
 async def get_tracing_status():
     """Debug endpoint to check LangSmith tracing status."""
@@ -1801,14 +1958,13 @@ async def set_workflow_mode(request: Request):
     data = await request.json()
     mode = data.get("mode", "mode-a")
     
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO settings (key, value, updated_at) 
                VALUES ('current_mode', ?, CURRENT_TIMESTAMP)
                ON CONFLICT(key) DO UPDATE SET value = ?, updated_at = CURRENT_TIMESTAMP""",
             (mode, mode)
         )
-        conn.commit()
     
     return JSONResponse({"status": "ok", "mode": mode})
 
@@ -1816,9 +1972,8 @@ async def set_workflow_mode(request: Request):
 @app.get("/api/settings/mode")
 async def get_workflow_mode():
     """Get the current workflow mode from the database."""
-    with connect() as conn:
-        row = conn.execute("SELECT value FROM settings WHERE key = 'current_mode'").fetchone()
-        mode = row["value"] if row else "mode-a"
+    row = await fetch_one("SELECT value FROM settings WHERE key = 'current_mode'")
+    mode = row["value"] if row else "mode-a"
     
     return JSONResponse({"mode": mode})
 
@@ -1826,9 +1981,8 @@ async def get_workflow_mode():
 @app.get("/api/settings/ai-model")
 async def get_ai_model():
     """Get current AI model setting."""
-    with connect() as conn:
-        row = conn.execute("SELECT value FROM settings WHERE key = 'ai_model'").fetchone()
-        model = row["value"] if row else "gpt-4o-mini"
+    row = await fetch_one("SELECT value FROM settings WHERE key = 'ai_model'")
+    model = row["value"] if row else "gpt-4o-mini"
     
     return JSONResponse({"model": model})
 
@@ -1839,14 +1993,13 @@ async def set_ai_model(request: Request):
     data = await request.json()
     model = data.get("model", "gpt-4o-mini")
     
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO settings (key, value, updated_at) 
                VALUES ('ai_model', ?, CURRENT_TIMESTAMP)
                ON CONFLICT(key) DO UPDATE SET value = ?, updated_at = CURRENT_TIMESTAMP""",
             (model, model)
         )
-        conn.commit()
     
     return JSONResponse({"status": "ok", "model": model})
 
@@ -1862,14 +2015,13 @@ async def save_workflow_progress(request: Request):
     progress_json = json.dumps(progress)
     key = f"workflow_progress_{mode}"
     
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO settings (key, value, updated_at) 
                VALUES (?, ?, CURRENT_TIMESTAMP)
                ON CONFLICT(key) DO UPDATE SET value = ?, updated_at = CURRENT_TIMESTAMP""",
             (key, progress_json, progress_json)
         )
-        conn.commit()
     
     return JSONResponse({"status": "ok", "mode": mode, "progress": progress})
 
@@ -1880,15 +2032,14 @@ async def get_workflow_progress(mode: str):
     import json
     key = f"workflow_progress_{mode}"
     
-    with connect() as conn:
-        row = conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
-        if row:
-            try:
-                progress = json.loads(row["value"])
-            except:
-                progress = []
-        else:
+    row = await fetch_one("SELECT value FROM settings WHERE key = ?", (key,))
+    if row:
+        try:
+            progress = json.loads(row["value"])
+        except:
             progress = []
+    else:
+        progress = []
     
     return JSONResponse({"mode": mode, "progress": progress})
 
@@ -1907,24 +2058,22 @@ async def start_mode_timer(request: Request):
     today = datetime.now().strftime("%Y-%m-%d")
     started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    with connect() as conn:
+    async with transaction() as tx:
         # Check if there's an active session for this mode (no ended_at)
-        active = conn.execute(
+        active = await tx.fetch_one(
             "SELECT id FROM mode_sessions WHERE mode = ? AND ended_at IS NULL",
             (mode,)
-        ).fetchone()
+        )
         
         if active:
             # Already active, return existing session
             return JSONResponse({"status": "already_active", "session_id": active["id"]})
         
         # Create new session
-        cur = conn.execute(
+        session_id = await tx.execute(
             """INSERT INTO mode_sessions (mode, started_at, date) VALUES (?, ?, ?)""",
             (mode, started_at, today)
         )
-        session_id = cur.lastrowid
-        conn.commit()
     
     return JSONResponse({"status": "ok", "session_id": session_id, "started_at": started_at})
 
@@ -1937,12 +2086,12 @@ async def stop_mode_timer(request: Request):
     
     ended_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    with connect() as conn:
+    async with transaction() as tx:
         # Find active session
-        active = conn.execute(
+        active = await tx.fetch_one(
             "SELECT id, started_at FROM mode_sessions WHERE mode = ? AND ended_at IS NULL",
             (mode,)
-        ).fetchone()
+        )
         
         if not active:
             return JSONResponse({"status": "no_active_session"})
@@ -1953,11 +2102,10 @@ async def stop_mode_timer(request: Request):
         duration = int((end_time - start_time).total_seconds())
         
         # Update session
-        conn.execute(
+        await tx.execute(
             """UPDATE mode_sessions SET ended_at = ?, duration_seconds = ? WHERE id = ?""",
             (ended_at, duration, active["id"])
         )
-        conn.commit()
     
     return JSONResponse({
         "status": "ok", 
@@ -1970,21 +2118,20 @@ async def stop_mode_timer(request: Request):
 @app.get("/api/mode-timer/status")
 async def get_mode_timer_status():
     """Get current timer status for all modes."""
-    with connect() as conn:
-        # Get active sessions
-        active_sessions = conn.execute(
-            "SELECT mode, id, started_at FROM mode_sessions WHERE ended_at IS NULL"
-        ).fetchall()
-        
-        active = {}
-        for session in active_sessions:
-            start_time = datetime.strptime(session["started_at"], "%Y-%m-%d %H:%M:%S")
-            elapsed = int((datetime.now() - start_time).total_seconds())
-            active[session["mode"]] = {
-                "session_id": session["id"],
-                "started_at": session["started_at"],
-                "elapsed_seconds": elapsed
-            }
+    # Get active sessions
+    active_sessions = await fetch_all(
+        "SELECT mode, id, started_at FROM mode_sessions WHERE ended_at IS NULL"
+    )
+    
+    active = {}
+    for session in active_sessions:
+        start_time = datetime.strptime(session["started_at"], "%Y-%m-%d %H:%M:%S")
+        elapsed = int((datetime.now() - start_time).total_seconds())
+        active[session["mode"]] = {
+            "session_id": session["id"],
+            "started_at": session["started_at"],
+            "elapsed_seconds": elapsed
+        }
     
     return JSONResponse({"active_sessions": active})
 
@@ -1994,36 +2141,35 @@ async def get_mode_timer_stats(days: int = 7):
     """Get time statistics for all modes."""
     cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
     
-    with connect() as conn:
-        # Get totals and averages for each mode
-        stats = conn.execute(
-            """
-            SELECT 
-                mode,
-                COUNT(*) as session_count,
-                SUM(duration_seconds) as total_seconds,
-                AVG(duration_seconds) as avg_session_seconds
-            FROM mode_sessions
-            WHERE date >= ? AND duration_seconds IS NOT NULL
-            GROUP BY mode
-            """,
-            (cutoff,)
-        ).fetchall()
-        
-        # Get today's totals
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_stats = conn.execute(
-            """
-            SELECT 
-                mode,
-                SUM(duration_seconds) as total_seconds,
-                COUNT(*) as session_count
-            FROM mode_sessions
-            WHERE date = ? AND duration_seconds IS NOT NULL
-            GROUP BY mode
-            """,
-            (today,)
-        ).fetchall()
+    # Get totals and averages for each mode
+    stats = await fetch_all(
+        """
+        SELECT 
+            mode,
+            COUNT(*) as session_count,
+            SUM(duration_seconds) as total_seconds,
+            AVG(duration_seconds) as avg_session_seconds
+        FROM mode_sessions
+        WHERE date >= ? AND duration_seconds IS NOT NULL
+        GROUP BY mode
+        """,
+        (cutoff,)
+    )
+    
+    # Get today's totals
+    today = datetime.now().strftime("%Y-%m-%d")
+    today_stats = await fetch_all(
+        """
+        SELECT 
+            mode,
+            SUM(duration_seconds) as total_seconds,
+            COUNT(*) as session_count
+        FROM mode_sessions
+        WHERE date = ? AND duration_seconds IS NOT NULL
+        GROUP BY mode
+        """,
+        (today,)
+    )
     
     result = {
         "period_days": days,
@@ -2086,11 +2232,12 @@ async def submit_evaluation_feedback(request: Request):
         comment=data.get("comment"),
         correction=data.get("correction"),
         source_info={"type": "api", "user_id": data.get("user_id")},
+        agent_name=data.get("agent_name"),
     )
     
     return JSONResponse({
-        "status": "ok" if feedback_id else "disabled",
-        "feedback_id": feedback_id,
+        "status": "ok" if feedback_id else "recorded_locally",
+        "feedback_id": str(feedback_id) if feedback_id else None,
     })
 
 
@@ -2126,7 +2273,7 @@ async def submit_thumbs_feedback(request: Request):
     )
     
     return JSONResponse({
-        "status": "ok" if feedback_id else "disabled",
+        "status": "ok" if feedback_id else "recorded_locally",
         "feedback_id": str(feedback_id) if feedback_id else None,
     })
 
@@ -2221,7 +2368,7 @@ async def evaluate_dikw_promotion_endpoint(request: Request):
 @app.get("/api/evaluations/summary")
 async def get_evaluation_summary(agent_name: Optional[str] = None, days: int = 7):
     """
-    Get aggregated feedback summary from LangSmith.
+    Get aggregated feedback summary from the local feedback ledger.
     
     Query params:
         agent_name: Filter by agent (optional)
@@ -2234,123 +2381,80 @@ async def get_evaluation_summary(agent_name: Optional[str] = None, days: int = 7
 
 
 @app.get("/api/evaluations/dashboard")
-async def get_evaluation_dashboard():
+async def get_evaluation_dashboard(days: int = 7):
     """
     Get a comprehensive evaluation dashboard with actionable insights.
     
+    Served from the local feedback ledger's daily rollups (an indexed read
+    per day, agent and metric), so it works offline; LangSmith is only
+    needed to open the linked traces.
+    
     Returns:
         - Overall quality scores
         - Improvement suggestions based on low scores
-        - Recent traces with issues
+        - Recent feedback with low scores
         - Recommended actions
     """
-    from src.app.services.evaluations import get_feedback_summary, is_evaluation_enabled
-    
-    if not is_evaluation_enabled():
-        return JSONResponse({
-            "enabled": False,
-            "message": "LangSmith evaluation not configured. Set LANGSMITH_API_KEY to enable."
-        })
+    from src.app.services.evaluations import is_evaluation_enabled
     
     try:
-        from langsmith import Client
-        from datetime import timedelta
-        
-        client = Client()
-        project_name = os.environ.get("LANGSMITH_PROJECT", "signalflow")
-        
-        # Get recent runs with low scores
-        start_time = datetime.now() - timedelta(days=7)
-        
-        runs = list(client.list_runs(
-            project_name=project_name,
-            start_time=start_time,
-            limit=100,
-        ))
-        
-        # Analyze runs
-        total_runs = len(runs)
-        runs_with_feedback = 0
-        low_score_runs = []
-        score_breakdown = {}
-        
-        for run in runs:
-            if run.feedback_stats:
-                runs_with_feedback += 1
-                for key, stats in run.feedback_stats.items():
-                    if key not in score_breakdown:
-                        score_breakdown[key] = {"scores": [], "count": 0}
-                    score_breakdown[key]["count"] += stats.get('n', 0)
-                    if stats.get('avg') is not None:
-                        score_breakdown[key]["scores"].append(stats['avg'])
-                        # Track low-scoring runs
-                        if stats['avg'] < 0.6:
-                            low_score_runs.append({
-                                "run_id": str(run.id),
-                                "name": run.name,
-                                "metric": key,
-                                "score": stats['avg'],
-                                "created_at": run.start_time.isoformat() if run.start_time else None,
-                            })
-        
-        # Calculate averages and generate insights
-        insights = []
-        for key, data in score_breakdown.items():
-            avg = sum(data["scores"]) / len(data["scores"]) if data["scores"] else None
-            score_breakdown[key]["average"] = round(avg, 3) if avg else None
-            
-            if avg and avg < 0.6:
-                if key == "helpfulness":
-                    insights.append({
-                        "metric": key,
-                        "score": round(avg, 3),
-                        "severity": "high" if avg < 0.4 else "medium",
-                        "recommendation": "Responses may not be addressing user needs. Review prompts to ensure they focus on actionable, relevant answers.",
-                        "action": "Review system prompts for clarity and user focus",
-                    })
-                elif key == "relevance":
-                    insights.append({
-                        "metric": key,
-                        "score": round(avg, 3),
-                        "severity": "high" if avg < 0.4 else "medium",
-                        "recommendation": "Responses may be off-topic. Ensure context is properly passed to agents.",
-                        "action": "Check context retrieval and prompt engineering",
-                    })
-                elif key == "accuracy":
-                    insights.append({
-                        "metric": key,
-                        "score": round(avg, 3),
-                        "severity": "high" if avg < 0.4 else "medium",
-                        "recommendation": "Factual accuracy issues detected. Consider adding RAG or fact-checking.",
-                        "action": "Add source verification or ground truth checks",
-                    })
-        
-        return JSONResponse({
-            "enabled": True,
-            "project": project_name,
-            "period_days": 7,
-            "stats": {
-                "total_runs": total_runs,
-                "runs_with_feedback": runs_with_feedback,
-                "evaluation_coverage": f"{(runs_with_feedback/total_runs*100):.1f}%" if total_runs else "0%",
-            },
-            "scores": {k: {"average": v["average"], "count": v["count"]} for k, v in score_breakdown.items()},
-            "insights": insights,
-            "low_score_runs": low_score_runs[:10],  # Top 10 issues
-            "recommended_actions": [
-                "Add thumbs up/down buttons to UI for user feedback",
-                "Review low-scoring traces in LangSmith",
-                "Update prompts based on feedback patterns",
-            ] if insights else [
-                "Quality looks good! Consider adding more evaluation dimensions.",
-            ],
-        })
-        
+        dashboard = await run_read(feedback_ledger.get_dashboard, days)
     except Exception as e:
         return JSONResponse({
             "enabled": True,
             "error": str(e),
         })
+    
+    # Generate insights from low average scores
+    insights = []
+    for key, data in dashboard["scores"].items():
+        avg = data["average_score"]
+        if avg is not None and avg < feedback_ledger.LOW_SCORE:
+            if key == "helpfulness":
+                insights.append({
+                    "metric": key,
+                    "score": round(avg, 3),
+                    "severity": "high" if avg < 0.4 else "medium",
+                    "recommendation": "Responses may not be addressing user needs. Review prompts to ensure they focus on actionable, relevant answers.",
+                    "action": "Review system prompts for clarity and user focus",
+                })
+            elif key == "relevance":
+                insights.append({
+                    "metric": key,
+                    "score": round(avg, 3),
+                    "severity": "high" if avg < 0.4 else "medium",
+                    "recommendation": "Responses may be off-topic. Ensure context is properly passed to agents.",
+                    "action": "Check context retrieval and prompt engineering",
+                })
+            elif key == "accuracy":
+                insights.append({
+                    "metric": key,
+                    "score": round(avg, 3),
+                    "severity": "high" if avg < 0.4 else "medium",
+                    "recommendation": "Factual accuracy issues detected. Consider adding RAG or fact-checking.",
+                    "action": "Add source verification or ground truth checks",
+                })
+    
+    langsmith_enabled = is_evaluation_enabled()
+    return JSONResponse({
+        "enabled": True,
+        "langsmith_enabled": langsmith_enabled,
+        "project": os.environ.get("LANGSMITH_PROJECT", "signalflow"),
+        "period_days": days,
+        "stats": dashboard["stats"],
+        "scores": {k: {"average": v["average_score"], "count": v["count"]} for k, v in dashboard["scores"].items()},
+        "by_agent": dashboard["by_agent"],
+        "daily": dashboard["daily"],
+        "insights": insights,
+        "low_score_runs": dashboard["low_score_events"],
+        "recommended_actions": [
+            "Add thumbs up/down buttons to UI for user feedback",
+            "Review low-scoring traces in LangSmith" if langsmith_enabled else "Set LANGSMITH_API_KEY to trace and review low-scoring runs",
+            "Update prompts based on feedback patterns",
+        ] if insights else [
+            "Quality looks good! Consider adding more evaluation dimensions.",
+        ],
+    })
 
 
 # ============================================
@@ -2402,39 +2506,38 @@ async def get_workflow_progress_report():
     """Get workflow mode progress for reporting."""
     import json as json_module
     
-    with connect() as conn:
-        modes = conn.execute(
-            "SELECT * FROM workflow_modes WHERE is_active = 1 ORDER BY sort_order"
-        ).fetchall()
+    modes = await fetch_all(
+        "SELECT * FROM workflow_modes WHERE is_active = 1 ORDER BY sort_order"
+    )
+    
+    result = []
+    for mode in modes:
+        steps = json_module.loads(mode["steps_json"]) if mode["steps_json"] else []
+        total_steps = len(steps)
         
-        result = []
-        for mode in modes:
-            steps = json_module.loads(mode["steps_json"]) if mode["steps_json"] else []
-            total_steps = len(steps)
-            
-            # Get progress from settings
-            progress_row = conn.execute(
-                "SELECT value FROM settings WHERE key = ?",
-                (f"workflow_progress_{mode['mode_key']}",)
-            ).fetchone()
-            
-            completed = 0
-            if progress_row:
-                try:
-                    progress = json_module.loads(progress_row["value"])
-                    completed = sum(1 for p in progress if p)
-                except:
-                    pass
-            
-            result.append({
-                "mode_key": mode["mode_key"],
-                "name": mode["name"],
-                "icon": mode["icon"],
-                "total_steps": total_steps,
-                "progress": completed
-            })
+        # Get progress from settings
+        progress_row = await fetch_one(
+            "SELECT value FROM settings WHERE key = ?",
+            (f"workflow_progress_{mode['mode_key']}",)
+        )
+        
+        completed = 0
+        if progress_row:
+            try:
+                progress = json_module.loads(progress_row["value"])
+                completed = sum(1 for p in progress if p)
+            except:
+                pass
         
-        return JSONResponse({"modes": result})
+        result.append({
+            "mode_key": mode["mode_key"],
+            "name": mode["name"],
+            "icon": mode["icon"],
+            "total_steps": total_steps,
+            "progress": completed
+        })
+    
+    return JSONResponse({"modes": result})
 
 
 @app.get("/api/reports/daily")
@@ -2442,45 +2545,44 @@ async def get_daily_report(days: int = 14):
     """Get daily breakdown for reporting."""
     cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
     
-    with connect() as conn:
-        # Get daily time tracking
-        daily_time = conn.execute(
-            """
-            SELECT date, 
-                   SUM(duration_seconds) as total_seconds,
-                   COUNT(*) as sessions
-            FROM mode_sessions
-            WHERE date >= ? AND duration_seconds IS NOT NULL
-            GROUP BY date
-            ORDER BY date DESC
-            """,
-            (cutoff,)
-        ).fetchall()
-        
-        # Get daily signal counts from Supabase
-        daily_signals = {}
-        meetings = meetings_supabase.get_meetings_with_signals_in_range(days=days)
-        
-        for m in meetings:
-            date = m.get("meeting_date") or m.get("created_at", "")[:10]
-            if date:
-                try:
-                    signals = m.get("signals", {})
-                    count = sum(len(signals.get(k, [])) for k in ["decisions", "action_items", "blockers", "risks", "ideas"])
-                    daily_signals[date] = daily_signals.get(date, 0) + count
-                except:
-                    pass
-        
-        result = []
-        for row in daily_time:
-            result.append({
-                "date": row["date"],
-                "total_seconds": row["total_seconds"] or 0,
-                "sessions": row["sessions"],
-                "signals": daily_signals.get(row["date"], 0)
-            })
-        
-        return JSONResponse({"daily": result})
+    # Get daily time tracking
+    daily_time = await fetch_all(
+        """
+        SELECT date, 
+               SUM(duration_seconds) as total_seconds,
+               COUNT(*) as sessions
+        FROM mode_sessions
+        WHERE date >= ? AND duration_seconds IS NOT NULL
+        GROUP BY date
+        ORDER BY date DESC
+        """,
+        (cutoff,)
+    )
+    
+    # Get daily signal counts from Supabase
+    daily_signals = {}
+    meetings = meetings_supabase.get_meetings_with_signals_in_range(days=days)
+    
+    for m in meetings:
+        date = m.get("meeting_date") or m.get("created_at", "")[:10]
+        if date:
+            try:
+                signals = m.get("signals", {})
+                count = sum(len(signals.get(k, [])) for k in ["decisions", "action_items", "blockers", "risks", "ideas"])
+                daily_signals[date] = daily_signals.get(date, 0) + count
+            except:
+                pass
+    
+    result = []
+    for row in daily_time:
+        result.append({
+            "date": row["date"],
+            "total_seconds": row["total_seconds"] or 0,
+            "sessions": row["sessions"],
+            "signals": daily_signals.get(row["date"], 0)
+        })
+    
+    return JSONResponse({"daily": result})
 
 
 # Sprint burndown cache to avoid recomputing on rapid mode changes
@@ -2498,21 +2600,20 @@ async def get_sprint_burndown(force: bool = False):
     if not force and _sprint_burndown_cache["data"] and (now - _sprint_burndown_cache["timestamp"]) < SPRINT_BURNDOWN_CACHE_TTL:
         return JSONResponse(_sprint_burndown_cache["data"])
     
-    with connect() as conn:
-        # Get sprint settings for jeopardy calculation
-        sprint_settings = conn.execute("SELECT * FROM sprint_settings WHERE id = 1").fetchone()
-        working_days_remaining = None
-        sprint_total_days = 14
-        sprint_day = None
-        
-        if sprint_settings:
-            from datetime import datetime, timedelta
-            sprint_start = datetime.strptime(sprint_settings["sprint_start_date"], "%Y-%m-%d")
-            sprint_total_days = sprint_settings["sprint_length_days"] or 14
-            sprint_day = (datetime.now() - sprint_start).days + 1
-            days_remaining = sprint_total_days - sprint_day
-            # Estimate working days (exclude weekends roughly)
-            working_days_remaining = max(0, int(days_remaining * 5 / 7))
+    # Get sprint settings for jeopardy calculation
+    sprint_settings = await fetch_one("SELECT * FROM sprint_settings WHERE id = 1")
+    working_days_remaining = None
+    sprint_total_days = 14
+    sprint_day = None
+    
+    if sprint_settings:
+        from datetime import datetime, timedelta
+        sprint_start = datetime.strptime(sprint_settings["sprint_start_date"], "%Y-%m-%d")
+        sprint_total_days = sprint_settings["sprint_length_days"] or 14
+        sprint_day = (datetime.now() - sprint_start).days + 1
+        days_remaining = sprint_total_days - sprint_day
+        # Estimate working days (exclude weekends roughly)
+        working_days_remaining = max(0, int(days_remaining * 5 / 7))
     
     # Get all active tickets assigned to sprint from Supabase
     tickets = tickets_supabase.get_active_sprint_tickets()
@@ -2709,186 +2810,185 @@ async def get_weekly_intelligence():
         
         meetings_data.append(meeting_info)
     
-    with connect() as conn:
-        # =====================================================================
-        # DIKW PYRAMID ACTIVITY (using dikw_items table)
-        # =====================================================================
-        dikw_items = conn.execute(
-            """
-            SELECT level, COUNT(*) as count,
-                   SUM(CASE WHEN created_at >= ? THEN 1 ELSE 0 END) as new_this_week
-            FROM dikw_items
-            WHERE status = 'active'
-            GROUP BY level
-            ORDER BY 
-                CASE level 
-                    WHEN 'wisdom' THEN 1 
-                    WHEN 'knowledge' THEN 2 
-                    WHEN 'information' THEN 3 
-                    WHEN 'data' THEN 4 
-                END
-            """,
-            (week_start,)
-        ).fetchall()
-        
-        dikw_summary = {
-            row["level"]: {"total": row["count"], "new": row["new_this_week"] or 0}
-            for row in dikw_items
+    # =====================================================================
+    # DIKW PYRAMID ACTIVITY (using dikw_items table)
+    # =====================================================================
+    dikw_items = await fetch_all(
+        """
+        SELECT level, COUNT(*) as count,
+               SUM(CASE WHEN created_at >= ? THEN 1 ELSE 0 END) as new_this_week
+        FROM dikw_items
+        WHERE status = 'active'
+        GROUP BY level
+        ORDER BY 
+            CASE level 
+                WHEN 'wisdom' THEN 1 
+                WHEN 'knowledge' THEN 2 
+                WHEN 'information' THEN 3 
+                WHEN 'data' THEN 4 
+            END
+        """,
+        (week_start,)
+    )
+    
+    dikw_summary = {
+        row["level"]: {"total": row["count"], "new": row["new_this_week"] or 0}
+        for row in dikw_items
+    }
+    
+    # Recent wisdom/knowledge items (high value)
+    high_value_dikw = await fetch_all(
+        """
+        SELECT id, level, content, summary, tags
+        FROM dikw_items
+        WHERE level IN ('wisdom', 'knowledge') AND status = 'active'
+        ORDER BY created_at DESC
+        LIMIT 5
+        """
+    )
+    
+    # =====================================================================
+    # TICKET/SPRINT PROGRESS (from Supabase)
+    # =====================================================================
+    sprint_overview = tickets_supabase.get_sprint_ticket_stats()
+    if not sprint_overview:
+        sprint_overview = {
+            "todo": {"count": 0, "points": 0},
+            "in_progress": {"count": 0, "points": 0},
+            "in_review": {"count": 0, "points": 0},
+            "blocked": {"count": 0, "points": 0},
+            "done": {"count": 0, "points": 0}
         }
-        
-        # Recent wisdom/knowledge items (high value)
-        high_value_dikw = conn.execute(
-            """
-            SELECT id, level, content, summary, tags
-            FROM dikw_items
-            WHERE level IN ('wisdom', 'knowledge') AND status = 'active'
-            ORDER BY created_at DESC
-            LIMIT 5
-            """
-        ).fetchall()
-        
-        # =====================================================================
-        # TICKET/SPRINT PROGRESS (from Supabase)
-        # =====================================================================
-        sprint_overview = tickets_supabase.get_sprint_ticket_stats()
-        if not sprint_overview:
-            sprint_overview = {
-                "todo": {"count": 0, "points": 0},
-                "in_progress": {"count": 0, "points": 0},
-                "in_review": {"count": 0, "points": 0},
-                "blocked": {"count": 0, "points": 0},
-                "done": {"count": 0, "points": 0}
-            }
-        
-        # Blocked tickets need attention
-        blocked_tickets = tickets_supabase.get_blocked_sprint_tickets(limit=5)
-        
-        # =====================================================================
-        # ACTION ITEMS DUE SOON (from accountability_items table)
-        # =====================================================================
-        recent_actions = conn.execute(
-            """
-            SELECT id, description as content, source_ref_id as meeting_id, status, created_at
-            FROM accountability_items
-            WHERE status != 'complete'
-            ORDER BY created_at DESC
-            LIMIT 10
-            """
-        ).fetchall()
-        
-        # =====================================================================
-        # CAREER STANDUPS (from standup_updates table)
-        # =====================================================================
-        standups = conn.execute(
-            """
-            SELECT id, standup_date, content, feedback, sentiment, key_themes, created_at
-            FROM standup_updates
-            WHERE standup_date >= ?
-            ORDER BY standup_date DESC
-            LIMIT 7
-            """,
-            (week_start,)
-        ).fetchall()
-        
-        standups_data = [
-            {
-                "id": s["id"],
-                "date": s["standup_date"],
-                "content": s["content"][:100] + "..." if s["content"] and len(s["content"]) > 100 else s["content"],
-                "sentiment": s["sentiment"],
-                "key_themes": s["key_themes"],
-                "has_feedback": bool(s["feedback"])
-            }
-            for s in standups
-        ]
-        
-        # =====================================================================
-        # TIME TRACKING SUMMARY
-        # =====================================================================
-        time_by_mode = conn.execute(
-            """
-            SELECT mode, SUM(duration_seconds) as total_seconds, COUNT(*) as sessions
-            FROM mode_sessions
-            WHERE date >= ? AND duration_seconds IS NOT NULL
-            GROUP BY mode
-            ORDER BY total_seconds DESC
-            """,
-            (week_start,)
-        ).fetchall()
-        
-        time_summary = [
-            {
-                "mode": row["mode"],
-                "total_hours": round(row["total_seconds"] / 3600, 1),
-                "sessions": row["sessions"]
-            }
-            for row in time_by_mode
-        ]
-        
-        # =====================================================================
-        # BUILD RESPONSE
-        # =====================================================================
-        return JSONResponse({
-            "period": {
-                "start": week_start,
-                "end": today
-            },
-            "meetings": {
-                "count": len(meetings_data),
-                "list": meetings_data[:10],
-                "total_signals": len(all_decisions) + len(all_actions) + len(all_blockers) + len(all_risks) + len(all_ideas)
-            },
-            "signals": {
-                "decisions": all_decisions[:5],
-                "decisions_count": len(all_decisions),
-                "action_items": all_actions[:5],
-                "action_items_count": len(all_actions),
-                "blockers": all_blockers[:5],
-                "blockers_count": len(all_blockers),
-                "risks": all_risks[:3],
-                "risks_count": len(all_risks),
-                "ideas": all_ideas[:3],
-                "ideas_count": len(all_ideas)
-            },
-            "dikw": {
-                "summary": dikw_summary,
-                "high_value_items": [
-                    {
-                        "id": item["id"],
-                        "level": item["level"],
-                        "content": item["content"][:200] + "..." if len(item["content"] or "") > 200 else item["content"],
-                        "summary": item["summary"],
-                        "tags": item["tags"]
-                    }
-                    for item in high_value_dikw
-                ]
-            },
-            "sprint": {
-                "overview": sprint_overview,
-                "blocked_tickets": [
-                    {
-                        "id": t["id"],
-                        "ticket_id": t["ticket_id"],
-                        "title": t["title"]
-                    }
-                    for t in blocked_tickets
-                ]
-            },
-            "action_items_pending": [
+    
+    # Blocked tickets need attention
+    blocked_tickets = tickets_supabase.get_blocked_sprint_tickets(limit=5)
+    
+    # =====================================================================
+    # ACTION ITEMS DUE SOON (from accountability_items table)
+    # =====================================================================
+    recent_actions = await fetch_all(
+        """
+        SELECT id, description as content, source_ref_id as meeting_id, status, created_at
+        FROM accountability_items
+        WHERE status != 'complete'
+        ORDER BY created_at DESC
+        LIMIT 10
+        """
+    )
+    
+    # =====================================================================
+    # CAREER STANDUPS (from standup_updates table)
+    # =====================================================================
+    standups = await fetch_all(
+        """
+        SELECT id, standup_date, content, feedback, sentiment, key_themes, created_at
+        FROM standup_updates
+        WHERE standup_date >= ?
+        ORDER BY standup_date DESC
+        LIMIT 7
+        """,
+        (week_start,)
+    )
+    
+    standups_data = [
+        {
+            "id": s["id"],
+            "date": s["standup_date"],
+            "content": s["content"][:100] + "..." if s["content"] and len(s["content"]) > 100 else s["content"],
+            "sentiment": s["sentiment"],
+            "key_themes": s["key_themes"],
+            "has_feedback": bool(s["feedback"])
+        }
+        for s in standups
+    ]
+    
+    # =====================================================================
+    # TIME TRACKING SUMMARY
+    # =====================================================================
+    time_by_mode = await fetch_all(
+        """
+        SELECT mode, SUM(duration_seconds) as total_seconds, COUNT(*) as sessions
+        FROM mode_sessions
+        WHERE date >= ? AND duration_seconds IS NOT NULL
+        GROUP BY mode
+        ORDER BY total_seconds DESC
+        """,
+        (week_start,)
+    )
+    
+    time_summary = [
+        {
+            "mode": row["mode"],
+            "total_hours": round(row["total_seconds"] / 3600, 1),
+            "sessions": row["sessions"]
+        }
+        for row in time_by_mode
+    ]
+    
+    # =====================================================================
+    # BUILD RESPONSE
+    # =====================================================================
+    return JSONResponse({
+        "period": {
+            "start": week_start,
+            "end": today
+        },
+        "meetings": {
+            "count": len(meetings_data),
+            "list": meetings_data[:10],
+            "total_signals": len(all_decisions) + len(all_actions) + len(all_blockers) + len(all_risks) + len(all_ideas)
+        },
+        "signals": {
+            "decisions": all_decisions[:5],
+            "decisions_count": len(all_decisions),
+            "action_items": all_actions[:5],
+            "action_items_count": len(all_actions),
+            "blockers": all_blockers[:5],
+            "blockers_count": len(all_blockers),
+            "risks": all_risks[:3],
+            "risks_count": len(all_risks),
+            "ideas": all_ideas[:3],
+            "ideas_count": len(all_ideas)
+        },
+        "dikw": {
+            "summary": dikw_summary,
+            "high_value_items": [
                 {
-                    "id": a["id"],
-                    "content": a["content"][:150] + "..." if len(a["content"] or "") > 150 else a["content"],
-                    "meeting_id": a["meeting_id"],
-                    "created": a["created_at"]
+                    "id": item["id"],
+                    "level": item["level"],
+                    "content": item["content"][:200] + "..." if len(item["content"] or "") > 200 else item["content"],
+                    "summary": item["summary"],
+                    "tags": item["tags"]
                 }
-                for a in recent_actions
-            ],
-            "standups": {
-                "count": len(standups_data),
-                "list": standups_data
-            },
-            "time_tracking": time_summary
-        })
+                for item in high_value_dikw
+            ]
+        },
+        "sprint": {
+            "overview": sprint_overview,
+            "blocked_tickets": [
+                {
+                    "id": t["id"],
+                    "ticket_id": t["ticket_id"],
+                    "title": t["title"]
+                }
+                for t in blocked_tickets
+            ]
+        },
+        "action_items_pending": [
+            {
+                "id": a["id"],
+                "content": a["content"][:150] + "..." if len(a["content"] or "") > 150 else a["content"],
+                "meeting_id": a["meeting_id"],
+                "created": a["created_at"]
+            }
+            for a in recent_actions
+        ],
+        "standups": {
+            "count": len(standups_data),
+            "list": standups_data
+        },
+        "time_tracking": time_summary
+    })
 
 
 @app.post("/api/mode-timer/calculate-stats")
@@ -2897,10 +2997,10 @@ async def calculate_mode_statistics():
     today = datetime.now().strftime("%Y-%m-%d")
     week_start = (datetime.now() - timedelta(days=datetime.now().weekday())).strftime("%Y-%m-%d")
     
-    with connect() as conn:
+    async with transaction() as tx:
         # Calculate daily stats
         for mode in ['grooming', 'planning', 'standup', 'implementation']:
-            daily = conn.execute(
+            daily = await tx.fetch_one(
                 """
                 SELECT 
                     SUM(duration_seconds) as total,
@@ -2910,10 +3010,10 @@ async def calculate_mode_statistics():
                 WHERE mode = ? AND date = ? AND duration_seconds IS NOT NULL
                 """,
                 (mode, today)
-            ).fetchone()
+            )
             
             if daily["total"]:
-                conn.execute(
+                await tx.execute(
                     """INSERT INTO mode_statistics (mode, stat_type, period, total_seconds, session_count, avg_session_seconds)
                        VALUES (?, 'daily', ?, ?, ?, ?)
                        ON CONFLICT(mode, stat_type, period) DO UPDATE SET
@@ -2923,7 +3023,7 @@ async def calculate_mode_statistics():
                 )
             
             # Calculate weekly stats
-            weekly = conn.execute(
+            weekly = await tx.fetch_one(
                 """
                 SELECT 
                     SUM(duration_seconds) as total,
@@ -2933,10 +3033,10 @@ async def calculate_mode_statistics():
                 WHERE mode = ? AND date >= ? AND duration_seconds IS NOT NULL
                 """,
                 (mode, week_start)
-            ).fetchone()
+            )
             
             if weekly["total"]:
-                conn.execute(
+                await tx.execute(
                     """INSERT INTO mode_statistics (mode, stat_type, period, total_seconds, session_count, avg_session_seconds)
                        VALUES (?, 'weekly', ?, ?, ?, ?)
                        ON CONFLICT(mode, stat_type, period) DO UPDATE SET
@@ -2945,7 +3045,6 @@ async def calculate_mode_statistics():
                      weekly["total"], weekly["count"], int(weekly["avg"] or 0))
                 )
         
-        conn.commit()
     
     return JSONResponse({"status": "ok", "calculated_at": datetime.now().isoformat()})
 
@@ -2964,6 +3063,7 @@ async def update_user_status(request: Request):
     """
     # Lazy import for backward compatibility
     from .agents.arjuna import interpret_user_status_adapter
+    from .agents.runtime import ClientDisconnected, run_cancellable
     
     data = await request.json()
     status_text = data.get("status", "").strip()
@@ -2972,52 +3072,54 @@ async def update_user_status(request: Request):
         return JSONResponse({"error": "Status text required"}, status_code=400)
     
     # Use ArjunaAgent adapter for AI interpretation
-    interpreted = await interpret_user_status_adapter(status_text)
+    try:
+        interpreted = await run_cancellable(interpret_user_status_adapter(status_text), request)
+    except ClientDisconnected:
+        return JSONResponse({"error": "Request cancelled"}, status_code=499)
+    except TimeoutError:
+        interpreted = {}
     mode = interpreted.get("mode", "implementation")
     activity = interpreted.get("activity", status_text)
     context_str = interpreted.get("context", "")
     
     # Save status
-    with connect() as conn:
+    async with transaction() as tx:
         # Mark all previous statuses as not current
-        conn.execute("UPDATE user_status SET is_current = 0")
+        await tx.execute("UPDATE user_status SET is_current = 0")
         
         # Insert new status
-        conn.execute("""
+        await tx.execute("""
             INSERT INTO user_status (status_text, interpreted_mode, interpreted_activity, interpreted_context)
             VALUES (?, ?, ?, ?)
         """, (status_text, mode, activity, context_str))
-        conn.commit()
     
     # Auto-start timer for the interpreted mode
     # First stop any active timers
-    with connect() as conn:
-        active = conn.execute(
+    async with transaction() as tx:
+        active = await tx.fetch_all(
             "SELECT mode FROM mode_sessions WHERE ended_at IS NULL"
-        ).fetchall()
+        )
         
         for session in active:
             # Stop the active session
             ended_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            conn.execute("""
+            await tx.execute("""
                 UPDATE mode_sessions 
                 SET ended_at = ?, 
                     duration_seconds = CAST((julianday(?) - julianday(started_at)) * 86400 AS INTEGER)
                 WHERE mode = ? AND ended_at IS NULL
             """, (ended_at, ended_at, session["mode"]))
         
-        conn.commit()
     
     # Start new timer
     today = datetime.now().strftime("%Y-%m-%d")
     started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO mode_sessions (mode, started_at, date, notes) VALUES (?, ?, ?, ?)""",
             (mode, started_at, today, activity)
         )
-        conn.commit()
     
     return JSONResponse({
         "status": "ok",
@@ -3032,10 +3134,9 @@ async def update_user_status(request: Request):
 @app.get("/api/user-status/current")
 async def get_current_status():
     """Get current user status."""
-    with connect() as conn:
-        status = conn.execute(
-            "SELECT * FROM user_status WHERE is_current = 1 ORDER BY created_at DESC LIMIT 1"
-        ).fetchone()
+    status = await fetch_one(
+        "SELECT * FROM user_status WHERE is_current = 1 ORDER BY created_at DESC LIMIT 1"
+    )
     
     if not status:
         return JSONResponse({"status": None})
@@ -3064,25 +3165,24 @@ DIKW_NEXT_LEVEL = {'data': 'information', 'information': 'knowledge', 'knowledge
 @app.get("/api/dikw")
 async def get_dikw_items(level: str = None, status: str = "active"):
     """Get DIKW items, optionally filtered by level."""
-    with connect() as conn:
-        if level:
-            items = conn.execute(
-                """SELECT d.*, m.meeting_name, m.meeting_date 
-                   FROM dikw_items d 
-                   LEFT JOIN meeting_summaries m ON d.meeting_id = m.id
-                   WHERE d.level = ? AND d.status = ? 
-                   ORDER BY d.created_at DESC""",
-                (level, status)
-            ).fetchall()
-        else:
-            items = conn.execute(
-                """SELECT d.*, m.meeting_name, m.meeting_date 
-                   FROM dikw_items d 
-                   LEFT JOIN meeting_summaries m ON d.meeting_id = m.id
-                   WHERE d.status = ? 
-                   ORDER BY d.level, d.created_at DESC""",
-                (status,)
-            ).fetchall()
+    if level:
+        items = await fetch_all(
+            """SELECT d.*, m.meeting_name, m.meeting_date 
+               FROM dikw_items d 
+               LEFT JOIN meeting_summaries m ON d.meeting_id = m.id
+               WHERE d.level = ? AND d.status = ? 
+               ORDER BY d.created_at DESC""",
+            (level, status)
+        )
+    else:
+        items = await fetch_all(
+            """SELECT d.*, m.meeting_name, m.meeting_date 
+               FROM dikw_items d 
+               LEFT JOIN meeting_summaries m ON d.meeting_id = m.id
+               WHERE d.status = ? 
+               ORDER BY d.level, d.created_at DESC""",
+            (status,)
+        )
     
     # Group by level for pyramid view
     pyramid = {level: [] for level in DIKW_LEVELS}
@@ -3108,7 +3208,7 @@ async def promote_signal_to_dikw(request: Request):
     Lazy imports ensure backward compatibility.
     """
     # Lazy import for backward compatibility
-    from .agents.dikw_synthesizer import ai_summarize_dikw_adapter, generate_dikw_tags
+    from .agents.dikw_synthesizer import ai_summarize_dikw_adapter, generate_dikw_tags_adapter
     
     data = await request.json()
     signal_text = data.get("signal_text", "")
@@ -3126,27 +3226,25 @@ async def promote_signal_to_dikw(request: Request):
         summary = signal_text[:200]
     
     # Auto-generate tags based on content and signal type
-    tags = generate_dikw_tags(signal_text, target_level, signal_type)
+    tags = await generate_dikw_tags_adapter(signal_text, target_level, signal_type)
     
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO dikw_items 
                (level, content, summary, source_type, original_signal_type, meeting_id, validation_count, tags)
                VALUES (?, ?, ?, 'signal', ?, ?, 1, ?)""",
             (target_level, signal_text, summary, signal_type, meeting_id, tags)
         )
-        conn.commit()
-        item_id = conn.execute("SELECT last_insert_rowid() as id").fetchone()["id"]
+        item_id = (await tx.fetch_one("SELECT last_insert_rowid() as id"))["id"]
         
         # Also update signal_status to mark as promoted
-        conn.execute(
+        await tx.execute(
             """INSERT INTO signal_status (meeting_id, signal_type, signal_text, status, converted_to, converted_ref_id)
                VALUES (?, ?, ?, 'approved', 'dikw', ?)
                ON CONFLICT(meeting_id, signal_type, signal_text) 
                DO UPDATE SET status = 'approved', converted_to = 'dikw', converted_ref_id = ?, updated_at = CURRENT_TIMESTAMP""",
             (meeting_id, signal_type, signal_text, item_id, item_id)
         )
-        conn.commit()
     
     return JSONResponse({"status": "ok", "id": item_id, "level": target_level, "tags": tags})
 
@@ -3160,7 +3258,7 @@ async def promote_dikw_item(request: Request):
     Lazy imports ensure backward compatibility.
     """
     # Lazy import for backward compatibility
-    from .agents.dikw_synthesizer import ai_promote_dikw_adapter, generate_dikw_tags
+    from .agents.dikw_synthesizer import ai_promote_dikw_adapter, generate_dikw_tags_adapter
     
     data = await request.json()
     item_id = data.get("item_id")
@@ -3171,45 +3269,53 @@ async def promote_dikw_item(request: Request):
     if not item_id:
         return JSONResponse({"error": "Item ID is required"}, status_code=400)
     
-    with connect() as conn:
-        item = conn.execute("SELECT * FROM dikw_items WHERE id = ?", (item_id,)).fetchone()
-        
-        if not item:
+    # Reads and LLM calls stay outside the transaction so the write lock is held only for the writes
+    item = await fetch_one("SELECT * FROM dikw_items WHERE id = ?", (item_id,))
+    
+    if not item:
+        return JSONResponse({"error": "Item not found"}, status_code=404)
+    
+    current_level = item['level']
+    if current_level == 'wisdom' and not to_level:
+        return JSONResponse({"error": "Already at highest level"}, status_code=400)
+    
+    # Use provided target level or default to next level
+    next_level = to_level if to_level else DIKW_NEXT_LEVEL.get(current_level, 'wisdom')
+    
+    # Use provided content or keep original
+    new_content = promoted_content if promoted_content else item['content']
+    
+    # Generate AI synthesis for summary if not provided
+    if provided_summary:
+        new_summary = provided_summary
+    else:
+        # Use DIKWSynthesizerAgent adapter for AI promotion
+        try:
+            result = await ai_promote_dikw_adapter(new_content, current_level, next_level)
+            new_summary = result.get('summary', f"Promoted from {current_level}: {item['summary'] or ''}")
+        except Exception:
+            new_summary = f"Promoted from {current_level}: {item['summary'] or ''}"
+    
+    # Normalize confidence (handle both 0-1 and 0-100 ranges)
+    current_confidence = item['confidence'] or 70
+    if current_confidence <= 1:
+        current_confidence = current_confidence * 100
+    new_confidence = min(95, current_confidence + 5)  # Slight boost on promotion
+    
+    # Auto-generate tags for the promoted content
+    existing_tags = item['tags'] or ''
+    new_tags = await generate_dikw_tags_adapter(new_content, next_level, existing_tags)
+    
+    async with transaction() as tx:
+        # The item may have changed while the LLM calls ran
+        current = await tx.fetch_one("SELECT level FROM dikw_items WHERE id = ?", (item_id,))
+        if not current:
             return JSONResponse({"error": "Item not found"}, status_code=404)
-        
-        current_level = item['level']
-        if current_level == 'wisdom' and not to_level:
-            return JSONResponse({"error": "Already at highest level"}, status_code=400)
-        
-        # Use provided target level or default to next level
-        next_level = to_level if to_level else DIKW_NEXT_LEVEL.get(current_level, 'wisdom')
-        
-        # Use provided content or keep original
-        new_content = promoted_content if promoted_content else item['content']
-        
-        # Generate AI synthesis for summary if not provided
-        if provided_summary:
-            new_summary = provided_summary
-        else:
-            # Use DIKWSynthesizerAgent adapter for AI promotion
-            try:
-                result = await ai_promote_dikw_adapter(new_content, current_level, next_level)
-                new_summary = result.get('summary', f"Promoted from {current_level}: {item['summary'] or ''}")
-            except Exception:
-                new_summary = f"Promoted from {current_level}: {item['summary'] or ''}"
-        
-        # Normalize confidence (handle both 0-1 and 0-100 ranges)
-        current_confidence = item['confidence'] or 70
-        if current_confidence <= 1:
-            current_confidence = current_confidence * 100
-        new_confidence = min(95, current_confidence + 5)  # Slight boost on promotion
-        
-        # Auto-generate tags for the promoted content
-        existing_tags = item['tags'] or ''
-        new_tags = generate_dikw_tags(new_content, next_level, existing_tags)
+        if current['level'] != current_level:
+            return JSONResponse({"error": "Item changed level during promotion"}, status_code=409)
         
         # Create new item at higher level with the refined content
-        conn.execute(
+        await tx.execute(
             """INSERT INTO dikw_items 
                (level, content, summary, source_type, source_ref_ids, original_signal_type, meeting_id, confidence, validation_count, tags)
                VALUES (?, ?, ?, 'synthesis', ?, ?, ?, ?, ?, ?)""",
@@ -3217,11 +3323,10 @@ async def promote_dikw_item(request: Request):
              item['original_signal_type'], item['meeting_id'],
              new_confidence, (item['validation_count'] or 0) + 1, new_tags)
         )
-        conn.commit()
-        new_id = conn.execute("SELECT last_insert_rowid() as id").fetchone()["id"]
+        new_id = (await tx.fetch_one("SELECT last_insert_rowid() as id"))["id"]
         
         # Record evolution history for the promotion
-        conn.execute("""
+        await tx.execute("""
             INSERT INTO dikw_evolution 
             (item_id, event_type, from_level, to_level, source_item_ids, content_snapshot, created_at)
             VALUES (?, 'promoted', ?, ?, ?, ?, datetime('now'))
@@ -3234,12 +3339,11 @@ async def promote_dikw_item(request: Request):
         ))
         
         # Update original item to show it was promoted
-        conn.execute(
+        await tx.execute(
             """UPDATE dikw_items SET promoted_to = ?, promoted_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
                WHERE id = ?""",
             (new_id, item_id)
         )
-        conn.commit()
     
     return JSONResponse({
         "status": "ok", 
@@ -3269,62 +3373,70 @@ async def merge_dikw_items(request: Request):
     if len(item_ids) < 2:
         return JSONResponse({"error": "Need at least 2 items to merge"}, status_code=400)
     
-    with connect() as conn:
-        items = conn.execute(
-            f"SELECT * FROM dikw_items WHERE id IN ({','.join('?' * len(item_ids))})",
-            item_ids
-        ).fetchall()
-        
-        if len(items) < 2:
-            return JSONResponse({"error": "Items not found"}, status_code=404)
-        
-        # All items must be at same level
-        levels = set(item['level'] for item in items)
-        if len(levels) > 1:
-            return JSONResponse({"error": "All items must be at the same level"}, status_code=400)
-        
-        current_level = items[0]['level']
-        if current_level == 'wisdom':
-            # Merge wisdom items into a mega-wisdom
-            next_level = 'wisdom'
-        else:
-            next_level = DIKW_NEXT_LEVEL[current_level]
-        
-        # Combine content for AI synthesis
-        combined_content = "\n\n".join([f"- {item['content']}" for item in items])
-        
-        # Use DIKWSynthesizerAgent adapter for merge synthesis
-        try:
-            items_for_adapter = [dict(item) for item in items]
-            result = await merge_dikw_items_adapter(items_for_adapter)
-            merged_summary = result.get('merged_content', '') or result.get('summary', '')
-            if not merged_summary:
-                merged_summary = f"Merged {len(items)} items: " + "; ".join([i['summary'][:50] for i in items if i['summary']])
-        except Exception:
+    # Reads and the LLM call stay outside the transaction so the write lock is held only for the writes
+    items = await fetch_all(
+        f"SELECT * FROM dikw_items WHERE id IN ({','.join('?' * len(item_ids))})",
+        item_ids
+    )
+    
+    if len(items) < 2:
+        return JSONResponse({"error": "Items not found"}, status_code=404)
+    
+    # All items must be at same level
+    levels = set(item['level'] for item in items)
+    if len(levels) > 1:
+        return JSONResponse({"error": "All items must be at the same level"}, status_code=400)
+    
+    current_level = items[0]['level']
+    if current_level == 'wisdom':
+        # Merge wisdom items into a mega-wisdom
+        next_level = 'wisdom'
+    else:
+        next_level = DIKW_NEXT_LEVEL[current_level]
+    
+    # Combine content for AI synthesis
+    combined_content = "\n\n".join([f"- {item['content']}" for item in items])
+    
+    # Use DIKWSynthesizerAgent adapter for merge synthesis
+    try:
+        items_for_adapter = [dict(item) for item in items]
+        result = await merge_dikw_items_adapter(items_for_adapter)
+        merged_summary = result.get('merged_content', '') or result.get('summary', '')
+        if not merged_summary:
             merged_summary = f"Merged {len(items)} items: " + "; ".join([i['summary'][:50] for i in items if i['summary']])
+    except Exception:
+        merged_summary = f"Merged {len(items)} items: " + "; ".join([i['summary'][:50] for i in items if i['summary']])
+    
+    # Create merged item
+    avg_confidence = sum(item['confidence'] or 0.5 for item in items) / len(items)
+    total_validations = sum(item['validation_count'] or 0 for item in items)
+    
+    async with transaction() as tx:
+        # The items may have been merged or moved while the LLM call ran
+        current = await tx.fetch_all(
+            f"SELECT id FROM dikw_items WHERE id IN ({','.join('?' * len(item_ids))}) "
+            "AND level = ? AND COALESCE(status, '') != 'merged'",
+            [*item_ids, current_level]
+        )
+        if len(current) != sum(1 for item in items if (item['status'] or '') != 'merged'):
+            return JSONResponse({"error": "Items changed during merge"}, status_code=409)
         
-        # Create merged item
-        avg_confidence = sum(item['confidence'] or 0.5 for item in items) / len(items)
-        total_validations = sum(item['validation_count'] or 0 for item in items)
-        
-        conn.execute(
+        await tx.execute(
             """INSERT INTO dikw_items 
                (level, content, summary, source_type, source_ref_ids, confidence, validation_count)
                VALUES (?, ?, ?, 'synthesis', ?, ?, ?)""",
             (next_level, combined_content, merged_summary, json.dumps(item_ids),
              min(1.0, avg_confidence + 0.15), total_validations)
         )
-        conn.commit()
-        new_id = conn.execute("SELECT last_insert_rowid() as id").fetchone()["id"]
+        new_id = (await tx.fetch_one("SELECT last_insert_rowid() as id"))["id"]
         
         # Mark source items as merged
         for item_id in item_ids:
-            conn.execute(
+            await tx.execute(
                 """UPDATE dikw_items SET status = 'merged', promoted_to = ?, promoted_at = CURRENT_TIMESTAMP
                    WHERE id = ?""",
                 (new_id, item_id)
             )
-        conn.commit()
     
     return JSONResponse({
         "status": "ok",
@@ -3345,9 +3457,9 @@ async def validate_dikw_item(request: Request):
     if not item_id:
         return JSONResponse({"error": "Item ID is required"}, status_code=400)
     
-    with connect() as conn:
+    async with transaction() as tx:
         if action == "validate":
-            conn.execute(
+            await tx.execute(
                 """UPDATE dikw_items 
                    SET validation_count = validation_count + 1,
                        confidence = MIN(1.0, confidence + 0.1),
@@ -3356,7 +3468,7 @@ async def validate_dikw_item(request: Request):
                 (item_id,)
             )
         elif action == "invalidate":
-            conn.execute(
+            await tx.execute(
                 """UPDATE dikw_items 
                    SET validation_count = MAX(0, validation_count - 1),
                        confidence = MAX(0.0, confidence - 0.1),
@@ -3365,22 +3477,23 @@ async def validate_dikw_item(request: Request):
                 (item_id,)
             )
         elif action == "archive":
-            conn.execute(
+            await tx.execute(
                 """UPDATE dikw_items SET status = 'archived', updated_at = CURRENT_TIMESTAMP WHERE id = ?""",
                 (item_id,)
             )
-        conn.commit()
     
     return JSONResponse({"status": "ok", "action": action})
 
 
-# generate_dikw_tags is now imported from agents/dikw_synthesizer.py (Checkpoint 2.5)
-# The imported version handles both sync and async contexts
+# Tag generation lives in agents/dikw_synthesizer.py (Checkpoint 2.5); async
+# routes await generate_dikw_tags_adapter directly instead of the sync wrapper
 
 
 @app.post("/api/dikw/generate-tags")
 async def generate_tags_endpoint(request: Request):
     """Generate tags for DIKW content."""
+    from .agents.dikw_synthesizer import generate_dikw_tags_adapter
+    
     data = await request.json()
     content = data.get("content", "")
     level = data.get("level", "data")
@@ -3389,13 +3502,15 @@ async def generate_tags_endpoint(request: Request):
     if not content:
         return JSONResponse({"error": "Content is required"}, status_code=400)
     
-    tags = generate_dikw_tags(content, level, existing_tags)
+    tags = await generate_dikw_tags_adapter(content, level, existing_tags)
     return JSONResponse({"status": "ok", "tags": tags})
 
 
 @app.post("/api/dikw")
 async def create_dikw_item(request: Request):
     """Create a new DIKW item."""
+    from .agents.dikw_synthesizer import generate_dikw_tags_adapter
+    
     data = await request.json()
     level = data.get("level", "data")
     content = data.get("content", "").strip()
@@ -3408,16 +3523,15 @@ async def create_dikw_item(request: Request):
     
     # Auto-generate tags if not provided and auto_tags is enabled
     if auto_tags and not tags:
-        tags = generate_dikw_tags(content, level)
+        tags = await generate_dikw_tags_adapter(content, level)
     
-    with connect() as conn:
-        conn.execute(
+    async with transaction() as tx:
+        await tx.execute(
             """INSERT INTO dikw_items (level, content, summary, tags, source_type)
                VALUES (?, ?, ?, ?, 'manual')""",
             (level, content, summary or None, tags or None)
         )
-        conn.commit()
-        item_id = conn.execute("SELECT last_insert_rowid() as id").fetchone()["id"]
+        item_id = (await tx.fetch_one("SELECT last_insert_rowid() as id"))["id"]
     
     return JSONResponse({"status": "ok", "id": item_id, "tags": tags})
 
@@ -3427,9 +3541,9 @@ async def update_dikw_item(item_id: int, request: Request):
     """Update an existing DIKW item."""
     data = await request.json()
     
-    with connect() as conn:
+    async with transaction() as tx:
         # Get current item to preserve unchanged fields
-        current = conn.execute("SELECT * FROM dikw_items WHERE id = ?", (item_id,)).fetchone()
+        current = await tx.fetch_one("SELECT * FROM dikw_items WHERE id = ?", (item_id,))
         if not current:
             return JSONResponse({"error": "Item not found"}, status_code=404)
         
@@ -3447,7 +3561,7 @@ async def update_dikw_item(item_id: int, request: Request):
         # Record evolution history if significant changes
         if content_changed or level_changed:
             # Snapshot the old state before updating
-            conn.execute("""
+            await tx.execute("""
                 INSERT INTO dikw_evolution 
                 (item_id, event_type, from_level, to_level, content_snapshot, created_at)
                 VALUES (?, ?, ?, ?, ?, datetime('now'))
@@ -3463,20 +3577,19 @@ async def update_dikw_item(item_id: int, request: Request):
         if confidence is not None:
             if confidence <= 1:
                 confidence = confidence * 100
-            conn.execute(
+            await tx.execute(
                 """UPDATE dikw_items 
                    SET level = ?, content = ?, summary = ?, tags = ?, confidence = ?, updated_at = CURRENT_TIMESTAMP
                    WHERE id = ?""",
                 (level, content, summary, tags, confidence, item_id)
             )
         else:
-            conn.execute(
+            await tx.execute(
                 """UPDATE dikw_items 
                    SET level = ?, content = ?, summary = ?, tags = ?, updated_at = CURRENT_TIMESTAMP
                    WHERE id = ?""",
                 (level, content, summary, tags, item_id)
             )
-        conn.commit()
     
     return JSONResponse({"status": "ok"})
 
@@ -3484,13 +3597,12 @@ async def update_dikw_item(item_id: int, request: Request):
 @app.delete("/api/dikw/{item_id}")
 async def delete_dikw_item(item_id: int):
     """Delete a DIKW item."""
-    with connect() as conn:
-        item = conn.execute("SELECT * FROM dikw_items WHERE id = ?", (item_id,)).fetchone()
+    async with transaction() as tx:
+        item = await tx.fetch_one("SELECT * FROM dikw_items WHERE id = ?", (item_id,))
         if not item:
             return JSONResponse({"error": "Item not found"}, status_code=404)
         
-        conn.execute("DELETE FROM dikw_items WHERE id = ?", (item_id,))
-        conn.commit()
+        await tx.execute("DELETE FROM dikw_items WHERE id = ?", (item_id,))
     
     return JSONResponse({"status": "ok"})
 
@@ -3647,18 +3759,17 @@ async def get_mindmap_data():
     
     Returns both DIKW pyramid structure and hierarchical mindmaps from conversations.
     """
-    with connect() as conn:
-        items = conn.execute(
-            """SELECT * FROM dikw_items WHERE status = 'active' 
-               ORDER BY level, created_at DESC"""
-        ).fetchall()
-        
-        # Get hierarchical mindmaps from conversations
-        mindmaps = conn.execute(
-            """SELECT id, conversation_id, mindmap_json, hierarchy_levels, 
-                      node_count, root_node_id FROM conversation_mindmaps
-               ORDER BY updated_at DESC LIMIT 5"""
-        ).fetchall()
+    items = await fetch_all(
+        """SELECT * FROM dikw_items WHERE status = 'active' 
+           ORDER BY level, created_at DESC"""
+    )
+    
+    # Get hierarchical mindmaps from conversations
+    mindmaps = await fetch_all(
+        """SELECT id, conversation_id, mindmap_json, hierarchy_levels, 
+                  node_count, root_node_id FROM conversation_mindmaps
+           ORDER BY updated_at DESC LIMIT 5"""
+    )
     
     # Build DIKW tree structure for mindmap
     tree = {
@@ -3776,13 +3887,12 @@ async def get_mindmap_data_hierarchical():
     """
     from .services.mindmap_synthesis import MindmapSynthesizer
     
-    with connect() as conn:
-        mindmaps = conn.execute(
-            """SELECT id, conversation_id, mindmap_json, hierarchy_levels,
-                      node_count, root_node_id, created_at, updated_at
-               FROM conversation_mindmaps
-               ORDER BY updated_at DESC"""
-        ).fetchall()
+    mindmaps = await fetch_all(
+        """SELECT id, conversation_id, mindmap_json, hierarchy_levels,
+                  node_count, root_node_id, created_at, updated_at
+           FROM conversation_mindmaps
+           ORDER BY updated_at DESC"""
+    )
     
     hierarchical_data = []
     for mindmap in mindmaps:
@@ -3862,17 +3972,16 @@ async def get_aggregated_conversation_mindmaps():
     """
     from .services.mindmap_synthesis import MindmapSynthesizer
     
-    with connect() as conn:
-        # Get conversations with their mindmaps
-        result = conn.execute("""
-            SELECT c.id as conversation_id, c.title, c.created_at,
-                   GROUP_CONCAT(cm.id) as mindmap_ids,
-                   COUNT(cm.id) as mindmap_count
-            FROM conversations c
-            LEFT JOIN conversation_mindmaps cm ON c.id = cm.conversation_id
-            GROUP BY c.id
-            ORDER BY c.created_at DESC
-        """).fetchall()
+    # Get conversations with their mindmaps
+    result = await fetch_all("""
+        SELECT c.id as conversation_id, c.title, c.created_at,
+               GROUP_CONCAT(cm.id) as mindmap_ids,
+               COUNT(cm.id) as mindmap_count
+        FROM conversations c
+        LEFT JOIN conversation_mindmaps cm ON c.id = cm.conversation_id
+        GROUP BY c.id
+        ORDER BY c.created_at DESC
+    """)
     
     conversation_data = []
     for conv in result:
@@ -4026,11 +4135,10 @@ async def generate_mindmap(request: Request):
     data = await request.json()
     full_regenerate = data.get("full", True)
     
-    with connect() as conn:
-        items = conn.execute(
-            """SELECT * FROM dikw_items WHERE status = 'active' 
-               ORDER BY created_at DESC"""
-        ).fetchall()
+    items = await fetch_all(
+        """SELECT * FROM dikw_items WHERE status = 'active' 
+           ORDER BY created_at DESC"""
+    )
     
     new_items_count = 0
     
@@ -4059,10 +4167,9 @@ async def generate_mindmap(request: Request):
 @app.get("/api/mindmap/tags")
 async def get_mindmap_tags():
     """Get tag cloud data for mindmap."""
-    with connect() as conn:
-        items = conn.execute(
-            """SELECT tags FROM dikw_items WHERE status = 'active' AND tags IS NOT NULL AND tags != ''"""
-        ).fetchall()
+    items = await fetch_all(
+        """SELECT tags FROM dikw_items WHERE status = 'active' AND tags IS NOT NULL AND tags != ''"""
+    )
     
     tag_counts = {}
     for item in items:
@@ -4094,25 +4201,25 @@ async def get_mindmap_status():
 @app.post("/api/dikw/backfill-tags")
 async def backfill_dikw_tags():
     """Backfill tags for existing DIKW items that don't have tags."""
-    with connect() as conn:
-        items = conn.execute(
-            """SELECT id, content, level, tags FROM dikw_items 
-               WHERE status = 'active' AND (tags IS NULL OR tags = '')"""
-        ).fetchall()
+    from .agents.dikw_synthesizer import generate_dikw_tags_adapter
+    
+    items = await fetch_all(
+        """SELECT id, content, level, tags FROM dikw_items 
+           WHERE status = 'active' AND (tags IS NULL OR tags = '')"""
+    )
     
     updated_count = 0
     errors = []
     
     for item in items:
         try:
-            tags = generate_dikw_tags(item['content'] or '', item['level'], '')
+            tags = await generate_dikw_tags_adapter(item['content'] or '', item['level'], '')
             if tags:
-                with connect() as conn:
-                    conn.execute(
+                async with transaction() as tx:
+                    await tx.execute(
                         "UPDATE dikw_items SET tags = ? WHERE id = ?",
                         (tags, item['id'])
                     )
-                    conn.commit()
                 updated_count += 1
         except Exception as e:
             errors.append({"id": item['id'], "error": str(e)})
@@ -4149,29 +4256,27 @@ def normalize_signal_type(signal_type: str) -> str:
 @app.post("/api/dikw/compress-dedupe")
 async def compress_and_dedupe_dikw():
     """Compress similar items and remove duplicates using AI analysis."""
-    with connect() as conn:
-        items = conn.execute(
-            """SELECT id, level, content, summary, original_signal_type, tags, confidence
-               FROM dikw_items WHERE status = 'active' 
-               ORDER BY level, created_at DESC"""
-        ).fetchall()
+    items = await fetch_all(
+        """SELECT id, level, content, summary, original_signal_type, tags, confidence
+           FROM dikw_items WHERE status = 'active' 
+           ORDER BY level, created_at DESC"""
+    )
     
     if len(items) < 2:
         return JSONResponse({"status": "ok", "message": "Not enough items to compress", "merged": 0, "normalized": 0})
     
     # Normalize signal types first
     normalized_count = 0
-    with connect() as conn:
+    async with transaction() as tx:
         for item in items:
             if item['original_signal_type']:
                 normalized = normalize_signal_type(item['original_signal_type'])
                 if normalized != item['original_signal_type']:
-                    conn.execute(
+                    await tx.execute(
                         "UPDATE dikw_items SET original_signal_type = ? WHERE id = ?",
                         (normalized, item['id'])
                     )
                     normalized_count += 1
-        conn.commit()
     
     # Group items by level for duplicate detection
     levels = {}
@@ -4222,17 +4327,16 @@ async def compress_and_dedupe_dikw():
         merged_tags = ','.join(sorted(all_tags)[:10])
         
         # Archive the duplicate items
-        with connect() as conn:
-            conn.execute(
+        async with transaction() as tx:
+            await tx.execute(
                 f"UPDATE dikw_items SET status = 'merged', updated_at = CURRENT_TIMESTAMP WHERE id IN ({','.join('?' * len(other_ids))})",
                 other_ids
             )
             # Update the kept item with merged tags
-            conn.execute(
+            await tx.execute(
                 "UPDATE dikw_items SET tags = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                 (merged_tags, best_item['id'])
             )
-            conn.commit()
         merged_count += len(other_ids)
     
     return JSONResponse({
@@ -4247,99 +4351,97 @@ async def compress_and_dedupe_dikw():
 @app.get("/api/dikw/{item_id}/history")
 async def get_dikw_item_history(item_id: int):
     """Get the evolution history of a DIKW item."""
-    with connect() as conn:
-        # Get the item itself
-        item = conn.execute("SELECT * FROM dikw_items WHERE id = ?", (item_id,)).fetchone()
-        if not item:
-            return JSONResponse({"error": "Item not found"}, status_code=404)
-        
-        # Get evolution history
-        history = conn.execute(
-            """SELECT * FROM dikw_evolution WHERE item_id = ? ORDER BY created_at ASC""",
-            (item_id,)
-        ).fetchall()
-        
-        # Get source meeting info if available
-        meeting_info = None
-        if item['meeting_id']:
-            meeting = conn.execute(
-                "SELECT id, meeting_name, meeting_date FROM meetings WHERE id = ?",
-                (item['meeting_id'],)
-            ).fetchone()
-            if meeting:
-                meeting_info = dict(meeting)
-        
-        # Get source items if this was promoted/merged
-        source_items = []
-        if item['source_ref_ids']:
-            try:
-                source_ids = json.loads(item['source_ref_ids'])
-                if source_ids:
-                    sources = conn.execute(
-                        f"SELECT id, level, content, created_at FROM dikw_items WHERE id IN ({','.join('?' * len(source_ids))})",
-                        source_ids
-                    ).fetchall()
-                    source_items = [dict(s) for s in sources]
-            except:
-                pass
-        
-        # Build evolution timeline
-        timeline = []
-        
-        # Add creation event
+    # Get the item itself
+    item = await fetch_one("SELECT * FROM dikw_items WHERE id = ?", (item_id,))
+    if not item:
+        return JSONResponse({"error": "Item not found"}, status_code=404)
+    
+    # Get evolution history
+    history = await fetch_all(
+        """SELECT * FROM dikw_evolution WHERE item_id = ? ORDER BY created_at ASC""",
+        (item_id,)
+    )
+    
+    # Get source meeting info if available
+    meeting_info = None
+    if item['meeting_id']:
+        meeting = await fetch_one(
+            "SELECT id, meeting_name, meeting_date FROM meetings WHERE id = ?",
+            (item['meeting_id'],)
+        )
+        if meeting:
+            meeting_info = dict(meeting)
+    
+    # Get source items if this was promoted/merged
+    source_items = []
+    if item['source_ref_ids']:
+        try:
+            source_ids = json.loads(item['source_ref_ids'])
+            if source_ids:
+                sources = await fetch_all(
+                    f"SELECT id, level, content, created_at FROM dikw_items WHERE id IN ({','.join('?' * len(source_ids))})",
+                    source_ids
+                )
+                source_items = [dict(s) for s in sources]
+        except:
+            pass
+    
+    # Build evolution timeline
+    timeline = []
+    
+    # Add creation event
+    timeline.append({
+        "event": "created",
+        "level": item['level'] if not source_items else (source_items[0]['level'] if source_items else 'data'),
+        "date": item['created_at'],
+        "source": meeting_info['meeting_name'] if meeting_info else item['source_type'],
+        "source_date": meeting_info['meeting_date'] if meeting_info else None,
+        "content_snapshot": None  # No prior content for creation
+    })
+    
+    # Add history events with content snapshots
+    for h in history:
         timeline.append({
-            "event": "created",
-            "level": item['level'] if not source_items else (source_items[0]['level'] if source_items else 'data'),
-            "date": item['created_at'],
-            "source": meeting_info['meeting_name'] if meeting_info else item['source_type'],
-            "source_date": meeting_info['meeting_date'] if meeting_info else None,
-            "content_snapshot": None  # No prior content for creation
+            "event": h['event_type'],
+            "from_level": h['from_level'],
+            "to_level": h['to_level'],
+            "date": h['created_at'],
+            "source": h['source_meeting_name'] or h['source_document_name'],
+            "content_snapshot": h['content_snapshot']  # Old content before change
         })
-        
-        # Add history events with content snapshots
-        for h in history:
-            timeline.append({
-                "event": h['event_type'],
-                "from_level": h['from_level'],
-                "to_level": h['to_level'],
-                "date": h['created_at'],
-                "source": h['source_meeting_name'] or h['source_document_name'],
-                "content_snapshot": h['content_snapshot']  # Old content before change
-            })
-        
-        # If promoted, add that event
-        if item['promoted_to']:
-            timeline.append({
-                "event": "promoted",
-                "to_level": "next",
-                "date": item['promoted_at']
-            })
-        
-        return JSONResponse({
-            "item": dict(item),
-            "meeting": meeting_info,
-            "source_items": source_items,
-            "timeline": timeline
+    
+    # If promoted, add that event
+    if item['promoted_to']:
+        timeline.append({
+            "event": "promoted",
+            "to_level": "next",
+            "date": item['promoted_at']
         })
+    
+    return JSONResponse({
+        "item": dict(item),
+        "meeting": meeting_info,
+        "source_items": source_items,
+        "timeline": timeline
+    })
 
 
 @app.post("/api/dikw/normalize-categories")
 async def normalize_dikw_categories():
     """Normalize all signal type categories to consistent format."""
-    with connect() as conn:
-        items = conn.execute(
-            """SELECT id, original_signal_type FROM dikw_items 
-               WHERE original_signal_type IS NOT NULL AND original_signal_type != ''"""
-        ).fetchall()
+    items = await fetch_all(
+        """SELECT id, original_signal_type FROM dikw_items 
+           WHERE original_signal_type IS NOT NULL AND original_signal_type != ''"""
+    )
     
     updated = 0
     changes = []
     
-    with connect() as conn:
+    async with transaction() as tx:
         for item in items:
             normalized = normalize_signal_type(item['original_signal_type'])
             if normalized != item['original_signal_type']:
-                conn.execute(
+                await tx.execute(
                     "UPDATE dikw_items SET original_signal_type = ? WHERE id = ?",
                     (normalized, item['id'])
                 )
@@ -4349,7 +4451,6 @@ async def normalize_dikw_categories():
                     "to": normalized
                 })
                 updated += 1
-        conn.commit()
     
     return JSONResponse({
         "status": "ok",
@@ -4508,18 +4609,17 @@ async def get_unprocessed_signals():
     # Get meetings with signals from Supabase
     meetings = meetings_supabase.get_meetings_with_signals(limit=20)
     
-    with connect() as conn:
-        # Get already processed signals from SQLite
-        processed = conn.execute(
-            """SELECT meeting_id, signal_type, signal_text 
-               FROM signal_status 
-               WHERE converted_to = 'dikw'"""
-        ).fetchall()
-        
-        processed_set = set(
-            (p['meeting_id'], p['signal_type'], p['signal_text']) 
-            for p in processed
-        )
+    # Get already processed signals from SQLite
+    processed = await fetch_all(
+        """SELECT meeting_id, signal_type, signal_text 
+           FROM signal_status 
+           WHERE converted_to = 'dikw'"""
+    )
+    
+    processed_set = set(
+        (p['meeting_id'], p['signal_type'], p['signal_text']) 
+        for p in processed
+    )
     
     unprocessed = []
     for meeting in meetings:
@@ -4685,8 +4785,8 @@ async def load_meeting_bundle_ui(
                         local_path = f"uploads/{unique_name}"
                     
                     # Record in database (with Supabase URL if available)
-                    with connect() as conn:
-                        conn.execute("""
+                    async with transaction() as tx:
+                        await tx.execute("""
                             INSERT INTO attachments (ref_type, ref_id, filename, file_path, mime_type, file_size, supabase_url, supabase_path)
                             VALUES ('meeting', ?, ?, ?, ?, ?, ?, ?)
                         """, (meeting_id, screenshot.filename, local_path or '', 
@@ -4736,8 +4836,8 @@ async def pocket_list_recordings(
     Returns paginated list with id, title, created_at for UI display.
     """
     try:
-        client = PocketClient()
-        resp = client.list_recordings(
+        client = get_async_pocket_client()
+        resp = await client.list_recordings(
             page=page,
             limit=limit,
             start_date=start_date,
@@ -4800,8 +4900,8 @@ async def pocket_fetch(request: Request):
     mind_map_key = (body.get("mind_map_key") or "").strip() or None
 
     try:
-        client = PocketClient()
-        details = client.get_recording(recording_id, include_transcript=True, include_summarizations=True)
+        client = get_async_pocket_client()
+        details = await client.get_recording(recording_id, include_transcript=True, include_summarizations=True)
         
         # If specific versions requested, fetch those; otherwise fetch latest
         if summary_key or mind_map_key:
@@ -4878,8 +4978,8 @@ async def pocket_fetch_versions(request: Request):
         return JSONResponse({"success": False, "error": "recording_id required"}, status_code=400)
 
     try:
-        client = PocketClient()
-        details = client.get_recording(recording_id, include_transcript=True, include_summarizations=True)
+        client = get_async_pocket_client()
+        details = await client.get_recording(recording_id, include_transcript=True, include_summarizations=True)
         
         # Extract all available versions
         summary_versions = get_all_summary_versions(details)
@@ -4901,6 +5001,60 @@ async def pocket_fetch_versions(request: Request):
         return JSONResponse({"success": False, "error": str(e)}, status_code=502)
 
 
+# Pocket integration: fetch every recording in a date range as one parallel batch
+@app.post("/api/integrations/pocket/sync")
+async def pocket_sync_range(request: Request):
+    """Fetch summaries, transcripts and action items for all recordings in a date range.
+
+    Accepts JSON or form with `start_date` and `end_date` (YYYY-MM-DD). Recordings
+    are fetched concurrently; unchanged ones are served from the client's ETag
+    cache. A recording that fails is reported in `errors` rather than failing
+    the whole sync.
+    """
+    try:
+        body = await request.json()
+    except Exception:
+        form = await request.form()
+        body = dict(form)
+
+    start_date = (body.get("start_date") or "").strip() or None
+    end_date = (body.get("end_date") or "").strip() or None
+    if not start_date:
+        return JSONResponse({"success": False, "error": "start_date required"}, status_code=400)
+
+    try:
+        client = get_async_pocket_client()
+        started = time.perf_counter()
+        batch = await client.fetch_recordings(start_date=start_date, end_date=end_date)
+    except Exception as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=502)
+
+    recordings, errors = [], []
+    for recording_id, details in batch.items():
+        if isinstance(details, Exception):
+            errors.append({"recording_id": recording_id, "error": str(details)})
+            continue
+        rec = details.get("data") if isinstance(details.get("data"), dict) else {}
+        summary_text, _summary_obj = extract_latest_summary(details)
+        recordings.append({
+            "recording_id": recording_id,
+            "title": rec.get("title"),
+            "created_at": rec.get("created_at"),
+            "summary_text": summary_text,
+            "transcript_text": extract_transcript_text(details),
+            "mind_map_text": extract_mind_map(details),
+            "action_items": extract_action_items(details),
+        })
+
+    return JSONResponse({
+        "success": not errors,
+        "recordings": recordings,
+        "errors": errors,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        "client_stats": dict(client.stats),
+    })
+
+
 # Pocket webhook endpoint (payload URL)
 @app.post("/api/integrations/pocket/webhook")
 async def pocket_webhook(request: Request):
@@ -4919,8 +5073,8 @@ async def pocket_webhook(request: Request):
         return JSONResponse({"success": False, "error": "recording_id required"}, status_code=400)
 
     try:
-        client = PocketClient()
-        details = client.get_recording(recording_id, include_transcript=True, include_summarizations=True)
+        client = get_async_pocket_client()
+        details = await client.get_recording(recording_id, include_transcript=True, include_summarizations=True)
         summary_text, _summary_obj = extract_latest_summary(details)
         transcript_text = extract_transcript_text(details)
 
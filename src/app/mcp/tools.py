@@ -4,12 +4,14 @@ import re
 from .parser import parse_meeting_summary
 
 from ..db import connect
+from ..db_blobs import put_text
 from ..chat.turn import run_turn
 
 import json
 
 from .extract import extract_structured_signals
 from .cleaner import clean_meeting_text
+from ..services.transcript_chunks import map_chunks_threaded, split_transcript
 
 
 # Pocket template detection patterns - supports 30+ templates
@@ -293,10 +295,10 @@ def load_meeting_bundle(args: Dict[str, Any]) -> Dict[str, Any]:
                 synthesized_notes,
                 meeting_date,
                 json.dumps(signals),
-                transcript_text or "",
-                pocket_ai_summary.strip() if pocket_ai_summary else "",
+                put_text(conn, transcript_text or ""),
+                put_text(conn, pocket_ai_summary.strip() if pocket_ai_summary else ""),
                 pocket_template,
-                pocket_mind_map.strip() if pocket_mind_map else "",
+                put_text(conn, pocket_mind_map.strip() if pocket_mind_map else ""),
             ),
         )
 
@@ -654,12 +656,29 @@ def export_meeting_signals(args: Dict[str, Any]) -> Dict[str, Any]:
     return response
 
 
+DRAFT_CHUNK_CHARS = 24000  # single-pass limit; longer transcripts are condensed in parallel first
+
+_DRAFT_CHUNK_PROMPT = """Condense part {part} of {parts} of the meeting transcript for "{meeting_name}" into notes.
+{focus_instruction}
+Keep every concrete detail: ticket numbers, story points, names, dates, numbers.
+Use these headings, omitting any with nothing to report:
+Work identified / Outcomes / Context / Decisions / Action items (Person will action) / Blockers /
+Risks and open questions / Commitments / Ideas / Other notes
+
+TRANSCRIPT PART {part}:
+{text}
+"""
+
+
 def draft_summary_from_transcript(args: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate a draft meeting summary from a transcript using LLM.
     User reviews/edits before loading via load_meeting_bundle.
     
-    Uses GPT-4o for best extraction quality on long transcripts.
+    Uses GPT-4o for best extraction quality on long transcripts. Transcripts
+    longer than DRAFT_CHUNK_CHARS are map-reduced: speaker-aligned parts are
+    condensed concurrently, then the summary is written from the notes, so
+    nothing in the middle of a long meeting is dropped.
     
     Args:
         transcript: The meeting transcript text
@@ -675,16 +694,29 @@ def draft_summary_from_transcript(args: Dict[str, Any]) -> Dict[str, Any]:
     if not transcript or len(transcript) < 100:
         return {"error": "Transcript too short. Provide at least 100 characters."}
     
-    # GPT-4o supports 128K context - use larger chunks
-    max_chars = 100000
-    if len(transcript) > max_chars:
-        half = max_chars // 2
-        transcript = transcript[:half] + "\n\n[... middle section omitted for length ...]\n\n" + transcript[-half:]
-    
     focus_instruction = ""
     if focus_areas:
         focus_instruction = f"\nPay special attention to these areas: {', '.join(focus_areas)}"
     
+    chunks = split_transcript(transcript, max_chars=DRAFT_CHUNK_CHARS)
+    source_label, source_text = "TRANSCRIPT", transcript
+    if len(chunks) > 1:
+        def condense(chunk):
+            return ask(_DRAFT_CHUNK_PROMPT.format(
+                part=chunk.index + 1, parts=len(chunks), meeting_name=meeting_name,
+                focus_instruction=focus_instruction, text=chunk.text,
+            ), model="gpt-4o")
+        
+        notes = map_chunks_threaded(chunks, condense)
+        if all(isinstance(n, Exception) for n in notes):
+            return {"status": "error", "error": str(notes[0])}
+        # A part that failed to condense is passed through raw rather than dropped
+        source_label = "NOTES FROM TRANSCRIPT PARTS (in meeting order)"
+        source_text = "\n\n".join(
+            f"[Part {chunk.index + 1}/{len(chunks)}]\n{chunk.text if isinstance(n, Exception) else n}"
+            for chunk, n in zip(chunks, notes)
+        )
+    
     prompt = f"""Analyze this meeting transcript and generate a structured summary in the exact format below.
 
 Meeting: {meeting_name}
@@ -737,8 +769,8 @@ Generate the summary in this EXACT format (keep all headers and structure):
 - [Ideas proposed for future consideration]
 
 ---
-TRANSCRIPT:
-{transcript}
+{source_label}:
+{source_text}
 """
     
     try:
@@ -750,6 +782,7 @@ TRANSCRIPT:
             "meeting_name": meeting_name,
             "draft_summary": draft,
             "model_used": "gpt-4o",
+            "chunks": len(chunks),
             "instructions": "Review and edit this draft, then use load_meeting_bundle to save it."
         }
     except Exception as e:
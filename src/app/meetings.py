@@ -15,6 +15,8 @@ from .mcp.parser import parse_meeting_summary
 from .mcp.extract import extract_structured_signals
 from .mcp.cleaner import clean_meeting_text
 from .services import meetings_supabase
+from .pagination import Page, cursor_offset, encode_cursor, page_size, paginate_list
+from .template_streaming import render_page
 
 logger = logging.getLogger(__name__)
 
@@ -142,12 +144,22 @@ async def store_meeting(
 
 
 @router.get("/meetings")
-def list_meetings(request: Request, success: str = Query(default=None)):
-    # Use Supabase as primary source
-    meetings_list = meetings_supabase.get_all_meetings(limit=500)
+def list_meetings(
+    request: Request,
+    success: str = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=100),
+    partial: bool = Query(default=False),
+):
+    # Use Supabase as primary source; one page at a time ("Load more" fetches the rest)
+    limit = page_size(limit)
+    offset = cursor_offset(cursor)
+    meetings_list = meetings_supabase.get_all_meetings(limit=limit + 1, offset=offset)
+    next_cursor = encode_cursor({"o": offset + limit}) if len(meetings_list) > limit else None
+    page = Page(items=meetings_list[:limit], next_cursor=next_cursor)
     
     formatted = []
-    for meeting in meetings_list:
+    for meeting in page.items:
         # Ensure meeting is a proper dict
         if not isinstance(meeting, dict):
             meeting = dict(meeting) if hasattr(meeting, '__iter__') else {}
@@ -175,9 +187,12 @@ def list_meetings(request: Request, success: str = Query(default=None)):
 
         formatted.append(meeting)
 
-    return templates.TemplateResponse(
+    return render_page(
+        templates,
         "list_meetings.html",
-        {"request": request, "meetings": formatted, "success": success},
+        {"request": request, "meetings": formatted, "success": success, "next_cursor": page.next_cursor},
+        block="meeting_rows" if partial else None,
+        headers=page.headers() if partial else None,
     )
 
 
@@ -458,6 +473,13 @@ def delete_meeting(meeting_id: str):
         logger.error(f"Failed to delete meeting {meeting_id} from Supabase")
     
     # Note: Embeddings are stored in Supabase's vector table, deletion cascades
+    
+    # Mindmaps live in SQLite; drop them from the synthesis aggregates too
+    try:
+        from .services.mindmap_synthesis import MindmapSynthesizer
+        MindmapSynthesizer.delete_conversation_mindmaps(f"meeting_{meeting_id}")
+    except Exception as e:
+        logger.error(f"Failed to delete mindmaps for meeting {meeting_id}: {e}")
 
     return RedirectResponse(url="/meetings?success=meeting_deleted", status_code=303)
 
@@ -472,9 +494,16 @@ def list_action_items(
     filter_status: str = Query(default="all"),
     filter_priority: str = Query(default="all"),
     sort_by: str = Query(default="date_desc"),
-    group_by: str = Query(default="none")
+    group_by: str = Query(default="none"),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=100),
+    partial: bool = Query(default=False),
 ):
-    """Display all action items across all meetings from Supabase and SQLite."""
+    """Display all action items across all meetings from Supabase and SQLite.
+    
+    Stats cover every matching item; the flat list is paginated ("Load more"),
+    the by-meeting grouping is rendered whole.
+    """
     
     all_action_items = []
     all_meetings = []
@@ -691,11 +720,15 @@ def list_action_items(
         'from_sqlite': sum(1 for i in all_action_items if i.get('source') == 'sqlite'),
     }
     
-    return templates.TemplateResponse(
+    page = paginate_list(all_action_items, cursor, page_size(limit))
+    
+    return render_page(
+        templates,
         "action_items.html",
         {
             "request": request,
-            "action_items": all_action_items,
+            "action_items": page.items,
+            "next_cursor": page.next_cursor if group_by != 'meeting' else None,
             "grouped_items": grouped_items,
             "all_meetings": [dict(m) for m in all_meetings],
             "stats": stats,
@@ -704,6 +737,8 @@ def list_action_items(
             "sort_by": sort_by,
             "group_by": group_by
         },
+        block="action_item_rows" if partial else None,
+        headers=page.headers() if partial else None,
     )
 
 
@@ -1,21 +1,26 @@
 # src/app/memory/embed.py
 import json
 import os
-from openai import OpenAI
 
 # Load env vars
 from dotenv import load_dotenv
 load_dotenv()
 
+from ..metrics import timer as metrics_timer
+
 EMBED_MODEL = os.getenv("EMBED_MODEL", "text-embedding-3-small")
 
 _client = None
 def client():
     global _client
+    from ..infrastructure.fake_providers import fake_backend_enabled, get_fake_client  # deferred: loads the infrastructure package
+    if fake_backend_enabled("embeddings"):
+        return get_fake_client("openai")
     if _client is None:
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY not set. Check your .env file.")
+        from openai import OpenAI  # deferred: slow import, not needed to serve
         _client = OpenAI(api_key=api_key)
     return _client
 
@@ -24,7 +29,8 @@ def embed_text(text: str) -> list[float]:
     if not text:
         return []
     try:
-        resp = client().embeddings.create(model=EMBED_MODEL, input=text)
+        with metrics_timer("embedding", "embed.embed_text"):
+            resp = client().embeddings.create(model=EMBED_MODEL, input=text)
         return resp.data[0].embedding
     except Exception as e:
         print(f"Warning: Embedding failed: {e}")
@@ -0,0 +1,464 @@
+"""
+In-process latency and throughput metrics for SignalFlow
+
+Provides always-on instrumentation cheap enough for production (~1µs per
+observation):
+- MetricsMiddleware: per-route request latency histograms, in-flight count,
+  status and error counters
+- timer()/timed(): dependency timers (db, supabase, embedding, llm) tagged
+  by caller
+- render_prometheus(): Prometheus text format for GET /metrics
+- snapshot(): JSON summary with percentiles for GET /api/admin/metrics
+  (POST /api/admin/metrics/reset starts a fresh window)
+
+Histograms are log-bucketed (each bucket boundary doubles from 0.5 ms to
+~65 s), so percentiles are accurate to within one bucket. Prompt sizes use
+TOKEN_BUCKETS (16 to ~190k tokens, 1.25x apart).
+
+Environment Variables:
+- METRICS_ENABLED=false to turn all recording into no-ops
+- METRICS_TOKEN=secret to scrape /metrics with "Authorization: Bearer secret"
+  instead of a login session
+
+Usage:
+    from .metrics import timer, timed
+
+    with timer("supabase", "meetings.list"):
+        rows = sb.table("meetings").select("*").execute()
+
+    @timed("llm", "arjuna.intent")
+    def parse_intent(...):
+        ...
+"""
+
+import asyncio
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# 0.5 ms, 1 ms, 2 ms ... ~65 s
+DEFAULT_BUCKETS = tuple(0.0005 * 2 ** i for i in range(18))
+
+# 16, 20, 25 ... ~190k tokens
+TOKEN_BUCKETS = tuple(sorted({int(16 * 1.25 ** i) for i in range(43)}))
+
+HTTP_DURATION = "signalflow_http_request_duration_seconds"
+HTTP_REQUESTS = "signalflow_http_requests_total"
+HTTP_ERRORS = "signalflow_http_request_errors_total"
+HTTP_IN_FLIGHT = "signalflow_http_requests_in_flight"
+DEPENDENCY_DURATION = "signalflow_dependency_duration_seconds"
+DEPENDENCY_ERRORS = "signalflow_dependency_errors_total"
+PROMPT_TOKENS = "signalflow_llm_prompt_tokens"
+CONTEXT_DROPPED_TOKENS = "signalflow_llm_context_dropped_tokens_total"
+
+_HELP = {
+    HTTP_DURATION: "HTTP request latency by route template",
+    HTTP_REQUESTS: "HTTP requests by route template and status",
+    HTTP_ERRORS: "HTTP requests that raised or returned 5xx",
+    HTTP_IN_FLIGHT: "HTTP requests currently being served",
+    DEPENDENCY_DURATION: "Latency of DB, Supabase, embedding and LLM calls by caller",
+    DEPENDENCY_ERRORS: "Dependency calls that raised, by caller",
+    PROMPT_TOKENS: "Prompt size in tokens sent to the LLM, by agent and task type",
+    CONTEXT_DROPPED_TOKENS: "Context tokens truncated or dropped to fit prompt budgets",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Fixed log-bucketed latency histogram."""
+
+    __slots__ = ("bounds", "counts", "sum", "count", "max", "_lock")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+            if value > self.max:
+                self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (capped at max)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def summary(self, scale: float = 1000, unit: str = "ms") -> Dict[str, Any]:
+        """Count and percentiles; seconds are reported as ms by default."""
+        return {
+            "count": self.count,
+            f"avg_{unit}": round(self.sum / self.count * scale, 3) if self.count else 0.0,
+            f"p50_{unit}": round(self.quantile(0.50) * scale, 3),
+            f"p95_{unit}": round(self.quantile(0.95) * scale, 3),
+            f"p99_{unit}": round(self.quantile(0.99) * scale, 3),
+            f"max_{unit}": round(self.max * scale, 3),
+        }
+
+
+class MetricsRegistry:
+    """Histograms, counters and gauges keyed by metric name and label tuple."""
+
+    def __init__(self, enabled: bool = METRICS_ENABLED, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = buckets
+        self.started_at = time.time()
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._lock = threading.Lock()
+
+    # -------------------------
+    # Recording
+    # -------------------------
+
+    def histogram(self, name: str, key: LabelKey, bounds: Optional[Tuple[float, ...]] = None) -> Histogram:
+        series = self._histograms.get(name)
+        hist = series.get(key) if series is not None else None
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(name, {}).setdefault(key, Histogram(bounds or self.buckets))
+        return hist
+
+    def observe(self, name: str, value: float, key: LabelKey = (), bounds: Optional[Tuple[float, ...]] = None):
+        if self.enabled:
+            self.histogram(name, key, bounds).observe(value)
+
+    def inc(self, name: str, key: LabelKey = (), amount: float = 1):
+        if self.enabled:
+            with self._lock:
+                series = self._counters.setdefault(name, {})
+                series[key] = series.get(key, 0) + amount
+
+    def gauge_add(self, name: str, delta: float, key: LabelKey = ()):
+        if self.enabled:
+            with self._lock:
+                series = self._gauges.setdefault(name, {})
+                series[key] = series.get(key, 0) + delta
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+            self.started_at = time.time()
+
+    # -------------------------
+    # Export
+    # -------------------------
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            histograms = {name: dict(series) for name, series in self._histograms.items()}
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            gauges = {name: dict(series) for name, series in self._gauges.items()}
+
+        for name, series in sorted(gauges.items()):
+            _header(lines, name, "gauge")
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{_labels(key)} {_number(value)}")
+
+        for name, series in sorted(counters.items()):
+            _header(lines, name, "counter")
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{_labels(key)} {_number(value)}")
+
+        for name, series in sorted(histograms.items()):
+            _header(lines, name, "histogram")
+            for key, hist in sorted(series.items()):
+                with hist._lock:
+                    counts, total, count = list(hist.counts), hist.sum, hist.count
+                cumulative = 0
+                for bound, n in zip(hist.bounds, counts):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{_labels(key + (('le', _number(bound)),))} {cumulative}")
+                lines.append(f"{name}_bucket{_labels(key + (('le', '+Inf'),))} {count}")
+                lines.append(f"{name}_sum{_labels(key)} {_number(total)}")
+                lines.append(f"{name}_count{_labels(key)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON view: per-route and per-dependency percentiles plus error rates."""
+        with self._lock:
+            routes = dict(self._histograms.get(HTTP_DURATION, {}))
+            dependencies = dict(self._histograms.get(DEPENDENCY_DURATION, {}))
+            prompts = dict(self._histograms.get(PROMPT_TOKENS, {}))
+            http_errors = dict(self._counters.get(HTTP_ERRORS, {}))
+            dep_errors = dict(self._counters.get(DEPENDENCY_ERRORS, {}))
+            in_flight = self._gauges.get(HTTP_IN_FLIGHT, {}).get((), 0)
+
+        uptime = max(time.time() - self.started_at, 1e-9)
+
+        def rows(series, errors, label_names):
+            out = []
+            for key, hist in series.items():
+                labels = dict(key)
+                summary = hist.summary()
+                failed = errors.get(key, 0)
+                out.append({
+                    **{k: labels.get(k) for k in label_names},
+                    **summary,
+                    "errors": int(failed),
+                    "error_rate": round(failed / summary["count"], 4) if summary["count"] else 0.0,
+                    "per_minute": round(summary["count"] / uptime * 60, 2),
+                })
+            return sorted(out, key=lambda r: r["count"] * r["avg_ms"], reverse=True)
+
+        return {
+            "enabled": self.enabled,
+            "uptime_seconds": round(uptime, 1),
+            "in_flight": int(in_flight),
+            "routes": rows(routes, http_errors, ("method", "route")),
+            "dependencies": rows(dependencies, dep_errors, ("kind", "caller")),
+            "prompt_tokens": sorted(
+                ({**dict(key), **hist.summary(scale=1, unit="tokens")} for key, hist in prompts.items()),
+                key=lambda r: r["count"] * r["avg_tokens"],
+                reverse=True,
+            ),
+        }
+
+
+def _header(lines: List[str], name: str, kind: str):
+    if name in _HELP:
+        lines.append(f"# HELP {name} {_HELP[name]}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    parts = ",".join(
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), " ")}"'
+        for k, v in key
+    )
+    return "{" + parts + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    return _registry
+
+
+def render_prometheus() -> str:
+    return _registry.render_prometheus()
+
+
+def snapshot() -> Dict[str, Any]:
+    return _registry.snapshot()
+
+
+# -------------------------
+# Dependency timers
+# -------------------------
+
+class timer:
+    """Context manager timing one dependency call: ``with timer("llm", "llm.ask"):``.
+
+    Exceptions are counted in DEPENDENCY_ERRORS and re-raised.
+    """
+
+    __slots__ = ("key", "start")
+
+    def __init__(self, kind: str, caller: str):
+        self.key = (("caller", caller), ("kind", kind))
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        registry = _registry
+        if registry.enabled:
+            registry.histogram(DEPENDENCY_DURATION, self.key).observe(time.perf_counter() - self.start)
+            if exc_type is not None:
+                registry.inc(DEPENDENCY_ERRORS, self.key)
+        return False
+
+
+def timed(kind: str, caller: Optional[str] = None) -> Callable:
+    """Decorator form of :class:`timer` for sync and async functions.
+
+    ``caller`` defaults to ``module.function``.
+    """
+    def decorator(fn):
+        name = caller or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+        if asyncio.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with timer(kind, name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timer(kind, name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+_SQL_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|TABLE|JOIN)\s+[\"`\[]?(\w+)", re.IGNORECASE)
+_SQL_LABEL_CACHE_SIZE = 2048
+_sql_labels: Dict[str, str] = {}
+
+
+def sql_label(sql: str) -> str:
+    """Low-cardinality caller tag for a statement, e.g. ``"SELECT meeting_summaries"``."""
+    label = _sql_labels.get(sql)
+    if label is None:
+        stripped = sql.lstrip()
+        verb = stripped.split(None, 1)[0].upper() if stripped else "?"
+        if verb == "WITH":
+            verb = "SELECT"
+        table = _SQL_TABLE.search(sql)
+        label = f"{verb} {table.group(1)}" if table else verb
+        if len(_sql_labels) < _SQL_LABEL_CACHE_SIZE:
+            _sql_labels[sql] = label
+    return label
+
+
+_REST_TABLE = re.compile(r"/(?:rest|storage|auth)/v1/(?:rpc/)?([\w-]+)")
+
+
+def instrument_httpx_client(client, kind: str = "supabase") -> bool:
+    """Time every request made through an httpx client via event hooks.
+
+    The caller tag is the REST resource (``meetings``, ``rpc:semantic_search``).
+    Latency runs to response headers; transport errors are not seen by hooks,
+    5xx responses are counted as errors. Returns False if hooks are unsupported.
+    """
+    hooks = getattr(client, "event_hooks", None)
+    if hooks is None or getattr(client, "_signalflow_metrics", False):
+        return False
+
+    def caller_for(request) -> str:
+        path = request.url.path
+        match = _REST_TABLE.search(path)
+        if not match:
+            return request.method
+        return f"rpc:{match.group(1)}" if "/rpc/" in path else match.group(1)
+
+    def on_request(request):
+        request.extensions["signalflow_start"] = time.perf_counter()
+
+    def on_response(response):
+        start = response.request.extensions.get("signalflow_start")
+        if start is None or not _registry.enabled:
+            return
+        key = (("caller", caller_for(response.request)), ("kind", kind))
+        _registry.histogram(DEPENDENCY_DURATION, key).observe(time.perf_counter() - start)
+        if response.status_code >= 500:
+            _registry.inc(DEPENDENCY_ERRORS, key)
+
+    client.event_hooks = {
+        "request": list(hooks.get("request", [])) + [on_request],
+        "response": list(hooks.get("response", [])) + [on_response],
+    }
+    client._signalflow_metrics = True
+    return True
+
+
+def observe_http_request(method: str, route: str, status: int, seconds: float):
+    registry = _registry
+    if not registry.enabled:
+        return
+    key = (("method", method), ("route", route))
+    registry.histogram(HTTP_DURATION, key).observe(seconds)
+    registry.inc(HTTP_REQUESTS, key + (("status", str(status)),))
+    if status >= 500:
+        registry.inc(HTTP_ERRORS, key)
+
+
+# -------------------------
+# ASGI middleware
+# -------------------------
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, status and in-flight requests per route.
+
+    Routes are labelled by their template (``/api/meetings/{meeting_id}``),
+    never the raw path, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._route_paths: Dict[Any, str] = {}
+        self._route_count = -1
+
+    def _route_label(self, scope) -> str:
+        route = scope.get("route")
+        if route is not None and getattr(route, "path", None):
+            return route.path
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "<unmatched>"
+        app = scope.get("app")
+        routes = getattr(app, "routes", None) or []
+        if len(routes) != self._route_count:
+            self._route_paths = {}
+            for r in routes:
+                target = getattr(r, "endpoint", None) or getattr(r, "app", None)
+                if target is not None and getattr(r, "path", None) is not None:
+                    self._route_paths.setdefault(target, r.path)
+            self._route_count = len(routes)
+        try:
+            return self._route_paths.get(endpoint, "<unmatched>")
+        except TypeError:  # unhashable endpoint
+            return "<unmatched>"
+
+    async def __call__(self, scope, receive, send):
+        registry = _registry
+        if scope["type"] != "http" or not registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        registry.gauge_add(HTTP_IN_FLIGHT, 1)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            registry.gauge_add(HTTP_IN_FLIGHT, -1)
+            observe_http_request(scope["method"], self._route_label(scope), status, time.perf_counter() - start)
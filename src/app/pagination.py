@@ -0,0 +1,88 @@
+"""
+Cursor pagination for HTML list views
+
+List pages return one page of rows plus an opaque ``next_cursor``; the
+page's "Load more" button requests ``?cursor=<next_cursor>&partial=1`` and
+appends the returned rows. Cursors are URL-safe base64 JSON, so a view can
+store whatever position it needs:
+
+- keyset positions (``{"k": sort_key, "id": last_id}``) where the query
+  can seek, e.g. signals over meeting_summaries
+- offsets (``{"o": n}``) where the rows come from a source that only
+  supports offset/limit or are merged and sorted in Python
+
+A cursor that fails to decode restarts from the first page.
+
+Usage:
+    from .pagination import Page, decode_cursor, encode_cursor, page_size, paginate_list
+
+    page = paginate_list(results, cursor, limit)
+    render_page(..., {"items": page.items, "next_cursor": page.next_cursor})
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# Response header carrying the next cursor on partial ("load more") responses
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page:
+    """One page of a list view."""
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def headers(self) -> Dict[str, str]:
+        """Headers for a partial response (the client reads the next cursor from here)."""
+        return {NEXT_CURSOR_HEADER: self.next_cursor or ""}
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """Opaque cursor for a page position."""
+    raw = json.dumps(position, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Dict[str, Any]:
+    """Position stored in a cursor; {} (first page) if missing or malformed."""
+    if not cursor:
+        return {}
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+    except (ValueError, TypeError):
+        return {}
+    return position if isinstance(position, dict) else {}
+
+
+def page_size(limit: Optional[int], default: int = DEFAULT_PAGE_SIZE) -> int:
+    """Clamp a requested page size to 1..MAX_PAGE_SIZE."""
+    if not limit or limit < 1:
+        return default
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def cursor_offset(cursor: Optional[str]) -> int:
+    """Offset stored in an offset cursor (0 for the first page)."""
+    offset = decode_cursor(cursor).get("o", 0)
+    return offset if isinstance(offset, int) and offset > 0 else 0
+
+
+def paginate_list(items: Sequence[Any], cursor: Optional[str], limit: int) -> Page:
+    """Slice an already-sorted list with an offset cursor."""
+    offset = cursor_offset(cursor)
+    end = offset + limit
+    return Page(
+        items=list(items[offset:end]),
+        next_cursor=encode_cursor({"o": end}) if len(items) > end else None,
+    )
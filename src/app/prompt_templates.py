@@ -0,0 +1,111 @@
+"""
+Shared prompt template environments
+
+Agents render their prompts from Jinja2 templates under ``prompts/``. Each
+agent used to build its own Environment in ``__init__``, and agents that
+are constructed per request (TicketAgent) re-read and re-compiled every
+template on every call. This module keeps one Environment per prompt
+directory for the whole process, so a template is compiled once and
+served from Jinja's in-memory cache afterwards.
+
+- get_prompt_env(): the shared Environment for a prompt directory
+- render_prompt(): render one template from it
+- precompile_prompts(): compile every template up front (startup warm-up)
+
+Templates are checked for changes on disk (auto_reload) only in
+development, where prompts are edited live; elsewhere a compiled template
+is never re-stat'ed.
+
+Environment Variables:
+- PROMPT_AUTO_RELOAD: true/false (default: true when ENVIRONMENT=development)
+
+Usage:
+    from ..prompt_templates import get_prompt_env
+
+    self.jinja_env = get_prompt_env("agents/arjuna")
+    prompt = self.jinja_env.get_template("system.jinja2").render(...)
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from jinja2 import Environment, FileSystemLoader
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
+
+_default_reload = "true" if os.getenv("ENVIRONMENT", "development") == "development" else "false"
+PROMPT_AUTO_RELOAD = os.getenv("PROMPT_AUTO_RELOAD", _default_reload).lower() in ("1", "true", "yes")
+
+_envs: Dict[str, Optional[Environment]] = {}
+_envs_lock = threading.Lock()
+
+
+def get_prompt_env(subdir: str) -> Optional[Environment]:
+    """
+    Shared Jinja2 environment for ``prompts/<subdir>``.
+
+    Returns None when the directory doesn't exist, so callers keep their
+    inline fallback prompts.
+    """
+    if subdir in _envs:
+        return _envs[subdir]
+    with _envs_lock:
+        if subdir not in _envs:
+            path = PROMPTS_DIR / subdir
+            if path.is_dir():
+                _envs[subdir] = Environment(
+                    loader=FileSystemLoader(str(path)),
+                    autoescape=False,
+                    auto_reload=PROMPT_AUTO_RELOAD,
+                )
+            else:
+                logger.warning(f"Prompts directory not found: {path}")
+                _envs[subdir] = None
+        return _envs[subdir]
+
+
+def render_prompt(subdir: str, template_name: str, **context) -> str:
+    """Render ``prompts/<subdir>/<template_name>`` with the shared environment."""
+    env = get_prompt_env(subdir)
+    if env is None:
+        raise FileNotFoundError(f"Prompts directory not found: {PROMPTS_DIR / subdir}")
+    return env.get_template(template_name).render(**context)
+
+
+def precompile_prompts(subdirs: Optional[Iterable[str]] = None) -> int:
+    """
+    Compile templates ahead of first use.
+
+    Args:
+        subdirs: Prompt directories to compile (default: every ``prompts/agents/*``)
+
+    Returns:
+        Number of templates compiled
+    """
+    if subdirs is None:
+        agents_dir = PROMPTS_DIR / "agents"
+        subdirs = sorted(f"agents/{p.name}" for p in agents_dir.iterdir() if p.is_dir()) if agents_dir.is_dir() else []
+
+    compiled = 0
+    for subdir in subdirs:
+        env = get_prompt_env(subdir)
+        if env is None:
+            continue
+        for name in env.list_templates():
+            try:
+                env.get_template(name)
+                compiled += 1
+            except Exception as e:
+                logger.warning(f"Prompt template {subdir}/{name} failed to compile: {e}")
+    return compiled
+
+
+def clear_prompt_cache():
+    """Forget all environments (tests, or after replacing prompt files in production)."""
+    with _envs_lock:
+        _envs.clear()
@@ -12,6 +12,7 @@ from abc import abstractmethod
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from ..db_blobs import put_text
 from .base import BaseRepository, QueryOptions
 
 logger = logging.getLogger(__name__)
@@ -285,6 +286,12 @@ class SQLiteMeetingRepository(MeetingRepository):
     Used as fallback when Supabase is unavailable.
     """
     
+    # List and search queries skip the blob-backed columns (raw_text, pocket_*)
+    # so they never load transcripts; get_by_id returns the full row.
+    _LIST_COLUMNS = (
+        "id, meeting_name, meeting_date, synthesized_notes, signals_json, import_source, created_at"
+    )
+    
     def _get_connection(self):
         """Get SQLite connection."""
         from ..db import connect
@@ -334,7 +341,7 @@ class SQLiteMeetingRepository(MeetingRepository):
         
         with self._get_connection() as conn:
             rows = conn.execute(f"""
-                SELECT * FROM meeting_summaries
+                SELECT {self._LIST_COLUMNS} FROM meeting_summaries
                 ORDER BY {options.order_by} {order_dir}
                 LIMIT ? OFFSET ?
             """, (options.limit, options.offset)).fetchall()
@@ -368,7 +375,7 @@ class SQLiteMeetingRepository(MeetingRepository):
                 data.get("synthesized_notes"),
                 data.get("meeting_date"),
                 data.get("signals_json"),
-                data.get("raw_text"),
+                put_text(conn, data.get("raw_text")),
                 data.get("import_source"),
             ))
             conn.commit()
@@ -390,6 +397,8 @@ class SQLiteMeetingRepository(MeetingRepository):
         values.append(entity_id)
         
         with self._get_connection() as conn:
+            if "raw_text" in data:
+                values[fields.index("raw_text = ?")] = put_text(conn, data["raw_text"])
             conn.execute(
                 f"UPDATE meeting_summaries SET {', '.join(fields)} WHERE id = ?",
                 values
@@ -401,6 +410,8 @@ class SQLiteMeetingRepository(MeetingRepository):
         """Delete a meeting."""
         with self._get_connection() as conn:
             conn.execute("DELETE FROM meeting_summaries WHERE id = ?", (entity_id,))
+            from ..services.mindmap_synthesis import MindmapSynthesizer
+            MindmapSynthesizer.remove_conversation_mindmaps(conn, f"meeting_{entity_id}")
             conn.commit()
             return True
     
@@ -409,8 +420,8 @@ class SQLiteMeetingRepository(MeetingRepository):
     ) -> List[Dict[str, Any]]:
         """Get meetings within a date range."""
         with self._get_connection() as conn:
-            rows = conn.execute("""
-                SELECT * FROM meeting_summaries
+            rows = conn.execute(f"""
+                SELECT {self._LIST_COLUMNS} FROM meeting_summaries
                 WHERE meeting_date BETWEEN ? AND ?
                 ORDER BY meeting_date DESC
                 LIMIT ?
@@ -421,8 +432,8 @@ class SQLiteMeetingRepository(MeetingRepository):
     def get_with_signals(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get meetings that have signals extracted."""
         with self._get_connection() as conn:
-            rows = conn.execute("""
-                SELECT * FROM meeting_summaries
+            rows = conn.execute(f"""
+                SELECT {self._LIST_COLUMNS} FROM meeting_summaries
                 WHERE signals_json IS NOT NULL
                 ORDER BY meeting_date DESC
                 LIMIT ?
@@ -438,17 +449,17 @@ class SQLiteMeetingRepository(MeetingRepository):
         
         with self._get_connection() as conn:
             if include_transcripts:
-                rows = conn.execute("""
-                    SELECT * FROM meeting_summaries
+                rows = conn.execute(f"""
+                    SELECT {self._LIST_COLUMNS} FROM meeting_summaries
                     WHERE LOWER(synthesized_notes) LIKE ?
                     OR LOWER(meeting_name) LIKE ?
-                    OR LOWER(raw_text) LIKE ?
+                    OR LOWER(blob_text(raw_text)) LIKE ?
                     ORDER BY meeting_date DESC
                     LIMIT ?
                 """, (like, like, like, limit)).fetchall()
             else:
-                rows = conn.execute("""
-                    SELECT * FROM meeting_summaries
+                rows = conn.execute(f"""
+                    SELECT {self._LIST_COLUMNS} FROM meeting_summaries
                     WHERE LOWER(synthesized_notes) LIKE ?
                     OR LOWER(meeting_name) LIKE ?
                     ORDER BY meeting_date DESC
@@ -412,7 +412,13 @@ class SQLiteTicketRepository(TicketRepository):
                 data.get("tags"),
             ))
             conn.commit()
-            return self.get_by_id(cursor.lastrowid)
+        from ..services.ticket_index import index_ticket_changed
+        index_ticket_changed({
+            "id": cursor.lastrowid, "ticket_id": data.get("ticket_id"), "title": data.get("title"),
+            "description": data.get("description"), "status": data.get("status", "backlog"),
+            "priority": data.get("priority"), "tags": data.get("tags"),
+        })
+        return self.get_by_id(cursor.lastrowid)
     
     def update(self, entity_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update an existing ticket."""
@@ -441,14 +447,18 @@ class SQLiteTicketRepository(TicketRepository):
                 values
             )
             conn.commit()
-            return self.get_by_id(entity_id)
+        from ..services.ticket_index import index_ticket_changed
+        index_ticket_changed({"id": entity_id, **{k: v for k, v in data.items() if k in allowed_fields}})
+        return self.get_by_id(entity_id)
     
     def delete(self, entity_id: str) -> bool:
         """Delete a ticket."""
         with self._get_connection() as conn:
             conn.execute("DELETE FROM tickets WHERE id = ?", (entity_id,))
             conn.commit()
-            return True
+        from ..services.ticket_index import index_ticket_deleted
+        index_ticket_deleted(entity_id)
+        return True
     
     def get_active(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get tickets with active statuses."""
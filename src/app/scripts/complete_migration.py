@@ -14,6 +14,8 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.app.db_blobs import BlobRow
+
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -25,7 +27,7 @@ def main():
     
     # Connect to SQLite
     conn = sqlite3.connect(str(project_root / 'agent.db'))
-    conn.row_factory = sqlite3.Row
+    conn.row_factory = BlobRow  # resolves text_blobs references
     
     # Connect to Supabase
     url = os.getenv('SUPABASE_URL')
@@ -2,8 +2,13 @@
 """Export SQLite data to JSON for Supabase migration."""
 import sqlite3
 import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.app.db_blobs import row_dict
+
 db_path = Path(__file__).parent.parent.parent.parent / "agent.db"
 output_dir = Path(__file__).parent / "migration_data"
 output_dir.mkdir(exist_ok=True)
@@ -82,7 +87,7 @@ print(f"Exported {len(memories_data)} career memories")
 meetings = conn.execute('SELECT * FROM meeting_summaries').fetchall()
 meetings_data = []
 for m in meetings:
-    d = dict(m)
+    d = row_dict(m, conn)  # resolves text_blobs references in raw_text
     signals = d.get('signals', '{}')
     try:
         if isinstance(signals, str):
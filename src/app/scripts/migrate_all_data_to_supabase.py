@@ -30,6 +30,8 @@ import hashlib
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from src.app.db_blobs import BlobRow
+
 # Try to load dotenv if available
 try:
     from dotenv import load_dotenv
@@ -61,7 +63,7 @@ def connect_sqlite() -> sqlite3.Connection:
         raise FileNotFoundError(f"Database not found: {db_path}")
     
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    conn.row_factory = BlobRow  # resolves text_blobs references
     return conn
 
 
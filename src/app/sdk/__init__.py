@@ -28,6 +28,8 @@ from .explorers import (
     DIKWExplorer,
 )
 from .insights import InsightsEngine
+from .trends import TrendEngine
+from .export import BulkExporter
 
 __all__ = [
     "SignalFlowClient",
@@ -36,4 +38,6 @@ __all__ = [
     "CareerExplorer",
     "DIKWExplorer",
     "InsightsEngine",
+    "TrendEngine",
+    "BulkExporter",
 ]
@@ -51,6 +51,7 @@ class SignalFlowClient:
     - career: Career development data
     - dikw: Knowledge hierarchy explorer
     - insights: AI-powered insight generation
+    - export: Bulk, keyset-paginated table export (Arrow/Parquet)
     
     Example:
         ```python
@@ -109,6 +110,7 @@ class SignalFlowClient:
         self._career = None
         self._dikw = None
         self._insights = None
+        self._export = None
         self._supabase = None
         
         logger.info(f"SignalFlow SDK initialized for {self._env.name}")
@@ -153,6 +155,14 @@ class SignalFlowClient:
             self._insights = InsightsEngine(self)
         return self._insights
     
+    @property
+    def export(self):
+        """Get bulk exporter (keyset-paginated, columnar)."""
+        if self._export is None:
+            from .export import BulkExporter
+            self._export = BulkExporter(self)
+        return self._export
+    
     @property
     def supabase(self):
         """Get direct Supabase client (if configured)."""
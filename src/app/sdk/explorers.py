@@ -11,12 +11,68 @@ Provides specialized explorers for different data domains:
 
 import logging
 from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
+class _BulkExportMixin:
+    """
+    Streaming export shared by the explorers.
+
+    Subclasses set ``_export_table`` and map their keyword filters to
+    pushed-down predicates in ``_export_filters``.
+    """
+
+    _export_table: str = ""
+
+    def _export_filters(self, **kwargs) -> List[tuple]:
+        return []
+
+    def export(self, columns: Optional[List[str]] = None, batch_size: Optional[int] = None, **filters):
+        """
+        Lazily iterate over every matching row (keyset-paginated).
+
+        Args:
+            columns: Columns to fetch (default all)
+            batch_size: Rows per round trip
+            **filters: Explorer-specific filters (see ``list``)
+
+        Returns:
+            Iterator of row dicts
+        """
+        return self._client.export.iter_rows(
+            self._export_table,
+            columns=columns,
+            filters=self._export_filters(**filters),
+            batch_size=batch_size,
+        )
+
+    def iter_dataframes(self, columns: Optional[List[str]] = None, batch_size: Optional[int] = None, **filters):
+        """Iterate over matching rows as one pandas DataFrame per page."""
+        return self._client.export.iter_dataframes(
+            self._export_table,
+            columns=columns,
+            filters=self._export_filters(**filters),
+            batch_size=batch_size,
+        )
+
+    def to_parquet(self, path: str, columns: Optional[List[str]] = None, **filters) -> int:
+        """
+        Write every matching row to a Parquet file without loading it all.
+
+        Returns:
+            Number of rows written
+        """
+        return self._client.export.to_parquet(
+            self._export_table,
+            path,
+            columns=columns,
+            filters=self._export_filters(**filters),
+        )
+
+
 @dataclass
 class Meeting:
     """Meeting data object."""
@@ -67,7 +123,7 @@ class Signal:
         )
 
 
-class MeetingsExplorer:
+class MeetingsExplorer(_BulkExportMixin):
     """
     Explorer for meeting data.
     
@@ -88,9 +144,19 @@ class MeetingsExplorer:
         ```
     """
     
+    _export_table = "meetings"
+    
     def __init__(self, client):
         self._client = client
     
+    def _export_filters(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[tuple]:
+        filters = []
+        if date_from:
+            filters.append(("gte", "meeting_date", date_from))
+        if date_to:
+            filters.append(("lte", "meeting_date", date_to))
+        return filters
+    
     def list(
         self,
         limit: int = 50,
@@ -150,22 +216,42 @@ class MeetingsExplorer:
         Returns:
             Dict with counts, averages, and trends
         """
-        meetings = self.list(limit=1000)
+        if self._client.supabase:
+            return self._count_statistics()
         
-        if not meetings:
-            return {"count": 0}
+        now = datetime.now()
+        total = with_transcripts = with_mind_maps = last_week = last_month = 0
+        for m in self.list(limit=1000):
+            total += 1
+            with_transcripts += m.has_transcript
+            with_mind_maps += m.has_mind_map
+            if m.created_at:
+                created = datetime.fromisoformat(m.created_at.replace("Z", "+00:00")).replace(tzinfo=None)
+                last_week += created > now - timedelta(days=7)
+                last_month += created > now - timedelta(days=30)
         
-        # Basic stats
-        total = len(meetings)
-        with_transcripts = sum(1 for m in meetings if m.has_transcript)
-        with_mind_maps = sum(1 for m in meetings if m.has_mind_map)
+        return self._statistics(total, with_transcripts, with_mind_maps, last_week, last_month)
+    
+    def _count_statistics(self) -> Dict[str, Any]:
+        """Statistics from server-side counts; no meeting rows (or transcripts) are transferred."""
+        def count(apply=lambda q: q) -> int:
+            query = self._client.supabase.table("meetings").select("id", count="exact", head=True)
+            return apply(query).execute().count or 0
         
-        # Time distribution
-        now = datetime.now()
-        last_week = sum(1 for m in meetings if m.created_at and 
-                       datetime.fromisoformat(m.created_at.replace("Z", "+00:00")) > now - timedelta(days=7))
-        last_month = sum(1 for m in meetings if m.created_at and
-                        datetime.fromisoformat(m.created_at.replace("Z", "+00:00")) > now - timedelta(days=30))
+        now = datetime.now(timezone.utc)
+        return self._statistics(
+            total=count(),
+            # neq also excludes NULL, matching has_transcript / has_mind_map
+            with_transcripts=count(lambda q: q.neq("raw_text", "")),
+            with_mind_maps=count(lambda q: q.neq("pocket_mind_map", "")),
+            last_week=count(lambda q: q.gt("created_at", (now - timedelta(days=7)).isoformat())),
+            last_month=count(lambda q: q.gt("created_at", (now - timedelta(days=30)).isoformat())),
+        )
+    
+    @staticmethod
+    def _statistics(total: int, with_transcripts: int, with_mind_maps: int, last_week: int, last_month: int) -> Dict[str, Any]:
+        if not total:
+            return {"count": 0}
         
         return {
             "total_meetings": total,
@@ -213,7 +299,7 @@ class MeetingsExplorer:
         return df
 
 
-class SignalsExplorer:
+class SignalsExplorer(_BulkExportMixin):
     """
     Explorer for meeting signals.
     
@@ -221,9 +307,29 @@ class SignalsExplorer:
     extracted from meetings (decisions, actions, blockers, risks, ideas).
     """
     
+    _export_table = "signals"
+    
     def __init__(self, client):
         self._client = client
     
+    def _export_filters(
+        self,
+        signal_type: Optional[str] = None,
+        status: Optional[str] = None,
+        meeting_id: Optional[str] = None,
+        created_from: Optional[str] = None,
+    ) -> List[tuple]:
+        filters = []
+        if signal_type:
+            filters.append(("eq", "signal_type", signal_type))
+        if status:
+            filters.append(("eq", "status", status))
+        if meeting_id:
+            filters.append(("eq", "meeting_id", meeting_id))
+        if created_from:
+            filters.append(("gte", "created_at", created_from))
+        return filters
+    
     def list(
         self,
         limit: int = 100,
@@ -364,16 +470,21 @@ class CareerExplorer:
         return pd.DataFrame(data)
 
 
-class DIKWExplorer:
+class DIKWExplorer(_BulkExportMixin):
     """
     Explorer for DIKW knowledge hierarchy.
     
     Provides access to the Data-Information-Knowledge-Wisdom pyramid.
     """
     
+    _export_table = "dikw_items"
+    
     def __init__(self, client):
         self._client = client
     
+    def _export_filters(self, level: Optional[str] = None) -> List[tuple]:
+        return [("eq", "level", level)] if level else []
+    
     def list(
         self,
         level: Optional[str] = None,
@@ -0,0 +1,198 @@
+# src/app/sdk/export.py
+"""
+Bulk Export for SignalFlow SDK
+
+Streams whole tables out of Supabase in bounded memory:
+
+- keyset pagination (``WHERE key > last ORDER BY key LIMIT n``), so deep
+  pages cost the same as the first one and rows aren't skipped or repeated
+  when new data arrives mid-export
+- column projection and predicate pushdown, so only the needed rows and
+  columns leave the database
+- Arrow record batches / incremental Parquet writes, one page at a time
+
+Example:
+    ```python
+    exporter = client.export
+
+    # Lazy row iteration
+    for row in exporter.iter_rows("meetings", columns=["id", "meeting_date"]):
+        ...
+
+    # Write the full signal history to Parquet without holding it in memory
+    exporter.to_parquet("signals", "signals.parquet",
+                        filters=[("eq", "signal_type", "decision")])
+    ```
+
+pyarrow is only needed for the Arrow/Parquet helpers.
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Predicate operators pushed down to PostgREST (query builder method names)
+FILTER_OPS = {"eq", "neq", "gt", "gte", "lt", "lte", "like", "ilike", "in_", "is_"}
+
+Filter = Tuple[str, str, Any]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for Arrow/Parquet export. Run: pip install pyarrow")
+
+
+class BulkExporter:
+    """Keyset-paginated, projected table export."""
+
+    def __init__(self, client, batch_size: int = DEFAULT_BATCH_SIZE):
+        self._client = client
+        self.batch_size = batch_size
+        self.queries = 0  # round trips issued, for diagnostics
+
+    def iter_batches(
+        self,
+        table: str,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        key: str = "id",
+        batch_size: Optional[int] = None,
+        max_rows: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of rows, ordered by ``key``.
+
+        Args:
+            table: Supabase table name
+            columns: Columns to select (default all). ``key`` is always included.
+            filters: Pushed-down predicates as (op, column, value), e.g. ("gte", "created_at", "2025-01-01")
+            key: Unique, sortable column used for keyset pagination
+            batch_size: Rows per round trip
+            max_rows: Stop after this many rows
+        """
+        supabase = self._client.supabase
+        if not supabase:
+            logger.warning("Bulk export requires a direct Supabase connection")
+            return
+
+        batch_size = batch_size or self.batch_size
+        for op, column, _ in filters or []:
+            if op not in FILTER_OPS:
+                raise ValueError(f"Unsupported filter op '{op}' on {column}. Available: {sorted(FILTER_OPS)}")
+
+        if columns:
+            selected = list(columns) if key in columns else [key, *columns]
+            projection = ", ".join(selected)
+        else:
+            projection = "*"
+
+        last_key = None
+        emitted = 0
+        while True:
+            limit = batch_size if max_rows is None else min(batch_size, max_rows - emitted)
+            if limit <= 0:
+                return
+
+            query = supabase.table(table).select(projection)
+            for op, column, value in filters or []:
+                query = getattr(query, op)(column, value)
+            if last_key is not None:
+                query = query.gt(key, last_key)
+            result = query.order(key).limit(limit).execute()
+            self.queries += 1
+
+            page = result.data or []
+            if not page:
+                return
+            yield page
+
+            emitted += len(page)
+            last_key = page[-1][key]
+            if len(page) < limit:
+                return
+
+    def iter_rows(self, table: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield rows one at a time (same arguments as :meth:`iter_batches`)."""
+        for page in self.iter_batches(table, **kwargs):
+            yield from page
+
+    def infer_schema(self, table: str, page: List[Dict[str, Any]], filters: Optional[List[Filter]] = None):
+        """
+        Arrow schema for an export, inferred from its first page.
+
+        A column that is null throughout the page would otherwise be typed
+        ``null`` and reject later values, so each such column is typed from
+        one non-null sample under the same filters (one small round trip per
+        column). Columns with no values anywhere stay ``null``.
+        """
+        pa = _require_pyarrow()
+        schema = pa.RecordBatch.from_pylist(page).schema
+        for i, field in enumerate(schema):
+            if not pa.types.is_null(field.type):
+                continue
+            query = self._client.supabase.table(table).select(field.name)
+            for op, column, value in filters or []:
+                query = getattr(query, op)(column, value)
+            result = query.not_.is_(field.name, "null").limit(1).execute()
+            self.queries += 1
+            if result.data:
+                schema = schema.set(i, pa.RecordBatch.from_pylist(result.data).schema.field(field.name))
+        return schema
+
+    def iter_record_batches(self, table: str, schema=None, **kwargs):
+        """
+        Yield ``pyarrow.RecordBatch`` objects, one per page, all with one schema.
+
+        Pass ``schema`` to pin column types; otherwise it is resolved from
+        the first page with :meth:`infer_schema` and every page is built
+        against it.
+        """
+        pa = _require_pyarrow()
+        for page in self.iter_batches(table, **kwargs):
+            if schema is None:
+                schema = self.infer_schema(table, page, kwargs.get("filters"))
+            yield pa.RecordBatch.from_pylist(page, schema=schema)
+
+    def iter_dataframes(self, table: str, **kwargs):
+        """Yield pandas DataFrames, one per page, for chunked notebook analysis."""
+        import pandas as pd
+
+        for page in self.iter_batches(table, **kwargs):
+            yield pd.DataFrame(page)
+
+    def to_arrow(self, table: str, **kwargs):
+        """Collect the export into a ``pyarrow.Table`` (columnar, no per-row objects)."""
+        pa = _require_pyarrow()
+        batches = list(self.iter_record_batches(table, **kwargs))
+        if not batches:
+            return pa.table({})
+        return pa.Table.from_batches(batches)
+
+    def to_parquet(self, table: str, path: str, compression: str = "zstd", **kwargs) -> int:
+        """
+        Stream the export into a Parquet file, one row group per page.
+
+        Returns:
+            Number of rows written
+        """
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        writer = None
+        rows = 0
+        try:
+            for batch in self.iter_record_batches(table, **kwargs):
+                if writer is None:
+                    writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
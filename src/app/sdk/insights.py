@@ -10,6 +10,8 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+from .trends import TrendEngine, METRICS
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +38,7 @@ class TrendAnalysis:
     dates: List[str]
     trend_direction: str  # up, down, stable
     change_percent: float
+    rolling: Optional[List[float]] = None
     
 
 class InsightsEngine:
@@ -61,6 +64,14 @@ class InsightsEngine:
     
     def __init__(self, client):
         self._client = client
+        self._trends = None
+    
+    @property
+    def trends(self) -> TrendEngine:
+        """Get the time-bucketed trend engine (results cached per period)."""
+        if self._trends is None:
+            self._trends = TrendEngine(self._client)
+        return self._trends
     
     def summarize_week(
         self,
@@ -135,55 +146,32 @@ class InsightsEngine:
         self,
         metric: str,
         days: int = 30,
+        period: Optional[str] = None,
+        rolling_window: Optional[int] = None,
     ) -> TrendAnalysis:
         """
         Analyze trends for a metric over time.
         
+        Each metric is computed from one projected query over the whole
+        window, bucketed per day, week or sprint.
+        
         Args:
-            metric: One of 'meeting_count', 'signal_count', 'action_completion'
+            metric: One of 'meeting_count', 'signal_count', 'action_completion', 'dikw_count'
             days: Number of days to analyze
+            period: 'day', 'week' or 'sprint' (defaults: day for meetings, week otherwise)
+            rolling_window: Optional trailing-average window, in buckets
         
         Returns:
             TrendAnalysis with values and direction
         """
-        today = datetime.now()
-        
-        if metric == "meeting_count":
-            # Daily meeting counts
-            values = []
-            dates = []
-            
-            for i in range(days):
-                date = today - timedelta(days=i)
-                date_str = date.strftime("%Y-%m-%d")
-                dates.append(date_str)
-                
-                meetings = self._client.meetings.list(
-                    date_from=date_str,
-                    date_to=date_str,
-                    limit=100,
-                )
-                values.append(len(meetings))
-            
-            values.reverse()
-            dates.reverse()
-            
-        elif metric == "signal_count":
-            # For simplicity, use weekly buckets
-            values = []
-            dates = []
-            
-            for i in range(min(days // 7, 4)):
-                week_start = today - timedelta(days=7 * (i + 1))
-                week_end = today - timedelta(days=7 * i)
-                dates.append(week_start.strftime("%Y-%m-%d"))
-                
-                signals = self._client.signals.list(limit=500)
-                values.append(len(signals))
-            
-            values.reverse()
-            dates.reverse()
-            
+        rolling = None
+        if metric in METRICS:
+            buckets = self.trends.bucketize(
+                metric, days=days, period=period, rolling_window=rolling_window
+            )
+            values = buckets["values"]
+            dates = buckets["dates"]
+            rolling = buckets["rolling"]
         else:
             values = []
             dates = []
@@ -213,6 +201,7 @@ class InsightsEngine:
             dates=dates,
             trend_direction=direction,
             change_percent=round(change, 1),
+            rolling=rolling,
         )
     
     def recommendations(self) -> List[Dict[str, str]]:
@@ -0,0 +1,245 @@
+# src/app/sdk/trends.py
+"""
+Trend Engine for SignalFlow SDK
+
+Computes time-bucketed metrics (per day, week or sprint) from a single
+projected query per metric. Supabase/PostgREST has no GROUP BY, so the
+engine fetches only the date (and any value) columns for the whole window
+in one request and buckets them in one pass, like a ``date_trunc`` GROUP BY.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ("day", "week", "sprint")
+
+# PostgREST caps a response at 1000 rows by default
+PAGE_SIZE = 1000
+
+CACHE_TTL_SECONDS = 300
+
+
+@dataclass
+class MetricSpec:
+    """How to compute one metric from a table."""
+    table: str
+    date_column: str
+    columns: Tuple[str, ...] = ()
+    # "count" -> rows per bucket; "ratio" -> share of rows where match(row) is true
+    aggregate: str = "count"
+    filters: Tuple[Tuple[str, Any], ...] = ()
+    match: Optional[Callable[[Dict], bool]] = None
+    default_period: str = "day"
+
+
+METRICS: Dict[str, MetricSpec] = {
+    "meeting_count": MetricSpec(table="meetings", date_column="meeting_date"),
+    "signal_count": MetricSpec(table="signals", date_column="created_at", default_period="week"),
+    "action_completion": MetricSpec(
+        table="signals",
+        date_column="created_at",
+        columns=("status",),
+        aggregate="ratio",
+        filters=(("signal_type", "action"),),
+        match=lambda row: row.get("status") == "completed",
+        default_period="week",
+    ),
+    "dikw_count": MetricSpec(table="dikw_items", date_column="created_at", default_period="week"),
+}
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class TrendEngine:
+    """
+    Time-bucketed metric engine with a per-period result cache.
+
+    Example:
+        ```python
+        engine = client.insights.trends
+
+        # One query for 30 daily buckets
+        buckets = engine.bucketize("meeting_count", days=30)
+
+        # Weekly signal counts with a 2-bucket rolling average
+        buckets = engine.bucketize("signal_count", days=90, period="week", rolling_window=2)
+        ```
+    """
+
+    def __init__(self, client, cache_ttl: float = CACHE_TTL_SECONDS):
+        self._client = client
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+        self.queries = 0  # round trips issued, for diagnostics
+
+    def bucketize(
+        self,
+        metric: str,
+        days: int = 30,
+        period: Optional[str] = None,
+        rolling_window: Optional[int] = None,
+        sprint_start: Optional[str] = None,
+        sprint_length_days: Optional[int] = None,
+        today: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compute a metric per bucket over the last ``days`` days.
+
+        Args:
+            metric: Name from METRICS
+            days: Window size in days, ending today (inclusive)
+            period: 'day', 'week' (Monday start) or 'sprint'; defaults per metric
+            rolling_window: Also return a trailing mean over this many buckets
+            sprint_start: Sprint anchor date (YYYY-MM-DD); read from sprint_settings if omitted
+            sprint_length_days: Sprint length; read from sprint_settings if omitted
+            today: Override the window end (for testing/backfills)
+
+        Returns:
+            Dict with 'dates', 'values', 'rolling' (or None), 'period'
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}. Available: {sorted(METRICS)}")
+        spec = METRICS[metric]
+        period = period or spec.default_period
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period: {period}. Available: {list(PERIODS)}")
+
+        today = today or date.today()
+        start = today - timedelta(days=days - 1)
+
+        anchor, length = None, None
+        if period == "sprint":
+            anchor, length = self._sprint_config(sprint_start, sprint_length_days, start)
+
+        # Cached per period: same metric/window/bucketing on the same day
+        key = (metric, days, period, rolling_window, anchor, length, today)
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        rows = self._fetch_rows(spec, start, today)
+
+        bucket_of = self._bucket_fn(period, anchor, length)
+        keys = []
+        for offset in range(days):
+            k = bucket_of(start + timedelta(days=offset))
+            if not keys or keys[-1] != k:
+                keys.append(k)
+
+        totals = {k: 0 for k in keys}
+        matches = {k: 0 for k in keys}
+        for row in rows:
+            d = _parse_date(row.get(spec.date_column))
+            if d is None or d < start or d > today:
+                continue
+            k = bucket_of(d)
+            totals[k] += 1
+            if spec.match is not None and spec.match(row):
+                matches[k] += 1
+
+        if spec.aggregate == "ratio":
+            values = [round(matches[k] / totals[k], 3) if totals[k] else 0.0 for k in keys]
+        else:
+            values = [totals[k] for k in keys]
+
+        rolling = None
+        if rolling_window and rolling_window > 1:
+            rolling = []
+            for i in range(len(values)):
+                window = values[max(0, i - rolling_window + 1):i + 1]
+                rolling.append(round(sum(window) / len(window), 3))
+
+        result = {
+            "metric": metric,
+            "period": period,
+            "dates": [k.isoformat() for k in keys],
+            "values": values,
+            "rolling": rolling,
+        }
+        self._cache[key] = (time.monotonic(), result)
+        return result
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    # -------------------------
+    # Internals
+    # -------------------------
+
+    def _bucket_fn(self, period: str, anchor: Optional[date], length: Optional[int]) -> Callable[[date], date]:
+        if period == "day":
+            return lambda d: d
+        if period == "week":
+            return lambda d: d - timedelta(days=d.weekday())
+        return lambda d: anchor + timedelta(days=((d - anchor).days // length) * length)
+
+    def _sprint_config(
+        self,
+        sprint_start: Optional[str],
+        sprint_length_days: Optional[int],
+        window_start: date,
+    ) -> Tuple[date, int]:
+        if sprint_start is None or sprint_length_days is None:
+            settings = {}
+            if self._client.supabase:
+                try:
+                    result = self._client.supabase.table("sprint_settings").select(
+                        "sprint_start_date, sprint_length_days"
+                    ).limit(1).execute()
+                    self.queries += 1
+                    settings = result.data[0] if result.data else {}
+                except Exception as e:
+                    logger.warning(f"Could not load sprint settings: {e}")
+            sprint_start = sprint_start or settings.get("sprint_start_date")
+            sprint_length_days = sprint_length_days or settings.get("sprint_length_days") or 14
+        anchor = _parse_date(sprint_start) or (window_start - timedelta(days=window_start.weekday()))
+        return anchor, int(sprint_length_days)
+
+    def _fetch_rows(self, spec: MetricSpec, start: date, end: date) -> List[Dict]:
+        """Fetch the projected columns for the window in one round trip (paged if large)."""
+        supabase = self._client.supabase
+        if supabase:
+            columns = ", ".join((spec.date_column,) + spec.columns)
+            rows: List[Dict] = []
+            offset = 0
+            while True:
+                query = supabase.table(spec.table).select(columns)
+                for column, value in spec.filters:
+                    query = query.eq(column, value)
+                query = query.gte(spec.date_column, start.isoformat())
+                # Inclusive of timestamps during the last day
+                query = query.lt(spec.date_column, (end + timedelta(days=1)).isoformat())
+                # Offset paging needs a total order, or rows shift between pages
+                query = query.order(spec.date_column).order("id")
+                result = query.range(offset, offset + PAGE_SIZE - 1).execute()
+                self.queries += 1
+                page = result.data or []
+                rows.extend(page)
+                if len(page) < PAGE_SIZE:
+                    return rows
+                offset += PAGE_SIZE
+
+        # API fallback (meetings only): one listing for the whole window
+        if spec.table == "meetings":
+            self.queries += 1
+            meetings = self._client.meetings.list(
+                limit=10000, date_from=start.isoformat(), date_to=end.isoformat()
+            )
+            return [{"meeting_date": m.meeting_date or m.created_at} for m in meetings]
+        return []
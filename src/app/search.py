@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Request, Query
 from fastapi.templating import Jinja2Templates
 from .db import connect
+from .pagination import cursor_offset, page_size, paginate_list
 from .services import documents_supabase, meetings_supabase
+from .template_streaming import render_page
 from typing import Optional
 import re
 
@@ -146,19 +148,25 @@ def search(
     end_date: str | None = Query(default=None),
     include_transcripts: bool = Query(default=False),  # F2: Search raw transcripts
     limit: int = 10,
+    cursor: str | None = Query(default=None),
+    partial: bool = False,
 ):
     results = []
+    limit = page_size(limit, default=10)
+    # Each source returns its newest matches; fetching offset + limit + 1 from
+    # every source is enough to fill this page of the merged, date-sorted list
+    fetch_limit = cursor_offset(cursor) + limit + 1
 
     if q and len(q) >= 2:
         # -------- Documents (from Supabase) --------
         if source_type in ("docs", "both"):
-            doc_results = _search_documents_supabase(q, start_date, end_date, limit)
+            doc_results = _search_documents_supabase(q, start_date, end_date, fetch_limit)
             results.extend(doc_results)
 
         # -------- Meetings (from Supabase) --------
         if source_type in ("meetings", "both", "transcripts"):
             search_transcripts = include_transcripts or source_type == "transcripts"
-            meeting_results = _search_meetings_supabase(q, search_transcripts, start_date, end_date, limit)
+            meeting_results = _search_meetings_supabase(q, search_transcripts, start_date, end_date, fetch_limit)
             results.extend(meeting_results)
         
         # -------- F2: Meeting Documents (linked transcripts/summaries from SQLite) --------
@@ -172,11 +180,11 @@ def search(
                            md.created_at, ms.meeting_name, ms.meeting_date
                     FROM meeting_documents md
                     JOIN meeting_summaries ms ON md.meeting_id = ms.id
-                    WHERE LOWER(md.content) LIKE ?
+                    WHERE LOWER(blob_text(md.content)) LIKE ?
                     ORDER BY md.created_at DESC
                     LIMIT ?
                     """,
-                    (like, limit),
+                    (like, fetch_limit),
                 ).fetchall()
                 
                 for d in doc_results:
@@ -192,17 +200,22 @@ def search(
                     })
 
     results.sort(key=lambda r: r["date"] or "", reverse=True)
+    page = paginate_list(results, cursor, limit)
 
-    return templates.TemplateResponse(
+    return render_page(
+        templates,
         "search.html",
         {
             "request": request,
             "query": q or "",
-            "results": results,
+            "results": page.items,
+            "next_cursor": page.next_cursor,
             "source_type": source_type,
             "start_date": start_date or "",
             "end_date": end_date or "",
             "include_transcripts": include_transcripts,
         },
+        block="result_rows" if partial else None,
+        headers=page.headers() if partial else None,
     )
 
@@ -3,7 +3,8 @@ SignalFlow services - Business logic layer between API and agents.
 Includes embeddings, encryption, sync, and other utilities.
 """
 
-# Make chromadb optional since we're migrating to Supabase pgvector
+# chromadb is optional (migrating to Supabase pgvector); EmbeddingService
+# imports it on construction, not here
 try:
     from .embeddings import EmbeddingService, create_embedding_service
 except ImportError:
@@ -7,6 +7,7 @@ Scheduled jobs that generate proactive notifications:
 - F4b: Stale Ticket/Blocker Alert (daily 9 AM weekdays)
 - F4c: Grooming-to-Ticket Match (hourly)
 - F4d: Sprint Mode Auto-Detect (daily)
+- Evaluation feedback reconcile with LangSmith (every 30 minutes)
 
 Jobs create notifications via NotificationQueue service.
 Can be triggered manually via CLI or scheduled via cron/APScheduler.
@@ -75,6 +76,12 @@ JOB_CONFIGS = {
         schedule="0 14,17 * * 1-5",  # Weekdays at 2 PM and 5 PM
         enabled=True,
     ),
+    "feedback_reconcile": JobConfig(
+        name="Evaluation Feedback Reconcile",
+        description="Sync the local feedback ledger with LangSmith",
+        schedule="*/30 * * * *",  # Every 30 minutes
+        enabled=True,
+    ),
 }
 
 
@@ -601,7 +608,8 @@ def run_job(job_name: str) -> Dict[str, Any]:
     
     Args:
         job_name: One of 'one_on_one_prep', 'stale_ticket_alert', 
-                  'grooming_match', 'sprint_mode_detect', 'overdue_encouragement'
+                  'grooming_match', 'sprint_mode_detect', 'overdue_encouragement',
+                  'feedback_reconcile'
     
     Returns:
         Job result dict
@@ -612,6 +620,7 @@ def run_job(job_name: str) -> Dict[str, Any]:
         "stale_ticket_alert": StaleTicketAlertJob,
         "grooming_match": GroomingMatchJob,
         "overdue_encouragement": OverdueEncouragementJob,
+        "feedback_reconcile": FeedbackReconcileJob,
     }
     
     if job_name not in jobs:
@@ -925,70 +934,39 @@ class GroomingMatchJob:
         return results
     
     def _find_matching_tickets(self, meeting: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Find tickets that match the grooming meeting content (from Supabase)."""
-        meeting_text = (meeting.get("raw_text") or "")[:2000].lower()
-        meeting_name = (meeting.get("meeting_name") or "").lower()
+        """Find active tickets that match the grooming meeting content.
         
-        # Extract key terms from meeting
-        # Simple keyword extraction - look for capitalized words, ticket IDs, etc.
-        ticket_id_pattern = re.compile(r'\b([A-Z]+-\d+)\b')
-        potential_ids = ticket_id_pattern.findall(meeting.get("raw_text") or "")
+        Uses the shared BM25 ticket index, so the full transcript is matched
+        against the full backlog rather than the most recent tickets.
+        """
+        from .ticket_index import get_ticket_index, ACTIVE_STATUSES
         
-        matches = []
+        raw_text = meeting.get("raw_text") or ""
+        index = get_ticket_index()
         
-        # Get all active tickets from Supabase
-        all_tickets = tickets_supabase.get_active_tickets()
+        def to_match(ticket, score, match_type):
+            return {
+                "id": ticket["id"],
+                "title": ticket.get("title") or "",
+                "status": ticket.get("status") or "",
+                "description": ticket.get("description") or "",
+                "tags": ticket.get("tags") or "",
+                "score": score,
+                "match_type": match_type,
+            }
         
         # First, check for exact ticket ID matches
-        if potential_ids:
-            potential_ids_lower = [pid.lower() for pid in potential_ids]
-            for ticket in all_tickets:
-                ticket_id = (ticket.get("ticket_id") or "").lower()
-                if ticket_id in potential_ids_lower:
-                    matches.append({
-                        "id": ticket["id"],
-                        "title": ticket.get("title") or "",
-                        "status": ticket.get("status") or "",
-                        "description": ticket.get("description") or "",
-                        "tags": ticket.get("tags") or "",
-                        "score": 100,  # Exact ID match
-                        "match_type": "id_match",
-                    })
+        matches = [
+            to_match(ticket, 100, "id_match")  # Exact ID match
+            for ticket in index.find_by_keys(raw_text, statuses=ACTIVE_STATUSES)
+        ]
         
-        # Then, do fuzzy title matching
+        # Then, rank by content similarity
         if not matches:
-            # Sort by updated_at for recent tickets
-            def get_updated(t):
-                return t.get("updated_at") or ""
-            sorted_tickets = sorted(all_tickets, key=get_updated, reverse=True)[:50]
-            
-            for ticket in sorted_tickets:
-                title = (ticket.get("title") or "").lower()
-                desc = (ticket.get("description") or "").lower()
-                
-                # Simple scoring: count word overlaps
-                title_words = set(title.split())
-                meeting_words = set(meeting_text.split())
-                
-                # Remove common words
-                common_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-                               'to', 'of', 'and', 'in', 'that', 'for', 'on', 'with', 'as'}
-                title_words -= common_words
-                meeting_words -= common_words
-                
-                overlap = len(title_words & meeting_words)
-                
-                if overlap >= 2:  # At least 2 significant words overlap
-                    score = min(overlap * 15, 80)  # Cap at 80 for fuzzy match
-                    matches.append({
-                        "id": ticket["id"],
-                        "title": ticket.get("title") or "",
-                        "status": ticket.get("status") or "",
-                        "description": ticket.get("description") or "",
-                        "tags": ticket.get("tags") or "",
-                        "score": score,
-                        "match_type": "keyword_match",
-                    })
+            query = f"{meeting.get('meeting_name') or ''}\n{raw_text}"
+            for result in index.search(query, limit=3, statuses=ACTIVE_STATUSES, min_matched_terms=2):
+                # Cap at 80 for content matches
+                matches.append(to_match(result["ticket"], round(result["confidence"] * 80), "keyword_match"))
         
         # Sort by score descending
         matches.sort(key=lambda x: x["score"], reverse=True)
@@ -1404,3 +1382,31 @@ class OverdueEncouragementJob:
             priority=NotificationPriority.NORMAL,
             expires_at=datetime.now() + timedelta(hours=4),
         )
+
+
+# =============================================================================
+# EVALUATION FEEDBACK RECONCILE
+# =============================================================================
+
+class FeedbackReconcileJob:
+    """
+    Keep the local feedback ledger and LangSmith in line.
+    
+    Feedback is always recorded locally first; this pushes events that
+    never reached LangSmith (offline, API errors) and pulls feedback
+    created in LangSmith itself (UI annotations, online evaluators).
+    
+    Schedule: Every 30 minutes (no-op when LangSmith isn't configured)
+    """
+    
+    def run(self) -> Dict[str, Any]:
+        """Run one reconciliation pass."""
+        from .feedback_ledger import reconcile_with_langsmith
+        
+        result = reconcile_with_langsmith()
+        if not result.get("skipped"):
+            logger.info(
+                f"Feedback reconcile: pushed {result['pushed']}, pulled {result['pulled']}, "
+                f"errors {result['errors']}"
+            )
+        return result
@@ -0,0 +1,408 @@
+"""
+Bulk Transcript Import (F1c)
+
+Backfills many meeting transcripts at once from a zip archive or a
+directory:
+
+- files are read one at a time (zip members are decompressed on demand
+  from the seekable archive), so the archive is never held in memory
+- clean -> parse -> extract runs in a process pool; the extractors are
+  pure regex, so this scales with cores
+- at most ``workers * 4`` files are in flight, bounding memory for large
+  archives
+- meetings and their import_history rows are written in batches, one
+  transaction per batch
+- every file gets an import_history row tagged with the run's batch_id,
+  so progress can be polled while the import runs
+
+Usage:
+    python scripts/bulk_import.py ~/Downloads/pocket-export.zip
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = ("md", "markdown", "txt")
+MAX_FILE_BYTES = 5 * 1024 * 1024  # per transcript; guards against zip bombs
+DEFAULT_BATCH_SIZE = 50
+IMPORT_SOURCE = "bulk_import"
+
+_DATE_IN_NAME = re.compile(r"(\d{4})[-_.]?(\d{2})[-_.]?(\d{2})")
+
+
+# ============== Text Helpers ==============
+
+def extract_markdown_text(content: bytes) -> str:
+    """
+    Extract plain text from markdown file content.
+
+    Args:
+        content: Raw bytes from uploaded file
+
+    Returns:
+        Decoded text content (markdown is already text)
+
+    Raises:
+        ValueError: If content cannot be decoded as UTF-8
+    """
+    try:
+        text = content.decode('utf-8')
+        return text.strip()
+    except UnicodeDecodeError:
+        # Try with latin-1 as fallback
+        try:
+            text = content.decode('latin-1')
+            return text.strip()
+        except:
+            raise ValueError("Could not decode file as text. Ensure it's a valid text/markdown file.")
+
+
+def infer_meeting_name_from_content(text: str, filename: str) -> str:
+    """
+    Try to infer a meeting name from the content or filename.
+
+    Checks for:
+    1. First H1 header (# Title)
+    2. First line if it looks like a title
+    3. Filename without extension
+    """
+    lines = text.split('\n')
+
+    # Look for H1 header
+    for line in lines[:10]:  # Check first 10 lines
+        line = line.strip()
+        if line.startswith('# '):
+            return line[2:].strip()[:100]  # Remove # and limit length
+
+    # Check if first non-empty line looks like a title (short, no punctuation at end)
+    for line in lines[:5]:
+        line = line.strip()
+        if line and len(line) < 80 and not line.endswith(('.', '?', '!')):
+            if not line.startswith(('#', '-', '*', '>')):  # Not a markdown element
+                return line[:100]
+
+    # Fall back to filename
+    name = filename.rsplit('.', 1)[0]  # Remove extension
+    name = name.replace('_', ' ').replace('-', ' ')  # Clean up
+    return name[:100]
+
+
+def infer_meeting_date_from_filename(filename: str) -> Optional[str]:
+    """Pick a YYYY-MM-DD (or YYYYMMDD) date out of a filename, if it has a valid one."""
+    match = _DATE_IN_NAME.search(os.path.basename(filename))
+    if not match:
+        return None
+    try:
+        return datetime(*(int(g) for g in match.groups())).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+def _is_transcript_name(name: str) -> bool:
+    base = os.path.basename(name)
+    if not base or base.startswith('.') or '__MACOSX' in name:
+        return False
+    return '.' in base and base.rsplit('.', 1)[-1].lower() in SUPPORTED_EXTENSIONS
+
+
+# ============== Sources ==============
+
+def iter_zip_transcripts(archive: Union[str, Path, BinaryIO]) -> Iterator[Tuple[str, Union[bytes, Exception]]]:
+    """
+    Yield (member name, bytes) for each transcript in a zip.
+
+    ``archive`` must be a path or a seekable file object; members are
+    decompressed one at a time. Oversized or unreadable members yield the
+    exception instead of bytes so they are recorded as failed.
+    """
+    with zipfile.ZipFile(archive) as zf:
+        for info in zf.infolist():
+            if info.is_dir() or not _is_transcript_name(info.filename):
+                continue
+            if info.file_size > MAX_FILE_BYTES:
+                yield info.filename, ValueError(f"File too large ({info.file_size} bytes, max {MAX_FILE_BYTES})")
+                continue
+            try:
+                with zf.open(info) as member:
+                    yield info.filename, member.read(MAX_FILE_BYTES + 1)
+            except (zipfile.BadZipFile, RuntimeError, OSError) as e:
+                yield info.filename, e
+
+
+def iter_directory_transcripts(root: Union[str, Path]) -> Iterator[Tuple[str, Union[bytes, Exception]]]:
+    """Yield (relative path, bytes) for each transcript under a directory, in sorted order."""
+    root = Path(root)
+    for path in sorted(root.rglob('*')):
+        rel = path.relative_to(root).as_posix()
+        if not path.is_file() or not _is_transcript_name(rel):
+            continue
+        if path.stat().st_size > MAX_FILE_BYTES:
+            yield rel, ValueError(f"File too large ({path.stat().st_size} bytes, max {MAX_FILE_BYTES})")
+            continue
+        yield rel, path.read_bytes()
+
+
+def iter_transcript_sources(source: Union[str, Path, BinaryIO]) -> Iterator[Tuple[str, Union[bytes, Exception]]]:
+    """Dispatch to the zip or directory reader."""
+    if isinstance(source, (str, Path)) and Path(source).is_dir():
+        return iter_directory_transcripts(source)
+    return iter_zip_transcripts(source)
+
+
+# ============== Worker ==============
+
+def process_transcript(filename: str, content: bytes, default_date: str, date_from_filename: bool = True) -> Dict[str, Any]:
+    """
+    Decode and run clean -> parse -> extract for one file.
+
+    Runs in a worker process, so it takes and returns plain data only.
+    """
+    from ..mcp.cleaner import clean_meeting_text
+    from ..mcp.extract import extract_structured_signals
+    from ..mcp.parser import parse_meeting_summary
+
+    file_type = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    result: Dict[str, Any] = {"filename": filename, "file_type": file_type, "warnings": []}
+
+    if len(content) > MAX_FILE_BYTES:
+        result["error"] = f"File too large (max {MAX_FILE_BYTES} bytes)"
+        return result
+    try:
+        text = extract_markdown_text(content)
+    except ValueError as e:
+        result["error"] = str(e)
+        return result
+    if len(text) < 10:
+        result["error"] = "File content is too short (minimum 10 characters)"
+        return result
+
+    meeting_date = infer_meeting_date_from_filename(filename) if date_from_filename else None
+    if not meeting_date:
+        meeting_date = default_date
+        result["warnings"].append(f"Meeting date set to {default_date}")
+
+    result.update(
+        text=text,
+        meeting_name=infer_meeting_name_from_content(text, os.path.basename(filename)),
+        meeting_date=meeting_date,
+    )
+    try:
+        signals = extract_structured_signals(parse_meeting_summary(clean_meeting_text(text)))
+        result["signals"] = signals
+        result["signal_count"] = sum(len(v) for v in signals.values() if isinstance(v, list))
+    except Exception as e:
+        result["signals"] = None
+        result["signal_count"] = 0
+        result["warnings"].append(f"Signal extraction failed: {e}")
+    return result
+
+
+# ============== Progress ==============
+
+@dataclass
+class BulkImportProgress:
+    """Live counters for one bulk import run."""
+    batch_id: str
+    status: str = "running"  # running | completed | failed
+    discovered: int = 0
+    processed: int = 0
+    completed: int = 0
+    failed: int = 0
+    signals: int = 0
+    meeting_ids: List[int] = field(default_factory=list)
+    errors: List[Dict[str, str]] = field(default_factory=list)
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    finished_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batch_id": self.batch_id,
+            "status": self.status,
+            "discovered": self.discovered,
+            "processed": self.processed,
+            "completed": self.completed,
+            "failed": self.failed,
+            "signals": self.signals,
+            "meeting_ids": self.meeting_ids,
+            "errors": self.errors[:50],
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+_runs: Dict[str, BulkImportProgress] = {}
+_runs_lock = threading.Lock()
+
+
+def get_bulk_import_progress(batch_id: str) -> Optional[Dict[str, Any]]:
+    """Live progress for a run in this process, falling back to import_history rows."""
+    with _runs_lock:
+        progress = _runs.get(batch_id)
+    if progress:
+        return progress.to_dict()
+
+    from ..db import connect
+
+    with connect() as conn:
+        rows = conn.execute(
+            "SELECT filename, status, meeting_id, error_message FROM import_history WHERE batch_id = ?",
+            (batch_id,),
+        ).fetchall()
+    if not rows:
+        return None
+    return {
+        "batch_id": batch_id,
+        "status": "completed",
+        "processed": len(rows),
+        "completed": sum(1 for r in rows if r["status"] == "completed"),
+        "failed": sum(1 for r in rows if r["status"] == "failed"),
+        "meeting_ids": [r["meeting_id"] for r in rows if r["meeting_id"]],
+        "errors": [
+            {"filename": r["filename"], "error": r["error_message"]}
+            for r in rows if r["status"] == "failed"
+        ][:50],
+    }
+
+
+# ============== Runner ==============
+
+def _default_executor(workers: int) -> Executor:
+    if workers <= 1:
+        return ThreadPoolExecutor(max_workers=1)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+class BulkImporter:
+    """Stream transcripts through a worker pool and write them in batches."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        default_date: Optional[str] = None,
+        date_from_filename: bool = True,
+        source_url: Optional[str] = None,
+        executor_factory: Callable[[int], Executor] = _default_executor,
+    ):
+        self.workers = workers or max(1, min(8, (os.cpu_count() or 2) - 1))
+        self.batch_size = batch_size
+        self.default_date = default_date or datetime.now().strftime('%Y-%m-%d')
+        self.date_from_filename = date_from_filename
+        self.source_url = source_url
+        self._executor_factory = executor_factory
+
+    def run(
+        self,
+        sources: Iterable[Tuple[str, Union[bytes, Exception]]],
+        batch_id: Optional[str] = None,
+        on_progress: Optional[Callable[[BulkImportProgress], None]] = None,
+    ) -> BulkImportProgress:
+        """Import every (filename, bytes) pair; returns the final progress record."""
+        progress = BulkImportProgress(batch_id=batch_id or uuid.uuid4().hex[:12])
+        with _runs_lock:
+            _runs[progress.batch_id] = progress
+
+        pending_rows: List[Dict[str, Any]] = []
+        max_in_flight = self.workers * 4
+
+        def flush():
+            if pending_rows:
+                self._write_batch(pending_rows, progress)
+                pending_rows.clear()
+                if on_progress:
+                    on_progress(progress)
+
+        def collect(future_result: Dict[str, Any]):
+            pending_rows.append(future_result)
+            progress.processed += 1
+            if len(pending_rows) >= self.batch_size:
+                flush()
+
+        try:
+            with self._executor_factory(self.workers) as executor:
+                in_flight = set()
+                for filename, content in sources:
+                    progress.discovered += 1
+                    if isinstance(content, Exception):
+                        collect({"filename": filename, "file_type": filename.rsplit('.', 1)[-1].lower(),
+                                 "error": str(content), "warnings": []})
+                        continue
+                    in_flight.add(executor.submit(
+                        process_transcript, filename, content, self.default_date, self.date_from_filename
+                    ))
+                    if len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(self._result_of(future))
+                for future in wait(in_flight).done:
+                    collect(self._result_of(future))
+            flush()
+            progress.status = "completed"
+        except Exception as e:
+            logger.error(f"Bulk import {progress.batch_id} failed: {e}")
+            progress.status = "failed"
+            progress.errors.append({"filename": "*", "error": str(e)})
+        finally:
+            progress.finished_at = datetime.now().isoformat()
+            with _runs_lock:
+                # Keep only recent runs in memory; history rows remain in the DB
+                for stale in list(_runs)[:-20]:
+                    _runs.pop(stale, None)
+
+        logger.info(
+            f"Bulk import {progress.batch_id}: {progress.completed} imported, "
+            f"{progress.failed} failed, {progress.signals} signals"
+        )
+        return progress
+
+    @staticmethod
+    def _result_of(future) -> Dict[str, Any]:
+        try:
+            return future.result()
+        except Exception as e:  # worker crashed (e.g. BrokenProcessPool)
+            return {"filename": "?", "file_type": "", "error": f"Worker failed: {e}", "warnings": []}
+
+    def _write_batch(self, rows: List[Dict[str, Any]], progress: BulkImportProgress):
+        """Insert a batch of meetings and their import_history rows in one transaction."""
+        from ..db import connect
+        from ..db_blobs import put_text
+
+        with connect() as conn:
+            for row in rows:
+                if row.get("error"):
+                    conn.execute("""
+                        INSERT INTO import_history (filename, file_type, status, error_message, batch_id)
+                        VALUES (?, ?, 'failed', ?, ?)
+                    """, (row["filename"], row["file_type"], row["error"], progress.batch_id))
+                    progress.failed += 1
+                    progress.errors.append({"filename": row["filename"], "error": row["error"]})
+                    continue
+
+                signals_json = json.dumps(row["signals"]) if row.get("signals") is not None else None
+                cursor = conn.execute("""
+                    INSERT INTO meeting_summaries
+                    (meeting_name, synthesized_notes, meeting_date, raw_text, signals_json, import_source, source_url)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (row["meeting_name"], row["text"], row["meeting_date"], put_text(conn, row["text"]),
+                      signals_json, IMPORT_SOURCE, self.source_url))
+                meeting_id = cursor.lastrowid
+                conn.execute("""
+                    INSERT INTO import_history (filename, file_type, meeting_id, status, batch_id)
+                    VALUES (?, ?, ?, 'completed', ?)
+                """, (row["filename"], row["file_type"], meeting_id, progress.batch_id))
+                progress.completed += 1
+                progress.signals += row.get("signal_count", 0)
+                progress.meeting_ids.append(meeting_id)
+            conn.commit()
@@ -0,0 +1,402 @@
+"""
+Code Locker Version Store
+
+Stores code locker file versions as periodic full snapshots plus compact
+forward line deltas, deduplicated by content hash. Diffs between version
+pairs are kept in a bounded in-process LRU keyed by content hash, so repeated
+comparisons are a single lookup and reading a diff never writes to the database.
+"""
+
+import difflib
+import hashlib
+import json
+import logging
+import time
+import zlib
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Every Nth version in a chain is stored as a full snapshot, which bounds
+# reconstruction to at most SNAPSHOT_INTERVAL - 1 delta applications.
+SNAPSHOT_INTERVAL = 10
+
+# Reconstructed contents keyed by content hash (immutable, so never stale)
+_CONTENT_CACHE_SIZE = 64
+_content_cache: "OrderedDict[str, str]" = OrderedDict()
+
+# Diff bodies keyed by (from_hash, to_hash), least recently used evicted first
+_DIFF_CACHE_SIZE = 256
+_diff_cache: "OrderedDict[Tuple[str, str], Tuple[str, int, int]]" = OrderedDict()
+
+# In-process diff counters surfaced through admin stats
+_diff_stats = {
+    'requests': 0,
+    'cache_hits': 0,
+    'total_ms': 0.0,
+    'max_ms': 0.0,
+}
+
+
+class CodeLockerStore:
+    """Delta-compressed, content-addressed storage for code locker versions."""
+
+    # -------------------------
+    # Encoding
+    # -------------------------
+
+    @staticmethod
+    def compute_content_hash(content: str) -> str:
+        """SHA-256 of file content, used as the blob key."""
+        return hashlib.sha256((content or '').encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return zlib.compress(json.dumps(value, separators=(',', ':')).encode('utf-8'), 6)
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        return json.loads(zlib.decompress(payload).decode('utf-8'))
+
+    @staticmethod
+    def make_delta(base: str, target: str) -> List[list]:
+        """Build a forward line delta that turns ``base`` into ``target``.
+
+        Ops are ``["c", start, end]`` to copy base lines and ``["i", [lines]]``
+        to insert new lines; deleted base lines are simply not copied.
+        """
+        base_lines = base.splitlines(keepends=True)
+        target_lines = target.splitlines(keepends=True)
+        matcher = difflib.SequenceMatcher(None, base_lines, target_lines, autojunk=False)
+
+        ops = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                ops.append(['c', i1, i2])
+            elif tag in ('replace', 'insert'):
+                ops.append(['i', target_lines[j1:j2]])
+        return ops
+
+    @staticmethod
+    def apply_delta(base: str, ops: List[list]) -> str:
+        """Apply a delta produced by :meth:`make_delta`."""
+        base_lines = base.splitlines(keepends=True)
+        out = []
+        for op in ops:
+            if op[0] == 'c':
+                out.extend(base_lines[op[1]:op[2]])
+            else:
+                out.extend(op[1])
+        return ''.join(out)
+
+    # -------------------------
+    # Blob storage
+    # -------------------------
+
+    @staticmethod
+    def _latest_hash_for_file(conn, filename: str) -> Optional[str]:
+        row = conn.execute("""
+            SELECT content_hash FROM code_locker
+            WHERE filename = ? AND content_hash IS NOT NULL
+            ORDER BY version DESC, id DESC
+            LIMIT 1
+        """, (filename,)).fetchone()
+        return row['content_hash'] if row else None
+
+    @staticmethod
+    def put_content(conn, filename: str, content: str) -> str:
+        """Store content as a blob and return its hash.
+
+        Identical content is stored once. New content is written as a delta
+        against the file's latest version unless the chain is due for a full
+        snapshot or the delta would not be smaller than the snapshot.
+        """
+        content = content or ''
+        content_hash = CodeLockerStore.compute_content_hash(content)
+
+        existing = conn.execute(
+            "SELECT 1 FROM code_locker_blobs WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        if existing:
+            return content_hash
+
+        full_payload = CodeLockerStore._encode(content)
+        storage, base_hash, chain_depth, payload = 'full', None, 0, full_payload
+
+        base_candidate = CodeLockerStore._latest_hash_for_file(conn, filename)
+        if base_candidate:
+            base = conn.execute(
+                "SELECT chain_depth FROM code_locker_blobs WHERE content_hash = ?", (base_candidate,)
+            ).fetchone()
+            if base and base['chain_depth'] + 1 < SNAPSHOT_INTERVAL:
+                base_content = CodeLockerStore.get_content(conn, base_candidate)
+                if base_content is not None:
+                    delta_payload = CodeLockerStore._encode(
+                        CodeLockerStore.make_delta(base_content, content)
+                    )
+                    if len(delta_payload) < len(full_payload):
+                        storage, base_hash = 'delta', base_candidate
+                        chain_depth, payload = base['chain_depth'] + 1, delta_payload
+
+        conn.execute("""
+            INSERT INTO code_locker_blobs
+            (content_hash, storage, base_hash, chain_depth, payload, raw_size, stored_size)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            content_hash,
+            storage,
+            base_hash,
+            chain_depth,
+            payload,
+            len(content.encode('utf-8')),
+            len(payload)
+        ))
+        CodeLockerStore._remember(content_hash, content)
+        return content_hash
+
+    @staticmethod
+    def _remember(content_hash: str, content: str):
+        _content_cache[content_hash] = content
+        _content_cache.move_to_end(content_hash)
+        while len(_content_cache) > _CONTENT_CACHE_SIZE:
+            _content_cache.popitem(last=False)
+
+    @staticmethod
+    def get_content(conn, content_hash: str) -> Optional[str]:
+        """Reconstruct content for a hash by walking back to the nearest snapshot."""
+        if content_hash in _content_cache:
+            _content_cache.move_to_end(content_hash)
+            return _content_cache[content_hash]
+
+        chain = []
+        current = content_hash
+        base_content = None
+        while current:
+            if current in _content_cache:
+                base_content = _content_cache[current]
+                break
+            blob = conn.execute("""
+                SELECT storage, base_hash, payload FROM code_locker_blobs
+                WHERE content_hash = ?
+            """, (current,)).fetchone()
+            if not blob:
+                logger.warning(f"Missing code locker blob {current}")
+                return None
+            if blob['storage'] == 'full':
+                base_content = CodeLockerStore._decode(blob['payload'])
+                break
+            chain.append(blob['payload'])
+            current = blob['base_hash']
+
+        if base_content is None:
+            return None
+
+        content = base_content
+        for payload in reversed(chain):
+            content = CodeLockerStore.apply_delta(content, CodeLockerStore._decode(payload))
+
+        CodeLockerStore._remember(content_hash, content)
+        return content
+
+    # -------------------------
+    # Version rows
+    # -------------------------
+
+    @staticmethod
+    def insert_version(
+        conn,
+        filename: str,
+        content: str,
+        ticket_id: Optional[int],
+        version: int,
+        notes: str = '',
+        is_initial: bool = False
+    ) -> int:
+        """Insert a code_locker row whose content lives in the blob store.
+
+        Returns:
+            ID of the new code_locker row
+        """
+        content_hash = CodeLockerStore.put_content(conn, filename, content)
+        cur = conn.execute("""
+            INSERT INTO code_locker (filename, content, content_hash, ticket_id, version, notes, is_initial)
+            VALUES (?, '', ?, ?, ?, ?, ?)
+        """, (filename, content_hash, ticket_id, version, notes, 1 if is_initial else 0))
+        return cur.lastrowid
+
+    @staticmethod
+    def row_content(conn, row) -> str:
+        """Content for a code_locker row, whether stored inline or as a blob."""
+        row = dict(row)
+        if row.get('content_hash'):
+            content = CodeLockerStore.get_content(conn, row['content_hash'])
+            if content is not None:
+                return content
+        return row.get('content') or ''
+
+    @staticmethod
+    def hydrate(conn, rows) -> List[Dict[str, Any]]:
+        """Convert code_locker rows to dicts with ``content`` filled in."""
+        entries = []
+        for row in rows:
+            entry = dict(row)
+            entry['content'] = CodeLockerStore.row_content(conn, entry)
+            entries.append(entry)
+        return entries
+
+    @staticmethod
+    def compact(conn) -> int:
+        """Move legacy inline ``content`` into the blob store.
+
+        Rows are processed per file in version order so each one can delta
+        against its predecessor.
+
+        Returns:
+            Number of rows compacted
+        """
+        rows = conn.execute("""
+            SELECT id, filename, content FROM code_locker
+            WHERE content_hash IS NULL
+            ORDER BY filename, version, id
+        """).fetchall()
+
+        for row in rows:
+            content_hash = CodeLockerStore.put_content(conn, row['filename'], row['content'])
+            conn.execute(
+                "UPDATE code_locker SET content = '', content_hash = ? WHERE id = ?",
+                (content_hash, row['id'])
+            )
+
+        if rows:
+            logger.info(f"Compacted {len(rows)} code locker rows into the version store")
+        return len(rows)
+
+    # -------------------------
+    # Diffs
+    # -------------------------
+
+    @staticmethod
+    def _hash_for_version(conn, filename: str, version: int) -> Tuple[Optional[str], bool]:
+        """Return (content_hash, found) for a file version.
+
+        Legacy inline rows are hashed and their content primed into the content
+        cache rather than written to the blob store; :meth:`compact` does that.
+        """
+        row = conn.execute("""
+            SELECT id, content, content_hash FROM code_locker
+            WHERE filename = ? AND version = ?
+            ORDER BY id DESC
+            LIMIT 1
+        """, (filename, version)).fetchone()
+        if not row:
+            return None, False
+        if row['content_hash']:
+            return row['content_hash'], True
+        content = row['content'] or ''
+        content_hash = CodeLockerStore.compute_content_hash(content)
+        CodeLockerStore._remember(content_hash, content)
+        return content_hash, True
+
+    @staticmethod
+    def diff_versions(conn, filename: str, v1: int, v2: int) -> Optional[Dict[str, Any]]:
+        """Unified diff between two versions of a file, cached by content hash pair.
+
+        Read-only: safe to call from GET handlers without committing.
+
+        Returns:
+            Diff payload, or None if either version does not exist or its
+            content can't be reconstructed (missing blob)
+        """
+        started = time.perf_counter()
+
+        hash1, found1 = CodeLockerStore._hash_for_version(conn, filename, v1)
+        hash2, found2 = CodeLockerStore._hash_for_version(conn, filename, v2)
+        if not found1 or not found2:
+            return None
+
+        key = (hash1, hash2)
+        cached = key in _diff_cache
+        if cached:
+            _diff_cache.move_to_end(key)
+            body, lines_added, lines_removed = _diff_cache[key]
+        else:
+            content1 = CodeLockerStore.get_content(conn, hash1)
+            content2 = CodeLockerStore.get_content(conn, hash2)
+            if content1 is None or content2 is None:
+                return None
+            # Headers are rendered per request since they carry version labels
+            diff = list(difflib.unified_diff(
+                content1.splitlines(keepends=True),
+                content2.splitlines(keepends=True),
+            ))
+            body = "".join(diff[2:])
+            lines_added = sum(1 for line in diff if line.startswith('+'))
+            lines_removed = sum(1 for line in diff if line.startswith('-'))
+            _diff_cache[key] = (body, lines_added, lines_removed)
+            while len(_diff_cache) > _DIFF_CACHE_SIZE:
+                _diff_cache.popitem(last=False)
+
+        header = f"--- {filename} (v{v1})\n+++ {filename} (v{v2})\n" if body else ""
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _diff_stats['requests'] += 1
+        _diff_stats['cache_hits'] += 1 if cached else 0
+        _diff_stats['total_ms'] += elapsed_ms
+        _diff_stats['max_ms'] = max(_diff_stats['max_ms'], elapsed_ms)
+
+        return {
+            "filename": filename,
+            "v1": v1,
+            "v2": v2,
+            "diff": header + body,
+            "lines_added": lines_added,
+            "lines_removed": lines_removed,
+        }
+
+    # -------------------------
+    # Stats
+    # -------------------------
+
+    @staticmethod
+    def get_stats(conn) -> Dict[str, Any]:
+        """Storage ratio and diff latency for the admin stats view."""
+        versions = conn.execute("""
+            SELECT COUNT(*) AS versions,
+                   SUM(CASE WHEN content_hash IS NULL THEN 1 ELSE 0 END) AS legacy_rows,
+                   COALESCE(SUM(LENGTH(CAST(content AS BLOB))), 0) AS inline_bytes
+            FROM code_locker
+        """).fetchone()
+        logical = conn.execute("""
+            SELECT COALESCE(SUM(b.raw_size), 0) AS logical_bytes
+            FROM code_locker cl
+            JOIN code_locker_blobs b ON b.content_hash = cl.content_hash
+        """).fetchone()
+        blobs = conn.execute("""
+            SELECT COUNT(*) AS blobs,
+                   SUM(CASE WHEN storage = 'full' THEN 1 ELSE 0 END) AS snapshots,
+                   SUM(CASE WHEN storage = 'delta' THEN 1 ELSE 0 END) AS deltas,
+                   COALESCE(SUM(stored_size), 0) AS stored_bytes,
+                   COALESCE(MAX(chain_depth), 0) AS max_chain_depth
+            FROM code_locker_blobs
+        """).fetchone()
+        logical_bytes = logical['logical_bytes'] + versions['inline_bytes']
+        stored_bytes = blobs['stored_bytes'] + versions['inline_bytes']
+        requests = _diff_stats['requests']
+
+        return {
+            'versions': versions['versions'],
+            'legacy_rows': versions['legacy_rows'] or 0,
+            'blobs': blobs['blobs'],
+            'snapshots': blobs['snapshots'] or 0,
+            'deltas': blobs['deltas'] or 0,
+            'max_chain_depth': blobs['max_chain_depth'],
+            'logical_bytes': logical_bytes,
+            'stored_bytes': stored_bytes,
+            'storage_ratio': round(stored_bytes / logical_bytes, 4) if logical_bytes else None,
+            'cached_diffs': len(_diff_cache),
+            'diff_requests': requests,
+            'diff_cache_hits': _diff_stats['cache_hits'],
+            'diff_avg_ms': round(_diff_stats['total_ms'] / requests, 3) if requests else None,
+            'diff_max_ms': round(_diff_stats['max_ms'], 3),
+        }
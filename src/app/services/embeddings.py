@@ -3,8 +3,6 @@ Embedding service for SignalFlow using ChromaDB.
 Handles text embeddings, semantic search, and vector storage.
 """
 
-import chromadb
-from chromadb.config import Settings
 import logging
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -38,6 +36,9 @@ class EmbeddingService:
         self.persist_directory = persist_directory
         self.use_http_client = use_http_client
         
+        # Deferred so importing this module doesn't load chromadb
+        import chromadb
+        
         try:
             if use_http_client:
                 # Connect to ChromaDB HTTP server
@@ -34,7 +34,6 @@ Usage:
 
 import logging
 import os
-from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass, field
 
@@ -68,12 +67,17 @@ def submit_feedback(
     comment: Optional[str] = None,
     correction: Optional[str] = None,
     source_info: Optional[Dict[str, Any]] = None,
+    agent_name: Optional[str] = None,
+    dedupe_key: Optional[str] = None,
 ) -> Optional[str]:
     """
     Submit feedback for a LangSmith trace run.
     
     This is the primary way to provide human feedback that can be used
-    to improve agent prompts over time.
+    to improve agent prompts over time. The feedback is also written to
+    the local feedback ledger (even when LangSmith is disabled or the
+    call fails; reconciliation pushes it later), which is what summaries
+    and the evaluation dashboard read.
     
     Args:
         run_id: The LangSmith run ID to provide feedback for
@@ -83,12 +87,41 @@ def submit_feedback(
         comment: Freeform comment about the output
         correction: What the correct output should have been
         source_info: Metadata about who/what provided the feedback
+        agent_name: Agent that produced the run (defaults to source_info["agent_name"])
+        dedupe_key: Replace any earlier ledger event with this key
     
     Returns:
-        Feedback ID if successful, None otherwise
+        LangSmith feedback ID if successful, None otherwise
     """
+    feedback_id = _submit_to_langsmith(run_id, key, score, value, comment, correction, source_info)
+    
+    from .feedback_ledger import record_feedback
+    record_feedback(
+        key,
+        score=score,
+        value=value,
+        source=(source_info or {}).get("type", "app"),
+        run_id=run_id,
+        agent_name=agent_name or (source_info or {}).get("agent_name"),
+        comment=comment,
+        dedupe_key=dedupe_key,
+        langsmith_feedback_id=str(feedback_id) if feedback_id else None,
+    )
+    return feedback_id
+
+
+def _submit_to_langsmith(
+    run_id: str,
+    key: str,
+    score: Optional[float],
+    value: Optional[str],
+    comment: Optional[str],
+    correction: Optional[str],
+    source_info: Optional[Dict[str, Any]],
+) -> Optional[str]:
+    """Create the feedback in LangSmith; None when disabled or on failure."""
     if not is_evaluation_enabled():
-        logger.debug("Evaluation disabled, skipping feedback submission")
+        logger.debug("Evaluation disabled, skipping LangSmith feedback submission")
         return None
     
     try:
@@ -172,6 +205,7 @@ def submit_thumbs_feedback(
         value="positive" if is_positive else "negative",
         comment=comment,
         source_info={"type": "user", "user_id": user_id} if user_id else None,
+        dedupe_key=f"run:{run_id}:user_feedback:{user_id or 'anonymous'}",
     )
 
 
@@ -603,6 +637,10 @@ def get_feedback_summary(
     """
     Get aggregated feedback summary for an agent.
     
+    Reads the local feedback ledger's daily rollups, so it works offline
+    and costs an indexed read per (day, agent, key) rather than a LangSmith
+    run scan.
+    
     Args:
         agent_name: Filter by agent name (or None for all)
         days: Number of days to look back
@@ -610,55 +648,10 @@ def get_feedback_summary(
     Returns:
         Summary dict with average scores, counts, etc.
     """
-    if not is_evaluation_enabled():
-        return {"error": "Evaluation not enabled"}
+    from .feedback_ledger import get_summary
     
     try:
-        from langsmith import Client
-        from datetime import timedelta
-        
-        client = Client()
-        
-        # Query runs with feedback
-        start_time = datetime.now() - timedelta(days=days)
-        
-        runs = client.list_runs(
-            project_name=os.environ.get("LANGSMITH_PROJECT", "signalflow"),
-            start_time=start_time,
-            filter=f'has(feedback_stats)' + (f' and eq(metadata.agent_name, "{agent_name}")' if agent_name else ''),
-            limit=1000,
-        )
-        
-        # Aggregate feedback
-        feedback_counts = {}
-        feedback_scores = {}
-        
-        for run in runs:
-            if run.feedback_stats:
-                for key, stats in run.feedback_stats.items():
-                    if key not in feedback_counts:
-                        feedback_counts[key] = 0
-                        feedback_scores[key] = []
-                    feedback_counts[key] += stats.get('n', 0)
-                    if stats.get('avg') is not None:
-                        feedback_scores[key].append(stats['avg'])
-        
-        # Calculate averages
-        summary = {
-            "agent_name": agent_name or "all",
-            "period_days": days,
-            "metrics": {},
-        }
-        
-        for key in feedback_counts:
-            avg_score = sum(feedback_scores.get(key, [])) / len(feedback_scores.get(key, [1])) if feedback_scores.get(key) else None
-            summary["metrics"][key] = {
-                "count": feedback_counts[key],
-                "average_score": round(avg_score, 3) if avg_score else None,
-            }
-        
-        return summary
-        
+        return get_summary(agent_name=agent_name, days=days)
     except Exception as e:
         logger.error(f"Failed to get feedback summary: {e}")
         return {"error": str(e)}
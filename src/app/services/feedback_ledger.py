@@ -0,0 +1,401 @@
+"""
+Feedback Ledger - local store and rollups for evaluation feedback
+
+Every piece of feedback the app sees (API feedback, thumbs up/down, signal
+votes, auto-evaluator scores) is written to ``feedback_events`` and folded
+into ``feedback_daily_rollup`` in the same transaction. Summaries and the
+evaluation dashboard read the rollup, so they cost O(days x agents x keys)
+indexed rows instead of scanning LangSmith runs on every request, and they
+work offline.
+
+- record()/retract(): write inside a caller's transaction (``tx.run``)
+- record_feedback()/retract_feedback(): same, on their own connection
+- dedupe_key: at most one live event per key, so toggling a thumbs or a
+  signal vote replaces the earlier event (and its rollup contribution)
+- reconcile_with_langsmith(): background job pushing events LangSmith
+  didn't get (offline, errors) and pulling feedback created in LangSmith
+
+Usage:
+    from .feedback_ledger import record_feedback, get_summary
+
+    record_feedback("helpfulness", score=0.8, source="api", run_id=run_id, agent_name="arjuna")
+    summary = get_summary(agent_name="arjuna", days=7)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from ..db import connect
+
+logger = logging.getLogger(__name__)
+
+# Scores below this count as "low" in rollups and dashboard issues
+LOW_SCORE = 0.6
+
+# Events older than this are neither pushed nor pulled by reconciliation
+RECONCILE_DAYS = int(os.getenv("FEEDBACK_RECONCILE_DAYS", "7"))
+
+
+def _day(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _cutoff_day(days: int) -> str:
+    """First day included in a ``days``-long window ending today (UTC)."""
+    return _day(time.time() - max(days - 1, 0) * 86400)
+
+
+def signal_dedupe_key(meeting_id: Any, signal_type: str, signal_text: str) -> str:
+    """Ledger key for the single live vote on one extracted signal."""
+    digest = hashlib.sha256(f"{meeting_id}\n{signal_type}\n{signal_text}".encode("utf-8")).hexdigest()[:24]
+    return f"signal:{digest}"
+
+
+def _apply_rollup(conn, day: str, agent_name: str, key: str, score: Optional[float], sign: int):
+    """Add (sign=1) or remove (sign=-1) one event's contribution to its rollup row."""
+    scored = 1 if score is not None else 0
+    conn.execute(
+        """
+        INSERT INTO feedback_daily_rollup (day, agent_name, key, count, scored, score_sum, low_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(day, agent_name, key) DO UPDATE SET
+            count = count + excluded.count,
+            scored = scored + excluded.scored,
+            score_sum = score_sum + excluded.score_sum,
+            low_count = low_count + excluded.low_count
+        """,
+        (
+            day, agent_name, key, sign, sign * scored,
+            sign * (score or 0.0), sign * (1 if scored and score < LOW_SCORE else 0),
+        ),
+    )
+
+
+def retract(conn, dedupe_key: str) -> bool:
+    """
+    Delete the live event for ``dedupe_key`` and back it out of the rollup.
+
+    An event already synced to LangSmith leaves a tombstone for its feedback
+    id, so reconciliation doesn't pull the stale remote copy back in.
+    """
+    row = conn.execute(
+        "SELECT id, day, agent_name, key, score, langsmith_feedback_id FROM feedback_events WHERE dedupe_key = ?",
+        (dedupe_key,),
+    ).fetchone()
+    if row is None:
+        return False
+    conn.execute("DELETE FROM feedback_events WHERE id = ?", (row["id"],))
+    _apply_rollup(conn, row["day"], row["agent_name"], row["key"], row["score"], -1)
+    if row["langsmith_feedback_id"]:
+        conn.execute(
+            "INSERT OR IGNORE INTO feedback_retracted (langsmith_feedback_id, retracted_at) VALUES (?, ?)",
+            (row["langsmith_feedback_id"], time.time()),
+        )
+    return True
+
+
+def record(
+    conn,
+    key: str,
+    score: Optional[float] = None,
+    value: Optional[str] = None,
+    *,
+    source: str,
+    run_id: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    comment: Optional[str] = None,
+    dedupe_key: Optional[str] = None,
+    langsmith_feedback_id: Optional[str] = None,
+    created_at: Optional[float] = None,
+) -> int:
+    """
+    Write one feedback event and update its daily rollup (caller commits).
+
+    Returns:
+        The event id
+    """
+    if dedupe_key:
+        retract(conn, dedupe_key)
+    created_at = created_at or time.time()
+    day = _day(created_at)
+    agent_name = agent_name or ""
+    cursor = conn.execute(
+        """
+        INSERT INTO feedback_events
+            (source, run_id, agent_name, key, score, value, comment, dedupe_key,
+             day, created_at, langsmith_feedback_id, synced_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            source, run_id, agent_name, key, score, value, comment, dedupe_key,
+            day, created_at, langsmith_feedback_id, created_at if langsmith_feedback_id else None,
+        ),
+    )
+    _apply_rollup(conn, day, agent_name, key, score, 1)
+    return cursor.lastrowid
+
+
+def record_feedback(key: str, score: Optional[float] = None, value: Optional[str] = None, **kwargs) -> Optional[int]:
+    """record() on its own connection; failures are logged, never raised."""
+    try:
+        with connect() as conn:
+            event_id = record(conn, key, score, value, **kwargs)
+            conn.commit()
+        return event_id
+    except sqlite3.Error as e:
+        logger.warning(f"Feedback ledger write failed: {e}")
+        return None
+
+
+def retract_feedback(dedupe_key: str) -> bool:
+    """retract() on its own connection."""
+    try:
+        with connect() as conn:
+            removed = retract(conn, dedupe_key)
+            conn.commit()
+        return removed
+    except sqlite3.Error as e:
+        logger.warning(f"Feedback ledger retract failed: {e}")
+        return False
+
+
+def record_signal_vote(conn, meeting_id: Any, signal_type: str, signal_text: str, feedback: Optional[str]):
+    """Mirror a signal thumbs vote ('up' / 'down' / None to clear) into the ledger."""
+    dedupe_key = signal_dedupe_key(meeting_id, signal_type, signal_text)
+    if feedback is None:
+        retract(conn, dedupe_key)
+        return
+    record(
+        conn,
+        "signal_feedback",
+        score=1.0 if feedback == "up" else 0.0,
+        value=feedback,
+        source="signal",
+        agent_name="meeting_analyzer",
+        comment=signal_type,
+        dedupe_key=dedupe_key,
+    )
+
+
+# =============================================================================
+# READS
+# =============================================================================
+
+def _rollup_rows(conn, days: int, agent_name: Optional[str] = None) -> List[sqlite3.Row]:
+    sql = """
+        SELECT agent_name, key, SUM(count) AS count, SUM(scored) AS scored,
+               SUM(score_sum) AS score_sum, SUM(low_count) AS low_count
+        FROM feedback_daily_rollup
+        WHERE day >= ?
+    """
+    params: List[Any] = [_cutoff_day(days)]
+    if agent_name:
+        sql += " AND agent_name = ?"
+        params.append(agent_name)
+    sql += " GROUP BY agent_name, key HAVING SUM(count) > 0"
+    return conn.execute(sql, params).fetchall()
+
+
+def _metric(count: int, scored: int, score_sum: float, low_count: int) -> Dict[str, Any]:
+    return {
+        "count": int(count),
+        "average_score": round(score_sum / scored, 3) if scored else None,
+        "low_scores": int(low_count),
+    }
+
+
+def get_summary(agent_name: Optional[str] = None, days: int = 7) -> Dict[str, Any]:
+    """Feedback counts and average scores per key over the last ``days`` days."""
+    with connect() as conn:
+        rows = _rollup_rows(conn, days, agent_name)
+
+    totals: Dict[str, List[float]] = {}
+    for r in rows:
+        acc = totals.setdefault(r["key"], [0, 0, 0.0, 0])
+        acc[0] += r["count"]
+        acc[1] += r["scored"]
+        acc[2] += r["score_sum"]
+        acc[3] += r["low_count"]
+
+    return {
+        "agent_name": agent_name or "all",
+        "period_days": days,
+        "source": "local",
+        "metrics": {key: _metric(*acc) for key, acc in sorted(totals.items())},
+    }
+
+
+def get_dashboard(days: int = 7, low_limit: int = 10) -> Dict[str, Any]:
+    """Scores by key and agent, a daily series, and the latest low-scoring events."""
+    cutoff = _cutoff_day(days)
+    with connect() as conn:
+        rows = _rollup_rows(conn, days)
+        daily = conn.execute(
+            """
+            SELECT day, SUM(count) AS count, SUM(scored) AS scored, SUM(score_sum) AS score_sum
+            FROM feedback_daily_rollup WHERE day >= ?
+            GROUP BY day ORDER BY day
+            """,
+            (cutoff,),
+        ).fetchall()
+        low = conn.execute(
+            """
+            SELECT run_id, agent_name, key, score, comment, created_at
+            FROM feedback_events
+            WHERE score < ? AND created_at >= ?
+            ORDER BY created_at DESC LIMIT ?
+            """,
+            (LOW_SCORE, time.time() - days * 86400, low_limit),
+        ).fetchall()
+        unsynced = conn.execute(
+            "SELECT COUNT(*) FROM feedback_events WHERE synced_at IS NULL AND run_id IS NOT NULL"
+        ).fetchone()[0]
+
+    by_key: Dict[str, List[float]] = {}
+    by_agent: Dict[str, Dict[str, Any]] = {}
+    for r in rows:
+        acc = by_key.setdefault(r["key"], [0, 0, 0.0, 0])
+        acc[0] += r["count"]
+        acc[1] += r["scored"]
+        acc[2] += r["score_sum"]
+        acc[3] += r["low_count"]
+        by_agent.setdefault(r["agent_name"] or "unknown", {})[r["key"]] = _metric(
+            r["count"], r["scored"], r["score_sum"], r["low_count"]
+        )
+
+    return {
+        "period_days": days,
+        "stats": {
+            "feedback_events": int(sum(acc[0] for acc in by_key.values())),
+            "scored_events": int(sum(acc[1] for acc in by_key.values())),
+            "unsynced_events": int(unsynced),
+        },
+        "scores": {key: _metric(*acc) for key, acc in sorted(by_key.items())},
+        "by_agent": by_agent,
+        "daily": [
+            {
+                "day": d["day"],
+                "count": int(d["count"]),
+                "average_score": round(d["score_sum"] / d["scored"], 3) if d["scored"] else None,
+            }
+            for d in daily if d["count"]
+        ],
+        "low_score_events": [
+            {
+                "run_id": r["run_id"],
+                "agent_name": r["agent_name"] or None,
+                "metric": r["key"],
+                "score": r["score"],
+                "comment": r["comment"],
+                "created_at": datetime.fromtimestamp(r["created_at"], tz=timezone.utc).isoformat(),
+            }
+            for r in low
+        ],
+    }
+
+
+# =============================================================================
+# LANGSMITH RECONCILIATION
+# =============================================================================
+
+def reconcile_with_langsmith(days: int = RECONCILE_DAYS, limit: int = 500, client=None) -> Dict[str, Any]:
+    """
+    Bring the ledger and LangSmith back in line.
+
+    Pushes events with a run_id that never reached LangSmith, then pulls
+    feedback created directly in LangSmith (UI, online evaluators) that the
+    ledger hasn't seen, matched by LangSmith feedback id. Feedback for
+    events the ledger retracted (toggled or cleared votes) is skipped.
+    """
+    from .evaluations import is_evaluation_enabled
+
+    if client is None:
+        if not is_evaluation_enabled():
+            return {"skipped": True, "reason": "LangSmith not configured"}
+        try:
+            from langsmith import Client
+        except ImportError:
+            return {"skipped": True, "reason": "langsmith package not installed"}
+        client = Client()
+
+    since = time.time() - days * 86400
+    result = {"pushed": 0, "pulled": 0, "errors": 0}
+
+    with connect() as conn:
+        pending = conn.execute(
+            """
+            SELECT id, run_id, key, score, value, comment, source, agent_name
+            FROM feedback_events
+            WHERE synced_at IS NULL AND run_id IS NOT NULL AND created_at >= ?
+            ORDER BY created_at LIMIT ?
+            """,
+            (since, limit),
+        ).fetchall()
+
+    for event in pending:
+        try:
+            kwargs = {"run_id": event["run_id"], "key": event["key"], "comment": event["comment"]}
+            if event["score"] is not None:
+                kwargs["score"] = event["score"]
+            if event["value"] is not None:
+                kwargs["value"] = event["value"]
+            kwargs["source_info"] = {"type": event["source"], "agent_name": event["agent_name"] or None}
+            feedback = client.create_feedback(**kwargs)
+        except Exception as e:
+            result["errors"] += 1
+            logger.warning(f"Feedback push for event {event['id']} failed: {e}")
+            continue
+        with connect() as conn:
+            conn.execute(
+                "UPDATE feedback_events SET langsmith_feedback_id = ?, synced_at = ? WHERE id = ?",
+                (str(feedback.id), time.time(), event["id"]),
+            )
+            conn.commit()
+        result["pushed"] += 1
+
+    try:
+        remote = list(client.list_feedback(limit=limit))
+    except Exception as e:
+        logger.warning(f"Feedback pull from LangSmith failed: {e}")
+        result["errors"] += 1
+        return result
+
+    with connect() as conn:
+        for fb in remote:
+            created = getattr(fb, "created_at", None)
+            created_ts = created.timestamp() if created else time.time()
+            if created_ts < since:
+                continue
+            if conn.execute(
+                """
+                SELECT 1 FROM feedback_events WHERE langsmith_feedback_id = ?
+                UNION ALL
+                SELECT 1 FROM feedback_retracted WHERE langsmith_feedback_id = ?
+                """,
+                (str(fb.id), str(fb.id)),
+            ).fetchone():
+                continue
+            source_info = getattr(fb, "source_info", None) or {}
+            record(
+                conn,
+                fb.key,
+                score=fb.score if isinstance(fb.score, (int, float)) else None,
+                value=str(fb.value) if getattr(fb, "value", None) is not None else None,
+                source="langsmith",
+                run_id=str(fb.run_id) if fb.run_id else None,
+                agent_name=source_info.get("agent_name"),
+                comment=getattr(fb, "comment", None),
+                langsmith_feedback_id=str(fb.id),
+                created_at=created_ts,
+            )
+            result["pulled"] += 1
+        # Older remote feedback is outside the pull window anyway
+        conn.execute("DELETE FROM feedback_retracted WHERE retracted_at < ?", (since,))
+        conn.commit()
+
+    return result
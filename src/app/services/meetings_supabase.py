@@ -35,14 +35,18 @@ def get_supabase_client():
     return _get_client()
 
 
-def get_all_meetings(limit: int = 100) -> List[Dict[str, Any]]:
+def get_all_meetings(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
     """
-    Get all meetings from Supabase.
+    Get all meetings from Supabase, newest first.
+    
+    Args:
+        limit: Maximum meetings to return
+        offset: Meetings to skip (pagination)
     
     Returns:
         List of meeting dictionaries with id, meeting_name, meeting_date, signals, etc.
     """
-    return _get_repo().get_all(QueryOptions(limit=limit))
+    return _get_repo().get_all(QueryOptions(limit=limit, offset=offset))
 
 
 def get_meeting_by_id(meeting_id: str) -> Optional[Dict[str, Any]]:
@@ -5,6 +5,7 @@ Aggregates mindmap data from all conversations and generates AI-powered
 synthesis with hierarchy preservation for knowledge graph integration.
 """
 
+import hashlib
 import json
 import logging
 from typing import Optional, Dict, List, Any
@@ -93,23 +94,30 @@ class MindmapSynthesizer:
                     mindmap_data = MindmapSynthesizer._parse_text_mindmap(mindmap_data)
             
             hierarchy = MindmapSynthesizer.extract_hierarchy_from_mindmap(mindmap_data)
-            root_node_id = hierarchy.get('root_node', {}).get('id')
+            root_node_id = (hierarchy.get('root_node') or {}).get('id')
+            content_hash = MindmapSynthesizer.compute_content_hash(mindmap_data)
             
             with connect() as conn:
-                conn.execute("""
+                cursor = conn.execute("""
                     INSERT INTO conversation_mindmaps 
-                    (conversation_id, mindmap_json, hierarchy_levels, root_node_id, node_count, title)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    (conversation_id, mindmap_json, hierarchy_levels, root_node_id, node_count, title, content_hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (
                     str(conversation_id),
                     json.dumps(mindmap_data),
                     min(hierarchy.get('levels', 0), hierarchy_level + 1) if hierarchy_level >= 0 else hierarchy.get('levels', 0),
                     root_node_id,
                     hierarchy.get('node_count', 0),
-                    title or str(conversation_id)
+                    title or str(conversation_id),
+                    content_hash
                 ))
+                mindmap_id = cursor.lastrowid
+                MindmapSynthesizer._index_mindmap(
+                    conn, mindmap_id, str(conversation_id), title or str(conversation_id),
+                    mindmap_data, content_hash, hierarchy=hierarchy
+                )
                 conn.commit()
-                return conn.execute("SELECT last_insert_rowid() as id").fetchone()['id']
+                return mindmap_id
         except Exception as e:
             logger.error(f"Error storing conversation mindmap: {e}")
             return None
@@ -154,7 +162,7 @@ class MindmapSynthesizer:
                 SELECT id, conversation_id, mindmap_json, hierarchy_levels, 
                        node_count, root_node_id, created_at
                 FROM conversation_mindmaps
-                ORDER BY updated_at DESC
+                ORDER BY updated_at DESC, id DESC
             """).fetchall()
         
         return [dict(m) for m in mindmaps]
@@ -215,18 +223,409 @@ class MindmapSynthesizer:
             'themes': themes
         }
     
+    # -------------------------
+    # Extraction cache & running aggregates
+    # -------------------------
+
+    @staticmethod
+    def compute_content_hash(mindmap_data: Dict[str, Any]) -> str:
+        """Stable SHA-256 of the mindmap structure, used as the extraction cache key."""
+        canonical = json.dumps(mindmap_data, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _index_mindmap(
+        conn,
+        mindmap_id: int,
+        conversation_id: str,
+        title: str,
+        mindmap_data: Dict[str, Any],
+        content_hash: str,
+        hierarchy: Dict[str, Any] = None
+    ) -> bool:
+        """Cache the extraction for a mindmap and fold it into the running aggregates.
+        
+        Content that has been seen before (same hash) reuses the cached extraction
+        and does not touch the aggregates, so re-saving an unchanged mindmap is free.
+        
+        Returns:
+            True if this was new content, False if it was already indexed
+        """
+        existing = conn.execute(
+            "SELECT 1 FROM mindmap_extractions WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        if existing:
+            return False
+        
+        if hierarchy is None:
+            hierarchy = MindmapSynthesizer.extract_hierarchy_from_mindmap(mindmap_data)
+        extracted = MindmapSynthesizer.extract_key_topics_and_relationships(mindmap_data)
+        level_counts = {
+            str(level): len(nodes)
+            for level, nodes in hierarchy.get('nodes_by_level', {}).items()
+        }
+        
+        conn.execute("""
+            INSERT INTO mindmap_extractions
+            (content_hash, first_mindmap_id, conversation_id, title, key_topics, relationships,
+             hierarchy_levels, max_depth, node_count, level_counts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            content_hash,
+            mindmap_id,
+            conversation_id,
+            title,
+            json.dumps(extracted.get('key_topics', [])),
+            json.dumps(extracted.get('relationships', [])),
+            hierarchy.get('levels', 0),
+            hierarchy.get('max_depth', 0),
+            hierarchy.get('node_count', 0),
+            json.dumps(level_counts)
+        ))
+        
+        topics = set(extracted.get('key_topics', []))
+        conn.executemany("""
+            INSERT INTO mindmap_topic_stats (topic, mention_count, last_mindmap_id)
+            VALUES (?, 1, ?)
+            ON CONFLICT(topic) DO UPDATE SET
+                mention_count = mention_count + 1,
+                last_mindmap_id = excluded.last_mindmap_id,
+                updated_at = datetime('now')
+        """, [(topic, mindmap_id) for topic in topics])
+        
+        relationships = {
+            (r['source'], r['target'], r.get('relationship', 'connects to'))
+            for r in extracted.get('relationships', [])
+        }
+        conn.executemany("""
+            INSERT INTO mindmap_relationship_stats (source, target, relationship, mention_count, last_mindmap_id)
+            VALUES (?, ?, ?, 1, ?)
+            ON CONFLICT(source, target, relationship) DO UPDATE SET
+                mention_count = mention_count + 1,
+                last_mindmap_id = excluded.last_mindmap_id,
+                updated_at = datetime('now')
+        """, [(src, tgt, rel, mindmap_id) for src, tgt, rel in relationships])
+        
+        return True
+
+    @staticmethod
+    def _unindex_content(conn, content_hash: str) -> bool:
+        """Take a cached extraction back out of the running aggregates.
+
+        The inverse of _index_mindmap: each distinct topic and relationship in
+        the extraction loses one mention, rows that reach zero are dropped, and
+        the extraction itself is deleted.
+
+        Returns:
+            True if an extraction was removed, False if none was cached
+        """
+        row = conn.execute(
+            "SELECT key_topics, relationships FROM mindmap_extractions WHERE content_hash = ?",
+            (content_hash,)
+        ).fetchone()
+        if not row:
+            return False
+        extracted = MindmapSynthesizer._row_to_extraction(row)
+
+        topics = set(extracted['key_topics'])
+        conn.executemany("""
+            UPDATE mindmap_topic_stats
+            SET mention_count = mention_count - 1, updated_at = datetime('now')
+            WHERE topic = ?
+        """, [(topic,) for topic in topics])
+        conn.execute("DELETE FROM mindmap_topic_stats WHERE mention_count <= 0")
+
+        relationships = {
+            (r['source'], r['target'], r.get('relationship', 'connects to'))
+            for r in extracted['relationships']
+        }
+        conn.executemany("""
+            UPDATE mindmap_relationship_stats
+            SET mention_count = mention_count - 1, updated_at = datetime('now')
+            WHERE source = ? AND target = ? AND relationship = ?
+        """, list(relationships))
+        conn.execute("DELETE FROM mindmap_relationship_stats WHERE mention_count <= 0")
+
+        conn.execute("DELETE FROM mindmap_extractions WHERE content_hash = ?", (content_hash,))
+        return True
+
+    @staticmethod
+    def remove_conversation_mindmaps(conn, conversation_id: str) -> int:
+        """Delete a conversation's mindmaps and subtract them from the aggregates.
+
+        Content still referenced by another mindmap keeps its extraction and
+        its mentions, mirroring how re-saving the same content is not counted
+        twice. The caller owns the transaction.
+
+        Returns:
+            Number of mindmap rows deleted
+        """
+        rows = conn.execute(
+            "SELECT DISTINCT content_hash FROM conversation_mindmaps WHERE conversation_id = ?",
+            (str(conversation_id),)
+        ).fetchall()
+        deleted = conn.execute(
+            "DELETE FROM conversation_mindmaps WHERE conversation_id = ?",
+            (str(conversation_id),)
+        ).rowcount
+
+        for row in rows:
+            content_hash = row['content_hash']
+            if not content_hash:
+                continue
+            still_used = conn.execute(
+                "SELECT 1 FROM conversation_mindmaps WHERE content_hash = ? LIMIT 1",
+                (content_hash,)
+            ).fetchone()
+            if not still_used:
+                MindmapSynthesizer._unindex_content(conn, content_hash)
+        return deleted
+
+    @staticmethod
+    def delete_conversation_mindmaps(conversation_id: str) -> int:
+        """Delete a conversation's mindmaps in their own transaction."""
+        with connect() as conn:
+            deleted = MindmapSynthesizer.remove_conversation_mindmaps(conn, conversation_id)
+            conn.commit()
+        return deleted
+
+    @staticmethod
+    def ensure_indexed() -> int:
+        """Index any mindmaps stored before the extraction cache existed.
+        
+        Only rows without a content hash are parsed, so this is a no-op once
+        the backlog has been processed.
+        
+        Returns:
+            Number of mindmap rows indexed
+        """
+        with connect() as conn:
+            pending = conn.execute("""
+                SELECT id, conversation_id, title, mindmap_json
+                FROM conversation_mindmaps
+                WHERE content_hash IS NULL
+                ORDER BY id
+            """).fetchall()
+            
+            for row in pending:
+                try:
+                    mindmap_data = json.loads(row['mindmap_json'])
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.warning(f"Skipping unparseable mindmap {row['id']}: {e}")
+                    mindmap_data = {}
+                content_hash = MindmapSynthesizer.compute_content_hash(mindmap_data)
+                MindmapSynthesizer._index_mindmap(
+                    conn, row['id'], str(row['conversation_id']),
+                    row['title'] or str(row['conversation_id']),
+                    mindmap_data, content_hash
+                )
+                conn.execute(
+                    "UPDATE conversation_mindmaps SET content_hash = ? WHERE id = ?",
+                    (content_hash, row['id'])
+                )
+            conn.commit()
+        
+        if pending:
+            logger.info(f"Indexed {len(pending)} mindmaps into extraction cache")
+        return len(pending)
+
+    @staticmethod
+    def _row_to_extraction(row) -> Dict[str, Any]:
+        """Decode the JSON columns of a mindmap_extractions row."""
+        extraction = dict(row)
+        for field in ('key_topics', 'relationships'):
+            try:
+                extraction[field] = json.loads(extraction.get(field) or '[]')
+            except json.JSONDecodeError:
+                extraction[field] = []
+        try:
+            extraction['level_counts'] = json.loads(extraction.get('level_counts') or '{}')
+        except json.JSONDecodeError:
+            extraction['level_counts'] = {}
+        return extraction
+
+    @staticmethod
+    def get_extractions_since(last_mindmap_id: int = 0) -> List[Dict[str, Any]]:
+        """Get cached extractions for content first seen after a given mindmap id."""
+        with connect() as conn:
+            rows = conn.execute("""
+                SELECT content_hash, first_mindmap_id, conversation_id, title, key_topics,
+                       relationships, hierarchy_levels, max_depth, node_count, level_counts
+                FROM mindmap_extractions
+                WHERE first_mindmap_id > ?
+                ORDER BY first_mindmap_id
+            """, (last_mindmap_id or 0,)).fetchall()
+        return [MindmapSynthesizer._row_to_extraction(r) for r in rows]
+
+    @staticmethod
+    def get_aggregate_topics(limit: int = 20) -> List[Dict[str, Any]]:
+        """Most frequently mentioned topics across all indexed mindmaps."""
+        with connect() as conn:
+            rows = conn.execute("""
+                SELECT topic, mention_count FROM mindmap_topic_stats
+                ORDER BY mention_count DESC, last_mindmap_id DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+        return [dict(r) for r in rows]
+
+    @staticmethod
+    def get_aggregate_relationships(limit: int = 20) -> List[Dict[str, Any]]:
+        """Most frequently seen relationships across all indexed mindmaps."""
+        with connect() as conn:
+            rows = conn.execute("""
+                SELECT source, target, relationship, mention_count FROM mindmap_relationship_stats
+                ORDER BY mention_count DESC, last_mindmap_id DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+        return [dict(r) for r in rows]
+
+    @staticmethod
+    def _get_latest_synthesis_row(synthesis_type: str = 'default'):
+        """Latest synthesis row of a type, including its high-water mark."""
+        with connect() as conn:
+            if synthesis_type == 'default':
+                return conn.execute("""
+                    SELECT id, synthesis_text, source_mindmap_ids, source_conversation_ids,
+                           hierarchy_summary, last_mindmap_id
+                    FROM mindmap_syntheses
+                    WHERE synthesis_type IS NULL OR synthesis_type = '' OR synthesis_type = 'default'
+                    ORDER BY updated_at DESC, id DESC
+                    LIMIT 1
+                """).fetchone()
+            return conn.execute("""
+                SELECT id, synthesis_text, source_mindmap_ids, source_conversation_ids,
+                       hierarchy_summary, last_mindmap_id
+                FROM mindmap_syntheses
+                WHERE synthesis_type = ?
+                ORDER BY updated_at DESC, id DESC
+                LIMIT 1
+            """, (synthesis_type,)).fetchone()
+
+    @staticmethod
+    def _high_water_mark(previous) -> int:
+        """Highest mindmap id folded into a synthesis row (0 if unknown)."""
+        if not previous:
+            return 0
+        if previous['last_mindmap_id']:
+            return previous['last_mindmap_id']
+        # Syntheses written before the high-water mark existed
+        try:
+            ids = json.loads(previous['source_mindmap_ids'] or '[]')
+            return max(ids) if ids else 0
+        except (json.JSONDecodeError, TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _load_json_list(value: Optional[str]) -> List[Any]:
+        try:
+            loaded = json.loads(value or '[]')
+            return loaded if isinstance(loaded, list) else []
+        except (json.JSONDecodeError, TypeError):
+            return []
+
+    @staticmethod
+    def _plan_refresh(synthesis_type: str, force: bool) -> Optional[Dict[str, Any]]:
+        """Work out what a synthesis refresh needs to send to the LLM.
+        
+        Returns None when the existing synthesis is already current. Otherwise
+        returns the previous synthesis (if any) and the extractions to fold in:
+        only the delta since the previous synthesis, or everything when there is
+        no previous synthesis or a forced refresh has no new content.
+        """
+        previous = MindmapSynthesizer._get_latest_synthesis_row(synthesis_type)
+        high_water = MindmapSynthesizer._high_water_mark(previous)
+        delta = MindmapSynthesizer.get_extractions_since(high_water) if previous else []
+        
+        if previous and delta:
+            return {'previous': previous, 'extractions': delta, 'incremental': True}
+        if previous and not force:
+            return None
+        
+        extractions = MindmapSynthesizer.get_extractions_since(0)
+        if not extractions:
+            return None
+        return {'previous': None, 'extractions': extractions, 'incremental': False}
+
+    @staticmethod
+    def _build_refresh_payload(plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble prompt context and the columns to store for a refresh plan."""
+        extractions = plan['extractions']
+        previous = plan['previous']
+        
+        delta_topics = []
+        delta_relationships = []
+        delta_hierarchies = []
+        for extraction in extractions:
+            delta_topics.extend(extraction['key_topics'])
+            delta_relationships.extend(extraction['relationships'])
+            delta_hierarchies.append({
+                'title': extraction.get('title') or '',
+                'levels': extraction.get('hierarchy_levels'),
+                'topics': extraction['key_topics']
+            })
+        
+        source_mindmap_ids = [e['first_mindmap_id'] for e in extractions]
+        source_conversation_ids = [e['conversation_id'] for e in extractions]
+        hierarchies = delta_hierarchies
+        if previous:
+            source_mindmap_ids = MindmapSynthesizer._load_json_list(previous['source_mindmap_ids']) + source_mindmap_ids
+            source_conversation_ids = MindmapSynthesizer._load_json_list(previous['source_conversation_ids']) + source_conversation_ids
+            hierarchies = MindmapSynthesizer._load_json_list(previous['hierarchy_summary']) + delta_hierarchies
+        
+        top_topics = [t['topic'] for t in MindmapSynthesizer.get_aggregate_topics(50)]
+        top_relationships = [
+            {'source': r['source'], 'target': r['target'], 'relationship': r['relationship']}
+            for r in MindmapSynthesizer.get_aggregate_relationships(50)
+        ]
+        
+        return {
+            'new_topics': list(dict.fromkeys(delta_topics))[:20],
+            'new_relationships': delta_relationships[:20],
+            'new_hierarchies': delta_hierarchies[-10:],
+            'top_topics': top_topics[:20],
+            'top_relationships': top_relationships[:15],
+            'hierarchies': hierarchies[-50:],
+            'source_mindmap_ids': source_mindmap_ids,
+            'source_conversation_ids': source_conversation_ids,
+            'stored_topics': top_topics,
+            'stored_relationships': top_relationships,
+            'last_mindmap_id': max(
+                [MindmapSynthesizer._high_water_mark(previous)] + [e['first_mindmap_id'] for e in extractions]
+            ),
+            'new_count': len(extractions),
+            'total_count': len(source_mindmap_ids),
+        }
+
+    @staticmethod
+    def _record_history(conn, synthesis_id: int, previous, new_count: int, triggered_by: str):
+        """Track incremental refreshes in mindmap_synthesis_history."""
+        if not previous:
+            return
+        conn.execute("""
+            INSERT INTO mindmap_synthesis_history
+            (synthesis_id, previous_text, changes_summary, triggered_by)
+            VALUES (?, ?, ?, ?)
+        """, (
+            synthesis_id,
+            previous['synthesis_text'],
+            f"Folded in {new_count} new mindmap(s) since synthesis {previous['id']}",
+            triggered_by
+        ))
+
     @staticmethod
     def generate_synthesis(force: bool = False) -> Optional[int]:
         """Generate AI-powered synthesis of all mindmaps.
         
         This function:
-        1. Collects all mindmaps from conversations
-        2. Extracts hierarchy and key information
-        3. Uses AI to synthesize into coherent knowledge structure
-        4. Stores synthesis with metadata
+        1. Indexes any mindmaps missing from the extraction cache
+        2. Collects only the mindmap content added since the last synthesis
+        3. Asks the AI to update the previous synthesis with that delta
+           (or synthesizes from scratch when there is no previous synthesis)
+        4. Stores synthesis with metadata and a new high-water mark
         
         Args:
-            force: Force regeneration even if recent synthesis exists
+            force: Skip the recent-synthesis check; with no new mindmaps this
+                regenerates the synthesis from the full aggregate
             
         Returns:
             ID of the generated synthesis or None on error
@@ -244,48 +643,56 @@ class MindmapSynthesizer:
                         logger.info("Recent synthesis exists, skipping generation")
                         return recent['id']
             
-            # Get all mindmaps
-            mindmaps = MindmapSynthesizer.get_all_mindmaps()
-            if not mindmaps:
+            MindmapSynthesizer.ensure_indexed()
+            plan = MindmapSynthesizer._plan_refresh('default', force)
+            if plan is None:
+                previous = MindmapSynthesizer._get_latest_synthesis_row('default')
+                if previous:
+                    logger.info("No new mindmaps since last synthesis, reusing it")
+                    return previous['id']
                 logger.warning("No mindmaps to synthesize")
                 return None
             
-            # Extract information from all mindmaps
-            all_topics = []
-            all_relationships = []
-            all_hierarchies = []
-            source_mindmap_ids = []
-            source_conversation_ids = []
+            payload = MindmapSynthesizer._build_refresh_payload(plan)
+            previous = plan['previous']
             
-            for mindmap in mindmaps:
-                try:
-                    mindmap_json = json.loads(mindmap['mindmap_json'])
-                    hierarchy = MindmapSynthesizer.extract_hierarchy_from_mindmap(mindmap_json)
-                    extracted = MindmapSynthesizer.extract_key_topics_and_relationships(mindmap_json)
-                    
-                    all_topics.extend(extracted.get('key_topics', []))
-                    all_relationships.extend(extracted.get('relationships', []))
-                    all_hierarchies.append({
-                        'levels': hierarchy.get('levels'),
-                        'topics': extracted.get('key_topics', [])
-                    })
-                    source_mindmap_ids.append(mindmap['id'])
-                    source_conversation_ids.append(mindmap['conversation_id'])
-                except Exception as e:
-                    logger.warning(f"Error processing mindmap {mindmap['id']}: {e}")
-            
-            # Prepare prompt for AI synthesis
-            synthesis_prompt = f"""
-            Synthesize the following mindmap data across {len(mindmaps)} conversations into a coherent knowledge structure.
+            if plan['incremental']:
+                synthesis_prompt = f"""
+            Update an existing knowledge synthesis with {payload['new_count']} new conversation mindmaps
+            ({payload['total_count']} mindmaps in total).
+            
+            Previous Synthesis:
+            {previous['synthesis_text'][:6000]}
+            
+            New Key Topics:
+            {json.dumps(payload['new_topics'], indent=2)}
+            
+            New Relationships:
+            {json.dumps(payload['new_relationships'], indent=2)}
+            
+            New Hierarchy Summary:
+            {json.dumps(payload['new_hierarchies'], indent=2)}
+            
+            Most Frequent Topics Across All Mindmaps:
+            {json.dumps(payload['top_topics'], indent=2)}
+            
+            Revise the previous synthesis so it incorporates the new material. Keep what is
+            still accurate, and update themes, relationships, intersections and gaps.
+            
+            Format as structured JSON with fields: overview, themes, key_relationships, intersections, gaps
+            """
+            else:
+                synthesis_prompt = f"""
+            Synthesize the following mindmap data across {payload['total_count']} conversations into a coherent knowledge structure.
             
             Key Topics Across All Mindmaps:
-            {json.dumps(list(set(all_topics[:30]))[:20], indent=2)}
+            {json.dumps(payload['top_topics'], indent=2)}
             
             Major Relationships:
-            {json.dumps(all_relationships[:20], indent=2)}
+            {json.dumps(payload['top_relationships'], indent=2)}
             
             Hierarchy Summary:
-            {json.dumps(all_hierarchies[:10], indent=2)}
+            {json.dumps(payload['new_hierarchies'], indent=2)}
             
             Please provide:
             1. A synthesized overview of the knowledge structure (2-3 paragraphs)
@@ -304,37 +711,33 @@ class MindmapSynthesizer:
                 logger.error(f"AI synthesis failed: {response}")
                 return None
             
-            # Parse response
-            try:
-                # Extract JSON from response
-                start = response.find('{')
-                end = response.rfind('}') + 1
-                if start >= 0 and end > start:
-                    synthesis_json = json.loads(response[start:end])
-                else:
-                    synthesis_json = {}
-            except:
-                synthesis_json = {'overview': response}
-            
             # Store synthesis
             with connect() as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO mindmap_syntheses
+                cursor = conn.execute("""
+                    INSERT INTO mindmap_syntheses
                     (synthesis_text, hierarchy_summary, source_mindmap_ids, source_conversation_ids,
-                     key_topics, relationships)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                     key_topics, relationships, last_mindmap_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (
                     response,
-                    json.dumps(all_hierarchies),
-                    json.dumps(source_mindmap_ids),
-                    json.dumps(source_conversation_ids),
-                    json.dumps(list(set(all_topics[:50]))),  # Unique topics
-                    json.dumps(all_relationships[:50])
+                    json.dumps(payload['hierarchies']),
+                    json.dumps(payload['source_mindmap_ids']),
+                    json.dumps(payload['source_conversation_ids']),
+                    json.dumps(payload['stored_topics']),
+                    json.dumps(payload['stored_relationships']),
+                    payload['last_mindmap_id']
                 ))
+                synthesis_id = cursor.lastrowid
+                MindmapSynthesizer._record_history(
+                    conn, synthesis_id, previous, payload['new_count'], 'incremental'
+                )
                 conn.commit()
-                synthesis_id = conn.execute("SELECT last_insert_rowid() as id").fetchone()['id']
             
-            logger.info(f"Generated synthesis {synthesis_id} from {len(mindmaps)} mindmaps")
+            mode = "incremental" if plan['incremental'] else "full"
+            logger.info(
+                f"Generated {mode} synthesis {synthesis_id} from {payload['new_count']} new "
+                f"of {payload['total_count']} mindmaps"
+            )
             return synthesis_id
             
         except Exception as e:
@@ -350,7 +753,7 @@ class MindmapSynthesizer:
                        relationships, source_mindmap_ids, source_conversation_ids,
                        created_at, updated_at
                 FROM mindmap_syntheses
-                ORDER BY updated_at DESC
+                ORDER BY updated_at DESC, id DESC
                 LIMIT 1
             """).fetchone()
         
@@ -399,32 +802,37 @@ class MindmapSynthesizer:
                 'conversation_count': 5
             }
         """
-        mindmaps = MindmapSynthesizer.get_all_mindmaps()
+        MindmapSynthesizer.ensure_indexed()
+        with connect() as conn:
+            rows = conn.execute("""
+                SELECT m.conversation_id, e.node_count, e.max_depth, e.level_counts
+                FROM conversation_mindmaps m
+                JOIN mindmap_extractions e ON e.content_hash = m.content_hash
+            """).fetchall()
         
         total_nodes = 0
         total_depth = 0
         levels_dist = {}
         conversation_ids = set()
         
-        for mindmap in mindmaps:
+        for row in rows:
+            total_nodes += row['node_count'] or 0
+            total_depth += row['max_depth'] or 0
+            conversation_ids.add(row['conversation_id'])
+            
+            # Count nodes by level
             try:
-                mindmap_json = json.loads(mindmap['mindmap_json'])
-                hierarchy = MindmapSynthesizer.extract_hierarchy_from_mindmap(mindmap_json)
-                
-                total_nodes += hierarchy.get('node_count', 0)
-                total_depth += hierarchy.get('max_depth', 0)
-                conversation_ids.add(mindmap['conversation_id'])
-                
-                # Count nodes by level
-                for level, nodes in hierarchy.get('nodes_by_level', {}).items():
-                    levels_dist[level] = levels_dist.get(level, 0) + len(nodes)
-            except Exception as e:
-                logger.warning(f"Error processing mindmap {mindmap['id']}: {e}")
+                level_counts = json.loads(row['level_counts'] or '{}')
+            except json.JSONDecodeError:
+                level_counts = {}
+            for level, count in level_counts.items():
+                level = int(level)
+                levels_dist[level] = levels_dist.get(level, 0) + count
         
-        avg_depth = total_depth / len(mindmaps) if mindmaps else 0
+        avg_depth = total_depth / len(rows) if rows else 0
         
         return {
-            'total_mindmaps': len(mindmaps),
+            'total_mindmaps': len(rows),
             'total_nodes': total_nodes,
             'avg_depth': round(avg_depth, 2),
             'levels_distribution': levels_dist,
@@ -440,29 +848,17 @@ class MindmapSynthesizer:
 
     @staticmethod
     def needs_synthesis() -> bool:
-        """Check if synthesis is needed (new mindmaps since last synthesis)."""
+        """Check if synthesis is needed (new mindmap content since last synthesis)."""
+        MindmapSynthesizer.ensure_indexed()
+        previous = MindmapSynthesizer._get_latest_synthesis_row('default')
+        high_water = MindmapSynthesizer._high_water_mark(previous)
+        
         with connect() as conn:
-            # Get current mindmap IDs
-            mindmaps = conn.execute("SELECT id FROM conversation_mindmaps ORDER BY id").fetchall()
-            current_ids = [m['id'] for m in mindmaps]
-            
-            if not current_ids:
-                return False
-            
-            # Get last synthesis
-            last_synthesis = conn.execute("""
-                SELECT source_mindmap_ids FROM mindmap_syntheses
-                ORDER BY updated_at DESC LIMIT 1
-            """).fetchone()
-            
-            if not last_synthesis:
-                return True
-            
-            try:
-                synth_ids = json.loads(last_synthesis['source_mindmap_ids'])
-                return set(current_ids) != set(synth_ids)
-            except:
-                return True
+            newer = conn.execute(
+                "SELECT 1 FROM mindmap_extractions WHERE first_mindmap_id > ? LIMIT 1",
+                (high_water,)
+            ).fetchone()
+        return newer is not None
 
     @staticmethod
     def generate_multiple_syntheses(force: bool = False) -> Dict[str, Optional[int]]:
@@ -474,49 +870,15 @@ class MindmapSynthesizer:
         - timeline: Chronological progression of decisions
         - action_focus: Focus on action items and next steps
         
+        Each view is refreshed independently from the mindmaps added since that
+        view was last generated; views with nothing new keep their existing ID.
+        
         Returns:
             Dictionary of synthesis type -> synthesis ID
         """
         from ..llm import ask as ask_llm
         
-        # Check if needed
-        if not force and not MindmapSynthesizer.needs_synthesis():
-            logger.info("No new mindmaps since last synthesis, skipping")
-            with connect() as conn:
-                existing = conn.execute("""
-                    SELECT id, synthesis_type FROM mindmap_syntheses
-                    ORDER BY updated_at DESC LIMIT 4
-                """).fetchall()
-                return {row['synthesis_type'] or 'default': row['id'] for row in existing}
-        
-        mindmaps = MindmapSynthesizer.get_all_mindmaps()
-        if not mindmaps:
-            return {}
-        
-        # Extract common data
-        all_topics = []
-        all_relationships = []
-        all_hierarchies = []
-        source_mindmap_ids = []
-        source_conversation_ids = []
-        
-        for mindmap in mindmaps:
-            try:
-                mindmap_json = json.loads(mindmap['mindmap_json'])
-                hierarchy = MindmapSynthesizer.extract_hierarchy_from_mindmap(mindmap_json)
-                extracted = MindmapSynthesizer.extract_key_topics_and_relationships(mindmap_json)
-                
-                all_topics.extend(extracted.get('key_topics', []))
-                all_relationships.extend(extracted.get('relationships', []))
-                all_hierarchies.append({
-                    'title': mindmap.get('title', ''),
-                    'levels': hierarchy.get('levels'),
-                    'topics': extracted.get('key_topics', [])
-                })
-                source_mindmap_ids.append(mindmap['id'])
-                source_conversation_ids.append(mindmap['conversation_id'])
-            except Exception as e:
-                logger.warning(f"Error processing mindmap {mindmap['id']}: {e}")
+        MindmapSynthesizer.ensure_indexed()
         
         synthesis_types = {
             'default': """Create a COMPREHENSIVE OVERVIEW synthesis:
@@ -551,24 +913,56 @@ class MindmapSynthesizer:
         }
         
         results = {}
-        unique_topics = list(set(all_topics[:30]))[:20]
         
         for synth_type, type_prompt in synthesis_types.items():
             try:
-                prompt = f"""
-                {type_prompt}
+                plan = MindmapSynthesizer._plan_refresh(synth_type, force)
+                if plan is None:
+                    previous = MindmapSynthesizer._get_latest_synthesis_row(synth_type)
+                    if previous:
+                        results[synth_type] = previous['id']
+                    continue
+                
+                payload = MindmapSynthesizer._build_refresh_payload(plan)
+                previous = plan['previous']
+                
+                if plan['incremental']:
+                    context = f"""
+                Previous {synth_type} synthesis:
+                {previous['synthesis_text'][:6000]}
                 
-                Analyzing {len(mindmaps)} conversation mindmaps.
+                Update it with {payload['new_count']} new conversation mindmaps
+                ({payload['total_count']} in total). Keep what is still accurate.
+                
+                New Key Topics:
+                {json.dumps(payload['new_topics'], indent=2)}
+                
+                New Relationships:
+                {json.dumps(payload['new_relationships'], indent=2)}
+                
+                New Conversation Summaries:
+                {json.dumps(payload['new_hierarchies'], indent=2)}
+                
+                Most Frequent Topics Across All Mindmaps:
+                {json.dumps(payload['top_topics'], indent=2)}
+                """
+                else:
+                    context = f"""
+                Analyzing {payload['total_count']} conversation mindmaps.
                 
                 Key Topics:
-                {json.dumps(unique_topics, indent=2)}
+                {json.dumps(payload['top_topics'], indent=2)}
                 
                 Relationships:
-                {json.dumps(all_relationships[:15], indent=2)}
+                {json.dumps(payload['top_relationships'], indent=2)}
                 
                 Conversation Summaries:
-                {json.dumps([h for h in all_hierarchies[:10]], indent=2)}
+                {json.dumps(payload['new_hierarchies'], indent=2)}
+                """
                 
+                prompt = f"""
+                {type_prompt}
+                {context}
                 Provide a structured JSON response with fields:
                 - overview (2-3 paragraph synthesis)
                 - themes (list of major themes)
@@ -580,22 +974,26 @@ class MindmapSynthesizer:
                 
                 # Store this synthesis type
                 with connect() as conn:
-                    conn.execute("""
+                    cursor = conn.execute("""
                         INSERT INTO mindmap_syntheses
                         (synthesis_text, synthesis_type, hierarchy_summary, source_mindmap_ids, 
-                         source_conversation_ids, key_topics, relationships)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                         source_conversation_ids, key_topics, relationships, last_mindmap_id)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         response,
                         synth_type,
-                        json.dumps(all_hierarchies),
-                        json.dumps(source_mindmap_ids),
-                        json.dumps(source_conversation_ids),
-                        json.dumps(unique_topics),
-                        json.dumps(all_relationships[:50])
+                        json.dumps(payload['hierarchies']),
+                        json.dumps(payload['source_mindmap_ids']),
+                        json.dumps(payload['source_conversation_ids']),
+                        json.dumps(payload['stored_topics']),
+                        json.dumps(payload['stored_relationships']),
+                        payload['last_mindmap_id']
                     ))
+                    synth_id = cursor.lastrowid
+                    MindmapSynthesizer._record_history(
+                        conn, synth_id, previous, payload['new_count'], f'incremental:{synth_type}'
+                    )
                     conn.commit()
-                    synth_id = conn.execute("SELECT last_insert_rowid() as id").fetchone()['id']
                     results[synth_type] = synth_id
                     logger.info(f"Generated {synth_type} synthesis with ID {synth_id}")
                     
@@ -616,7 +1014,7 @@ class MindmapSynthesizer:
                            created_at, updated_at
                     FROM mindmap_syntheses
                     WHERE synthesis_type IS NULL OR synthesis_type = '' OR synthesis_type = 'default'
-                    ORDER BY updated_at DESC
+                    ORDER BY updated_at DESC, id DESC
                     LIMIT 1
                 """).fetchone()
             else:
@@ -626,7 +1024,7 @@ class MindmapSynthesizer:
                            created_at, updated_at
                     FROM mindmap_syntheses
                     WHERE synthesis_type = ?
-                    ORDER BY updated_at DESC
+                    ORDER BY updated_at DESC, id DESC
                     LIMIT 1
                 """, (synthesis_type,)).fetchone()
             
@@ -0,0 +1,259 @@
+"""
+Notification Fan-out Hub
+
+Pushes notification changes to open browser tabs over Server-Sent Events
+instead of having every tab query Supabase for the unread count.
+
+- Writers (NotificationQueue, the /api/notifications endpoints) call
+  :meth:`NotificationHub.publish` after a successful write
+- Each published event gets a sequential id and is kept in a small ring
+  buffer so a reconnecting EventSource can resume from ``Last-Event-ID``
+- Unread/total counts live in memory, adjusted by each event and
+  reconciled against the database at most once per ``reconcile_interval``
+  (only while someone is asking), so idle dashboards cost no queries
+
+The hub is per process. With several workers, events published in one
+worker reach that worker's streams immediately; others pick up the new
+counts at their next reconcile.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER = "default"  # single-user app; kept as a key so counts can split per user later
+RECONCILE_INTERVAL = 300  # seconds
+BUFFER_SIZE = 500  # events kept for Last-Event-ID resume
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def load_notification_counts() -> Dict[str, int]:
+    """Count unread and open (unactioned) notifications, Supabase first."""
+    from ..db import connect
+    from ..infrastructure.supabase_client import get_supabase_client
+
+    try:
+        supabase = get_supabase_client()
+    except Exception as e:
+        logger.warning(f"Supabase unavailable: {e}")
+        supabase = None
+
+    if supabase:
+        try:
+            unread = supabase.table("notifications").select("id", count="exact").is_("read_at", "null").execute()
+            total = supabase.table("notifications").select("id", count="exact").is_("actioned_at", "null").execute()
+            return {"unread": unread.count or 0, "total": total.count or 0}
+        except Exception as e:
+            logger.warning(f"Supabase notification count failed: {e}")
+
+    with connect() as conn:
+        table = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='notifications'"
+        ).fetchone()
+        if not table:
+            return {"unread": 0, "total": 0}
+        row = conn.execute(
+            """SELECT
+                COUNT(*) as total,
+                SUM(CASE WHEN read = 0 THEN 1 ELSE 0 END) as unread
+               FROM notifications"""
+        ).fetchone()
+    return {"unread": row["unread"] or 0, "total": row["total"] or 0}
+
+
+class NotificationHub:
+    """In-process event fan-out with cached counts and a resumable event log."""
+
+    def __init__(
+        self,
+        loader: Callable[[], Dict[str, int]] = load_notification_counts,
+        reconcile_interval: float = RECONCILE_INTERVAL,
+        buffer_size: int = BUFFER_SIZE,
+    ):
+        self._loader = loader
+        self.reconcile_interval = reconcile_interval
+        # Event ids are "<epoch>-<seq>"; a new epoch per process means ids
+        # from before a restart are recognised as unresumable
+        self.epoch = uuid.uuid4().hex[:8]
+        self._seq = itertools.count(1)
+        self._events: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=buffer_size)
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._reconciled_at: Dict[str, float] = {}
+        self._subscribers: List[Tuple[asyncio.Queue, asyncio.AbstractEventLoop]] = []
+        self._lock = threading.Lock()
+        self.reconciles = 0  # loader calls, for diagnostics
+
+    # -------------------------
+    # Counts
+    # -------------------------
+
+    def counts(self, user: str = DEFAULT_USER) -> Dict[str, int]:
+        """Cached counts, reloading from the database when stale (blocking)."""
+        if self.is_stale(user):
+            self.reconcile(user)
+        with self._lock:
+            return dict(self._counts.get(user, {"unread": 0, "total": 0}))
+
+    def is_stale(self, user: str = DEFAULT_USER) -> bool:
+        reconciled = self._reconciled_at.get(user)
+        return reconciled is None or time.monotonic() - reconciled > self.reconcile_interval
+
+    def reconcile(self, user: str = DEFAULT_USER, emit: bool = True) -> Dict[str, int]:
+        """Reload counts from the database; publishes a ``count`` event if they drifted."""
+        fresh = self._loader()
+        self.reconciles += 1
+        with self._lock:
+            previous = self._counts.get(user)
+            changed = previous is not None and previous != fresh
+            self._counts[user] = dict(fresh)
+            self._reconciled_at[user] = time.monotonic()
+        if changed and emit:
+            self._emit("count", {}, user)
+        return fresh
+
+    # -------------------------
+    # Publishing
+    # -------------------------
+
+    def publish(
+        self,
+        event_type: str,
+        data: Optional[Dict[str, Any]] = None,
+        user: str = DEFAULT_USER,
+        unread_delta: int = 0,
+        total_delta: int = 0,
+        unread: Optional[int] = None,
+        reconcile: bool = False,
+    ) -> str:
+        """
+        Record a change and push it to subscribers. Safe to call from any thread.
+
+        Args:
+            event_type: created | read | read_all | actioned | deleted
+            data: Event payload (notification dict or {"id": ...})
+            unread_delta / total_delta: Adjustment to the cached counts
+            unread: Absolute unread count, when the writer knows it (read_all)
+            reconcile: Reload counts instead of adjusting them, for writes whose
+                effect depends on the row's prior state (marking an already-read
+                notification read). Skipped while nobody holds cached counts.
+        """
+        if reconcile:
+            if user in self._counts:
+                self.reconcile(user, emit=False)
+            return self._emit(event_type, data or {}, user)
+
+        with self._lock:
+            counts = self._counts.get(user)
+            if counts is not None:
+                if unread is not None:
+                    counts["unread"] = unread
+                counts["unread"] = max(0, counts["unread"] + unread_delta)
+                counts["total"] = max(0, counts["total"] + total_delta)
+        return self._emit(event_type, data or {}, user)
+
+    def _emit(self, event_type: str, data: Dict[str, Any], user: str) -> str:
+        with self._lock:
+            seq = next(self._seq)
+            event = {
+                "id": f"{self.epoch}-{seq}",
+                "type": event_type,
+                "user": user,
+                "data": data,
+                "counts": dict(self._counts[user]) if user in self._counts else None,
+            }
+            self._events.append((seq, event))
+            subscribers = list(self._subscribers)
+
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, event)
+            except RuntimeError:
+                # Loop closed under us; the stream's finally block unsubscribes
+                pass
+        return event["id"]
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, event: Dict[str, Any]):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop, it can resume from its last id on reconnect
+            logger.debug("Notification subscriber queue full, dropping event")
+
+    # -------------------------
+    # Subscribing
+    # -------------------------
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber queue on the running event loop."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.append((queue, asyncio.get_running_loop()))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        with self._lock:
+            self._subscribers = [(q, l) for q, l in self._subscribers if q is not queue]
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent event (0 before the first)."""
+        with self._lock:
+            return self._events[-1][0] if self._events else 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def events_since(self, last_event_id: Optional[str], user: str = DEFAULT_USER) -> Optional[List[Dict[str, Any]]]:
+        """
+        Buffered events after ``last_event_id``.
+
+        Returns None when the id can't be resumed from (another process
+        epoch, or already evicted from the buffer); callers then send a
+        full snapshot instead.
+        """
+        if not last_event_id:
+            return None
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        last = int(seq)
+        with self._lock:
+            events = list(self._events)
+        if events and events[0][0] > last + 1:
+            return None  # gap: some events were evicted
+        return [e for s, e in events if s > last and e["user"] == user]
+
+    @staticmethod
+    def seq_of(event_id: str) -> int:
+        return int(event_id.rpartition("-")[2])
+
+
+_hub: Optional[NotificationHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_notification_hub() -> NotificationHub:
+    """Get the process-wide notification hub."""
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = NotificationHub()
+    return _hub
+
+
+def publish_notification_event(event_type: str, data: Optional[Dict[str, Any]] = None, **kwargs):
+    """Publish to the shared hub; never lets a fan-out problem fail the write."""
+    try:
+        get_notification_hub().publish(event_type, data, **kwargs)
+    except Exception as e:
+        logger.warning(f"Notification event publish failed: {e}")
@@ -21,6 +21,7 @@ from typing import Dict, List, Optional, Any
 
 from ..db import connect
 from ..infrastructure.supabase_client import get_supabase_client as get_supabase
+from .notification_hub import publish_notification_event
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +180,7 @@ class NotificationQueue:
                 
                 if result.data:
                     logger.info(f"Created notification in Supabase: {notification.id}")
+                    self._publish_created(notification)
                     return notification.id
             except Exception as e:
                 logger.warning(f"Supabase insert failed, falling back to SQLite: {e}")
@@ -196,8 +198,17 @@ class NotificationQueue:
             conn.commit()
         
         logger.info(f"Created notification: {notification.id} ({notification.notification_type.value})")
+        self._publish_created(notification)
         return notification.id
     
+    def _publish_created(self, notification: Notification):
+        publish_notification_event(
+            "created",
+            notification.to_dict(),
+            unread_delta=0 if notification.read else 1,
+            total_delta=1,
+        )
+    
     def create_signal_review(
         self,
         signal_type: str,
@@ -393,6 +404,7 @@ class NotificationQueue:
         if supabase:
             try:
                 supabase.table("notifications").update({"read": True}).eq("id", notification_id).execute()
+                publish_notification_event("read", {"id": notification_id}, reconcile=True)
                 return
             except Exception as e:
                 logger.warning(f"Supabase update failed: {e}")
@@ -400,6 +412,7 @@ class NotificationQueue:
         with connect() as conn:
             conn.execute("UPDATE notifications SET read = 1 WHERE id = ?", (notification_id,))
             conn.commit()
+        publish_notification_event("read", {"id": notification_id}, reconcile=True)
     
     def approve(self, notification_id: str, feedback: Optional[str] = None) -> bool:
         """Approve a pending notification (e.g., signal review).
@@ -475,6 +488,9 @@ class NotificationQueue:
                         self._record_signal_feedback(result.data, action, notes)
                     
                     logger.info(f"Notification {notification_id} {action}")
+                    publish_notification_event(
+                        "actioned", {"id": notification_id, "action": action}, reconcile=True
+                    )
                     return True
             except Exception as e:
                 logger.warning(f"Supabase action failed: {e}")
@@ -489,6 +505,7 @@ class NotificationQueue:
             conn.commit()
         
         logger.info(f"Notification {notification_id} {action}")
+        publish_notification_event("actioned", {"id": notification_id, "action": action}, reconcile=True)
         return True
     
     def _record_signal_feedback(self, notification_data: dict, action: str, notes: Optional[str]):
@@ -529,6 +546,8 @@ class NotificationQueue:
                           notes if action == "rejected" else None))
                     conn.commit()
             
+            from .signal_learning import signal_feedback_recorded
+            signal_feedback_recorded(signal_type, signal_text, feedback)
             logger.info(f"Recorded signal feedback: {signal_type} → {feedback}")
         except Exception as e:
             logger.error(f"Failed to record signal feedback: {e}")
@@ -580,6 +599,7 @@ class NotificationQueue:
             try:
                 supabase.table("notifications").delete().eq("id", notification_id).execute()
                 logger.info(f"Deleted notification {notification_id}")
+                publish_notification_event("deleted", {"id": notification_id}, reconcile=True)
                 return True
             except Exception as e:
                 logger.warning(f"Supabase delete failed: {e}")
@@ -589,6 +609,7 @@ class NotificationQueue:
             conn.commit()
         
         logger.info(f"Deleted notification {notification_id}")
+        publish_notification_event("deleted", {"id": notification_id}, reconcile=True)
         return True
     
     def mark_all_read(self) -> int:
@@ -604,6 +625,7 @@ class NotificationQueue:
                 result = supabase.table("notifications").update({"read": True}).eq("read", False).execute()
                 count = len(result.data) if result.data else 0
                 logger.info(f"Marked {count} notifications as read (Supabase)")
+                publish_notification_event("read_all", unread=0)
                 return count
             except Exception as e:
                 logger.warning(f"Supabase update failed: {e}")
@@ -614,6 +636,7 @@ class NotificationQueue:
             conn.commit()
         
         logger.info(f"Marked {count} notifications as read")
+        publish_notification_event("read_all", unread=0)
         return count
     
     def cleanup_expired(self) -> int:
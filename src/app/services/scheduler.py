@@ -5,17 +5,57 @@ Uses APScheduler to run background jobs at their scheduled times.
 This provides reliable in-app scheduling without depending on external cron.
 
 Jobs are defined in background_jobs.py and scheduled based on their cron expressions.
+
+Every worker/replica starts its own APScheduler, so execution is
+coordinated through a leader lease (see scheduler_lease.py):
+
+- a heartbeat keeps the lease renewed; only the leader runs jobs
+- each cron tick is claimed once (``tick:<job>@<minute>``) before running
+- a random jitter spreads jobs that share a cron minute
+- every run is recorded in ``scheduler_job_runs`` and the per-job
+  last/next run state in ``scheduler_jobs`` (served at /api/v1/jobs)
+
+Configuration:
+    SCHEDULER_LOCK            sqlite (default) | redis | none
+    SCHEDULER_LEASE_TTL       lease lifetime in seconds (default 60)
+    SCHEDULER_JITTER_SECONDS  max random delay before a run (default 30)
 """
 
+import json
 import logging
 import os
+import random
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 # Global scheduler instance
 _scheduler = None
+_lease = None
+_is_leader = False
+
+DEFAULT_JITTER_SECONDS = 30
+TICK_CLAIM_TTL = 24 * 3600  # tick claims only need to outlive clock skew and misfire grace
+HISTORY_PER_JOB = 200  # runs kept per job in scheduler_job_runs
+
+# (schedule id, display name, background_jobs.run_job name, crontab)
+JOB_SCHEDULES = [
+    # 1:1 Prep - Every Tuesday at 7 AM (but job checks biweekly internally)
+    ("one_on_one_prep", "1:1 Prep Digest", "one_on_one_prep", "0 7 * * 2"),
+    # Stale Ticket Alert - Weekdays at 9 AM
+    ("stale_ticket_alert", "Stale Ticket Alert", "stale_ticket_alert", "0 9 * * 1-5"),
+    # Grooming Match - Every hour
+    ("grooming_match", "Grooming-to-Ticket Match", "grooming_match", "0 * * * *"),
+    # Sprint Mode Detect - Daily at 8 AM
+    ("sprint_mode_detect", "Sprint Mode Auto-Detect", "sprint_mode_detect", "0 8 * * *"),
+    # Overdue Encouragement - Weekdays at 2 PM and 5 PM
+    ("overdue_encouragement_2pm", "Overdue Encouragement (2 PM)", "overdue_encouragement", "0 14 * * 1-5"),
+    ("overdue_encouragement_5pm", "Overdue Encouragement (5 PM)", "overdue_encouragement", "0 17 * * 1-5"),
+    # Feedback Reconcile - Every 30 minutes
+    ("feedback_reconcile", "Evaluation Feedback Reconcile", "feedback_reconcile", "*/30 * * * *"),
+]
 
 
 def get_scheduler():
@@ -24,34 +64,288 @@ def get_scheduler():
     return _scheduler
 
 
+def get_lease():
+    """Get the lease backend in use (None when running uncoordinated)."""
+    return _lease
+
+
+# =============================================================================
+# JOB EXECUTION
+# =============================================================================
+
+def _execute(job_name: str) -> Dict[str, Any]:
+    """Run one background job, honouring the 1:1 prep biweekly gate."""
+    from .background_jobs import OneOnOnePrepJob, run_job
+
+    if job_name == "one_on_one_prep":
+        job = OneOnOnePrepJob()
+        if not job.should_run_today():
+            return {"skipped": True, "reason": "not a 1:1 week"}
+        return job.run()
+    return run_job(job_name)
+
+
+def run_tracked(
+    job_id: str,
+    job_name: str,
+    trigger: str = "cron",
+    scheduled_for: Optional[str] = None,
+    runner: Optional[Callable[[str], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Run a job and record its timing and outcome.
+
+    Exceptions are re-raised after being recorded so HTTP callers can
+    report them; the cron wrapper swallows them.
+    """
+    runner = runner or _execute
+    holder = _lease.holder if _lease else None
+    started = datetime.now()
+    run_id = _record_run_start(job_id, scheduled_for, trigger, holder, started)
+
+    t0 = time.perf_counter()
+    try:
+        result = runner(job_name)
+    except Exception as e:
+        duration_ms = int((time.perf_counter() - t0) * 1000)
+        _record_run_finish(run_id, job_id, "failed", duration_ms, error=str(e))
+        raise
+
+    duration_ms = int((time.perf_counter() - t0) * 1000)
+    status = "skipped" if isinstance(result, dict) and result.get("skipped") else "success"
+    _record_run_finish(run_id, job_id, status, duration_ms, result=result)
+    return result
+
+
+def run_scheduled_job(job_id: str, job_name: str, jitter: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Cron entry point: run the job only if this process leads and wins the tick.
+
+    Returns the job result, or None when another process owns this tick.
+    """
+    # Cron has minute granularity and APScheduler fires on :00, so the
+    # minute identifies the tick fleet-wide even if workers fire a few ms apart
+    tick = datetime.now().replace(second=0, microsecond=0).isoformat()
+
+    if _lease is not None:
+        if not _lease.acquire():
+            logger.debug(f"{job_id}: not leader, skipping tick {tick}")
+            return None
+        if not _lease.claim(f"tick:{job_id}@{tick}", TICK_CLAIM_TTL):
+            logger.info(f"{job_id}: tick {tick} already claimed")
+            return None
+
+    if jitter is None:
+        jitter = float(os.environ.get("SCHEDULER_JITTER_SECONDS", DEFAULT_JITTER_SECONDS))
+    if jitter > 0:
+        time.sleep(random.uniform(0, jitter))
+
+    try:
+        result = run_tracked(job_id, job_name, trigger="cron", scheduled_for=tick)
+        logger.info(f"{job_id} completed: {_summarize(result)}")
+        return result
+    except Exception as e:
+        logger.error(f"{job_id} failed: {e}")
+        return None
+
+
+def _heartbeat():
+    """Renew (or try to take) the leader lease and log leadership changes."""
+    global _is_leader
+    if _lease is None:
+        return
+    try:
+        leader = _lease.acquire()
+    except Exception as e:
+        logger.warning(f"Scheduler lease heartbeat failed: {e}")
+        leader = False
+    if leader != _is_leader:
+        logger.info(f"Scheduler leadership {'acquired' if leader else 'lost'} ({_lease.holder})")
+    _is_leader = leader
+    if leader:
+        _persist_next_runs()
+
+
+# =============================================================================
+# PERSISTED STATE
+# =============================================================================
+
+def _summarize(result: Any, limit: int = 2000) -> Optional[str]:
+    if result is None:
+        return None
+    try:
+        text = json.dumps(result, default=str)
+    except (TypeError, ValueError):
+        text = str(result)
+    return text[:limit]
+
+
+def _record_run_start(job_id, scheduled_for, trigger, holder, started: datetime) -> Optional[int]:
+    from ..db import connect
+
+    try:
+        with connect() as conn:
+            cur = conn.execute(
+                """
+                INSERT INTO scheduler_job_runs (job_id, scheduled_for, trigger, holder, started_at, status)
+                VALUES (?, ?, ?, ?, ?, 'running')
+                """,
+                (job_id, scheduled_for, trigger, holder, started.isoformat()),
+            )
+            conn.commit()
+            return cur.lastrowid
+    except Exception as e:
+        logger.warning(f"Could not record start of {job_id}: {e}")
+        return None
+
+
+def _record_run_finish(run_id, job_id, status, duration_ms, result=None, error=None):
+    from ..db import connect
+
+    finished = datetime.now().isoformat()
+    try:
+        with connect() as conn:
+            if run_id is not None:
+                conn.execute(
+                    """
+                    UPDATE scheduler_job_runs
+                    SET finished_at = ?, duration_ms = ?, status = ?, error = ?, result_summary = ?
+                    WHERE id = ?
+                    """,
+                    (finished, duration_ms, status, error, _summarize(result), run_id),
+                )
+            conn.execute(
+                """
+                INSERT INTO scheduler_jobs (job_id, last_run_at, last_status, last_duration_ms,
+                                            run_count, failure_count, updated_at)
+                VALUES (?, ?, ?, ?, 1, ?, datetime('now'))
+                ON CONFLICT(job_id) DO UPDATE SET
+                    last_run_at = excluded.last_run_at,
+                    last_status = excluded.last_status,
+                    last_duration_ms = excluded.last_duration_ms,
+                    run_count = scheduler_jobs.run_count + 1,
+                    failure_count = scheduler_jobs.failure_count + excluded.failure_count,
+                    updated_at = datetime('now')
+                """,
+                (job_id, finished, status, duration_ms, 1 if status == "failed" else 0),
+            )
+            conn.execute(
+                """
+                DELETE FROM scheduler_job_runs
+                WHERE job_id = ? AND id NOT IN (
+                    SELECT id FROM scheduler_job_runs WHERE job_id = ? ORDER BY id DESC LIMIT ?
+                )
+                """,
+                (job_id, job_id, HISTORY_PER_JOB),
+            )
+            conn.commit()
+    except Exception as e:
+        logger.warning(f"Could not record finish of {job_id}: {e}")
+    _persist_next_runs()
+
+
+def _persist_next_runs():
+    """Write APScheduler's next fire times so any worker can report them."""
+    if not _scheduler:
+        return
+    from ..db import connect
+
+    schedules = {job_id: (name, cron) for job_id, name, _, cron in JOB_SCHEDULES}
+    try:
+        with connect() as conn:
+            for job in _scheduler.get_jobs():
+                if job.id not in schedules:
+                    continue
+                name, cron = schedules[job.id]
+                next_run = job.next_run_time.isoformat() if job.next_run_time else None
+                conn.execute(
+                    """
+                    INSERT INTO scheduler_jobs (job_id, name, schedule, next_run_at, updated_at)
+                    VALUES (?, ?, ?, ?, datetime('now'))
+                    ON CONFLICT(job_id) DO UPDATE SET
+                        name = excluded.name,
+                        schedule = excluded.schedule,
+                        next_run_at = excluded.next_run_at,
+                        updated_at = datetime('now')
+                    """,
+                    (job.id, name, cron, next_run),
+                )
+            conn.commit()
+    except Exception as e:
+        logger.warning(f"Could not persist next run times: {e}")
+
+
+def get_job_states() -> List[Dict[str, Any]]:
+    """Persisted last/next run state for every job that has run or been scheduled."""
+    from ..db import connect
+
+    with connect() as conn:
+        rows = conn.execute("SELECT * FROM scheduler_jobs ORDER BY job_id").fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_job_history(job_id: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    """Most recent runs, newest first, optionally for one job (prefix match covers split schedules)."""
+    from ..db import connect
+
+    with connect() as conn:
+        if job_id:
+            rows = conn.execute(
+                "SELECT * FROM scheduler_job_runs WHERE job_id = ? OR job_id LIKE ? ORDER BY id DESC LIMIT ?",
+                (job_id, f"{job_id}_%", limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT * FROM scheduler_job_runs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_leader_info() -> Dict[str, Any]:
+    """Who holds the leader lease, and whether it is this process."""
+    if _lease is None:
+        return {"backend": "none", "holder": None, "is_leader": _scheduler is not None}
+    try:
+        current = _lease.current()
+    except Exception as e:
+        logger.warning(f"Could not read scheduler lease: {e}")
+        current = None
+    return {
+        "backend": _lease.backend,
+        "holder": current["holder"] if current else None,
+        "expires_at": current["expires_at"] if current else None,
+        "this_process": _lease.holder,
+        "is_leader": bool(current and current["holder"] == _lease.holder),
+    }
+
+
+# =============================================================================
+# LIFECYCLE
+# =============================================================================
+
 def init_scheduler():
     """
     Initialize the APScheduler with all background jobs.
-    
+
     Only runs in production (ENVIRONMENT=production) to avoid
-    duplicate job execution during development.
+    duplicate job execution during development. Safe to start in every
+    worker: jobs only execute in the process holding the leader lease.
     """
-    global _scheduler
-    
+    global _scheduler, _lease, _is_leader
+
     # Only run scheduler in production
     environment = os.environ.get("ENVIRONMENT", "development")
     if environment != "production":
         logger.info(f"Scheduler disabled in {environment} environment")
         return None
-    
+
     try:
         from apscheduler.schedulers.background import BackgroundScheduler
         from apscheduler.triggers.cron import CronTrigger
-        
-        from .background_jobs import (
-            OneOnOnePrepJob,
-            StaleTicketAlertJob,
-            GroomingMatchJob,
-            SprintModeDetectJob,
-            OverdueEncouragementJob,
-            JOB_CONFIGS,
-        )
-        
+
+        from .scheduler_lease import create_lease
+
+        _lease = create_lease()
         _scheduler = BackgroundScheduler(
             job_defaults={
                 'coalesce': True,  # Combine missed executions
@@ -59,121 +353,40 @@ def init_scheduler():
                 'misfire_grace_time': 60 * 30,  # 30 min grace period
             }
         )
-        
-        # Job wrapper functions
-        def run_one_on_one_prep():
-            """Run 1:1 prep job if it should run today."""
-            try:
-                job = OneOnOnePrepJob()
-                if job.should_run_today():
-                    result = job.run()
-                    logger.info(f"OneOnOnePrepJob completed: {result}")
-            except Exception as e:
-                logger.error(f"OneOnOnePrepJob failed: {e}")
-        
-        def run_stale_ticket_alert():
-            """Run stale ticket alert job."""
-            try:
-                job = StaleTicketAlertJob()
-                result = job.run()
-                logger.info(f"StaleTicketAlertJob completed: alerts={result.get('alerts_created', 0)}")
-            except Exception as e:
-                logger.error(f"StaleTicketAlertJob failed: {e}")
-        
-        def run_grooming_match():
-            """Run grooming-to-ticket match job."""
-            try:
-                job = GroomingMatchJob()
-                result = job.run()
-                if result.get("matches"):
-                    logger.info(f"GroomingMatchJob completed: matches={len(result['matches'])}")
-            except Exception as e:
-                logger.error(f"GroomingMatchJob failed: {e}")
-        
-        def run_sprint_mode_detect():
-            """Run sprint mode detection job."""
-            try:
-                job = SprintModeDetectJob()
-                result = job.run()
-                logger.info(f"SprintModeDetectJob completed: suggested={result.get('suggested_mode')}")
-            except Exception as e:
-                logger.error(f"SprintModeDetectJob failed: {e}")
-        
-        def run_overdue_encouragement():
-            """Run overdue encouragement job."""
-            try:
-                job = OverdueEncouragementJob()
-                result = job.run()
-                created = result.get("notifications_created", 0)
-                if created > 0:
-                    logger.info(f"OverdueEncouragementJob completed: notifications={created}")
-            except Exception as e:
-                logger.error(f"OverdueEncouragementJob failed: {e}")
-        
-        # Schedule jobs based on their cron expressions
-        # 1:1 Prep - Every Tuesday at 7 AM (but job checks biweekly internally)
-        _scheduler.add_job(
-            run_one_on_one_prep,
-            CronTrigger.from_crontab("0 7 * * 2"),  # Every Tuesday 7 AM
-            id="one_on_one_prep",
-            name="1:1 Prep Digest",
-            replace_existing=True,
-        )
-        
-        # Stale Ticket Alert - Weekdays at 9 AM
-        _scheduler.add_job(
-            run_stale_ticket_alert,
-            CronTrigger.from_crontab("0 9 * * 1-5"),  # Weekdays 9 AM
-            id="stale_ticket_alert",
-            name="Stale Ticket Alert",
-            replace_existing=True,
-        )
-        
-        # Grooming Match - Every hour
-        _scheduler.add_job(
-            run_grooming_match,
-            CronTrigger.from_crontab("0 * * * *"),  # Every hour
-            id="grooming_match",
-            name="Grooming-to-Ticket Match",
-            replace_existing=True,
-        )
-        
-        # Sprint Mode Detect - Daily at 8 AM
-        _scheduler.add_job(
-            run_sprint_mode_detect,
-            CronTrigger.from_crontab("0 8 * * *"),  # Daily 8 AM
-            id="sprint_mode_detect",
-            name="Sprint Mode Auto-Detect",
-            replace_existing=True,
-        )
-        
-        # Overdue Encouragement - Weekdays at 2 PM and 5 PM
-        _scheduler.add_job(
-            run_overdue_encouragement,
-            CronTrigger.from_crontab("0 14 * * 1-5"),  # Weekdays 2 PM
-            id="overdue_encouragement_2pm",
-            name="Overdue Encouragement (2 PM)",
-            replace_existing=True,
-        )
-        _scheduler.add_job(
-            run_overdue_encouragement,
-            CronTrigger.from_crontab("0 17 * * 1-5"),  # Weekdays 5 PM
-            id="overdue_encouragement_5pm",
-            name="Overdue Encouragement (5 PM)",
-            replace_existing=True,
-        )
-        
+
+        for job_id, name, job_name, cron in JOB_SCHEDULES:
+            _scheduler.add_job(
+                run_scheduled_job,
+                CronTrigger.from_crontab(cron),
+                args=[job_id, job_name],
+                id=job_id,
+                name=name,
+                replace_existing=True,
+            )
+
+        if _lease is not None:
+            _scheduler.add_job(
+                _heartbeat,
+                "interval",
+                seconds=max(_lease.ttl // 3, 5),
+                id="_leader_lease",
+                name="Scheduler leader lease",
+                replace_existing=True,
+            )
+
         # Start the scheduler
         _scheduler.start()
-        print("✅ Background job scheduler started")
-        
+        _heartbeat()
+        role = "leader" if (_is_leader or _lease is None) else "follower"
+        print(f"✅ Background job scheduler started ({role}, lock={_lease.backend if _lease else 'none'})")
+
         # Log scheduled jobs
         for job in _scheduler.get_jobs():
             next_run = job.next_run_time.strftime("%Y-%m-%d %H:%M") if job.next_run_time else "N/A"
             print(f"  📅 {job.name}: next run at {next_run}")
-        
+
         return _scheduler
-        
+
     except ImportError:
         logger.warning("APScheduler not installed. Background jobs will not run automatically.")
         return None
@@ -183,21 +396,30 @@ def init_scheduler():
 
 
 def shutdown_scheduler():
-    """Shutdown the scheduler gracefully."""
-    global _scheduler
+    """Shutdown the scheduler gracefully and hand the lease to another worker."""
+    global _scheduler, _lease, _is_leader
     if _scheduler:
         _scheduler.shutdown(wait=False)
         logger.info("Scheduler shutdown complete")
         _scheduler = None
+    if _lease is not None:
+        try:
+            _lease.release()
+        except Exception as e:
+            logger.warning(f"Could not release scheduler lease: {e}")
+        _lease = None
+    _is_leader = False
 
 
 def get_next_job_runs() -> list:
     """Get the next scheduled run times for all jobs."""
     if not _scheduler:
         return []
-    
+
     jobs = []
     for job in _scheduler.get_jobs():
+        if job.id.startswith("_"):
+            continue
         jobs.append({
             "id": job.id,
             "name": job.name,
@@ -0,0 +1,206 @@
+"""
+Leader Lease for the Background Job Scheduler
+
+Every uvicorn worker / replica boots its own APScheduler, so without
+coordination each cron tick fires once per process. Two layers keep a
+tick to a single execution across the fleet:
+
+- a renewable leader lease: only the current holder runs jobs, and a
+  follower takes over once the holder stops renewing (crash, shutdown)
+- a per-tick claim: the first process to claim ``<job>@<tick>`` runs it,
+  which covers the short window where an expired leader and its
+  successor both believe they hold the lease
+
+Backends:
+- SQLite (default): rows in ``scheduler_leases``; works for workers that
+  share the app database file
+- Redis: ``SET NX PX`` plus compare-and-set Lua scripts; works across hosts
+"""
+
+import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_TTL = 60  # seconds
+LEADER_LEASE_NAME = "scheduler-leader"
+
+
+def make_holder_id() -> str:
+    """Identify this process: host, pid and a random suffix (pids get reused)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class SQLiteLease:
+    """Lease backend storing holders and expiries in the app database."""
+
+    backend = "sqlite"
+
+    def __init__(self, holder: Optional[str] = None, ttl: int = DEFAULT_LEASE_TTL):
+        self.holder = holder or make_holder_id()
+        self.ttl = ttl
+
+    def acquire(self, name: str = LEADER_LEASE_NAME) -> bool:
+        """Take the lease if it is free or expired, or renew it if we hold it."""
+        from ..db import connect
+
+        now = time.time()
+        try:
+            with connect() as conn:
+                cur = conn.execute(
+                    """
+                    INSERT INTO scheduler_leases (name, holder, expires_at, acquired_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        holder = excluded.holder,
+                        expires_at = excluded.expires_at,
+                        acquired_at = CASE WHEN scheduler_leases.holder = excluded.holder
+                                           THEN scheduler_leases.acquired_at
+                                           ELSE excluded.acquired_at END
+                    WHERE scheduler_leases.holder = excluded.holder
+                       OR scheduler_leases.expires_at < ?
+                    """,
+                    (name, self.holder, now + self.ttl, now, now),
+                )
+                conn.commit()
+                return cur.rowcount > 0
+        except sqlite3.OperationalError as e:
+            # Locked by another writer: treat as not acquired, retry next heartbeat
+            logger.warning(f"Lease acquire failed for {name}: {e}")
+            return False
+
+    def release(self, name: str = LEADER_LEASE_NAME) -> None:
+        from ..db import connect
+
+        with connect() as conn:
+            conn.execute(
+                "DELETE FROM scheduler_leases WHERE name = ? AND holder = ?",
+                (name, self.holder),
+            )
+            conn.commit()
+
+    def current(self, name: str = LEADER_LEASE_NAME) -> Optional[Dict[str, Any]]:
+        """Live lease for ``name`` (None if free or expired)."""
+        from ..db import connect
+
+        with connect() as conn:
+            row = conn.execute(
+                "SELECT holder, expires_at, acquired_at FROM scheduler_leases WHERE name = ? AND expires_at >= ?",
+                (name, time.time()),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def claim(self, key: str, ttl: int) -> bool:
+        """
+        Claim a one-shot key (e.g. a job tick) for ``ttl`` seconds.
+
+        Unlike :meth:`acquire`, a claim is never renewed by the same holder:
+        a second claim of the same key returns False until it expires.
+        """
+        from ..db import connect
+
+        now = time.time()
+        with connect() as conn:
+            cur = conn.execute(
+                """
+                INSERT INTO scheduler_leases (name, holder, expires_at, acquired_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    holder = excluded.holder,
+                    expires_at = excluded.expires_at,
+                    acquired_at = excluded.acquired_at
+                WHERE scheduler_leases.expires_at < ?
+                """,
+                (key, self.holder, now + ttl, now, now),
+            )
+            # Opportunistically drop expired tick claims so the table stays small
+            conn.execute(
+                "DELETE FROM scheduler_leases WHERE name LIKE 'tick:%' AND expires_at < ?",
+                (now,),
+            )
+            conn.commit()
+            return cur.rowcount > 0
+
+
+class RedisLease:
+    """Lease backend on Redis, for replicas that don't share a filesystem."""
+
+    backend = "redis"
+
+    # Renew only if we still hold it (a plain SET would steal an expired-and-retaken lease)
+    _RENEW = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('pexpire', KEYS[1], ARGV[2])
+    end
+    return 0
+    """
+    _RELEASE = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, redis_url: str, holder: Optional[str] = None, ttl: int = DEFAULT_LEASE_TTL):
+        import redis
+
+        self.holder = holder or make_holder_id()
+        self.ttl = ttl
+        self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+        self._renew = self._redis.register_script(self._RENEW)
+        self._release = self._redis.register_script(self._RELEASE)
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return f"signalflow:scheduler:{name}"
+
+    def acquire(self, name: str = LEADER_LEASE_NAME) -> bool:
+        key = self._key(name)
+        ttl_ms = self.ttl * 1000
+        if self._redis.set(key, self.holder, nx=True, px=ttl_ms):
+            return True
+        return bool(self._renew(keys=[key], args=[self.holder, ttl_ms]))
+
+    def release(self, name: str = LEADER_LEASE_NAME) -> None:
+        self._release(keys=[self._key(name)], args=[self.holder])
+
+    def current(self, name: str = LEADER_LEASE_NAME) -> Optional[Dict[str, Any]]:
+        key = self._key(name)
+        holder = self._redis.get(key)
+        if not holder:
+            return None
+        pttl = self._redis.pttl(key)
+        return {"holder": holder, "expires_at": time.time() + max(pttl, 0) / 1000, "acquired_at": None}
+
+    def claim(self, key: str, ttl: int) -> bool:
+        return bool(self._redis.set(self._key(key), self.holder, nx=True, ex=ttl))
+
+
+def create_lease(backend: Optional[str] = None, ttl: Optional[int] = None):
+    """
+    Build the lease backend from configuration.
+
+    ``SCHEDULER_LOCK`` selects ``sqlite`` (default), ``redis`` (needs
+    ``REDIS_URL``) or ``none`` (no coordination, single-process deploys).
+    Falls back to SQLite if Redis is requested but unavailable.
+    """
+    backend = (backend or os.environ.get("SCHEDULER_LOCK", "sqlite")).lower()
+    ttl = ttl or int(os.environ.get("SCHEDULER_LEASE_TTL", DEFAULT_LEASE_TTL))
+
+    if backend == "none":
+        return None
+    if backend == "redis":
+        url = os.environ.get("REDIS_URL")
+        if url:
+            try:
+                return RedisLease(url, ttl=ttl)
+            except ImportError:
+                logger.warning("redis not installed, scheduler lease falling back to SQLite")
+        else:
+            logger.warning("SCHEDULER_LOCK=redis but REDIS_URL is unset, falling back to SQLite")
+    return SQLiteLease(ttl=ttl)
@@ -13,18 +13,36 @@ The feedback loop helps the AI:
 - Identify patterns in rejected signals to avoid similar extractions
 - Understand user preferences for signal phrasing and detail level
 - Track signal categories that need more attention
+
+Extraction prompts read the learning context from a process-wide
+LearningContextCache: feedback writes update its aggregates in memory,
+and it is reloaded from signal_feedback in a background thread at most
+every LEARNING_CONTEXT_TTL_MINUTES, so analysing a meeting adds no
+feedback queries.
 """
 
-from typing import Dict, List, Any, Optional
+from collections import Counter, deque
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 import logging
+import os
+import threading
+import time
 
 from ..db import connect
 from ..infrastructure.supabase_client import get_supabase_client as get_supabase
 
 logger = logging.getLogger(__name__)
 
+# Feedback window and recent-example limits used for pattern analysis
+FEEDBACK_WINDOW_DAYS = 90
+RECENT_EXAMPLES = 50
+
+# Reload the cached learning context from the source of truth after this long
+# (deletions, toggled votes and other processes aren't seen incrementally)
+LEARNING_CONTEXT_TTL_SECONDS = float(os.getenv("LEARNING_CONTEXT_TTL_MINUTES", "15")) * 60
+
 
 # =============================================================================
 # SIGNAL FEEDBACK PATTERNS
@@ -46,21 +64,30 @@ class SignalLearningService:
         self._feedback_cache: Dict[str, Any] = {}
         self._cache_expiry: Optional[datetime] = None
     
-    def get_feedback_summary(self, days: int = 90) -> Dict[str, Any]:
+    def get_feedback_summary(self, days: int = FEEDBACK_WINDOW_DAYS) -> Dict[str, Any]:
         """
         Get a summary of signal feedback patterns.
         
         Returns:
             Dict with feedback statistics by signal type and overall patterns
         """
+        return self._build_summary(*self.load_feedback(days))
+    
+    def load_feedback(
+        self, days: int = FEEDBACK_WINDOW_DAYS
+    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Load raw feedback aggregates: counts by (signal_type, feedback) and the
+        most recent rejected and approved signals (newest first).
+        """
         supabase = get_supabase()
         if not supabase:
-            return self._get_feedback_summary_sqlite(days)
+            return self._load_feedback_sqlite(days)
         
-        return self._get_feedback_summary_supabase(supabase, days)
+        return self._load_feedback_supabase(supabase, days)
     
-    def _get_feedback_summary_sqlite(self, days: int) -> Dict[str, Any]:
-        """SQLite fallback for feedback summary."""
+    def _load_feedback_sqlite(self, days: int) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """SQLite fallback for feedback aggregates."""
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
         
         with connect() as conn:
@@ -82,8 +109,8 @@ class SignalLearningService:
                 FROM signal_feedback 
                 WHERE feedback = 'down' AND created_at >= ?
                 ORDER BY created_at DESC
-                LIMIT 50
-            """, (cutoff_date,)).fetchall()
+                LIMIT ?
+            """, (cutoff_date, RECENT_EXAMPLES)).fetchall()
             
             # Get highly approved signals for positive patterns
             approved = conn.execute("""
@@ -91,25 +118,24 @@ class SignalLearningService:
                 FROM signal_feedback 
                 WHERE feedback = 'up' AND created_at >= ?
                 ORDER BY created_at DESC
-                LIMIT 50
-            """, (cutoff_date,)).fetchall()
-        
-        return self._build_summary(type_counts, rejected, approved)
+                LIMIT ?
+            """, (cutoff_date, RECENT_EXAMPLES)).fetchall()
+        
+        return (
+            [dict(r) for r in type_counts],
+            [dict(r) for r in rejected],
+            [dict(r) for r in approved],
+        )
     
-    def _get_feedback_summary_supabase(self, supabase, days: int) -> Dict[str, Any]:
-        """Supabase implementation for feedback summary."""
+    def _load_feedback_supabase(self, supabase, days: int) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """Supabase implementation for feedback aggregates."""
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
         
-        # Build filter for user if specified
-        filters = {"created_at": {"gte": cutoff_date}}
-        if self.user_id:
-            filters["user_id"] = self.user_id
-        
         try:
             # Get all feedback in date range
             query = supabase.table("signal_feedback").select(
                 "signal_type, signal_text, feedback, created_at"
-            ).gte("created_at", cutoff_date)
+            ).gte("created_at", cutoff_date).order("created_at", desc=True)
             
             if self.user_id:
                 query = query.eq("user_id", self.user_id)
@@ -118,13 +144,12 @@ class SignalLearningService:
             rows = result.data or []
             
             # Aggregate manually
-            type_feedback_counts = {}
+            type_feedback_counts = Counter()
             rejected = []
             approved = []
             
             for row in rows:
-                key = f"{row['signal_type']}:{row['feedback']}"
-                type_feedback_counts[key] = type_feedback_counts.get(key, 0) + 1
+                type_feedback_counts[(row['signal_type'], row['feedback'])] += 1
                 
                 if row['feedback'] == 'down':
                     rejected.append(row)
@@ -133,15 +158,15 @@ class SignalLearningService:
             
             # Convert to list format
             type_counts = [
-                {"signal_type": k.split(":")[0], "feedback": k.split(":")[1], "count": v}
-                for k, v in type_feedback_counts.items()
+                {"signal_type": signal_type, "feedback": feedback, "count": count}
+                for (signal_type, feedback), count in type_feedback_counts.items()
             ]
             
-            return self._build_summary(type_counts, rejected[:50], approved[:50])
+            return type_counts, rejected[:RECENT_EXAMPLES], approved[:RECENT_EXAMPLES]
         
         except Exception as e:
             logger.error(f"Failed to get feedback summary from Supabase: {e}")
-            return self._get_feedback_summary_sqlite(days)
+            return self._load_feedback_sqlite(days)
     
     def _build_summary(
         self, 
@@ -268,13 +293,17 @@ class SignalLearningService:
         
         return patterns
     
-    def generate_learning_context(self) -> str:
+    def generate_learning_context(self, summary: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate context text for injection into signal extraction prompts.
         
         This context helps the AI understand user preferences based on feedback.
+        
+        Args:
+            summary: Precomputed feedback summary (default: query it)
         """
-        summary = self.get_feedback_summary()
+        if summary is None:
+            summary = self.get_feedback_summary()
         
         if summary.get("total_feedback", 0) < 5:
             return ""  # Not enough feedback to generate meaningful context
@@ -437,10 +466,11 @@ def get_learning_context_for_extraction() -> str:
     """
     Get learning context for signal extraction prompts.
     
-    This is the main integration point for MeetingAnalyzerAgent.
+    This is the main integration point for MeetingAnalyzerAgent. Served
+    from the shared LearningContextCache; a stale cache is refreshed in
+    the background rather than on the caller's time.
     """
-    service = get_signal_learning_service()
-    return service.generate_learning_context()
+    return get_learning_context_cache().context()
 
 
 def refresh_signal_learnings() -> bool:
@@ -451,4 +481,178 @@ def refresh_signal_learnings() -> bool:
     """
     service = get_signal_learning_service()
     memory_id = service.store_learning_in_memory()
+    if _cache is not None:
+        _cache.refresh_in_background()
     return memory_id is not None
+
+
+# =============================================================================
+# CACHED LEARNING CONTEXT
+# =============================================================================
+
+class LearningContextCache:
+    """
+    Feedback aggregates and the rendered learning context, kept in memory.
+    
+    ``version`` increases on every change (incremental update or reload);
+    the prompt text is re-rendered from the in-memory aggregates only when
+    the version moved, which needs no database access.
+    """
+    
+    def __init__(self, service: Optional[SignalLearningService] = None):
+        self._lock = threading.RLock()
+        self._service = service or SignalLearningService()
+        self._counts: Counter = Counter()
+        self._rejected: deque = deque(maxlen=RECENT_EXAMPLES)
+        self._approved: deque = deque(maxlen=RECENT_EXAMPLES)
+        self._text = ""
+        self._text_version = -1
+        self._refreshing = False
+        self.version = 0
+        self.built_at: Optional[float] = None
+    
+    def refresh(self, attempts: int = 3) -> bool:
+        """
+        Reload the aggregates from signal_feedback.
+        
+        The load runs outside the lock so record() is never blocked on it.
+        A load that overlapped a record() may or may not include that change,
+        so it is discarded and retried; if writes keep landing, the
+        incrementally maintained aggregates are kept and False is returned.
+        """
+        for _ in range(attempts):
+            with self._lock:
+                started = self.version
+            type_counts, rejected, approved = self._service.load_feedback()
+            with self._lock:
+                if self.version != started:
+                    continue
+                self._counts = Counter({
+                    (row["signal_type"], row["feedback"]): row["count"] for row in type_counts
+                })
+                self._rejected = deque(
+                    ({"signal_type": r["signal_type"], "signal_text": r["signal_text"]} for r in rejected),
+                    maxlen=RECENT_EXAMPLES,
+                )
+                self._approved = deque(
+                    ({"signal_type": a["signal_type"], "signal_text": a["signal_text"]} for a in approved),
+                    maxlen=RECENT_EXAMPLES,
+                )
+                self.version += 1
+                self.built_at = time.monotonic()
+                return True
+        return False
+    
+    def record(self, signal_type: str, signal_text: str, feedback: Optional[str],
+               previous: Optional[str] = None):
+        """
+        Fold one feedback change into the aggregates.
+        
+        signal_feedback rows are upserted per signal, so a vote replaces
+        ``previous`` (the stored value before the write, if any); that vote
+        is taken back out first. ``feedback=None`` is a pure retraction
+        (vote cleared or row deleted).
+        """
+        example = {"signal_type": signal_type, "signal_text": signal_text}
+        with self._lock:
+            if previous:
+                key = (signal_type, previous)
+                if self._counts[key] > 1:
+                    self._counts[key] -= 1
+                else:
+                    del self._counts[key]
+                examples = {"down": self._rejected, "up": self._approved}.get(previous)
+                if examples is not None and example in examples:
+                    examples.remove(example)
+            if feedback:
+                self._counts[(signal_type, feedback)] += 1
+                if feedback == "down":
+                    self._rejected.appendleft(example)
+                elif feedback == "up":
+                    self._approved.appendleft(example)
+            self.version += 1
+    
+    def summary(self) -> Dict[str, Any]:
+        """Feedback summary (same shape as get_feedback_summary) from memory."""
+        with self._lock:
+            type_counts = [
+                {"signal_type": signal_type, "feedback": feedback, "count": count}
+                for (signal_type, feedback), count in self._counts.items()
+            ]
+            return self._service._build_summary(type_counts, list(self._rejected), list(self._approved))
+    
+    def context(self, max_age: float = LEARNING_CONTEXT_TTL_SECONDS) -> str:
+        """Learning context text; loads on first use, refreshes in the background when stale."""
+        if self.built_at is None:
+            with self._lock:
+                if self.built_at is None:
+                    try:
+                        self.refresh()
+                    except Exception as e:
+                        logger.error(f"Failed to load signal learning context: {e}")
+                        self.built_at = time.monotonic()
+        elif time.monotonic() - self.built_at > max_age:
+            self.refresh_in_background()
+        
+        with self._lock:
+            if self._text_version != self.version:
+                self._text = self._service.generate_learning_context(self.summary())
+                self._text_version = self.version
+            return self._text
+    
+    def refresh_in_background(self) -> bool:
+        """Start a reload thread unless one is already running."""
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+        
+        def _run():
+            try:
+                if not self.refresh():
+                    with self._lock:
+                        self.built_at = time.monotonic()  # aggregates are current; retry after another TTL
+            except Exception as e:
+                logger.error(f"Background signal learning refresh failed: {e}")
+                with self._lock:
+                    self.built_at = time.monotonic()  # retry after another TTL
+            finally:
+                with self._lock:
+                    self._refreshing = False
+        
+        threading.Thread(target=_run, name="signal-learning-refresh", daemon=True).start()
+        return True
+
+
+_cache: Optional[LearningContextCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_learning_context_cache() -> LearningContextCache:
+    """Get the shared learning context cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LearningContextCache()
+        return _cache
+
+
+def signal_feedback_recorded(signal_type: Optional[str], signal_text: Optional[str], feedback: Optional[str],
+                             previous: Optional[str] = None):
+    """
+    Incremental hook for signal feedback writes. No-op until the cache is first used.
+    
+    Pass the row's feedback value from before the write as ``previous`` so a
+    toggled vote replaces it; ``feedback=None`` retracts ``previous`` (vote
+    cleared or deleted).
+    """
+    if _cache is None or _cache.built_at is None or not signal_type or feedback == previous:
+        return
+    _cache.record(signal_type, signal_text or "", feedback, previous)
+
+
+def reset_learning_context_cache():
+    """Drop the shared cache (next use reloads it)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -0,0 +1,401 @@
+# src/app/services/ticket_index.py
+"""
+Ticket Match Index - BM25 over the ticket backlog.
+
+In-memory inverted index over ticket titles, tags and descriptions used to
+match free text (grooming transcripts, action items, signals) to tickets:
+
+- tokenized, stop-worded postings with per-field weights (BM25F-style:
+  title > tags > description)
+- incremental upsert/remove when tickets are created, updated or deleted
+- exact ticket-key lookup (e.g. "PROJ-123" mentioned in a transcript)
+- optional blending with ticket embeddings (cosine similarity)
+
+Queries touch only the postings of the query's terms, so matching a full
+transcript against the full backlog takes milliseconds.
+
+Usage:
+    from .ticket_index import get_ticket_index
+
+    index = get_ticket_index()
+    matches = index.search(transcript, statuses=ACTIVE_STATUSES, limit=3)
+"""
+
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("todo", "in_progress", "in_review", "blocked")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Per-field term frequency weights
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.0, "description": 1.0}
+
+# Rebuild from the source of truth after this long (other devices/processes write tickets too)
+INDEX_TTL_SECONDS = 600
+
+# A BM25 score at this value maps to confidence 0.5
+CONFIDENCE_HALF_SCORE = 8.0
+
+# Long queries (whole transcripts) are pruned to their most informative terms
+MAX_QUERY_TERMS = 128
+
+STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further
+had has have having he her here hers him his how i if in into is it its itself just let me
+more most my no nor not now of off on once only or other our ours out over own same she
+should so some such than that the their theirs them then there these they this those through
+to too under until up us very was we were what when where which while who whom why will with
+would you your yours yeah okay ok like know think going gonna get got need want one thing
+things really right well yes
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-_][a-z0-9]+)*")
+_TICKET_KEY_RE = re.compile(r"\b([A-Z][A-Z0-9]+-\d+)\b")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-word characters and drop stop words/short tokens."""
+    tokens = []
+    for token in _TOKEN_RE.findall((text or "").lower()):
+        if len(token) < 3 or token in STOP_WORDS or token.isdigit():
+            continue
+        # Crude plural folding so "pipelines" matches "pipeline"
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def extract_ticket_keys(text: str) -> List[str]:
+    """Ticket keys like PROJ-123 mentioned in text."""
+    return _TICKET_KEY_RE.findall(text or "")
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    na = math.sqrt(sum(x * x for x in a))
+    nb = math.sqrt(sum(y * y for y in b))
+    return dot / (na * nb) if na and nb else 0.0
+
+
+def _doc_id(value: Any) -> Any:
+    """Normalize a ticket id; route paths pass SQLite row ids as strings."""
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+class TicketMatchIndex:
+    """Inverted BM25 index over tickets, updatable in place."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.docs: Dict[Any, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[Any, float]] = {}
+        self._lengths: Dict[Any, float] = {}
+        self._terms: Dict[Any, List[str]] = {}
+        self._keys: Dict[str, Any] = {}
+        self._embeddings: Dict[Any, List[float]] = {}
+        self._total_length = 0.0
+        self.built_at: Optional[float] = None
+
+    def __len__(self):
+        return len(self.docs)
+
+    # -------------------------
+    # Updates
+    # -------------------------
+
+    def build(self, tickets: Iterable[Dict[str, Any]]):
+        """Replace the index contents."""
+        with self._lock:
+            self.docs.clear()
+            self._postings.clear()
+            self._lengths.clear()
+            self._terms.clear()
+            self._keys.clear()
+            self._total_length = 0.0
+            for ticket in tickets:
+                self._add(ticket)
+            self.built_at = time.monotonic()
+
+    def upsert(self, ticket: Dict[str, Any]):
+        """
+        Add or re-index one ticket. Partial dicts are merged with the stored ticket.
+
+        A partial dict without ``id`` is matched to an indexed ticket by its
+        ``ticket_id`` key (for updates addressed by key, e.g. "PROJ-12").
+        """
+        with self._lock:
+            doc_id = _doc_id(ticket.get("id"))
+            if doc_id is None:
+                doc_id = self._keys.get((ticket.get("ticket_id") or "").upper())
+                if doc_id is None:
+                    return
+            merged = {**self.docs.get(doc_id, {}), **ticket, "id": doc_id}
+            self._remove(doc_id)
+            self._add(merged)
+
+    def remove(self, doc_id: Any):
+        doc_id = _doc_id(doc_id)
+        with self._lock:
+            self._remove(doc_id)
+            self._embeddings.pop(doc_id, None)
+
+    def set_embedding(self, doc_id: Any, vector: List[float]):
+        with self._lock:
+            if vector:
+                self._embeddings[doc_id] = vector
+
+    def _add(self, ticket: Dict[str, Any]):
+        doc_id = ticket.get("id")
+        if doc_id is None:
+            return
+        weighted: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(str(ticket.get(field) or "")):
+                weighted[token] += weight
+        length = sum(weighted.values())
+
+        self.docs[doc_id] = ticket
+        self._lengths[doc_id] = length
+        self._terms[doc_id] = list(weighted)
+        self._total_length += length
+        for term, tf in weighted.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        key = (ticket.get("ticket_id") or "").upper()
+        if key:
+            self._keys[key] = doc_id
+
+    def _remove(self, doc_id: Any):
+        if doc_id not in self.docs:
+            return
+        for term in self._terms.pop(doc_id, []):
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self._postings[term]
+        self._total_length -= self._lengths.pop(doc_id, 0.0)
+        key = (self.docs[doc_id].get("ticket_id") or "").upper()
+        if self._keys.get(key) == doc_id:
+            del self._keys[key]
+        del self.docs[doc_id]
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def find_by_keys(self, text: str, statuses: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Tickets whose key (e.g. PROJ-123) appears in the text."""
+        allowed = set(statuses) if statuses else None
+        found = []
+        with self._lock:
+            for key in dict.fromkeys(k.upper() for k in extract_ticket_keys(text)):
+                doc_id = self._keys.get(key)
+                if doc_id is None:
+                    continue
+                ticket = self.docs[doc_id]
+                if allowed is None or ticket.get("status") in allowed:
+                    found.append(ticket)
+        return found
+
+    def search(
+        self,
+        text: str,
+        limit: int = 5,
+        statuses: Optional[Iterable[str]] = None,
+        min_matched_terms: int = 1,
+        query_embedding: Optional[List[float]] = None,
+        embedding_weight: float = 0.0,
+        exclude_ids: Optional[Iterable[Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank tickets against free text.
+
+        Args:
+            text: Query text (a title, an action item or a whole transcript)
+            limit: Max results
+            statuses: Only return tickets in these statuses
+            min_matched_terms: Require at least this many distinct query terms in a ticket
+            query_embedding: Embedding of ``text`` for blending
+            embedding_weight: 0..1 share of the score taken from cosine similarity
+
+        Returns:
+            List of {"ticket", "bm25", "confidence", "matched_terms"} sorted by confidence
+        """
+        query_terms = Counter(tokenize(text))
+        if not query_terms:
+            return []
+        allowed = set(statuses) if statuses else None
+        excluded = set(exclude_ids or ())
+
+        with self._lock:
+            n_docs = len(self.docs)
+            if not n_docs:
+                return []
+            avg_len = self._total_length / n_docs or 1.0
+
+            weighted_terms = []
+            for term, qtf in query_terms.items():
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                df = len(posting)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                # Repeated query terms count, but sublinearly (long transcripts repeat a lot)
+                q_weight = 1 + math.log(qtf)
+                weighted_terms.append((q_weight * idf, posting))
+            if len(weighted_terms) > MAX_QUERY_TERMS:
+                weighted_terms = sorted(weighted_terms, key=lambda t: t[0], reverse=True)[:MAX_QUERY_TERMS]
+
+            scores: Dict[Any, float] = {}
+            matched: Dict[Any, int] = {}
+            for term_weight, posting in weighted_terms:
+                for doc_id, tf in posting.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[doc_id] / avg_len)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + term_weight * tf * (BM25_K1 + 1) / (tf + norm)
+                    matched[doc_id] = matched.get(doc_id, 0) + 1
+
+            results = []
+            for doc_id, bm25 in scores.items():
+                if matched[doc_id] < min_matched_terms or doc_id in excluded:
+                    continue
+                ticket = self.docs[doc_id]
+                if allowed is not None and ticket.get("status") not in allowed:
+                    continue
+                confidence = bm25 / (bm25 + CONFIDENCE_HALF_SCORE)
+                if query_embedding is not None and embedding_weight > 0 and doc_id in self._embeddings:
+                    similarity = max(0.0, _cosine(query_embedding, self._embeddings[doc_id]))
+                    confidence = (1 - embedding_weight) * confidence + embedding_weight * similarity
+                results.append({
+                    "ticket": ticket,
+                    "bm25": round(bm25, 3),
+                    "confidence": round(confidence, 3),
+                    "matched_terms": matched[doc_id],
+                })
+
+        results.sort(key=lambda r: r["confidence"], reverse=True)
+        return results[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tickets": len(self.docs),
+                "terms": len(self._postings),
+                "embeddings": len(self._embeddings),
+                "age_seconds": round(time.monotonic() - self.built_at, 1) if self.built_at else None,
+            }
+
+
+# -------------------------
+# Process-wide index
+# -------------------------
+
+_index: Optional[TicketMatchIndex] = None
+_index_lock = threading.Lock()
+
+
+def _load_tickets() -> List[Dict[str, Any]]:
+    """All tickets from Supabase, falling back to SQLite."""
+    from . import tickets_supabase
+
+    tickets = tickets_supabase.get_all_tickets_paged()
+    if tickets:
+        return tickets
+
+    from ..db import connect
+    with connect() as conn:
+        rows = conn.execute(
+            "SELECT id, ticket_id, title, description, status, priority, tags FROM tickets"
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def _attach_stored_embeddings(index: TicketMatchIndex):
+    """Attach locally stored ticket embeddings (for optional score blending)."""
+    try:
+        from ..memory.embed import EMBED_MODEL
+        from ..memory.vector_store import fetch_all_embeddings
+
+        for ref_id, vector in fetch_all_embeddings("ticket", EMBED_MODEL):
+            if ref_id in index.docs:
+                index.set_embedding(ref_id, vector)
+    except Exception as e:
+        logger.debug(f"No stored ticket embeddings attached: {e}")
+
+
+def get_ticket_index(max_age: float = INDEX_TTL_SECONDS) -> TicketMatchIndex:
+    """Get the shared index, (re)building it if missing or older than ``max_age``."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = TicketMatchIndex()
+        if _index.built_at is None or time.monotonic() - _index.built_at > max_age:
+            try:
+                _index.build(_load_tickets())
+                _attach_stored_embeddings(_index)
+            except Exception as e:
+                logger.error(f"Failed to build ticket match index: {e}")
+                if _index.built_at is None:
+                    _index.built_at = time.monotonic()
+        return _index
+
+
+def index_ticket_changed(ticket: Dict[str, Any]):
+    """Incremental hook for ticket create/update. No-op until the index is first used."""
+    if _index is not None and _index.built_at is not None:
+        _index.upsert(ticket)
+
+
+def index_ticket_deleted(doc_id: Any):
+    """Incremental hook for ticket deletion."""
+    if _index is not None and _index.built_at is not None:
+        _index.remove(doc_id)
+
+
+def reset_ticket_index():
+    """Drop the shared index (next use rebuilds it)."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def find_similar_tickets(
+    text: str,
+    limit: int = 5,
+    min_confidence: float = 0.0,
+    statuses: Optional[Iterable[str]] = None,
+    min_matched_terms: int = 2,
+) -> List[Dict[str, Any]]:
+    """
+    Tickets similar to ``text`` as flat dicts, for API responses.
+
+    Used for action-item -> ticket suggestions and duplicate checks before
+    converting a signal into a new ticket.
+    """
+    results = get_ticket_index().search(
+        text, limit=limit, statuses=statuses, min_matched_terms=min_matched_terms
+    )
+    return [
+        {
+            "id": r["ticket"].get("id"),
+            "ticket_id": r["ticket"].get("ticket_id"),
+            "title": r["ticket"].get("title") or "",
+            "status": r["ticket"].get("status") or "",
+            "confidence": r["confidence"],
+        }
+        for r in results
+        if r["confidence"] >= min_confidence
+    ]
@@ -10,6 +10,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from .ticket_index import index_ticket_changed, index_ticket_deleted
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +41,33 @@ def get_all_tickets(limit: int = 100) -> List[Dict[str, Any]]:
         return []
 
 
+def get_all_tickets_paged(page_size: int = 1000) -> List[Dict[str, Any]]:
+    """
+    Get every ticket from Supabase, paging past the 1000-row response cap.
+    
+    Used to build the ticket match index over the full backlog.
+    """
+    client = get_supabase_client()
+    if not client:
+        return []
+    
+    tickets = []
+    try:
+        offset = 0
+        while True:
+            result = client.table("tickets").select("*").order("id").range(
+                offset, offset + page_size - 1
+            ).execute()
+            rows = result.data or []
+            tickets.extend(_format_ticket(row) for row in rows)
+            if len(rows) < page_size:
+                return tickets
+            offset += page_size
+    except Exception as e:
+        logger.error(f"Failed to page tickets from Supabase: {e}")
+        return tickets
+
+
 def _format_ticket(row: Dict) -> Dict[str, Any]:
     """Format a Supabase ticket row to match expected format."""
     # Handle tags - Supabase stores as array, template expects comma-separated string
@@ -381,7 +410,9 @@ def create_ticket(
         result = client.table("tickets").insert(data).execute()
         
         if result.data:
-            return _format_ticket(result.data[0])
+            ticket = _format_ticket(result.data[0])
+            index_ticket_changed(ticket)
+            return ticket
         return None
     except Exception as e:
         logger.error(f"Failed to create ticket: {e}")
@@ -400,6 +431,7 @@ def update_ticket(ticket_id: str, updates: Dict[str, Any]) -> bool:
         # Add updated_at timestamp
         updates["updated_at"] = datetime.now().isoformat()
         client.table("tickets").update(updates).eq("id", ticket_id).execute()
+        index_ticket_changed({"id": ticket_id, **updates})
         return True
     except Exception as e:
         logger.error(f"Failed to update ticket {ticket_id}: {e}")
@@ -416,6 +448,7 @@ def delete_ticket(ticket_id: str) -> bool:
     
     try:
         client.table("tickets").delete().eq("id", ticket_id).execute()
+        index_ticket_deleted(ticket_id)
         return True
     except Exception as e:
         logger.error(f"Failed to delete ticket {ticket_id}: {e}")
@@ -0,0 +1,259 @@
+"""
+Chunked Transcript Processing (map-reduce)
+
+Long Teams/Pocket transcripts (50-150 KB) don't fit a single extraction
+prompt. This module splits them into overlapping, speaker-turn-aligned
+chunks, runs an extractor over every chunk concurrently, and merges the
+per-chunk results deterministically:
+
+- split_transcript(): chunks never cut a speaker turn in half unless the
+  turn alone is larger than a chunk; the last turns of each chunk are
+  repeated at the start of the next so signals on a boundary are seen whole
+- map_chunks() / map_chunks_threaded(): per-chunk extraction with a
+  concurrency cap, so total latency is ~one chunk's latency per wave
+- reduce_signals(): merges signal lists in transcript order, drops
+  duplicates and near-duplicates (mostly from the overlap) and records the
+  source offsets of every kept signal
+
+Usage:
+    chunks = split_transcript(transcript)
+    results = await map_chunks(chunks, extract_one)
+    merged = reduce_signals(chunks, results)
+    merged["signals"]["decisions"], merged["sources"]["decisions"][0]["start"]
+"""
+
+import asyncio
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHUNK_CHARS = int(os.getenv("TRANSCRIPT_CHUNK_CHARS", "6000"))
+CHUNK_OVERLAP_CHARS = int(os.getenv("TRANSCRIPT_CHUNK_OVERLAP_CHARS", "600"))
+MAX_CONCURRENCY = int(os.getenv("TRANSCRIPT_CHUNK_CONCURRENCY", "6"))
+
+SIGNAL_KEYS = ("decisions", "action_items", "blockers", "risks", "ideas", "key_signals")
+
+# "Alice:", "SPEAKER_01:", "[00:12:03] Alice Smith:", "00:12 Bob -", "**Alice:**"
+_TURN_START = re.compile(
+    r"^\s*(?:\[?\(?\d{1,2}:\d{2}(?::\d{2})?(?:\.\d+)?\)?\]?\s*)?"
+    r"\**[A-Z][\w.'()-]*(?: [\w.'()-]+){0,4}\**\s*(?::|\s-\s)"
+)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_NORMALIZE = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class TranscriptChunk:
+    """A contiguous slice ``text[start:end]`` of the original transcript."""
+    index: int
+    start: int
+    end: int
+    text: str
+
+
+def _turns(text: str) -> List[Tuple[int, int]]:
+    """(start, end) offsets of speaker turns; blank lines also end a turn."""
+    turns: List[Tuple[int, int]] = []
+    turn_start = None
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        line_start, offset = offset, offset + len(line)
+        if not line.strip():
+            if turn_start is not None:
+                turns.append((turn_start, line_start))
+                turn_start = None
+            continue
+        if turn_start is None:
+            turn_start = line_start
+        elif _TURN_START.match(line):
+            turns.append((turn_start, line_start))
+            turn_start = line_start
+    if turn_start is not None:
+        turns.append((turn_start, len(text)))
+    return turns
+
+
+def _split_long_turn(text: str, start: int, end: int, max_chars: int) -> List[Tuple[int, int]]:
+    """Break one oversized turn at sentence boundaries (hard cut as a last resort)."""
+    pieces = []
+    piece_start = start
+    last_break = None
+    for match in _SENTENCE_END.finditer(text, start, end):
+        if match.end() - piece_start > max_chars and last_break:
+            pieces.append((piece_start, last_break))
+            piece_start = last_break
+        last_break = match.end()
+    while end - piece_start > max_chars:
+        cut = last_break if last_break and piece_start < last_break < piece_start + max_chars else piece_start + max_chars
+        pieces.append((piece_start, cut))
+        piece_start = cut
+    pieces.append((piece_start, end))
+    return pieces
+
+
+def split_transcript(
+    text: str,
+    max_chars: int = None,
+    overlap_chars: int = None,
+) -> List[TranscriptChunk]:
+    """
+    Split a transcript into speaker-turn-aligned chunks of at most ``max_chars``.
+
+    Consecutive chunks share up to ``overlap_chars`` of whole trailing turns.
+    Text that fits in one chunk is returned as a single chunk.
+    """
+    max_chars = max_chars or CHUNK_CHARS
+    overlap_chars = CHUNK_OVERLAP_CHARS if overlap_chars is None else overlap_chars
+    text = text or ""
+    if not text.strip():
+        return []
+    if len(text) <= max_chars:
+        return [TranscriptChunk(0, 0, len(text), text)]
+
+    units: List[Tuple[int, int]] = []
+    for start, end in _turns(text):
+        if end - start > max_chars:
+            units.extend(_split_long_turn(text, start, end, max_chars))
+        else:
+            units.append((start, end))
+
+    chunks: List[TranscriptChunk] = []
+    current: List[Tuple[int, int]] = []
+    new_units = 0  # units in ``current`` not carried over from the previous chunk
+
+    def flush():
+        start, end = current[0][0], current[-1][1]
+        chunks.append(TranscriptChunk(len(chunks), start, end, text[start:end]))
+
+    for unit in units:
+        if current and unit[1] - current[0][0] > max_chars and new_units:
+            flush()
+            carried: List[Tuple[int, int]] = []
+            for prev in reversed(current):
+                if current[-1][1] - prev[0] > overlap_chars or unit[1] - prev[0] > max_chars:
+                    break
+                carried.insert(0, prev)
+            current, new_units = carried, 0
+        current.append(unit)
+        new_units += 1
+
+    if current and new_units:
+        flush()
+    return chunks
+
+
+async def map_chunks(
+    chunks: Sequence[TranscriptChunk],
+    extract: Callable[[TranscriptChunk], Awaitable[Any]],
+    max_concurrency: int = None,
+) -> List[Any]:
+    """
+    Run ``extract`` over every chunk with at most ``max_concurrency`` in flight.
+
+    Results come back in chunk order. A chunk whose extractor raises yields
+    the exception object instead, so one failure doesn't lose the others.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or MAX_CONCURRENCY)
+
+    async def run(chunk):
+        async with semaphore:
+            return await extract(chunk)
+
+    return await asyncio.gather(*(run(chunk) for chunk in chunks), return_exceptions=True)
+
+
+def map_chunks_threaded(
+    chunks: Sequence[TranscriptChunk],
+    extract: Callable[[TranscriptChunk], Any],
+    max_concurrency: int = None,
+) -> List[Any]:
+    """Blocking counterpart of :func:`map_chunks` for sync extractors (thread pool)."""
+    if len(chunks) <= 1:
+        return [_call_or_error(extract, chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=min(max_concurrency or MAX_CONCURRENCY, len(chunks))) as pool:
+        return list(pool.map(lambda chunk: _call_or_error(extract, chunk), chunks))
+
+
+def _call_or_error(extract, chunk):
+    try:
+        return extract(chunk)
+    except Exception as e:
+        return e
+
+
+def _normalize(item: str) -> str:
+    return _NORMALIZE.sub(" ", item.lower()).strip()
+
+
+def _locate(item: str, chunk: TranscriptChunk) -> Tuple[int, int]:
+    """Best-effort offsets of ``item`` in the original transcript (the chunk span if paraphrased)."""
+    position = chunk.text.lower().find(item.lower().strip())
+    if position >= 0:
+        return chunk.start + position, chunk.start + position + len(item.strip())
+    return chunk.start, chunk.end
+
+
+def reduce_signals(
+    chunks: Sequence[TranscriptChunk],
+    results: Sequence[Any],
+    keys: Sequence[str] = SIGNAL_KEYS,
+) -> Dict[str, Any]:
+    """
+    Merge per-chunk signal dicts into one, in transcript order.
+
+    Items are compared after lowercasing and stripping punctuation; an item
+    whose normalized text contains (or is contained in) an already kept item
+    of the same type is treated as the same signal and the longer wording
+    wins. Failed chunks (exceptions or non-dicts) are skipped and counted.
+
+    Returns:
+        Dict with "signals" (type -> list of text), "sources" (type -> list of
+        {"text", "chunk", "start", "end"}), "chunks" and "failed_chunks"
+    """
+    kept: Dict[str, List[Dict[str, Any]]] = {key: [] for key in keys}
+    failed = 0
+
+    for chunk, result in zip(chunks, results):
+        if not isinstance(result, dict):
+            failed += 1
+            if isinstance(result, BaseException):
+                logger.warning(f"Chunk {chunk.index} extraction failed: {result}")
+            continue
+        for key in keys:
+            for item in result.get(key) or []:
+                if not isinstance(item, str) or not item.strip():
+                    continue
+                normalized = _normalize(item)
+                if not normalized:
+                    continue
+                existing = next(
+                    (
+                        entry for entry in kept[key]
+                        if normalized == entry["_norm"] or normalized in entry["_norm"] or entry["_norm"] in normalized
+                    ),
+                    None,
+                )
+                if existing is None:
+                    start, end = _locate(item, chunk)
+                    kept[key].append({
+                        "text": item.strip(), "chunk": chunk.index, "start": start, "end": end, "_norm": normalized,
+                    })
+                elif len(normalized) > len(existing["_norm"]):
+                    start, end = _locate(item, chunk)
+                    existing.update(text=item.strip(), _norm=normalized, start=start, end=end, chunk=chunk.index)
+
+    sources = {
+        key: [{k: v for k, v in entry.items() if k != "_norm"} for entry in entries]
+        for key, entries in kept.items()
+    }
+    return {
+        "signals": {key: [entry["text"] for entry in entries] for key, entries in sources.items()},
+        "sources": sources,
+        "chunks": len(chunks),
+        "failed_chunks": failed,
+    }
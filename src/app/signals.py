@@ -14,8 +14,11 @@ from fastapi import APIRouter, Request, Query
 from fastapi.responses import JSONResponse
 from fastapi.templating import Jinja2Templates
 from datetime import datetime, timedelta
+from typing import Optional
 import json
 from .db import connect
+from .pagination import Page, decode_cursor, encode_cursor, page_size
+from .template_streaming import render_page
 # llm.ask removed - signal extraction uses MeetingAnalyzerAgent (Checkpoint 2.4)
 
 # Import from new MeetingAnalyzer agent (Checkpoint 2.4)
@@ -43,6 +46,20 @@ DATE_PRESETS = {
 
 def get_signals_by_type(signal_type: str, days: int = None, limit: int = 100):
     """Get all signals of a specific type across meetings."""
+    page, total = get_signals_page(signal_type, days=days, limit=limit)
+    return page.items, total
+
+
+def get_signals_page(signal_type: str, days: int = None, cursor: str = None, limit: int = 100):
+    """
+    One page of signals of a type, grouped by meeting, newest meetings first.
+    
+    Pages hold up to ``limit`` meetings and seek on (meeting date, id), so
+    "load more" costs the same on the last page as on the first.
+    
+    Returns:
+        (Page of meeting groups, number of signals on the page)
+    """
     type_map = {
         "decisions": "decision",
         "action_items": "action",
@@ -60,20 +77,31 @@ def get_signals_by_type(signal_type: str, days: int = None, limit: int = 100):
         date_filter = "AND (meeting_date >= ? OR (meeting_date IS NULL AND created_at >= ?))"
         params = [cutoff_date, cutoff_date]
     
-    params.append(limit)
+    position = decode_cursor(cursor)
+    if "k" in position and "id" in position:
+        date_filter += " AND (COALESCE(meeting_date, created_at) < ? OR (COALESCE(meeting_date, created_at) = ? AND id < ?))"
+        params += [position["k"], position["k"], position["id"]]
+    
+    params.append(limit + 1)
     
     with connect() as conn:
         meetings = conn.execute(
             f"""
-            SELECT id, meeting_name, meeting_date, signals_json
+            SELECT id, meeting_name, meeting_date, signals_json,
+                   COALESCE(meeting_date, created_at) AS sort_key
             FROM meeting_summaries
             WHERE signals_json IS NOT NULL AND signals_json != '{{}}'
             {date_filter}
-            ORDER BY COALESCE(meeting_date, created_at) DESC
+            ORDER BY COALESCE(meeting_date, created_at) DESC, id DESC
             LIMIT ?
             """,
             tuple(params)
         ).fetchall()
+        
+        next_cursor = None
+        if len(meetings) > limit:
+            meetings = meetings[:limit]
+            next_cursor = encode_cursor({"k": meetings[-1]["sort_key"], "id": meetings[-1]["id"]})
 
         meeting_ids = [m["id"] for m in meetings]
         status_map = {}
@@ -166,54 +194,75 @@ def get_signals_by_type(signal_type: str, days: int = None, limit: int = 100):
                 })
                 total_signals += len(items)
     
-    return results, total_signals
+    return Page(items=results, next_cursor=next_cursor), total_signals
 
 
-def signals_response(request: Request, signal_type: str, days: str = "all"):
+def signals_response(
+    request: Request,
+    signal_type: str,
+    days: str = "all",
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    partial: bool = False,
+):
     """Common response builder for all signal endpoints."""
     days_int = DATE_PRESETS.get(days)
-    meetings, total = get_signals_by_type(signal_type, days=days_int)
-    return templates.TemplateResponse(
+    limit = page_size(limit)
+    page, total = get_signals_page(signal_type, days=days_int, cursor=cursor, limit=limit)
+    # Meetings without signals of this type yield empty pages; skip past them
+    while not page.items and page.has_more:
+        page, total = get_signals_page(signal_type, days=days_int, cursor=page.next_cursor, limit=limit)
+    return render_page(
+        templates,
         "signals.html",
         {
             "request": request,
             "signal_type": signal_type,
-            "meetings": meetings,
+            "meetings": page.items,
             "total_signals": total,
             "selected_days": days,
+            "next_cursor": page.next_cursor,
         },
+        block="signal_cards" if partial else None,
+        headers=page.headers() if partial else None,
     )
 
 
 @router.get("/signals")
 @router.get("/signals/all")
-def signals_all(request: Request, days: str = Query(default="all")):
-    return signals_response(request, "all", days)
+def signals_all(request: Request, days: str = Query(default="all"), cursor: Optional[str] = None,
+                limit: int = 100, partial: bool = False):
+    return signals_response(request, "all", days, cursor, limit, partial)
 
 
 @router.get("/signals/decisions")
-def signals_decisions(request: Request, days: str = Query(default="all")):
-    return signals_response(request, "decisions", days)
+def signals_decisions(request: Request, days: str = Query(default="all"), cursor: Optional[str] = None,
+                      limit: int = 100, partial: bool = False):
+    return signals_response(request, "decisions", days, cursor, limit, partial)
 
 
 @router.get("/signals/action_items")
-def signals_action_items(request: Request, days: str = Query(default="all")):
-    return signals_response(request, "action_items", days)
+def signals_action_items(request: Request, days: str = Query(default="all"), cursor: Optional[str] = None,
+                         limit: int = 100, partial: bool = False):
+    return signals_response(request, "action_items", days, cursor, limit, partial)
 
 
 @router.get("/signals/blockers")
-def signals_blockers(request: Request, days: str = Query(default="all")):
-    return signals_response(request, "blockers", days)
+def signals_blockers(request: Request, days: str = Query(default="all"), cursor: Optional[str] = None,
+                     limit: int = 100, partial: bool = False):
+    return signals_response(request, "blockers", days, cursor, limit, partial)
 
 
 @router.get("/signals/risks")
-def signals_risks(request: Request, days: str = Query(default="all")):
-    return signals_response(request, "risks", days)
+def signals_risks(request: Request, days: str = Query(default="all"), cursor: Optional[str] = None,
+                  limit: int = 100, partial: bool = False):
+    return signals_response(request, "risks", days, cursor, limit, partial)
 
 
 @router.get("/signals/ideas")
-def signals_ideas(request: Request, days: str = Query(default="all")):
-    return signals_response(request, "ideas", days)
+def signals_ideas(request: Request, days: str = Query(default="all"), cursor: Optional[str] = None,
+                  limit: int = 100, partial: bool = False):
+    return signals_response(request, "ideas", days, cursor, limit, partial)
 
 
 @router.post("/api/signals/extract-from-document")
@@ -243,9 +292,7 @@ async def extract_signals_from_document(request: Request):
         content = doc["content"]
         source = doc["source"]
         
-        # Truncate if too long
-        if len(content) > 15000:
-            content = content[:15000] + "\n\n[... truncated for processing ...]"
+        # Long transcripts are chunked inside the agent, so no truncation here
         
         try:
             # Use MeetingAnalyzerAgent for signal extraction
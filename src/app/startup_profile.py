@@ -0,0 +1,201 @@
+# src/app/startup_profile.py
+"""
+Startup profiling and readiness state.
+
+Set ``STARTUP_PROFILE=1`` to time every module imported while the app loads
+(self and cumulative time, like ``python -X importtime``) and each startup
+phase. The report is logged once startup finishes and is available from
+``GET /api/admin/startup``.
+
+Readiness is tracked separately from liveness:
+    serving - startup() finished; the app answers requests
+    warm    - background warmup finished; heavy modules are imported
+"""
+
+import importlib.abc
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "").lower() in ("1", "true", "yes")
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a loader so exec_module is timed."""
+
+    def __init__(self, loader, profiler: "ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Meta path finder that records per-module import time."""
+
+    def __init__(self):
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self._local = threading.local()
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._local.finding = False
+
+    def _stack(self) -> List[list]:
+        # Imports nest per thread; the warmup thread imports alongside the main one
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _enter(self, name: str):
+        # [name, start, time spent in nested imports]
+        self._stack().append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name: str):
+        stack = self._stack()
+        _, start, nested = stack.pop()
+        cumulative = time.perf_counter() - start
+        if stack:
+            stack[-1][2] += cumulative
+        self.timings[name] = {
+            "self_ms": round((cumulative - nested) * 1000, 2),
+            "cumulative_ms": round(cumulative * 1000, 2),
+        }
+
+    def top(self, limit: int = 25, key: str = "cumulative_ms") -> List[dict]:
+        ranked = sorted(self.timings.items(), key=lambda kv: kv[1][key], reverse=True)
+        return [{"module": name, **t} for name, t in ranked[:limit]]
+
+
+class StartupState:
+    """Startup phase timings plus serving/warm readiness flags."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.serving = False
+        self.warm = False
+        self.warmup_errors: Dict[str, str] = {}
+        self.profiler: Optional[ImportProfiler] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    def mark_serving(self):
+        self.serving = True
+        self.phases["time_to_serving"] = round((time.perf_counter() - self.started_at) * 1000, 2)
+
+    def warm_up(
+        self,
+        modules: List[str],
+        package: Optional[str] = None,
+        background: bool = True,
+        tasks: Optional[List[Callable[[], Any]]] = None,
+    ):
+        """Import heavy modules ahead of the first request that needs them.
+
+        Relative names (".llm") are resolved against ``package``. ``tasks``
+        are run after the imports (e.g. precompiling prompt templates).
+        """
+        def _run():
+            import importlib
+
+            with self.phase("warmup"):
+                for name in modules:
+                    try:
+                        importlib.import_module(name, package)
+                    except Exception as e:
+                        # Optional dependency missing; the feature fails on use as before
+                        self.warmup_errors[name] = str(e)
+                for task in tasks or []:
+                    try:
+                        task()
+                    except Exception as e:
+                        self.warmup_errors[getattr(task, "__name__", repr(task))] = str(e)
+            self.warm = True
+            if self.profiler is not None:
+                self.log_report()
+
+        if background:
+            threading.Thread(target=_run, name="startup-warmup", daemon=True).start()
+        else:
+            _run()
+
+    def readiness(self) -> dict:
+        if self.warm:
+            status = "warm"
+        elif self.serving:
+            status = "serving"
+        else:
+            status = "starting"
+        return {"status": status, "serving": self.serving, "warm": self.warm}
+
+    def report(self, limit: int = 25) -> dict:
+        result = {
+            **self.readiness(),
+            "phases_ms": dict(self.phases),
+            "warmup_errors": dict(self.warmup_errors),
+            "import_profile_enabled": self.profiler is not None,
+        }
+        if self.profiler is not None:
+            result["slowest_imports"] = self.profiler.top(limit)
+        return result
+
+    def log_report(self, limit: int = 15):
+        logger.info("Startup phases (ms): %s", self.phases)
+        if self.profiler is not None:
+            for entry in self.profiler.top(limit):
+                logger.info(
+                    "import %-50s self=%8.1fms cumulative=%8.1fms",
+                    entry["module"], entry["self_ms"], entry["cumulative_ms"]
+                )
+
+
+startup_state = StartupState()
+
+if STARTUP_PROFILE:
+    startup_state.profiler = ImportProfiler()
+    startup_state.profiler.install()
@@ -16,6 +16,7 @@ from typing import Dict, List, Optional
 import httpx
 
 from .db import connect, table_exists
+from .db_blobs import put_text
 
 logger = logging.getLogger(__name__)
 
@@ -143,7 +144,7 @@ def sync_meetings_from_supabase() -> int:
                     meeting.get("synthesized_notes", ""),
                     meeting.get("meeting_date"),
                     signals_json,
-                    meeting.get("raw_text"),
+                    put_text(conn, meeting.get("raw_text")),
                     meeting.get("created_at"),
                 ))
                 synced += 1
@@ -0,0 +1,109 @@
+"""
+Streaming HTML page rendering
+
+``Jinja2Templates.TemplateResponse`` renders the whole page into one string
+before the first byte is sent. Heavy list pages (meetings, signals, action
+items, search) hold every row of that page twice in memory and the browser
+sees nothing until the last row is rendered. render_page() instead drives
+Jinja's ``Template.generate()`` and sends the output as a chunked
+response, so the page head and first rows go out while the rest renders.
+
+- render_page(): full page, or a single ``{% block %}`` for "load more"
+  requests; streamed when STREAM_TEMPLATES is on
+- The first chunk is rendered before the response starts, so errors in the
+  page head still produce a normal 500 instead of a truncated page
+
+Environment Variables:
+- STREAM_TEMPLATES: true/false (default: true)
+- STREAM_CHUNK_BYTES: minimum bytes per chunk sent (default: 16384)
+
+Usage:
+    from .template_streaming import render_page
+
+    return render_page(templates, "list_meetings.html", {"request": request, "meetings": page.items},
+                       block="meeting_rows" if partial else None)
+"""
+
+import itertools
+import logging
+import os
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.templating import Jinja2Templates
+
+logger = logging.getLogger(__name__)
+
+STREAM_TEMPLATES = os.getenv("STREAM_TEMPLATES", "true").lower() in ("1", "true", "yes")
+STREAM_CHUNK_BYTES = int(os.getenv("STREAM_CHUNK_BYTES", "16384"))
+
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+
+
+def _chunked(pieces: Iterable[str], min_bytes: int) -> Iterator[bytes]:
+    """Coalesce Jinja's many small string events into chunks of at least ``min_bytes``."""
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= min_bytes:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def _logged(chunks: Iterator[bytes], name: str) -> Iterator[bytes]:
+    try:
+        yield from chunks
+    except Exception:
+        # Headers are already sent; all we can do is log and cut the response
+        logger.exception(f"Streaming render of {name} failed mid-response")
+        raise
+
+
+def render_page(
+    templates: Jinja2Templates,
+    name: str,
+    context: Dict[str, Any],
+    block: Optional[str] = None,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+    stream: Optional[bool] = None,
+):
+    """
+    Render a template (or one of its blocks) as an HTML response.
+
+    Args:
+        templates: The router's Jinja2Templates
+        name: Template name
+        context: Template context; must include ``request``
+        block: Render only this block (partial "load more" responses)
+        status_code: Response status
+        headers: Extra response headers
+        stream: Override STREAM_TEMPLATES for this response
+    """
+    request = context["request"]
+    for processor in templates.context_processors:
+        context.update(processor(request))
+
+    template = templates.get_template(name)
+    if block is None:
+        pieces = template.generate(context)
+    else:
+        pieces = template.blocks[block](template.new_context(context))
+
+    stream = STREAM_TEMPLATES if stream is None else stream
+    if not stream:
+        return HTMLResponse("".join(pieces), status_code=status_code, headers=headers)
+
+    chunks = _chunked(pieces, STREAM_CHUNK_BYTES)
+    first = next(chunks, b"")
+    return StreamingResponse(
+        _logged(itertools.chain((first,), chunks), name),
+        status_code=status_code,
+        headers=headers,
+        media_type=HTML_MEDIA_TYPE,
+    )
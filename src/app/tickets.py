@@ -26,6 +26,8 @@ import uuid
 
 from .db import connect
 from .services import tickets_supabase  # Supabase-first reads
+from .services.code_locker_store import CodeLockerStore
+from .services.ticket_index import index_ticket_changed, index_ticket_deleted
 # llm.ask removed - AI features now use TicketAgent adapters (Checkpoint 2.7)
 from .memory.embed import embed_text, EMBED_MODEL
 from .memory.vector_store import upsert_embedding
@@ -196,10 +198,10 @@ def create_ticket(
                         
                         # If update file with base content, also add to code locker
                         if file_type == 'update' and base_content:
-                            conn.execute("""
-                                INSERT INTO code_locker (ticket_id, filename, content, version, notes, is_initial)
-                                VALUES (?, ?, ?, 1, 'Initial/baseline version from ticket', 1)
-                            """, (new_id, filename, base_content))
+                            CodeLockerStore.insert_version(
+                                conn, filename, base_content, new_id, 1,
+                                'Initial/baseline version from ticket', is_initial=True
+                            )
             except json.JSONDecodeError:
                 pass  # Invalid JSON, ignore
     
@@ -207,6 +209,10 @@ def create_ticket(
     text_for_embedding = f"{ticket_id} {title}\n{description or ''}"
     vector = embed_text(text_for_embedding)
     upsert_embedding("ticket", new_id, EMBED_MODEL, vector)
+    index_ticket_changed({
+        "id": new_id, "ticket_id": ticket_id.strip(), "title": title, "description": description,
+        "status": status, "priority": priority, "tags": tags,
+    })
     
     return RedirectResponse(url=f"/tickets/{new_id}", status_code=303)
 
@@ -303,6 +309,10 @@ def update_ticket(
             (ticket_id, title, description, status, priority, sprint_points, in_sprint, requires_deployment, tags, 
              ai_summary, implementation_plan, task_decomposition, test_plan, ticket_pk),
         )
+    index_ticket_changed({
+        "id": ticket_pk, "ticket_id": ticket_id, "title": title, "description": description,
+        "status": status, "priority": priority, "tags": tags,
+    })
     
     # Update embedding
     text_for_embedding = f"{ticket_id} {title}\n{description or ''}\n{ai_summary or ''}\n{implementation_plan or ''}"
@@ -329,6 +339,7 @@ def delete_ticket(ticket_pk: str):
             "DELETE FROM attachments WHERE ref_type = 'ticket' AND ref_id = ?",
             (ticket_pk,)
         )
+    index_ticket_deleted(ticket_pk)
     return RedirectResponse(url="/tickets?success=deleted", status_code=303)
 
 
@@ -0,0 +1,267 @@
+"""
+Token counting and context budgeting for LLM prompts
+
+Prompts used to be capped with character slices (``notes[:1000]``,
+``context_parts[:10]``), which cut important content just as readily as
+filler and said nothing about the real token cost. This module counts
+tokens with the model's tokenizer and packs context blocks into a token
+budget by priority:
+
+- count_tokens(): tiktoken when installed (encoders are cached per
+  encoding), otherwise the ~4 chars/token heuristic
+- prompt_budget(): tokens left for a prompt given the model's context
+  window, the completion reserve and the PROMPT_CONTEXT_TOKENS cost cap
+- pack_context(): fits ContextBlocks into a budget, highest priority first;
+  required blocks are never cut, optional ones are truncated or dropped and
+  every cut is logged and counted in metrics
+- record_prompt_tokens(): per task type / agent prompt-size histogram
+
+Environment Variables:
+- PROMPT_CONTEXT_TOKENS: ceiling on assembled prompt context (default 12000)
+
+Usage:
+    from ..token_budget import ContextBlock, pack_context, prompt_budget
+
+    packed = pack_context(
+        [ContextBlock(question, priority=100, name="question", required=True),
+         ContextBlock(notes, priority=50, name="meeting:Standup")],
+        prompt_budget(model, max_output_tokens=1000),
+        model=model,
+        caller="arjuna.quick_ask",
+    )
+    prompt = packed.text
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+from .metrics import CONTEXT_DROPPED_TOKENS, PROMPT_TOKENS, TOKEN_BUCKETS, get_metrics
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+PROMPT_CONTEXT_TOKENS = int(os.getenv("PROMPT_CONTEXT_TOKENS", "12000"))
+
+# Context window per model family; the longest matching prefix wins
+MODEL_CONTEXT_TOKENS = {
+    "gpt-3.5-turbo": 16385,
+    "gpt-4": 8192,
+    "gpt-4-turbo": 128000,
+    "gpt-4o": 128000,
+    "gpt-4.1": 1047576,
+    "gpt-5": 400000,
+    "o1": 200000,
+    "o3": 200000,
+    "o4": 200000,
+    "claude": 200000,
+}
+DEFAULT_CONTEXT_TOKENS = 8192
+
+# Models tokenized with o200k_base; everything else (including Claude,
+# which has no public tokenizer) is approximated with cl100k_base
+_O200K_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+
+# Optional blocks are dropped rather than cut below this many tokens
+MIN_TRUNCATED_TOKENS = 32
+TRUNCATION_MARKER = "\n[... truncated]"
+
+
+def _encoding_name(model: Optional[str]) -> str:
+    model = (model or "").lower()
+    return "o200k_base" if model.startswith(_O200K_PREFIXES) else "cl100k_base"
+
+
+@lru_cache(maxsize=None)
+def _encoder(encoding_name: str):
+    """Load a tiktoken encoding once (None if unavailable, e.g. no network for the BPE file)."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding {encoding_name} unavailable, estimating tokens: {e}")
+        return None
+
+
+def get_encoder(model: Optional[str] = None):
+    """Cached tiktoken encoder for a model, or None when falling back to the heuristic."""
+    return _encoder(_encoding_name(model))
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Number of tokens ``text`` costs for ``model``."""
+    if not text:
+        return 0
+    encoder = get_encoder(model)
+    if encoder is None:
+        # ~4 chars per token is a reasonable heuristic for GPT models
+        return max(1, len(text) // 4)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: Optional[str] = None, marker: str = TRUNCATION_MARKER) -> str:
+    """Cut ``text`` to at most ``max_tokens`` tokens, ending with ``marker`` when cut."""
+    if max_tokens <= 0 or not text:
+        return ""
+    encoder = get_encoder(model)
+    if encoder is None:
+        if len(text) // 4 <= max_tokens:
+            return text
+        keep = max(0, max_tokens - count_tokens(marker, model)) * 4
+        return text[:keep].rstrip() + marker
+    tokens = encoder.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    keep = max(0, max_tokens - count_tokens(marker, model))
+    return encoder.decode(tokens[:keep]).rstrip() + marker
+
+
+def context_window(model: Optional[str]) -> int:
+    """Context window in tokens for a model (DEFAULT_CONTEXT_TOKENS if unknown)."""
+    model = (model or "").lower()
+    best = ""
+    for prefix in MODEL_CONTEXT_TOKENS:
+        if model.startswith(prefix) and len(prefix) > len(best):
+            best = prefix
+    return MODEL_CONTEXT_TOKENS[best] if best else DEFAULT_CONTEXT_TOKENS
+
+
+def prompt_budget(
+    model: Optional[str],
+    max_output_tokens: int = 0,
+    reserved_tokens: int = 0,
+    cap: Optional[int] = None,
+) -> int:
+    """
+    Tokens available for prompt context.
+
+    Args:
+        model: Target model
+        max_output_tokens: Completion tokens to leave room for
+        reserved_tokens: Tokens already spent elsewhere (system prompt, instructions)
+        cap: Cost ceiling (defaults to PROMPT_CONTEXT_TOKENS; 0 = window only)
+    """
+    cap = PROMPT_CONTEXT_TOKENS if cap is None else cap
+    available = context_window(model) - max_output_tokens
+    if cap:
+        available = min(available, cap)
+    return max(0, available - reserved_tokens)
+
+
+@dataclass
+class ContextBlock:
+    """One piece of prompt context competing for the token budget."""
+    text: str
+    priority: int = 0
+    name: str = ""
+    required: bool = False
+    truncatable: bool = True
+
+
+@dataclass
+class PackedContext:
+    """Result of pack_context(): the joined text and what was cut to fit."""
+    text: str
+    tokens: int
+    budget: int
+    included: List[str] = field(default_factory=list)
+    truncated: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    dropped_tokens: int = 0
+
+    @property
+    def over_budget(self) -> bool:
+        return self.tokens > self.budget
+
+
+def pack_context(
+    blocks: Sequence[ContextBlock],
+    budget_tokens: int,
+    model: Optional[str] = None,
+    separator: str = "\n\n",
+    caller: str = "context",
+) -> PackedContext:
+    """
+    Fit context blocks into ``budget_tokens``.
+
+    Required blocks are placed first and always kept whole, even if that
+    exceeds the budget (a warning is logged). The remaining blocks are
+    placed highest priority first (ties keep their original order); a block
+    that doesn't fit is truncated when it's truncatable and at least
+    MIN_TRUNCATED_TOKENS would survive, otherwise dropped. Kept blocks are
+    joined in their original order.
+
+    Args:
+        blocks: Candidate blocks
+        budget_tokens: Token budget for the joined text
+        model: Model whose tokenizer to count with
+        separator: Joiner between blocks
+        caller: Label for logs and the dropped-tokens counter
+    """
+    sep_tokens = count_tokens(separator, model)
+    costs = [count_tokens(block.text, model) for block in blocks]
+    order = sorted(
+        (i for i, block in enumerate(blocks) if block.text),
+        key=lambda i: (not blocks[i].required, -blocks[i].priority, i),
+    )
+
+    kept = {}
+    truncated: List[str] = []
+    dropped: List[str] = []
+    dropped_tokens = 0
+    used = 0
+    for i in order:
+        block = blocks[i]
+        join_cost = sep_tokens if kept else 0
+        cost = costs[i] + join_cost
+        if block.required or used + cost <= budget_tokens:
+            kept[i] = block.text
+            used += cost
+            continue
+        room = budget_tokens - used - join_cost
+        if block.truncatable and room >= MIN_TRUNCATED_TOKENS:
+            text = truncate_to_tokens(block.text, room, model)
+            kept[i] = text
+            text_tokens = count_tokens(text, model)
+            used += join_cost + text_tokens
+            truncated.append(block.name or f"block{i}")
+            dropped_tokens += max(0, costs[i] - text_tokens)
+        else:
+            dropped.append(block.name or f"block{i}")
+            dropped_tokens += costs[i]
+
+    packed = PackedContext(
+        text=separator.join(kept[i] for i in sorted(kept)),
+        tokens=used,
+        budget=budget_tokens,
+        included=[blocks[i].name or f"block{i}" for i in sorted(kept)],
+        truncated=truncated,
+        dropped=dropped,
+        dropped_tokens=dropped_tokens,
+    )
+
+    if packed.over_budget:
+        logger.warning(f"{caller}: required context is {used} tokens, over the {budget_tokens} token budget")
+    if truncated or dropped:
+        logger.info(
+            f"{caller}: fitted context to {budget_tokens} tokens; "
+            f"truncated={truncated} dropped={dropped} ({dropped_tokens} tokens cut)"
+        )
+        get_metrics().inc(CONTEXT_DROPPED_TOKENS, (("caller", caller),), dropped_tokens)
+    return packed
+
+
+def record_prompt_tokens(tokens: int, task_type: Optional[str] = None, agent: str = "llm"):
+    """Observe the size of a prompt sent to a model."""
+    get_metrics().observe(
+        PROMPT_TOKENS, tokens, (("agent", agent), ("task_type", task_type or "default")), bounds=TOKEN_BUCKETS
+    )
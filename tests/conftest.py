@@ -46,6 +46,23 @@ def test_db() -> Generator[sqlite3.Connection, None, None]:
     conn.close()
 
 
+@pytest.fixture(scope="function")
+def temp_db(tmp_path, monkeypatch):
+    """
+    Point the app's pooled connections at a fresh SQLite file.
+    
+    Unlike test_db, code that opens its own connections via db.connect()
+    sees this database. Yields the src.app.db module.
+    """
+    from src.app import db
+    
+    db.close_pool()
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "agent.db"))
+    db.init_db()
+    yield db
+    db.close_pool()
+
+
 @pytest.fixture(scope="function")
 def db_with_data(test_db) -> sqlite3.Connection:
     """Database with sample test data pre-loaded."""
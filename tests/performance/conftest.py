@@ -0,0 +1,55 @@
+# tests/performance/conftest.py
+"""
+Fixtures for the benchmark suite.
+
+``corpus_db`` builds one synthetic corpus per session (size from
+BENCH_SCALE, see corpus.py) in a temp SQLite file and points the app at
+it with Supabase unconfigured and embeddings computed locally, so the
+benchmarks measure this repo's code rather than the network.
+
+Run and record results:
+    pytest tests/performance --benchmark-only --benchmark-json=.benchmarks/latest.json
+    BENCH_SCALE=10 pytest tests/performance --benchmark-only --benchmark-autosave
+    pytest tests/performance --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:20%
+"""
+
+import os
+from dataclasses import asdict
+
+import pytest
+
+from tests.performance.corpus import CorpusSize, build_corpus, fake_embedding
+
+BENCH_SEED = int(os.getenv("BENCH_SEED", "0"))
+
+
+@pytest.fixture(scope="session")
+def corpus_size() -> CorpusSize:
+    return CorpusSize.from_env()
+
+
+@pytest.fixture(scope="session")
+def corpus_db(tmp_path_factory, corpus_size):
+    from src.app import db
+    from src.app.infrastructure import supabase_client
+    from src.app.memory import semantic
+
+    with pytest.MonkeyPatch.context() as mp:
+        for var in ("SUPABASE_URL", "SUPABASE_KEY", "SUPABASE_ANON_KEY", "SUPABASE_SERVICE_ROLE_KEY"):
+            mp.delenv(var, raising=False)
+        mp.setattr(supabase_client, "_supabase_client", None)
+        mp.setattr(semantic, "embed_text", fake_embedding)
+
+        db.close_pool()
+        mp.setattr(db, "DB_PATH", str(tmp_path_factory.mktemp("bench") / "corpus.db"))
+        db.init_db()
+        with db.connect() as conn:
+            counts = build_corpus(conn, corpus_size, seed=BENCH_SEED)
+        yield counts
+        db.close_pool()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    """Record the corpus shape with the results so runs at different scales aren't compared."""
+    output_json["corpus"] = {**asdict(CorpusSize.from_env()), "seed": BENCH_SEED}
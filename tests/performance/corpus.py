@@ -0,0 +1,193 @@
+# tests/performance/corpus.py
+"""
+Synthetic corpus generator for benchmarks and load tests.
+
+Fills a SQLite database (already initialised with ``init_db()``) with
+meetings + transcripts, documents, signals, DIKW items, tickets and
+embeddings. Output is deterministic for a given size and seed, so numbers
+from different commits are comparable.
+
+Embeddings are hashed bag-of-words vectors (see ``fake_embedding``): texts
+sharing words get similar vectors, so semantic search returns meaningful
+neighbours without calling OpenAI.
+
+Usage:
+    from tests.performance.corpus import CorpusSize, build_corpus
+
+    with db.connect() as conn:
+        counts = build_corpus(conn, CorpusSize.from_env())
+"""
+
+import json
+import os
+import random
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from typing import Dict, List
+
+from src.app.db_blobs import put_text
+from src.app.infrastructure.fake_providers import FAKE_EMBED_DIM, hashed_embedding
+
+# Must match the fake embeddings backend so queries embedded by it rank corpus rows
+EMBED_DIM = FAKE_EMBED_DIM
+EMBED_MODEL = os.getenv("EMBED_MODEL", "text-embedding-3-small")
+
+TOPICS = [
+    "billing", "onboarding", "migration", "pipeline", "latency", "dashboard", "search",
+    "release", "vendor", "security", "analytics", "mobile", "payments", "scheduler",
+    "warehouse", "airflow", "snowflake", "kafka", "retention", "pricing",
+]
+WORDS = [
+    "the", "team", "agreed", "to", "review", "next", "sprint", "deploy", "fix", "customer",
+    "data", "model", "ticket", "owner", "blocked", "by", "waiting", "for", "approval", "on",
+    "test", "plan", "rollout", "metric", "alert", "query", "schema", "cost", "budget", "risk",
+]
+SPEAKERS = ["Rowan", "Priya", "Marcus", "Elena", "Jordan", "Sam"]
+SIGNAL_TYPES = ["decisions", "action_items", "blockers", "risks", "ideas"]
+
+
+@dataclass
+class CorpusSize:
+    """Row counts for a synthetic corpus."""
+    meetings: int = 500
+    transcript_words: int = 1500
+    docs: int = 300
+    doc_words: int = 400
+    signals_per_type: int = 3
+    dikw_items: int = 500
+    tickets: int = 200
+
+    def scaled(self, factor: float) -> "CorpusSize":
+        """Same shape, ``factor`` times the rows (word counts unchanged)."""
+        return CorpusSize(**{
+            f.name: getattr(self, f.name) if f.name.endswith("_words") or f.name == "signals_per_type"
+            else max(1, int(getattr(self, f.name) * factor))
+            for f in fields(self)
+        })
+
+    @classmethod
+    def from_env(cls) -> "CorpusSize":
+        """Default size scaled by BENCH_SCALE (default 1.0)."""
+        return cls().scaled(float(os.getenv("BENCH_SCALE", "1.0")))
+
+
+def fake_embedding(text: str, dim: int = EMBED_DIM) -> List[float]:
+    """Deterministic unit vector: hashed bag of words (same space as the fake embeddings backend)."""
+    return hashed_embedding(text, dim)
+
+
+def _sentence(rng: random.Random, topic: str, words: int = 12) -> str:
+    body = " ".join(rng.choice(WORDS) for _ in range(words))
+    return f"{body} {topic}".capitalize()
+
+
+def _paragraphs(rng: random.Random, topic: str, words: int) -> str:
+    sentences = []
+    while words > 0:
+        n = min(words, rng.randint(8, 20))
+        sentences.append(_sentence(rng, topic, n) + ".")
+        words -= n
+    return " ".join(sentences)
+
+
+def _transcript(rng: random.Random, topic: str, words: int) -> str:
+    lines = []
+    while words > 0:
+        n = min(words, rng.randint(6, 30))
+        lines.append(f"{rng.choice(SPEAKERS)}: {_sentence(rng, topic, n)}")
+        words -= n
+    return "\n".join(lines)
+
+
+def _day(start: date, i: int, total: int, span_days: int = 365) -> str:
+    return (start + timedelta(days=int(i * span_days / max(total, 1)))).isoformat()
+
+
+def build_corpus(conn, size: CorpusSize, seed: int = 0) -> Dict[str, int]:
+    """
+    Insert a synthetic corpus through ``conn`` and commit.
+
+    Returns:
+        Rows written per table
+    """
+    rng = random.Random(seed)
+    start = date.today() - timedelta(days=365)
+    counts = {"meetings": 0, "meeting_documents": 0, "docs": 0, "embeddings": 0,
+              "dikw_items": 0, "tickets": 0, "signals": 0}
+
+    for i in range(1, size.meetings + 1):
+        topic = TOPICS[i % len(TOPICS)]
+        day = _day(start, i, size.meetings)
+        signals = {
+            stype: [_sentence(rng, topic, 8) for _ in range(size.signals_per_type)]
+            for stype in SIGNAL_TYPES
+        }
+        notes = _paragraphs(rng, topic, 200)
+        transcript = _transcript(rng, topic, size.transcript_words)
+        conn.execute(
+            """
+            INSERT INTO meeting_summaries (id, meeting_name, synthesized_notes, meeting_date, created_at,
+                                           signals_json, raw_text, import_source)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 'benchmark')
+            """,
+            (i, f"{topic.title()} sync #{i}", notes, day, day, json.dumps(signals), put_text(conn, transcript)),
+        )
+        conn.execute(
+            """
+            INSERT INTO meeting_documents (meeting_id, doc_type, source, content, format, is_primary, created_at)
+            VALUES (?, 'transcript', ?, ?, 'txt', 1, ?)
+            """,
+            (i, rng.choice(["teams", "pocket", "zoom"]), put_text(conn, transcript), day),
+        )
+        conn.execute(
+            "INSERT INTO embeddings (ref_type, ref_id, model, vector) VALUES ('meeting', ?, ?, ?)",
+            (i, EMBED_MODEL, json.dumps(fake_embedding(notes))),
+        )
+        counts["meetings"] += 1
+        counts["meeting_documents"] += 1
+        counts["embeddings"] += 1
+        counts["signals"] += len(SIGNAL_TYPES) * size.signals_per_type
+
+    for i in range(1, size.docs + 1):
+        topic = TOPICS[(i * 7) % len(TOPICS)]
+        day = _day(start, i, size.docs)
+        content = _paragraphs(rng, topic, size.doc_words)
+        conn.execute(
+            "INSERT INTO docs (id, source, content, document_date, created_at) VALUES (?, ?, ?, ?, ?)",
+            (i, f"{topic.title()} design notes {i}", content, day, day),
+        )
+        conn.execute(
+            "INSERT INTO embeddings (ref_type, ref_id, model, vector) VALUES ('doc', ?, ?, ?)",
+            (i, EMBED_MODEL, json.dumps(fake_embedding(content))),
+        )
+        counts["docs"] += 1
+        counts["embeddings"] += 1
+
+    levels = ["data", "information", "knowledge", "wisdom"]
+    for i in range(1, size.dikw_items + 1):
+        topic = TOPICS[i % len(TOPICS)]
+        conn.execute(
+            """
+            INSERT INTO dikw_items (level, content, source_type, original_signal_type, meeting_id, tags, confidence)
+            VALUES (?, ?, 'signal', ?, ?, ?, ?)
+            """,
+            (levels[i % len(levels)], _sentence(rng, topic, 15), rng.choice(["decision", "risk", "idea"]),
+             (i % max(size.meetings, 1)) + 1, topic, round(rng.random(), 2)),
+        )
+        counts["dikw_items"] += 1
+
+    statuses = ["backlog", "todo", "in_progress", "in_review", "blocked", "done"]
+    for i in range(1, size.tickets + 1):
+        topic = TOPICS[i % len(TOPICS)]
+        conn.execute(
+            """
+            INSERT INTO tickets (ticket_id, title, description, status, priority, sprint_points, tags)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (f"BENCH-{i}", _sentence(rng, topic, 6), _paragraphs(rng, topic, 80), statuses[i % len(statuses)],
+             rng.choice(["low", "medium", "high"]), rng.choice([1, 2, 3, 5, 8]), topic),
+        )
+        counts["tickets"] += 1
+
+    conn.commit()
+    return counts
@@ -0,0 +1,350 @@
+# tests/performance/test_benchmarks.py
+"""
+Microbenchmarks for the hot paths: retrieval, ranking and search, signal
+listing and keyset paging, guardrail scanning, signal merging, ticket
+matching, model routing, rate limiting, metrics spans, context packing,
+feedback and learning-context reads, bulk import, mixed async SQLite load
+and the fake Supabase vector search.
+
+Each benchmark asserts a little about its result so a regression that
+makes a path "fast" by returning nothing fails instead of looking good.
+"""
+
+import asyncio
+import io
+import json
+import random
+import time
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.performance
+
+QUERIES = ["billing migration", "pipeline latency", "vendor risk approval"]
+
+
+class TestRetrieval:
+
+    def test_retrieve_both(self, benchmark, corpus_db):
+        from src.app.memory.retrieve import retrieve
+
+        result = benchmark(retrieve, ["billing", "migration"], source_type="both", limit=20)
+        assert result["documents"] and result["meetings"]
+
+    def test_rank_items(self, benchmark, corpus_db):
+        from src.app.memory.rank import rank_items
+        from src.app.memory.retrieve import retrieve
+
+        found = retrieve(["pipeline", "latency"], source_type="both", limit=100)
+        items = [
+            {"type": "document", "content": d["content"], "created_at": d["created_at"]}
+            for d in found["documents"]
+        ] + [
+            {"type": "meeting", "content": m["synthesized_notes"], "created_at": m["created_at"]}
+            for m in found["meetings"]
+        ]
+
+        ranked = benchmark(rank_items, items, terms=["pipeline", "latency"],
+                           source_preference="meeting", time_hint="recent")
+        assert len(ranked) == len(items)
+
+    @pytest.mark.parametrize("ref_type", ["doc", "meeting"])
+    def test_semantic_search(self, benchmark, corpus_db, ref_type):
+        from src.app.memory.semantic import semantic_search
+
+        results = benchmark(semantic_search, QUERIES[0], ref_type, k=8)
+        assert len(results) == 8
+
+
+class TestSearch:
+
+    def test_keyword_search_api(self, benchmark, corpus_db):
+        from src.app.api.search import keyword_search
+
+        def run():
+            return asyncio.run(keyword_search(q="snowflake", source_type="both", start_date=None,
+                                              end_date=None, limit=20))
+
+        response = benchmark(run)
+        assert response.total_results > 0
+
+    @pytest.mark.parametrize("signal_type", ["decisions", "all"])
+    def test_get_signals_by_type(self, benchmark, corpus_db, signal_type):
+        from src.app.signals import get_signals_by_type
+
+        groups, total = benchmark(get_signals_by_type, signal_type, None, 100)
+        assert len(groups) == min(100, corpus_db["meetings"]) and total > 0
+
+
+class TestGuardrails:
+
+    def test_pre_call_scan(self, benchmark):
+        from src.app.agents.guardrails import Guardrails
+
+        guardrails = Guardrails()
+        prompt = ("Summarise the billing migration decisions from last sprint and list owners. " * 40
+                  + "Contact me at rowan@example.com")
+
+        def run():
+            return asyncio.run(guardrails.pre_call(prompt, agent_name="arjuna"))
+
+        result = benchmark(run)
+        assert not result.blocked and "pii:email" in result.triggered_rules
+
+
+class TestSignalMerge:
+
+    def test_merge_signals_holistically(self, benchmark):
+        from src.app.api.v1.imports import merge_signals_holistically
+
+        existing = {t: [f"{t} item {i} about the billing rollout" for i in range(200)]
+                    for t in ("decisions", "action_items", "blockers", "risks", "ideas", "key_points")}
+        incoming = {t: [{"text": f"{t} item {i} about the billing rollout"} for i in range(100, 400)]
+                    for t in existing}
+
+        merged, added = benchmark(merge_signals_holistically, existing, incoming)
+        assert added == 6 * 200
+        assert len(merged["decisions"]) == 400
+
+
+class TestTicketIndex:
+
+    def test_full_backlog_full_transcript(self, benchmark):
+        from src.app.services.ticket_index import TicketMatchIndex
+
+        rng = random.Random(7)
+        vocab = [f"term{i}" for i in range(3000)]
+        tickets = [
+            {
+                "id": i,
+                "ticket_id": f"T-{i}",
+                "title": " ".join(rng.sample(vocab, 6)),
+                "description": " ".join(rng.sample(vocab, 40)),
+                "tags": " ".join(rng.sample(vocab, 2)),
+                "status": "todo",
+            }
+            for i in range(5000)
+        ]
+        transcript = " ".join(rng.choice(vocab) for _ in range(8000))
+
+        idx = TicketMatchIndex()
+        idx.build(tickets)
+
+        results = benchmark(idx.search, transcript, limit=3)
+        assert len(results) == 3
+
+
+class TestBulkImport:
+
+    def test_backfill_hundreds_of_transcripts(self, benchmark, temp_db):
+        from src.app.services.bulk_import import BulkImporter, iter_zip_transcripts
+
+        body = "\n".join(f"- Person {i}: follow up on item {i}" for i in range(40))
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i in range(300):
+                zf.writestr(
+                    f"2025-{(i % 12) + 1:02d}-01_meeting_{i}.md",
+                    f"# Meeting {i}\n\n## Synthesized Signals\nDecision:\n- Use PostgreSQL\n\n"
+                    f"Action items:\n- Rowan: Review PR #{i} by Friday\n" + body,
+                )
+        archive = buf.getvalue()
+
+        def run():
+            return BulkImporter(workers=4).run(iter_zip_transcripts(io.BytesIO(archive)))
+
+        progress = benchmark.pedantic(run, rounds=3, iterations=1)
+        assert progress.completed == 300
+
+
+class TestRateLimiter:
+
+    def test_memory_checks(self, benchmark):
+        from src.app.infrastructure.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(redis_url=None, max_buckets=1000)
+
+        async def checks():
+            for i in range(5000):
+                await limiter.check(f"ip:{i}", limit=100, window=60)
+
+        benchmark(lambda: asyncio.run(checks()))
+        assert len(limiter._buckets) <= 1000
+
+
+class TestMetrics:
+
+    def test_timer_span(self, benchmark):
+        from src.app.metrics import get_metrics, timer
+
+        def span():
+            with timer("db", "SELECT meeting_summaries"):
+                pass
+
+        registry = get_metrics()
+        registry.reset()
+        try:
+            benchmark(span)
+            key = (("caller", "SELECT meeting_summaries"), ("kind", "db"))
+            assert registry.histogram("signalflow_dependency_duration_seconds", key).count > 0
+        finally:
+            registry.reset()
+
+
+@pytest.fixture
+def adaptive_router():
+    from src.app.agents.model_router import ModelRouter
+
+    router = ModelRouter()
+    router.policy = {
+        "task_types": {"classification": {
+            "default_model": "gpt-4o-mini",
+            "fallback_models": ["gpt-3.5-turbo"],
+            "latency_budget_ms": 2000,
+        }},
+        "adaptive_routing": {"min_samples": 5},
+    }
+    router.task_configs = {}
+    router._parse_policy()
+    for i in range(1000):
+        router.record_outcome("gpt-4o-mini", 100 + i % 900)
+    return router
+
+
+class TestModelRouter:
+
+    def test_record_outcome(self, benchmark, adaptive_router):
+        benchmark(adaptive_router.record_outcome, "gpt-4o-mini", 250)
+        # The rolling window stays bounded however many outcomes are recorded
+        assert adaptive_router.get_model_health()["gpt-4o-mini"]["calls"] == adaptive_router.adaptive.window_size
+
+    def test_adaptive_route(self, benchmark, adaptive_router):
+        config = adaptive_router.task_configs["classification"]
+
+        model, _ = benchmark(adaptive_router._route_within_budget, config, "task_type_default")
+        assert model == "gpt-4o-mini"
+
+
+class TestTokenBudget:
+
+    def test_pack_many_blocks(self, benchmark, monkeypatch):
+        from src.app import token_budget
+        from src.app.token_budget import ContextBlock, pack_context
+
+        monkeypatch.setattr(token_budget, "get_encoder", lambda model=None: None)
+        blocks = [ContextBlock("note " * 200, priority=i % 7, name=f"b{i}") for i in range(500)]
+
+        packed = benchmark(pack_context, blocks, 8000)
+        assert 0 < packed.tokens <= 8000
+
+
+class TestFeedbackLedger:
+
+    def test_dashboard_over_many_events(self, benchmark, temp_db, monkeypatch):
+        from src.app.services.feedback_ledger import get_dashboard, record
+
+        monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+        monkeypatch.delenv("LANGCHAIN_API_KEY", raising=False)
+        now = time.time()
+        with temp_db.connect() as conn:
+            for i in range(20000):
+                record(conn, ("helpfulness", "accuracy", "relevance")[i % 3], score=(i % 10) / 10,
+                       source="bench", run_id=f"run-{i}", agent_name=f"agent{i % 5}",
+                       langsmith_feedback_id=f"ls-{i}", created_at=now - (i % 30) * 86400)
+            conn.commit()
+
+        dashboard = benchmark(get_dashboard, days=7)
+        assert dashboard["stats"]["feedback_events"] > 0
+
+
+class TestSignalLearning:
+
+    def test_cached_learning_context(self, benchmark):
+        from src.app.services.signal_learning import LearningContextCache, SignalLearningService
+
+        service = SignalLearningService()
+        rows = [
+            {"signal_type": "action_item", "feedback": "up", "count": 20},
+            {"signal_type": "risk", "feedback": "down", "count": 15},
+            {"signal_type": "risk", "feedback": "up", "count": 1},
+        ]
+        with patch.object(service, "load_feedback", return_value=(rows, [], [])):
+            cache = LearningContextCache(service)
+            cache.context()
+
+            context = benchmark(cache.context)
+        assert "risk (often rejected)" in context
+
+
+class TestSignalPages:
+
+    @pytest.mark.parametrize("page_number", [1, 50])
+    def test_keyset_page(self, benchmark, temp_db, page_number):
+        """Deep pages should cost the same as the first one."""
+        from src.app.signals import get_signals_page
+
+        signals = json.dumps({"decisions": ["Ship it"], "risks": ["Vendor delay"]})
+        with temp_db.connect() as conn:
+            conn.executemany(
+                "INSERT INTO meeting_summaries (id, meeting_name, synthesized_notes, meeting_date, signals_json) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(i, f"Meeting {i}", "notes", f"2026-01-{(i % 28) + 1:02d}", signals) for i in range(1, 5001)],
+            )
+            conn.commit()
+
+        cursor = None
+        for _ in range(page_number - 1):
+            cursor = get_signals_page("decisions", cursor=cursor, limit=100)[0].next_cursor
+
+        page, _ = benchmark(get_signals_page, "decisions", cursor=cursor, limit=100)
+        assert len(page.items) == 100 and page.has_more == (page_number < 50)
+
+
+class TestAsyncDb:
+
+    def test_mixed_read_write_load(self, benchmark, temp_db):
+        from src.app import db_async
+
+        with temp_db.connect() as conn:
+            conn.execute("CREATE TABLE bench_items (id INTEGER PRIMARY KEY, name TEXT, qty INTEGER DEFAULT 0)")
+            conn.executemany("INSERT INTO bench_items (name, qty) VALUES (?, ?)",
+                             [(f"seed-{i}", i) for i in range(2000)])
+            conn.commit()
+
+        async def request(i):
+            if i % 5 == 0:
+                return await db_async.execute("INSERT INTO bench_items (name, qty) VALUES (?, ?)", (f"w-{i}", i))
+            return await db_async.fetch_all(
+                "SELECT name, qty FROM bench_items WHERE qty > ? ORDER BY qty DESC LIMIT 50", (i,)
+            )
+
+        async def mixed_load():
+            return await asyncio.gather(*(request(i) for i in range(500)))
+
+        try:
+            results = benchmark.pedantic(lambda: asyncio.run(mixed_load()), rounds=5, iterations=1)
+            assert len(results) == 500
+        finally:
+            db_async.shutdown_async_db()
+
+
+class TestFakeSupabase:
+
+    def test_semantic_search_rpc(self, benchmark):
+        from src.app.infrastructure.fake_providers import hashed_embedding
+        from src.app.infrastructure.fake_supabase import FakeSupabaseClient
+
+        sb = FakeSupabaseClient()
+        sb.table("embeddings").insert([
+            {"ref_type": "document", "ref_id": f"d{i}", "embedding": hashed_embedding(f"doc {i} billing {i % 7}", 256)}
+            for i in range(2000)
+        ]).execute()
+        params = {"query_embedding": hashed_embedding("billing 3", 256), "match_threshold": 0.0, "match_count": 10}
+        sb.rpc("semantic_search", params).execute()  # parse and cache vectors
+
+        results = benchmark(lambda: sb.rpc("semantic_search", params).execute().data)
+        assert len(results) == 10
@@ -0,0 +1,222 @@
+# tests/test_agent_runtime.py
+"""
+Tests for the shared agent event loop, request cancellation and the
+non-blocking LLM client path.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def runtime():
+    from src.app.agents.runtime import AgentRuntime
+
+    rt = AgentRuntime(name="agent-runtime-test")
+    yield rt
+    rt.shutdown()
+
+
+class TestRunSync:
+
+    def test_reuses_one_loop_and_thread(self, runtime):
+        async def where():
+            await asyncio.sleep(0)
+            return threading.get_ident(), id(asyncio.get_running_loop())
+
+        runtime.run_sync(where())
+        threads_before = threading.active_count()
+        seen = {runtime.run_sync(where()) for _ in range(50)}
+
+        assert len(seen) == 1
+        assert threading.active_count() == threads_before
+
+    def test_callable_from_inside_a_running_loop(self, runtime):
+        async def answer():
+            return 42
+
+        async def caller():
+            # A sync adapter invoked from async code no longer needs a pool + asyncio.run
+            return runtime.run_sync(answer())
+
+        assert asyncio.run(caller()) == 42
+
+    def test_timeout_cancels_the_coroutine(self, runtime):
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            runtime.run_sync(slow(), timeout=0.05)
+        assert cancelled.wait(1)
+
+    def test_errors_propagate(self, runtime):
+        async def boom():
+            raise ValueError("bad intent")
+
+        with pytest.raises(ValueError, match="bad intent"):
+            runtime.run_sync(boom())
+
+    def test_refuses_to_deadlock_on_its_own_loop(self, runtime):
+        async def noop():
+            return None
+
+        async def reentrant():
+            with pytest.raises(RuntimeError):
+                runtime.run_sync(noop())
+            return "ok"
+
+        assert runtime.run_sync(reentrant()) == "ok"
+
+
+class _Request:
+    """Stands in for a Starlette Request that disconnects after ``after`` seconds."""
+
+    def __init__(self, after):
+        self.disconnect_at = time.monotonic() + after
+
+    async def is_disconnected(self):
+        return time.monotonic() >= self.disconnect_at
+
+
+class TestRunCancellable:
+
+    @pytest.fixture(autouse=True)
+    def fast_poll(self, monkeypatch):
+        from src.app.agents import runtime
+
+        monkeypatch.setattr(runtime, "DISCONNECT_POLL_SECONDS", 0.01)
+
+    def test_client_disconnect_cancels_agent(self):
+        from src.app.agents.runtime import ClientDisconnected, run_cancellable
+
+        state = {}
+
+        async def agent_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+
+        async def route():
+            with pytest.raises(ClientDisconnected):
+                await run_cancellable(agent_call(), _Request(after=0.05))
+
+        start = time.perf_counter()
+        asyncio.run(route())
+        assert state["cancelled"] and time.perf_counter() - start < 1
+
+    def test_timeout_and_success(self):
+        from src.app.agents.runtime import run_cancellable
+
+        async def value():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        async def route():
+            assert await run_cancellable(value(), _Request(after=60)) == "done"
+            with pytest.raises(TimeoutError):
+                await run_cancellable(asyncio.sleep(10), timeout=0.05)
+
+        asyncio.run(route())
+
+
+def _fake_async_openai(delay, log):
+    async def create(**kwargs):
+        log.append(kwargs)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log.append("cancelled")
+            raise
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=" ok "))])
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+class TestAsyncLLM:
+
+    def test_acomplete_does_not_block_the_loop(self, monkeypatch):
+        from src.app import llm
+
+        log = []
+        client = _fake_async_openai(0.1, log)
+        monkeypatch.setattr(llm, "_async_openai_client_once", lambda: client)
+
+        async def scenario():
+            messages = [{"role": "user", "content": "hi"}]
+            return await asyncio.gather(*(llm.acomplete(messages, "gpt-4o-mini", temperature=0.2) for _ in range(5)))
+
+        start = time.perf_counter()
+        assert asyncio.run(scenario()) == ["ok"] * 5
+        assert time.perf_counter() - start < 0.3  # concurrent, not 5 x 0.1s
+        assert log[0]["temperature"] == 0.2 and "max_tokens" not in log[0]
+
+    def test_cancelling_the_request_cancels_the_llm_call(self, monkeypatch):
+        from src.app import llm
+        from src.app.agents.runtime import ClientDisconnected, run_cancellable
+
+        log = []
+        client = _fake_async_openai(10, log)
+        monkeypatch.setattr(llm, "_async_openai_client_once", lambda: client)
+
+        async def route():
+            call = llm.acomplete([{"role": "user", "content": "hi"}], "gpt-4o-mini")
+            with pytest.raises(ClientDisconnected):
+                await run_cancellable(call, _Request(after=0.05))
+
+        from src.app.agents import runtime
+        monkeypatch.setattr(runtime, "DISCONNECT_POLL_SECONDS", 0.01)
+        asyncio.run(route())
+        assert log[-1] == "cancelled"
+
+    def test_assistant_intent_parse_is_cancelled_with_the_request(self, monkeypatch):
+        from src.app import llm
+        from src.app.agents import runtime
+        from src.app.api import assistant
+
+        log = []
+        client = _fake_async_openai(10, log)
+        monkeypatch.setattr(llm, "_async_openai_client_once", lambda: client)
+        monkeypatch.setattr(llm, "get_current_model", lambda: "gpt-4o-mini")
+        monkeypatch.setattr(runtime, "DISCONNECT_POLL_SECONDS", 0.01)
+
+        async def route():
+            call = assistant.parse_assistant_intent("make a ticket", {}, [], thread_id="t-1")
+            with pytest.raises(runtime.ClientDisconnected):
+                await runtime.run_cancellable(call, _Request(after=0.05))
+
+        asyncio.run(route())
+        assert log[-1] == "cancelled"
+
+    def test_assistant_intent_carries_its_own_langsmith_run(self, monkeypatch):
+        from src.app import llm, tracing
+        from src.app.api import assistant
+
+        runs = []
+        langsmith = SimpleNamespace(
+            create_run=lambda **kw: runs.append(("create", kw)),
+            update_run=lambda **kw: runs.append(("update", kw)),
+            list_runs=lambda **kw: pytest.fail("run_id must not be guessed from list_runs"),
+        )
+        monkeypatch.setattr(tracing, "is_tracing_enabled", lambda: True)
+        monkeypatch.setattr(tracing, "get_langsmith_client", lambda: langsmith)
+        client = _fake_async_openai(0, [])
+        monkeypatch.setattr(llm, "_async_openai_client_once", lambda: client)
+
+        intent = asyncio.run(assistant.parse_assistant_intent("hello", {}, [], thread_id="thread-42"))
+
+        (_, created), (_, updated) = runs
+        assert intent["run_id"] == created["id"] == updated["run_id"]
+        assert created["extra"]["metadata"]["thread_id"] == "thread-42"
+        assert updated["outputs"] == {"response": "ok"}
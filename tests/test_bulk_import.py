@@ -0,0 +1,121 @@
+# tests/test_bulk_import.py
+"""
+Tests for F1c: bulk transcript import from zip archives and directories.
+"""
+
+import io
+import zipfile
+
+import pytest
+
+
+TRANSCRIPT = """# {title}
+
+## Synthesized Signals
+Decision:
+- Use PostgreSQL for the new feature
+
+Action items:
+- Rowan: Review PR #{n} by Friday
+- Alex: Set up database migrations
+
+Blocked:
+- Waiting on design approval
+
+## Commitments
+"""
+
+
+def _zip(files):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    buf.seek(0)
+    return buf
+
+
+class TestHelpers:
+
+    def test_date_from_filename(self):
+        from src.app.services.bulk_import import infer_meeting_date_from_filename
+
+        assert infer_meeting_date_from_filename("2026-01-22_standup.md") == "2026-01-22"
+        assert infer_meeting_date_from_filename("notes/20260105 sync.txt") == "2026-01-05"
+        assert infer_meeting_date_from_filename("2026-13-40.md") is None
+        assert infer_meeting_date_from_filename("standup.md") is None
+
+    def test_zip_reader_filters_and_flags_oversized(self, monkeypatch):
+        from src.app.services import bulk_import
+
+        monkeypatch.setattr(bulk_import, "MAX_FILE_BYTES", 100)
+        archive = _zip({
+            "a.md": "# A\nhello world",
+            "big.txt": "x" * 500,
+            "image.png": "binary",
+            "__MACOSX/._a.md": "junk",
+            ".hidden.md": "junk",
+        })
+        entries = dict(bulk_import.iter_zip_transcripts(archive))
+
+        assert set(entries) == {"a.md", "big.txt"}
+        assert entries["a.md"].startswith(b"# A")
+        assert isinstance(entries["big.txt"], ValueError)
+
+    def test_helpers_still_exported_from_imports_api(self):
+        from src.app.services import bulk_import
+        from src.app.api.v1 import imports
+
+        assert imports.extract_markdown_text is bulk_import.extract_markdown_text
+        assert imports.infer_meeting_name_from_content is bulk_import.infer_meeting_name_from_content
+
+
+class TestBulkImporter:
+
+    def test_zip_import_records_meetings_and_history(self, temp_db):
+        from src.app.services.bulk_import import BulkImporter, get_bulk_import_progress, iter_zip_transcripts
+
+        archive = _zip({
+            "2026-01-20_planning.md": TRANSCRIPT.format(title="Sprint Planning", n=1),
+            "retro.txt": TRANSCRIPT.format(title="Retro", n=2),
+            "empty.md": "tiny",
+        })
+        batches = []
+        progress = BulkImporter(workers=2, batch_size=2, default_date="2026-02-01").run(
+            iter_zip_transcripts(archive), batch_id="batch-1", on_progress=lambda p: batches.append(p.processed)
+        )
+
+        assert progress.status == "completed"
+        assert (progress.discovered, progress.completed, progress.failed) == (3, 2, 1)
+        assert progress.signals > 0
+        assert batches == [2, 3]
+
+        with temp_db.connect() as conn:
+            meetings = {
+                r["meeting_name"]: dict(r)
+                for r in conn.execute("SELECT * FROM meeting_summaries WHERE import_source = 'bulk_import'")
+            }
+            history = conn.execute(
+                "SELECT filename, status, meeting_id FROM import_history WHERE batch_id = 'batch-1'"
+            ).fetchall()
+
+        assert meetings["Sprint Planning"]["meeting_date"] == "2026-01-20"
+        assert meetings["Retro"]["meeting_date"] == "2026-02-01"
+        assert meetings["Retro"]["signals_json"]
+        assert {r["filename"]: r["status"] for r in history} == {
+            "2026-01-20_planning.md": "completed", "retro.txt": "completed", "empty.md": "failed",
+        }
+        assert get_bulk_import_progress("batch-1")["completed"] == 2
+
+    def test_directory_import_inline(self, temp_db, tmp_path):
+        from src.app.services.bulk_import import BulkImporter, iter_transcript_sources
+
+        root = tmp_path / "transcripts"
+        (root / "q1").mkdir(parents=True)
+        (root / "q1" / "one.md").write_text(TRANSCRIPT.format(title="One", n=1))
+        (root / "two.markdown").write_text(TRANSCRIPT.format(title="Two", n=2))
+        (root / "notes.pdf").write_bytes(b"%PDF")
+
+        progress = BulkImporter(workers=1).run(iter_transcript_sources(root))
+        assert progress.completed == 2
+        assert len(progress.meeting_ids) == 2
@@ -0,0 +1,185 @@
+# tests/test_code_locker_store.py
+"""
+Tests for the code locker delta version store.
+
+Verifies snapshot/delta round-trips, content-hash dedup, bounded delta
+chains, legacy row compaction and the bounded per-hash-pair diff cache.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def locker_db(tmp_path, monkeypatch):
+    """Point the SQLite layer at a fresh temporary database."""
+    from src.app import db
+    from src.app.services import code_locker_store
+
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "locker.db"))
+    code_locker_store._content_cache.clear()
+    code_locker_store._diff_cache.clear()
+    db.init_db()
+    return db
+
+
+@pytest.fixture
+def store(locker_db):
+    from src.app.services.code_locker_store import CodeLockerStore
+    return CodeLockerStore
+
+
+def _source(n: int, edit: int = None) -> str:
+    lines = [f"def func_{i}(x):\n    return x + {i}\n" for i in range(n)]
+    if edit is not None:
+        lines[edit] = f"def func_{edit}(x):\n    return x * {edit}  # changed\n"
+    return "".join(lines)
+
+
+class TestVersionStore:
+    """Snapshot + delta storage."""
+
+    def test_delta_round_trip(self, store):
+        base = _source(50)
+        target = _source(50, edit=10)
+        ops = store.make_delta(base, target)
+
+        assert store.apply_delta(base, ops) == target
+        assert any(op[0] == 'c' for op in ops)
+
+    def test_versions_reconstruct_and_use_deltas(self, store, locker_db):
+        versions = [_source(80, edit=i) for i in range(5)]
+        with locker_db.connect() as conn:
+            for i, content in enumerate(versions, start=1):
+                store.insert_version(conn, "etl.py", content, None, i)
+            conn.commit()
+
+        from src.app.services import code_locker_store
+        code_locker_store._content_cache.clear()
+
+        with locker_db.connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM code_locker WHERE filename = 'etl.py' ORDER BY version"
+            ).fetchall()
+            assert [store.row_content(conn, r) for r in rows] == versions
+            storage = [
+                r['storage'] for r in conn.execute(
+                    "SELECT storage FROM code_locker_blobs ORDER BY rowid"
+                ).fetchall()
+            ]
+            stats = store.get_stats(conn)
+
+        assert storage[0] == 'full'
+        assert set(storage[1:]) == {'delta'}
+        assert stats['storage_ratio'] < 0.5
+
+    def test_identical_content_is_deduplicated(self, store, locker_db):
+        with locker_db.connect() as conn:
+            store.insert_version(conn, "a.py", _source(5), None, 1)
+            store.insert_version(conn, "a.py", _source(5), None, 2)
+            store.insert_version(conn, "copy_of_a.py", _source(5), None, 1)
+            blobs = conn.execute("SELECT COUNT(*) AS c FROM code_locker_blobs").fetchone()['c']
+
+        assert blobs == 1
+
+    def test_chain_depth_is_bounded(self, store, locker_db):
+        from src.app.services.code_locker_store import SNAPSHOT_INTERVAL
+
+        with locker_db.connect() as conn:
+            for i in range(SNAPSHOT_INTERVAL * 2 + 3):
+                store.insert_version(conn, "big.py", _source(60, edit=i % 60) + f"# rev {i}\n", None, i + 1)
+            max_depth = conn.execute(
+                "SELECT MAX(chain_depth) AS d FROM code_locker_blobs"
+            ).fetchone()['d']
+            snapshots = conn.execute(
+                "SELECT COUNT(*) AS c FROM code_locker_blobs WHERE storage = 'full'"
+            ).fetchone()['c']
+
+        assert max_depth < SNAPSHOT_INTERVAL
+        assert snapshots == 3
+
+    def test_compact_moves_legacy_rows(self, store, locker_db):
+        with locker_db.connect() as conn:
+            for v in (1, 2):
+                conn.execute(
+                    "INSERT INTO code_locker (filename, content, version) VALUES (?, ?, ?)",
+                    ("legacy.py", _source(20, edit=v), v)
+                )
+            assert store.compact(conn) == 2
+            assert store.compact(conn) == 0
+            rows = conn.execute(
+                "SELECT * FROM code_locker WHERE filename = 'legacy.py' ORDER BY version"
+            ).fetchall()
+
+            assert all(r['content'] == '' for r in rows)
+            assert store.row_content(conn, rows[1]) == _source(20, edit=2)
+
+
+class TestDiffCache:
+    """Version diffs are cached per content-hash pair."""
+
+    def test_diff_matches_and_is_cached(self, store, locker_db):
+        with locker_db.connect() as conn:
+            store.insert_version(conn, "job.py", "a\nb\nc\n", None, 1)
+            store.insert_version(conn, "job.py", "a\nB\nc\nd\n", None, 2)
+
+            first = store.diff_versions(conn, "job.py", 1, 2)
+            second = store.diff_versions(conn, "job.py", 1, 2)
+            stats = store.get_stats(conn)
+
+        assert first == second
+        assert first['diff'].startswith("--- job.py (v1)\n+++ job.py (v2)\n")
+        assert "+B\n" in first['diff'] and "-b\n" in first['diff']
+        # Counts include the +++/--- header lines, as before
+        assert first['lines_added'] == 3
+        assert first['lines_removed'] == 2
+        assert stats['cached_diffs'] == 1
+        assert stats['diff_cache_hits'] >= 1
+
+    def test_diff_cache_is_bounded(self, store, locker_db, monkeypatch):
+        from src.app.services import code_locker_store
+
+        monkeypatch.setattr(code_locker_store, "_DIFF_CACHE_SIZE", 2)
+        with locker_db.connect() as conn:
+            for v in range(1, 5):
+                store.insert_version(conn, "job.py", _source(5, edit=v), None, v)
+            for v in range(2, 5):
+                store.diff_versions(conn, "job.py", 1, v)
+
+        assert len(code_locker_store._diff_cache) == 2
+        assert [key[1] for key in code_locker_store._diff_cache] == [
+            store.compute_content_hash(_source(5, edit=v)) for v in (3, 4)
+        ]
+
+    def test_diff_does_not_write_legacy_rows(self, store, locker_db):
+        with locker_db.connect() as conn:
+            for v in (1, 2):
+                conn.execute(
+                    "INSERT INTO code_locker (filename, content, version) VALUES (?, ?, ?)",
+                    ("legacy.py", _source(5, edit=v), v)
+                )
+            conn.commit()
+
+            result = store.diff_versions(conn, "legacy.py", 1, 2)
+            blobs = conn.execute("SELECT COUNT(*) AS c FROM code_locker_blobs").fetchone()['c']
+            hashed = conn.execute(
+                "SELECT COUNT(*) AS c FROM code_locker WHERE content_hash IS NOT NULL"
+            ).fetchone()['c']
+
+        assert "changed" in result['diff']
+        assert blobs == 0
+        assert hashed == 0
+
+    def test_missing_version_returns_none(self, store, locker_db):
+        with locker_db.connect() as conn:
+            store.insert_version(conn, "job.py", "a\n", None, 1)
+            assert store.diff_versions(conn, "job.py", 1, 7) is None
+
+    def test_missing_blob_returns_none(self, store, locker_db):
+        from src.app.services import code_locker_store
+
+        with locker_db.connect() as conn:
+            store.insert_version(conn, "gone.py", "a\n", None, 1)
+            store.insert_version(conn, "gone.py", "b\n", None, 2)
+            conn.execute("DELETE FROM code_locker_blobs")
+            code_locker_store._content_cache.clear()
+            assert store.diff_versions(conn, "gone.py", 1, 2) is None
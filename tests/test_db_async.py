@@ -0,0 +1,112 @@
+# tests/test_db_async.py
+"""
+Tests for the async SQLite facade used by route handlers.
+
+Covers the read/write helpers, transaction commit/rollback, and that
+SQLite work happens on the reader pool and writer thread rather than the
+event loop.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def async_db(tmp_path, monkeypatch):
+    """Fresh database file and facade."""
+    from src.app import db, db_async
+
+    db.close_pool()
+    db_async.shutdown_async_db()
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "async.db"))
+    conn = db.connect()
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, qty INTEGER DEFAULT 0)")
+    conn.commit()
+    conn.close()
+    yield db_async
+    db_async.shutdown_async_db()
+    db.close_pool()
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncHelpers:
+    """fetch/execute helpers."""
+
+    def test_execute_returns_lastrowid_and_rowcount(self, async_db):
+        async def scenario():
+            first = await async_db.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+            second = await async_db.execute("INSERT INTO items (name) VALUES (?)", ("b",))
+            updated = await async_db.execute("UPDATE items SET qty = 5")
+            return first, second, updated
+
+        first, second, updated = run(scenario())
+        assert (first, second) == (1, 2)
+        assert updated == 2
+
+    def test_fetch_one_and_all(self, async_db):
+        async def scenario():
+            await async_db.executemany(
+                "INSERT INTO items (name) VALUES (?)", [("x",), ("y",), ("z",)]
+            )
+            row = await async_db.fetch_one("SELECT * FROM items WHERE name = ?", ("y",))
+            rows = await async_db.fetch_all("SELECT name FROM items ORDER BY id")
+            missing = await async_db.fetch_one("SELECT * FROM items WHERE name = 'nope'")
+            return row, rows, missing
+
+        row, rows, missing = run(scenario())
+        assert row["name"] == "y"
+        assert [r["name"] for r in rows] == ["x", "y", "z"]
+        assert missing is None
+
+    def test_run_read_runs_off_loop(self, async_db):
+        import threading
+
+        async def scenario():
+            return await async_db.run_read(lambda: threading.current_thread().name)
+
+        assert run(scenario()).startswith("sqlite-read")
+
+
+class TestTransactions:
+    """Multi-statement writes."""
+
+    def test_commits_on_success(self, async_db):
+        async def scenario():
+            async with async_db.transaction() as tx:
+                item_id = await tx.execute("INSERT INTO items (name) VALUES ('kept')")
+                await tx.execute("UPDATE items SET qty = 3 WHERE id = ?", (item_id,))
+                inside = await tx.fetch_one("SELECT qty FROM items WHERE id = ?", (item_id,))
+            after = await async_db.fetch_one("SELECT qty FROM items WHERE name = 'kept'")
+            return inside, after
+
+        inside, after = run(scenario())
+        assert inside["qty"] == 3
+        assert after["qty"] == 3
+
+    def test_rolls_back_on_error(self, async_db):
+        async def scenario():
+            with pytest.raises(ValueError):
+                async with async_db.transaction() as tx:
+                    await tx.execute("INSERT INTO items (name) VALUES ('lost')")
+                    raise ValueError("boom")
+            return await async_db.fetch_all("SELECT * FROM items")
+
+        assert run(scenario()) == []
+
+    def test_concurrent_writers_are_serialized(self, async_db):
+        async def bump():
+            async with async_db.transaction() as tx:
+                row = await tx.fetch_one("SELECT qty FROM items WHERE id = 1")
+                await asyncio.sleep(0)
+                await tx.execute("UPDATE items SET qty = ? WHERE id = 1", (row["qty"] + 1,))
+
+        async def scenario():
+            await async_db.execute("INSERT INTO items (name) VALUES ('counter')")
+            await asyncio.gather(*(bump() for _ in range(25)))
+            return await async_db.fetch_one("SELECT qty FROM items WHERE id = 1")
+
+        assert run(scenario())["qty"] == 25
@@ -0,0 +1,104 @@
+# tests/test_db_pool.py
+"""
+Tests for the pooled SQLite connection layer in db.connect().
+"""
+
+import logging
+import threading
+import pytest
+
+
+@pytest.fixture
+def pooled_db(tmp_path, monkeypatch):
+    """Fresh database file with an empty pool."""
+    from src.app import db
+
+    db.close_pool()
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "pool.db"))
+    conn = db.connect()
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    yield db
+    db.close_pool()
+
+
+class TestConnectionPool:
+    """Connections are reused and configured once."""
+
+    def test_connections_are_reused(self, pooled_db):
+        for _ in range(5):
+            with pooled_db.connect() as conn:
+                conn.execute("SELECT 1").fetchone()
+
+        # The previous wrapper is still bound to ``conn`` while the next one opens
+        stats = pooled_db.get_pool_stats()[0]
+        assert stats['created'] <= 2
+        assert stats['reused'] >= 4
+
+    def test_pragmas_applied(self, pooled_db):
+        with pooled_db.connect() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2   # MEMORY
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == pooled_db.SQLITE_BUSY_TIMEOUT_MS
+
+    def test_uncommitted_work_is_discarded_on_release(self, pooled_db):
+        conn = pooled_db.connect()
+        conn.execute("INSERT INTO items (name) VALUES ('pending')")
+        conn.close()
+
+        with pooled_db.connect() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert count == 0
+
+    def test_closed_wrapper_cannot_be_used(self, pooled_db):
+        import sqlite3
+
+        conn = pooled_db.connect()
+        conn.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_concurrent_threads(self, pooled_db):
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(20):
+                    with pooled_db.connect() as conn:
+                        conn.execute("INSERT INTO items (name) VALUES (?)", (f"{n}-{i}",))
+                        conn.commit()
+            except Exception as e:  # pragma: no cover - surfaced via assert below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        with pooled_db.connect() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert errors == []
+        assert count == 80
+        assert pooled_db.get_pool_stats()[0]['created'] <= 8
+
+
+class TestUsageLogging:
+    """Stack inspection only happens when a message is emitted."""
+
+    def test_no_stack_walk_for_quiet_queries(self, pooled_db, monkeypatch):
+        calls = []
+        monkeypatch.setattr(pooled_db, "_find_caller", lambda: calls.append(1) or "x")
+
+        with pooled_db.connect() as conn:
+            conn.execute("SELECT * FROM items").fetchall()
+        assert calls == []
+
+        pooled_db._sqlite_logger.setLevel(logging.DEBUG)
+        try:
+            with pooled_db.connect() as conn:
+                conn.execute("SELECT * FROM items").fetchall()
+        finally:
+            pooled_db._sqlite_logger.setLevel(logging.WARNING)
+        assert calls == [1]
@@ -0,0 +1,291 @@
+# tests/test_fake_backends.py
+"""
+Tests for the offline backend stand-ins: the SQLite-backed PostgREST fake,
+the fake LLM/embedding clients and their latency models, and the
+FAKE_BACKENDS wiring in the client factories.
+"""
+
+import asyncio
+import json
+import statistics
+import time
+
+import pytest
+
+
+@pytest.fixture
+def sb():
+    from src.app.infrastructure.fake_providers import LatencyModel
+    from src.app.infrastructure.fake_supabase import FakeSupabaseClient
+
+    client = FakeSupabaseClient(latency=LatencyModel())
+    client.table("meetings").insert([
+        {"id": "m1", "meeting_name": "Billing sync", "meeting_date": "2026-01-03", "signals": {"decisions": ["a"]},
+         "synthesized_notes": "billing migration plan", "priority": 2},
+        {"id": "m2", "meeting_name": "Pipeline review", "meeting_date": "2026-01-05", "signals": None,
+         "synthesized_notes": "pipeline latency regression", "priority": 5},
+        {"id": "m3", "meeting_name": "Vendor call", "meeting_date": None, "signals": {"risks": ["b"]},
+         "synthesized_notes": "vendor risk", "priority": 7},
+    ]).execute()
+    return client
+
+
+@pytest.fixture
+def fakes_enabled(monkeypatch):
+    from src.app.infrastructure import fake_providers, fake_supabase
+
+    monkeypatch.setenv("FAKE_BACKENDS", "all")
+    monkeypatch.setenv("FAKE_LLM_LATENCY", "0")
+    monkeypatch.setenv("FAKE_EMBED_LATENCY", "0")
+    monkeypatch.setenv("FAKE_SUPABASE_LATENCY", "0")
+    monkeypatch.setenv("FAKE_SUPABASE_SEED", "false")
+    fake_providers.reset_fake_clients()
+    fake_supabase.reset_fake_supabase_client()
+    yield
+    fake_providers.reset_fake_clients()
+    fake_supabase.reset_fake_supabase_client()
+
+
+class TestFakeSupabaseQueries:
+
+    def test_filters_order_and_paging(self, sb):
+        rows = sb.table("meetings").select("id, meeting_name").order("meeting_date", desc=True).execute().data
+        assert [r["id"] for r in rows] == ["m3", "m2", "m1"]  # NULLS FIRST when descending
+        assert set(rows[0]) == {"id", "meeting_name"}
+
+        page = sb.table("meetings").select("id", count="exact").order("priority").range(1, 2).execute()
+        assert [r["id"] for r in page.data] == ["m2", "m3"] and page.count == 3
+
+        assert [r["id"] for r in sb.table("meetings").select("id").gte("priority", 5).lt("priority", 7).execute().data] == ["m2"]
+        assert len(sb.table("meetings").select("id").in_("id", ["m1", "m3", "x"]).execute().data) == 2
+        assert sb.table("meetings").select("id").neq("id", "m1").limit(1).execute().data[0]["id"] == "m2"
+        assert sb.table("meetings").select("id").ilike("meeting_name", "%BILLING%").execute().data == [{"id": "m1"}]
+
+    def test_null_checks_or_and_single(self, sb):
+        from src.app.infrastructure.fake_supabase import FakePostgrestError
+
+        with_signals = sb.table("meetings").select("id").not_.is_("signals", "null").execute().data
+        assert {r["id"] for r in with_signals} == {"m1", "m3"}
+
+        either = sb.table("meetings").select("id").or_(
+            "meeting_name.ilike.%vendor%,synthesized_notes.ilike.%pipeline%").execute().data
+        assert {r["id"] for r in either} == {"m2", "m3"}
+
+        assert sb.table("meetings").select("*").eq("id", "m2").single().execute().data["priority"] == 5
+        assert sb.table("meetings").select("*").eq("id", "nope").maybe_single().execute().data is None
+        with pytest.raises(FakePostgrestError):
+            sb.table("meetings").select("*").single().execute()
+
+    def test_numeric_strings_match_integer_ids(self, sb):
+        sb.table("tickets").insert({"id": 7, "title": "Fix"}).execute()
+        assert sb.table("tickets").select("title").eq("id", "7").execute().data == [{"title": "Fix"}]
+
+    def test_writes(self, sb):
+        from src.app.infrastructure.fake_supabase import FakePostgrestError
+
+        created = sb.table("documents").insert({"source": "spec.md", "content": "x"}).execute().data[0]
+        assert created["id"] and created["created_at"]
+        with pytest.raises(FakePostgrestError):
+            sb.table("documents").insert({"id": created["id"], "source": "dup"}).execute()
+
+        updated = sb.table("documents").update({"content": "y"}).eq("source", "spec.md").execute().data
+        assert updated[0]["content"] == "y" and updated[0]["id"] == created["id"]
+
+        sb.table("documents").upsert({"source": "spec.md", "content": "z"}, on_conflict="source").execute()
+        rows = sb.table("documents").select("*").execute().data
+        assert len(rows) == 1 and rows[0]["content"] == "z"
+
+        deleted = sb.table("documents").delete().eq("id", created["id"]).execute().data
+        assert len(deleted) == 1 and sb.table("documents").select("id").execute().data == []
+
+    def test_rejects_unsafe_identifiers(self, sb):
+        from src.app.infrastructure.fake_supabase import FakePostgrestError
+
+        with pytest.raises(FakePostgrestError):
+            sb.table("meetings").select("*").eq("id') OR 1=1 --", "x")
+
+
+class TestFakeSupabaseRpc:
+
+    @pytest.fixture
+    def indexed(self, sb):
+        from src.app.infrastructure.fake_providers import hashed_embedding
+
+        sb.table("documents").insert([
+            {"id": "d1", "source": "billing.md", "content": "billing migration runbook"},
+            {"id": "d2", "source": "infra.md", "content": "kubernetes upgrade notes"},
+        ]).execute()
+        sb.table("embeddings").insert([
+            {"ref_type": "document", "ref_id": "d1", "embedding": hashed_embedding("billing migration runbook")},
+            {"ref_type": "document", "ref_id": "d2", "embedding": hashed_embedding("kubernetes upgrade notes")},
+            {"ref_type": "meeting", "ref_id": "m1", "embedding": hashed_embedding("billing migration plan")},
+        ]).execute()
+        return sb
+
+    def test_semantic_search(self, indexed):
+        from src.app.infrastructure.fake_providers import hashed_embedding
+
+        params = {"query_embedding": hashed_embedding("billing migration"), "match_threshold": 0.3, "match_count": 5}
+        results = indexed.rpc("semantic_search", params).execute().data
+        assert {r["ref_id"] for r in results} == {"m1", "d1"}
+        assert all(r["similarity"] >= 0.3 for r in results)
+
+        docs = indexed.rpc("match_embeddings", {**params, "filter_ref_type": "document"}).execute().data
+        assert [r["ref_id"] for r in docs] == ["d1"]
+
+    def test_hybrid_search_fuses_keyword_and_semantic(self, indexed):
+        from src.app.infrastructure.fake_providers import hashed_embedding
+
+        results = indexed.rpc("hybrid_search", {
+            "query_text": "billing", "query_embedding": hashed_embedding("billing migration"), "match_count": 3,
+        }).execute().data
+        assert {r["id"] for r in results[:2]} == {"d1", "m1"}
+        assert results[0]["rrf_score"] >= results[-1]["rrf_score"]
+        assert {"id", "ref_type", "source_name", "content", "rrf_score"} <= set(results[0])
+
+    def test_vector_cache_follows_writes(self, indexed):
+        from src.app.infrastructure.fake_providers import hashed_embedding
+
+        query = {"query_embedding": hashed_embedding("kubernetes upgrade"), "match_threshold": 0.3, "match_count": 5}
+        assert [r["ref_id"] for r in indexed.rpc("semantic_search", query).execute().data] == ["d2"]
+        indexed.table("embeddings").delete().eq("ref_id", "d2").execute()
+        assert indexed.rpc("semantic_search", query).execute().data == []
+
+    def test_unknown_function(self, sb):
+        from src.app.infrastructure.fake_supabase import FakePostgrestError
+
+        with pytest.raises(FakePostgrestError):
+            sb.rpc("does_not_exist", {}).execute()
+
+
+class TestSeeding:
+
+    def test_seed_from_sqlite(self, tmp_path, monkeypatch):
+        from src.app import db
+        from src.app.infrastructure.fake_providers import LatencyModel
+        from src.app.infrastructure.fake_supabase import FakeSupabaseClient
+
+        db.close_pool()
+        monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "seed.db"))
+        db.init_db()
+        with db.connect() as conn:
+            conn.execute(
+                "INSERT INTO meeting_summaries (id, meeting_name, synthesized_notes, meeting_date, signals_json) "
+                "VALUES (1, 'Sync', 'notes', '2026-01-02', ?)", (json.dumps({"decisions": ["Ship"]}),),
+            )
+            conn.execute("INSERT INTO docs (id, source, content) VALUES (1, 'a.md', 'text')")
+            conn.execute("INSERT INTO embeddings (ref_type, ref_id, model, vector) VALUES ('doc', 1, 'm', '[1.0, 0.0]')")
+            conn.commit()
+            client = FakeSupabaseClient(latency=LatencyModel())
+            counts = client.seed_from_sqlite(conn)
+        db.close_pool()
+
+        assert counts["meetings"] == 1 and counts["documents"] == 1 and counts["embeddings"] == 1
+        meeting = client.table("meetings").select("*").eq("id", 1).single().execute().data
+        assert meeting["signals"] == {"decisions": ["Ship"]}
+        emb = client.table("embeddings").select("*").execute().data[0]
+        assert emb["ref_type"] == "document" and emb["embedding"] == [1.0, 0.0]
+
+
+class TestLatencyModel:
+
+    def test_parse(self):
+        from src.app.infrastructure.fake_providers import LatencyModel
+
+        assert LatencyModel.parse("").sample() == 0.0
+        assert LatencyModel.parse("0").sample() == 0.0
+        assert LatencyModel.parse("fixed:25").sample() == pytest.approx(0.025)
+        assert LatencyModel.parse("40").sample() == pytest.approx(0.040)
+        uniform = LatencyModel.parse("uniform:10:20")
+        assert all(0.010 <= uniform.sample() <= 0.020 for _ in range(50))
+        with pytest.raises(ValueError):
+            LatencyModel.parse("pareto:1:2")
+
+    def test_deterministic_and_centered(self):
+        from src.app.infrastructure.fake_providers import LatencyModel
+
+        a, b = LatencyModel.parse("lognormal:100:0.5", seed=3), LatencyModel.parse("lognormal:100:0.5", seed=3)
+        assert [a.sample() for _ in range(5)] == [b.sample() for _ in range(5)]
+
+        model = LatencyModel.parse("lognormal:100:0.5", seed=1)
+        samples = [model.sample() for _ in range(2000)]
+        assert statistics.median(samples) == pytest.approx(0.100, rel=0.1)
+        assert min(samples) >= 0.0
+
+    def test_sleep(self):
+        from src.app.infrastructure.fake_providers import LatencyModel
+
+        model = LatencyModel.parse("fixed:20")
+        start = time.perf_counter()
+        asyncio.run(model.asleep())
+        assert time.perf_counter() - start >= 0.018
+
+
+class TestFakeClients:
+
+    def test_openai_shapes_are_deterministic(self):
+        from src.app.infrastructure.fake_providers import FakeOpenAI, LatencyModel
+
+        client = FakeOpenAI(LatencyModel(), LatencyModel())
+        messages = [{"role": "user", "content": "Summarise the sprint"}]
+        first = client.chat.completions.create(model="gpt-4.1-mini", messages=messages)
+        second = client.chat.completions.create(model="gpt-4.1-mini", messages=messages)
+        assert first.choices[0].message.content == second.choices[0].message.content
+        assert first.usage.total_tokens > 0
+
+        answer = client.responses.create(model="gpt-4.1-mini", input="Return JSON with the owners").output_text
+        assert json.loads(answer)["fake"] is True
+
+        data = client.embeddings.create(model="text-embedding-3-small", input=["a b", "a b", "c"]).data
+        assert data[0].embedding == data[1].embedding != data[2].embedding
+        assert sum(x * x for x in data[0].embedding) == pytest.approx(1.0)
+
+    def test_async_clients_and_custom_responder(self):
+        from src.app.infrastructure.fake_providers import (
+            FakeAsyncAnthropic, FakeAsyncOpenAI, LatencyModel, set_llm_responder,
+        )
+
+        set_llm_responder(lambda prompt, model: f"{model}:{prompt[-5:]}")
+        try:
+            async def run():
+                msg = await FakeAsyncAnthropic(LatencyModel()).messages.create(
+                    model="claude-sonnet-4", system="be brief", messages=[{"role": "user", "content": "hello"}])
+                chat = await FakeAsyncOpenAI(LatencyModel(), LatencyModel()).chat.completions.create(
+                    model="gpt-5", messages=[{"role": "user", "content": "world"}])
+                return msg.content[0].text, chat.choices[0].message.content
+
+            assert asyncio.run(run()) == ("claude-sonnet-4:hello", "gpt-5:world")
+        finally:
+            set_llm_responder(None)
+
+
+class TestWiring:
+
+    def test_disabled_by_default(self, monkeypatch):
+        from src.app.infrastructure.fake_providers import fake_backend_enabled
+
+        monkeypatch.delenv("FAKE_BACKENDS", raising=False)
+        assert not fake_backend_enabled("supabase")
+        monkeypatch.setenv("FAKE_BACKENDS", "llm, embeddings")
+        assert fake_backend_enabled("llm") and fake_backend_enabled("embeddings")
+        assert not fake_backend_enabled("supabase")
+
+    def test_factories_return_fakes(self, fakes_enabled, monkeypatch):
+        from src.app import llm
+        from src.app.infrastructure.fake_providers import FakeAnthropic, FakeAsyncOpenAI, FakeOpenAI
+        from src.app.infrastructure.fake_supabase import FakeSupabaseClient, get_fake_supabase_client
+        from src.app.infrastructure.supabase_client import get_supabase_client
+        from src.app.memory import embed
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        assert get_supabase_client() is get_fake_supabase_client()
+        assert isinstance(get_supabase_client(), FakeSupabaseClient)
+        assert isinstance(llm._openai_client_once(), FakeOpenAI)
+        assert isinstance(llm._anthropic_client_once(), FakeAnthropic)
+        assert isinstance(embed.client(), FakeOpenAI)
+
+        async def run():
+            return llm._async_openai_client_once()
+        assert isinstance(asyncio.run(run()), FakeAsyncOpenAI)
+
+        assert len(embed.embed_text("billing migration")) > 0
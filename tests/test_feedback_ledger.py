@@ -0,0 +1,176 @@
+# tests/test_feedback_ledger.py
+"""
+Tests for the local evaluation feedback ledger: rollups maintained on
+write, dedupe/retract, summary and dashboard reads, and LangSmith
+reconciliation.
+"""
+
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_langsmith(monkeypatch):
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+    monkeypatch.delenv("LANGCHAIN_API_KEY", raising=False)
+
+
+def _rollup(db, agent_name, key):
+    with db.connect() as conn:
+        return conn.execute(
+            "SELECT SUM(count), SUM(scored), SUM(score_sum), SUM(low_count) FROM feedback_daily_rollup "
+            "WHERE agent_name = ? AND key = ?",
+            (agent_name, key),
+        ).fetchone()
+
+
+class TestRollups:
+
+    def test_rollup_maintained_on_write(self, temp_db):
+        from src.app.services.feedback_ledger import record_feedback
+
+        record_feedback("helpfulness", score=0.9, source="api", run_id="r1", agent_name="arjuna")
+        record_feedback("helpfulness", score=0.3, source="api", run_id="r2", agent_name="arjuna")
+        record_feedback("helpfulness", value="partial", source="api", run_id="r3", agent_name="arjuna")
+
+        count, scored, score_sum, low = _rollup(temp_db, "arjuna", "helpfulness")
+        assert (count, scored, low) == (3, 2, 1)
+        assert score_sum == pytest.approx(1.2)
+
+    def test_dedupe_key_replaces_earlier_event(self, temp_db):
+        from src.app.services.evaluations import submit_thumbs_feedback
+
+        submit_thumbs_feedback("run-1", is_positive=True, user_id="u1")
+        submit_thumbs_feedback("run-1", is_positive=False, user_id="u1")
+        submit_thumbs_feedback("run-1", is_positive=True, user_id="u2")
+
+        count, scored, score_sum, low = _rollup(temp_db, "", "user_feedback")
+        assert (count, scored, low) == (2, 2, 1)
+        assert score_sum == pytest.approx(1.0)
+
+    def test_signal_votes_toggle_and_clear(self, temp_db):
+        from src.app.services.feedback_ledger import record_signal_vote
+
+        with temp_db.connect() as conn:
+            record_signal_vote(conn, 7, "decision", "Ship on Friday", "up")
+            record_signal_vote(conn, 7, "decision", "Ship on Friday", "down")
+            record_signal_vote(conn, 7, "risk", "Vendor delay", "up")
+            conn.commit()
+        assert _rollup(temp_db, "meeting_analyzer", "signal_feedback")[:2] == (2, 2)
+
+        with temp_db.connect() as conn:
+            record_signal_vote(conn, 7, "decision", "Ship on Friday", None)
+            conn.commit()
+        count, scored, score_sum, low = _rollup(temp_db, "meeting_analyzer", "signal_feedback")
+        assert (count, score_sum, low) == (1, 1.0, 0)
+
+
+class TestReads:
+
+    def test_summary_filters_by_agent_and_window(self, temp_db):
+        from src.app.services.evaluations import get_feedback_summary
+        from src.app.services.feedback_ledger import record_feedback
+
+        record_feedback("accuracy", score=0.8, source="agent", agent_name="arjuna")
+        record_feedback("accuracy", score=0.4, source="agent", agent_name="arjuna")
+        record_feedback("accuracy", score=0.1, source="agent", agent_name="ticket_agent")
+        record_feedback("accuracy", score=0.0, source="agent", agent_name="arjuna",
+                        created_at=time.time() - 30 * 86400)
+
+        summary = get_feedback_summary(agent_name="arjuna", days=7)
+        assert summary["agent_name"] == "arjuna" and summary["period_days"] == 7
+        assert summary["metrics"]["accuracy"] == {"count": 2, "average_score": 0.6, "low_scores": 1}
+
+        assert get_feedback_summary(days=7)["metrics"]["accuracy"]["count"] == 3
+        assert get_feedback_summary(days=60)["metrics"]["accuracy"]["count"] == 4
+
+    def test_dashboard_lists_low_scores_and_unsynced(self, temp_db):
+        from src.app.services.feedback_ledger import get_dashboard, record_feedback
+
+        record_feedback("relevance", score=0.2, source="auto_evaluator", run_id="bad", agent_name="arjuna",
+                        comment="off topic")
+        record_feedback("relevance", score=0.9, source="auto_evaluator", run_id="good", agent_name="arjuna",
+                        langsmith_feedback_id="ls-1")
+
+        dashboard = get_dashboard(days=7)
+        assert dashboard["scores"]["relevance"]["average_score"] == pytest.approx(0.55)
+        assert dashboard["by_agent"]["arjuna"]["relevance"]["count"] == 2
+        assert dashboard["stats"] == {"feedback_events": 2, "scored_events": 2, "unsynced_events": 1}
+        assert [e["run_id"] for e in dashboard["low_score_events"]] == ["bad"]
+        assert dashboard["daily"][0]["count"] == 2
+
+
+class _FakeLangSmith:
+
+    def __init__(self, remote=()):
+        self.created = []
+        self.remote = list(remote)
+
+    def create_feedback(self, **kwargs):
+        self.created.append(kwargs)
+        return SimpleNamespace(id=f"ls-{len(self.created)}")
+
+    def list_feedback(self, limit=100):
+        return self.remote
+
+
+class TestReconcile:
+
+    def test_pushes_unsynced_and_pulls_new_remote_feedback(self, temp_db):
+        from src.app.services.feedback_ledger import reconcile_with_langsmith, record_feedback
+
+        record_feedback("helpfulness", score=0.7, source="api", run_id="run-1", agent_name="arjuna")
+        record_feedback("helpfulness", score=0.9, source="api", run_id="run-2", langsmith_feedback_id="ls-known")
+        record_feedback("helpfulness", score=0.5, source="api")  # no run: nothing to attach it to
+
+        remote = [
+            SimpleNamespace(id="ls-known", key="helpfulness", score=0.9, value=None, run_id="run-2",
+                            comment=None, source_info={}, created_at=datetime.now(timezone.utc)),
+            SimpleNamespace(id="ls-ui", key="correctness", score=1, value=None, run_id="run-3",
+                            comment="annotated", source_info={"agent_name": "ticket_agent"},
+                            created_at=datetime.now(timezone.utc)),
+        ]
+        client = _FakeLangSmith(remote)
+
+        result = reconcile_with_langsmith(client=client)
+        assert result == {"pushed": 1, "pulled": 1, "errors": 0}
+        assert client.created[0]["run_id"] == "run-1" and client.created[0]["score"] == 0.7
+        assert _rollup(temp_db, "ticket_agent", "correctness")[0] == 1
+
+        again = reconcile_with_langsmith(client=client)
+        assert again == {"pushed": 0, "pulled": 0, "errors": 0}
+
+    def test_toggled_vote_is_not_pulled_back(self, temp_db):
+        from src.app.services.evaluations import submit_thumbs_feedback
+        from src.app.services.feedback_ledger import reconcile_with_langsmith
+
+        class _EchoLangSmith(_FakeLangSmith):
+            """Pushed feedback shows up in later list_feedback calls, like LangSmith."""
+
+            def create_feedback(self, **kwargs):
+                fb = super().create_feedback(**kwargs)
+                self.remote.append(SimpleNamespace(
+                    id=fb.id, key=kwargs["key"], score=kwargs.get("score"), value=kwargs.get("value"),
+                    run_id=kwargs["run_id"], comment=kwargs.get("comment"), source_info={},
+                    created_at=datetime.now(timezone.utc),
+                ))
+                return fb
+
+        client = _EchoLangSmith()
+        submit_thumbs_feedback("run-1", is_positive=True, user_id="u1")
+        assert reconcile_with_langsmith(client=client)["pushed"] == 1
+
+        submit_thumbs_feedback("run-1", is_positive=False, user_id="u1")
+        assert reconcile_with_langsmith(client=client) == {"pushed": 1, "pulled": 0, "errors": 0}
+        assert reconcile_with_langsmith(client=client) == {"pushed": 0, "pulled": 0, "errors": 0}
+
+        count, scored, score_sum, low = _rollup(temp_db, "", "user_feedback")
+        assert (count, score_sum, low) == (1, 0.0, 1)
+
+    def test_skipped_without_langsmith(self, temp_db):
+        from src.app.services.background_jobs import run_job
+
+        assert run_job("feedback_reconcile")["skipped"] is True
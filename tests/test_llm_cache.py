@@ -0,0 +1,173 @@
+# tests/test_llm_cache.py
+"""
+Tests for the persistent LLM response cache.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    from src.app.metrics import get_metrics
+
+    get_metrics().reset()
+
+
+@pytest.fixture
+def router(monkeypatch):
+    """Policy with two cached task types and one uncached one."""
+    from src.app.agents import model_router
+    from src.app.agents.model_router import ModelRouter
+
+    router = ModelRouter()
+    router.policy = {"task_types": {
+        "parsing": {"default_model": "gpt-4o-mini", "cache_ttl_seconds": 3600},
+        "summarization": {"default_model": "gpt-4o-mini", "cache_ttl_seconds": 60},
+        "conversation": {"default_model": "gpt-4o-mini"},
+    }}
+    router.task_configs = {}
+    router._parse_policy()
+    monkeypatch.setattr(model_router, "_global_router", router)
+    return router
+
+
+class TestStore:
+
+    def test_key_covers_all_inputs(self):
+        from src.app.llm_cache import make_key
+
+        base = make_key("gpt-4o", "sys", "prompt", 0.2, 500)
+        assert base == make_key("gpt-4o", "sys", "prompt", 0.2, 500)
+        assert len({
+            base,
+            make_key("gpt-4o-mini", "sys", "prompt", 0.2, 500),
+            make_key("gpt-4o", "other", "prompt", 0.2, 500),
+            make_key("gpt-4o", "sys", "prompt!", 0.2, 500),
+            make_key("gpt-4o", "sys", "prompt", 0.7, 500),
+            make_key("gpt-4o", "sys", "prompt", 0.2, 1000),
+        }) == 6
+
+    def test_opt_in_per_task_type(self, temp_db, router):
+        from src.app import llm_cache
+
+        assert llm_cache.lookup_key("conversation", "gpt-4o", None, "hi") is None
+        assert llm_cache.lookup_key(None, "gpt-4o", None, "hi") is None
+        assert llm_cache.lookup_key("parsing", "gpt-4o", None, "hi")
+
+    def test_hit_miss_and_expiry(self, temp_db, router, monkeypatch):
+        from src.app import llm_cache
+
+        key = llm_cache.make_key("m", None, "plan this")
+        assert llm_cache.get(key, "parsing") is None
+        llm_cache.put(key, "parsing", "m", '{"keywords": []}')
+        assert llm_cache.get(key, "parsing") == '{"keywords": []}'
+
+        stats = llm_cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["by_task_type"]["parsing"]["hits"] == 1
+        assert stats["process"]["parsing"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+        now = time.time()
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now + 7200)
+        assert llm_cache.get(key, "parsing") is None
+
+    def test_prune_evicts_least_recently_used(self, temp_db, router):
+        from src.app import llm_cache
+
+        for i in range(10):
+            llm_cache.put(f"k{i}", "parsing", "m", "x" * 100)
+        llm_cache.get("k0", "parsing")  # k0 becomes most recently used
+
+        with temp_db.connect() as conn:
+            deleted = llm_cache.prune(conn, max_entries=5, max_bytes=10_000)
+            conn.commit()
+            keys = {r["key"] for r in conn.execute("SELECT key FROM llm_response_cache")}
+            assert deleted == 5 and "k0" in keys and "k1" not in keys
+
+            llm_cache.prune(conn, max_entries=100, max_bytes=250)
+            conn.commit()
+            assert conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0] == 2
+
+    def test_async_access_stays_off_the_event_loop(self, temp_db, router, monkeypatch):
+        import threading
+        from src.app import llm_cache
+
+        loop_threads = set()
+        real_connect = llm_cache.connect
+
+        def connect():
+            assert threading.get_ident() not in loop_threads, "SQLite opened on the event loop"
+            return real_connect()
+
+        monkeypatch.setattr(llm_cache, "connect", connect)
+        key = llm_cache.make_key("m", None, "tag this")
+
+        async def scenario():
+            loop_threads.add(threading.get_ident())
+            assert await llm_cache.aget(key, "parsing") is None
+            await llm_cache.aput(key, "parsing", "m", "tags")
+            hit = await llm_cache.aget(key, "parsing")
+            await asyncio.gather(*llm_cache._pending)  # deferred recency bump
+            return hit
+
+        assert asyncio.run(scenario()) == "tags"
+        with temp_db.connect() as conn:
+            assert conn.execute("SELECT hits FROM llm_response_cache WHERE key = ?", (key,)).fetchone()[0] == 1
+
+
+class TestCallSites:
+
+    def test_llm_ask_serves_repeats_from_cache(self, temp_db, router, monkeypatch):
+        from src.app import llm
+
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=" summary "))])
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr(llm, "_openai_client_once", lambda: client)
+
+        assert llm.ask("Summarize ticket 1", model="gpt-4o-mini", task_type="summarization") == "summary"
+        assert llm.ask("Summarize ticket 1", model="gpt-4o-mini", task_type="summarization") == "summary"
+        assert len(calls) == 1
+
+        llm.ask("Summarize ticket 1", model="gpt-4o-mini")  # no task type: never cached
+        llm.ask("Summarize ticket 2", model="gpt-4o-mini", task_type="summarization")
+        assert len(calls) == 3
+
+    def test_agent_ask_llm_uses_cache(self, temp_db, router):
+        pytest.importorskip("pydantic")
+        from src.app.agents.base import AgentConfig, BaseAgent
+
+        class EchoAgent(BaseAgent):
+            def get_system_prompt(self, **kwargs):
+                return "system"
+
+            async def run(self, *args, **kwargs):
+                return {}
+
+        llm_client = SimpleNamespace(calls=0)
+
+        async def ask(**kwargs):
+            llm_client.calls += 1
+            return f"answer {llm_client.calls}"
+
+        llm_client.ask = ask
+        agent = EchoAgent(AgentConfig(name="echo", description="test"), llm_client=llm_client, model_router=router)
+
+        async def scenario():
+            return [
+                await agent.ask_llm("classify this", task_type="parsing"),
+                await agent.ask_llm("classify this", task_type="parsing"),
+                await agent.ask_llm("chat with me", task_type="conversation"),
+                await agent.ask_llm("chat with me", task_type="conversation"),
+            ]
+
+        assert asyncio.run(scenario()) == ["answer 1", "answer 1", "answer 2", "answer 3"]
+        assert agent.interaction_log[1]["status"] == "cached"
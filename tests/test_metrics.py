@@ -0,0 +1,186 @@
+# tests/test_metrics.py
+"""
+Tests for the in-process latency metrics: histograms, dependency timers,
+the ASGI middleware and the Prometheus / JSON exports.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def registry():
+    from src.app import metrics
+
+    metrics.get_metrics().reset()
+    yield metrics.get_metrics()
+    metrics.get_metrics().reset()
+
+
+class TestHistogram:
+
+    def test_percentiles_within_one_bucket(self):
+        from src.app.metrics import Histogram
+
+        hist = Histogram()
+        for ms in range(1, 101):
+            hist.observe(ms / 1000)
+
+        summary = hist.summary()
+        assert summary["count"] == 100
+        assert 50 <= summary["p50_ms"] <= 100
+        assert 95 <= summary["p99_ms"] <= 100
+        assert summary["max_ms"] == 100.0
+
+    def test_overflow_lands_in_inf_bucket(self):
+        from src.app.metrics import Histogram
+
+        hist = Histogram()
+        hist.observe(500.0)
+        assert hist.counts[-1] == 1
+        assert hist.quantile(0.99) == 500.0
+
+
+class TestTimers:
+
+    def test_timer_records_latency_and_errors(self, registry):
+        from src.app.metrics import DEPENDENCY_ERRORS, timer
+
+        with timer("llm", "llm.ask"):
+            pass
+        with pytest.raises(ValueError):
+            with timer("llm", "llm.ask"):
+                raise ValueError("boom")
+
+        key = (("caller", "llm.ask"), ("kind", "llm"))
+        assert registry.histogram("signalflow_dependency_duration_seconds", key).count == 2
+        assert registry._counters[DEPENDENCY_ERRORS][key] == 1
+
+    def test_timed_decorator_handles_async(self, registry):
+        from src.app.metrics import timed
+
+        @timed("embedding", "search.query")
+        async def embed():
+            return [0.1]
+
+        assert asyncio.run(embed()) == [0.1]
+        deps = registry.snapshot()["dependencies"]
+        assert deps[0]["caller"] == "search.query" and deps[0]["count"] == 1
+
+    def test_db_queries_are_timed_by_statement(self, registry, tmp_path, monkeypatch):
+        from src.app import db
+
+        db.close_pool()
+        monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "metrics.db"))
+        db.init_db()
+        try:
+            with db.connect() as conn:
+                conn.execute("SELECT COUNT(*) FROM meeting_summaries WHERE id = ?", (1,)).fetchone()
+        finally:
+            db.close_pool()
+
+        callers = {d["caller"] for d in registry.snapshot()["dependencies"] if d["kind"] == "db"}
+        assert "SELECT meeting_summaries" in callers
+
+    def test_sql_label(self):
+        from src.app.metrics import sql_label
+
+        assert sql_label("  insert into signal_status (a) values (?)") == "INSERT signal_status"
+        assert sql_label("WITH x AS (SELECT 1) SELECT * FROM tickets") == "SELECT tickets"
+        assert sql_label("PRAGMA journal_mode=WAL") == "PRAGMA"
+
+
+class TestMiddleware:
+
+    def _call(self, path, status=200, raise_error=False):
+        from src.app.metrics import MetricsMiddleware
+
+        def endpoint():
+            pass
+
+        route = SimpleNamespace(path="/api/meetings/{meeting_id}", endpoint=endpoint)
+        app_obj = SimpleNamespace(routes=[route])
+
+        async def app(scope, receive, send):
+            scope["endpoint"] = endpoint  # what the router adds to the shared scope
+            if raise_error:
+                raise RuntimeError("handler failed")
+            await send({"type": "http.response.start", "status": status, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def send(message):
+            pass
+
+        scope = {"type": "http", "method": "GET", "path": path, "app": app_obj}
+        asyncio.run(MetricsMiddleware(app)(scope, None, send))
+
+    def test_routes_labelled_by_template(self, registry):
+        self._call("/api/meetings/1")
+        self._call("/api/meetings/2", status=503)
+        with pytest.raises(RuntimeError):
+            self._call("/api/meetings/3", raise_error=True)
+
+        routes = registry.snapshot()["routes"]
+        assert len(routes) == 1
+        route = routes[0]
+        assert (route["route"], route["method"], route["count"], route["errors"]) == (
+            "/api/meetings/{meeting_id}", "GET", 3, 2
+        )
+        assert registry.snapshot()["in_flight"] == 0
+
+    def test_prometheus_exposition(self, registry):
+        self._call("/api/meetings/1")
+
+        text = registry.render_prometheus()
+        assert "# TYPE signalflow_http_request_duration_seconds histogram" in text
+        assert (
+            'signalflow_http_requests_total{method="GET",route="/api/meetings/{meeting_id}",status="200"} 1'
+            in text
+        )
+        assert 'signalflow_http_request_duration_seconds_bucket{method="GET",route="/api/meetings/{meeting_id}",le="+Inf"} 1' in text
+        assert "signalflow_http_requests_in_flight 0" in text
+
+    def test_disabled_registry_records_nothing(self, registry, monkeypatch):
+        from src.app.metrics import timer
+
+        monkeypatch.setattr(registry, "enabled", False)
+        with timer("db", "SELECT x"):
+            pass
+        self._call("/api/meetings/1")
+        assert registry.snapshot()["routes"] == []
+        assert registry.snapshot()["dependencies"] == []
+
+
+class TestEndpoints:
+
+    def test_scrape_needs_a_session_unless_metrics_token_is_set(self, temp_db, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.app.main import app
+
+        client = TestClient(app)
+        monkeypatch.delenv("BYPASS_TOKEN", raising=False)
+        monkeypatch.delenv("METRICS_TOKEN", raising=False)
+        assert client.get("/metrics").status_code == 401
+
+        monkeypatch.setenv("METRICS_TOKEN", "s3cret")
+        assert client.get("/metrics").status_code == 401
+        response = client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+        assert response.status_code == 200
+        assert "signalflow_http_requests_in_flight" in response.text
+
+    def test_admin_snapshot_is_read_only_and_reset_is_a_post(self, registry):
+        from src.app.api import admin
+        from src.app.metrics import timer
+
+        with timer("db", "SELECT x"):
+            pass
+
+        assert admin.get_metrics_snapshot()["dependencies"]
+        assert admin.get_metrics_snapshot()["dependencies"]
+        assert admin.reset_metrics()["dependencies"]
+        assert not admin.get_metrics_snapshot()["dependencies"]
+        assert ("POST", "/api/admin/metrics/reset") in {
+            (method, route.path) for route in admin.router.routes for method in route.methods
+        }
@@ -0,0 +1,177 @@
+# tests/test_mindmap_synthesis.py
+"""
+Tests for incremental mindmap synthesis.
+
+Verifies that extractions are cached per content hash, that the running
+topic/relationship aggregates update on insert and delete, and that
+synthesis refreshes only send mindmaps added since the previous synthesis.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+
+def _mindmap(root: str, children: list) -> dict:
+    nodes = [{'id': 'root', 'title': root, 'level': 0, 'parent_id': None}]
+    edges = []
+    for i, child in enumerate(children):
+        nodes.append({'id': f'n{i}', 'title': child, 'level': 1, 'parent_id': 'root'})
+        edges.append({'source': 'root', 'target': f'n{i}'})
+    return {'nodes': nodes, 'edges': edges}
+
+
+@pytest.fixture
+def synth_db(tmp_path, monkeypatch):
+    """Point the SQLite layer at a fresh temporary database."""
+    from src.app import db
+
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "mindmaps.db"))
+    db.init_db()
+    return db
+
+
+@pytest.fixture
+def synthesizer(synth_db):
+    from src.app.services.mindmap_synthesis import MindmapSynthesizer
+    return MindmapSynthesizer
+
+
+class TestExtractionCache:
+    """Per-mindmap extraction caching and running aggregates."""
+
+    def test_store_indexes_extraction(self, synthesizer, synth_db):
+        mindmap_id = synthesizer.store_conversation_mindmap(
+            "meeting_1", _mindmap("Pipeline", ["DAG", "Pricing"]), title="Planning"
+        )
+
+        with synth_db.connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM mindmap_extractions WHERE first_mindmap_id = ?", (mindmap_id,)
+            ).fetchone()
+
+        assert row is not None
+        assert json.loads(row['key_topics']) == ["Pipeline", "DAG", "Pricing"]
+        assert row['node_count'] == 3
+
+    def test_duplicate_content_reuses_extraction(self, synthesizer, synth_db):
+        data = _mindmap("Pipeline", ["DAG"])
+        synthesizer.store_conversation_mindmap("meeting_1", data)
+        synthesizer.store_conversation_mindmap("meeting_1", data)
+
+        with synth_db.connect() as conn:
+            extractions = conn.execute("SELECT COUNT(*) AS c FROM mindmap_extractions").fetchone()['c']
+            mention = conn.execute(
+                "SELECT mention_count FROM mindmap_topic_stats WHERE topic = 'Pipeline'"
+            ).fetchone()['mention_count']
+
+        assert extractions == 1
+        assert mention == 1
+
+    def test_aggregates_accumulate_across_mindmaps(self, synthesizer):
+        synthesizer.store_conversation_mindmap("meeting_1", _mindmap("Pipeline", ["DAG"]))
+        synthesizer.store_conversation_mindmap("meeting_2", _mindmap("Pipeline", ["Pricing"]))
+
+        topics = {t['topic']: t['mention_count'] for t in synthesizer.get_aggregate_topics()}
+        relationships = synthesizer.get_aggregate_relationships()
+
+        assert topics["Pipeline"] == 2
+        assert topics["DAG"] == 1
+        assert {(r['source'], r['target']) for r in relationships} == {
+            ("Pipeline", "DAG"), ("Pipeline", "Pricing")
+        }
+
+    def test_delete_subtracts_from_aggregates(self, synthesizer, synth_db):
+        synthesizer.store_conversation_mindmap("meeting_1", _mindmap("Pipeline", ["DAG"]))
+        synthesizer.store_conversation_mindmap("meeting_2", _mindmap("Pipeline", ["Pricing"]))
+
+        assert synthesizer.delete_conversation_mindmaps("meeting_2") == 1
+
+        topics = {t['topic']: t['mention_count'] for t in synthesizer.get_aggregate_topics()}
+        relationships = synthesizer.get_aggregate_relationships()
+        with synth_db.connect() as conn:
+            extractions = conn.execute("SELECT COUNT(*) AS c FROM mindmap_extractions").fetchone()['c']
+
+        assert topics == {"Pipeline": 1, "DAG": 1}
+        assert {(r['source'], r['target']) for r in relationships} == {("Pipeline", "DAG")}
+        assert extractions == 1
+
+    def test_delete_keeps_content_shared_with_another_mindmap(self, synthesizer):
+        data = _mindmap("Pipeline", ["DAG"])
+        synthesizer.store_conversation_mindmap("meeting_1", data)
+        synthesizer.store_conversation_mindmap("meeting_2", data)
+
+        synthesizer.delete_conversation_mindmaps("meeting_1")
+
+        topics = {t['topic']: t['mention_count'] for t in synthesizer.get_aggregate_topics()}
+        assert topics == {"Pipeline": 1, "DAG": 1}
+
+    def test_ensure_indexed_backfills_legacy_rows(self, synthesizer, synth_db):
+        with synth_db.connect() as conn:
+            conn.execute(
+                "INSERT INTO conversation_mindmaps (conversation_id, mindmap_json, title) VALUES (?, ?, ?)",
+                ("meeting_9", json.dumps(_mindmap("Legacy", ["Topic"])), "Old")
+            )
+            conn.commit()
+
+        assert synthesizer.ensure_indexed() == 1
+        assert synthesizer.ensure_indexed() == 0
+        assert synthesizer.get_hierarchy_summary()['total_nodes'] == 2
+
+
+class TestIncrementalSynthesis:
+    """Synthesis refreshes only send the delta to the LLM."""
+
+    def test_first_synthesis_is_full(self, synthesizer):
+        synthesizer.store_conversation_mindmap("meeting_1", _mindmap("Pipeline", ["DAG"]))
+
+        with patch("src.app.services.mindmap_synthesis.ask_llm", return_value='{"overview": "v1"}') as llm:
+            synthesis_id = synthesizer.generate_synthesis(force=True)
+
+        assert synthesis_id is not None
+        assert llm.call_count == 1
+        assert "Previous Synthesis" not in llm.call_args[0][0]
+        assert synthesizer.needs_synthesis() is False
+
+    def test_refresh_sends_only_new_mindmaps(self, synthesizer, synth_db):
+        synthesizer.store_conversation_mindmap("meeting_1", _mindmap("Pipeline", ["DAG"]))
+        with patch("src.app.services.mindmap_synthesis.ask_llm", return_value='{"overview": "v1"}'):
+            first_id = synthesizer.generate_synthesis(force=True)
+
+        synthesizer.store_conversation_mindmap("meeting_2", _mindmap("Staffing", ["Hiring"]))
+        assert synthesizer.needs_synthesis() is True
+
+        with patch("src.app.services.mindmap_synthesis.ask_llm", return_value='{"overview": "v2"}') as llm:
+            second_id = synthesizer.generate_synthesis(force=True)
+
+        prompt = llm.call_args[0][0]
+        assert second_id != first_id
+        assert '{"overview": "v1"}' in prompt
+        assert "Hiring" in prompt
+        assert "DAG" not in prompt.split("Most Frequent Topics")[0]
+
+        current = synthesizer.get_synthesis_by_type('default')
+        assert len(current['source_mindmap_ids']) == 2
+
+        with synth_db.connect() as conn:
+            history = conn.execute(
+                "SELECT * FROM mindmap_synthesis_history WHERE synthesis_id = ?", (second_id,)
+            ).fetchone()
+        assert history['previous_text'] == '{"overview": "v1"}'
+
+    def test_no_new_content_skips_llm(self, synthesizer):
+        data = _mindmap("Pipeline", ["DAG"])
+        synthesizer.store_conversation_mindmap("meeting_1", data)
+        with patch("src.app.services.mindmap_synthesis.ask_llm", return_value='{"overview": "v1"}'):
+            first_id = synthesizer.generate_synthesis(force=True)
+
+        # Re-saving identical content produces no delta
+        synthesizer.store_conversation_mindmap("meeting_1", data)
+        assert synthesizer.needs_synthesis() is False
+
+        with patch("src.app.llm.ask", return_value='{"overview": "view"}') as llm:
+            results = synthesizer.generate_multiple_syntheses(force=False)
+
+        # Only views that never existed are generated
+        assert results['default'] == first_id
+        assert llm.call_count == 4
@@ -0,0 +1,182 @@
+# tests/test_model_router_adaptive.py
+"""
+Tests for latency/error-aware model routing and hedged requests.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+def _router(**task_overrides):
+    from src.app.agents.model_router import ModelRouter
+
+    classification = {
+        "default_model": "gpt-4o-mini",
+        "fallback_models": ["gpt-3.5-turbo"],
+        "latency_budget_ms": 2000,
+    }
+    classification.update(task_overrides)
+    router = ModelRouter()
+    router.policy = {
+        "task_types": {"classification": classification},
+        "agent_defaults": {"assistant": "classification"},
+        "adaptive_routing": {"min_samples": 5, "hedge_min_delay_ms": 10},
+    }
+    router.task_configs = {}
+    router._parse_policy()
+    return router
+
+
+class TestRollingModelStats:
+
+    def test_percentiles_track_recent_calls(self):
+        from src.app.agents.model_router import RollingModelStats
+
+        stats = RollingModelStats(size=100)
+        for ms in range(1, 101):
+            stats.record(ms * 10)  # 10ms .. 1000ms
+
+        assert 400 <= stats.quantile(0.5) <= 600
+        assert 850 <= stats.quantile(0.95) <= 1100
+
+        for _ in range(100):  # window slides: old samples fall out
+            stats.record(50)
+        assert stats.quantile(0.95) < 70
+        assert stats.count() == 100
+
+    def test_errors_and_time_expiry(self):
+        from src.app.agents.model_router import RollingModelStats
+
+        stats = RollingModelStats(size=10, window_seconds=60)
+        for i in range(4):
+            stats.record(100, success=i % 2 == 0, now=1000.0)
+        assert stats.error_rate(now=1000.0) == 0.5
+
+        assert stats.count(now=1061.0) == 0
+        assert stats.error_rate(now=1061.0) == 0.0
+        assert stats.quantile(0.95, now=1061.0) == 0.0
+
+
+class TestAdaptiveSelection:
+
+    def test_routes_around_slow_default(self):
+        router = _router()
+        assert router.select("classification").model == "gpt-4o-mini"
+
+        for _ in range(10):
+            router.record_outcome("gpt-4o-mini", 3500)
+            router.record_outcome("gpt-3.5-turbo", 800)
+
+        result = router.select("classification")
+        assert result.model == "gpt-3.5-turbo"
+        assert result.selection_reason == "adaptive_latency" and result.fallback_used
+        assert router.select(agent_name="assistant").model == "gpt-3.5-turbo"
+        assert router.get_fallback_chain("classification") == ["gpt-3.5-turbo", "gpt-4o-mini"]
+
+    def test_routes_around_failing_default(self):
+        router = _router()
+        for _ in range(6):
+            router.record_outcome("gpt-4o-mini", 200, success=False)
+
+        result = router.select("classification")
+        assert (result.model, result.selection_reason) == ("gpt-3.5-turbo", "adaptive_errors")
+
+    def test_keeps_default_when_everything_is_degraded_or_disabled(self):
+        router = _router()
+        for _ in range(6):
+            router.record_outcome("gpt-4o-mini", 5000)
+            router.record_outcome("gpt-3.5-turbo", 5000)
+        assert router.select("classification").model == "gpt-4o-mini"
+
+        router = _router()
+        router.adaptive.enabled = False
+        for _ in range(6):
+            router.record_outcome("gpt-4o-mini", 5000)
+        assert router.select("classification").model == "gpt-4o-mini"
+
+    def test_hedge_plan_uses_p95(self):
+        router = _router(hedge=True)
+        assert router.get_hedge_plan("classification", "gpt-4o-mini") == ("gpt-3.5-turbo", 2000)
+
+        for _ in range(20):
+            router.record_outcome("gpt-4o-mini", 400)
+        backup, delay_ms = router.get_hedge_plan("classification", "gpt-4o-mini")
+        assert backup == "gpt-3.5-turbo" and 320 <= delay_ms <= 500
+
+        assert _router().get_hedge_plan("classification", "gpt-4o-mini") is None
+
+    def test_selection_stats_from_rolling_counters(self):
+        router = _router()
+        router.select("classification")
+        router.select("classification", override="gpt-4o")
+        for _ in range(6):
+            router.record_outcome("gpt-4o-mini", 200, success=False)
+        router.select("classification")
+
+        stats = router.get_selection_stats(minutes=5)
+        assert stats["total"] == 3
+        assert stats["by_model"] == {"gpt-4o-mini": 1, "gpt-4o": 1, "gpt-3.5-turbo": 1}
+        assert stats["overrides"] == 1 and stats["adaptive_reroutes"] == 1
+        assert stats["model_health"]["gpt-4o-mini"]["error_rate"] == 1.0
+
+
+class _SlowPrimaryClient:
+    """gpt-4o-mini answers slowly, every other model answers quickly."""
+
+    def __init__(self, slow=1.0):
+        self.slow = slow
+        self.cancelled = []
+
+    async def ask(self, prompt, model, **kwargs):
+        try:
+            await asyncio.sleep(self.slow if model == "gpt-4o-mini" else 0.01)
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+        return f"answer from {model}"
+
+
+def _agent(router, client):
+    pytest.importorskip("pydantic")
+    from src.app.agents.base import AgentConfig, BaseAgent
+
+    class EchoAgent(BaseAgent):
+        def get_system_prompt(self, **kwargs):
+            return "system"
+
+        async def run(self, *args, **kwargs):
+            return {}
+
+    return EchoAgent(AgentConfig(name="echo", description="test"), llm_client=client, model_router=router)
+
+
+class TestAgentIntegration:
+
+    def test_hedged_request_returns_backup_and_cancels_primary(self):
+        router = _router(hedge=True, latency_budget_ms=50)
+        client = _SlowPrimaryClient()
+        agent = _agent(router, client)
+
+        start = time.perf_counter()
+        answer = asyncio.run(agent.ask_llm("classify", task_type="classification"))
+
+        assert answer == "answer from gpt-3.5-turbo"
+        assert time.perf_counter() - start < 0.5
+        assert client.cancelled == ["gpt-4o-mini"]
+        statuses = {entry["model"]: entry["status"] for entry in agent.interaction_log}
+        assert statuses == {"gpt-3.5-turbo": "hedged", "gpt-4o-mini": "hedge_cancelled"}
+
+    def test_interactions_feed_the_router(self):
+        router = _router(latency_budget_ms=50)
+        agent = _agent(router, _SlowPrimaryClient(slow=0.08))
+
+        async def scenario():
+            return [await agent.ask_llm("classify", task_type="classification") for _ in range(6)]
+
+        answers = asyncio.run(scenario())
+        assert answers[0] == "answer from gpt-4o-mini"
+        assert answers[-1] == "answer from gpt-3.5-turbo"  # default drifted over budget
+        assert router.get_model_health()["gpt-4o-mini"]["calls"] == 5
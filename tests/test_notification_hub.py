@@ -0,0 +1,131 @@
+# tests/test_notification_hub.py
+"""
+Tests for the notification fan-out hub (SSE push instead of count polling).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+
+class _Loader:
+    def __init__(self, unread=3, total=5):
+        self.counts = {"unread": unread, "total": total}
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return dict(self.counts)
+
+
+@pytest.fixture
+def loader():
+    return _Loader()
+
+
+@pytest.fixture
+def hub(loader):
+    from src.app.services.notification_hub import NotificationHub
+    return NotificationHub(loader=loader, reconcile_interval=300, buffer_size=4)
+
+
+class TestCounts:
+
+    def test_counts_cached_until_stale(self, hub, loader):
+        assert hub.counts() == {"unread": 3, "total": 5}
+        for _ in range(50):
+            hub.counts()
+        assert loader.calls == 1
+
+        hub.reconcile_interval = 0
+        hub.counts()
+        assert loader.calls == 2
+
+    def test_publish_adjusts_cached_counts(self, hub, loader):
+        hub.counts()
+        hub.publish("created", {"id": "n1"}, unread_delta=1, total_delta=1)
+        assert hub.counts() == {"unread": 4, "total": 6}
+
+        hub.publish("read_all", unread=0)
+        assert hub.counts()["unread"] == 0
+        assert loader.calls == 1
+
+    def test_reconcile_on_publish_only_when_watched(self, hub, loader):
+        hub.publish("read", {"id": "n1"}, reconcile=True)
+        assert loader.calls == 0  # nobody holds counts yet
+
+        hub.counts()
+        loader.counts["unread"] = 2
+        hub.publish("read", {"id": "n1"}, reconcile=True)
+        assert loader.calls == 2
+        assert hub.counts()["unread"] == 2
+
+
+class TestResume:
+
+    def test_events_since_last_id(self, hub):
+        first = hub.publish("created", {"id": "a"})
+        second = hub.publish("created", {"id": "b"})
+
+        assert [e["id"] for e in hub.events_since(first)] == [second]
+        assert hub.events_since(second) == []
+
+    def test_unresumable_ids_return_none(self, hub):
+        first = hub.publish("created", {"id": "a"})
+        for i in range(5):
+            hub.publish("created", {"id": str(i)})
+
+        assert hub.events_since(None) is None
+        assert hub.events_since(first) is None  # evicted from the 4-event buffer
+        assert hub.events_since("deadbeef-1") is None  # previous process
+
+
+class TestFanOut:
+
+    def test_publish_from_worker_thread_reaches_subscriber(self, hub):
+        async def scenario():
+            queue = hub.subscribe()
+            thread = threading.Thread(target=hub.publish, args=("created", {"id": "x"}))
+            thread.start()
+            event = await asyncio.wait_for(queue.get(), timeout=1)
+            thread.join()
+            hub.unsubscribe(queue)
+            return event
+
+        event = asyncio.run(scenario())
+        assert event["type"] == "created"
+        assert event["data"] == {"id": "x"}
+        assert hub.subscriber_count == 0
+
+
+class TestQueueIntegration:
+
+    def test_queue_writes_publish_events(self, tmp_path, monkeypatch):
+        from src.app import db
+        from src.app.services import notification_hub, notification_queue
+        from src.app.services.notification_queue import Notification, NotificationQueue
+
+        db.close_pool()
+        monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "notifications.db"))
+        db.init_db()
+        monkeypatch.setattr(notification_queue, "get_supabase", lambda: None)
+        monkeypatch.setattr(notification_hub, "get_supabase_client", lambda: None, raising=False)
+
+        hub = notification_hub.NotificationHub(loader=_Loader(unread=0, total=0))
+        monkeypatch.setattr(notification_hub, "_hub", hub)
+        try:
+            queue = NotificationQueue()
+            hub.counts()
+
+            nid = queue.create(Notification(title="Review signal"))
+            assert hub.counts() == {"unread": 1, "total": 1}
+
+            queue.mark_read(nid)
+            queue.dismiss(nid)
+            queue.delete(nid)
+            assert [e["type"] for e in hub.events_since(f"{hub.epoch}-0")] == [
+                "created", "read", "actioned", "deleted",
+            ]
+        finally:
+            db.close_pool()
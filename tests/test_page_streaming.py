@@ -0,0 +1,183 @@
+# tests/test_page_streaming.py
+"""
+Tests for heavy HTML list pages: cursor pagination, keyset paging of
+signals, streamed template rendering and the compression middleware.
+"""
+
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+
+
+def _add_meetings(db, count, signals=None):
+    signals = signals or {"decisions": ["Ship it"], "risks": ["Vendor delay"]}
+    with db.connect() as conn:
+        for i in range(1, count + 1):
+            conn.execute(
+                "INSERT INTO meeting_summaries (id, meeting_name, synthesized_notes, meeting_date, signals_json) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (i, f"Meeting {i}", "notes", f"2026-01-{(i % 28) + 1:02d}", json.dumps(signals)),
+            )
+        conn.commit()
+
+
+class TestCursors:
+
+    def test_round_trip_and_bad_cursors(self):
+        from src.app.pagination import decode_cursor, encode_cursor
+
+        cursor = encode_cursor({"k": "2026-01-05", "id": 42})
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == {"k": "2026-01-05", "id": 42}
+        assert decode_cursor(None) == {}
+        assert decode_cursor("not-a-cursor!") == {}
+        assert decode_cursor(encode_cursor({"o": 1})[:-2] + "@@") == {}
+
+    def test_paginate_list_walks_all_items(self):
+        from src.app.pagination import page_size, paginate_list
+
+        items = list(range(25))
+        seen, cursor = [], None
+        while True:
+            page = paginate_list(items, cursor, 10)
+            seen += page.items
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+        assert seen == items
+        assert page.headers() == {"X-Next-Cursor": ""}
+        assert page_size(0) == 100 and page_size(10_000) == 500
+
+
+class TestSignalsKeyset:
+
+    def test_pages_cover_every_meeting_once(self, temp_db):
+        from src.app.signals import get_signals_page
+
+        _add_meetings(temp_db, 57)
+
+        ids, cursor, pages = [], None, 0
+        while True:
+            page, total = get_signals_page("decisions", cursor=cursor, limit=20)
+            ids += [group["meeting_id"] for group in page.items]
+            pages += 1
+            assert total == len(page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        assert pages == 3
+        assert sorted(ids) == list(range(1, 58))
+        assert len(set(ids)) == 57
+
+    def test_all_types_grouped(self, temp_db):
+        from src.app.signals import get_signals_page
+
+        _add_meetings(temp_db, 3)
+        page, total = get_signals_page("all", limit=10)
+        assert total == 6 and not page.has_more
+        assert {s["type"] for s in page.items[0]["signals"]} == {"decision", "risk"}
+
+
+def _run_asgi(app, accept="gzip"):
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", accept.encode())]}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = sent[0]
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    return dict(start["headers"]), body, sent
+
+
+def _app(chunks, content_type=b"text/html; charset=utf-8"):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type)]})
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+    return app
+
+
+class TestCompression:
+
+    def test_streamed_body_gzipped_chunk_by_chunk(self):
+        from src.app.compression import CompressionMiddleware
+
+        chunks = [b"<li>row</li>" * 500 for _ in range(4)]
+        headers, body, sent = _run_asgi(CompressionMiddleware(_app(chunks)), accept="gzip, deflate")
+
+        assert headers[b"content-encoding"] == b"gzip"
+        assert headers[b"vary"] == b"Accept-Encoding"
+        assert gzip.decompress(body) == b"".join(chunks)
+        # Each chunk is flushed on arrival, so the first one is readable on its own
+        first = zlib.decompressobj(zlib.MAX_WBITS | 16).decompress(sent[1]["body"])
+        assert first == chunks[0]
+
+    def test_small_sse_and_refused_bodies_pass_through(self):
+        from src.app.compression import CompressionMiddleware, choose_encoding
+
+        headers, body, _ = _run_asgi(CompressionMiddleware(_app([b"<p>hi</p>"])))
+        assert b"content-encoding" not in headers and body == b"<p>hi</p>"
+
+        events = [b"data: x\n\n" * 200] * 2
+        headers, body, _ = _run_asgi(CompressionMiddleware(_app(events, b"text/event-stream")))
+        assert b"content-encoding" not in headers and body == b"".join(events)
+
+        headers, _, _ = _run_asgi(CompressionMiddleware(_app([b"x" * 5000])), accept="gzip;q=0")
+        assert b"content-encoding" not in headers
+
+        assert choose_encoding("br, gzip", brotli_available=True) == "br"
+        assert choose_encoding("br, gzip", brotli_available=False) == "gzip"
+        assert choose_encoding("*", brotli_available=False) == "gzip"
+
+
+class TestRenderPage:
+
+    def test_generate_is_coalesced_into_chunks(self):
+        jinja2 = pytest.importorskip("jinja2")
+        from src.app.template_streaming import _chunked
+
+        template = jinja2.Template("{% for r in rows %}<li>{{ r }}</li>{% endfor %}")
+        chunks = list(_chunked(template.generate(rows=range(1000)), 4096))
+
+        assert b"".join(chunks).decode() == template.render(rows=range(1000))
+        assert len(chunks) > 1
+        assert all(len(c) >= 4096 for c in chunks[:-1])
+
+    @pytest.fixture
+    def templates(self, tmp_path):
+        pytest.importorskip("starlette.templating")
+        from fastapi.templating import Jinja2Templates
+
+        (tmp_path / "rows.html").write_text(
+            "<h1>{{ title }}</h1><ul>{% block rows %}{% for r in rows %}<li>{{ r }}</li>{% endfor %}{% endblock %}</ul>"
+        )
+        return Jinja2Templates(directory=str(tmp_path))
+
+    def _body(self, response):
+        if hasattr(response, "body_iterator"):
+            async def collect():
+                return b"".join([chunk async for chunk in response.body_iterator])
+            return asyncio.run(collect()).decode()
+        return response.body.decode()
+
+    def test_full_page_streams_and_block_renders_alone(self, templates):
+        from src.app.template_streaming import render_page
+
+        context = {"request": object(), "title": "Rows", "rows": range(3)}
+        streamed = render_page(templates, "rows.html", dict(context), stream=True)
+        assert streamed.media_type.startswith("text/html")
+        assert self._body(streamed) == "<h1>Rows</h1><ul><li>0</li><li>1</li><li>2</li></ul>"
+
+        partial = render_page(templates, "rows.html", dict(context), block="rows", stream=False,
+                              headers={"X-Next-Cursor": "abc"})
+        assert self._body(partial) == "<li>0</li><li>1</li><li>2</li>"
+        assert partial.headers["X-Next-Cursor"] == "abc"
@@ -0,0 +1,122 @@
+# tests/test_pocket_client.py
+"""
+Tests for the async Pocket client against the offline fixture server.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("httpx")
+
+
+def _recording(i, day=5):
+    return {
+        "id": f"rec-{i}",
+        "title": f"Standup {i}",
+        "created_at": f"2026-01-{day:02d}T09:00:00Z",
+        "transcript": {"segments": [{"speaker": "SPEAKER_01", "text": f"Status update {i}"}]},
+        "summarizations": {"v2_summary": {"markdown": f"## Summary {i}", "version": 2}},
+    }
+
+
+@pytest.fixture
+def server():
+    from src.app.integrations.pocket_fixtures import PocketFixtureServer
+
+    recordings = [_recording(i, day=5 + i % 7) for i in range(21)]
+    recordings.append(_recording(99, day=20))
+    with PocketFixtureServer(recordings, api_key="test") as srv:
+        yield srv
+
+
+def _run(server, scenario, **kwargs):
+    from src.app.integrations.pocket import AsyncPocketClient
+
+    async def main():
+        async with AsyncPocketClient(api_key="test", base_url=server.url, backoff_base=0.01, **kwargs) as client:
+            return await scenario(client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncPocketClient:
+
+    def test_get_recording_and_extractors(self, server):
+        from src.app.integrations.pocket import extract_latest_summary, extract_transcript_text
+
+        details = _run(server, lambda c: c.get_recording("rec-3"))
+        assert extract_latest_summary(details)[0] == "## Summary 3"
+        assert extract_transcript_text(details) == "SPEAKER_01: Status update 3"
+
+    def test_unchanged_recordings_served_from_etag_cache(self, server):
+        async def scenario(client):
+            first = await client.get_recording("rec-1")
+            second = await client.get_recording("rec-1")
+            server.update_recording({**_recording(1), "title": "Renamed"})
+            third = await client.get_recording("rec-1")
+            return first, second, third, dict(client.stats)
+
+        first, second, third, stats = _run(server, scenario)
+        assert second == first
+        assert third["data"]["title"] == "Renamed"
+        assert stats["not_modified"] == 1
+        assert server.count(304) == 1
+
+    def test_retries_429_and_5xx(self, server):
+        server.fail_next(429)
+        server.fail_next(503)
+
+        details, stats = _run(server, lambda c: _with_stats(c, c.get_recording("rec-2")))
+        assert details["data"]["id"] == "rec-2"
+        assert stats["retries"] == 2
+
+    def test_gives_up_after_max_retries(self, server):
+        import httpx
+
+        server.fail_next(503, times=5)
+        with pytest.raises(httpx.HTTPStatusError):
+            _run(server, lambda c: c.get_recording("rec-2"), max_retries=2)
+
+    def test_batch_reports_failures_per_recording(self, server):
+        batch = _run(server, lambda c: c.get_recordings(["rec-1", "missing", "rec-1"]))
+        assert set(batch) == {"rec-1", "missing"}
+        assert batch["rec-1"]["data"]["id"] == "rec-1"
+        assert isinstance(batch["missing"], Exception)
+
+
+async def _with_stats(client, coro):
+    result = await coro
+    return result, dict(client.stats)
+
+
+class TestConcurrency:
+
+    def test_week_of_recordings_in_one_parallel_batch(self, server):
+        # Slow the fixture server down and count overlapping requests
+        handler = server._httpd.RequestHandlerClass
+        original = handler.do_GET
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+
+        def slow_get(self):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            try:
+                time.sleep(0.05)
+                return original(self)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        handler.do_GET = slow_get
+
+        batch = _run(server, lambda c: c.fetch_recordings("2026-01-05", "2026-01-11"), max_concurrency=8)
+
+        assert len(batch) == 21
+        assert all(not isinstance(v, Exception) for v in batch.values())
+        # Fetched in parallel, never above the concurrency cap
+        assert 1 < in_flight[1] <= 8
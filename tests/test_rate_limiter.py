@@ -0,0 +1,122 @@
+# tests/test_rate_limiter.py
+"""
+Tests for the rate limiter: bounded memory buckets, the Redis token bucket
+script and caller tiers.
+"""
+
+import asyncio
+import math
+from types import SimpleNamespace
+
+import pytest
+
+
+def _limiter(**kwargs):
+    from src.app.infrastructure.rate_limiter import RateLimiter
+    return RateLimiter(redis_url=None, **kwargs)
+
+
+def _check_many(limiter, n, **kwargs):
+    async def run():
+        return [(await limiter.check(**kwargs))[0] for _ in range(n)]
+    return asyncio.run(run())
+
+
+class TestMemoryBuckets:
+
+    def test_token_bucket_allows_burst_then_blocks(self):
+        limiter = _limiter()
+        results = _check_many(limiter, 6, identifier="ip:1", endpoint="auth", limit=5, window=60)
+        assert results == [True] * 5 + [False]
+
+        _, info = asyncio.run(limiter.check("ip:1", "auth", limit=5, window=60))
+        assert 0 < info.retry_after <= 12
+        assert info.to_headers()["Retry-After"] == str(math.ceil(info.retry_after))
+
+    def test_buckets_are_bounded(self):
+        limiter = _limiter(max_buckets=100)
+
+        async def run():
+            for i in range(1000):
+                await limiter.check(f"ip:{i}", limit=10, window=60)
+        asyncio.run(run())
+
+        assert len(limiter._buckets) == 100
+        assert limiter.evicted == 900
+
+    def test_idle_buckets_expire(self, monkeypatch):
+        from src.app.infrastructure import rate_limiter
+
+        clock = [1000.0]
+        monkeypatch.setattr(rate_limiter.time, "time", lambda: clock[0])
+        limiter = _limiter()
+
+        async def run():
+            for i in range(20):
+                await limiter.check(f"ip:{i}", limit=10, window=60)
+            clock[0] += 61
+            await limiter.check("ip:new", limit=10, window=60)
+        asyncio.run(run())
+
+        assert limiter.expired == 8  # bounded work per new bucket
+        assert "ratelimit:ip:new:default" in limiter._buckets
+        assert limiter.get_stats()["buckets"] == 13
+
+
+class TestTiers:
+
+    def _request(self, **state):
+        return SimpleNamespace(
+            state=SimpleNamespace(**state),
+            headers={"X-Auth-Token": "secret"} if state.get("session_token") == "bypass" else {},
+            query_params={},
+            client=SimpleNamespace(host="10.0.0.1"),
+        )
+
+    def test_resolve_identity(self):
+        from src.app.infrastructure.rate_limiter import resolve_identity
+
+        assert resolve_identity(self._request()) == ("ip:10.0.0.1", "anonymous")
+        assert resolve_identity(self._request(user_id="rowan")) == ("user:rowan", "user")
+        ident, tier = resolve_identity(self._request(session_token="abc"))
+        assert tier == "user" and "abc" not in ident
+        ident, tier = resolve_identity(self._request(session_token="bypass"))
+        assert tier == "api_key" and "secret" not in ident
+
+    def test_tier_scales_limit(self):
+        limiter = _limiter()
+        anon = _check_many(limiter, 12, identifier="a", limit=5, window=60)
+        keyed = _check_many(limiter, 30, identifier="b", limit=5, window=60, tier="api_key")
+        assert sum(anon) == 5
+        assert sum(keyed) == 25
+
+
+class TestRedisTokenBucket:
+
+    @pytest.fixture
+    def redis_limiter(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        from src.app.infrastructure.rate_limiter import _TOKEN_BUCKET_LUA
+
+        limiter = _limiter()
+        limiter._redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        limiter._token_bucket_script = limiter._redis_client.register_script(_TOKEN_BUCKET_LUA)
+        limiter._fallback_mode = False
+        return limiter
+
+    def test_script_enforces_limit_with_one_key(self, redis_limiter):
+        async def run():
+            results = [(await redis_limiter.check("ip:1", limit=5, window=60))[0] for _ in range(7)]
+            _, info = await redis_limiter.check("ip:1", limit=5, window=60)
+            keys = await redis_limiter._redis_client.keys("*")
+            ttl = await redis_limiter._redis_client.pttl(keys[0])
+            usage = await redis_limiter.get_usage("ip:1", "default")
+            return results, info, keys, ttl, usage
+
+        results, info, keys, ttl, usage = asyncio.run(run())
+        assert results == [True] * 5 + [False, False]
+        assert info.remaining == 0 and 0 < info.retry_after <= 12
+        assert keys == ["ratelimit:ip:1:default"]
+        assert 0 < ttl <= 61_000
+        assert usage["used"] >= 1
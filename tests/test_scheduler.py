@@ -0,0 +1,126 @@
+# tests/test_scheduler.py
+"""
+Tests for the leader-elected background job scheduler.
+
+Simulates several workers sharing one SQLite database by swapping the
+module-level lease between holders.
+"""
+
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture
+def sched(tmp_path, monkeypatch):
+    from src.app import db
+    from src.app.services import scheduler
+
+    db.close_pool()
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "scheduler.db"))
+    db.init_db()
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2026, 3, 2, 9, 0, 0, 120000)
+
+    monkeypatch.setattr(scheduler, "datetime", FrozenDatetime)
+    monkeypatch.setattr(scheduler, "_lease", None)
+    yield scheduler
+    db.close_pool()
+
+
+def _expire(name):
+    from src.app.db import connect
+
+    with connect() as conn:
+        conn.execute("UPDATE scheduler_leases SET expires_at = 0 WHERE name = ?", (name,))
+        conn.commit()
+
+
+class TestSQLiteLease:
+
+    def test_single_leader_until_expiry(self, sched):
+        from src.app.services.scheduler_lease import SQLiteLease, LEADER_LEASE_NAME
+
+        a, b = SQLiteLease(holder="worker-a"), SQLiteLease(holder="worker-b")
+
+        assert a.acquire()
+        assert not b.acquire()
+        assert a.acquire()  # renewal
+        assert b.current()["holder"] == "worker-a"
+
+        _expire(LEADER_LEASE_NAME)
+        assert b.acquire()
+        assert not a.acquire()
+
+        b.release()
+        assert a.current() is None
+        assert a.acquire()
+
+    def test_claim_is_one_shot(self, sched):
+        from src.app.services.scheduler_lease import SQLiteLease
+
+        a, b = SQLiteLease(holder="worker-a"), SQLiteLease(holder="worker-b")
+        assert a.claim("tick:job@1", 60)
+        assert not a.claim("tick:job@1", 60)
+        assert not b.claim("tick:job@1", 60)
+        assert b.claim("tick:job@2", 60)
+
+
+class TestScheduledRuns:
+
+    def test_tick_runs_once_across_workers(self, sched, monkeypatch):
+        from src.app.services.scheduler_lease import SQLiteLease, LEADER_LEASE_NAME
+
+        calls = []
+        monkeypatch.setattr(sched, "_execute", lambda name: calls.append(name) or {"ok": True})
+        workers = [SQLiteLease(holder=f"worker-{i}") for i in range(3)]
+
+        for lease in workers:
+            monkeypatch.setattr(sched, "_lease", lease)
+            sched.run_scheduled_job("grooming_match", "grooming_match", jitter=0)
+        assert calls == ["grooming_match"]
+
+        # Leader dies mid-tick; its successor must not re-run the same tick
+        _expire(LEADER_LEASE_NAME)
+        monkeypatch.setattr(sched, "_lease", workers[1])
+        assert sched.run_scheduled_job("grooming_match", "grooming_match", jitter=0) is None
+        assert calls == ["grooming_match"]
+
+        runs = sched.get_job_history("grooming_match")
+        assert len(runs) == 1
+        assert runs[0]["holder"] == "worker-0"
+        assert runs[0]["scheduled_for"] == "2026-03-02T09:00:00"
+        assert runs[0]["status"] == "success"
+
+    def test_failures_and_state_are_recorded(self, sched, monkeypatch):
+        def boom(name):
+            raise RuntimeError("supabase down")
+
+        monkeypatch.setattr(sched, "_execute", boom)
+        assert sched.run_scheduled_job("stale_ticket_alert", "stale_ticket_alert", jitter=0) is None
+
+        with pytest.raises(RuntimeError):
+            sched.run_tracked("stale_ticket_alert", "stale_ticket_alert", trigger="http")
+
+        sched.run_tracked("stale_ticket_alert", "stale_ticket_alert", trigger="http",
+                          runner=lambda name: {"skipped": True})
+
+        runs = sched.get_job_history("stale_ticket_alert")
+        assert [r["status"] for r in runs] == ["skipped", "failed", "failed"]
+        assert runs[1]["error"] == "supabase down"
+        assert all(r["duration_ms"] is not None for r in runs)
+
+        state = {s["job_id"]: s for s in sched.get_job_states()}["stale_ticket_alert"]
+        assert state["run_count"] == 3
+        assert state["failure_count"] == 2
+        assert state["last_status"] == "skipped"
+
+    def test_history_prefix_covers_split_schedules(self, sched, monkeypatch):
+        monkeypatch.setattr(sched, "_execute", lambda name: {})
+        sched.run_scheduled_job("overdue_encouragement_2pm", "overdue_encouragement", jitter=0)
+        sched.run_scheduled_job("overdue_encouragement_5pm", "overdue_encouragement", jitter=0)
+
+        assert len(sched.get_job_history("overdue_encouragement")) == 2
@@ -0,0 +1,199 @@
+# tests/test_sdk_export.py
+"""
+Tests for the SDK bulk exporter and explorer export helpers.
+
+Uses an in-memory stand-in for the Supabase query builder that records
+each round trip and the page window requested.
+"""
+
+import pytest
+
+
+class _Query:
+    def __init__(self, backend, table):
+        self.backend = backend
+        self.rows = list(backend.tables.get(table, []))
+        self.columns = None
+        self.order_by = None
+        self.row_limit = None
+        self.count = None
+        self.head = False
+        self.negate = False
+
+    def select(self, columns, count=None, head=False):
+        if columns != "*":
+            self.columns = [c.strip() for c in columns.split(",")]
+        self.count, self.head = count, head
+        return self
+
+    def neq(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) is not None and r[column] != value]
+        return self
+
+    def eq(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) == value]
+        return self
+
+    def gt(self, column, value):
+        self.rows = [r for r in self.rows if r[column] > value]
+        return self
+
+    def gte(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) and r[column] >= value]
+        return self
+
+    def lte(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) and r[column] <= value]
+        return self
+
+    @property
+    def not_(self):
+        self.negate = True
+        return self
+
+    def is_(self, column, value):
+        assert value == "null"
+        self.rows = [r for r in self.rows if (r.get(column) is None) != self.negate]
+        self.negate = False
+        return self
+
+    def order(self, column):
+        self.order_by = column
+        return self
+
+    def limit(self, n):
+        self.row_limit = n
+        return self
+
+    def execute(self):
+        self.backend.calls.append(self)
+        rows = sorted(self.rows, key=lambda r: r[self.order_by]) if self.order_by else self.rows
+        rows = rows[:self.row_limit] if self.row_limit else rows
+        count = len(rows) if self.count else None
+        if self.head:
+            rows = []
+        if self.columns:
+            rows = [{c: r.get(c) for c in self.columns} for r in rows]
+        return type("Result", (), {"data": rows, "count": count})()
+
+
+class _FakeSupabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = []
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+@pytest.fixture
+def backend():
+    signals = [
+        {"id": i, "signal_type": "decision" if i % 3 == 0 else "action",
+         "content": f"signal {i}", "status": "pending", "created_at": "2026-01-01T00:00:00Z"}
+        for i in range(1, 26)
+    ]
+    meetings = [
+        {"id": f"m{i:02d}", "meeting_name": f"Sync {i}", "meeting_date": f"2026-01-{i:02d}",
+         "created_at": "2026-01-01T00:00:00Z", "raw_text": "hello" if i % 2 else None,
+         "pocket_mind_map": None}
+        for i in range(1, 11)
+    ]
+    return _FakeSupabase({"signals": signals, "meetings": meetings})
+
+
+@pytest.fixture
+def client(backend):
+    from src.app.sdk import SignalFlowClient
+
+    client = SignalFlowClient(environment="local")
+    client._supabase = backend
+    return client
+
+
+class TestBulkExporter:
+
+    def test_keyset_pages_cover_all_rows_once(self, client, backend):
+        pages = list(client.export.iter_batches("signals", batch_size=10))
+
+        assert [len(p) for p in pages] == [10, 10, 5]
+        ids = [r["id"] for p in pages for r in p]
+        assert ids == list(range(1, 26))
+        # Later pages seek past the last key instead of using offsets
+        assert len(backend.calls) == 3
+
+    def test_projection_and_pushdown(self, client):
+        rows = list(client.export.iter_rows(
+            "signals", columns=["signal_type"], filters=[("eq", "signal_type", "decision")], batch_size=4
+        ))
+
+        assert len(rows) == 8
+        assert set(rows[0]) == {"id", "signal_type"}
+        assert {r["signal_type"] for r in rows} == {"decision"}
+
+    def test_max_rows(self, client):
+        rows = list(client.export.iter_rows("signals", batch_size=10, max_rows=12))
+        assert [r["id"] for r in rows] == list(range(1, 13))
+
+    def test_rejects_unknown_filter_op(self, client):
+        with pytest.raises(ValueError):
+            list(client.export.iter_rows("signals", filters=[("drop", "id", 1)]))
+
+    def test_no_supabase_yields_nothing(self):
+        from src.app.sdk import SignalFlowClient
+
+        client = SignalFlowClient(environment="local")
+        client._env.supabase_url = None
+        assert list(client.export.iter_rows("signals")) == []
+
+    def test_parquet_round_trip(self, client, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        path = tmp_path / "signals.parquet"
+        written = client.export.to_parquet("signals", str(path), columns=["signal_type"], batch_size=10)
+
+        parquet = pq.ParquetFile(str(path))
+        assert written == 25
+        assert parquet.metadata.num_rows == 25
+        assert parquet.num_row_groups == 3
+
+    def test_column_null_on_first_page_keeps_its_type(self, client, backend):
+        pa = pytest.importorskip("pyarrow")
+        for row in backend.tables["signals"]:
+            row["resolved_at"] = "2026-02-01T00:00:00Z" if row["id"] > 10 else None
+            row["owner"] = None
+        # Only value of "owner" is on a row the export filters out
+        backend.tables["signals"].append({"id": 99, "status": "done", "owner": "rowan"})
+
+        batches = list(client.export.iter_record_batches(
+            "signals", columns=["resolved_at", "owner"], filters=[("neq", "status", "done")], batch_size=10
+        ))
+
+        assert [b.num_rows for b in batches] == [10, 10, 5]
+        assert len({b.schema for b in batches}) == 1
+        assert batches[0].schema.field("resolved_at").type == pa.string()
+        assert batches[0].schema.field("owner").type == pa.null()
+        samples = [q.columns for q in backend.calls if q.row_limit == 1]
+        assert samples == [["resolved_at"], ["owner"]]
+        assert client.export.to_arrow("signals", columns=["resolved_at"], batch_size=10).num_rows == 26
+
+
+class TestExplorerExport:
+
+    def test_meetings_export_pushes_date_filter(self, client):
+        rows = list(client.meetings.export(columns=["meeting_date"], date_from="2026-01-05"))
+        assert [r["id"] for r in rows] == [f"m{i:02d}" for i in range(5, 11)]
+
+    def test_signals_export_filters(self, client):
+        rows = list(client.signals.export(signal_type="decision", batch_size=3))
+        assert len(rows) == 8
+
+    def test_statistics_use_counts_not_rows(self, client, backend):
+        stats = client.meetings.get_statistics()
+
+        assert stats["total_meetings"] == 10
+        assert stats["with_transcripts"] == 5
+        assert stats["with_mind_maps"] == 0
+        assert stats["meetings_last_7_days"] == 0
+        # Head-only count queries: no rows (and no transcripts) cross the wire
+        assert all(q.head and q.count == "exact" and q.columns == ["id"] for q in backend.calls)
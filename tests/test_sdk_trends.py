@@ -0,0 +1,185 @@
+# tests/test_sdk_trends.py
+"""
+Tests for the SDK trend engine.
+
+Uses a small in-memory stand-in for the Supabase query builder that
+records every round trip.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+
+class _Query:
+    def __init__(self, backend, table):
+        self.backend = backend
+        self.rows = list(backend.tables.get(table, []))
+        self.columns = None
+        self.window = None
+        self.orders = []
+
+    def select(self, columns):
+        self.columns = [c.strip() for c in columns.split(",")]
+        return self
+
+    def eq(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) == value]
+        return self
+
+    def gte(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) and r[column] >= value]
+        return self
+
+    def lt(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) and r[column] < value]
+        return self
+
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, n):
+        self.window = (0, n - 1)
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def execute(self):
+        self.backend.calls += 1
+        rows = self.rows
+        for column, desc in reversed(self.orders):
+            rows = sorted(rows, key=lambda r: (r.get(column) is None, r.get(column)), reverse=desc)
+        if not self.orders and self.backend.unstable_order and self.backend.calls % 2:
+            rows = rows[::-1]  # like Postgres, no ORDER BY means no guaranteed order
+        if self.window:
+            rows = rows[self.window[0]:self.window[1] + 1]
+        if self.columns:
+            rows = [{c: r.get(c) for c in self.columns} for r in rows]
+        return type("Result", (), {"data": rows})()
+
+
+class _FakeSupabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = 0
+        self.unstable_order = False
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+class _Client:
+    def __init__(self, supabase):
+        self.supabase = supabase
+
+
+TODAY = date(2026, 3, 18)  # a Wednesday
+
+
+def _day(offset):
+    return (TODAY - timedelta(days=offset)).isoformat()
+
+
+@pytest.fixture
+def backend():
+    meetings = [{"meeting_date": _day(d)} for d in (0, 0, 1, 5, 12, 29, 45)]
+    signals = [
+        {"created_at": f"{_day(d)}T10:00:00Z", "signal_type": t, "status": s}
+        for d, t, s in [
+            (0, "action", "completed"), (1, "action", "open"), (2, "decision", "pending"),
+            (8, "action", "completed"), (9, "action", "completed"), (40, "risk", "pending"),
+        ]
+    ]
+    return _FakeSupabase({"meetings": meetings, "signals": signals})
+
+
+@pytest.fixture
+def engine(backend):
+    from src.app.sdk.trends import TrendEngine
+    return TrendEngine(_Client(backend))
+
+
+class TestBucketing:
+
+    def test_daily_counts_in_one_query(self, engine, backend):
+        result = engine.bucketize("meeting_count", days=30, today=TODAY)
+
+        assert backend.calls == 1
+        assert len(result["values"]) == 30
+        assert result["dates"][-1] == TODAY.isoformat()
+        assert result["values"][-1] == 2
+        assert result["values"][-2] == 1
+        # Meeting 45 days ago is outside the window
+        assert sum(result["values"]) == 6
+
+    def test_weekly_buckets_start_monday(self, engine):
+        result = engine.bucketize("signal_count", days=14, period="week", today=TODAY)
+
+        assert all(date.fromisoformat(d).weekday() == 0 for d in result["dates"])
+        assert sum(result["values"]) == 5
+
+    def test_ratio_metric(self, engine):
+        result = engine.bucketize("action_completion", days=7, period="week", today=TODAY)
+        # This week (Mon 16th - Wed 18th): one completed, one open
+        assert result["values"][-1] == 0.5
+
+    def test_sprint_buckets(self, engine):
+        result = engine.bucketize(
+            "meeting_count", days=30, period="sprint",
+            sprint_start="2026-03-02", sprint_length_days=14, today=TODAY,
+        )
+        assert result["dates"] == ["2026-02-16", "2026-03-02", "2026-03-16"]
+        assert result["values"][-1] == 3
+
+    def test_rolling_window(self, engine):
+        result = engine.bucketize("meeting_count", days=3, rolling_window=2, today=TODAY)
+        assert result["values"] == [0, 1, 2]
+        assert result["rolling"] == [0.0, 0.5, 1.5]
+
+    def test_paged_fetch_is_totally_ordered(self, backend, monkeypatch):
+        from src.app.sdk import trends
+
+        monkeypatch.setattr(trends, "PAGE_SIZE", 2)
+        backend.tables["meetings"] = [{"id": i, "meeting_date": _day(i % 5)} for i in range(7)]
+        backend.unstable_order = True
+
+        result = trends.TrendEngine(_Client(backend)).bucketize("meeting_count", days=7, today=TODAY)
+
+        assert backend.calls == 4
+        # Each meeting counted once: no row skipped or repeated across pages
+        assert result["values"][-5:] == [1, 1, 1, 2, 2]
+
+    def test_results_cached_per_period(self, engine, backend):
+        engine.bucketize("meeting_count", days=30, today=TODAY)
+        engine.bucketize("meeting_count", days=30, today=TODAY)
+        engine.bucketize("meeting_count", days=30, period="week", today=TODAY)
+        assert backend.calls == 2
+
+    def test_unknown_metric_and_period(self, engine):
+        with pytest.raises(ValueError):
+            engine.bucketize("nope")
+        with pytest.raises(ValueError):
+            engine.bucketize("meeting_count", period="month")
+
+
+class TestInsightsTrendAnalysis:
+
+    def test_trend_analysis_uses_single_query(self, backend):
+        from src.app.sdk.insights import InsightsEngine
+
+        insights = InsightsEngine(_Client(backend))
+        trend = insights.trend_analysis("meeting_count", days=30)
+
+        assert backend.calls == 1
+        assert len(trend.values) == 30
+        assert trend.trend_direction in ("up", "down", "stable")
+
+    def test_unknown_metric_is_stable_and_empty(self, backend):
+        from src.app.sdk.insights import InsightsEngine
+
+        trend = InsightsEngine(_Client(backend)).trend_analysis("unknown")
+        assert trend.values == [] and trend.trend_direction == "stable"
+        assert backend.calls == 0
@@ -5,6 +5,8 @@ Tests for Signal Learning Service (PC-1 Implementation)
 Verifies the feedback → AI learning loop for signal extraction.
 """
 
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
@@ -202,6 +204,160 @@ class TestSignalLearningIntegration:
             assert result is False
 
 
+class TestLearningContextCache:
+    """Tests for the cached, incrementally maintained learning context."""
+    
+    @pytest.fixture
+    def temp_db(self, temp_db, monkeypatch):
+        """Fresh SQLite database, no Supabase, no shared cache."""
+        from src.app.services import signal_learning
+        
+        monkeypatch.setattr(signal_learning, "get_supabase", lambda: None)
+        signal_learning.reset_learning_context_cache()
+        yield temp_db
+        signal_learning.reset_learning_context_cache()
+    
+    def _seed(self, db, rows):
+        with db.connect() as conn:
+            conn.executemany(
+                "INSERT INTO signal_feedback (meeting_id, signal_type, signal_text, feedback) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+    
+    def test_sqlite_feedback_summary(self, temp_db):
+        """SQLite rows are aggregated (not just mocked summaries)."""
+        from src.app.services.signal_learning import SignalLearningService
+        
+        self._seed(temp_db, [
+            (1, "decision", "Decided to ship the beta on Friday", "up"),
+            (1, "decision", "Approved the Q4 hiring plan for the platform team", "up"),
+            (1, "risk", "stuff", "down"),
+        ])
+        summary = SignalLearningService().get_feedback_summary()
+        
+        assert summary["total_feedback"] == 3
+        assert summary["acceptance_rates"] == {"decision": 100.0, "risk": 0.0}
+    
+    def test_served_from_memory_after_first_load(self, temp_db):
+        """Extraction calls after the first load run no feedback queries."""
+        from src.app.services import signal_learning
+        
+        self._seed(temp_db, [(i, "action_item", f"Owner: Sam will fix bug {i} by Friday", "up") for i in range(6)])
+        cache = signal_learning.get_learning_context_cache()
+        
+        with patch.object(cache._service, "load_feedback", wraps=cache._service.load_feedback) as load:
+            first = signal_learning.get_learning_context_for_extraction()
+            for _ in range(10):
+                assert signal_learning.get_learning_context_for_extraction() == first
+        
+        assert load.call_count == 1
+        assert "action_item" in first
+    
+    def test_feedback_updates_context_incrementally(self, temp_db):
+        """New feedback changes the context without reloading."""
+        from src.app.services import signal_learning
+        
+        signal_learning.signal_feedback_recorded("risk", "vague", "down")  # before first use: ignored
+        assert signal_learning.get_learning_context_for_extraction() == ""
+        
+        cache = signal_learning.get_learning_context_cache()
+        version = cache.version
+        with patch.object(cache._service, "load_feedback") as load:
+            for i in range(4):
+                signal_learning.signal_feedback_recorded("decision", f"Decided to adopt option {i} for launch", "up")
+            signal_learning.signal_feedback_recorded("risk", "stuff", "down")
+            context = signal_learning.get_learning_context_for_extraction()
+        
+        load.assert_not_called()
+        assert cache.version == version + 5
+        assert cache.summary()["acceptance_rates"] == {"decision": 100.0, "risk": 0.0}
+        assert "User highly values these signal types: decision" in context
+
+    def test_toggle_and_retract_match_reload(self, temp_db):
+        """Toggled, cleared and deleted votes leave the aggregates a reload would build."""
+        from src.app.services import signal_learning
+        
+        text = "Vendor may slip the API date"
+        self._seed(temp_db, [(1, "risk", text, "up")])
+        cache = signal_learning.get_learning_context_cache()
+        cache.context()
+        
+        signal_learning.signal_feedback_recorded("risk", text, "down", "up")  # toggle
+        assert cache.summary()["acceptance_rates"] == {"risk": 0.0}
+        assert list(cache._approved) == []
+        
+        signal_learning.signal_feedback_recorded("risk", text, "down", "down")  # re-vote: no-op
+        signal_learning.signal_feedback_recorded("risk", text, None, "down")  # cleared / deleted
+        assert cache.summary()["total_feedback"] == 0
+        assert list(cache._rejected) == []
+        
+        incremental = cache.summary()
+        with temp_db.connect() as conn:
+            conn.execute("DELETE FROM signal_feedback")
+            conn.commit()
+        cache.refresh()
+        assert cache.summary() == incremental
+    
+    def test_feedback_recorded_during_a_reload_is_kept(self, temp_db):
+        """A vote that lands while refresh() is loading is neither lost nor counted twice."""
+        from src.app.services import signal_learning
+        
+        self._seed(temp_db, [(1, "risk", "Vendor may slip", "down")])
+        cache = signal_learning.get_learning_context_cache()
+        cache.context()
+        reload = cache._service.load_feedback
+        
+        def racing_load():
+            snapshot = reload()  # read before the concurrent write commits
+            if load.call_count == 1:
+                self._seed(temp_db, [(2, "risk", "Budget overrun", "down")])
+                signal_learning.signal_feedback_recorded("risk", "Budget overrun", "down")
+            return snapshot
+        
+        with patch.object(cache._service, "load_feedback", side_effect=racing_load) as load:
+            assert cache.refresh() is True
+        assert load.call_count == 2  # the overlapped load was discarded
+        assert cache.summary()["total_feedback"] == 2
+        
+        def always_racing():
+            signal_learning.signal_feedback_recorded("decision", "Ship Friday", "up")
+            return reload()
+        
+        with patch.object(cache._service, "load_feedback", side_effect=always_racing):
+            assert cache.refresh(attempts=2) is False
+        # Kept the incrementally maintained aggregates: 2 risks + 2 decisions
+        assert cache.summary()["total_feedback"] == 4
+    
+    def test_stale_cache_refreshes_in_background(self, temp_db):
+        """A stale cache answers immediately and reloads off the caller's thread."""
+        import threading
+        from src.app.services import signal_learning
+        
+        cache = signal_learning.get_learning_context_cache()
+        assert cache.context() == ""
+        self._seed(temp_db, [(i, "blocker", f"Waiting on API credentials from vendor {i}", "up") for i in range(5)])
+        
+        release = threading.Event()
+        reload = cache._service.load_feedback
+        
+        def slow_load():
+            release.wait(5)
+            return reload()
+        
+        with patch.object(cache._service, "load_feedback", side_effect=slow_load):
+            assert cache.context(max_age=0) == ""  # old text, not blocked on the reload
+            assert cache.refresh_in_background() is False  # single flight
+            built_at = cache.built_at
+            release.set()
+            for _ in range(100):
+                if cache.built_at != built_at and not cache._refreshing:
+                    break
+                time.sleep(0.01)
+        
+        assert "blocker" in cache.context()
+
+
 class TestSignalLearningAPI:
     """Test API endpoints for signal learning."""
     
@@ -0,0 +1,129 @@
+# tests/test_startup.py
+"""
+Tests for startup speedups: schema fast path, migration fast path,
+import profiling, readiness state and lazy agent exports.
+"""
+
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def fresh_db(tmp_path, monkeypatch):
+    from src.app import db
+
+    db.close_pool()
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "startup.db"))
+    yield db
+    db.close_pool()
+
+
+class TestSchemaFastPath:
+    """init_db() skips work when the schema fingerprint matches."""
+
+    def test_second_init_is_skipped(self, fresh_db):
+        fresh_db.init_db()
+        with fresh_db.connect() as conn:
+            assert fresh_db.schema_is_current(conn)
+            conn.execute("DROP TABLE skill_tracker")
+            conn.commit()
+
+        fresh_db.init_db()
+        with fresh_db.connect() as conn:
+            assert not fresh_db.table_exists(conn, "skill_tracker")
+
+        fresh_db.init_db(force=True)
+        with fresh_db.connect() as conn:
+            assert fresh_db.table_exists(conn, "skill_tracker")
+
+    def test_version_bump_reruns_init(self, fresh_db, monkeypatch):
+        fresh_db.init_db()
+        with fresh_db.connect() as conn:
+            conn.execute("DROP TABLE skill_tracker")
+            conn.commit()
+
+        monkeypatch.setattr(fresh_db, "SCHEMA_VERSION", fresh_db.SCHEMA_VERSION + 1)
+        fresh_db.init_db()
+        with fresh_db.connect() as conn:
+            assert fresh_db.table_exists(conn, "skill_tracker")
+            assert fresh_db.schema_is_current(conn)
+
+
+class TestMigrationFastPath:
+    """run_all_migrations() is a single lookup once everything is applied."""
+
+    def test_second_run_applies_nothing(self, fresh_db, monkeypatch):
+        from src.app import db_migrations
+
+        fresh_db.init_db()
+        first = db_migrations.run_all_migrations()
+        assert first["applied"] == first["total"]
+
+        def fail():
+            raise AssertionError("migration should not run")
+
+        monkeypatch.setattr(
+            db_migrations, "MIGRATIONS",
+            [(v, key, fail) for v, key, _ in db_migrations.MIGRATIONS]
+        )
+        second = db_migrations.run_all_migrations()
+        assert second["applied"] == 0
+        assert second["skipped"] == second["total"]
+
+
+class TestImportProfiler:
+
+    def test_records_nested_import_times(self, tmp_path, monkeypatch):
+        from src.app.startup_profile import ImportProfiler
+
+        (tmp_path / "profiled_child.py").write_text("VALUE = 1\n")
+        (tmp_path / "profiled_parent.py").write_text("import profiled_child\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        profiler = ImportProfiler()
+        profiler.install()
+        try:
+            import profiled_parent  # noqa: F401
+        finally:
+            profiler.uninstall()
+            sys.modules.pop("profiled_parent", None)
+            sys.modules.pop("profiled_child", None)
+
+        parent = profiler.timings["profiled_parent"]
+        child = profiler.timings["profiled_child"]
+        assert parent["cumulative_ms"] >= child["cumulative_ms"]
+        assert parent["self_ms"] <= parent["cumulative_ms"]
+        assert profiler.top(1)[0]["module"] == "profiled_parent"
+
+
+class TestStartupState:
+
+    def test_readiness_transitions(self):
+        from src.app.startup_profile import StartupState
+
+        state = StartupState()
+        assert state.readiness()["status"] == "starting"
+
+        with state.phase("init_db"):
+            pass
+        state.mark_serving()
+        assert state.readiness()["status"] == "serving"
+
+        state.warm_up(["json", "module_that_does_not_exist_xyz"], background=False)
+        report = state.report()
+        assert report["status"] == "warm"
+        assert "module_that_does_not_exist_xyz" in report["warmup_errors"]
+        assert {"init_db", "time_to_serving", "warmup"} <= set(report["phases_ms"])
+
+
+class TestLazyAgentExports:
+
+    def test_exports_resolve_on_access(self):
+        from src.app import agents
+        from src.app.agents.dikw_synthesizer import DIKW_LEVELS
+
+        assert agents.DIKW_LEVELS is DIKW_LEVELS
+        assert "DIKW_LEVELS" in dir(agents)
+        with pytest.raises(AttributeError):
+            agents.not_an_agent_export
@@ -0,0 +1,181 @@
+# tests/test_text_blobs.py
+"""
+Tests for the compressed, content-addressed transcript blob store.
+"""
+
+import pytest
+
+
+TRANSCRIPT = "\n".join(f"Speaker {i % 4}: we discussed the rollout plan for item {i}" for i in range(400))
+
+
+@pytest.fixture(autouse=True)
+def blob_cache():
+    from src.app import db_blobs
+
+    db_blobs.clear_cache()
+    yield
+    db_blobs.clear_cache()
+
+
+def _stored(conn, sql, params=()):
+    """Fetch column values as stored, without resolving blob references."""
+    cursor = conn._conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params).fetchone()
+
+
+class TestPutText:
+
+    def test_small_text_stays_inline(self, temp_db):
+        from src.app.db_blobs import put_text
+
+        with temp_db.connect() as conn:
+            assert put_text(conn, "short note") == "short note"
+            assert put_text(conn, None) is None
+            assert conn.execute("SELECT COUNT(*) FROM text_blobs").fetchone()[0] == 0
+
+    def test_large_text_is_compressed_and_deduplicated(self, temp_db):
+        from src.app.db_blobs import BLOB_REF_PREFIX, get_blob_stats, put_text
+
+        with temp_db.connect() as conn:
+            first = put_text(conn, TRANSCRIPT)
+            second = put_text(conn, TRANSCRIPT)
+            assert first == second
+            assert first.startswith(BLOB_REF_PREFIX)
+            assert put_text(conn, first) == first
+            conn.commit()
+            stats = get_blob_stats(conn)
+
+        assert stats["blobs"] == 1
+        assert stats["compressed_bytes"] * 5 < stats["bytes"]
+
+
+class TestLazyRows:
+
+    def _insert_meeting(self, conn, text):
+        from src.app.db_blobs import put_text
+
+        cursor = conn.execute(
+            "INSERT INTO meeting_summaries (meeting_name, synthesized_notes, raw_text) VALUES (?, ?, ?)",
+            ("Rollout sync", "notes", put_text(conn, text)),
+        )
+        conn.execute(
+            "INSERT INTO meeting_documents (meeting_id, doc_type, source, content) VALUES (?, 'transcript', 'pocket', ?)",
+            (cursor.lastrowid, put_text(conn, text)),
+        )
+        conn.commit()
+        return cursor.lastrowid
+
+    def test_rows_resolve_references_on_access(self, temp_db):
+        from src.app import db_blobs
+
+        with temp_db.connect() as conn:
+            meeting_id = self._insert_meeting(conn, TRANSCRIPT)
+        db_blobs.clear_cache()
+
+        with temp_db.connect() as conn:
+            row = conn.execute("SELECT * FROM meeting_summaries WHERE id = ?", (meeting_id,)).fetchone()
+            stored = _stored(conn, "SELECT raw_text FROM meeting_summaries")[0]
+
+        assert len(stored) < 100
+        assert row["raw_text"] == TRANSCRIPT
+        assert dict(row)["raw_text"] == TRANSCRIPT
+        assert TRANSCRIPT in tuple(row)
+        assert row["meeting_name"] == "Rollout sync"
+
+    def test_blob_text_sql_function_for_search(self, temp_db):
+        with temp_db.connect() as conn:
+            self._insert_meeting(conn, TRANSCRIPT + "\nSpeaker 1: the zebra migration is blocked")
+            hits = conn.execute(
+                "SELECT COUNT(*) FROM meeting_summaries WHERE LOWER(blob_text(raw_text)) LIKE ?", ("%zebra%",)
+            ).fetchone()[0]
+            doc_hits = conn.execute(
+                "SELECT COUNT(*) FROM meeting_documents WHERE LOWER(blob_text(content)) LIKE ?", ("%zebra%",)
+            ).fetchone()[0]
+            misses = conn.execute(
+                "SELECT COUNT(*) FROM meeting_summaries WHERE LOWER(raw_text) LIKE ?", ("%zebra%",)
+            ).fetchone()[0]
+
+        assert (hits, doc_hits, misses) == (1, 1, 0)
+
+    def test_repository_search_includes_transcripts(self, temp_db):
+        from src.app.repositories.meetings import SQLiteMeetingRepository
+
+        with temp_db.connect() as conn:
+            self._insert_meeting(conn, TRANSCRIPT + "\nSpeaker 2: quokka budget review")
+
+        results = SQLiteMeetingRepository().search("quokka", include_transcripts=True)
+        assert [m["meeting_name"] for m in results] == ["Rollout sync"]
+
+    def test_repository_lists_never_load_transcripts(self, temp_db, monkeypatch):
+        from src.app import db_blobs
+        from src.app.repositories.meetings import SQLiteMeetingRepository
+
+        with temp_db.connect() as conn:
+            meeting_id = self._insert_meeting(conn, TRANSCRIPT)
+        db_blobs.clear_cache()
+
+        loads = []
+        real_get_text = db_blobs.get_text
+        monkeypatch.setattr(db_blobs, "get_text", lambda ref, conn=None: loads.append(ref) or real_get_text(ref, conn))
+
+        repo = SQLiteMeetingRepository()
+        listed = repo.get_all() + repo.get_with_signals() + repo.search("rollout", include_transcripts=True)
+        assert listed and all(m["raw_text"] == "" for m in listed)
+        assert loads == []
+
+        assert repo.get_by_id(meeting_id)["raw_text"] == TRANSCRIPT
+        assert len(loads) == 1
+
+    def test_row_dict_resolves_on_given_connection(self, temp_db, tmp_path):
+        import sqlite3
+        from src.app import db_blobs
+
+        with temp_db.connect() as conn:
+            self._insert_meeting(conn, TRANSCRIPT)
+        db_blobs.clear_cache()
+
+        # A script's own connection to the file, not the app pool
+        raw = sqlite3.connect(temp_db.DB_PATH)
+        raw.row_factory = sqlite3.Row
+        row = raw.execute("SELECT meeting_name, raw_text FROM meeting_summaries").fetchone()
+        resolved = db_blobs.row_dict(row, raw)
+        raw.close()
+
+        assert db_blobs.is_blob_ref(row["raw_text"])
+        assert resolved == {"meeting_name": "Rollout sync", "raw_text": TRANSCRIPT}
+
+
+class TestMaintenance:
+
+    def test_externalize_and_collect_garbage(self, temp_db):
+        from src.app.db_blobs import collect_garbage, externalize_columns, is_blob_ref
+
+        with temp_db.connect() as conn:
+            conn.execute(
+                "INSERT INTO meeting_summaries (meeting_name, synthesized_notes, raw_text, pocket_ai_summary) "
+                "VALUES ('Legacy', 'notes', ?, 'tiny')",
+                (TRANSCRIPT,),
+            )
+            conn.execute(
+                "INSERT INTO meeting_documents (meeting_id, doc_type, source, content) VALUES (1, 'transcript', 'teams', ?)",
+                (TRANSCRIPT,),
+            )
+            conn.commit()
+
+            moved = externalize_columns(conn, batch_size=1)
+            assert moved["meeting_summaries.raw_text"] == 1
+            assert moved["meeting_documents.content"] == 1
+            assert moved["meeting_summaries.pocket_ai_summary"] == 0
+            assert externalize_columns(conn)["meeting_summaries.raw_text"] == 0
+
+            raw_text, summary = _stored(conn, "SELECT raw_text, pocket_ai_summary FROM meeting_summaries")
+            assert is_blob_ref(raw_text) and summary == "tiny"
+            assert conn.execute("SELECT COUNT(*) FROM text_blobs").fetchone()[0] == 1
+
+            assert collect_garbage(conn) == 0
+            conn.execute("DELETE FROM meeting_documents")
+            conn.execute("DELETE FROM meeting_summaries")
+            conn.commit()
+            assert collect_garbage(conn) == 1
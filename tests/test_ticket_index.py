@@ -0,0 +1,162 @@
+# tests/test_ticket_index.py
+"""
+Tests for the BM25 ticket match index.
+"""
+
+import pytest
+
+
+TICKETS = [
+    {"id": 1, "ticket_id": "DATA-101", "title": "Optimize Airflow DAG timeouts",
+     "description": "Airflow scheduler kills long running tasks", "tags": "airflow, bug", "status": "todo"},
+    {"id": 2, "ticket_id": "DATA-102", "title": "Snowflake cost dashboard",
+     "description": "Track warehouse credits per team", "tags": "snowflake", "status": "in_progress"},
+    {"id": 3, "ticket_id": "API-7", "title": "Add rate limiting to public API",
+     "description": "Token bucket per API key with Redis", "tags": "api, redis", "status": "backlog"},
+    {"id": 4, "ticket_id": "DATA-103", "title": "Data pipeline retries",
+     "description": "Retry transient failures in the ingestion pipeline", "tags": "pipeline", "status": "blocked"},
+]
+
+
+@pytest.fixture
+def index():
+    from src.app.services.ticket_index import TicketMatchIndex
+
+    idx = TicketMatchIndex()
+    idx.build(TICKETS)
+    return idx
+
+
+class TestTokenize:
+
+    def test_drops_stop_words_and_folds_plurals(self):
+        from src.app.services.ticket_index import tokenize
+
+        assert tokenize("The pipelines are failing in the DAG") == ["pipeline", "failing", "dag"]
+        assert tokenize("rate-limiting for 2026") == ["rate-limiting"]
+
+    def test_extracts_ticket_keys(self):
+        from src.app.services.ticket_index import extract_ticket_keys
+
+        assert extract_ticket_keys("We covered DATA-101 and API-7, not data-9") == ["DATA-101", "API-7"]
+
+
+class TestSearch:
+
+    def test_ranks_relevant_ticket_first(self, index):
+        results = index.search("the airflow dag keeps hitting a timeout overnight")
+        assert results[0]["ticket"]["id"] == 1
+        assert 0 < results[0]["confidence"] < 1
+
+    def test_status_filter_and_min_terms(self, index):
+        results = index.search("redis rate limiting for the api", statuses=("todo", "in_progress"))
+        assert all(r["ticket"]["id"] != 3 for r in results)
+
+        results = index.search("redis", min_matched_terms=2)
+        assert results == []
+
+    def test_key_lookup_respects_status(self, index):
+        text = "We discussed DATA-101 and API-7 today"
+        assert [t["id"] for t in index.find_by_keys(text)] == [1, 3]
+        assert [t["id"] for t in index.find_by_keys(text, statuses=("todo",))] == [1]
+
+    def test_incremental_update_and_remove(self, index):
+        index.upsert({"id": 2, "title": "Kafka consumer lag alerts"})
+        assert index.search("snowflake warehouse credits")[0]["ticket"]["id"] == 2  # description kept
+        assert index.search("kafka lag")[0]["ticket"]["id"] == 2
+        assert all(r["ticket"]["id"] != 2 for r in index.search("snowflake dashboard cost", min_matched_terms=2))
+
+        index.remove(1)
+        assert index.search("airflow dag timeout") == []
+        assert index.find_by_keys("DATA-101") == []
+        assert len(index) == 3
+
+    def test_updates_by_route_id_or_ticket_key(self, index):
+        index.upsert({"id": "3", "status": "done"})  # path params arrive as strings
+        assert len(index) == len(TICKETS) and index.docs[3]["status"] == "done"
+
+        index.upsert({"ticket_id": "data-101", "status": "done"})
+        assert index.docs[1]["status"] == "done"
+        index.upsert({"ticket_id": "NOPE-1", "status": "done"})  # unknown key: ignored
+        assert len(index) == len(TICKETS)
+
+        index.remove("4")
+        assert 4 not in index.docs
+
+    def test_embedding_blending(self, index):
+        index.set_embedding(3, [1.0, 0.0])
+        index.set_embedding(1, [0.0, 1.0])
+
+        plain = {r["ticket"]["id"]: r["confidence"] for r in index.search("api airflow")}
+        blended = {
+            r["ticket"]["id"]: r["confidence"]
+            for r in index.search("api airflow", query_embedding=[1.0, 0.0], embedding_weight=0.5)
+        }
+        assert blended[3] > plain[3]
+        assert blended[1] < plain[1]
+
+
+class TestSharedIndex:
+
+    def test_hooks_are_noop_until_built_and_sqlite_fallback(self, tmp_path, monkeypatch):
+        from src.app import db
+        from src.app.services import ticket_index, tickets_supabase
+
+        db.close_pool()
+        monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "tickets.db"))
+        db.init_db()
+        monkeypatch.setattr(tickets_supabase, "get_all_tickets_paged", lambda: [])
+        ticket_index.reset_ticket_index()
+        try:
+            ticket_index.index_ticket_changed({"id": 99, "title": "ignored"})
+
+            with db.connect() as conn:
+                conn.execute(
+                    "INSERT INTO tickets (ticket_id, title, description, status) VALUES (?, ?, ?, ?)",
+                    ("OPS-1", "Rotate database credentials", "Quarterly credential rotation", "todo"),
+                )
+                conn.commit()
+
+            matches = ticket_index.find_similar_tickets("rotate the database credentials")
+            assert [m["ticket_id"] for m in matches] == ["OPS-1"]
+
+            ticket_index.index_ticket_changed({"id": 99, "ticket_id": "OPS-2", "title": "Credential vault", "status": "todo"})
+            assert ticket_index.get_ticket_index().find_by_keys("OPS-2")
+        finally:
+            ticket_index.reset_ticket_index()
+            db.close_pool()
+
+    def test_sqlite_ticket_update_and_delete_update_the_index(self, tmp_path, monkeypatch):
+        """SQLite-only edits and deletes are reflected without a rebuild."""
+        import asyncio
+        from src.app import db, db_async
+        from src.app.api.v1 import tickets as tickets_api
+        from src.app.api.v1.models import TicketUpdate
+        from src.app.services import ticket_index, tickets_supabase
+
+        db.close_pool()
+        monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "tickets.db"))
+        db.init_db()
+        monkeypatch.setattr(tickets_supabase, "get_all_tickets_paged", lambda: [])
+        ticket_index.reset_ticket_index()
+        try:
+            with db.connect() as conn:
+                pk = conn.execute(
+                    "INSERT INTO tickets (ticket_id, title, status) VALUES (?, ?, ?)",
+                    ("OPS-7", "Rotate Kafka broker certificates", "todo"),
+                ).lastrowid
+                conn.commit()
+            index = ticket_index.get_ticket_index()
+            assert index.search("kafka broker certificates")[0]["ticket"]["id"] == pk
+
+            asyncio.run(tickets_api.update_ticket(pk, TicketUpdate(status="done")))
+            assert not index.search("kafka broker certificates", statuses=["todo"])
+            assert index.search("kafka broker certificates", statuses=["done"])
+
+            asyncio.run(tickets_api.delete_ticket(pk))
+            assert not index.search("kafka broker certificates")
+            assert index.built_at is not None and len(index) == 0
+        finally:
+            ticket_index.reset_ticket_index()
+            db_async.shutdown_async_db()
+            db.close_pool()
@@ -0,0 +1,222 @@
+# tests/test_token_budget.py
+"""
+Tests for token counting, priority-based context packing, prompt-size
+metrics and the shared prompt template environments.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+class _WordEncoder:
+    """Stands in for a tiktoken encoding: one token per whitespace-separated word."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text, disallowed_special=()):
+        self.calls += 1
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+@pytest.fixture
+def words(monkeypatch):
+    from src.app import token_budget
+
+    encoder = _WordEncoder()
+    monkeypatch.setattr(token_budget, "get_encoder", lambda model=None: encoder)
+    return encoder
+
+
+class TestCounting:
+
+    def test_heuristic_without_tokenizer(self, monkeypatch):
+        from src.app import token_budget
+
+        monkeypatch.setattr(token_budget, "get_encoder", lambda model=None: None)
+        assert token_budget.count_tokens("") == 0
+        assert token_budget.count_tokens("abc") == 1
+        assert token_budget.count_tokens("x" * 400) == 100
+
+        cut = token_budget.truncate_to_tokens("x" * 400, 20)
+        assert cut.endswith(token_budget.TRUNCATION_MARKER)
+        assert token_budget.count_tokens(cut) <= 20
+
+    def test_tokenizer_path(self, words):
+        from src.app.token_budget import count_tokens, truncate_to_tokens
+
+        assert count_tokens("one two three") == 3
+        assert truncate_to_tokens("one two three", 3) == "one two three"
+        cut = truncate_to_tokens(" ".join(["w"] * 50), 10)
+        assert count_tokens(cut) <= 10 and cut.endswith("truncated]")
+
+    def test_encoder_is_cached_per_encoding(self):
+        from src.app import token_budget
+
+        assert token_budget._encoding_name("gpt-4o-mini") == "o200k_base"
+        assert token_budget._encoding_name("claude-sonnet-4") == "cl100k_base"
+        assert token_budget.get_encoder("gpt-4o") is token_budget.get_encoder("gpt-4o-mini")
+
+    def test_model_budgets(self):
+        from src.app.token_budget import context_window, prompt_budget
+
+        assert context_window("gpt-4o-mini") == 128000
+        assert context_window("gpt-4-turbo") == 128000
+        assert context_window("gpt-4") == 8192
+        assert context_window("claude-opus-4-20250514") == 200000
+        assert context_window("mystery-model") == 8192
+
+        assert prompt_budget("gpt-4", max_output_tokens=1000, cap=0) == 7192
+        assert prompt_budget("gpt-4o", max_output_tokens=1000, reserved_tokens=500, cap=4000) == 3500
+        assert prompt_budget("gpt-4", max_output_tokens=9000, cap=0) == 0
+
+
+class TestPackContext:
+
+    def test_keeps_everything_that_fits_in_original_order(self, words):
+        from src.app.token_budget import ContextBlock, pack_context
+
+        blocks = [ContextBlock("a b", priority=1, name="a"), ContextBlock("c d", priority=9, name="c")]
+        packed = pack_context(blocks, 100, separator=" | ")
+        assert packed.text == "a b | c d"
+        assert packed.included == ["a", "c"] and not packed.dropped and not packed.truncated
+
+    def test_low_priority_blocks_are_cut_first(self, words):
+        from src.app.metrics import CONTEXT_DROPPED_TOKENS, get_metrics
+        from src.app.token_budget import ContextBlock, pack_context
+
+        get_metrics().reset()
+        filler = " ".join(["old"] * 100)
+        blocks = [
+            ContextBlock(filler, priority=1, name="old_notes"),
+            ContextBlock(" ".join(["new"] * 60), priority=5, name="new_notes"),
+            ContextBlock("tiny", priority=0, name="tiny", truncatable=False),
+            ContextBlock("question here", priority=0, name="question", required=True),
+        ]
+        packed = pack_context(blocks, 110, separator=" ", caller="test")
+
+        assert packed.included == ["old_notes", "new_notes", "question"]
+        assert packed.truncated == ["old_notes"] and packed.dropped == ["tiny"]
+        assert packed.tokens <= 110 and not packed.over_budget
+        assert packed.text.index("old") < packed.text.index("new") < packed.text.index("question")
+        assert get_metrics()._counters[CONTEXT_DROPPED_TOKENS][(("caller", "test"),)] == packed.dropped_tokens > 0
+
+    def test_required_blocks_are_never_cut(self, words):
+        from src.app.token_budget import ContextBlock, pack_context
+
+        question = " ".join(["q"] * 50)
+        packed = pack_context(
+            [ContextBlock("optional context", priority=99), ContextBlock(question, required=True, name="q")],
+            10,
+        )
+        assert packed.text == question
+        assert packed.over_budget and packed.dropped == ["block0"]
+
+    def test_small_remainders_are_dropped_not_shredded(self, words):
+        from src.app.token_budget import ContextBlock, pack_context
+
+        packed = pack_context(
+            [ContextBlock(" ".join(["a"] * 90), priority=2), ContextBlock(" ".join(["b"] * 90), priority=1)],
+            100,
+        )
+        assert packed.dropped == ["block1"] and not packed.truncated
+
+
+class TestPromptTokenMetrics:
+
+    def test_recorded_per_agent_and_task_type(self):
+        from src.app.metrics import PROMPT_TOKENS, TOKEN_BUCKETS, get_metrics
+        from src.app.token_budget import record_prompt_tokens
+
+        registry = get_metrics()
+        registry.reset()
+        for tokens in (400, 500, 600, 9000):
+            record_prompt_tokens(tokens, task_type="synthesis", agent="Arjuna")
+        record_prompt_tokens(48, agent="llm.ask")
+
+        hist = registry._histograms[PROMPT_TOKENS][(("agent", "Arjuna"), ("task_type", "synthesis"))]
+        assert hist.bounds == TOKEN_BUCKETS
+
+        rows = registry.snapshot()["prompt_tokens"]
+        assert rows[0]["agent"] == "Arjuna" and rows[0]["count"] == 4
+        assert rows[0]["max_tokens"] == 9000 and 400 <= rows[0]["p50_tokens"] <= 625
+        assert rows[1]["task_type"] == "default"
+        assert 'signalflow_llm_prompt_tokens_bucket{agent="llm.ask",task_type="default",le="48"} 1' in registry.render_prometheus()
+
+
+class TestPromptTemplates:
+
+    @pytest.fixture(autouse=True)
+    def fresh_envs(self):
+        pytest.importorskip("jinja2")
+        from src.app import prompt_templates
+
+        prompt_templates.clear_prompt_cache()
+        yield
+        prompt_templates.clear_prompt_cache()
+
+    def test_one_environment_per_directory(self):
+        from src.app.prompt_templates import PROMPT_AUTO_RELOAD, get_prompt_env
+
+        env = get_prompt_env("agents/arjuna")
+        assert env is get_prompt_env("agents/arjuna")
+        assert env.auto_reload == PROMPT_AUTO_RELOAD
+        assert get_prompt_env("agents/does_not_exist") is None
+
+    def test_precompile_and_render(self, tmp_path, monkeypatch):
+        from src.app import prompt_templates
+
+        (tmp_path / "agents" / "demo").mkdir(parents=True)
+        (tmp_path / "agents" / "demo" / "hello.jinja2").write_text("Hello {{ name }}")
+        (tmp_path / "agents" / "demo" / "broken.jinja2").write_text("{% if %}")
+        monkeypatch.setattr(prompt_templates, "PROMPTS_DIR", tmp_path)
+
+        assert prompt_templates.precompile_prompts() == 1
+        assert prompt_templates.render_prompt("agents/demo", "hello.jinja2", name="Ada") == "Hello Ada"
+        with pytest.raises(FileNotFoundError):
+            prompt_templates.render_prompt("agents/missing", "hello.jinja2")
+
+    def test_agents_share_compiled_templates(self):
+        pytest.importorskip("pydantic")
+        from src.app.agents.arjuna import ArjunaAgent
+        from src.app.agents.base import AgentConfig
+
+        first = ArjunaAgent(config=AgentConfig(name="a", description="t"))
+        second = ArjunaAgent(config=AgentConfig(name="b", description="t"))
+        assert first.jinja_env is second.jinja_env
+        assert first.jinja_env.get_template("system.jinja2") is second.jinja_env.get_template("system.jinja2")
+
+
+class TestQuickAskBudget:
+
+    def test_old_notes_give_way_to_question_and_sprint(self, words, monkeypatch):
+        pytest.importorskip("pydantic")
+        import asyncio
+
+        from src.app import token_budget
+        from src.app.agents.arjuna import ArjunaAgent
+        from src.app.agents.base import AgentConfig
+        from src.app.token_budget import ContextBlock
+
+        monkeypatch.setattr(token_budget, "PROMPT_CONTEXT_TOKENS", 400)
+        agent = ArjunaAgent(config=AgentConfig(name="arjuna", description="t"))
+        monkeypatch.setattr(agent, "get_system_prompt", lambda: "system")
+        monkeypatch.setattr(agent, "get_sprint_context_for_prompt", lambda: "Sprint 12: 3 tickets in progress")
+        monkeypatch.setattr(agent, "_get_recent_meetings_blocks", AsyncMock(return_value=[
+            ContextBlock("Meeting: Latest " + " ".join(["fresh"] * 150), priority=50, name="meeting:Latest"),
+            ContextBlock("Meeting: Ancient " + " ".join(["stale"] * 400), priority=40, name="meeting:Ancient"),
+        ]))
+
+        with patch.object(ArjunaAgent, "ask_llm", new_callable=AsyncMock) as ask:
+            ask.return_value = "ok"
+            asyncio.run(agent.quick_ask(topic="sprint_status"))
+
+        prompt = ask.call_args[1]["prompt"]
+        assert "Sprint 12" in prompt and "current sprint status" in prompt
+        assert prompt.count("fresh") == 150
+        assert prompt.count("stale") < 400 and "Ancient" in prompt
+        assert token_budget.count_tokens(prompt) <= 400
@@ -0,0 +1,178 @@
+# tests/test_transcript_chunks.py
+"""
+Tests for map-reduce signal extraction over long transcripts.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+
+def _transcript(turns=300):
+    lines = []
+    for i in range(turns):
+        speaker = ["Alice", "Bob", "SPEAKER_03"][i % 3]
+        lines.append(f"{speaker}: Update on item {i}. We walked through the details and the numbers for it.")
+    lines[10] = "Alice: We decided to ship the importer on Friday."
+    lines[150] = "Bob: I will own the migration runbook."
+    lines[290] = "SPEAKER_03: We are blocked on the security review."
+    return "\n".join(lines)
+
+
+class TestSplitTranscript:
+
+    def test_short_text_is_one_chunk(self):
+        from src.app.services.transcript_chunks import split_transcript
+
+        chunks = split_transcript("Alice: hello\nBob: hi")
+        assert [(c.start, c.end) for c in chunks] == [(0, 20)]
+
+    def test_chunks_align_to_turns_and_overlap(self):
+        from src.app.services.transcript_chunks import split_transcript
+
+        text = _transcript()
+        chunks = split_transcript(text, max_chars=2000, overlap_chars=300)
+
+        assert len(chunks) > 10
+        assert chunks[0].start == 0 and chunks[-1].end == len(text)
+        for chunk in chunks:
+            assert len(chunk.text) <= 2000
+            assert chunk.text == text[chunk.start:chunk.end]
+            assert chunk.text.split(":", 1)[0] in ("Alice", "Bob", "SPEAKER_03")
+        for prev, nxt in zip(chunks, chunks[1:]):
+            assert prev.start < nxt.start < prev.end  # overlapping, always advancing
+
+    def test_oversized_turn_split_at_sentences(self):
+        from src.app.services.transcript_chunks import split_transcript
+
+        text = "Alice: " + " ".join(f"Sentence number {i} is here." for i in range(400))
+        chunks = split_transcript(text, max_chars=1000, overlap_chars=0)
+        assert all(len(c.text) <= 1000 for c in chunks)
+        assert all(c.text.rstrip().endswith(".") for c in chunks)
+        assert "".join(c.text for c in chunks) == text
+
+
+class TestReduceSignals:
+
+    def test_merges_in_order_dedupes_and_locates(self):
+        from src.app.services.transcript_chunks import TranscriptChunk, reduce_signals
+
+        text = "Alice: We decided to ship Friday.\nBob: Ship Friday, agreed.\nBob: Bob will write the runbook."
+        chunks = [TranscriptChunk(0, 0, 56, text[:56]), TranscriptChunk(1, 34, len(text), text[34:])]
+        results = [
+            {"decisions": ["We decided to ship Friday."]},
+            {"decisions": ["we decided to ship friday"], "action_items": ["Bob will write the runbook"]},
+        ]
+
+        merged = reduce_signals(chunks, results)
+        assert merged["signals"]["decisions"] == ["We decided to ship Friday."]
+        assert merged["signals"]["action_items"] == ["Bob will write the runbook"]
+        source = merged["sources"]["action_items"][0]
+        assert text[source["start"]:source["end"]] == "Bob will write the runbook"
+        assert merged["failed_chunks"] == 0
+
+    def test_failed_chunks_are_skipped(self):
+        from src.app.services.transcript_chunks import TranscriptChunk, reduce_signals
+
+        chunks = [TranscriptChunk(0, 0, 5, "a"), TranscriptChunk(1, 5, 10, "b")]
+        merged = reduce_signals(chunks, [RuntimeError("timeout"), {"risks": ["Vendor may slip"]}])
+        assert merged["signals"]["risks"] == ["Vendor may slip"]
+        assert merged["failed_chunks"] == 1
+
+
+class _FakeLLM:
+    """Extracts the planted lines from each prompt, with a fixed per-call latency."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ask(self, prompt, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        found = {"decisions": [], "action_items": [], "blockers": []}
+        for line in prompt.splitlines():
+            speaker, _, said = line.partition(": ")
+            if speaker not in ("Alice", "Bob", "SPEAKER_03"):
+                continue
+            if "decided" in said:
+                found["decisions"].append(said)
+            elif "I will" in said:
+                found["action_items"].append(said)
+            elif "blocked" in said:
+                found["blockers"].append(said)
+        return "```json\n" + json.dumps(found) + "\n```"
+
+
+def _agent(monkeypatch, llm):
+    pytest.importorskip("jinja2")
+    from src.app.agents.base import AgentConfig
+    from src.app.agents.meeting_analyzer import MeetingAnalyzerAgent
+    from src.app.services import transcript_chunks
+
+    monkeypatch.setattr(transcript_chunks, "CHUNK_CHARS", 2000)
+    agent = MeetingAnalyzerAgent(config=AgentConfig(name="meeting_analyzer", description="test"))
+    if agent.jinja_env is None:
+        pytest.skip("meeting analyzer prompts not available")
+
+    async def ask_llm(prompt, task_type=None, **kwargs):
+        return await llm.ask(prompt)
+
+    monkeypatch.setattr(agent, "ask_llm", ask_llm)
+    return agent
+
+
+class TestChunkedExtraction:
+
+    def test_recall_covers_whole_transcript(self, monkeypatch):
+        llm = _FakeLLM()
+        agent = _agent(monkeypatch, llm)
+
+        result = asyncio.run(agent.extract_signals_chunked(_transcript(), {}))
+
+        assert result["signals"]["decisions"] == ["We decided to ship the importer on Friday."]
+        assert result["signals"]["action_items"] == ["I will own the migration runbook."]
+        assert result["signals"]["blockers"] == ["We are blocked on the security review."]
+        assert llm.calls == result["chunks"] > 10
+
+    def test_draft_summary_condenses_parts_then_summarizes(self, monkeypatch):
+        from src.app import llm
+        from src.app.mcp import tools
+
+        prompts = []
+
+        def fake_ask(prompt, model=None, **kwargs):
+            prompts.append(prompt)
+            if prompt.startswith("Condense part"):
+                return "notes: " + prompt.split("TRANSCRIPT PART", 1)[1].splitlines()[1][:40]
+            return "## Summary"
+
+        monkeypatch.setattr(llm, "ask", fake_ask)
+        monkeypatch.setattr(tools, "DRAFT_CHUNK_CHARS", 4000)
+
+        result = tools.draft_summary_from_transcript({"transcript": _transcript(), "meeting_name": "Planning"})
+
+        assert result["status"] == "draft_generated" and result["chunks"] > 3
+        assert len(prompts) == result["chunks"] + 1
+        final = prompts[-1]
+        assert "NOTES FROM TRANSCRIPT PARTS" in final
+        assert f"[Part {result['chunks']}/{result['chunks']}]" in final
+
+
+class TestConcurrency:
+
+    def test_chunks_are_extracted_in_parallel(self, monkeypatch):
+        llm = _FakeLLM(delay=0.05)
+        agent = _agent(monkeypatch, llm)
+
+        result = asyncio.run(agent.extract_signals_chunked(_transcript(), {}, max_concurrency=32))
+
+        assert result["chunks"] > 5
+        # Every chunk in flight at once: latency is about one chunk, not chunks x delay
+        assert llm.max_in_flight == result["chunks"]